@@ -1,46 +0,0 @@
-"""This file is used to store images in the PTB-BlueprintReader app."""
-
-_add = b'iVBORw0KGgoAAAANSUhEUgAAABoAAAAaCAYAAACpSkzOAAAAAXNSR0IArs4c6QAAAOVJREFUSEvtlj0KwkAQhb9cwyOoWOlFbK08gKW2ausltLATPYmNSjpbbTyEZiQrS+JPXsQFIQuBkLy3bzOZeTMR+TUB6unVePL+3aM9cACOCcj2eazIu28DC0Dd/JXwGRgAGwM4oS6wFk9fFN4Btk7oBNSKMkVcDDRNyGI5Fsgj4ALMBc7UhJZATyC5KFwFzspIu+SHtQRSGaHYSMrJ/ASSeJXQf4aun1qRkIg56BCYZb0umz3BhD59SZk6upuqVA+eEUu8SuirOgpmqsHaRLDGZ3EP0spNKNhwYmJBxi3fdn4yQN4AQIhCC2v4X8AAAAAASUVORK5CYII='
-
-_axis = b'iVBORw0KGgoAAAANSUhEUgAAAIAAAACACAYAAADDPmHLAAAAAXNSR0IArs4c6QAAC15JREFUeF7tXXuMXUUZ/77Tbnejxaj4CIhasGa3PXOOkSIGH7VVsYgmKCCCVmNQUVt81FdF2kqLtqABwTZiUBKJSgu+CEhAUgM+iBjcWO/M7La4JlVSLKTB6JLYbXrP5/2Ss+ZyvXtnzuvuPefMJPvX+eZ7zPc7M7/5Zs5dBNdqPQJY6+hd8OAAUHMQOAA4ANR8BGoevpsBHABqPgI1D9/NAA4ANR+BmofvZgAHgJqPQM3Dr/UMIIS4g/OvlLqorjioLQDi5L8nTvyP6wqCWgKgI/mzL38tQVA7AMyR/NqCoFYAMCS/liCoDQAsk187ENQCAAmTXysQVB4AKZNfGxBUGgAZk18LEFQWADklv/IgqCQAck5+pUFQOQAUlPzKgqBSACg4+ZUEQWUA0KfkVw4ElQBAn5NfKRCUHgDzlPzKgKDUAJjn5FcCBKUFwIAkv/QgKCUABiz5pQZB6QAwoMkvLQhKBYABT34pQVAqAGS5uCmEWAUAD1jqWK2UetBSttRiDgDd0+cAUGpYd3HezQDdM+pmADcDVO1d7x6PmwHcDOBIYBcMuCXALQFuCegyAm4XUDVYOA7gOIDjAI4DuEpgJwYcCXQksGqrvasDJMmomwHcDJAEL+WVdbsAtwtwuwC3C3C7ALcLsFvFXCXQbpzKI+U4gOMAjgM4DuA4gOMAdquW4wB241QeKccBHAdwHMBxAMcBHAewW7UcB7Abp/JIOQ7gOIDjAI4DOA7gOIDdquU4gN04lUfKcQDHARwHcBzAcQDHAexWLccB7MapPFKOAzgO4DiA4wCOAzgOYLdqOQ5gN07lkXIcwHEAxwEcB3AcwHEAu1XLcQC7cSqHlBBiOwBckdDb7UqpKxP2KZ14pb8OFkJcSkTXIuILUmbmCSLaqLW+NWX/ge9WSQAEQbCSiK4BgLPyyAAi/hYANkopf5+HvkHSUSkALFu27KQFCxZcCwAfKGiQbwGAK5VSTxSkv+9qKwOAIAi2ENHWfoxgvCx8vR+2irZRegD4vn8JIn4VAE4rerDa9SPio/GycGc/7eZtKxMAgiA4DRGfbjQaT+btmEmf7/uvAYAdrfX5LSbZgp//gog2aa3/XLCd/1M/Nja2BBGHJicn/5LWdiYACCHWEtH7tNbnpnUgab8gCJ4XRdE1iHhZ0r5FyhPRN0dGRraOj4//q0g77bp939/red4PpZTfT2szKwBuAoCPI+IZUsrxtE7Y9hNCfAEANgPACbZ9+iz3b14WlFLfKdpuEATnEtE9AHCLUuojae1lBUADAAIAaCilXpXWCVM/IcS7AeArAJCnjb8DwDpEJCLamTOH+CMRbdZa32eKLe1zIcTfAOBlAHBAKTWWVk9qAAghzgCAR9oMn98Cwc/TOtKtXxAEQczsGQC5NUS8QkrJdYL/tSAINhDR9bkZaSGWiG7zPO9qKeX+PPXGM2H7LiR16ToLAD4FADe2BfaUUuqFABBlDXbJkiUjixcvZmb/uay62vtzQkZGRtbNtU6HYfjsZrN5fd78goi2zczMbJ+amprJGs+qVasWHjly5J8AsLhN1yal1NfS6M4CgNsB4KIOo59WSn0rjSOzfXzfX8fFFkQ8OYuejr6NKIrWT0xM/M5GZzzz8LLwJht5S5nHEHFLFsLGdoQQ3wOAD7fbRMT7pJRvt/TjGWKpAMBvShRFvIY+v9Po8ePHT92/f//BpM74vn8OIvLhyxuS9u0hz28KV+6YrCZuYRheGEXRLgB4ceLOc3Qgol9x3SLNv6UTQoQA0G27OT08PPzSNDuQVAAQQpwNAPfPEeN1SqnP2w6Y7/tLEZGZ/Qdt+1jK3aSU4tkkc/N9fxMiXp1ZUZsCIrq52WzuSPKytADwsxYAuvIhRHy/lPK2pD6mBcBVMSvvas/zvJWNRoMPUHo2IQQz+y8DwCKTrO1zfsM8z9sgpZS2fWzkwjA8NYqibQCw1kbeUuZYS+4qpdQOk7wQ4r0AsKeHXCrApwUA/1fNXuvjHUopdrhrE0LwYQ1P96OmwG2ftwpSj3qetzXNW2Brg+V831+NiMzAeReUV1NEtF1rvbvHmJnGXCqleIlI1BIDIAzDU6IoesxkBRHXSil/1C7n+/7rY4KXirDMYfM/RHSj1jrphQ9TCKbZ61IAuCHnotTdnudtbzQaD7cbF0J8AgC+bXLY87yxRqNxwCTX/jwxACymoln9DxPR2Vrrp/mY1vM8ZvbrkzhnIbsniqKNExMTTEj73sIwfFGz2dyAiF/K2fjOeEY4zKVvIvp1XHAzmfmiUuobJqGsAOBt3idtjHDBpbXGHyMiXudPtOljKfMQHwQppbgUOu/N9/0zYxDkVrAioiM8GxDRswCAayLGhoh3SSnPMwq2CSSeAYIgONRisLZ79EMA8JIkDhlk+U3flRTlOdo3LQvMe5jYLsvLJhE9nqAmwsW4RC9aIgD02IfmFe9ceogTPzw8vDnNXrdo59r1c42k9fZezlM4AHj9tM22EHGVlJKXDKuWFABWZMTKsr3QnVEUXWdbxbNXW6zk8uXLfc/zeKn8WLGWnqkdEW+QUm6wtZkIAEEQ3EtE59gqzyg33rrNuytr6TSjD5m7CyHeGXOmt2VWZqdgXCllvUW1BsCKFSuGZmZmuHBRdHsyTnyulbeinTbpF0LwbMCHWy83yWZ9fvTo0RHbgydrACT8uDJVDIj43dZuYWfeVbxUzhTQiauJzWbzckT8bAHq21VerJTiwzpjSwIArn7xjZzcG59mERGz+4HY1uUeYIfCuJrIM0Ju28YOE3uUUpfYxJEEAH/N+dYMM1YdJ77wK1Q2g9FvGf5yCRF5x/DqnG0fVkqdZKPTCgBCCD4OPWyj0FKG787tajabuyYnJ/9h2aeSYnE1kZcFnhGem1eQzWZzyeTkJF8b69lsAcAnYD8wKbN9TkTrtdbG2ratvirI2db7E8T6GaVU+42trl1tAcB3/d6VwHhv1CE+HkVRoLV+Ki+dZdYT1/v5gu0pOcbxoFJqtUmfLQC4Epdr4wuYWutc7/zl6mAflQkh+ADH+hKNrWtKKWN+jQJFln+J6EytdfvNYtvYKiMXhuHpURQV8k2F53lndR4tdw6cEQC+72+Lr2zlPuhpTq9yd2KeFQohfgIAFxThBn8ib7onYQSAEEIDwPIiHGSd8adlc96EKcruIOj1ff8CRGQAFNX2twpCPU8mjQDwff9iRORjztxIYEe0E0opv6gRGGS9QojZL6uKcPNuItrd65oZGzUCoN2zsbGxE4eGhi4kIgaEkWHaRkVEW7TWlar9m2IXQjDpS3R7x6DzEUTcHUURJ926ZpMIAJ0OhGE42mw2z4tniNNNQfd4fiyKolfO19WuDH6n6hrfq+TKapbb0Hz37y5O+MTExJ9SOZJ0BjAZEUK8rvW94DsAgGeIV5jk258j4q1Syg8l6VNW2SAIbiaijyb0/xAi7m3dNrpdSnlvwr5zimeaAXo54fs+o3uN53lr4iXD+EtdRPRmrfUDeQU3iHrCMHxjFEW/sfCNf2dgLyLeMz09vfvgwYNHLfokFikMAJ2ejI6Onrxo0SIGw5rW5+TnA8BQF28fUkrl+WlY4gEpuoMQgq9rrexi5zi/4US0d+HChT/dt29f4s/r0vjeNwB0Ohd/gMlg4L+3zj5vXYK8TGvN9wIq14QQ/FEnf9w52/hjVX7L75+vn6CbNwB0ZpfPyBkMiMizxGu11v24fdQ3kPGSiIh/4ITzW661/mXfjPcwNDAAaPdxdHT0hAMHDkwPwgDl5cPSpUufMzU1xcfgA9UGEgADNUIVd8YBoOIJNoXnAGAaoYo/dwCoeIJN4TkAmEao4s8dACqeYFN4DgCmEar4cweAiifYFJ4DgGmEKv7cAaDiCTaF918XvHu9mZGufAAAAABJRU5ErkJggg=='
-
-_choose = b'iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAAAXNSR0IArs4c6QAAA79JREFUaEPtmc9LVFEUx79DOlALwcwydNEiZ+yHWak0v0ujgswRo4LAqEULFyEJpkWQtbLcigRBZT9okS0aQaUWpeagi4TMP0Awl+qYQQsVXpxp7vC8vvvmzvuRSHPg4Tj33HPP5/445543DmxycQA4kXh4lPvcF/z/6uYhAPQwEdlk7TK2eZuaU80APnOtQ4qiVKu/czgc7QDoWSdZWVlVKysrw6whOzv7+OrqKm+TNWvZ/qQxiVXcpMgD+P1BRPr613To7OxA56MOTSORvgH4/YFkWzQ6irrwWU1dLdt14RpEo194fWMArW134oZaW//+ZUIAIiGneAANh5LdRba5CTIGMDe/JHTU7oYdeTnqIaQB4p3mFn51QVFu2O1kKvsOB/rztuecS6XH2ukQZwBkZ0tG779cAUo6yZi9GQ9xBkBmb8voGA2jmRWQmV0ZHTMr0O5yuYvz83cW8ncgmYGt0qE70dLSz/mpqe9TAB7IXuZMJ7KJia8oL6+whGND8kD7vbuIRN7D4/XC4/HB6/XB7S4xBLQhAIOD/bjScHmNw+6SEng9vjhQIBhEQcFuKSAjABSF0P34SVNRYVG9+losNSKAxcVF7N+3F8vLy8IutMU8Hi/o6h0MhbB167Z1ulRHxGIL49euNrC7vLrK07S9riIzmonP19diZCRZlOmyO53OOIzPF0AgGIp/JjEThUxfJfQqtlQrmZubC4/Xh8GBNVWgdD1gSSKj2adVsFA+AHgDgOrlWZFdy7aQoihwFe9BLBazkCFpivICgdzkjVsGQIYpElFEskF6AVzSsssALMnE3d1doJxgsQidp3EsLSknJ7/hZHXISv91nbccgAweLjuA2dkfVkCkdN4WgMbG63jX+9YsgJTzDMB0JlZ7++plD5qbmwwDlJYeotvohYSBf5eJmcfT09OorCgzDKDqaCyRkQGz70aPHjmImZkZsxDGAWgZh4ZHx9UetLQ0u54/e1qs5VXPi9fjtbXhedZWU3OmYnxsbJdJAuMAiUqIDKiF3ulrvl4HwA+mpyvLlRaAllH+AMUPu46o9cMAIhKeUrS5KNCjklLvR5V4t2QikxgsXRXagsd0OrFQSQCiuEvXB9ITip0A9IPCbcHIfJw3DGEnwCkAHzUAREnKEISdAFsA/AbgVEGkyrAiCOFWshOA/Kai5HQCIJXzjJOH0D0HdgO0AXiYOIia93nBGWEQG3qIybdKALdExUiKsEYQuhHI7jCabtg1pG/3FjLkVDqdMgDpzJYdupkVsGNW07H5BxuGckCzDmgjAAAAAElFTkSuQmCC'
-
-_close = b'iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAAAXNSR0IArs4c6QAAAiRJREFUaEPtmL9HRmEUx79piIaIhmiIaIiGiIZoiGiIhijqDyyKhmiIaIiGiIZoiGiIhoiGaIh8ci7H24977nvvlcN9x3vPPef76733eZ4BJf8NJMevjsB/O9g50DlQU4EuQjUFrP14VQf2JW1L+qg9+ecGg5L2JG1F+1chAPhNSYeSdiS9R4cE64Yk7UrakHQQJRElUIAvsByZE29BcGVlw6b8uisMkYgSwFpIoE7xOzYnXsvQldwfMeXXXB0uE6PSqEYJ0BuLIeFVOjEnXvokMWrKr7rncRfwoYhWIcAMrIaEV+vUSDxXJDFm4Fd6XAV8OJpVCTALyyHhVTuzOD0FSYxbbJZdPW4CvlIk+yHATKyHhFfv3Jx4LCExYcovuTpcBHzlKPZLgNlEABJexQtz4uEXEpOm/KK7j3uArxrBrxZ1CPA8UYCEV/PSnLjvITFlyi+467gG+Gj0vulSlwANiQQkvKpXRuLOJk4b+HmHALcAXxa5PxPZBAEGEA1IeHWvLU7c5ws755DgEuB/i1rwXVA/Qn4QEYGEV/nGCmZdIe4AvjdiYdC+sCkHip5EBRJebT8PVwBfRKsv0G0SoPeMkfCqcx03AH9bG7Vr0LQD6QmkjlDqP3Hq12jqD1nqpUTqxVzq5XTqDU3qLWXqTX36Y5X0B1ss0lIfLRYL2NSHu00u4xvr1cZ+oDFwkUYdgYhKbdZ0DrSpbqR350BEpTZr0jvwCW6pmDGyy2y0AAAAAElFTkSuQmCC'
-
-_cube = b'iVBORw0KGgoAAAANSUhEUgAAAIAAAACACAYAAADDPmHLAAAAAXNSR0IArs4c6QAADaRJREFUeF7tXX2MXUUVP3Pva2nZqIhiIlSoSXG7OzO3LauBCooCRlEJCYigBLHKh3xYwjeCoW1AvgvtVsUCiR9BFBqEmlgFwkcJIEHrZvfO3S2CmCpEFI1QxKTdt/e4R+bpo93dd+/Mve/e9+5Msn/tnDNnzvzeOWfmzpzDwLVKa4BVevZu8uAAUHEQOAA4AFRcAxWfvrMADgAV10DFp+8sgANAxTVQ8ek7C+AAUHENVHz6zgI4AFRcAxWfvrMADgAV10DFp+8sgANANTXQ399/sO/7x8VxvJAx1gsA9DcCACEAPB/H8cbR0dGhbtdOpSwA53xvxtjXAeAYABhIsLgPIeI9URTdkaBvR3apDACklOci4nIAONBgpR5ljA2GYXi/AW2pSboeAJzzkxhjtPBLM1iJDXEcD46Ojj6RAa9SsOhaAEgpj9K/eDL3WbdbtUXYmjXjdvPrOgBwzhfrX/yynJX5GmNsXa1WGxwaGnol57FyY981AAiCYF4cx2Tq6W+P3DS2O+MXAGBQKTUIANjGcTMZquMBMH/+/Dk9PT3L9a9+v0y0YsbkGe0WfmxGXgxVRwNACPEV/YtfZKo+xtivAGAzIj4NAB/TW8SDTPkBwCZEHIyi6AELHm0j7UgASCmPpYVHxCMsNPU0Iq6NouinzTwGBgZm7dix4zwAoL95Fvx/pC3CFgseuZN2FAA454dqU/95C82Qz16rffa0bBYtWrTfxMREAwizDcerkzWgrePY2Ng2Qx65knUEAIIg6NUB3tkW2vgXLXy9Xr9l69at/0jKp7+/f4nv++ch4qlJaabo9zIFip7nDY6MjLxhwSdz0lIDYOHChe/yfb8R4O1lOnvG2O1xHK+JomjUlAfn/JPkFhhjR5vyAABFW8cwDG+z4JEpaWkBIISgM3va0i0wnTEibmSMrVFKPWbKY1c6IcQpWq4PWvDcrLeOP7PgkQlp6QDAOf+C9vOHWMzw19rP323BY0ZSKeUFiEgxwv4WY9yrA8XHLXhYkZYGAEKIT+hf1mctZvS8/mWts+CRmHTBggVvnzt37uUaCHMSE+7ecb3eOhq7KNOxCwdAEAQH0Zm9ZZC1nTG2dvbs2Vdt2bJl3FQZpnR9fX0H+r7/DQCwOX5+vSlQ/JupLGnpCgNAf3///p7nNY5uZ6UVvKn/et/3rxoeHn7JgkcmpHqbSkD4jAXDP2prQEfLsQWfRKRtB8DAwMCeO3fupF88Lf57E0k5daf7PM+7emRk5HcWPHIhFUIcBwCXAcCHLAb4jXZnd1rwaEnaVgBIKZch4vkAIFtKNn2HJ/XC0xFuqZsQ4msaCAeYCoqIvwSAm6IoesSUx0x0bQOAEOInAHCSxSSeQ8RvRVH0QwsehZAKIVYAwCUAsKeFANcqpS63oJ+StC0AmNzT08nb3obCv4qI10ZRdIMhfSnIgiB4TxzHKwHgLAuBHlRK0YFUZi13AAghHgKAowwlXj0+Pr7q2WefpQi5K5qUUiIiWYTjTSZELjSKojUmtFPR5AoAKeV1iHipgbAU+KxUSv3BgLYjSIIgOFJbhMMMBD5FKZVJcJgbADjnRzDGHk45ObIWtPBPpaTr2O5Syi9O3iRagYgfSDGJbePj4zILy5gbAKSUtyHi6Skm1ehK39FXhWFIn227ugkh6AIKxQWHp50oIp4RRdHtael27Z8LAPr6+g7wfZ9e2LzNUMAdALBKKXWtIX2pybIICBljj4RheKTtRHMBgL6LT9s+2zasgXCfLaOy0OsHKhQEvttWJt/359megOYCAL3vJdOWVbvb9/0rh4eHf58Vw3bz0TERLfxHMxz747afuvMCAEWoJ2c40QYrcgtZAisHEd/KcvHixXvV63VyZXQqmGmjGMv23WJeAHhU37CdbsJ0EYLOy00avcahnUJu3/pNhJqKRl9qIcCaHoLRRRYKFKdr1j+IogCwChFf1C91A0OF3+f7/mVldAtSysMR8WoAMNnjA53/e563DhHp+Lg7AUCmnG7e0mVPRKTrX3MNgZDLGbmJLEuXLp27ffv2NYyxM0zoKS9B84UWIUQrS9q5FqDZl+v9MIHA1C28gIjfjKIoi52H0doJIejz9ioAML28Sr94elBCIPhvqwwAGhPmnJ9m6RY2+b5/fjvdQhAEh8RxvBoAPmyCnIa5D8OQPvu+pVUOADT7JUuW7FOv1y+ydAurlVIXmSxIChpfCPE9ADgtBU1z15b3FysJgIaGdCBFZtXULbyEiBfn4RaklGci4vUA8A7DxadLqzcqpf48E32lAZCVW0DEh2u12tlZuAW6wBrH8bdNs43o2z30HjHRw1EHAI0CfY+QvpjZ7Bas3IIQ4laLw5yW5n6ac4Rq7AKSmlEhBL3GoVu3pm7h73QZNY1b0PcY11p82FrHGFsRhuE/k86zsruApArinH+JMXYhAJgeIj3m+/6ZM7mF/v5+7nkefW41Si5F5h4Rr7FJKOVcQAtESCmvz8MtCCHoyhU9+zJpzzPGbsziAagDQAL1CyH6AICOXU3dwuuIeCa5BSnlyYi4fjJC70kw9FRdBvXOY6chvTsHMFUc5/x4xtiVNm6hxbn7tKJpc39F1qllnQUwQIOU8kpEpFc5pt8W0oxK5n5lGIa5JIZyAEizFE199btDekdwoiGLJGTXKKWuSNLRtI8DgKnmNB3n/FOMMTqxM90t7CYBJZ2o1WqXZHGw1Gp6DgCtNJTw/0II2jJeZekWnmOMXdLOhNEOAAkXOEk3yjdUq9XILVBuwbTtCqXUNWmJbPs7ANhqcAr6IAg+EscxAaFlCprJxxp3aXNfSO4BB4AcANBg2Q7l2orfDhkLuxNY9O3edijXAWB6DVjfZesE5XaCjM4CVBykDgAOALaGand651+z0Wk79OgsgLMA2aC1mUs7kGsrtZPxTQ06C+AsgO1vycUA2WvwTY7tsFLOAjgLkD1+24FcW6mdjC4GyP3OfSeA1LkA5wJsceqCwOw16ILAvHT6P74uBsgxBuCcf58x9uUZVnGDUsqm9p81QDoEAFQ5ZJ/pJouIy6Io+oGNMnKJAaSUlyLidTMI9qJS6n02gtvSlh0AOvEEFb+atiHiYVEUPWmji7wAcAIi3tNCsAfjOD59dHT0TzYTMKUtMwA45/2e592DiHym+U1MTOw7Njb2F1MdEF0uAEiRKjZExNVFFIEoKwA456d6nndxq8UvdapYQlbKZNEP6Pp5m2zQnIa2bAAQQlC5PMqIQuXzWrZSJ4sm6Q3Txd+pM2VRwaRcW1kAIKVcqgtopSmnU/508bR6Qog7AOCrKVcyJmtQr9dvsPVvM41bNACCIHj/xMTEhYyxc1Lqh7ovV0plUhwzlxigeUJSStXKn02jgL/qpIm5PMgoEACMc75Sp8N7Z9rFZ4zdFYZhZnmYcweAtgSUDWte2snq/gQgSqBoXRyhefwiAKCTSVKeI6OC2Iyxn4dheKyhHqckawsANAjoJS0lcjBtlDj5JqXUL0wZFAUAKojted55k3kEDraQ/USlVKutdWr2bQMASUb1cfTbfZvCkRuoxo5Saiz1bJsI2mEBhBCUPZSA/2lTWXVquRVRFOUSGLcVAKSEDEvHfleXUDNKx5InAHp7e/edNWsWnYSeYrrwk/WHu690bLMyMioe/Spj7OYwDOnpd6qWFwCklLfobZ2XSqD/d+7u4tG7KiWj8vH0dp8qjSVO1ZI1AKSUF2j3Nu3HmxaAqFb5+F2VIYSgEzA6CaMTMdP2FGPsojAMZ/yIooPSTG4E6UrhFNxStjLTtl7vdEZNGZjStT0GaCUoRcyMMQJCy/f70/GiNC6+758xMjJCn1OnbLYWQEo5gIiUT9CoKogW6l59BP54K73k9f/SAaAxUV1vh4BgtGcmPoh4cxRFlB5mt2YKAJ1phPIGn2CxKJv1IRfVTiq0lRYApBVStu/7y7VFMK3E8W+qvRNF0XeaNW0CACHEjQBgU4dAMcbWZZFFNCvUlBoAjUkGQdBLtYUA4GyLiW9jjJ3VqMyRBgCc83MYY1QVZA/D8V+mX7zneYMjIyNvGPLIhawjANCYOef8UG0NbK6Tbab4YGJiglLCzliRazIg/S0AkLk3PcauU3AXx/Hg2NjYtlxW0JJpRwGgMVcpJZ2HU7WxIyzm36om3xOWAR4VwR4Mw3CLhYy5k3YkAJoCRUr5Rq5hUe6aSj7AJr2lS1QVJDnbfHp2NABIJfPnz5/T09PTCBT3y0dNibg+o3/xiQ+jEnHNuVPHA6ApUJynA0WyCKbBmom6X9BbukHaeZowKJKmawDQFCgu1oHispwV+xpt6Wq12uDQ0NArOY+VG/uuA0BToHiU/ihzTA7au1Wbeypk3dGtawHQZBFO0hbBqPbPLqu7gbZ0NnWAyoaWrgdAk0U4V1uEAw0W4VH9i7/fgLbUJJUBAK0C53xvsgaMsc8lvKj6EL1wiqKIbjd3ZasUAJpXkCqWM8aOjuN4IWOsFwB6GWMRItIn2dE4jjdmXQOojAiqLADKuBhFyOQAUITWSzSmA0CJFqMIURwAitB6icZ0ACjRYhQhigNAEVov0ZgOACVajCJEcQAoQuslGtMBoESLUYQoDgBFaL1EYzoAlGgxihDFAaAIrZdoTAeAEi1GEaI4ABSh9RKN6QBQosUoQhQHgCK0XqIx/wNalq/bOjwz/QAAAABJRU5ErkJggg=='
-
-_delete = b'iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAAAXNSR0IArs4c6QAAAYFJREFUaEPtmTFOAzEQRV9qGsQJkCgooaCghIImLQWi4wqcAHEDbsANEA0dEnAApJRUdPRpUoNG2FJk1t5JPIu1yliKIu1+2//Pn7G9uxNG3iYj548LaO2gO5A4cKJ05FWJ64VZOnAAzHpn/AUcAe9KbBFmKeAJmCpJPQNnSuy/CBDiIiC2XIrsAvKTdg481IqwcuAD2A9k7oDrDLEr4D7c+wT2hhLQVYyHmcmOgYtw7wt47CF1CewEjGDfMviuevrjbM4BEfBSGx3j/qfAZgm4SSIY02oerot7W0ZRXgDfYazt8J9G+3YVB7p4xQlkYLFziCZpGwOlWmBUoMDUBSgscwdKQdqIFFreO9JCL92LgWueQiUCGgddQG0NuAOtNzJ3wB0oVHHtMljbv5Oa9WHOa8BrwGsg/0Q1iiJWPLMUIc0Pcy6g9SrkDrgDyn2gNlVK/Qd/sTUk+eWxVec0FSh5MzdaAdoPeFYCVR8CV3HAipjpOC7ANJxrDOYOrBE00y4/KD+VMUrYU9wAAAAASUVORK5CYII='
-
-_edit = b'iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAAAXNSR0IArs4c6QAAAxBJREFUaEPtmdmrTmEUh58TEREREZkiMmfKlEyJyJSDS0O5IBf8A/gHuCG5IG4RRUqGyJypCKUUiTKUEqWU0q/WPq2+9nj28H2n9qpT59v7Xft9futd79pr791GF7e2Ls5PLaDZK1ivQCuvwGxgCjAiB+RtQH9prD+wEhgFfAU+AjeTHKNS6CBwIMk55flZwLOEsettvukN4y4CG+N8wwRMBV6khEszbEnCKgjwPERWxN3A8aiJwgTI4Zg5vLaLpwENG3M5Ifrr7PrdnfM5oA+wyh0bDXwImyBMgE+fQ4B+l2FrDL6nXfwfsNUF7AEwz85tB063kgBFV2nT26D+GrxyPrCzQHsrClhh8H0N7o/BX3LwmwClUmAtk0LLDF4lU/bb4K842A0G382OHQH2Z9nEZe2BxQY/0GB+GvxVB7fW4HvYMRUR3Rs+NVvAIgMbbCA/gC3ADQe22sb0cvCbgTdxFaSKKrTAwIYayHeDv+XAFOWgfOqwIp8Ir4FlC5hrYMMN9ovB33Hwyy21+mWJfOBfpgD1UorqSJvss8Hfd/C6S6ucDugMfJkrMMPgxxiYGjPl/CMHr30h+EGdhS9LwDSDH2dg7w3+iYPXvhD8kDzwZQiYbPATDOydwT938NoXgh+WF74MAaosqveytwbvO1vtC8EHzxipq01UKS1yE6vxUgMmU+1Wzr9yE2tfCF5tgSwNfBCMyIeiIgXsAw4b3FFgr4PXvhD82AzwM4GnNj7yoahIARcA9TGybcAZ+1/7QvDjM8BraKqWpkgBv+xBRJNPApTvitxSYGJG+MoFzAeCG5RyWwIaLU3Oe59KVyDpJYA24Z6kxqxBcaUCdgEnHID6/OvAXbv7PowqgzHHKxUgDj3jKuevuXLaCe4Ol8oF5IEN860FKCplvlZJWrF6BeoVSMqRhPN1CtUp1KwU2gGcdN2jWuFmmN6PBk3hTuBUGERYO602+HEziGPmnAP4lwIdQ6v4xJQ3FrE307jPrPrUtBAI3mfmBcnq/w24B7yMc6y/E2cNa9Hj6xUoOqJZr/cfWTToMbJthvAAAAAASUVORK5CYII='
-
-_elements = b'iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAAAXNSR0IArs4c6QAAA3ZJREFUaEPtmUuojkEYx39nacGCjbJBSEQpViyclA0p19wjycaCiKxcVu4kLOSWcglFpEShiLJBLqFcihILSYqN6H+a9/R80/vOzHu+77znnHpndTrf88z7/80z88wzM2308dbWx/VTA7QwgnuAscAn4BFwOqXv3hKBD8BQT7AAVsYgegPAv4DIS8CCEEQMYCKwChgdGwnz+zPgKnAvwceK3wEcBoYDJ9x0UhdBiBDANmBrgogikwnA04C/Fb8T2GJsxwAXUyCKACYBj02HKaOZmU91f/wAJgOvciCs+P3AhhybJIgigGXAGdepFlJSRnD2GwFlFLXVwHFPnBV/BFgbiFIUogjATp/YOvG/rwjcdf/cDqivrFnxx4A1CVM0CFElgBWflCJT1kRVAA/cepCmc8CShJH3TfxIKDuerAJAa+mdU3MdmNUF8ZmLILRLD3Bpur0KgBsmo+0DtMibadpnxgPfgUFVABwFvjrFL4F5wOsuEsx3+4PczwJLqwBQFjoPLHSinziI9yUhrHi5TgduVwWgDyq1ZpucNsm5wOdECF98Z3quEsCHUGYSxLcIRKF4+VUN4EPccRAqO/JaUHwIQLXJXtfjMOBjYqhltgI45ew3A7tzfO10ugnMAX57dlHxIYCZgHK22i2Xe1MZlKv1cTUJu1LgaCGuOdu/zjZJfAhAv+WdklIhZHcQWB9xsBCXXYocDBwyfn491dBlrFBTqRsTkafxArAokdZC+C5B8bEIZJ0NAUYmipHZG+BLCXuZHgDWGR8taolXFIMtFoGYfyt/n+0GSvDPI6e5zu+mALQ6Av2c0IGJ9NontGv/ybOPAbR6DUwDVBuNShSfmemuaHneRUEIoNVZSPW7f7wsydFx8dVwxi4CsPuAbhbKZCLdZGQ1j90H7gNTnGL1F7qxsGDqK7sdeWgORh02RQDN7MR2E7I78U+gv6tMF5cc+uwM8Mv1EV3E3XGoz87E0dyeA2f3ioZBr7KYqwFcZOoIxNZf0cVWPYXqKRSbO+73egrV+wDQzPvAJmCXG0X7PqCDjqpQXRDMKHj4yJulOmPrXK6yXnesI6xR6gtN4vRvMPNfaHRToRuLZppKHJUi0VpIBt3xRvbCvHuVBdEzV7vvFDvQdMcrpQZmHJB6ItMR86330pMUgbIj1CP2sQj0iKgyH+3zAP8BKHwFQC9rlesAAAAASUVORK5CYII='
-
-_folder = b'iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAAAXNSR0IArs4c6QAAAYFJREFUaEPtWMFNxTAMtacAsUKSFRgBLggJBoABYIA/AAwAA4AEJyTG4J/qjAASS9So4iNBW77T2hEqcq/xe3nPdtLWCAt/cOH6wQ38dQW9Al4BZQb+bwvFGB8AYB8AdgqTtAaAZyJaFcabhI1WIMbICvZLIrpW4CdBBwZCCE+IeDCJpReMiOdN09xqOEqxAwMppVdm3isl+C2OmU9zzvdaHgk/MNBvHyISD3oI4QQR76TN5qwj4lvbti8558MxvImBjjildMbMN3NElmLGkmlmoBMRY7wAgKtSQTPiHono+DvO1MDGxAoRj5g5zBAoQd6JaLeqAUnB1HXpTJpXYKpAKd4NlFyjUhY1614Br4Cmfz7fLT8+LPsJ9VtImWAR7hXwQyw2yfYAbyFvIW8hf5HJP/XKLtkK91tocbeQ1WCrUlvJP/UWo8VK4jtaeayyGY1ohrvV9BcNtr52nzFeryJ88mixioqKpOLgtuLeJtRuwCSNChKvgCJ5JlCvgEkaFSQfKdUCQHGQ+hsAAAAASUVORK5CYII='
-
-_ICO = b'iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAACXBIWXMAACdfAAAnXwEdhrpqAACo90lEQVR4nO39ebyfVXUvjr/X55ycnCmBAGFKgDCEGWQWhQSUKQEUFFGRIFatQx3bXjvd3t72215/t7e9rRNqWzuAwaFVGUQmUSEgIjMIBghDgASBkPnMw2f9/nj2sNba6/mcEwY73M96vc75PM9+9l577b3XtGeat+hCgAAwEjCqIA0MBhXhjCoyxUTcCkcAk1/dN4myFtc0oD599aUV/tbfvBoBAHwIwO8B6JyCNJmYRZiXba6Z6onq65EBEIWn/GJjgAEiYgbT9Ks45JqTMDGBCTS9piITyY0/nTiRFhHXi9eSHpk2P6cnMnGJgHEAzwF4BsDDAB4E8FMAz9bQ/uoAhYK+yrgrBmXNR34GVHER21AoSY2PEQd7z1xWUmJIzqFkfi3GOkVlQ+srjML/Ms10lAL5dJwO4FMAOlpkqpKIUnvCb6uPUxuotpDKLLeKpVC0T6W2OTxTwiurXSolmV7qCyKmTEnJI0Xzm7JWxSdS6Uzdt2qOpNw4GqIQHurVqU9GlHdZ4fnZCn8l+gH3DAB7hb9FPrkFzJG46gwpBYq9wjK3tpvTUzpFc2oL1YrhAVW5ZZygHmWcOk6WzywDeOoiSCx1iqqegqlxRq6I5fAUDNn4+ePhAD4LoNf5LBg+fWSKDExBei3jJUoYDGpRQxUWcskq60xEiJojCoykTdFpiFPxkmIoVYG1CfJbfi35RtEj8QQxoao+su6kbMiIoLwambYQcOk9OAqjQteCry0YBQcQHgLjbgA/B3APAQ8wMFpUSOVFtXRjim8hF3LCJERCdIUwaN6iC1sUxQffevsxokCxJfJl5jVVnKlpmxrPtuYZYDcA32biPYgpupOlcdFquFTJGrw4kYcrU6IpIhCYWVu2FmDpIlOXZOtVEFOkqam/VmWLuIOwCiehkoj47hUlkSbprClbghDXxRfpMA1EWTRrZZOFAi++SwUaHkcB3AfgHgB3hr/nBI2vSFa2JT3tvuhC3x2ZVlbTi/3yQOOty6WkpJU6sqGoweqnaZGiC8D3ABzqItM4LeMqB4vys7X2niwqoUkMTGDixHOeI1YUpaZ+p9OwrQxWQu2ZVUGHTWOFVllpH0Ttsh3SiGZIezNOSg9jq3xlO3nprQL1DEFMu52i1LXgEsH05GMqaEwnUanYZMalsNWny2G+svTzKN8qh9g3qTXCb2xlNsxT5a59WjKh4ffvuBJ+VXwZJzODxhdiWMvLxpx4Qmv5LrvprMJd4bft4AhnISSYIk4ML+JS7iaYdFS+y6iKNrexRG1WeLggQck2OXVZK935h2vKHz2XpGklXY5Gk8Gp7ME5/gWArxBwARh7epnphqfIVxK/A76kpXQvpwswFXi6STN47eh5oApQY7uvCh1lqBk0miKd/52BvyTgXVMlN2WmunhFPoTYfaqzigCUm6k+GStmS9uK96OioJr0yaKCqvErgzO2oKOAUs27CkTTHfv6iobadPG7V9+RHqdOXGXnlNvmq9JPx2OQNCocUqqrCLPrkEwt9GV8qnlvTCfxdMIsYXWcVjG1T7rUaKIuWuRYfvO0IhfU+WinW7Hi+0cJfF7dZ/aDlSI3JKRvDCYKlTCV8ANqwE7gZcuQZP4kTo+5bVmKtIRS+GNcTXeykjGYUq7mSZevGPgk82tIDMgNj0llJOhSwmsKTqJaict8CzoItfXo0qjyzYwb/bctIGxhYJHmX6fxpoBWBCUFMH0Rs4LlIyY3VJoNP73ioJRLq+Ja/GVJyIknQ+T8l63sFrAUwKcA6uSaBI4bDxvXUBWtLhORyyzGyhS6VnFlnF/QyYuq5ygvziC0llaH2JLB2QZUsWLHhAUistRwjW/olZUTxZp1KCBS4erXYRKjQMOEguJiSYPP6igGIyXNES/q4gfeIxFABPxBHf+2Egtu8V1WeVIAdbjqhH1bVo7U4Z1e+unF4vSb18dMV6mRbujp5HkYA38OoDvErpiuSJaNQ8E5nuTnuATOk+uhLCzqLJIZ3F0tn9mqsNd81opXpDkVFvMV7yoWadyuZU4SwHUGMpUZqLweA0wMvQbGai+Tn+R9S2sVVuPqMVRFprw4f1ZNaLQRoaJTjhdIJVUnkyk/yXuclcViAFu5+jvXpqzj8UhM3beo1Ru2IC0TyDBRK4IeA3WYc3MWJsNjZOi1Lx7WUs1vi98wNYg8dwDwBQJ2LGhV/lxr189h3PiTKkcwsbU6VVgyGcwszJpQZ5J/rUykmVnymxME1f+v6bglZrU02uJxZOo6K8mC+bMvRjFzKczEucY9mbJKTvJP/sbZa6jGDPJgXg0fkX7JqKN2I9iuT8o8yfdU8ibyVX04Av4GwFxZHt9As/pWCxwUQKuI01EO3rMMKXGEcOFv5XjWGldP0oJ6kjUlTFPip/AaGgD+EcDeyIY/oY/ShDzlZFG7DMu6HWNaaRmkIMbqEGuVSDIdCRwCkqzHrJRAU8n3Xl3IfCVSXRlOIqft4qtURBEqWSKhdFjRxiFHJeCZLspSmUNiHtaBCIuGUtHqFJ1i5qR7xbfYRpwdthJY4Rd1LrtGpaEIPzsD+NsYQRZEZUZ1SxJKaBSmU+ebg7fRZCp1XZM+FoLNu0ov0k5Fi1doaZRbLTSs8QoVCQR8CcCRMlWRZ9mKcQCJaqIZJW+D64m1ERRj6ZXbSaCF0lDY2MlPKAUlX6Y5FC+yDo9IYo/R1d3KihWUuXofzrtRIJVmYU0useYCW0eucubadikdGtal8KRLslr6zqSUuGFHpazPYWAAwADlpcgl0TZX550BNFJHwXdJS7KnCaYRC9snB9682q2VFvMuVaUnMQp3rcqcln77PQbOtKmsbhIUpgKmMhHkyF5ufC1A9fRQsJbG23ebhmOWxjjobFKQwxuKQVE2U4FDchLLB/hdDE1SRlLxLzNQLCAVVemZTJbfI9EiltlBlW16yFordHZxKEJstRH5y7XTOI0iRiXNbVpWklI0Umn9kUbl+JzeuyCwoUWoPu1UMK34qsGm76a4qCgzWVYl20CbEyjNnPl8LgO/aS1MoCO2h9R5mW9MpRZWCgAhDfixZDbHu6ga3+i6Vg5Rjf5tVfdS2Fslt8P1qqsSkBBQuNRCNk045bSopg0SPklIFt9obaU8cjHSXurppAYTAhYRI37K+YZfu+DH7ssi/ZohtGv0QrQnEio3NK0yDhqRnm8lVAOEXwWodyoZ0NQkHHodwFTWtBVYjpkib5Of/92LINVkwUk1RE+Zj4lrdpEcBsKfodoFBmSrFFsz+1CJgaP1st3sOlALXaSmD8yiyfYsTF2ZDMsrKyLSCP6MnnORPM4puBYjp1F7iAQd/uxgHT79oRroLMO1nEQhcPc+5+i2TQoPiIS1VhWQEaTqjE6Eab/ats4fTSmE8uMiOJZDv4XfZQBuIeAgLz/rZlho+B+mFhmP2ayZsN/qvtepTc9f0vPIJk0LP7NVfgW3ZwQ7EHAJGNsJyyx33Kl02TJTsnyyCKEOlExK0+WRKSypzMoF0t9NXH8EJJeFEh9TpkfNJIl9iV4+ce5cG+kUW2VvlUFUYKk7xDouQe8XtvWR6hsmsQ1ho8hYlzFqYs7CndJFAhS7VI2UEvmZRtzyReDlauW3MOLSVWT1JukRvwcDWAHgIpu3TliyQKN+RabNMLvsdSlaCXfUfJ4aya3ITpycPupkafF1ntNzhKyaronfAPA1AHsiW/165YNidNe11rJ8Rl8VLrXAI6q8mLJPxsmx3PGZAPLOk4g461a62YUqZAk1GTq4SRS05X7vOHdnladSKFarQXgspgwlLRxwa62m8qIQxyogcupWai5DE6DrTipWqR3l3L9WPYGVufRnlCiJj70AvqromgY0bNQ662lrdGpgR0Cn0kj1ORjRz4FTpLfj9C0EOIWE8C8BOArQ201rTKzVW0V1yf2gMb6tnsTJZTGkwVBeAWeiy/nnjBZAyUkBMzk168aUCs5oJW/7c6GnxUElCi9DDvZxtMokCLP1q/LJ+PUGrEhXeE9xZDjVHMAhBD4UtWQ2ofTIeXcVhgoIiJ26VwLuKb2atp6mOc/QKMzYNBLZODUK0NUmdQqmFj85Vn0bSuiNVNWjidzGvwdgKfvi6OkANs8JqtZiqiyLcoajNEhBiYFyYY2cJZDCFYkT765GtP19Td7UDSLzS3JPprxGsFwBqHkHqWahWCYO9KV6Mq3hUk7mWzSrlJyEbG4FgUW9infyTJmo7OShiMq0clgovRhOdmCRijj2yY40qnwI+DqoWiw0FTC8zUCFvvK+tQquujOtPIltAnZavG6NYx0K+Tt10nMB+gBQrUQBjIRKDPmzpxSAyNhpiK9U0NYsJ1c0v3pKXVpAka+JlneMRqshacxder9RpICHGmfFgKTjCcHS7OxVObvGTX5WuKVyNEUp8MvZA5k6eV4xDZVpbSJ13qBR1lJpmKoQdZJ4RHdvs9ejN2w4rWF3xdnTmaTXQyCch+r0obe3YvVYrkYR7Kgilap8LMLU4mddlFqEdU8Sh6cSPXqMhkwVP0WDA8DhDPxPADNdXKzC7Hik50wxqkUcwpoZ7cVFGaWQCQtua6goia2qtNS1erfTY+nUDDsfK6bNMoMTQNGOGkXi1DfJI+w8z0REl6Vhk18daJkxtArNpZYEF4pKqEzZvFLxlbkie22FWScbTUYiEaU4rkxF4sgkzhQzynInnkkaq1ouvNybaLea1SiA0ojY9zq/LoZZ/8lNLFJofCw/TctExGevhgQH6tb3Ia7xnwPNEDKd5JuANrONv4E57uhVKFQ1TaOKSeCJRsUqH9KvrPAIw6I6VVI6k0S6W4NyIbRwl/UtwkL5SCY30kvqPwuDpuqFdHrriHFpL0CeDpEZs2Yxo9iiJ2HbIx7RkLV5FuWCDQ2fqoVNNj8ITy0kTnbLUTqmvXVbwAozaTmIeBoqtaXYeW8hQOp7vfW35ka/cdm+LkEtVeI2AQNVPfwDgAWxbWNtRqHmMlHicUbmBMEt2l/IEimZLioakr9AoRUiObX61dQBwXT9CYkjCsOVHzIPscrOJMgy6wpjSY6JVKYTNJD0fmSighNFfcUxifTutBcg1YtAY5RnUoqmLEkYATXg51cTlXSRqtsUq26Mp8Sm2cJ6LVYkGMANCMuF65ZUNrhIXe94qe+mCWu5Kn4XbR0VjqdrrFp7pVBIW4GfAODzAI4OKVJnsRq4q+pSFJcQ3GnpXcgWFXkRqqnlxDROmdR3xAwLmXJI98ulspGWQ7oFMV6pOCTzu6rVUQzK2awpZkErCYNZVaPaw5NaJ74WxMT6qqlTHTWKoFW+rDRlbPtkjaErwbFr7A182qfM/VTSHfNjQWlRyIxEybFDXFJSqFYK3mgTSchnApKo8pagJd8yfl1yT6XVqTn53sqH0zC1ukitSqplPwXgbImgLIs1EPXHN8cE4puKWidSfohU8q6ekS8kA5xD/rM1Ips0PqV/ueqtyQGYrXOOxMQufRGnlab0WiyoA5CX8zvJtF4nxGlJFmwpj0+AYg8W6Q3ilBfbesjvSaGGYNmfL1qSdTqp2NNAL8syZrefOL+DM0/Z+kh5a8m0X3UhY6SGaNYpRR9uDgbYj8Hif20+zger4TzPofrWWjEoa53dodMBfEQyBGQDl5MZqSEj1hanm00LuDKfJN5ldh52z/rrZk6ei4oedZ8/usZFZBIhBcM5+Zajm+mb1+6y0Gzd2apWyvwM8uQwECHsp6tCWeYm01LW/4pTK97Imk3UnlUE8XsWbHLnpbRK1WglXXkdgyBZeCKJbvHoKUWJ2Rb+BnDeOSiZXSwEmlL8Cx/Dj1JP25QqhusFPOar1br+Vp/KmIzqb19Up/r0eFZAmiLOOsNwNWW9qVe5FGSyJETgrhUKXQBX48d/nBOWXszU+xEMA7hKOtZJYtSQeYvmIqFnqSg3CicpxeKEWZdHKUkr5AhnhAjENq3dPiLrLxRJXZwRv0vboepEaEtveYmw9W4lUatpJAefyLbWMMT6tmb4JAZ+6CnoFoeCTm3EbOtH1mklwFOBK+BGlKazeqVVDKqE/ksAdinKoLmHYlDm5ExmqPHIqllxUG5zqbYFYlXMnH+VHbtVVci2HOaPw+cGJzt5lHUjPCsyKshTbum8PXHuniYMaYGdm6mRh2oHLalwZf0tPaHyCjsUlTSb+o3FKyu18iCswgh5xPajol5DrVCZf/wp2DhoF6VsxfmH3lLsgk4Azk4n1xuzx8yDTPljO7dQAK3F1aO2RQkkodsOJcfUYq3jHAOXcNg9VZhXU5tIjVVC5EDLJNESyTiGLKUrrYqnzERCP5WybGuhbIs0Vlm4Abo+c4fbFFAqN9G+SfIzKr1FQ2qxKaqOEff6OUpWxTcVwbGAIYzCQThqR51Qbh4ZRkYyCA/AEmLWVyieszh0eY3lEuVN4xgy74wjZWNug6pX7Ibm+GnEujO1JwLZlPWVqPdEF+ZAvNosaq2SwznkPMX3OsXiWToA/4OBNzvkVXFqNIfxSVUxSTdg0cV2GLtiTC72rsdoKi78qlC6ymy3lXEcnYbYXS5wB06t8k2jffY8QWvc8icpkOHJ21iTaIvkG+HxlK6klbgyXrHXHxunYL+g3Nz+RlGGBMVx6vqjIM1qDim8UsDr88oG2hFFKTZCKeixCgrq12bkpC/Yu+FLb1ka10JAuTE1qsl6dZo673lbXYUamfVq/nwAFztRs1U12t02Z61+QNaXThxpaYSPqI9FqVeyuhFjdC00id0U/bV6OOszw78QVEUUukqy6dbAUtCExhREqyKSZpJiqlq8sC2vsE1GvjMtJj/VBhArcx3OJKd8UqnpnPL34hhmts3tA/vNpQ6ISW3lLXCq2fElFWb6lTQ2CnW2jVBXojJGjinz9NSDbDE2X1V1t6KnUOF8OID/DnMjMhQvOeQVn9KDtLIMoKbvrqxZauXMGKmUvhuuQVaNH9Wh1xHAzJQOvVorqBqPFtzdeaiqvJjk9+i2hqy2JFQG5TA5SMPamnp4KZYRNVYxfPDO9qqKojwNMsk0GqEHWTSCqhvLN9KLYlHvjnVPvxKh8rgoKU+ERhmRCBq2hurttSJYUTBdveFxnuc9lPVO5ZPI1M1fC8IOAH0O4QJGQ7fUvpGNosw4BjSn0w5Sq1sSqwiGo4VcFmuEitJJBVIgz4GaBHLqLZezttk0Syv+ipY6sYHgl9rFEdRKYQncRhNLqxXOQlTFD7RQiiBI8dhYlVvVB6nveeCEi3S53gQCT/FnJV95E6QFWFjzUvjJp1MpWMMPJm+RVC13piJNY8p7l5zvnkqVBbDgma2idDVpW4Xb/Ovj0ZcB7GNy9NbgW0Pt4lRSn35ra6Xwzhyc2YMoxIgkU8TIJDJOYfE1+ymF9S4JFP/d2RVOylAiS8ISOYticr8RWt1RUbxbA5PyYfUaGylWRaAncVYSMnGHgAgTeTqmVcu3IodsKOl4isgo/AaBUsBFOT3jYxROjTYVzVH3DQxgFGEQvFGzaDo9ywPiPKhTIAxT4x41NT6NVtt1pwRxyl9yQIkBfwngeL1KrIxkyXSYML46SrksYhRSUf6aaswOrK6TrCJN+izoios9/FJnSKOmCUUwVv4uTrlitbxcRESoq5fS7BgKTHq7BqNoA9bNY9ozj6Xl1ZDSAMpHDlbaY0e2FtsDAsvyKw1Yd8Bn8jjYaw+3TPqpTvpRJ27kfns74EwDSiFKar42P78EEY9NO5UlL2mo3lqVKtpefR9Tiv0BAO+oYqsTX6fM2ikzxZMpRTO7DkKglwmqr5yYzFHt2nZWIuMplSTIoW4t/imFTedRGB9ClnJLGIe2EFmW6wysG5US6nhyYZXniRXtIISl9jQcXcAgadKjKmxJ+p61rUaXPLKqXGwjmHRk38gkoIiGU+ykgR1RKkYhZJKYTvyyKV/4ptVIxHkaIAbECsYMdsaGu8JI4gPreDJ+3W4YGX/NiuV+hG2E+YuXnQDgdxjoiE3JnKbryCzDSjrk6EP2m3n1V/5011eFiABf+7frt46NjfPw6BgDoJHRMR4ZG2cAPDwygtGxSQaAwaFhnphsMgBsGRjkyWqZIW/cPMAA0GTG5q2DTAAmm03eMjCU+agEW/0pEICw/FWwMKlJ5rjamqfiaCNaaBFLSCHgMREZ1kDBQSaRWGLqGwSBgJD776Kc1iKb/At0FNLn/KTiK874rCPLKY1VGjYhB9Jrpw1SXiJjAlFxFHUmqtCbRwHopnmLLpyaXHZy9Ompp9S8e78AsPZVUADzFy/bDcC/AZjfIprTaIw1Ky7f8xUT8J8cvvqtHwwNDA43AWCy2cTWgWEGgInJSR4YGmEAGBsfx9DIKABgZHScR8fGmBk0NDLaHB+fQJOZhoZGeHxykhmgrQOD3GzmrdZakZQ9rhq+qbX8frh365hGy4UHwsRig09JayxCiJLlQxzcUue1TqmoGcVsp4VaWYtGzK55sIpKwiIxJebZ7JzcWA6DurbAU6rEVir45cD8xcsaAC6BEX5ROjlXHY+uYQC0/exZLVZG/r8DH3n3Wb3/3jRMF/7u29eODg6N8MRk5UVtHRzCZLPynDZtGQQReHKySVsGhwGAm80mBc8JE5OTGBwaZoAwWnloAEDDIyM8OjYBQLB58oZS76siwMqH73AlSeHCrtszZ11JcBw0qYyygqScL+t0AVFUb1XYIZ05cSmKUqhdFe1QaVNbxWC1ug17FeBvARxlPRaj2qIpUgc7vPvMk/peXVLa8FrDh9915sypY708mL942VYgSF0+k94ux43uAGAcZc9v1iumpT0qVYPMA0iDiibr6oEQkucuTxLd6MBXLo2S4ANb3g5sfbNYKCn7+bsdYanr22j8r6bwz1+87EMMvFXmW5yAEdwsL98//q0L5ryK5LThvwA4dk7KkRT++C60QepFOGjyuESVsrh53LJowbOs4nEar0DcWkUxHRcuRsh372IQcGqLrbZMBv1mqqEWX42jtG0wCmAQwASArQDGAAxu3jrY9b0v/Y99hoZHaGxiEkPDI82JiSa2Dg41w4BZc2KyiYGhIR6faPLg0DAHt4+HR0b5gL3nz2iZaxv+XwRlA6PEEtLgaNVhF/wfpCuafbdnLAOloZIdb2/wImZPwarr/oLKP+eucskiGULmdxZRWoAV/FaCPR18dUpniiQA0BV+0/nn283qw3GHHzA9LG1owzSghTGUHXdmJs+jrO0kex1903f38BGymVVbkcUAKcsgZyBVmmkGsEc6FNQQkmJ4vksBrH4Kqu03G4+csDa04d8b5PhQNvhVmBBAtf04hCkbmb9N1yzmf0IGpXDLvGT0Kk95AmLEkXOX85c7dhpMGQgtF/l4ZBeOhjewIfBa7TqFEmjriDb8WmGvebs0mBlbBoaYmbEprMGAsbSA4uWCla1RFV4vmSAVW8hTGIRM6w+kBxJHD7KuYG39CZCrXqQCmWF3xmX/YxvFLZMtHQ1nbqEF3m0ZF5i3eNk2xNbQ092Frhkz0NfTjbu+8/mXjacN/7XhW3/7B90Ewuz+XiICZvX1EjNj6+AwMzM2DwwBAG8ZGAQzkqLYMjCE8J3BjC2DQ9xsMn32q98aN/JghRKcz0XPUpjes66x5l+jLZQHkLsEaoZADALGpb8Uh8prBHKqHntFZ3EDwiuz3yr1KxF+ABgeGcPwyBg2bx18RXja8F8b9th1brlUniqFAFTjTgAI07uKD+8999TOA5d8cAieAFUykm4nRunqe4I3tc3k5C0Um5IAUCqgXjJd3y2YKk8xUmoCW8RvDW3Xvw3/JWCyWqxUnJAEAFDbdvWNQ7ZvINJPNbQm+xfe+DwrDeeMLqjw6dzJmVVIK9i2YREJr9T6S3g1lh23oQ3ThcHh6iwOMRgXx/esvaTQb/d2Q8oRSH+Swqw2slMEEjql0NcJo6c6BLEqt3Byg/s9P5seUD28qq5/G9qwLeDxW+gCgIiwXX8vEH6JgNn9fSAAs2dVv1/9s0+otFur5cgZl55okAY4bSWWo4QR4rXC8pOKk6UmIo5De7ZrwZ0tRij1EGccQWCvg5I/Tin80x8PKGKdd/oJGB2fwMDgMMYnJrB1cBhj4xMYHhnF0PAoxiYmsHVwCM1mu9fQhtcGuNqRCQDYtGWgZVyrAAarjVRRArRcx/F9p6Mt5aaue57kzOzgTHQjDQCG8GpooH47sJzAE2OV0huwisZi8PwTqUDquhoeLL/6xzjpuMMxc0YnZvX3orOjA7P6etDVNQM9M7vQ2zMTXZ2dmN3fiyYzBgaHMZqUwwjGJyaxZWAI4xOTGBwaxtlven2L3NrQhlcfBoZHikNCErB6KofQWHvpcU6wiG6ESHoSIjTOIrK7EpCKkAJhHa0mtD62J/ytxgOWvfXNLb5q6CCKI7RtaMO/C3R2dBRhQ0Mj2aTqA6FbjfRLYxuPL5HrehSOqBHiZHw2tmmCH8FHYMhZAAt11tiz8e7wo3mqE/DSF2pDG/7zw847bl+EDQyJA3l94VcgFwnEHgL7d+9R9SnjIKsZ8lCB2s34sve/q9UHNWZdTmW0GmCsv9qjDW3494O5O273stPuNneHImxgeNidtwtG0I7Dp9ucozATymN9BAoieyNywCPCZF+BGPaMfOVr1E8LyjA1sSmHOCB0Tg3FGU/b/rfhPx7cf8Ul6Tmu7hsaGcXY+EQafG4yY2u1IhBbBofBzSaGR8ew05xSeQwOjagrfcI8ICv3HGka0EhTEORyEF0MKvqXhgqXQTxWP53u9EFAWatqnHAVoSaeHBuovySlDW34jwez+6tDkl7J2NLAkJgGDMdnWOFPX7Nbry8hNTMBsa8Pbd2Rev0wEp+BCOBGrcqogdoOiwmzMwo+Fh/mLV7WHsFrw385GBgcdmbGS1kgYfnLYX559mDuJhQY9O1IKYGIwkC4GswhYEqQnQqvq6D7OtHR9zWLox6+PA0S2tCG/1SgBgHLfXLp6HHONtjr0wMA2Hf3BaTzS9J16UrOgifhewDivw6rycpJ7ysGXwXIuPMXL/tjACe1yK4NbfhPCUEBRDmPz+kxdvJJDPyhRvSo+MZ2mU5SHnkqMCUK35gaStyTz1BcQ96amhqoGzyMU3+S+BD3bADv3YYs2tCG/zQwWI0BRMFMlrmSiXzAp5ExOZYubaUZvquicY4fRTqMNWR8JMS9s5glDG+mo5KyFyei51yghX2qLkTuwyjdtC+AP0U47mv+Scue7qAGze7vbXTP7EJPd1ejv7eHOjs7aPtZ/Y0ZnR3o6+1u9HTPpJldM2hWb0+jo6OB7Wb1NWZ0dlBvdzd1z5xBXeHbrnN36Nh7/i7tc//a8O8GA8Mjxey5GKiT/X4L6gSinCwPI4hr7aXgQ6SxwByXAjsjEzqlMdv2TpR0PzbiKoNtHUVAFwOfB7CTGLjgyWaTN2wZmAxhTc81CflZByXps/hhzYrle0yDqDa04TUD0QWQ/FlYQgGuw5zn+4IpzQMCzkUnKY1UCmmlYHEsuPQxVOoa0Md7ReGfZkchZ/w5Ag6F1EMVCj3KKc5ZzoVKQYUzEh+OPmRhPES0DW34dwFmjtuBC/6ELzDSrhoDVwzoC9/dBzFmwBBOfEMi89x5D9g5LJBVSjLhOnfz8ZMAlsYQMzYgBkky2NmGPKjha5+rvvI/dylL0YY2vPYwMTmJiclJjI6NY8vWIWGzlGDHy1IliM0+KX54KByFKN91tw2nX/u9U+ar3H1LjcJSqohWmseqMdFROAnAR6LbQvk+xlhHTp9Ij0qIGnLd/+1n97ev+2rDNsPaF9bz68//1AgCXzUaRLP7+4iZaVZfN3d0dKJrRif1dHcRgbD9rD7M7JqB3p5umt3fi/6+Htp1x+1pznb9mNHZSZ2dnRgcrq4nQxwEDH130xWoDBqBiSvvnlyJzJDSE8mxAEBLsxoUjBH0SkBUPQNGHKHgJGJKLHXGlhB/HEFSUQn/LgA+y0B1wFrVK1EoDD6KdePgNSOiGd595kn/ae65a8N/HNiweascledmk7FxywATEM8DkIKlTukV4cVYVBQlQjr8MxheJnG5SBrrolKcYHHGfM3lImnITiiQpGCiXJl1AKRi1XggqAuZqusQ41C1AOkSAPNypWX/I/kzbnl0VizJ1XkAaF/31YaXBxu3bGUhNfI2j6InCy38tQPRMdB06Ktnx6t28klBYmzMG1NINFnhlw8EsRuwzsew4dOJ5/TRLfz/AByjouUBvrqCqX4S63p0TjJnOvHoQ16ziyPb8F8bXtqwRQtUHuSq/kjxYvwtWF16BWykwfHVJe+rnnN2FqZjZtPQGTPiCkNFasq2YRL5lEdspN+d6EUgld/eA+B8gT4VuOqAmPFEqMtI4zdx84BWFLkxiL/1t3+4s0dWG9owFWzcMlA4lSztmTM8LcXDdROQzvl0oZVoe65w/cBAFokgXOLuspyKIU4FLkYWjTqLNTAdSCN3ZfxDAfweKs8jxkguivCyOKuBfDCZKYNbDzHO3DmzyyNZ2tCGacJLGzdHESfOxsnYM0r9VgGELHgB0jLdxOPK/RcRhdgV8USmpJNpkPeUQkuL8iBUF8ADr3PRSgdEFydSbuL2AfgbANsb9WlVBSHcdqQqQ5dW1i95YRedc0p78K8NLxvWb9qSDEy0okjMHT5A+actOvGafUOfNfGqHLmXCkKOETpoy/DcV7a9Cw8ImO6JQFYt1WCd4nKRzwPYH1pnWnQs/5k+WDE2AJlIKJFGg/C77z9v+/oCtaENrWHj5kFlseGM5xGqQ3ghhFYC6/Q5ITj5uIl3tdWWzO7ZXDIimYVO55996pr001IAseTT6QEUQ44V/C4DpwGIK32kILNN5pTG6VIl/SiXPjIAevPxR3RPg9Q2tKEWXtq0pVk9JTEiKbHiqdYFoMy3ZuSP1DFfAYtntW2YzEs62gw1LCZOAeKkiCRwnN2vVwBkHqleCRQSrOHNAD5EKBRSSqKMfaqRpFnt6L/OKR+SmJTKv/zv392ptlxtaMM0YMOmLUDphwJCOFnwnAYWU/yclUfA2Gp4zXiz5ThibQBFmqLAy2lMeb5AhZidMYDC5jrvvutvRxzS724M/C8A3al/QLniohZQFp9ZKYnwnWN83YNI2Sdq5+2yY3vwrw2vGF7auAWo+NVaXcmGtveJ0CtgI5iKSaVXHpWBQlya2bp+fPwWM5GngiqrHwhOTkz0IJQCSEJck11p/bl4E0kbAH+JgN1Q2ek0GumPI0g/o6RJ0RdcBFH7sf542TmntI8Ta8MrgomJSWzeOlh1AezBGG5/n4QVzy4shBETAdJbVbMCVCO7DL1HxngeslNSqygCIdJ+MiNNA/rda/tKRWhLYf1LgI6Gcc9L9P7IgnChFGrRn5F6igGgo6ODPrHsrbNdhG1owzRh49YB2YWWYJ1kNY4lBEsadGuJHYZnKZTS2U5W0TGEcuCwbnhO4Ug0UVY+DYVSZwCjuXQ+rY8kuxDA24WFVgMhXm6msyVGT3Ow6A4oBLHfc+biY3paEdWGNkwHNm7aanm1cFpL81sFM9KiG895jWCTqX9kBw5LqESBS7oseaJLHvYeIa+ygTMLYEcn9LO1uS5lhwL4DICOWHmtSpLUUuxr6U6QuifdVDpxHhcgAuMrf/aJHVtk1YY2TAvWbdwyhU9cQRBWMUhdDglwEd1BkqOS/mMrjlaWphKtpCAoy4raY1MogG27pYdt7D6iuNhHuVBe4cseRfwlqRdgi+n6HnvP36193FcbXhXYVO36k9ZVufrxIYZl++Ts1BdjAdBCHhEV3gFnsZHsH7sZMb0aLTcOdtQcTDpt9V3k6EwD+q69rxbIfvsCGPuHT1GA8/p+jctzNmRZ6g5HTD0B2TK3fuOv24d+tOFVgXUbNwPlIFe0wHIgbVugsOBkvsHMCMi8hNeb06RBvXI8TtLP9mPWMJUCaDUM5w8AlpQD+G8ATk2pdf+ETBpr2F1ifRehHBvomjHjZbRHG9rgw8bNA55I6NHo6ekAOUDnpbfeQRrhJ6jrwaQwSdqEg13QKRVKoSGi6S7OBLS0tyxl9i9OAvBBlFJaB6oyYv8Exr2X2i4qO6+Lcu6pb2gP/rXhVYOwDyCxopSy/MyFUDmQjv6eIl7q94vTO5TigBKX9GSNbLxcJE4dlmkkcaCplgJnF99SE18YmEtxsY/+ZGPb8QD5Vyw9iLVbeiCFCqC/+cMPlVextqENLxPWb4yrACuw/YDwRKq7rj+TiISATKBhydrxu42ocNmMdKJISHG5SBlT4CQUS4GLQT2VQqo8kfeXAZ6P2D9Kc4y1l4ukAQqByhk70Wk8Whigg/bdU99w3IY2vELYsHlrfGzdAyYycqaG7ZUH4UhC6vLWuRJCQGo9COk5s0BVM34WnxNqsxQ4W3z56/kR4fmzBBwX8VPWICz9E1UACv6TOFNFeBjJXSL9XlRAVfPMP/znz7YH/9rwqsJLG1MXQNo7glppW/G69Y4JkqsrCFKlDHJMKgcCoEUtjvin7ciecjFesjWcCjxj2pBZW2mbouNyPoB3xr657OtYjSUlOnoplBcHp/PWomfAav2C3/sAwH09PVP1rdrQhm0G4QEk4GyslV0M7i6EgHsDc+adisNFPOEMH1o5B3lKrF5ca/r/FTSSfuLyY22uwH4A/oCBzki4LADpFJVs51k7VYEMOPN9FH8IudYL3fSOJSe2D/1ow6sKzIwNeSWg7Mu7nmiVqIpq+9yOHNVemlWjNfRIuHrkrHvipxbUWTpi1EZM6Lj3RdoQ3sXA5wDs6EQi/V9RlCuV8ppnk6/uw3DWIPFS9DR+QKD/9dvvm+MUrg1teNmwaesgTzSbQDnsFcEXFW3YonegvnP1r65LG3CosUczXCbzys6DcgdKyiy9qVyMMAjIno4o0ib4vwQcmkcMCsvuOzKq78R2NZ/sfTCg50ADjVEPEAAcfXD7uq82vPqwcfOAdMdbCWEE6ZWSEQLpCRAFLnY9g4RHHXCddxgKEP0QLsys6YiwNarI2oMAbphS1vYkwvffRHWFdzFgmIlVJMSMjWYrPJaibwVZmYTkNMQCXfWV/znXp7QNbXj5IC4EAfxB/fiq+NwyL8SBNlm+iLw7wECJ/y3vezvz5YGjZK237cpTxp90T6SHAWrY60zqFB0BR6O6x6/hexrFQEYqdyXx9kSlIquaeik/t6/7asNrBes2bAaSNY+X+Khx6GpsijWf19jNmKi4vlqkTQPjMo0rlmKPjEWRVIz4kJVE+lSQ2aj1bHTUWQD+CsCs7M5Il4e9lOlSghCD5EdTOLf+kpdhTk1919LF7ZV/bXhNYFN1FkBc5md29gaHNgtUafgDWL6HjqhkRKZhJw1HOuxBosUQYeHHW7pSGoK4HtzqAGcI80sg7BsJIY1I5SMKETNhGUN6KFGJ6AEEXSTxm7L+Hx97z/ZO9Da04RXDSxuqo8AkRzsGqlbwoT8wwYp4kNTM1IX1tEaSzCcCF2f8mdesHLKAuqY+jQG4aCr4fQAnZzUEhlgQYVRQ3P2XiDaVZ9f61w49uNoF4BOOOqQ9+NeG1wzKNQB25o6NjBbf4nOVOHTTK4kUIpMFh4oHjST1rLPQU9rfX5tzFHpW75J2AorLQQuEpwN4vyGaJKkmX6kZtcuflEe935KLWVwukvB++3N/1B78a8NrBmEjkOHJBFbuJMRvgfcJckhOaY18gUbcvNOKpKA/3MtFEkZnmaB3PVmRUTmYlk33zgD+DGaTj0EitYnVMGZ4UmmHqBwKB0RcLkLB6Uhxdpozuz3414bXFNZXZwHYfrscBSwc5iDEid+FcddGMINUDCxFm42VDjJQoCCRYxKt7DGnrrXXpZBElAKVqb8EwO5cmWPp7kviuEhV0z+Kgyp1A36ybAZBin/hW9/cPvG3Da8pbNwy6JrjKJh1Y1XihiCW1k09IU2F+UYyR2bn3XQa8o3loudv8cp3Ly87CJie/hzAsVFoo4oxkhtvF4H5lN16odoipcLnJxmXteDLrgEDQKNB9JkPvKN94m8bXlNYF+8DKK0wAMXoUrjyc+T5bOnE2LmJ29IgMmWxcy8XKVMIWTKfasctzIEgBADnMvCe6H5LVWIzDXMYSliVrtC39qTOjqEkaTHbcWJRSW8+/oj24F8bXnPYEMYA9IBW4eBaWyiicrl6KCMgq0CU85/Ct/lykYSbEWfe6oYxNNguwF4g/BHlTT7e7SIJoyRCFLDqLpQlIxsZ2j2KFS/XJlHwa7h93VcbXmsYHB7ByNi4MrsoDCrZXT8kxIQ5nQouLD7HqBp0wMu6XCSGJcNJypZm5LYPEHFIBdBAdajnzpZQSbCdgHT6OV7pkjXXqlPKe4WnUDggzNtlx/ahH214zWH9xi12ji9071W0vJG94Ge11ld6xRFXAawft+VyEaMTWN4yVGzvsX2AmE9DhP4fAEfUEWpKkI7zyKpGdfeTFpT9+kIR5lOP1XiABAZw0TmntFf+teE1h41bBoAs8NaHJfGaLLOKASZmkitXjYxoMEY0BTGmdbmIQZXJky5Ji7QMgOJS4PcAeLv44HYgoosRPAFnXDC5IrJDY6jQ/pN5KroJMzo68PH2dV9t+DXA+ngjcBTn/KkS+MDAlC20EnSEgz4cwa7rg8czxSgrlTLzYkzBvtdtmsmp6+SLGwD25+pI744g+YW3EPsVUc2I/pGF4Oar01FaaS6E0U5l/eUCh6WLj7HrENrQhtcE1oeDQDjzOVBJdXReE5+26PNGA2rGskrgHHeqy0UkXoWCK4VVeM/5RfVHIu2JpgYInyNgxzhaQRqJRKz7HbVnm4ChVkR5RMlyUfkt58Lt677a8OuCsAy42JtCereeOv5OxJIPLY2eHLWfJihPg3VmxgvJL8KgS0GW63fQAOMQIGxaKOmOgeWZIawrybgpJEOV/+EUiGoKsmDeru3Bvzb82uClDZvZ4dWC9UvrHz9kx7h05HMsIRyEqRWGNcLSctZ5FjGC2u3vaYpGJqRc5EQicyrTKttNLkGy61QDSlVoV+a29nVfbfg1wsYtA9aXljzdop8d4pUdY6sQADUroA6/rQO1ZRjKuPtgLhfx4iZd0BCuvHRx4lyHnMKo0TbWw7C/WU0YFyRmI32PRGj7uq82/Lphw6ZqJ6Dwr+OYQN2Ad/wNZ4dkv7gmMulvUVTZiaoiAdlCxx/TWxddA9b5xV9HY7A6EESOdIjbRTwNKAsThT/8spZ8oTxihOgt5L5UqoR0uUj7uq82/Lph3cbNumMbxIpKocyfI++ncYJau+X21cP6HyXMxgPhGKaR50cx6Fb0YIQ1dgmTewHk7SJA2SewWkRaeuE9pMn9+CtHHgtfBkkhUHxmMPA3f/ihOR7BbWjDawUbNg9QMvuIPFzaP8XQ0MEtwAzEhxfhDsevuTud45Iz6ialXbjgyiBT/mXRz09JG9CJVYmtWy4pd8smBgLIryfZlRBaqipj9AgO3q993Vcbfv2wfuPmJvKBH6IrDciurONPuyPoKiGiBLe8XETiY/g2OHoaxYiDJ6/hg5Q74a0LD4D0B1dQLeScQuVo98COG7BOUyWU/f8Y+cZ/+mztcuQ2tOG1gLHxcQwMjSBKSwBlvASvWtmQNrQOtvVykZQnbDoqaMsoSpdFXNdn+xDV9eD2dpG6Pr8FPY9pOihZG+l9DAZ5kUdfT3etwmlDG14r2Lh5gIE8R84lbwZ32toxtsoAIoI0qBKcnnABSl4k3rp7PITMWdxOcSobHTcD5cUBsmthdU5+Fn3+4BFpdyC6OQS9MrIhInFy/kUe553Rvu6rDb9+WFedBCRNOslRNTGwTlC+eSm/0quF8g6msqm2d5GvEc9jaQxJl00raEwvrOUw5REFMg5z5gilmS66Psqs51+ClmpJp1qBBBFRBn72d963XVm2NrThtYWNmwfio+LeKBfWx/dkUAymCyNpUkG9Fl0MkR4i66rTHz63uFzEo8c5LzRrhM4qqfZS5MqD9CVchRDHCmSFxOmDRDVLneAWXymDqXz+9/3B/90wq6+XZvf3NPp6uht/9JF3z5oiSRvasE2wftNWIwXKk40BMkrh8keJZ8i5+0p6wkpbhpz00hvqmKYQBYG/pNNZb2foZSG4KbxTl6UKN75EFejv/svJvMohoZdKR0j2Dap702qWR//w9vtGKcUDvvyNawZiHtL7MAUGAMzq76VZvT3U19vd6O/tpu1n91NfT3ejv7cbvT3djdl9PfTfPvCOfrdcbfh/BjZs2lIwd+zDQnVpyxgiHgA1UCDGwuKxYIVjICVEhTGyoXUGDRJdrGUpRpdLjjMtQgajByDwCw1V5GfrpaDYnvkf1V9WIASy6xqRBLf2fhCpVWRhkkJDTixpYAC0dWCItw4MKU1uq/Rzl1457OUrYhIAzOyaQf29PZjV19OY1dfT6OvtQV/PTJrV10uz+nupr2cm/fFHL2gfXPqfENYX9wFE17mSr3rr54Yb+WAKJwV5/C35XimDzPeJ40nIe5IuYfiiTKh3h0aqLhch6jQRrfBnl4A1wlalMBmKenDdHEa+a22q3kAg3maRAqwX4imVOk9DVH6uNxlxdGycR8fG8dKmLU0CJi0NDOAr3/zBiDAFXrnS8+z+XvT39jT6emZSb28PbT+rj/p6u6m/Zyb19XTTrP5e/N4Hz2+viPw1wEsbt3jcktjVZ8wkW8lDEP1uJQI1wo8qXVqjEy1wmY/uMEufm5jzdmJfNqSNj90FSmMAEISL1HnhkLDauTa0PSVRaMXwnMlPVxsKx0liqvUAagok8/LcKIjKJPFONekLnaVo13l76eLFSdlp4IhMK+KId8vAEG0ZGGqGMBLVkzjvC5ddNQadkadQuGvGDOrv7abZ/b3UX3V50NfTTbP6emhWXw/19nTTn3zsPTO9ym0DsHHzVnk/R+HMoqx3+T09C9kxyRWYjyQZpNbbcJRD3K1A+ThiawSzx8AAgVkdatiZMdXR6HwzWtIImXQ59C2nLF9EUFIwrS5ZFZJVOTmJCtElUESSIkW0ChGpZvXrO3crlGoyC0W02io7OBq96rZ4MUg9WtcwHzjDJu7Y+Dg2bB7ncL21x8D099/+wZhunpLQqJ+36++lvp5KifT1dmP7WX3U29NNfb0zqb+nB/19PfQHH3rnjBo8/+lgQ54FAHxnVild2Vc2rqONCvNiuqMKUttZi8Y2gn4tbhMWWSblRU6UYsmtYazWVDrWN4XnGwzVQgChSiXhEkUd6KNXs2pLm4sEkupToMEoKBCnbocpTlnGkEi5ZjlBFSo9hVL6tPUvNLjpY4pfuRQ7NZ4huaDdUYaExLCJBNdjgmDqLQNDvGVgKIULDyWV9UvLrx436S2+6J2gv7e7Mau/F/29UanMRH9vL83u70Vfz0z6k49d+O+6/Hvdhk2R3ghue1YfmCkYEeMlRkvbmpMriB1EY7E1H0T0YfjMkzsOfEEyvuECzyAACNOAkrlL7aLYXUpa7H34wuPYQmPlWMW3SDQ+6VO1Gviz9rg8tTV+rzJ1Zk9VHjL/VITcSmTj5s5cwpNl23cPSChCBlX7M2qnhEjr5+y/5DGawkgEX6jUX7qMDqNnq1Zo19D6qk4UliQ/EN5J/CK7iwDAf//t6ybLopZ1DwCz+npRjZV0o7d3Jrbv76Pe3u7osWBWXw/+8MPv6igqrwWEdQBKGCVraCmlpIml8Ynmv1TyqcixOMEbrxqzThtHGiKblrKZaDDh5E/lO5ajE2UFR1byTUwmjEkIv7FgrlglU6Y3MunOrwNZqBgcDl4U6CzXef4bOcFi7lTxcR5r9XEkXg8IZf0JYSiqxdHsHpnFN4nMljeNHEFUryoRyvXlClfVkkoYo1K1itogcBlPxNKkCEwksxG8JtDHdlSKMJZp6+AQtg4O1cknAOCSy78vLGSFd82K5a6XMdlsxhOBS3NsiNIMI8gjBI3o6taYUtqHlJgc+k35rcK05TY6RIwIeIhzge6S9wKw8+QyT05ffCDo+rMc4VtcxRg+BGYmKtpC5xE5kZRmZHHTSyJApFM56yvdc4SikTQCV06KuhD1FkhS6YghbpMWDVu5WuUq8ICPoFAXSkncI2kI5qgmUtxiKtXg9pqrtulEItYPakkKl+hrFA/E8nNdxpbZt4KNmwdif9Wdqqu30JS/cxI7S5v8TfqaoydQxTao1RkExrY6BJjweiUkjBHjFgCnNiAaHpFR6tg8GkYqP8T3Om0WMo6CSPaDffLA10tKoN2ZCIDoty8+t/cf/vxTsw5ZuGBGkRKJLS0BYv+0aqS0ddnTs1rAizKkrgu01Uz0k24TqOgFPkYebnEZTgaQChT5wiaI30K2pUPUymHLcahIl0YipDeVVsxJHEK8rLGJbkvKx+ENyfStbEs8DNSVc0bRxZRv3hH4bJ5t3mG/cXJqPfIiL6Q0VoHL8IJpM+11n68FcDqALXIhUKhUUnbJqHnZJpbsOsFPBYo42MT1hMggjhY9+I11DoBm5hjW19uND56/pHf72f2NpYuP6f7xHQ+MfuGyq4bueXjVRE7jjq4LwVECHp1mxVysG84tTPyW2J0LugvHioF8UUQpvZR1siiBLJT5IJUkRyEVWkk1jsnPaELDHonhMhpdxviRawZEYhqWaeRDbB+nK2jL2YofFazfuCXFLSyHVo52VouytGhFbsoO8USIfOxxa6XSY5mscpH4E30MZ/A5VJIpEgP4NwAXAGgCeXderleRi9HeU2n+Vt/U6YcxI0drtxQapIZu2a4EqAEc/o23n96z/ez+6vATIpzyhiNmfvdLfzxnl53mpENRTU2JM94Kqxm7MiTLFCMqlS5NgiiKY26t0BNy21SkObq8CiKDLjMilXgLSNzEKqho68gLQtEoHSGkQJ9i4bgb0AIrwtNYqAgsVJv6yja/VCRWWbdi2tj/17lJ4EBzPCwkNkeyabJ5sgLi+p27UQvY8KAX8ro/XS4fGUQ7RhJ0e8aQfwTwLgThByoms1pcvTFATIpFrMUDkF1iz+eAaHBPo2B62rpFG3LxMTJaT3dX44PnLym2GF/zk5+PvvDSRgZAf/Thd/V+4Y8/2r/fnrvnkWNj3Q2tNkxmWcQUppEjYqc4tvzJSArNzH/04Xd1/9Z7zu7ac7e5HWQEqa4CHSGR0cnEq7PwLNo4kZSk3mgGY+A90tT3qLzEBdLJ2xEWrrDSho9E95TqLGgB4UagFFEaD5FasnvIl1J329AB0XZAlnUlpyVNSpfLsSiDupBBBuKtwIk+KYqTBPxfAL9pc+wE8qivgEpBxaW7nAebnVYlJI+jiuxo7aLwBqy75Mcp8cVPbL4lWPbWU7p3mjNb3YI82Wzi85deOcQA77T97Mb7zju9p7d7Js3fdaeOt3/8z7dYSlhb06RRKbALadLMikdb+Bzi0Kuq19b1rL6exgffuaSra8YM/NFH3o2HVq2evPG2eye+/I1rxkZGx1RlkMi+RR4xIAp+tl6ayWCVTSgnUT5vRqZj6DaVyizjJI68JUa7Ncm57jOL1QhztLrRuMoxArfcEeKNQCnDGvy5zQVObfZT8Uwl6nEEAkwXSOpMzRaqVKpe5DVksdvklXcMwJ8D+AtZmJhJAyT6o4qYqgKlGjFUyhSUa4PsvJPVVgpSmDE9TjyJzMaU01bpr2vGDHzk3WcW1v/6FXePrnr6uUkC8KF3Le3p7Z5JAPDF5VfnlS9lAQJeq8DJvOfEBZHmhVRU5eV79YRT3nBkZ9eMvPju0IULOi4655SusfG0HicqY6t70q/ndwjGtmkUqSxekJjf1doerqJ5P/LusxtvOv6Ijnm77JDiWs/BKE63XgQFJk+rx33YWG4EitEzXaQE3IIag2AdJvONytIvDWkp4CqEkOq6JEzgJPVewSCA34URfpm+M0WPhkxrNI/LWfxG4dUemrAGRiWJHBKzptzImb/QxKn0hQG17ut7zj65O/TzEzSbjM9fduUQAJ7d39t477nVzcMPPvLUxE9+/sCEZ+2k5o+UCPsdacq7HUttLbVDpVcDV2u9qzi3EMKzTj62mMe+8bZ7JppNpg+/68wZ+y3YvXHdLXdP/PiO+ydzMulX5mIkHuTkbTqVrwxeGiUVVtmm03ySWbGw2nvsulPjjz96QSrPloEh3LfyieaFv/uXEwqbyMIYgRqaZZwWFkXAug2bU5kyTqMvDR0GswoKle4t5qIilXyqZv+ktZdFVh44pzp1d+8ygM0APg7g8hqaAeilwEWDtajguoIlorlaiJvoNtpQoTcbGWqzi151SGyFVCmYzo4OfPQ9ZxfW/6af3Tf28OPPTBJAHzx/Sc+svl4CgC98/cohz0VhXRdq5YehIfXZOI0Oe4peUy31rsRlxJJ6urv4pOMOLxTAtbfcNQGA33nm4hkH7D2/cdj+Cxo/vuP+YSGmqU6EaybWU1DguqK5s86TMsHZCOh5b7m6us5Nz6Xaf8F89WV2fy+2n9VHAHDeGSc2jjx4X3rsqbV82ZU3WXc6tbUQNO+7ei5HiTKEG4ESbwomTT5OrC+f7yz3leVvpayQUwZFUMkN5W+SHoLhQ6MaGcCLAN6ParpPITHGCMo6hghKk7X67pmMWIJ0w4esDMVGrfOpgbhuVh8umsqdPazzly7qnrfLjmo5KDPjc5deMUQA+nu76f3nnd4NACufeGbihtvutevaVVLbGIkWmDqpZgill5J8qpIF7bVM6UjqVFUxzcnHvW5G7KpE2Lx1kH963y8nFszbueOAvec3AODG2+6dTBiFQudSudo20KRIIkXF5qS6j12z8kzlKe/XPnCf+QXvrXzyWQZAp77xyMb73nZax8cufEsHVH1o/NLtLMQAKavwW89lchAwNYBAR5r0pOQsXbmJTbFR69rKc/op/xmsIn4NGvnpGQBvZyH8EpE1RmkhEOsItgQ2kP0ABGtCRTgyN9ctaoglKeA3zju9973nntoTaZMZUIVXTg9SR4Pw8QvfUlj/W+76xdiDjzw1EXB2x6nBL3796mFmtosqZANb/hJWVYppYfRVo5qWtc/S4tpIfOZJxxTW/6bb75sYn5ikM086Lim6a2+5a6LOjaoNL2tdljeRwQkHyevdoB5LPOULgw7cZ48i10eefJYZ4IUL5hEAPPbUGjD0bJmZokgZ11jYOG5Rb/4BvFStA1DSS0kuwkl4VrtoLWdCay8XEVWgAjylW/25ElG2WKiIRwGczcDtngSSeQcYncGFSpoyvltq5K91g+K3GJ7SU8F1pdZM4TVLQwB85gPv6Gs2m/jMB9/Rz4IdGkQgImo0CEQNNBqEjkYDnR0NdHR0FMg+f+mVQwDQ091FH3jHkh4AWPX0c5PX3PzzMUGb2LGh1lRHX11qa2mEIoo0XaaUR1VCO9gmqyPsrCoG/7mzs4NOecORhQK47ta7JwjAGYuO7gSAp9e+0HzkyWebEoEl1ss3GiiO1s7d6QrIY9tkPclmJcthyFN4LL57CuDRJ9dwZ0cH7bfHbpUCeHotg7K2CRIZCdMDFBYZRONMcdhM3KQU8LHEXWwajVyax04kGaKIomYS1M9WOaTb5LEumZweFgH3AXg7wKvr7Yx5J0Kn5V7HSnnEuBSTLVtLvavSxf9uitn9vYW7+HLgikv+ZHsbtnCv3TueufnrO04Xx7zFyzbYoekK8gEqsh6SkJQ7ExHbNEgVKWWTc6ATjz6kc3Z/r0o+ODzCP7nj/om5O2zXOPKg/ToA4Ibb7k0rGwOfSkm2G4lSXqVRSyJntABJ3MmtKf3BjCjFyxVEMzo6sN9euxXV8ciTz/K+e+yKzs7KoXl89XPNuMHGRHY2Iqk8M/G2aAY2bx3ExMRkLBco15NBrlAkfebTQd4AYPVBW33rOlpZk1N7nnxG+BmAtwJ4CWVd1SsczmcCpgxMZDetqthwIJEizDE3Di5pMaahFP9jwNoVy3d4NfDMX7xss7CmAFQlZMZg0FknHVdY/5t//uDk6NgELVl0TGejUaW6bsVdkzFtaAKpUaQ1lpAERv/q5gzkMOwK1qCmopGtWd6a8BGAffbcjeR0JlD1w9dt2MzHHb5/6s48snoNBEMHzMU4HAnllnNMZU4ldvnL7AOQDpMqu8JiT72unqwb4DF1WHbNHNY/AC2aximXt17mhwDeDqC429yWQdIXwzvtd22+a3VJzEptCpVmz6BsKeCxRafhMPyXgTUrlm/3StKfdfJxnWtWLE+nGb+4YTPf8/CqSQgr41gaUClBxTtKbiT1U4SLBTxOI4oDMRnw+/+PPrWmCYDk7MCqp9Y4h2voN9mtkF4oRbKmsCtiGXCcBsyuHJT3kgpTVJHqI6Q0ZOiKhKUzNEynQuFgFN3FIG+qTFcAeCeACUGHRuQ8xTVDDHsikGYVpfyCfocNi8nEryfwdg4zMmJ0uVKCh1atnjh04YL25aDbCDvvsB09c/PXX7XjzectXhZPSiaItkIK5LghJ8aRYPU5S2E8cO/5hVQ+8sSzAIA4APjci+t5YHhEsm46AaqOZgpsladWW439V7Buw2bJmqo7xIl2VS6kzTq6lHWGVsmHGOkqVxUKBaS/CZ2Wa+AyABfbmi5cGMcxJ1EvWtC4bLhoHYw1iEsWRJ5K5osz02R6p5KTpj3no3+2sb+3h2b39yIcZtno7+2mENbo7+2uzqbrmUmz+/uqE3XDKbqHH7B3Z4+ZKmvDy4O1K5a/KqcRz1+8bCwLY8VO+zsKIEwB4oDwbdXqtcZ+em5+ee5jkMukLBjV6V11akOeBMRK0jwPKHevUvbig7F8nlMr18PobPLxdYXM5N2BsevAXwTo05miktA6MEYYNG/RhWsMuUYuNRhL4HVzYlCLOBm3ycjTooWWDB/SChYAOPn1h3ct/6vfK9zqj/9/X9768wcfHZ/d39tY/n8+M3u3nXdobNoywJ/9u28Nzuzqotl9vdRXHSdFvT0zaVZvD83q76Xe7kqx9PbMpO36+6i3eybFwak2/PvD/MXLJpzgwvuUL2tWLC8a8MuXf58/+3ffZhkf0PwojJnjyDovAoS8WB0hDae3H8frio0B+CyAP3Oy0hBycBSTguQBMCufPz1SWUglhCXSYrDZcw8TOvmRdX51VwXlShEey6cvflsx77/yiWcmrvzRz0bBTCccdVDnbjvvEOf9hy7//s2jsiwZZaHB0284ehuz+3tpVl93o7enh/p7u1Edvd2blEhfb3elNHpmUn9vN3q6Z9Ksvh7q7+0JiqUb/b3tW5BfCdQd77Wt8JLcCQiozQdRQqPVZvMdybGpFbK0ZBphNrNGkUgXWnnxwqceZKbfJ+CSaRUscHV2M6T05uzlseCKACvFEMkzcWqKRrlhOpnrUZD9Fly3VLV1EqJUCwNvPPLgGcccurA4ovoLl101zMzU0SB87MK39gDASxu3NC+76qYxx72zL7n8oZHHxsd5w+ZxCkdvu4dYesk1tUi7wbbr7230VcoAvT3dje1n96O6JKSb+ru7cfabXj/j+CMOVFZr05YBfvLZ55s777h9Y/6uOxEATE420dHxqsyU/j8H5jhw6VI7p0BDDXIy0m5IdyYig7scPnyi4oh6R1g2gOnjBHyzviSZAt/ay9zzV3UxSCykEejoTJApYuxvpbiyZFV4HlCtseaprFFhCUQtPYHgODFA+PT7zi2s/6qnn5v8wS13jhKBzj759V0L96r2+v/jd64fGR4Za9ZUk1RIIp/8Laeqc6p0L8l0mSiVCBSP3o6IJqBbCR84/4wui/yv/vE7Y5decdP4X/3+B7svOOvkzrHxcRx29keHxicmua+6GAT9vT3UFzyRWb09mNXfS/093egJHkn0Tvp6utHbMzMczV2dqhu8Fa9c/yVh3YbNTqtXEPkuGsOwCoKDHlC8LyRDYqvrSmfdEnmL7cfEX2sB/g2Afti6JJmCVi6/De/M4WlUt0ZOk3ah4PmQjVB6DVmZOS4OxG/R1YDQwF43IJhmPvaw/We88ciDC0G55PKrh5rNSml94qLK+m/cMsD/9N0bR6BkMuUZ13yLxigGmUQqFV7qvlBW6VJlxZZGz726AEB04D570N7zdy12Ml634u7JRoNw2huP6gCA2+55eHJweIQBYGzzOG/cvDXuDW/qssTMsgOnLJsRgll9vejv7W709XRzb+9MmjOrH+FikHDjUC/6e7XSmNXfi/6gVHp7uhEvF/mPPHaycUt1I1CN+y7D4xRc8n5bGwBXIcRn6TWkRDGCeHocwAUA3f1yymZxSq0Uw9RuQEf4jVMQ4xgn3NyBZ7WAiqvjqP6OzdQtRPApYn/qU+8trf/Ta1+YvOLG20cZoKUnHtV10L57dgLAP3/3xuHBoZG4bVccYiLyVJZACYpXvrquDQA9zSmYLDZ+OlDEshMDOOvk44ouzb2/fHzyhfWb+PjDD+jcac5sAsLqv3CwRuI8DlqGPcJCl1Wf/aPO4GOko7ebolbkHXQe1H7qmjEDfT0zMWtWX+OSP/mtjiMP2lfF/e4NtzWfWvM8v+/tp3fsNGc2Xly/CQ888mSzrzcpGsSxk1fbO9m4aSASb5d6K9c/9N2EcNeshjc4gGIKNeDmtKTXUyUMPEjA2wA8+XLKVXoB2bZ5HgAA0hZBOr+aeMmniXtzD8Ssgc+yCsAROGdlF5CJL2pZuDmHH7h350nHHVZa/29cMzzZbBIB+MRF5/QAwNbBIf7av10/GulNBBUVZShhSat58CGbWPFu8hCDQWo1YPQaeElY3y/h+hV3TwLA0pOO7QCqk41uvPWeyXhiE4XsnGOb1YkxFCnwrVPJ2Jzm1u13T6kXlTE2Pk5j4+PYuHWgOX+XnYpyXfKNa5qPP/0cf+KiczoA4Oof39H80y8ur+umYVZfL/X2zkR/uLps+1l96K1uHEJfTzf6+3poVnVzM6LSmNXfi97umdTXMxN9Pd3YblYf+nq68dKmzbkcphsgyquMhbXcyhhkHMnKQ8cNbZUdDFnCYCd+FoT/RVXDLChAlTKt+RYNYiEoL12bIVFaCUhFmsIqZaYN/6UNCb/xkE0J3qoyYQWpqCBHvaYyymVan774bT1kYq55/qXmv167YhQA3nT862a87sB9OgHgsit/NLJ5YIjNwKWk3asABlp5RjK62D9SWPmkcAph8xpur3m7dBy0757FqN61t9w5QQCffuLRHQBwz0OrJtdt3Gw8O0Vabj52I9kr2xWtmWH1WI8pdMaqH2T/mQHQjtvNprk7bKfKNDY+jief+RUWzNuZZnZVTs9jq9dmsdNlYaBS5lsHh+gFXYWGtCqNVbyOSpHtIstYhMkGrkkbE6aVj6muK76Vi5lE9WQRIPAPGXQegHxTSfxNY3BZ5Rj5K0Bit40HoDwPQBBmBzko4ci6zlP4Mq8a5aIlBTpRnRKrPgYrdvB+e3ae+oYji9tu/+5bPxiemKwG6D998bk9ADA0Mspf/eYPhmNLOAyg9IFgXiEs8siuos2t8KtAVW5qVTdV65518nFFp/mhVaubz/xqHR+ycK+OPXebK/f+G66AoFM+Vuv185Ed2XsLSlcWSiMMYcL5AiBXq6lz/WIkyQsEAAftWy4BfvzpX/HE5CTvH1YAAsCq1WuLRTZQ9HHoBRbsl4StDqx0q3KXdqEFJpmhRu/wOziedmrH/JVI4bsMWkpB+D3NIh9bn3tcewaBAn/uiFJyT8AlAxTZe6Ih0dgKM0LvZpqCKO+g+ORF5/TGTTARXnhpY3P5938yAgAnHHXwjKMPqaYGv37Vj0Y3bhmwpzAnk2XIZsskMXrmCLdq45kKniAK7OVrVq5V8ZYuKvf+X7/i7gmAsWTRMXnvf9r8o7wopbBZMLIsAbMynYbZ2QkrVrEpAXeksSi0twfgsdVrwQAtFArgkSfXMLLCcRD7ZyukIonz8eqIMlaxKmvQ8ZybLjVhKV4uSuUKySxSPmyzBlCNLv4jgPNJHNlt87HGsrUfO6UuBFCnAGrMnPgajEb2wajMy8NS0o2khWM3xZObgKtKunCv3TuWnnRsaf2/fe3w+PgEAKZPX/y2HgAYHRvnr37jByNCQSnG9jS4yL/uijV5q2AUfLEBJ3ewdQdHP4Q44rQepl3nzqHXHbhP4QH84OY7JwDCGSdWYwMrn3im+cxzLxZHy8c8GXbKUmXOqhJg64EyTdpjUUmk8hQfFGPLoJpDQJoEcFwC/Py6jdg6OOTxbStFI7yclHGt7BtjVVh94dYI5akyK0bvRXp5r5eI5uoRMDAJ0F8z8EFbHM8FqRPK6lurrz5IBSDL5G1UAFQDJC+ZTURHw5lyeKY4h5OhSzUUA/j4Ref0dDS07npp45bm16/60SgAHHf4gR1vOPKgGQDwzR/cPLpu4+YmOQ2ZXrNpjDKjLnmTGinSolib6hmCU5kKnePUH+Gsk47rtJ7N488811z19HO8525z6eD9qrGBsPffU7xCy5U2lEQbtmCXQnewClc3yNl2Fl6i3i7jdQEeCceALdxrHgBg1dNrk6RQrqOohlyLHosbykyiPdzoHoNKOoUX5QIJaRb5ZDbJIy4MVZQqqaj3EQD/HeDfMwrYK6OrEArKthGSFGV+5qhpZeairK3doZpnn9fygfqGcRKjAdA7oxbM26XjnFOO77aovvZv148Mj1Rn43/qvef0AsD4+ARfcvk1yfrnJnALwDZMtl5impKzYr/EGsEo3AW/mXpR7brEd/8nAWDJ4nwqcAwzGI0S0/Zfm2rbR1RfyWp2UhFrF2nGVPauPiIiSDc/wsonnkGjQdh3z+qAkFWr11qPQhbRzdcID9v2ZF33ZMJEM+cCoGQTq+jsFupsHJKSFRyXeD0tudgK4JMA/nI6gtsqhi3AVCALlq6fSmod+WoPT2ptJqwFtJzPC4+uSxbmS51N5IQaRvv4srf0dHZoD3njlgH+lytuHAHArztwnxmLjz1sBgD82/W3jv3qxfXqiCxwOjc/0m+LpfqeZOOVg1NOsVp+jghYDKEDAHbcfjYd97oDCvf/2lvumgCB4tFfz/xqHT+0arWUsUSmYmxTOM35tmrze/RXo2LjMpLvz4boYWpH1hPvsdtc6u3Wvbatg0NY+8J6zN9tZ+qeWc3mPrZ6rZuXB/6yhOKQYKXzw/OUpwU5/CqVtbIp4iV903YiURAJXkfAewH8AzmNxFQWuZVzP7VnYOKLyA0bzsgtLmhS+MmkqaEvJZfm3NAs60kJofc8b5cdG+84/cTC+v/zd28cHhgcYQboUxef201EmJiYxJcu//6wiar6dSLTeMGiXJ1ly5xdvBBEoeugCxbvDbXtwskWxOqldP1YFXLGoqM7bdfm2efX8YOPPsU7bT+bjjl0YRj9v0fuQ7BMaPXXtHiDgagZybY3FNPbk4tTGXKdcpnY7/+vYQA4YMG8FBY8ANd6W4rjwhytcCVpyveRZW0lTxFLVS6tLRkoxxckv4T6U/iNAn0GwPkArqxCMqlxSaJ3ykK0FXXetv3WClg8NaRts26EtY5WAkRw2UjCrIcmkYaovhwtTNPHLnxLz4wZ2kPeOjjEX/vO9SMA45D99myc9sYjuwDgypt+NvrMcy82LQ5Tp9JzKQbGTEOXn8VFdjKa7yOTrFDTxapq6MzFxxbW//pb75kAwKedcFRHVA4hTJDp8Ary4GR2Sd26jUqPPDeNk14wRk3nL/Sa4BcR9aB99rDpYv8/nQEAAI88tcbNxOIOSxOitEf6YqdbOGzJfskmlgOBxYJJoVCqFVBQsiCNXlFmpSlyWHx8FMBZAG6J8XVfyRTbdYyLH0uCyL/OR8tpGsgdRSLoASJr3cm3Dj7N5nLN8EEqAUW50dVJ+8bwXXaa0/GuM08qrP+lV9w0smXrEBhEn7zonF4iwsTkJL6w/KoR1u1R5BmzKx2e6luqZ1LpSD9Lb7ksXMbNkXmisVXxZ/X14o1HHVRe/HHznZMAKE7/rd+0he988JE0VeQYW/UptJkusC6H2+dNzEumHXVeUmdYxZ7WbADAgc4A4GOVsCOuAXhx/SZs3jpoMinIImPDWRjNWFYpkMYA66GNWD85AzbpWbYXi79UByacMx1ZdBi4B8DpAB7S5dMwlfsvhWUqKyoZtzTe1VvDSZgKF1V7i3xaukMOcPGQE8hVWxwlMzQGffSCs7pnds1QeAeHR/jvvnXtMADst+fuHUtPOrYLAK695a6xJ5/51aSxipqT8ipKtRbXKaPU0nElDWkeKM53d+awlYU0SgR02glHdtiDMl9cv4nveXjVZG9PN048+pAOAPjhT++bbDaFu53LFnkj4S4tFWd1rwugT+3MaamYZ4QsLjjd56vDIy2RLv8egKeqLsDCBXoGIBIoUJm0JKWYlEmXpYhlEIRrQkudJy56leghRNNTiDaRDb6VgNNBeKaIAiOczrBGnTBJps5E+d2EOHhl6hVywom0Q5Kth83TaH0Aqf8sQVpXh6DwrrknruRQ+e40Zza95y1vKqz/5Vf/ZGTjlgEGgE++95zujkYDzSbjC5ddJfv+Ba2oWrPY3GwamCyCEI/ET4pilHLd6S6SwWNdAgDOdE7+vSHc+3fK8a/riMtkr7/1bnUOgfZe0viDzTzrJ3EHAIzFgiRIrGWQ5YzFldUVpt4g1hmqOuiaMYP3nr9Lwccrn3iWGw3CfnvuTgDw2OrnHOpV3ql4tsJNwjjAKperJ5vCVLSh9RAlUg6lsZ4SwbxTwSoAqht6TgV4Q0JmVLW3OqhObjxLL+PIZe6pUHZBtMDTSK2ojX3tPI9j8VMlCyuY8za23o74mwKktfrpEwEfeteZPfZarJHRMf7KN64ZBUB7zduFzjnl+JkAcONP7x175MlnJ5GrWWYlw2StxAzr6l+ll3RHXNTCMogXeXpKFDzuntmFxcceWl78cctdkwxgyeLK/R8cHuEVdz2UFADrdqIomFZojbVLAl8jaknI7Qc2kVjGje5UHoVPyRYu2J3szM3z6zZi05YBzN91LvV0VzMA1QBgacK59FhcuhlJgVGyJADJTi8ZU+7htOVExgv5WqLJdRKY6xuozusfU+WKWkCLhi7MFO8eKA2p0pRP8bcBPy9lvWVBSbm76UIAz8rGR0mXVZKS7lRFQtPSdv19uOicUwrr/61rbxldt3FzEwA+seytPZ0dHWBmfP7SK6T1txdIIOh9O94VLXR8aVnf1srVtGMqs6rHdMtcjvjmNxzRYafINm0Z4NvvW9mc0dmBNx9/RAcA3PzzB5tj4+MtZDdhLimRVRzIcZRWqwl+KzBy8ZPQFsqqAgDtv8A5BfipagGQHAB8NHQJnHwLOmMGNjDyjvQMmNUwiG334tXwcywrmXeXSWL+BHwZwIUAmnWNVWflW8WzxLdiBIvAi9ugxJeq5QqmEFpYqC6KI+EeLWkUWr7bOADkVvZc8eHpN9+5tGdWX4+q67Hxcb5k+fdHgGpq8LzTT+gGgJt//uD4Lx5b3QwUem4dBysZPZFkEKTllBIm6sLKOQFpd1fYXw8yc9NR6uRW0ph9UhBnLvbu/bt/cmJyEicefUhHLP91YT8ABBNGwqTWV+YXKdNsfHS5koIXbewtpU3ltQ1OWnGoZmYAB+3jKIAnnwUA3l9MAcZBQZTI5Pp8RVCOx5BNKNqoqBNNujRwBZls/iCMf5pxYB13DMBfAPhYmZ0mXLUfOYzmlFMGTqGEioJQEYHRKBg8rwNSNaKFgoByUKQQNldt6zTRUYsNkWlhpv7ebvqNt59WnADx3Rt+OvqrdRsmAeDjy97aHacG/+bSK0aAaupG1o+kkxNzpCz1Oey6ceI+WDva7dRl0GXkdLhIuANQYwHU2dmBU95wRLn2/5Y7JxnA0jD6PzY+jh/97P5SLnNBU/PIepYSIQkL9CQByenY1luMJ7U0qxVRGbVtbiL4MwCPPPlsE8gzAOs2bs6XdHD6Z4uJSEcpJAQ2zpagyxciQajJNQ0Ql+XKTR8+iB3pPAzgDwD8ibbaJnfW9EfGnA4k9T/N+DKPMnNKHkB2B/VgoaKTVGXWXLoQEeY3aWliXUeNLhvH7JMm/sA7lnRvF+6MjzA+PoEvfv2qYQZo553mNN65dPFMALjtnofH73v48QmU1ihOb5qKKOqGHb6LpkVZ/RRX8058JBQ9xiJyImPRMYd2zOrT9/4NDI3wLXf+YrKjATrthOror5/d/8hkOKFH844a1FM6N9IR21XPVJCt71zvsC8hHSncVq6Ug6TKc8De7kWgxADFGYDHVz9nzaQnuEmpSIY2iiy+V3KlDnhTeFwZqilYkgfW06Is/m8G6EMA/tah28vHPLSWaeuycPFlukDCWnAYAyhvHJNMUVo0Hc/6fKaB1JaUSHpwm6FTCujp7mp84Pwzir7/VT+6Y/SZX61jAvCx95ydpgY/d+mVdtWfwuswko3jbU1miOqqipLm8wXR2dByRiHbTOUnK/vMk44t3P+f/PyB5tj4OI46eCHtvOP2BADXr7i7WeKys42WrUhGtLWttBQbHothRsOZpla9gFJ1ojq9Z94u+u7VyWYTq55+jomI99srzgCsVRxRSZ1SKgpvfiD7MVrkqt2drcHaQCWw/K4djVijhWMCAHgeVX//cmwrOBXvCZutAPK+TKV1kN2caAUaOdRPziVdVgOyYbskJJYutslZNYSoW8bFbztt5g7bzVLrYicmJ/H5y64cZlTr5i84++SZAPDzBx+duOP+lcXyWJWR+iYEJwi1y+FCkGLF2S00FafES12UlU3FNsyWLExHRwOnBwsvISz+SUd/NZuM62+7x7kII8uLaTzrJYvByqwPK6nlmN4WTHp8JNMVudcYUwZw0L7ziw+r17yAkdEx7LHLTml/wGOr10Sao4KNp0VZIxPfvQFLCueXccw/pFAyI6yb0YEpnfWMioYXtfEUA+eimu6rrYw6kNpmOnFztmW4v2ZDg9CNAMojvHS9UG0jF9aNq2qWu6CKvK1Zii/WjMzsmkEffteZRd//2lvuGntqzfNNAvDhd+epwS9cdtWwU3aB2tIjVr2GhV/RTyFr9QVtogym0qhMUELhSb3+8AM7dtx+tgobGR3Dj+54YIIBnH7CUZ0AcP/KJ5rr1m+yZfN+VWYwvOW1pVlPbzEImn3zwll5F3xMAA7ad88iYVwAdMA+eXfgo0+tlakLfVy0YFnf8YqOqLjypi8tvFMaWNHGbIIIEEvmGQ8xsISAnytkUzGDNdrkVF6moVbwLTrve2H6TEw5CFj6O767A5CXxngDJY1F+UzBklK98K2nzJy7w3bFkdifC1N8283qo4vOOWUmANz3yycmbrnzwYkiX8rMWUeQLotW8CxjtEqfX2vzQsWCigkZoKXO6P+tdz80OTQ8QgfsPb+x9/xdCVCLf6Ky1SvUVUYhYp79lu0GlCuD/bPgq85zq8MzlEar0RLkbQF+NOwBWLiXVABpD0BUSDX1qVYeStoQDJBnnGS8VrKp2pFMsYIwxp2zdwA4jYDHLEJvCoVrX+BXri1EWY5SO5L+ltsnllxrQoZYCZhcKp+FdTsn45BriBKtRf2mtAxtKh0hQmdnB33k3aX1v/G2e8Yee2ptEwB96F1Lu+PU2Be/ftWIZorARJ5J8kpX7piQlp6KWpsOTvOdIB2MCkWDKC3wkXDtLdUxX2eKb9flvf+s8UW0+X+i22FCEU2OcnvmP7GCEfA0DVjR4Syz0I4Ge5uAVoabgPffu+oevLRxCzZu3qqKkNnEOJ6ktmakuFwaoLRaMWmVAl9RZis/8qvs1/6QgNNQ9f1zZal8SuQwBEqoV+V1eJ196Vy0l3krQxsmSuw/WYIi0yhynDheuCbDY0wB7z7zpK7dd95RnwjEjM9deuUIAJ7V14P3ve20bgB4aNXqyRt/eu848kyMWm4ryuXQWZCmFgdl7qM8M6LNnCdfFL4kS1K2TcWTRxy0T2O3uTsoHBMTk7jxp/c2AeCMMP332Oq1zafWPM8Cr6M/le5uxX+RBnfBj1Nx8uizyIRiYJB0Am0eCCC10CfCyieeYQCIawAez3sAHL9Gim1hX+QoqPUa0hgGS+rMkRWhXEnga41xlrfvAFiKeGovtHBYa+1KkvNqhbtOhPOzL0Wl2mgVh/OBIIBY1OKgj66PIEH2h5XSmMokIjdMbjACOjs68FsXvqWw/j++44Hxh1atngRA7z/vjJlxavCLX786jfxzptsaroIxYo6iMMVWaKcMWrO5EbRmlDi10DDOPKk8+ff2+385uXnrIM/bZcfGoQv3agBp9D+mdtyrdLFNjlUPDKhNehKREph8Okymn4oUDvb0Ebzr3DnYfna/ijIyOoZnfvUiiAj77ilmAEovWWGnMrzg00I9hBTCe7HFiVZdKg2VSNDFAL6Cai+/OrjTI5T8r4WCyBpdVt7UEtTSyJo3z8WNT1EBtLyJV3yTlS/dNYIfp9YamfwIDHrbaW+cueducwvBCH1/7u2eSe9/x+k9APDY6rWT195y1zhEQ0awWlyaTRlBvNoTYlqwtgpRFst1bmoUudf/v/aWcPHH4mMb0aex/f8SikGMIp6VYVVXmSMTT1YRHRbLpodMGplPin3QvnsWKFY9/Rw3m0y777wD+nurWd7Hnlqr9G9pRfM7lWp4CmnRokjavbc6P4fr/TnjqFb3/ZalJ9GFwk0uoM5+FBa9BoeXvpW2T0JawxkMoBH5p9DuIQ4VdS7iCMqlNY1phSG0+RY+aKNB6RYfCSvufmj8vl8+MQkAF7/t1K44av7Fr1890uR0/pyS8WxtywLJl7Je1FRxK4fAtU4WCKB0ILyg6aB992osmKd3xzWbjBtuvbsJgE8/sRr9X/vCen7w0afi/D9H+qygQbS1Q2U6g0AREXf7JY6Nm3jULWESv8dtinfFTzUF6J8CDAC8v1gcJI4BS7kIydZGmYUbBcV3ung21ERg1XvIKRxXapCB32XgTyweyz9TaaP6zrFPZWG5HQGeJqr8ayxdA+wwThVXngCs6IhR8p7QKM9qTb877ZfccdaN99Y3H9+1zx67Ftb/89UCH+6e2dX40LvO7AaA1WtfmLzyR7ePIzNLIbCRdsX5mQgS8RKC6PBYN1PFrYfCg8qCpHSTe/HH3Q891ly3YXNzh+1mNY47/ICao78qma1ZeF8qrOxbqvENysWhZPCFM+fwmRS2/CGrSyuATKg5BuyJsAlI7gHIawAirTZ/EtVr1/m7HgGXdElkiFdzWeUstA0TsJ6B9xP4i76GcaClP+J/9PE5OteoLE/hTKkUtFX+mHf8NkLNMTn4WJCRM0/MlL+Lj/JX4gxcx0SET1x0TrHq7477V078/IFHJkCgC84+uStODX7x61eNcGX+k7KxaSlrI7sEVpXVmFSpuNK7a1eRlGR6zfJmC66XDyxZdHShAG6ojvmi0088qhG3zl5/693C+sut+hl1rE9HaDL9UBUk66zOS5PVIvPSJx+ZlhbxCcgHfUiIHkCcHtyweSte2rgleg2WVguyHgsLXudiWwQicZzSs4qHwFgL4HwC/2sriloJiPtdhHouiKXV+9aqm6EYzc0VANBJwD8B+FzYDmy95fp2IBNuIyV7F/5xaVFlgwWBOKbrgL3nF33iz4eDPWZ0dvJHLzirGwCefX5d87s3/HQcZLKK+I0rAlsn7AVa683yofZoNYknJ1BTcxVjCWW49/xd6cB99ihmOX5wy51NADg9XPyxccsA33H/I5MBpai3Qt6Ji/ZTBbFGTlr0+uEm3dB1eymU1yFfOhoNLAzLfCX88onqUJz4bZUYAGxpPEUBTN5sA8SrNaBRwSslL5gzxv8lqpH+n3hUUc2zDrN2sCRtOs6Cx3rTqCclcKbt9gNwM1enEjcaQB4VpnKW0hhIV9tKI2QsKKkIFm+sqE++t7T+9z78+MStdz80AYDeuXRxd5wa/PLl14xMTE5GsSS7LCTs6IkWxQEdWmpMV94pInXeo5eQVthUskMURV8SudRZ+/+Lx1Y317zwEvd2z8TiYw5tAMBNt9/XnGw2K/xKaSUqxIN/32FMVvokorBFHPNFFtjGcWNWYQvm74J41HeE9Zu24MUNmxnIm4AeW50HAHMxC4XmGVU782bTyOeqHci9A1HYChCAuwCcBtJn9+XI8o7Iepj6Zr6sJlKBTGaSMEuHpaAVPQLH+QB+zMDxoVK5ISIQyiPgkqCyoUVbV7m6LB9HLyxMbGCpLAAAp77xqK7D9l9QCMUXvn7VCAB0dnTwxy58SzcAPL9uY/Nb194yqmjLC0PC+vEqa08gUDowsoyBxiBOlPf2Cy9GymAsL+f/CUIblYbzrJPKk3+vW3HXJDPoTce/riMKzQ233j0p69w8hyxbOptqgZ90ewF9SJRltIr3OCq2BFb1ODyaBMl6OUB14g8BtPvOO/Ksvmq8N50BoBAV45YSUluWyhuAcyJRKnfeJh6TpfYNYT8GcCqA5wq/CfGU2/pTUi2RGuqP7Y4Ee8ZIiXsSJnV3qsqvhSL4awD/AmBejE7IewFSw0VibKX6VpytRkXimeROKPvDwaClOvzERW8tRv5/8djqyZtuv3ccAM6tpgYbAPCVb14zOj6eV/0KVWI9HeFhqLrxlCqnH1J1DDFBol1lYQTiMZueZrF57b7zjnT4AXs7137fNUnIYwODwyO4+c5fNAlqqFq6uoEmmauv2FIBtKOgxkWsgldCknK1ElG/QJIBeFOAj8RTgPfOS4DNDEBGQdZT97u+ZYNm9uCs6ApNKaxuTPA9AGcA2GILVNVPzqWOjlYQ01trT+a3DBP/BQe4Ah8aTi5ZZGAnrjYq/TaA7hAtJfOOBAsME+tJng9iqSSpUfXXpLiKbmZabLHomEO7jj5kYWn9L7tqGCA0GoRPhe7Buo2bm9+45iejNi5rBWqtpH0taI1MAlBe/FJ9KXVbxmGVTMzDa8+kLc486dgOMtWx6unnmo8/8ytUB4Mc2QCAW+96aHJkdMytPMPNhctmXB9v0A7sHj6t0ZTfyQhNwYJpRoUAHOjdA/BEuQcgdAHgtRiLRgh1QTZuECvZDEppEtQMSGyjdPlViPNPDJwHQO24tFYFznOrMOlzKaapjW9TWxPqWuGiKdKRTVVX5lYCzshtp5u2oZMq1NJI2FNYUt1YDWTeYvdXlj3Vqdf3f/SpNZPX33r3OFBNDe49v5oa/IdvXzc6PDqmEegcFa+LwGgE3HZLKz4oFSq3mtLBOi/Hgkh+KeqTACx11/7f2SQAJxx5MM3urw4Guf62u5smQ2nWao/fAtJhmOl7pF1oM/bsh2Q1oQfdrKhgBaH9QnUe6BwDlvcAVP3/TVsGsG7DZpmfLgyim+P16FT1KHrItInQGta4TgL431A382bw3MXpQFGr1nlqmabM21c+UyL9Uwa+S4yFKNs+sUBn5HbDbEHes/W3tU1ctEJUCRStBcmcIu6A/fWvO7DzDUccpA/CR5ji48oDjFODGzZv5UuvuGnMWW9tD7ZMn4SGF/LLsShpZoJMIznMYiEhCfHTjEP4JftOAO80Z3bjmMP2L/v/YfVfvPdvYmISN952r7zRSBkhS9RUDBospxwPEP3/QpAgy2ZzojK7ZARkJXfP7KI9dpurIzLj0acqBRA9gOD+k6hzW6y06YlMmzCKQdkqtpW+TJ9oEjCAYTD+GO4JPhzz1DlM4TYVGYcXrZ4MVSZ8SqWT6KiJRdieGZcCOFvysqg/DvILIOwGNC2QLl1zMvGYUMo55bYwOKEDPvnectXfU2uen7z6x3eMAaAli46ZccDe8zsA4J++c8Po4PCIXD0oya5z92tItS5JKGkmm3LEYuBG9KNzK1ilEYWBxKfTTzy6Ye/9e3rtC/zQqtVMBJxx4tENAPjZ/SubWwaH5MWhipGdJ6kAddFKpleVItpGXHjiQ4zLTv2KemQAtP+CeSjvOHwJA0MjYAAHBA9g1eq1pnql8SkKW8iVjMPI13iJNLGRokGL8TcBCMd3eVLt2NkWXOVBIqBWadSp2Sr1VA1RAyeD+acEnC1iW16I9QEgzAKEissMW+eT1UMxGxczNa3GDODIg/ftPCnc4CvhC5ddOdKsDlHmqCC2DAzxP37nxpHIXo61sMqZgGJaK0u+eBePNUvfk9XLjCm0JHIFyxmPCJz/iLzR/+urlX58xEH7NnbZaQ4B1eq/MHplaRaNk+TOMxxKgIQByl3DbK6zwmOW6U0d5f4gCXOs6UvUsbcC8NEnn2UGsPvcHTCrr7cKSwOArphpxOoj638Iy9VJKcTshCqdjGcBvAvA5R6bF5XnUVJYtbI+WmpeA7bQ0+n763AGgD8CcCVAB4asJElWqUZtSJ0Vh1QesXCVCgkxLpdHP+nf1BWQMwhEBHzqvecWff9nfrWuecUPfzYOgE55wxEzDtt/QQcA/Mv3fji6ZXBInmkFIF1GQrKVBY2WVNeKyPJWH2Pnw8XhvOft8ZTrqYg4q6+X3nDkQc7RX3c1GaCli44Jiphx3a13KxSRFfK98soVr7uQRBWR8i9CQ2fmqM7RYWc2w7PO6YtobDmlyATgoH3LAcDHVq8FIZ8CDMhFQGa7Sm5rhm7jVIQYKwsaEZXL2uURtwTgMQDvYuD+ukrTDKLRyRVtSg3r+tDWT3yrk2JNsB9e18AEzAbonwGca61AKwsepJ0brdHnwSPSZYuZGKHXSYXPRVFdH7rfgs5T3nBEl419yeXfH5loTjIAfPK958wEqtNx//5frxslJC9FFCB5LVK6k4tuFFgMKzyHQFY0JDIdmz9dOkSh8c8/DFEIAM5YdFTD3vv3wksb+d5fPt4k5L3/Dz76VPNX6zY0rfKNdHEqrzR+BaguZ3RBJFEKdxAOTyBKK+8FqSXjBIC8GYCVTzwLhl4e/OjqtbHqs+4WBQSKtqzzThhZPmN7VUXKl9Teg2qa7363nK4IaF3oCmRdK7T6ViPZtnCsQkvUDLwRwG1cnUlo+TsaJK9kUeFTw5x9VUQmj1xtImuVE6EcUPrke8/ptlNhz724vvmv160YZQYtOubQjjg1uPzqH41u2jIAxHUINTvQldUq6yvUVXFNQaK9smIMVLsjbaVpo5DDyFYGF/Er47VkkXvtd5OZsXCv3WnfPXcjALhuxd1Nsr6OJiQ6LdLx8eIVCskgzAdftj6/JZZTClUdU6VsvBmAR558lgnAAeEUoC0DQ3jxpY3ILBJQl7LmZRK1hjRAhecmCnYzA6cysNoWVhbKpBFQ2yS1sWvqvVTdgQCvQRV/QVsjAj5DwDUADgkxlAKMdUEoJiGkV8idutIc79MDNjENzVHabOH333t+x5JFxxTW/yvf/MHI+MQECOBPhi3BwyNj/NVv/iDO+1fZaRcvdgNE3j79Vbx8+KVXsLRhhx0rWSItz0/QUpHS9XR34aRjD3MUwF2TALBEjA2Ewz88ElV1Uk0k88ltyEh3VBJmWrEOGdnwyEeCfxkA7bj9bJ67w/YKz8TEJB5/5jkAQDwGvDoDkEl0aabyWmX+BMRTC4NpyE2S3P5A1/dRLYEd89vdvufuVuuYmJZesFHcAtZpVJM4xOll4J9RrVuQesYu1kv1afhSUWxWpU1Z/0lRWKYQmaZ512RCQst86r3ndDcaOtm6DZub37zm5jFwmBo88qBOAPjmD24eW7dxixTEJMABveMO+oaPhEBIuiPXGvoF2RqxtDgtTaCANx9/REe8/DLChs1b+fZ7VzYZwJITq9V/jz/zHD/+jLwco+As1dg1eXKZjtWJSGSKbZQDRLOFuqt1EORgRMLvHQL6+DPPYXxikgBQ9AAef/o5BuyNuy39aYE3NyuHg0DNPUXx5V8AnIMa4ZcJcs7lJRnuyYfhZTp+gWWousE0hywLxwL4KVUKLWPJ+soe4mrJVY+M8lhw+72GJFJmMgaZN8Vbe8/fteOsk4/TN2AC+PtvXzsSV73FhUGjY+N8yeXfHxUlFPP2iYw0Il1PZ27LTHimzxLZAiLHTQk2jrf454c/vbc52Wxi97k70OEH7E0AcMOt96S5/2l4wcLIKbXu6GWKffQa5WZbMeo6KdspptYXrKcFGWD/HsBqv/8uO83B7P7eEPasKGuyEy2Ka2fT9UkmyYuoOGISwF8z8P76FfiJZlg2iuY05VZaYc94TA2xRrc5IQDg0wCuA3C4yJrj/yjwJHhCQDTMsq1A8JYCk/7n/UaJMmaopeX8xEVv7bZXRK/ftIUvveKmMQB81MH7dsSpwe9cf+vYCy9tkIU0c/6UyBCFp/y9cgm5dINSuxlNmZCiFtjUg+WKZGlT1cyY0Vlz799dkwBoyeJj0tFf166orgIP6GwdujvfSNg6QZRtrxTdN1jSkBRdHxtTnnmQPCp5uYi3B2DlE8+AAOy/YPcUFmYA6jQRyUB5eo+w1FGJa9YAhgD8d1R9ZCXahW9UU1ASObquElxNWuCeKlBaFY+2AN0ALkO1mWdOQWrVJrHLbZ2XiKrwEGJAQ3yomJeLchUN49h/pwyJZWnPXec23nbqGwvr/4/fuWFkaGSUAVCcGhwfn8AXll89lrMqmF6GpzqMuQlToZ5ZWxsxfZQFtrVHJ/ULCKDsWtdcLrK4uvdPYdk6OITb7n64CYDPCO7/8+s28oOPPCVH/1vZCF0n6TIWVUZwqTTc4/8FvqKuPSJE/QvZSOMrfIDjAYQz/7FwQb4l6LGn8zkAoo1s1sFLI10Gta03sQAxsBmM3wLwlw7ppUasjSR8akvRNMFqJYsgSaW0UjJ9xURHAbgNwLICJamoSSg9IRTeSnGDlDwWvM7N1be+JNHPHnQSBFXMNKjGH1/2lnSDb4TNWwf5n7974xgAOnjhXh2nvOGIGQBwxU23j619/iV7CWYdSI2WyklI/5OFCASqYtpGLiwvOScKA7GYuf9KMJ+rcO/k3x/f8cDk2Pg4tpvVR8e/7sAGANxw2z1N5tqeYeYPbczECTrCL8oJpHX0hdu0GATDAJCjSspNMMq5ooWABhEdsHc5BRgv/YjHgG8dHMLz6zYilMFzWWQ9y7wjT8W2kn7or1Ddz3epKowLLS8XcdM5HuO0wFRcYlKpQV2zzfg0ATcCOBK5XVgh0gQyUIxNFVY0KoJYzE7OGiStBIoT3Fq4OOkYEpzD0O45xWYKBO06d07H+UsXFSP//3LFD0e2Dg4xQPjURdXU4MTkJL5w2VWjcMtSYWVUK3WY44GlurAWMuG10ZIci9HfVAIyTFqmgzdORh2NBk474chi6+914Zjv0044qtHZqY7+8nBrDzTLuVHWmrosHPW0U5KC2OxV1ar6Yidtlpd8Dlx42WO3ndJJvxEGhkaw5vmXAORFQI8+tTa1i16B7FErJlxYLdSqiK+G7Z8A8B6qDvNwasXkQSTcjaxbYyxJgQzT0lenr1tAZKaCPiGpjF4G/omAd9hMYl2HFXBskqeugKA+tmBS7OY7pevBk1LMjW6Ey9HT+Y1FJHk5I3/swrfO7JoxQyXaOjjMf//ta8cAwsIF8zqWLj52BgBc85M7x1avfaHpyFTKPBaH/BZg8yCFvzB1mr/VHjmpnLepqWO+xx9xIO2w3SyVdHhkDD++4/4mACwJq/82bRnAz+5fGc/+izTlQ5qg3HpZ3W7eylvzaC85OCbzyupJZqJBxGXAPwT00aeeRehRc/QAVj29Vp6SprPTR70pHR8UtDagjAdQLfBRwq9rSBpNKqqvlSX2VZMRI5Ou1kto4T4wAGYcDzHKb72UlFVJvzEIgFKcmmoRt1oJSOJPIoz+gIMjhZLJW+bKO8/Zji4466Si7//1q340unnrEAPAp9577sxGg9BsMj5/6RUjfmFckAIThUYwaVFXqoziRdZuFIIaw1fygAwXFpG8o79uuesXk0PDo9w9s4sWH3toB1B1CSaqKTJZbu9yEbFnS/K/KmA49SoXr+A5zVVU4eU6w1Rn6uzlIgQAC/d2DgF94lmAgbk7bEfxkpDHnlqb8ykMvlJemvmqTo9McStXV3Q96dDYUpi9cI+cmMJoyyK9i2MbLAcBn0F1cMfrYhlJsIPMKirBUnHJViyaX8h0Dug0gQTYac+MSZpLTxtajfHhC87s6Z7ZpaphaGSU/+5b144CwN7zd22c/abjugDguhV3ja96+rkm+XXpMqJRcdJtCJbfjgEXi4EUXlHbhfokQLrHcsUam/hMRLTkxGMc9/8uBkAnv/7wRrwWO7j/dkuxhpwjiWhuBQktyLAmoDRyUWfVDRDGOFK5qXyrAleVc9A+zilA1UWgqf8PmFOAHGus2lQ4c8zqFPdrAbydgDGP6NQwllagxVrLOqiz/VPANPJgYDYB/8zAOVRd1pvutRQYUvM6rph49pwGFaVIb6cBVTKWDa5zVT6J0Fgp+vaz+xvxBl8J3/j+T8bWb9rCQJ4aZGZ8/rIrR7ms35YXrZB/WVcQkjRbaT7r1YOyhmV0w4RRMWYZJY1LKBo68uB9G7vOnaPKMj4+gRtvu7da/ReUw8joGH7y8wfs4R8KCLCXi9gco1WI9JP5lcCRZOG5eDonFytwlrXG0uLEY4ncQ0CeDMeACQWwKiuAQrLq24bkmM/XAbyVa4RfotQEqctFTFlaIHGg8C9r8MkyOLFPJuCnAN5GYU1OSbPmcXFw77TUi+DrSvdpmeGGQ1hqfGVutC5KwRWDKutEAPChdy7t7uvpVmUZHRvnL3/jmlEA2KOaGuwCgB/97P7xXz7+9KTQLQlXyRdCMXExdeQaz7ogR3sopcpCaxYuss5YbJElnHXycYX1v/2+Xza3Dg6h0Wjg1Dce0QCAW+76RXN4JPGwLG96146GpiHQlRqXs6B6RkIGibNUa9elyHKyjUcKPVFnZwf223N3WHgkXgUeBgC3Dg7juRfXp+81l4vET4EZUs4TqObDLwbQdAqXE7cokn6ahuvjhFcMWrCCxqcsRnF7yn8HcBWAQ2D1gyZIiiHXNRfXs7PeC8ApBgOgTlP4xFhOeCYyquTSMjADNLuvl37jvNMK6//ta28Ze3H9piYD+Piyt8yMU4N/e+mVI5JnGWm+120AyeRGYGKb2SmwuFpcWUpPuYjiy7UCukoCxkinMKkMgOLyXgnXhZH+4484sLH97H4CgBtvu6fJuhyhK5HkTThexdaDwF+JtLqt0LZu8pFN0AlEIa0n4SFWtmG/PXdHnNWIsG7DZmzcMkCEvAlo1eq1WkNlDWfKJVi1+jwI4H8C+L9O+RJIS/RyYArtmcIFcYXLZS2MOWtle1RTlWfHJEbe0jokEvVb0hLVShXPk4NWZYiyIG8H1lZdYhH1yqJ+SNV3stz4wDtO757V16vyHh+fwCWXf38UAHbdaU7jHUuqqcFb7nxw4oGVT8gjsIzXkY7gte1Sp6C9TRERgWw3pWJYfjNSAFuPAaMQ2lRvhyzci/Yy9/5NNpu4YUW11Hfp4mMbADAxOYkbwtFfpvHAiEf7JefDPeecZVTD98ZrMfaViyjO5SKS7wwrKCRE8A8BWfnkswmBuAdAkmJ5u/CAQpz1IP4QgvDXeCwp0SuBqdK7lY2SOWuwngbgZ6iO65LyJiOKsOqRXLTZrtWQqLQ5dFsmdmpxKKgqlF1CmDRXzrX60t8zs/GB85cU1v87N942tvaF9U0A9PEL3zJzZle1P/4Ll1Xn/xtlVwwyCmWjlLyoKEu6bZOyzfTlIknpOZeLmAx0u8maXbq43Pp790Ormus2bmYiwhknHtUAgDsffLS5acuAbtmqpeMhA9VjvlzEAwqeiKLIsYJprRBl/U5Q9eheLhIVY93lIqk9DnYOAXkkHAK605zZ2GG7WQDkKcAK6sIYwBoA54PpG06cIjG7ofUwvVgZisGQlpHV2/8H4HsM7B9OZfbGt6RSlhucaoQ8j3Ox/lAFsfIu2CBggLlTksm12kYfKonsttiN6XTx20/vmhNc3AgTk5P40vLvjzBAc+fMxgVnn9wFAD+7b+XEzx98NFyAKZV/WpRTnOte0VgYjlhAoSfyB1MUE78atRcCkiqXtMdTk18OJIDdk39vvrPJAA4/YAHtvvOOBADX33pP4WCx9lJCYI1NCsTJBk6nPCBvleZcJlmX4uBSNqcEa1dB8oMxAoh5AP4uwEeefIbDtxS26um1GQlrHA6sBPAuEB6S9sHG9yyxMKa2TG5aXfKiHhTXuALi5VJlvzOqUf4lBA5LkOy5sUo4JfOaOGkhlDVuaml7JDMYx+QAMGCOhSK9GzAxkiS/LJtjgSvo6e6i33xnaf2v/tEdY0+vfZ4J4I9ccNbMODX4+cuuHC2cz0BeQB4GgpJ9S8fGaLdGWmtLqm2zNLaZ2zMnlBxTlE+A9SYAAPvssWvjgL31SDgz47oVdzMALA0HgzDnq8ArGmKpWnCqAk73LnjMLxrMruhMP5mDZK5F9upLchVKfHyAdw/Ak+EYcDkFGG8CUiXPBRMPdwA4BYjC79LXGpz9nnWuho6lVYEr3NACUgNv48rlX1oxF8nyFcmNRSh+g36XR9IzMg+oXZ+kvlH+LraPEcI0oCpAxQ+VWQiphYtRJxgEgC58y5u75s7ZTo2ATzab+MJlV44CBDk1eM/DqyZuu/fhCWSNZtW1GKgyk5CASUPqI5Jx1OGc00ivSbpNsXwMqAapk7P0wACfeVI5+v/go0/xcy+ubwLAGYuqk39/8dhqXvvC+pSfQC55TSsSRQ/FwwhTAVmM51DGE9cnFPwty6YvRCnHG2Tc3CfK09X9vd20x647qTSTzWY69HP/BZVSHBgawdoXN0ScZKoy/yNcT8Cpa1Ysfx7bBKUpkfVWWvlQqCKtPpPMmmidzo3TAPBFAN8gYIHAVadqo4VzsskyHPKRwj2VRkzdCFZh+TnfDZjbomJK1rUgC2hvFwHAM2Z08kfefVZh/a+75a6xx5/5VRMAf+idS7vi1ODnL70qnfbDsm1KVUxefvG78chSKWRNs3ykiFMV2wq1Fb7I9p6iQuXaVTf/2PJfW239xb577EpxLXzc+y8YU/JSrUEh80iRNlYFUO6ka7lYlbuwRO6RykmpxjCK2fEBe+/B9pi31WtewMjoOIC8COjxp9eme3uMDkptQsA3wDhrzYrlQ14d1EHp/WXay0VxXlzNRq2+TvFhIYCfAPgYgC42CjmSVGRYWPv0iQFx3ZFqviJNYcCEd2BJZoCRl6vq1Y6JQIbHEJSFNZjaC84+uWvXuXOUBWw2Obj5wKy+3kacGnzw0acmf3TH/ZNRgxWmTl8uwmQ9gML2q1DSRTeeAacKyeXT6SVCQq488aq1KoF43i47Ng7bf0HBDnH135JFeWwgTgmKxrGdwqKTKBonOLZ5nETWnCCAdTLX+tg0LuR2yK+cKoJwoDMAuCqP9nMcHwgzAJamyKwTBHxpzYrlvz0FOS60LEMopY2jPQKByLPDdXloN/EDAP4cwK4hhV6XkXeMewZNGRelIClPC+lvmirKdVm0sVNGQtgLMGkixv3WiRkFURJr6jvP6OjARy84qzjq+4e33zu+8olnmwD4A+84vStODX7h61eNUh1hmf8LNZde61LWT4UnzShUlypTqU9SsAlTFR7ca6YzTzqOrBV89Kk1/MSzv2IGsHTxsQQAT615nh9bvUbKlFSCbN6j+56qS+hco/zkCWyotjKTaFNdTvtkLZJXYNX8UoHWTQECwI7bz8ZOc2YDSDMA0uOLv8ME/PF0hb/WRdpG8Bq7bukpqVgFRd2ozun7KoBdoc1O9pzKe4tk+1iFnaRcnMJi1JMqgVTwDKj95Vp0BYYGqltStJFhruuXSozJ/Th/yaKuPXadq6w/M+Nzl1bWv6+nO00NPvLks5M33HrPuIfT1K3Uhl7GjhaVBqWIxNJPMp+ZMmNahHUkisYgLHHv/burSSDedac59LoD90l7/yM76IWMyQW22YW/5CZnDVmSmsrzMi4XqYPY74mWX2rn6h6AfeYXieIegIXlEuBKqeV23MDAR9asWO4e4lEQU0vw9NRCjQIEECyaa5kk6NwZOBag21CtTuyI+BKPZgsaNbj0AVQ7Rv4TWiGO4eQTf3MDck5WnvYkIlqhIJm+AeA5znmHCNpM1gEDaDSIPrbsLUXf/5Y7fzHxi0efmgSAi99+Wpoa/OLXrx5jVuWsg2jVrCAGQ1sswycRVR50kkprpEueFoTwueV2becZDGDunO3omEMXetd+NwHQGSceTfEw1OtuUXv/Q9tWJNZ4PJroILLSgHBRB55pULeBKIVfYyl0vvpXzpygxQwA6xmAtVlpVkSvBXDB2hXLL6vLN0LhyqhQh3RHk+pg/RSL4877OrUS8H2GgOtRndyjBIhiOxiXwp7RHdSw0KmKZ+MEdXb7Rb2LPFUf39QKm2f5eX0DwFoSRkVoiTq3WLgajLeddkLXgnm7FNbvc5deMQJUU4MfDNb/iWd+1fz+T6q7/0QenosZ+UzWl1z1oLajsmxfY+JiwalCZgUjmkG50EmdCmKBMu6kU85YVN77t3rtC7zyiWcYAMfR/xfXb+L7Vj6uGmQal4uIYiI3Yd7AV3hrDO94oVd0uYiUC4V77g7bYU7Y5hthZHQMq9e8AADYf++q/z80Moo1L7wko60EcNaaFctvrKFBF0o853DbpTY2ThZoijxaKt8ycHsCvofq6LE5IYrdGpB4WCKR3oARah/YKw30yeWaAZSta5UBA083GFidCpATxjonwO0WBRehQR+7sLT+t9/3y4m7H1o1CQAXnP2mrp132K6y/suvGm025dSkEihTlOqdNE0ukEgnR0t1lHSdscsLJHmgNif1ITXM0pOOLax/3OY7q6+X3njEQQ0AuPGn93KzyZJNyasMKH6sqGatDBBPxUdWCWK+3x38B6QlSbqvtj7kc9QWSrEygIMc6//Y6rWYbFbjnGkGYPVz1YE+FdzJ1TTfgzV05mKWtKhwVX+YilM0Xi+qrQw2zwycztXc/rkxONGotaqxtmYSJf86WSSjpdpV0WRTZUFSA4iUeUjYz3R60GMNAh4VFKkphsiWgkrJcPSWk4+bsf+CeYX1/9t/uWIUqE7F/a0Lzu4CgGeee7F5ZXX3XyK6teJL9CR3SH52l8hlKSbzl2OY++OkSCHzeqGIpP5m0VCz+3txwpEHFwrgBzff2QRAp7zhiEbc9BSPA6M6xaoLKekvnDGOKgBpnYad7y/KYF9q6t9jSlWR0sR5MwBxARCg9wCEJDcCOGXtiuXP+dm3INoNn+rg79bpSVU6FxFM/v+bgO8RcIBEZdoMlGftTHuoHc5sYrQycBBy4K2cZLCapcnhZktdaMeI4qFOAI+YwriEGM+AiQgfW/aWYuT/rl88NvGz+1ZOAMAFZ+WpwUu+cc3oxOSkQFEzRw25Fr6Fa+ZRqqtUKObKKnJSHDmKcQgMN6jpSFkVKej0E4/qsLvgnl+3ke9f+WQTAC1dXO393zo4hJ/e+zDLolnJFnm4hi9q+ByX1HcnoaQ1WoBiVZUBBtThJzEsN5wI9GYA4oEfc2b389w5lff32Oo1QLWP/31rViy3ZyBOC6TiyVB3NYRMReZJpy8Nc44cLOKeqM7pe3OJWLAZxf/6DnmpVgIlURmwWZNhi5oMIYk2jJ9EeUiHqaayaVKfE8CDnQAeBDAOYIbOCxaBQnbqG4+ccejCBV7ffxQAdXZ08EffUy0Meu7F9c1vX3vLuKTV1J58NWFgAGEILW1BEMKuC2tbxdLO6vQbRYsS7BykWITUBwBLFpXu/3W33t1kZuqaMQMnv/7wBgD86Gf3NycmJmX5BAXOtGtmPoa27lKQxX1YVSrK32UhZSUVHpARikrB5/dC7mIaIsC7CFScApT4ZXRs/HtrVix/bxF5G6AUY1+kvVTxqS6FG17V5MUM+gsC5iPXRUCXxbeKyiA1nJQjtqLJ5ujEjAZAtY2XNjBPUuLgyBMVGwn+mCTg5w0AowDuy0qQLFantpk+FW7wlXD/yicmb7nrFxMAcN4ZJ6Spwa9845qxivlzuSjiVqbMzG1rMxdIsc2k+dLRpgk5oZWbLLtyLhT80ds9Eycfd5gz+n9nEwBOOu6wRl9P5SRdf+s9zFBdLItcb/LILp0cRUrMlYRfFC4WQhDL2lBkDVsWKrVGku+YAEb5x5cOaqh1/hEeefJZAsD7i30Rf/bJi/6bV+6pQBbaUjy18E8PJ5vfAHFu/2sEzCs/A1JYqgpLhshBp729GpK8TZ+y3llq8RZlSIoiKx9SeRDwEIDNkXl/nKhmhSgORCjJO+m413UecdC+xaGXn7/sqhEw0OggfHzZW2cC1cj35d+/WR3dxFJbsV+Q+EGQU8zQxNXK7HwT2OyxXzK/SAchLLZy9sXHv6LP/uY3HNHonqlPPF+/aQvf+cCjDABnnFiN/o+OjeMndzwwSYV6VZoduuoLL0HSk5Wd0/LI9SJC4otz9E6sgpxzSk5OvUaG2GvezrDl37RlAM+v28gAcPB+ew6H4EEAT1s80wGr8muUs5+wRbBUfI5FfT2A2wFcDFCHzrPgNMkjBYmCvZ3BbLZPYgl7i7G/yjgoL43Mr8Ur6asYiK9hMBohwtUxgqyMGpOLT4U7/CQ8vOrpyZtuv28CAM558xtn7D1/1wYA/P23rxsdGx+XUZUVFpRR+iZGZkgwvTJDAIX9SnXjFlHe4o5C6zoV7R61uOc+OPFpyaLy5J8bb7uXJ5tNdDQadNoJRxIA3Hr3Q83B4REVTwq7bLwYIBQbxOeQJkW15Y6DlXq5gFsMx1eNirbUETpheN5/b/ca8IjoqbNOPu6XMRjAy+r3S8IkF5dfZSxtyOqURlSQBu//QDVQeQTgCYCa2nezkRIueE3q4xjPJa8S8tSzS9MHgU5rL7NiULo+ZEzpuyomgb5HoKpvzcCjAO9gKHEF6/gjD+o87vADCuv/xeXVAh8iok9c9NYuINz9d+WN0foniZZIiwqqqJU7EBWfWmaVZa9p6CgLNTahwmXLHjIozhUP4dQ1Ywaf8oby4o9rV9zVZICOPfwA7Lj9bAL03n/O5bD05HCheXP9FPKXPxsXIRWn+CoKDD3IxzqDUqKK5KCD9tmj+BYOAX0AwBk7bDcrHhL4SxtvmyBWSqsI6ZdqQjSwiYNq3/41AP4MwKz6vNIpPNELKwkrta3kbRYfXfIIerm0sOq1lUAZs8bHmVmQlXAPQpvk3YDQO8M9YACfDnf4SVj19HOT19x85zjAOPOkYzvj1ODX/u36seERbf1LDyrJbo3htSqjIElZOe1fFc6b9b+CoKsDhhM9BL9PRgAWH3tox6y+HvVh6+AQbrvn4SYBHL2DyWYTP/zpveniDyNcybuRRDnlcyugTJT22lVpqtRFPXgQFY0gzuigIrp7DNjz6zY8imqabz2A3ULwy1YA2XzpY0taxVcrLYrYrntzPqrzB86ESOnjV8q3RA6wuLVH7t2PINLZ+4mysaMYTwtCjS7LG0JFY7P4c/KuIFmwEDrHoSdleswhCztPPPqQ0vp//aqxak1bgz5xUdX3l3f/TX18sp7aFFZSvpo0ijlTU8vatfJLKAYBJarCXlb77fzLRc486dgCz02339ccG58gAHTGoqMJAO7+xWO8ftMWS7ugejriqUAzjbI25tqsKrZcNUk6WdW+pUem9oJ49DHgzwB8+N1nfnTNiuUbUJ12G+Hh+uJMD6jm2QZUBXTZV0aIoZ0AvsLAcgALRKzkVhuD4S3OaamXMoNKJ0DyaK2A1rGFLT6FErMJpZr46rbaOAYgcpZFy/0QAPTb73tbMfK/eu0LzStvun0MAJ/6xiM749TgP333xrGBoZFQVjVelQgrPaWUWcGTnL95oGSBUFt4F69gF3U6UOkZVbN1HY0GTn3jkeXJvyvubhKAQxcuoD12nUsAcH3Y+x/pUnVQY+4FfR791sVLT1H7t+BEW41RREinLxRn8do9swsL5u9SZLPDdrPuDY8Hi+CX7QG4rn+rVi1f1Rfm1Id/Haoz+T9M1RR4wTOi0RXfBPfQCuoUVKXPcnS+jlR2njxFkx0kaAPIXNDnepmNUrMqE5ieDtt/QcdJxx02w1L6peVXjzab1ZUtn7yomhrcOjjMX/u361PfP2mRZJMS9sh42QfNWRMg5i5UnYvarN4SU3PZEK2hJjZDWU7pWuMNRx7UiIdcRhgaGcWP73iguvY7rP0HgOtvvTspUOg2SrvDo4IRalCVT6pkh6uMVa8xEXqUg21MhnA7jdI1wADTwgXzYPc/AHgGwObwHBXAMICnSjTTBSrpYPUjo6YfX7IoVtbvAriJgWNLrPo3eo2Zr8TmXBUgKXCL4JKMcnKp1uNyPqkmF41nNweZMuUiFC0IYAeTNzGAT138tpl2v/ua519qfuf628YYwEnHHjbjyIP37QCAy668aXzz1sE6a0WJ/bNeULvLoLwDZRQLqyhMF2fXtZUBq8Jig4oV2gVeqZMkEXFvv4Rb7nywOTI6BgC0JLj/D696mp/51Togug5Q3o04ny1zG2dHIU3gC4/GMrdsWKUMJORqL+vFcQnUSsEajuYDnRkAAL8Qz1EBvOIZAEuHNbneNsqSOAaAnVBt4vk/AHas8RRTlXB+VofCWI+IdDqba2xnT4fF5Czy0iZYjeJrFFEPSp6y7ot57JUhBKMAfJ+FcOA+e3SefsJRhfX/yjevGZ2YnCQC8KmLz50JVHf//f23rxurU9IpLHClF0/6P0abeW6M6Nfn9ix9Bc1HJPieHH5x64IAahCWCAsf4dpbKku/17xd6KB99ySg2vtPWZDjqHv1J+9YR+ojSQtcTluUXB2ZR92QZE1UrhWly9IqQnLiOq9KWR22/4KtBTW+AnhlMwDwzZ4Mcw5HcIDORbWJ521Q+q5IYo+La43WpHUCXMcslIFl+7tmPo06lvYUWh508qwxWEU0yRvyo0A/B0JAPvXec2Y2GjrzF17a2Lz8mpvHAeD4Iw7qeP3hB3QAwPKrfjy+ftOWxOyeILHISisqqwC9dlDpCiMgv+eSy4UxCqymT8mdxicw+OiD96NddpqjPo+Nj+Om2+9rMsBLTjw6fbv+1ru99doZYw60K/h0JP1qGarwUKqo8hSpUE49MJSZzp8hjWfXZ2HJ0X75jiWLHnDSRAWwHarVc8ArHQA02tmvpyKJhE4AXwbwTRDvF6Owj0I4Yq7EWRaKcZTwOYgVf4kyqJoXjSPziZxShEnPwzP4JFCRGfyLMRq6Xc1XAPvutVvjrJOPc6z/D0YnxicAAJ8O1n9kdAxf/dYPRgskgRhl7UzpqudoaJX95vy9sEhygEbWmxSKlMyxbsIDcM9UKIRtqXPw5+33ruQtg4MAQLH///RzL/IvH38a0F6ONNQFMbqMtbvcitVe1rSEgsVBzLQ8nUo9KK2F5SqzlDQ1y88IePPs/t69HdqiApAzAK/MA3AsSJ0pduAoALcB+CiA7nKyqXiJPBWe6w4IU/XoLe+usTcBMRUW23Nyql8qwkICdWOW5V1BWytVCTRiWpWq+jkbwG2fXHbOTDvYs27jZr78+z8eZwBHHrxvR5wa/Na1t4y9sH6TdYk8K51cJdmgsqyMQvjcxieVh6yjNDdaHLXFWlmwSWtIhYrn9f+vXXHXJBFh7pzZOObQ/QkAbrj1HkY+Ybsoi+MEKUtezXtHHZ5ORtJK0OFnl2Vzcp2KtIY13G/XBDCAqxk4Zc2K5RPIFj7CBMLWcrxKMwApd011UXM1kvYHqFb0vR5VdYbqU2POEmeqH1FBpCUDlrdlJEOHXbiqsdQwmFXO0Qpw/h6O7UYa0KzzSiKRtwI4Q36WCdScvjK3wG1rViz/+MTk5FOW0H/41+tHh0fGQGD89vvePhOo7v778uXXjEWPjTNxDvOrcFfaSGhWEsn8hbosv4RihJ1P6UTVnKX0M0ixEYWNEqpLHePSYQsX0J67zVUETDab1cUfDJx+4tEdsaskRv8L7WRA6l0KpOcDCBhMYoekkgNFZWKIaRpJRhwzlYRFWkUDEQFNBr62dsXyD4dor3cQPoZ8XXdUACMAnpyalmmAkkEp+QVP7AzgHwGcHbyY1IAVyEWmSin6MlkdyqUEU9ZNpsLqo1S1Nd07XRrDcCqKUtDi2gbBv7W1AyX8UX3keJ0SuUPk73d2VB7v8+s2Nu/95eOTm7YM8L9898ZxADh04d4db3r94Z0A8K/X3zr+3IvrI9vGDeVpAYCoBKmdlLYSIJhdbmEuTB7FmKYicnFywyvcgO35JuWQaJJFIMA9+PPnDzzCGzZX42FLFx1DALBu42bc/dBjTWhBaglZ2ZHxKVORPOvjBVieSu+icjgqtZS20rhyBiCmG2bgs2tXLP8Lkd1hThG8AcBHkU+dfllQ1h+pApprzd4N4LMMLDDLOOtk0MiSkyNrAdbeZG4piuySUbJQynWZyE08hMwvqq3JKAHkNBIkTxsFl1WFHZSz14Nb+EizyaObBwax6MLfHZ2YZDSo2t3GAH36fdXU4MTkJC65/PtjqVXiyGU+fSdd9Jcbj6Nw2TY2ClHt8JWjplYbyCkQNcVWfa+cAZNHFHSpQKSCyK3L/uq/uPinr7cbJxx9MAHATT+9r5mOPssWQkxRlvJLppGEO5DodYRcEizXpXvKwuLIiIFiojs8bwDwO2tXLL/U0HuoLQB8BfCKVwCWdWU9OQBAF0CXALiYgRmpYkoorKtAw1qhKAo4aGYjQqoKDa2FUbKWmVXUUllZq25pJxvPPN/KwF/ImrI3ihCcdQA2l0aDZs6Z3f+m0bFxK6W8ZNHRnQDQ2dGBZ557sekUIjOpRpwv+8jTYXJk1iq7lC3B9Lny4uyYRp3MJi2rAjEiboSirG8G9ttzt3SzTwpmxnUr7mIGcMrxRzS6ZlRjpfEuQElXTph4QpYbspGMivDqhJyPSTmKXxIoIy2iTtjmxQLn0wDOW1MKP6AH+SLIGYC4RvgVTwF64mjC4tbdD3Jl0KznM+2sjFHRSpTdvI1zWxCohJNRiBeb/0ZBs+EdwOD21VwFZ1DV/0/prJUFgE5bT0atRG69va+ne2uj0UBc4LNmxfJZALDfae/fGq/7gkxDwQfKeUermowWI81VSY7MbjNFraU8Bfm5rJaYuzDeoTy6Itmkyx+ELsn5nXVyee/f/Suf5OfXbQQBWLK4cv+3Dg7jtnsejo2jrG/+zTZKtydlf098imJKEmcqZz4UiCSijMC6rKIyi8tFYqoHAJy/ZsXyVWX9AGjdBXgVBwBLMEzwpwA+jUrphEZPyyJCNF8PcG7oVopCZueCVZ7RKBmL7ba1xu06dWUKLnigpaJTwuZ876xLa63iyuv+odgiOX/xsq0AMDI6VlYQMwnPxgoDYAWyIlIv9Ss9CkNagTt6BLLRki6BqDh53JbGlcYbkoZlgJcsOqY8+mvFXU0A3DVjBt4Ujv66+c4Hm+H8A9WaDsEmWIiviSoGAa1tif3MVFaRn7VMiFVeaFJVdvwYlfBvsOUNsCeCwAnYinC6NF5jBRDoXUDAP4BwKnO61CW6lJHf9fHTAkwdiaqolSWlwHMsBqCGmInAzETyrD82OGBYIw6Xqbws85IW/DgHmPgz5sVAk4DflwzjWs6QgZoFaKFKCADmL142l4G/pmo1VUzSyJUiz/Ksq34NSRgITFwewknqRwmPrVgjyDqF9QASm+hxOpldDOM9d51L3r1/P7jlLjCAE44+uDGrr1pncf0Kd/GPVZCKVkFbsOSVI0R+fAtZnWWrljQZdD3lsseS6/r5NoBlYZqvDjzr/0uRT1QAowCeaIHn5cJHUR3asVuwkaHOfCsjwWjRkCTXnaOT5bJ5RwuT/JfGELw95LBzCciCq5VwFZskz3CwA9EgCeOVhL/6OkDAbwC4lgwyVTpBRzEN6MRJsGbF8nUALp6/eNl6AB9M2WbtKyvKaEvXJfbFXb9IDetaNyvcOg9iW/a8LqaYUqnSmUHEJYuPacR9EJ/+7N9N/vCn9za3Dg6h2WQigOLo/9j4OH58x/2yQeSwsFTxqtCCBrkD0dZBnWniOFdlWNNWfa7CdHQEU9jq0STgC2tWLP8dLw8DngJ4SDxHBfAYqrUBrxgC4dsz8A8EnGc+pWejMBULc1aOSuHGnY92biG2H0QbUE0bIPGy4lVtoByBssiiu1fGlmvJVLdN7hp7DsDbUR3y61DnAMlBQEcNtYDPALg2xLULRqzAe+qV80NwS/WmdWvhS90sAh1LWRj7FibU4o9jF9F60pEH70sAcOVNtzev/tEdzc0DgzSzKy+OXL32BTz57PN8+70reevgsCmhosdR+poGjrxEptUNCF9SKt9q7KWoA0oRtHNEYGAIwGemKfzA9KcAX4UZgARvA3CXEf7IU15diqpTIg1k62qm1hTrSBFUSkb8suV7SYBAyAZB3Bgmlbs8kVbiTjwYUIrkCh4EcBKM8MvKsQmipmqoEGE2WggM1qxYPsnA+xl4mJAPSRCZSa0JSP9Fg5qXy4/qJNsiTaKWdeVaVMK3g6n0QFu5WitwiqqG3/rTL00CwLmnvrGx1+5zqbPRwVJh/dFH3t3YZ49d6UP/4/OTKWenGpPjUWSa6U6zI+JU4LpKAJzys+sNydIJ5YsXCPy+NSuW/219kgJaKYBZqMYIgFdBAcxfvKwLwN8T8C0G0jr+8JfOegT01WUGjTtfDkg3W5lcNr/WcCXejG1AynwJvZAbUOKMg0wSf9Fm5nIREbdgqetBOBXVPYu1IC2acj/nLbqwNtGaFctb4cS8xcvmEfAjALtLnNCN4PGj8LWKeGziAGGcIUe1baBxO9ojKoIomVnpl5JoGzwpkbUrlhd7IiLMX7ysxt2t2tzSpBzNMu8p6i/yUVLk1CKySoWc7yoAF65ZsfyuFkksdAIYAGAPhtkZwDpUU3J3hLDzUG29fVkwb/GyNxLwJQBHcBQQ4SIFMMIxtfMaJd6pexPFBkW97Bz0qSMVBoV1V9DxKKSRh13DEttYMn18/SqAz3B1xn8teJosQqdiTJI5TVmXWLti+dr5i5edh2rkWOw2kmNRClQFGaGIZp90WYuoiR98QZddvIwbiPO8cq9HQYnEWyio+YuXjRshYpPGQqoHq7qj9YivJn2h5jVuVbdp9RfDzAKQHgARNPwcwDvXrFj+TElyS9gfpfA/j0r4gVdpBmDe4mWfJeDjCIdzpvLkGZ4IjjApKIQyiLHwhFTtWllh/ZpcKGnBZWblsvZKfON4U2noxQRdFZVJDCNaxS7ypCsA/I6mzgevwmJYo+C09HEqtBWsWbH8YVQjj5O5lpVM1Lhn7Lg9Kr0kxCUmtayeztYjqEVhvGMBNQOQCQwvyezWCap0/Vl/8zJU7SJYoACZX3DhYnqVR0GbX/HXorqYc1uFH8ju/0oA7wGwF4ATxPeoAMYAPL6tyOcvXrZw/uJlPyHiP0Ql/J61l38x3Je7rCnNwHzRNNYzlvgFuhxPRGAov98jo9zBKUgkEUfu+7D5yof1qNY/uNDKdKfKCgzdqCvltsCaFcuvBfDfEtUVgqRijTUNDZltvfwW/R3oKRhbBq3JOAlFTJ7rm/V+fy7wTPtyEZlvMdMT9QwjHcdmmShiI+cbsSS7Hpi0e2MZo7btQlV/bc2K5WetWbF8YKqMaiAqgPcD+BaqI8DkJZ/Ph997sY0zAPMXL/skqpVrJ4eZCY6ECyiEnZ16jvdhhe8g44FxDU8VkLWyZwyEl8jeWJZoEutPq6b2FJkpT5H3J5G8Li7iZUPqc4MUklc0BlAH8xcvuw7AopiZMblWGXjh8auah3WySvJfmPVKzGyaqL3VisT4yyj6DqZBkhPg0VHUv/dV1EdkHpj9bI6ydCuARLnV50ilWFE4RMD/WrNi+Wcd2rcF9kS+4WdnALNRWaNNIuuY57Rg/uJlOwH4BwbOEQWJ7WHqyhcMVZk+T8V2j4Irv8moLLHG+hWGLEWOtIkM3L0ahuYULuOLyFxEzGF5W6/ip8w9NtPaihDh5ZFg0266lpAYzXF9kso2+qnMORnnIqY6SqwQ/th6KEbJpfcT06fqLDhMxzHGV9FsPA+duHA7clyGXvCToqTvVLZK/OYJv0VAwEsEfPBVEH6gsvgxrxdRufkboZtzW4T/nagGDc+l3DZS+XlCnyylNJkEVf9SZqv6oTDpmb/LuFxmq3bqeW2UF+HAdfG99xis8JGXTss0A/gL8VUR4oGtuNp4rTyAVwmiNxD50mp1RD0GRGcptS/gMHiAqRjNWBFfTgRI7Sw+qgFN7zotMiUoMjJldvOvK6SJO0W0ItIqVOMzt08jbgpxT11wZmbriKmzNgK6UR3TdRH0YrTCKxMUAKWgWDq8+mWHHs/bY/0Qbvoty87RxzJW3+Lx7EmdN2e9hAgrAXyPge8RsHJaje9BjWUDVOXnhn85GXlpQthnUSmBRAsKdqo9+SgFGE5IO2Zb0CldyJgyNme0oJKkFFULa8pBCz8h7l0IdGTBr1ES4bvSI2WpS5B7xGv4TZuLoER/DuB8BtaQiafjlpQUYYxSKbSgmVp8Z+AkAj6P6lx+QAsjiXfPi60eSNdgDR2p2uw10yaCpIGRGCG0cr50R2SX3LLYrlOJTI34ueGUWRRHv2yhFxnUDAUAUArA2wldi7II8b6E51tRbR9dhGq10omoRo/roNAAKjB5dNIqyD0IORJFJZC1eAov0DoG2Wp4ZYYSW2S8gTHr+gkUUznWx4J1L62sshcsnq4CcAGAkeJrC2swHS6eykBMEeevqFrL3yu+F2dExhUOsmEllAyd2wDaknMcRiIZhOImHWnn3RoyfpGNU6Pr/GqgmhYIxK0E6HsIayg8/psWCEvZCtQ6AEcq6jGbkCmY5+nwF0cVh4wplKeeiOOqNV5t0cV7XArvuFKZ7e14TWEXjTHQeZU1EMnPikcfeFIkrq0izXhJwensChJqUf09KiHzc+F6Quq4OKuZgrZaHCbOwQD+DsCJ9Z5Haq+4wtOd7SgpS7kRUN3ySNXnVJ+aYld9FFupy4JR7Smt9TRGUnT9OTz9SwBXAPguAysLhTjFcytqVDyrHkH6RCCLcCqNLxXGtAmroFekHYrJKDNBQmMEQbljShNkw1xKR7HSM7eLoNvbPlprhKJCCREMw1qm07Vi61QwXyTJKjLFnzV1PIhqoOgvyxwB6fdsiyWpw+EQp/klB34GwO+hupSjbkNNSa6xsLF9Et+oY2Gq9gy9dqHqVAk8dpZGImo3uRIvX77BChmjTOMVRDk0JMYNGHiEgO+i+lsZkdc0vC6JeW4lc9b/sRj0duDI1iYTX4NMbUU8whwL0BtqaShrbTVVJ3OWU18eVSVbFGR5U7YeaytdQoDqJ0rESlGRziMyodG7LRVmLKdVBYyaJcUAnifCJ5nxHY/Do3hMKfoiP2co0MXhMWVQr/NReSNLbZQ6ljTvsc4Lj4FyTJa1ZBtW3xgX8amVdpAfBQXpOwlaHHpJxc7y4ykZYuCXVLn236OwUtK2SJ2QF5F8hVMTuR70duAptPtUFqROgdhWdUlkfXEBAfsCOJ2BNxFwDIDdSRwipBumyjmoViJFh6IqZBUVd6F0C7IgMqCpnSKRRL0kBqqxgJLWmLm47z3bVKPUmIBHGbiQGffKDy2Ko4gkGxAevLllX73rGOHtQwD+BNUekfpCluQUyoH8b+lVGASnHbPpCmdQQp+3nOowVLe7PRw16jDRJd8yPWnJ+UpUrn0SeoWfUjpNcSuQMtaKgz0w8ac5DTgN67GN8DIw7grgQAYWUjWIuHv4mwNgRwB9DGxHQIdRXN6Isv0moZVSziYlV2SWTp2mzmMpkZXp8rtzwKlIezuAdyCvwNsmsEw4nfgxukqf33biqq//tkLrlmnyWWbIWm4alHizOG6awtPIzrrVXpWCMQZMomGE5X6c5bzm6A+gEvTvorL2U+6JyHRWT74ymFpidKH8+Db0/w8DTcAzSs0kIAAAAABJRU5ErkJggg=='
-
-_indicator = b'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAAJlJREFUWEfFz4kNgDAMQ9F0n+4Io6MigTh65HS8wPsulLha616y/IYT0ZYScOHtPDzgicMDvjg0oIfDAkY4JGCGhwes8NAADh4WwMVDAiS4e4AUdw3Q4G4BWtwlwIKbA6y4KcADVwd44aoAT1wc4I2LAiJwdkAUzgqIxJcB0fg0AIEPA1B4NwCJ/wLQ+CsgA78DsvAzIBNvAQcRLTAC1BapWgAAAABJRU5ErkJggg=='
-
-_layer = b'iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAAAXNSR0IArs4c6QAABPpJREFUaEPtmVfoHVUQxr8oohIsYAGjomLDhkSxYcVeUAkWbGh8sIK+6IuCDUFQX8QH64O9N6wximKiiL33gooNFcVeEAs/mAnzH3f3nL13bySQgQv5756d+b4zZ+bMTKZpEZdpizh+LSbwf3twkh5YTdJpkr6SdKOkLydBdhIEVpV0gv1WN9CfS7rSfl8PSWRIAisZ6BMlrdkC8lNJVxiRb4cgMgSBFSUBml1fO4GaZ3/vnJ5/bCQg8/04RMYhsHw4KusmEE9LOlvSY/Z8N0nnSdo+rfswHK0fRyEyCoHpAfgGyehzks6R9HALmL2MyDbp/XuByC99iPQhsEwAvlEy8pIBf6DS+H5GZMu0/u1A5PcaXTUElgrAN01KX5N0rqR7aow1rDnQiGye3r0RiPzZpbuLwBIBeDbwphm+Y0Tg+bODbSM2SS9eDUT+brLVRuB4yywz00fvGvBbBgKe1RxmRDZML1629HtV/qCJAEeCQIxCtiCL3DAh4FntUUYkZzcwgG+BNBG4XdIhYc1HBv66hQTezRxjG7lOsHu/pANKBPaUdIGknCHeNyI3TZjIEbbL6yc7L9rzKZmuLQYI4JMlnSRp46SIVIcrbxuYyKEGMKfotyRdLukySf8J5FIa5dKCBGSiK8FOquM83jUmkVm2IZslPRxdQAO+9XIrEXCdFGruEcrkKK/YWb2vJ5H9DXjOdJTdvuPFgq+WgGNbI3iEIi7KC0bkoQKRfQz4VmkdRZ3v+Ge1m9GXgOtdL3iEEiPKM1bIPZqe72HAt0vPKRl8xz+oBe7rRiXg33NuiRF+WZ4yIjwn6HdsWANwfq/3BT4UAdfDcSBGZlcCudaOy/OV61uXNXlgl3ATcyPP72FkJ/MGJUGT3Go73kfnvlbWEPT8e05UXFNK0JTQnNCk1Ap1P8eKahO514DPrVUgaXcDflD4pqqU4OK6vuEmxjgeebYHCBqevyRRS9UKXqRFPTx9wE18tCQutgXSFsQ8ZwdRlC+YB40ICoeUbc0eNVAUApzemWD/JxssZaGlA5Fc4nIs8Ag1+ziyhaRTGhIApbsD/6PNQImAf7dcIJJLirstRmhy+gjdHYOvnLkoIRz4TyWFtQRcDyWFHy0fWvk7ynA88k7BKHFxRgNwhl8OvFhCuI2+BPw76iEnskoCfLMRybcqMyMI5h3/JgDvPX5sI8BdQG3zc2E31wpEVkhr6d5Iv0gT8B8C8E8KdjjC9CdP1ASxt5RfSLramurSztB8uEeWLYD5LQCnSeqSlYPeGVaSFFvK3BM7kUslfVcwyFTBiSyZ1nIf+BkvBTxTP9cTx5VVFxl26f6PSwCcyEWSfi0QocY/VhKlMynwERsIMF3oEipbgJ/aMGflNDAtmSJdQcz4D2X5YnEi59stW8BU9ZoWFlunNwBnmMAl1lgB1GQhymCU56sdIngKt44jePrMBuDMngD+ZJfyGgL+PRNmSgumaFEgQnxc2JMF6ZTslEfyd1qs+GS7U20fAq6Icw2RKfMZSRC5WNIlBSJtwOmpCfIp5XJpU0Yh4DoplSGyd4NHiA/ARGkDziietdRWvWUcAm6MKR5Edk3WKQ3Osgqy6ag8bsDHGhAPQcBxH2lEdihsI70yOz7IhG9IAo6b/I9Htk5E+N8bgF/T+5x0fDAJAtEjtIVcetQwYx2VNg6TJDDkRrfqWkxgoWxzh5F/AedcA0CZDARIAAAAAElFTkSuQmCC'
-
-_link = b'iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAAAXNSR0IArs4c6QAAAjBJREFUaEPtV7uKFEEUPVXTkZluIL5gwcCWut2g8wPKCgabiOY+QAzMzTYTM/0AMVFzH5EoKJuIYDTQcytRwcBXIPgBE/SVXmagdujpx3aJlFbBJFP3nrrnnKrbVQqBDxV4/YgE/raD0YHowEAF4hYaKODg9OjAYAkHAkQHBgo4OP3/cYCILgI4DeDU/HeoST5m3iUOEUmL3N8AvBeRidaap9Pp8y72tDpgjDkA4J5S6moXwEXMHggsw7/SWl8viuJr07qNBPI83yjL8nWfwj0S2IESkSvW2seralhJwBhzWSn1aEXiRwCV5SsHM591J4lou0WIgwBO1sVorc8VRfGmbq6WQJ7nR8uy/OImKKW+A7iZJMm7yWTycy+utOWkabo2Go3OKKUeANjvxovImrX21zJGLQEiegngvBP8VkQ2rLWztiJ8zI/H432z2axas2oYi6300Fp7rZVAlmUXROSZG7h8IH0U2QWjpnNdYuanu3bGMpAxZkspddv5/xYz3+2yoO+YLMtuiMh9B/cOM281EiCiJwCqnr8ztNbHmlpZh/7eyKvJ3TRN15Mk+ewAvGDmzTYCVd89UgWJyAdr7YmmCv4kgWpdIvoE4Pi8hh/MfPifJxD2Fgr+EAffRucHJ9wPWUUg+KtERSLoy9yizwZ9nV6QCPpB437xgn1S+r6g+cZrfRP7XtA3XiTgW9G+eNGBvor5jo8O+Fa0L150oK9ivuOjA74V7YsXHeirmO/43yNjKEAZOIi2AAAAAElFTkSuQmCC'
-
-_maximize = b'iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAAAXNSR0IArs4c6QAAAZVJREFUaEPtWUFuAjEMnL3Sn9Azd/hEP9H38Il+or1zhp/QaysjIrmr7Cb2OFRB2csKkdgzHmdjJxM6f6bO8WMQ+G8Fcwp8GkAdDGPXhrp9LhHYVwKLSsGfSn9fAP4E7ekJXAG8AJD35f7WwWqVQuJzq3zLb3koBc4A3u5EKhV3DRPgHwBeM7PNBJICyVZrEjnwGoOZwAnAZhaNViRy4MXXN4CdN4WE8XtG0mgSS+AlZY8A0lfRrECasOZAFjfzlGzLHkETEIAlRx4SNTbDCESTqAEvPs0ESpGsdbxmJ8LGzb63FNAAvAs6woabgE4nZnNLJNw2vAqk9BAAEV8htw2WQGm9NP9/EGge4oKDocBQgIzASCEygPT0oQAdQtIAq0DXpQRdiKkm6eHFXEQpHGHDVU5HNCMRNhYbmrUWLsyxocc2t5RLEyLB635ifgo37/BCCLQAX0uCJtD1wVb3R4vdH+7qjd57fGItFpocrz/FBUcukmwtlWyOOzIdXfeVpzXZ1Xi3z6gUILBzUwcBLn787O4V+AVK8LoxESqymAAAAABJRU5ErkJggg=='
-
-_minimize = b'iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAAAXNSR0IArs4c6QAAAMRJREFUaEPtkrEKAkEQQ3Mg98k21jZ+8iEoW9h6gRiXhWd7mTjz3m5a/Lctvr84YLZBDGAgJMATCgHG4xiIEYYFGAgBxuMYiBGGBRgIAcbjGIgRhgUYCAHG466Bq6S7pEv8j17BU9JN0uMs7hwwMscfl//sPI7YJb2+HeEcMOaXNnBmcep318DUJX/xhDigRYAn1CLr9mLAJdXKYaBF1u3FgEuqlcNAi6zbiwGXVCuHgRZZtxcDLqlWDgMtsm4vBlxSrdwb5LkJMdyd7ZIAAAAASUVORK5CYII='
-
-_normal = b'iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAAAXNSR0IArs4c6QAAAZ5JREFUaEPtWTFSAzEM3LTwE6jp4Q8Mn+ARwCP4BJM/hJ4afgItzM7YGXOxLF3sG59v5CZFbGlXK+tseYfBx25w/HACvRXUFLgC8NUZZBFDicAzgHsADx1JEPwbgD0A4jkZEgFOfgqzPzuRiOCvAw5iepkyyBGYLuSaHIkDgNtg8B3A3cxUK623YhCrkMXAUgQsvo+xKu0BzdASBDSf5j0QJ5YMvjZOocewYWPOS6n7j4RWRjlZIvED4KbRHvgAcAFgFnj6thCQSHwDuGxEILVlinyUwUpAIhHt1FahNC1mlW2NADdqOhhxplSMfGsCVIJffv6mQyzRGoFfY21vqUDOpYhz8wSmKVQS5JwvsVFg+SuvKWB10G2eE+gW+uDYFXAFKiPgKVQZwOrlrkB1CCsNuAKVAaxerikw/GHO7wOFHEnbMloqnX2hGf5KmUYm115pfSemvaaX+ggwB36YtsrQja2hW4tao3XVzV0NPPfGEgRo1+L7WFw2+8CxxicmPi+dvJNt9pEvrf/DPrNq55NV/K8dp1cBsgTCCfSW6A8NU6gxazDd0AAAAABJRU5ErkJggg=='
-
-_settings = b'iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAAAXNSR0IArs4c6QAAB71JREFUaEPtWXuMHlUVP2d22lRRFCU1QcBS1nZ3753p0rVoLbT2ZTFBfATfSAQTFAmGRIi8QuKDGqPGR9QIEQUqaDBEXr6oAgoKugrL3DOfK26hCBiVogHW9Gv9vnuc8+XOl9npvL66JSXh/jd3zvM+zvmdcxGe5wOf5/bDCw6kO6i1PpmZj0fEcQAYBYBh9283AOxCxF3M/DgzP4CIvyeiH8/H7s/LDoRhuNha+49BDPI871VRFP1zEJ4i2nlxQGt9JgBcNYgxiHiGMebqQXgOmANKqesQ8f1OwdfEGSKKsgqVUisQ8cMAcK6bv46ITjsoHNBaPwYARzpjVhHRH4oMC8PwDdbae92/R4loyXPiQBiGx0RR9EiRMqXUMCL+xf17logOrTJKa/0sALxEaBDxWGPMw0X04+PjS6ampnbWOVh7B7TWbwKAnwCABYDtiPjToaGh20V4EARLmflbALDZKbqJiN5R48AtAPBWR7Pd9/2zRJYY3O12tzDzSU6eh4hvMcb8qkpepQPLly8/YsGCBQ8CwOF5Icz8ECIuy84j4rnGmK9XKVRKnYeIX87R/BkAlhfwSegN4jj+e5nMSgeS1b8LANbVbaP7/6C19pRWq/XXKvrR0dHXeJ53FSJubCj3LiJaP7ADSqlPIeJlKSMinmatfRkArELEkzO7ch8zb43j+NaGBvXIlFJrPM/7NDNvcHyy2rdJkgOAWQC4NqP7MmPMZ4rkF+5AEAQBM2fD4CVEtDUrQCl1PACEcRx/exDD87RBEHzIWtuK41gM74/ksn8iuexfTCc8zwuiKKI8f6EDWusbAeCdjljS/uv/HyP3l1drLU6tcvw3ENF7ah3Ir761dmWr1XqgqRFa6zfLzgDARBK11ji+3ySR54/JokREdHtTWUEQTDBzP6cg4qgxZjrLv88OaK2vAYDThQgRbzHGvK2pQq31NwDgYzX03ySicwaQKXfhg47+u0QksKU/5jgwMTHx4j179jwFAIuEwlp7YqvVuqeJMq31DAAc24Q2MWgHEaVotZIlCIK1zJzmgt2zs7Ov2LlzZztlmuOAUmoLIv4sI3E9EUkorRzJsfktAKzOEG1DxFsRsQcbmHk1M0vySldSpu9NjtMb62QrpdYj4h0pHTNvjOO4/z3HgSAIDmPmOwFghWPY7XnehiiK7itTlI8WiPhuY8wPi+iDIHgXM9+Q+Xc+EX2pTHYQBOL4LwHgRY5mChE3GGP+XbgDMumcEA+lMJExK7E6juPJvCJ3YX/eF4b4OmOMXNbSkb+YyU5sKbrYSinJN2JHDzcBwGS73d40MzPzTFZ4YRgdHh4+dNGiRRJ5ljri/1hrN7Zard9lmbXWlwDAZ90xuTKO44/UHQn5r5S6AhHPcrSXEtHlWT638tsB4BA3v4OZx+M4lgQ3Z5RCCUGg3W73DkRMIe93iEjwfH8opW5CxDRKnU5E25o4oLWWu9DLtMx8cxzHb88tjCTHVNcO3/c3lSHTOix0MQCkq7OViGTFsw48gYhHyESn0zlmenq6Fv4K7cjIyBLf93vwnJn/Fsfxq3MOSNa/yM1dTESfK1uYQRy4nIguzSkS4HaUzCUA7agoih5vsgNhGB5prZUiSMZjRHR0mQOIeKEx5vMDOyD4vNPp/CIT268goo/mFH0fAN4rc1XRJ688F41+QETvy8mV+jpNWDO+728e6AgVXWJE3GyMScvBnj6t9fnJRfuCU76NiHoZvG5orbPZ9QIi6oM24S26xO12e2U+AvUWrmB1JBfsbxgtzQGpnoJc0DSMTrXb7XWVYXTZsmWHL1y4UI7NIIlsDv7BilxQkAMqcZHWWjK12NMskQVBsI6Z+9DB87y1URTd3eBIzMFBzHwlIt7T6XR6vL7vn8jMJ2Riv0w3wkNhGG601ooTvYGI64wxv+5/543TWv8LAA5z82uISHBO7SjAQ1U8jXCQCJDKTRbDCXuSiBZnBRfB6X4EYObr4zj+QK31jiCPi0r4KvFPwZ28mZlPkXnZ2Xy238eBnMfCtyLfZatyyOGjVcwslVRaTU0iomCpyUEKmjAMtbXWpPo8z1udB5ZlJWUfHifw9e4Evq5tugvzSZc9lmV2FDowNjZ2nOd592eMOZuIpIHVHw4thkQ0UFO34M6dycwmj3a11tJDlT5rbzgwJz2qOaMUSuTbKsx8KiIudm8Ac9oqiPjJbGRosgtyVJOgIq2btD+0K6mjpTUzycxPImK/ppD2zkBtldQArbWUck2Pz6S19tS6xtbY2NjR0tgCgE1NHE0aa3cSUdo72oelEsyNjIy80vd9gQ+vLVC2TzuwSWsxCdMfT8L0V3PyylqL0wkeO2F6elrq9MJR29x13WepsoYaNHd/lESstJ9UqFBr3W/uSv09NDR0dklz97+e560s64qnwmsdEMKqVneuvf40Eb28JsxKSfhSofE8b2mZgXLU6o6jyGjkQN1Z1VpLHdArSqqwkItcaQvxuXvgqHMgCILrmbmH6RHxK91u98a9e/dGKXJUSklhLk9M0hpMn5i+R0TZNkudmv27A02kJk9MUr8O1OQ9qB75tNZSVla+C+QX4qB6ZhXjMg/dx0ndnnnoTm0XyP0nZpbmlHS8b2uyu3U083KJ65QcyP8vOHAgV7eJ7P8BBv11XrMcwcgAAAAASUVORK5CYII='
-
-_slider = b'iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAAAXNSR0IArs4c6QAAAmpJREFUaEPtmb9rFUEQxz8pYsAUsdEiKAhRBH8UIXXAtHaBKNhpoX+AwVqtI8YmhWmSxiZpomUIURvTiBhBE0QhaJqglSASG2VgTu6dd/d29t7tsfGmuvfe7Nz3O7M7Mzuvj8ilL3L8tASajmAbgTYCFT3QxBa6BFwGxoFjwCbwFJjx4RKawDRwvwDoMnDFSiI0gR/AYWAHeA68AO4AJxX4LWDWQiKPwANg1GLEoHtRdSeBFX0W8NvAALALfCyx9wq4nf49S+CMGjNgMqu+A85nVi0A1xwtnU6TzIvAb0dDVdSGgO8pA2+BC44GOzDnETgKnHM0ZlVbBfqBe3oGJBqSkebU0EPgSYnRLWCvbAtZAVn1bwDzBYve+Jy90FlIsD8GpoBDKSISiZvAS6tHmiAgGI8AkpGOA+vAeyvwRL8pAr54/1n3XxM4q6Vf0t8+8AFYqrIdfMLiGwFJfQI2T6Sfkb4miPgQGFRvDyvCL8AvYEQ/fwVOZQpVbWTyCFwFpKUoE2nARCa0IMmzZJVn+r0Uqjrktbbef21nCUinKB2ji3xST6d1PwMnXBZX0BGMP5P1B46AEIt6C7lEttshlouKnI0g4pOFBFhZGpVO1rs1sLL2JSDvSReyb8AasKG3KisOb/0qBLxf2suFLQFPb0bdTkd9oQl2pUzmN547pHBZ1Uu91JgOyTvEMjwa6zXyjL3axirSEpdNxnrBq+pgq6NQ5kXgkU4IegG2yEbRaLHbOxeB62ml0HUgmfoVDXflHnG3G4smCUQ/XhfnRf0Hh2V3OOmGPgNOoCxKLQGLt+rQbSNQh1ctNqOPwB+4Om4x1j7LvQAAAABJRU5ErkJggg=='
-
-_structure = b'iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAAAXNSR0IArs4c6QAAAf9JREFUaEPtmTssREEUhj+dRklNQk9UOnp0ajRUJEi0aCVIqGhQ69DTqYSehJpSoyMnmbuZvTuz98zcsXaTmWSr+5/Hfx4zZ2b76PHV1+P+kwn8dwZTZWAI2AYmlYQegX3gQ4n3wlIReAFGA515BcYCZVrgKQiMA09G873SoWmDmwCelTJOWAoC4syd0a7V92PwM4CWdCbgy3TOQO6BOhEAcgnVCaB222tnI2egmzIgB5NmFQdfVxxk/WYoG9B4bmG+ABkCvwPlmuApekAULgAbwJTSmQfgCLhS4v98GnUZsJu7dqn4GKTKQCYQW0p1MlDM9O1s27tNlY9RY3UMgV1gNuD6WOV48V2umbeA6FevGAJvwLDaQhjwHRgJEQklUN5ZQmxVYaMOt7oEourWwSR6y80EqupC+T15BjaBtYBmvQHmlc4WsGtgTikjzX0CHJbxrhJaAs6Vim2YGFhXyh2bACnhDdgycGELuQjIbiAplQbdU1qo8y6kMbFj+dQ0slcR0Mz3nbiR2UHNBMopzxlQNEEuoXZByiWUS6gUAW/DeCLVdSV0CqwE/nMiJEIuI8WlKGQcFxtnwGrVKGFHVFGeDciWa9jyKJBh8SBEucG2PM/47gPyUCW/QaWRy/KQpZCToXFRgRPIp3kEa3kIC73QKO11DpYJdC7Wbks9n4Ff8LOlMfjvp+sAAAAASUVORK5CYII='
-
-_tip = b'iVBORw0KGgoAAAANSUhEUgAAAecAAAHnCAYAAACCDZVUAAAAAXNSR0IArs4c6QAAAARzQklUCAgICHwIZIgAAAAEZ0FNQQAAsY8L/GEFAAAACXBIWXMAABJ0AAASdAHeZh94AAD/lUlEQVR4XuydBYBc1fX/z3rchbiTkASS4B6CO4VSoDilhUKVtj8qVP4VaEuhQg2nQIHi7m7Bk0Dc3X2TbDZr8z+f8+bOvJ28mZ3dzMxK3jd5+948uX7vkXvuuXkRhYQIESJEiBAhmgzyo+cQIUKECBEiRBNBSJxDhAgRIkSIJoaQOIcIESJEiBBNDCFxDhEiRIgQIZoYQuIcIkSIECFCNDGExDlEiBAhQoRoYgiJc4gQIUKECNHEEBLnECFChAgRookhJM4hQoQIESJEE0NInEOECBEiRIgmhpA4hwgRIkSIEE0MIXEOESJEiBAhmhhC4hwiRIgQIUI0MYTEOUSIECFChGhiCIlziBAhQoQI0cQQEucQIRoJTX0r9XCr9xAhGg952gHDHhgiRA5Bl9uyZYts2rTJrjt27Cjt27eXgoKC6Bu5B+nIy8uz6+3bt8vmzZvt3K5dO+nUqZMUFRXZsxAhQuQGIXEOESLLcISPc0VFhbz99tvy2GOPyZw5c+x+jx495Oyzz5bjjjvOCGEu4bo/6aisrJQZM2bIQw89JJMmTTLi3LlzZzn66KMtfX369IkR8BAhQmQXIXEOESIHoJtVVVXJ888/L9/73vdk2bJlUlNTY88geBC+X/3qV3LBBRdI69at7X4uQLqIn7RMnz5dvv/978s777xjaXVo1aqVfO1rX5Nf/OIXsscee0TvhggRIpsI55xDhMgBIIAbN26UZ555RpYuXRojzAACuWrVKnnhhRdk9erV0bu5gZOEkejfffddmTJlSi3CDMrLy+XNN980qTrk5UOEyA1C4hyiRaKpEBGXDs5r166VuXPn2u9EQBCnTp0qs2fPjt7JLTZs2CAff/yxbN26NXqnNtatWyeLFi0y1XcuETIDIXZXhMQ5RIsFA3tjD+5OMiUdELfly5cnTRPEe8WKFTlPM/FhoEb6EqVmB56j9mYeOpdw5RcixO6GkDiHaNGA8CDtobZFlZxrwucHhI8jGcGprq42IpjrNJIeiC7q62RxU3aUY67T5uLjzEH5UZeUVa7TEiJELhES5xAtEhAT5nHfeOMNsz5+4IEHbN6Ue/753lwBAtirVy/p2bNnUqICgZw8ebLs2LEjeid3mD9/vknOydLWtm1bGTRokBmH5RKUG2natm2bWZA//fTTctddd5lh3cyZM42hCBGiJSIkziFaJCA2N910k1lGX3vttfLjH//Yrq+//nqb920Mqat79+62pjmV5Mza58ZgHiB+qQgdRLlv3745X+9MPZWVlcnDDz8sP/rRj8yaHKvx7373u1avL730UqOUV4gQ2UZInEO0OEDknnjiCbnzzjtNusICmvlcrI2RurjvVLTuyDYcQc7Pz28UxiAVSE8yhiER6b6XSXzxxRfGaLHEiyVo69evl8WLFxthvuWWW2TNmjXRN0OEaDkIiXOIFgfUwu+//75ZHvsJIddIh0899ZRZRgOITa4IDvHURQiRAnnHn+5sg/TA0KSDXKYLUF9MS6AJSZSQSTOEG3V3rtMVIkS2ERLnEC0OLPtBWk6m7kTq+vDDD3O+LAiVMB7AUhGSlStXWtpzxTAAjKwWLlxYp1q7TZs2JvnnCpQTGg9sBZLVFfP0LD/LdV2GCJFthMQ5RIsDxAapKhmB4znSVrI1vdkChHmvvfZKSXhR2/rVtLmQCCmrefPmmRV0EEgvhmz9+/eP3skNyDtTERjxJQPvkO5clFOIELlESJxDtDhASDiSgYEcNanbeCJXA3thYWFKgzCA686SkhK7Jl25kqDZ4CKZVEw6SBdHrtIDkIbxP049JUNxcbHsueeeds5VPYYIkQuExDlEiwPEbdSoUSktixcsWGDqUFTfuSI4pGf06NHSpUuX6J3aIB0jR46UIUOGxH5nm+AQPoRt//33t+VSQYBoI/EnS3e2UFpaarYDaDqSgd28sIKnrHLJOIQIkW2ExDlEiwMSKsSEOdJkYEtEPF4lU+VmCn7iCpGDOI8dOzZQSoWpIN3+tcTZJjiOqLGGmXXYQfF16NBBDj/8cCOEuQTqffyQp8KwYcNk7733jv4KEaLlICTOIVokhg4dmlK1jfET86x45Mol2B7ym9/8phFpmAf2cIaZQK185JFHyumnn26SbK7gmAcIHNtC9u7d2yR80kU6SO+5554r48ePz+kaZ9KFq1OOZKDc0DQkk/izCVdufuYrRIhMouD/KaLXIUJkBG7Aakw1I6rQDz74wKyQgwZQ7iEJsldx165d7V420psYJhIzUirSMwZWbMF44IEHyplnnmlEe8yYMUYYc112MAoQOuZv+/XrZ2mDIF922WVy6aWXWjpzmSY0Gi+++KK8/PLLST2moWn4yle+Ioceemj0Tu5AWfjbVWLZNIU+EKJ5I9zPOURGQDNqSgMRauvf/e538o9//CPpEiGka5xYnHTSSdE7uQeeuZBIOZpK+VGXWLJjAAajAHKVNteOiP8Pf/iD3HzzzUnrj7n5O+64QyZMmBC9EyJEy0Go1g6RMTg+rynwe8zbDh8+3OZLk4H1xFgDp+uAIxtAJYv6GILUFMoNkBa0Co4w5wqOMAPWL7PGOdladTQQSPfMkzcFNJW6C9FyEBLnEBkBgxM+kFmniyU0+wOjWm6sQQtJFMkKC2M34CcCAjBlypQm48AiWTpzgaB6cunxpyub9emPB8YAtXWyMqF+MZ7DUruxQFlgs4DjGOwXaPOhM5QQmUJInENkBPiwRo188cUXy/nnny9XXXWVPPPMM6a2bQwgWQ0YMED69OmTlKDAPDAnnWod7e6CZEQw8X6y9zINVOrdunVLKr2zXnzcuHG1LMizzQgSvosDbQsOUn7zm9/IhRdeKBdccIHZDNDms70CIMTugdAgLMQugcFq2rRp8u1vf1sef/xxkyCwsGXgwkUmVsjOyCmXIF2oi1Fbf/TRR0kHboyNTjzxRCPiuSI8IeoGzBVEbuLEiSaR+kFbOuSQQ+SKK64wi3zqjfrNdv0RvouLrT3Z6ezRRx+1Xc5WrFghs2bNkrffftueY/CXS6v7EC0PoeQcYpeAsQ57JUMA/YY7DFBLliyRxx57LKX7xWyBQRS1KPPOqfYgxvCIgTbZ3GaIxgEE+IADDpBvfetbRoiZomCOGWvyE044Qa6++mqzes8VYfYD1TX+vmEc/G2eNkRbv+2224xJJV0hQjQUIXEOsUtAJZxImB0YnJh/Zh461yBu1sGyfjeVZyvmnT/55JNGU7+HSI7OnTvbMq5bb71V/vWvf8nf/vY3u8bCHm0HTFeuCTOgraMZou0EAQKdbAlfiBDpIiTOIRoMBh/mbYMIs0Ndz7MFBmyOgQMH2txkkEcuwNwhLiJRSza1wZT0NJU0ubTkMj3UH3PKuGI99thj5bTTTpOjjjpKBg8eHNOG8E6u0uTyT5tmOiSZtoX7PM9lWYVoeQiJc4gGgYHHDZ59+/a160RwD8MdlrvkeqBy8bETFM41khFnwJIdNsLIRRpdHJw5mFdFal+/fr2p2P3GREFlmmm49EBwkASZ38WnNZb3EJlclEldoO44UHVTJonlkotyAi4eHLbQppN5TMOYDc9qqdpciBB1ITQIC9EguIEK1TFSDKphHH+4wZznEO5zzjlHTj31VJv/dfdzARcPAySS+wsvvJBUgkfKwW0lnqZcOrMFf/4xnHv++eflkUceMStfpgfwJ42VMmXHu9kuL8KnXN577z1LBwZOGDVh3ERZkBbq2KUl2+lp6nBlADPDtqMwM34GhnXruGBlxYLfkjxEiPoiJM4hdgkMVLh7ZFBC8uI316iTcUmJ+0e3D3BjDOwuToggEnIyMJAef/zx5rQkF+lEUr799tvlz3/+s7zxxhu23vqzzz4zl6PM4++3335Wjgz82UwPav1XX31VfvnLXxqDQBowkINRWLRokRnUoRlx6ch2epoDYPhw+YpWBi0Dv5GmMVBD9X7NNddY+w8l5xC7gtB9Z4iMAMKM1IfXLVSi+GJGtccA1piDFM0bdTGSzHPPPRe9uzOY18TY6LDDDssJ8Xnttdfku9/9rkmoiV2QMoNww9wgtWYLxIvxEkZXr7/++k6e0lDPYhXN+vVUFu+7Cygv1za4RuNAe1+3bp0RaZZ1oe7GkG13Z2BC7DpC1i5ERsBAjtMPNnHAaGfEiBFmJd3Y0gODJGljv2LOycAAy9Iv1JXZBgM71rzJjNCQnLEGzra3KcoGbQLr1INcmMJw8cxvlRyU3myjMeIMgp/gunaFhEzbYgMVGLxUHulChKgPQuIcosUDQyIGTozTkgHpOpEQZQsYWjE/n4oRwC1ktj1NkQ4kvlTxoAVxy8wgktkkPH4izHVTIcohQjQGQuIcosUDgsIOVG7uOwioKPEmlmjgkw2gTUDtn0ySh5lAPZptVTLpwOALNWwQeI7vaubhs02YAeFTD0uXLjVGCZewTJU0FavxECFyiZA4h9gtwHwgXqaSLX9BrYsbRohBtgERwqUpGzcEqf2xHD/88MOTpjVTgOBh7HXccccFupqEKLMdI4ZpuQCM0b333itf/epX5dxzzzVLf+a8MVgLN5QIsbshtNYOkRPUJXllWzLDsApPZbhcTLZ5P/EfdNBBMnr06KymBWAdjsSKQRHpIX0Ygu2zzz7msxmimG3fzOSReLHI3rhxo6m4uYc/dIj2RRddZBuZkK5slYerd+K+66675PrrrzeJGRsA5sMxmMOCHccjaD/86chWmkBjt9cQIUJr7RCNjlwMdKhGWevMBh2LFy+O3q0N1My/+MUv5NprrzXVcjZBnlHh4vwEAgQhYnkO0jT+o90ez7kAaWHbQ1TJGKqhTmd5HIwCacpWOly9c2ZKAT/a+KymrvygLrAo//3vf29q9ly0lyAkxttY6QixeyAkziGyCjeAYXSEdIQhFOpSpLNU1tOZBumA+Fx55ZW2W1ZQs4cgstXljTfeaCrlbA28Lm7C55oDtS1SLGpud99/zjZcmqgn0sABUcxW/Inh4viELRdhVBLBe+PHj7elbsOGDQucCsgWMNrDWJB2S7xoEfzORXJVPyF2P4RzziGyDpYMMbB+/etfl0suucRUpTfddJMNxEFLeLIFpC62hkwGBl8sujlnc8AlbBc+Z+LDG5eL1z/gu3O2QTwcpAPGxGkOshW/P1yXX85BaIzyACxpe/rpp21rStotx09+8hPzxe6mRlKlO0SIXYI2rBDNEDU1NdGrpgmXvlWrVkWUKEdatWoV0YGMUcwOlZoj5513XmT27Nn2XrZBesrLyyN33HFHRKWfWDr8R5cuXSK33357Vss2WdhNvT6zjalTp0YOP/zwWm3EHcooRM4//3xrS9lCYvlv2bIl8o9//CPSr1+/WmlSBioyatSoyIsvvhhRqTr6dogQmUcoOTdT+Dl2pE/Wo2LtigoumWWrez8XIH2k69NPPzXXmcyv+uNnPTFuK/Hale31vID0oLbGRSfWybhb5J4DKnYcqLCHsP9+ppEs7GzG2RyAARrbQLLEzF8WqPpxi4m/6mRLvjIBf5y0U6ZAHn744Z0cxSgRF2Uo5dlnnzVVd1MAaaI/0f/96+NJtztCND+E1trNGAwozONizfrggw/KSy+9ZNdY3mLI45bA8B4d1H/OBZivUwnDDLGCHG5AsFEPnnTSSTYHne10ET5lgvcyN6fs/IBDtJlvZolTtpcwhdgZME7UA9MKtAvqhbXeWM9jxHfCCSdYG8kFaKtsAvL4448HOqWhDzH3fMwxxzS6q07Shy/0//3vf8Yw0P/ZUIV0OT/xjZm+ELsAbWghmik2bdoU+fOf/xwZMmSIqY2VqER0kIt07949cvnll0fmz5/fqOpSleYjf/jDHyIlJSWw7oEHquR77rknotJ+9KvswJUDZ5XoIyr1RBYsWBD57LPPIvPmzYusW7cuVFM2Mqgb2sySJUsiX3zxRUSlV1NlqyQYfSP7IA2LFy+OHH300abCDmqzSuwiEyZMiMyaNatR+9e2bdsi//nPf0zNrsxMrP8rYY6cc845Vn6Nmb4Qu4ZQrd1MoXVnTjOQmJXImLSBOhuVFsty4KT/+c9/2sYGjQWkIST4VJIoqjgdYGwHJPKULTjpgTOGV0gVqEvHjRtnzklIp3/5VDbT0hTQFPNH3TC9wDKuvffe21yu4jwm25oMysKVB/0HTc/HH3+805IuB9JJ++HIFRLrC43TK6+8YuvCp0+fbi5WXf/HkI2NVd56662cTBmFyA5C4tyM4O+gDBwQNIhv0EDLHDRqOdTKjdVBGcRQIePxKhXYpvDll19ulHQ6op2IZPezBeqTARcmi+ugOs00XBzEx8COihQ7gVzE3dRAfZNv1p3jpcz5Ew8CTCfMQy6mYoJAOlnpcPfddweu2ec5tidTp05NmY8QTRvhnHMzAR3ODSCcGUQhaswzQ4iDgHEIc9LsmsP2jbkeSIiPOUQYiE8++SSpJAJh4MAgC1/PjTHgNRYoE3xJIwVRl++9954NvEj3zGtiEJWt8qAtMT+JlEXc77zzju2GxX12V0Jide2tJcPlD8bogQceMEMw2mMywHD+4Ac/MK9luSwb4qI+ILi33XabMd/JiC/vohFiXty/LjtEM4JWdohmCOZNtXNG+vTpg5iT9GC+9+qrr44okW6U+SfinDRpks2LB6XPHcyTMX/OnOPuAspGCXPkrLPOsuVd1BUHy8yUUYk8//zzWZuLJ27mVq+44oqIMlBms0Dcbdq0iQwdOjSiBMqWnu0uoDymTJkSOeSQQwLbpzuUWYpcd911Nt/bGCCdEydOjAwaNChw2Zk7mHu+6qqrIhs3box+GaK5IVRrN1PAGbN/MirjVNw7qlIkAeagneOEXAOXlGeffXbKDRSQ8PF7vX79+uidlg3te6ZGRlJjjpN5QuqHw1ng3n///SbZZgPEw4YSzzzzjC0JQmrkHloYVLs4jcGWgXTuDiDfaC/QHCQD/WzkyJFy3nnnZX3HsCBQF7g5xcUse48nqxvSicod1XsuvfCFyCxC4txMQQfEcIbdi+rqgBA85tFUMsipRy5AOlUikzPOOCOlGlAlAhsYWUPKNWjJhIFyYMkb3qYgjIlArUp9ofLOBlCHMi1CGhJBuWNsyLE7EGfySHl88cUXKedoUQ/DZLJRCNMOuQRppK7ox++++27Kfkzbwj/72LFjbX48RPNESJybMbAwZkOAww47rM7BAkmMjo1TBT9yMfgyWDjLaOZQg0A6MG5hHg1jFpeuXKSvMUC+IMrkNRnDwnPsBrIBwkZbkWyQhzkg7lwzc5RLruuc8kdyRoPgGMNE8A7W46zJz7b1eBDQaiDZs/66LsNJ3NReeOGFtrtaiOaLkDg3Y7D0hwHj+9//vjlsSAVUpWwukKiqTEYYMgUXFwZGxx57rBmmJQNSCx7DJk2aZL9JW7bT15hAzY80lowYoRHBKCwbIGwcVfiXj/mBxIUxX7LnmQD5hgmAMKLd4QxxzHWdkw6YRvKcLG60PzDBbLzRGICRYhqiLk0KjAPe1NgTu7GsyUNkBiFxbuZg8DzqqKNsU4lU6y4ZgJCacUuYTDrIJhg02FnokEMOSTngM8fK2m2YiZYO6ovyCJqWgFCwZWNdTFdDgftSvKEFbQlJ/WDpm01rZIgyc9t///vfbacw9o7+7ne/a5Ih6ttkDEs2QB4pDzZFCZKKeY6aGMvnVHYT2YLruyyNSiU1oz1Dlf29732v0T2Xhdh1hEupWgAYUFBlMUfIfrzJiC+dl2VVhx56aFYlIj8YIBhc3ADIoIwEn4z48i7GUUcccYQNli11gCFf1AG+pMmvUzFDlCHa5P9rX/uaTQVko64IE6mcelizZo21GdoRce+77762fePBBx+ctTlL1uj/7ne/kzvuuMMcfsybN08+//xzcz+JCpd859KYCcmZMqEPrV69OqbO5x6OUL7xjW/Il7/85ZymyQ/K54knnpB169ZF79QG7al///5yzTXXGBORjTYTIrcIiXMLASpIBlJUwkFGPgDVHB3XL706wplNuPCJE44ewxsGwWRAvcl6Z/wqQzBaMoGmPFjfjZSMdS2ME0SAbTXZhCOVqnVXQJgQZyQtDuInHRjuXX755abChZnKBpjvvu+++8wGwm+dT1tknpupFwwdWY2QK8C4svJh6NChZokNk4LB5X777WeSPXUSpGXIBYhz5cqVtoEMjFQQkOjPPfdc06AxFoRoAdAOEaKFYO3atZFrr73W1slStYmHDj62flWlgugX3rrJXEIl58iTTz5p/r+D0ugOJVSRTz75JOfpayxQJyrF2kEZ5TLf+BRXadXWmOci7hUrViTdHpJDGRLzGZ1rX+fkmziVubX15yrdR5QYWtk0NvD/ftJJJwX6+6YclamLvPvuu6F/+BaEcM65hUDr0jh7dvBhHSYGWEhdSKtIn0hoSM1IAn7uP9eSAOpDZ1iTysIcy23U30jRuwMoCyQ2DsooV/VCu6GN0FZQ2WYrbuJxZ7Qm1K+7lwglkqZaVkITvZMbkG/KAo0CW1giuaPBof8kS2uugO3BmWeeabYAaMBIJ3XlbAd+/OMfm+aD+yFaBkK1dgsBAwsH1r+oKTHmYa6MbfjotF/5ylds2RX3IQS8y4CTjYG4LjC4sOEFLj2D1vgCBmbmp5kjJx+Nkc5cozHqI1fxuXiYy0WdjbtQN6+bCAjMqaeeamr9xiQ2/vpo7PYHIaYv4zoUxptrpkEop6uvvtpsFOhXjZ3OEJlDnjbAxmUJQ2QFWHWyhpY5PJZUMCcV5NUo1wTBxcfcOEvAcMKBpBQE5s5++tOf2nsMPCBX6c11uewuoE2yzIf502RDDxL8PffcI+ecc05YBwmAoXH9GsYFZjxX+1yHyC1CtXYLBWpKOGxUc6i7k7kbzPXg5+JjacqJJ56YcmDBKQSDuN9oKJfpZSBMRkBCNAxYHbPFYapyRYWLA42QMO8MCDJMKysZsPQPCXPLRUicQzQKmCvDKQm+ilMNwljuYt2dTLrOJCAYMAJ4YrrxxhvlZz/7mdxwww3mGIX7PHdEJSTa9QPlBbPDUj8/sxUErKSZ6w2RHPSZkHlp2QiJc4hGAfPeSM8Yh6WaV2TpyF133WXnbBNE5sFvv/12W47C5gI33XST/OpXv7I1v3/729/MSMk/IIYEOn1QbniAY1tK1LLJgEobF5nZ8owWIkRzQUicWzjqIiCNSWBQyWHIgvo9GTAKQ5J9/fXXs2q9i1THRhDsErVs2TKLF2md+3hn+u9//ysfffSR/Qah5FJ/IDGj0k6lBcG9KxoVLKRD1I2QQWy5CIlzC0ciAfF3Zq7xxsSgyVwgkiNEyT3LNpCYcbpx9NFHp5Se8Z7F1obJHDBkAhB+tuODECfmnd+UESpZ3stF2bQ0UGZ4BcNlZyqg0mYZU6pldiHiCBnElouwB+xmcJ0ZIoy7xF/+8pdmFYsHJHayueWWWwIJVDZAWphbRI3MoJwKH374oe337JiHTAMmZe3atUnDhyhDoLGCDwfE+gONA+ubYQCTgeVCLJ9KtTlKiBC7C0LivJsCSRljp3//+9/yxhtvmNEVa09///vfy69//eta+ypnExA61jIfd9xxKVWZEMa6HP/vCliqhfvGZFbtpA2i4ZZ0hagfcCaDcR9MUDKw3A87hJD5CREiJM5NFtmUXCG6GOYwj+s3znHqW+ZXMYxiQ4ZcSNCs1cSnMw5SkgGJlrRla7cqiC9OHXDuEEQccISy1157pVS/h4gjsd3g7x3JORVzxbI/vF2FaHzkot+HSI2QOOcQ6TR43nHvQUTTlV7r05lQ0TL3x1xuEJBynnrqKXnxxRezJqn6wfyi2y0rmfTMO0itqD6zAcJn8wdU7Ehvzo0m68XZDAG3qKQxJM7pAQbH346Zz0+1JI7yZ1cltBchsg/qJt2xJUTjIPQQliNQzG7A8ktmzMVBLHG4wXzckiVLzKUl7+EFCOKIExHAAIYEh5MGHBGwVhhiERRuKqBa/OEPfyi33nprzPo4EYQ7YcIEU31DlFzY9YmnPiBNjzzyiFx33XVmLU08fjA3zfw4W/clUz1nAqQDQoLlNtvzsaSH7QtxihGqtBsG2vcf//hHuf7665NqPmjL7EOMj+hs7KqU2G6z1Y4bC0H542D8gAlH67R06dKYu1zqgYOydmMITk048MNPWw8t5hsXIXFuJDBgrVq1yuZ2p0yZIpMnTzZrYAiTI84QTs5IcK7j0Xkg0GxgAdFA2kPiYH1ouoMNHDOb3LOWFwYgGZgDZOtC5qAhjtkczMjn8uXLzfkHy5mcSp04Icasff3Nb35jquVspgO4sqeOKHs3eIVoGJg6ueqqq2y6JBlo0xDw888/PytEgTqlPoGrz5Zap7RdjBsZWxhXWAII0w9xhvmkLFwbd5ooGH9sKrCUd+MKDCnTPDBOYfvPPULinGMwQCCRvffee+Z56tNPP7VOg4OGZFJsECDGdCYc4R9//PFywgknxHasSacjscE9kgodN1kTIBzigIhfdtll1kmzCfIPg/Lss8/apvswDjAIo0aNktNOO83mI0NuvnmBtsVexOyoRJsLAu2MOsbOgT28+Z0pYgAjCqOHMSEGadgudO/e3TaHgamFULcEUM7klbGFlQ2MLWwsw+5f9KP6ji1o62CE2cnu5JNPtrEl2/0/RAIgziEyD+0o0as42Kv3hRdeiHzpS1+KdOnSJaJca9I9bdM9lOONqGQZ0cEm8te//tX2n3VITAO/3T2VZiK///3vI506dQoM1x2kb/jw4ZEXX3wxJ3vFkr6KioqIDii2P3VpaantpxtUni0Frl5aah6V0YoMGjQosH1x0MZOOeWUiDJm0S8yA8qTvaO//vWvR3r16hVR4mJ7nbdv3z5y6qmnRiZOnGj7V7cE0Edef/31yNlnnx3p1q1bxsYWZfYjKkFH/vjHP0aWLVvWovthU0O4ZWSWkMj54/rx8ccfl9/97ne2ExNGV9rQo08bDq3DmIqcnZ5QIeIUn3mjRKnApYkzEiiqalRfSKup0oKlLelnDSrevPg+MX+ZAuGSbgyx4NTRBLR0tTJ5ox6puxkzZtg0B1IP5Y66EU9qnJsTyI8DbefRRx81CTYI1O9ZZ51lUxeZ0owQP1Lygw8+KH/5y19iDnboK8zD4hAFaRL3sWhnmivIJ3l7+umnbRkkyyLRwmVqbKGMUJFjg8HcNfYujBstRePQpKEVECKLgNNcunRp5Kc//Wmkb9++EW3UO3GomTyQCk488cTIm2++aZJ6KpSXl0deffXVyIEHHlgnl42Efd1115k0m23uOdvhN0UocxW58cYbrS569+4d6d69e2TYsGGRiy++OPLxxx/nRGuRKbj6c+fPP//c8hLUrjhos4899ljG8ki8HCtXrjRJMlnbVmYzMnPmzOhXzQ9KOE2a/fWvfx0ZMGCASctB+czEQRkqkxg57rjjbMxg7Ngd+2kuERLnLILGqxx65Pvf/36ka9eu9VYzQcg56vudSh+Ro446KqJctKm7XFqCAAG/6667TBUWFJY7SMOIESMi9957r3XMEJkDg+wjjzwSGTx4cK265hq1okqVkeXLl0ffbn6A8TjiiCNqtSd30L6PP/54I5KOqO4K3PecCTNZvBxM16Byb44gfxDma6+9ts6+G3TQthpCzPnmsMMOs+m5cBzILkK1doagZWlnbfR25jeW16jU7rzzTlMJuXeCgNoSZxxYSCphNYOVww8/3Nb+YozBfYw0WP7gLC6TQTuuWT6julOJJaWvYu1sZpGJUdqsWbOSuq8ELMdAfU6asK51IC0u35lEtsJtCLKZFsr8jjvuMJVkouEOv3Gnyt7XGDA1lfKoD5iiwC860y60XQfyguOZ3/72t3LggQdaG93V/Pm/R33Npik4PwkCLmOxDsdArDmBtshUwT/+8Q9rN/TLVHBTI6zfP/LII80am/JGpa8Mio0trC93Y0tiG/SDsYX2iJ8E1v9ThqGKO0vQig6RATiO3QFpAVU2XK0OGDHO039wH2MubeRmtPKf//wnMmPGDDOCwiBq27ZtkbKyMjPe4t6SJUuMY/3FL34R0U5mRmXa8ZKGjwSNVKKDYp0qw+nTp5uRTF1qdyS5q6++OrJx48ZdlnKaA8gjB4ZDaCGQFijLTOadskQ6pi6Dypw28uijj5qE3RxBWTG1c9NNN5lGZ9SoUZExY8ZYnh966CFr45mCqxfO9CH6IG02sUxp52eccYalKxdIbC/1bT/+9zdv3hz5+c9/HunRo8dO+fIfbmy58sorI3fffXdk6tSp1tYYTzgod8qIawznXnvttchvfvObyPjx421sSTYWMN4wthx99NGRd955p955CZEeQuKcBaAqVmnZ5piTEU4avnKdkW984xvWKeg06cy50REgEtOmTYv84Q9/sHkzOmFQHBwMTBdddFFkwYIFSQd3woToPPjgg6bqS5ZmdzAo/OlPf4ooxx4NoeWCOlm8eHHk6aefjvzrX/+K3HbbbZEnnngiopKDWZX70dBBCibssssuSzoYtm3bNvLSSy81+0GQfGKR/eGHH0YmT55sBIEyzFa+CJd4TjrpJGuz9BMO5k4PPvjgyAMPPJBRxiAIpIHxYMOGDdbH6bsO9ck373JQhkyBMHYEtRUO+i9jz+WXX26rLDZt2pTW2ML4QPpmz54dufnmm62MsHAPioMDFfd5551nddpcGcemjFCtnSFoWZpKTTuBqSexyk5mBc17qJvxhqQdyHw6Y5mM+smFk3j2A1U0FpM4CuDAuxgbWQSpo7iHehvg6UsHp1rhufCVMJhqC0tPLDNRCSYDluY4NWBtKipxvm2JoO6wnkbtivrw5ZdftrrFJzlqvUGDBpl6n3oDyeqrLvA9UyDsuqVMUvRuHCNHjjTPaNR5cwaW2HikYjUBznSYxqHtNLTc6gLhsbqAds+aXdS6OO855ZRT5Gtf+5qpeOl3mY4XkB/UxKjycarDlqf4s6eemZ7q0KFDrN2kA1dGtD+Vmm1s4XcQGFv+7//+z9oM44PLowvDf/aD39QH6aPNMS6xRpqxhXEtEfQPpsNYZYCavDlbvTdJaCWF2EXA0TpgIco65mQqSu0AkSFDhpg6D5WSH4TjDysdwLFi+HLmmWcGqu/cgUSMlWUqDpq4MWBLlX53FBcXm0SOqr2+aW4uQNq55pprLK+J+Uea5RnW65kAdUi5+yUVJGnaCgZ7LcX4pjHaCnEyLeHUuUjr2Zb0iOPJJ5+MKDNg0jpSJkfnzp1NnY6Kub5pWLduXeTSSy9Nqdnq37+/GW0iYdcXlJO/fhgr5s6dGzn33HNTaueUQY08++yzaUnnIdJHKDlnAI4TRUrFAAVDDbjmRMCVwtXihpL9k/HE4wfhcNQHvI9EBZeLoQYcNelIBBIxkgprlZNxuITFOxigwfFjdEK+gkAcGKIgkcBl10cKaA4g32gHqEvOicCIizxjvIcXNVDfuvODdenUDZI4a0kxlMIITBkAOf30082oKpPQQdjqkHy4dO9K+tNFLuJIBHFSV5Qhh5PWMwnaiz9M2syf//xnefvtt00LRXlzoBnBUxn9DG9oylBHv0gN6umtt94yf/gbN26M3o2D/KEZwP88Rm5oyOoL0u/PA2GiecCADC9vaOCCNGrcYyw7+OCDbWzJdNnurmhZI2ojA0tm3OahCgoCauMf/OAHcuqpp2bcDSUdE3ecqPCCgBXmm2++KdOmTUtKcAEDF6o/dmdC/Ziqo+GcALUvg05LBAwNTFay8uI5R+Kg1hBQ7jBF3/3ud+Wvf/2r/POf/zSf5mw+kum2QlvAnSVOce677z5TubLZR9DAGyI9+OvfMXb0jSB1MPemT5+edFe4IOCWk3qCSAYBBh019pe+9KWMtxemrhi3sO5mSi0R5Ad3xDjOaaljQWMgJM4ZAo0Sb1s00CDJFU4WSYgjk3MzjnDQafbdd1+59NJLay1zcuA9/OySvqABww8IBfsrn3vuucbhJwN5Zr67pXZIpAEkm2SEl7k86jUVs5MuCIN4CA9pBenZzclmEhCEe++91xi5H/3oR/Kzn/3MrpmjZItQp/HJRJ52JySWFwx6kPbMAaYOJikdEDZSK303yCYBbQC+9SHMzGVnGrRB7EsuuugiY9gTQfoYW/DTjz2Ku+c/h6g/QuKcIUDwcLuIwUdQg2Q9IMSuLmm0vvCHBTFhg4gjjjgieqc2GBDoQJzrAgY77EiFSitVetlSsaWptAF5RhphY5EgIJ2wRpRy2lUkG8AyPbARHtMVzGS9++671laRyDDqgTCzUxn3QCbb6O6AxPKCSKZSLTvGLh3A/OKDIGh6BWDAdeGFF5qEm416o90wtsAAsBFGUH+HEWFjE1yJApeOsB01HCFxzhCQINmeLYjw0ZjHjx9v6uJ0JSE6hDvSBR2BjsqcE3OYiaCTo85EhZkOcDJwySWXmLo1sZPxm3lRiHempbumAiRYrOmPPvposzJGikZKQaKFAaKcIeC7OgDxfVD5ctSn/usCUhfWvjgESdR2oO1BDUvbqG+7SwXCIexM5qOpg3rDkj/ZnDIOQZifTWffasqNeoPwYRUdBKzO6zO2gPrUh2uH9Ad8oAetGuA5KxiSOXwJUX+EBmEZAtIH6sIg7pbB/IorrrD54HSkTAYziD1zumwWwFwgams6n+sonIPAfbhcNtcgTYlAwsfwCAOyVGkhHOLEgA01OWnBKAWJEakAwo0KHfV3tpajNDYoHzQdDHycGXCpQzZoYH9irjNtqJWITJYrBoN33323Tb8kA96iWBZDW0vVzuoCTCqGT8ytsjSP9ky7ZkonG8wcYdM+3bw5ddeYbZJ8QnzpN5QF7YR+ggaNPsP8MIaEdaWR5zBTd911lxG/REDoGVvw2pfu2MLUBhIuB6p1N7YA4guqd/ebsYX5Zbc80w8YPqbWOOrKV4i6Ee7nnCFgpU2HCyLODO4Y3mDZDFI1XIgn+7E+8cQTNrjxG2kYq2CsdrlOBaqTQeqGG26QP/3pT7E5IAc6MNIgRkcMFukAldXMmTNtvSNGb3DQDDIQeCeht+TOSJlSBm6+z81FpzMYNiUg1bC+l8E1CAzSMFwYo/mNiupbtxDI//3vf7YjFHORECemPyD8V155pWkdMlV21I2TLDF2hPAw1QCBYNohlc1AtgHhow/TdyDSlC/9hnIgjemWAfX11a9+1Vzy+odr8oWbX8qZvPKb58nyy7jAtBb7pUPoqScYCCRvGAa36gAkC4eyvvnmm23tf+KcOW2G9sMKB8e0pkpPiDqghRciA8CDFDsJUaSJh3Ysc79ZF5QQR959992IDiy2tlY7rx3K1dp+tNroIzrQRd9OvWaUdYfdkjjE/8pXvmLrPdMF8XCQPu3gdk4Vd0uBP4/NPb+kHzeueJQLahMctDNlMGt5saoviOeTTz6xTVJouzowW9icdfC2HdPwBZCJ8iQMvG7hKY/14K1atbK1/sp02u5eDz/8cKOvDyeNKq1av+Hguj55511l/AP7MuV7/vnnx7ycpQqXZ59++qltWkE9+McW1l7jtpOyTAcvv/yyufcMSg8ew5SRjb4ZYlfQvFj/Jgwty6QcIioj94z3kgELTyRmJAC4Wu1QdqCKYs3xY489ZtIPYaSKD2hHSfk8VTr8cPFwkA+/er0lo67ybW5AA4O9AZJsMqAiHTNmjNVxuu3Dwb2PNPX8889bO6XtuvuckdzwgvbFF1/UO/wgEAZrf2+88UaTBJHqiB9tEar0ZNNM2UCy/NCG6IuUKYfrS/VFsvAJm6Ou8qRMXn31VSt76sE/tjB1Rp0FqaqDkKz/c490NCR/IXZGSJwzABo5hJUBMBE0ZFRHnEGqhotKzqmyE0EcOBjBmpbrVOHQQbAEDTJGARiWuLm5urC7drTEfLeEckA1H9S2HFBFYvHrGLu6Bnw/XPnQrmijDPpBgICmcm5THxCX30LYD+Jn9QRWzpmIKxVc+Jzriqu+7YjwIJ5B5Uk9Yf9BmHWFy/hEWVD+iSAO5rVZQ11X+gFjC1M7iWBcggkIiiNE/RES5wyBgSJZw/YTyVSNn2epBk8aP1xvKhAGHdVx60EgjlTxhGh5cO0uVfuj3fifJ/5OBzChqWwZCDNdW4e6ABHABiIZmOvGKJJ+k004wujOmQTl77RoiaCPp2sb4Pp8UH3yHcSf5+mUlV8L4Ae/SWsyxixE/RAS5wyAToKhVhAxpKG6pSt0DBpwsgEPbpRwgjoZ95DAWcZAfMngvkVKYnAKAuFkaoAM0Tzg2kVQ23JIbJeuvdYHSN+oxlGRBwFDKCed7yqQ4IKWDDqQFoycMhFXXUinfBsCmB32m/YTYQeIKa480yGorBhh1UXQGEU9U18YejoNXyqgeeMIGscw/AvHlswgJM4ZRLKOSefhqKsDQzSdr2b/gML7dB4cAOCmM50BIBX3ms73IeqHZAxXUwFSJlJkKpWjk4gcGtJOICInn3yyHH/88UY4+U2YEEq8np133nnmiz0TbZCwCSuIEaD/sD6f5W/Elcn6QXuF6p557RdeeMFU68x5o9JNh1DWF6nKymnAXP6S5ZMywtcCSwITCTBCAdbtAwYMiN5JDsJ341kiSKc7Mo2m3r+ygd2KOFPB2arkVNw560uZN6oLDGAsl8KlIssb6CwsvcB1HktgOIIcACQCwoxxR7KBOFsdaHcCgxPGR8zlMVg39cGDtoAxWOLyFwfaA77fOXYVSHostfnFL35hXuZwWcsyQ5b34So0Xc9YdYE+h9cqlu9A+GECIDxMI7G0CHeTnEEm2jt1TF2zZeh3vvMdc0JDvljmxBIxDDaTaat2Bcn6K+lhbGEDGvc8WT4pF3xj47IVf+04EGJsgbnB0RA+3YPc/iaCsQW7mKB2RHqyqaVo6n0s09jt1jmTXRqwO2cKcM90VKwhXfgONHqcP+C8Ip044cCxdoU7ZzCAICMx16XSdkDVRVqeeuqpnSRoBkZ2rvnhD39ozECmy6GlwpUTRBlGC09bWD9jjIQ6ECKAZAKRyOYA1VAwtcIOV6w/Tibd4QmNdgpTuKvtgu9hCGBecEDCdA3SG9JuJtsb8WDIRH3g3Yz40DyxjzFeuKibTMXHfOprr71mG5IgNfv7FsQPb3n4FkD7lcl+xTrpCy64wAzcCNcPxgTqDG0FaagrXqa7IK6MLRBYtHW0XRiqdL6HEfjWt74ljzzyyE5pwfEKPtrZb5o+QDiZKgcXTqbCaxbQzIbIAJYsWRI57rjjaK07HdroIypFpFw/qgNmrXWKXFdVVdmhg0D0bt3gO9aZ9unTJzAtOkhGnnvuuVpxhUgPlBlrQX/2s5/Z2lBlbmyPXiU4Vq4/+MEPbM/dpgRXz0qcbU0sbTGoXeiAF1HibPt5O+xqG3HfZ7utEb4ysbamWRlb62f0m0xj3rx5ESWCSfdTVsbX1lxnGsoAJt1jnbR8//vft7XF6ZYz7zGmuLGlPvXEWvmBAwfulA4O+gBry0NkBi1Wra15i1554Lc2PpNEOSc+31XAgeIJjPmbRM4ODpv1mG7tZxD4hoN0ubTByXIESWLJ0g9n/PTTT5uklAjCwTsRnr1C1B/Uj1s/i3YCSYo5P9oUEgXlzrac3HP1mKyecgXXFml3qdo99xPbbeLv+sJ9v6vh1AXCR6WNOpv+h0Yo09oLNCQPPPCArdNOVob0c5aJJevjDQUaB7dXciJIC3tGp+svH1BelA9ji6uboPr3g+do9JhjJ49BwNWv2ygmWRmlC//3XNPH6FeZLtumjBZLnGloVCoHajUGVRx80MEYRNmdBwJGh8oEGBRQa6EeCmqYOBZJtdezg7+DuHCCwgOJ92m85OvJJ5+0xpwIBi38QZPGVB2xsZAsn00FtBXWikKIg8A8/0MPPWTr1V35NmY5+8sTVTzzk8nKGOKGCjjZ2vjmhkyWO/2KXbxQ5VK3yUCcQcZpuwqIKGp6v3tNPyDMjGlB672D4NoA53TLibaPWp14gmxZGFtg+p3NQibKnzhRv+MamekYxm4cqeBYxjHALRktljgDGgidiTkZNipgzu3aa6814wd+/+EPfzDH/Jkg0AxudCD8Zwdx7TAIbG5PAw/i/vwNjXS7w/1OhP854Hu3sQE+sIPA/BSbGjTFAbg+A0VjgQGBekzGvdOO2NnJ+UBu7PwQv2tXLH2BqfC3Mz+YC2Yzk0zuNd5SwJw2/QoimEpywzqd+Vv6f7JybggID6kU4y0IdSKQaGEcPvjgA2ujdcG1S/85sa0mph9BBsaT8TLxGd9iU8DmG5naT5pyZoMW9mX69re/bXPZP/7xj22++7rrroulI5Pl3NTQookzgyUSM478OcOF4YCe86effiq33367WS++/PLL1sB3paJpoBjSsIQELjIRNDYMiEiL25bPj8TOkS5cODAhcJeonYIsKWEekJrT3RkrE3Cdh3pAY8AgB4GA83bpdueG5j+XoA7RSLg0B4HlShgFNgWQTleuXKdKN+/RboMG/90VlBfW1/fff7+pjoO0UQ70KZZuMW0EMt2eWQLF2MI64kSQTsaUO+64w4zHXD27One/6wPS776DsUOwwMCUabNE8C4bcKB6h8nLBBgv7rvvPnn44YdN2ECVzsGSNdLy3//+17RB/nS2NLRY4kyFQaTeeeednXZzAfym47EsAstmiCaSp+M8G1LhqLZZ2uF2n0oERAm1EEul6ETpcLnpAGmOjnnLLbcknQ9CamaZViaWytQHEGTmaFnWcs4558i5554rP/nJT2znLb96rDl0MCzdscZONQAxeNHmUg3kuYKfQKRTvv6BrjnUR7YBU4k6++9//7v1sWSg3HCuwlJHVlVkA7Q9xhaIoL9eHbB/QMj46U9/akIAYwvvuaOhIN/33HOP/PGPfwwcRwHallNOOcWcy+xKXH4wjjFGwBgkgnEDLUFT0VBlCy2WOFNhVCLzMKnU1khDEGW2QWNdJsTazQs3ZICCe2ZtZ7L5IToR0u2vfvUra3y7IrHTAZHUbrvtNtsCksYaBKRm1jiy1CdTa0zTAWUP08CA8cwzz9jWd5Tvv/71LyPQzCU5Kbo5dDDSiFOLVPOK5MVtEdiU4IzXksGVP+eGtke+a+i3TREQCKS3IONKP+hfxx13nC1Fg0HPBqgXNHNf/vKXTX0e1F8QRljqxdiC4VoyL17pgDGTsYV9pFkelsxeAUb1kEMOkWOPPTZj02XEw7gYRJgBzxGskj1vMdCMtliUlpZGfvzjH9uSF7Ja18FWc2PGjIkooY4sXry4XkuYHJTYR3RgjvzoRz+KtG/fPjAeDu3EkSOOOCKijd/ed3HxfSrwnEMbpm0vedlll0V69uwZGAeHdmLbPu+tt96y5Sa5AvlR7jYybty4wKUnLD9i6Rnb2NWV56aE2bNnR/bee++d8uM/2N5TGZEmla8777wz6RaiHN27d48okxfbYjFZ2hPv85uDJWaUjTKckblz59rvhvSfpgLSTp/Za6+9AsvLf7DF6zvvvJOT/rVy5crIz3/+85RjC0u6Dj30UBtbeN9fD3XVK2eWotF3r7jiCmvLQf2Xg/tsQUo58U0mMX369IgS/aTxMqaxrCtZfloCWjRxVmkh8tBDD6UclBIPKl4lo4hyqJE33nijwY1u2rRptnctRCgoHg7i2mOPPWx/5SeffNLWmKaKTyWfyPr1620d83XXXRcZNWqU7V8bFLY7+vfvH3nggQesLHIJBqrHH3880q9fv8B0cVDOrNGE0Wgu2Lx5sw1ayQYsDpWkbH9c1p42FbD+FuYzKL0ce+65Z+T111+vk6AmDob8/vjjj41JhGkZNGhQZOTIkZErr7wy8tlnn2VlvXG2QZ5ov/fff39KxpeDseXf//53TvsXPhVOOeUUa2dBaeLIz883hotx7JlnnjFhg7ElGTGj3mGoqDOVvE1IgcgHhc1B++/du7cxdNlgSlatWhW55JJLAsdP8n3RRRdFli1bZu+2VAJd8P8wh2uhwLgFK0JUMhhMpFLr+YEKkPedRx6MMVBX1cdYBtUTaii2eSR+bfzRJ7WBagYLX5YIoPZFNc09jCBQK+FyETUplouorJj/+vOf/2zzS+zIkyxc7TwWPxbqF154oRn7cC9XIF3Mfb300ktJ1U/aqS0PzFWhLk41l9tUQBvQwSCmkg8Cz3H+j5qTDQdyWe4OtFsH4qdtpZoLxybhjDPOEGXmUqbXPSN8Dtbu45KTaQvUwBjpoNLHKA7jP9b+s0SrOYE8Uk4sS6RfomINAmMCauYf/OAHVt/+cqNsUpVjQ0G4WETTtzFs5QgaA3iPdDN2MFbgZ4GlfswhM6YwLjG+8Jw6pG0w3cTYwt7OfvubRGD8xpjIqhdsSbJh4Y+KHN8RpM0ZfjF9QDljdIcFNxuskJZslHOTgFZiiwZc1fz58817kzboQC87yQ6tdJNszznnnIg2cFOT1wdITkjfEyZMSClBu4P4kG7gxuF6+/bta954uOYeqiwlDoHfJh7k9ZZbbjGPVZSBO3IFOPG3337bpPug9LmD+kB1qIxHTtXuuwI8RekAkVJ6Jt9oOHJZ5onwx12X5Dx8+HBTT9YnvUzHoPlIJmHhpQ6NUHME7VcZsMiwYcMC80Y/POyww0yNz7u5BlIw01po51JJ0O6grVJPePFiPEFdjVatR48eNrYoIUxrbCEcvv3jH/9o0m02QR7pQzfeeGNEGcDId77zHbumzJuSVipbaPHEGTDgKCdoczAQyrpUwYkHhJW5UxrGggULAgewZIMaDYz5qOOPP77e8TbkoPPQ6f7yl7/ECHNjwJU56s66Bg+en3feecZENVZ60wXpY1723HPPTZkvBrAnnngiptZ1+aorf4nP+c3gH3Q/Fdxzzgxk3/zmN1O2P5iNiRMnpk1oCFelrohKxoHhcaiEF/nb3/4W/aJh8OfDf842iAe1Ke030WYFIoYKH7V3Y03JkD5U6dg2oOKmblMxi5k4YKSZpvrTn/5k7mBzURfEQftlOo+jrKws+qTlo0WrtTV/pvLgQL3I7k6s89UKt/VyWunRN1OD91HZsbkFKhaWSgVZTCb+BqhBVQI27zlYgaNaUoIdfZpZoPYhfyzSR5XdWCpVQLyooFD9oVKl3JKB8kWNhroOL2uotJoqyBflzFTERx99lFRNTL3T3lDroq7nO9ojSLdOsEhlKRrTKy5ev+o/VTguPs6ol5WxNBVoMhx++OG2y1J9nEjgK4B1qMm8ZjGVwiYQrH9tKFweE8/ZBvGgrsXxB+pd2i91iqr1oIMOMocYp556aqM5bSF9pAf1Mm2MtoKqOtlUy66CtocamXyzGiWZxXimQRzEzTjC0RymvjIGKHRLRiJ3h2SgRDJy++23m1oKVZ82gJ24xGSHNpDI+PHjzdgJtU6iwUtifA68h9T9f//3f5ERI0aYiqk+8aY6tPGa+h3jD1TJuTb+SgUki9///vdm/BWUdndQFtRHri0wiau+8fE+RjZMHQTlhQNty6WXXmrWsvUFbQUV8+WXX24SGuphzvxGuk1sc3WBNPB9UDo5KHtl5iJKgKJf1A0lBqZJQjoOCpODaZibbrop+kVm4OoqV23EjRcYeFInrC5Yvny5TcHkKg11gXQg5f/617+26ZRU0xf1OWgXaAkwijvttNNsas9Z8+caTaWsc4ndQnL2g99w9Eg1uNvkHdYxItVyXRfgojGkYI0yEgmGNBi8OI4uMT4HDBfgupFskQ5ZK4vBBtK7DgBpxe0H8SiBN+cHSCdXX321OVPBWKKpcJfkibSwdyxcPdoKyi8ZKA8c51M+lFdQ/e0KtIOb1oK6xkiNsJE+ONc3HvKBgwraQjLQzpBIe/XqVa/w8R2MhIKRFZIz6aWNIq1jzMNe30GeopKB7/FLnMxBDUAqYttB2lQ6oO3jkW7y5MlJjRKRrs477zzra/UFdY9hJm3CGQS5+gL1ra+Ggnhow/gtwAiLukS7QPt0zxsbpAEtGXWIFM014wpSNHVDu68PCA/tFVvd0tZwdcx+1YTfWFqtplDOuUaLJs5UaLIBnk6OtywIAcTDWQUmG2j8IExUeQyWHPzG4jix4SbGz5nBj3fxcU1Hwp8xhJrB3h18kwyodiDyBxxwgHzpS18yr0SXXXaZ+bXt3r17bNBoCnD5Jn8Mbs4CPVn+uM8AyGbwDIhB9dZQMNBjPY7bP9z/4QjG1R2qQUek0wHv8R3hcQS1GZ4zODKdkcyrUxAIC0vwW2+9dScrYZ5hzU+bheClU9ekg3BwQZmMOJM20lkf4szqgf/85z8pmRO8ZTG9QvnWB6TZuWlEbe42qiEfMKP0gVzC1V2yc1MAaaFc+vXrZ2MLQgB+viHUtEPGFdoPZZsMfA9DxdiCN0HGlksuucQINGML6uW6QPjZKJdshduUkaeZrp/I1gKBNMV88j/+8Q958cUXTdJIFwyQLNdiScV3vvMdG5BoxP5iTdao4GjpMMwXsXQLYvH+++/bcge+ZzBiThNiDIiLgR4OFgkZqZ3BtCkR5ES4cmCAgECwUT3zy0GAuYFD//3vf2/z1bsK4qbsOTNvi1cypF0INYAg49EN73C4RvSXo/s2GZBM8Mp2ww03JF0qRjtAAsZjU7raDOr8N7/5jdx0002BRB+wfAXinW4Zff7558bIYe+QDJdffrkto6lrzply4UCqZzlLMq90lO1pp50mf/nLX4wZrQ+Qyr///e8bUaac6SeEh9SKL/xvfvObTUY71FRBHUGQaZvspMbhxhZAH6BPOrsU2iqaRMYXzhBp+iN9wt8PCBcE9Q3qiYMxC61R4rch6gkt7N0a2pjsrAOhOQFhyQnzNszjasOiJaZ1KJGMHHXUUTYXjYW2C9ed0wFpYC6PeVplEMzaWqWd2G/OhA3qE25TAOlljv6qq65KuvSmU6dOESV4Vg67mj++dwdz8EqYzV4gMU7q+JhjjrE5RX+cdcWvA19EGbnI0KFDk7YT7rM5P84d6oKLjzKiHQWF5w48q9VnfhgnNErMAsPiwBoZRxrkqS6QTt773e9+l9TzHvlmaQ5z0rTndODyTztnCSBtIShcZUzNE1mI+oE6oy7cOEKbZCkcy0P5zUE/cfVQV/t34D2+o//897//Ne9lOOlRpjXy6quvmtOeEA3Dbk2caVj+Rsg1jen55583r10sh1GOfadBItnBuwcddJB5WsrEmt3EDpL4uznAX8YMEKxbPOuss8xYyE/UlEs3ooS3KfdNpvLLQMR6UH9d+Q8I1/XXX1/vZRpffPFF5PDDDw8M0x0YYuGKMBVcPjljvHXooYcGhuUO4vSvMa2rnO69996Uy74oezzppQvK6eKLL07KlHDAtLz00ktp1yHvcUyePNnWXAeFyQHRfu6559ION0Ry1FWGdT2HiWZJ1VNPPWVLRVkzTV9iHIQRZnkeTJ+/X4X1lj6arj40B9DBJXrlgd+oediajb2eUYMyF4fKJx2ghmRrStTjqObqA62L6FUcpMd/PzG9zQUu3agmUZup1GUqURzms08tc6jKDJkKmLlU936m8osKD3VxMqCGw0MS6vagevDD/xw1KwZsqdKJcRfGg8qYRO/sDH9+aWt1edTCuM6/Z3dd5cTz+uQrFXgP1SjxJ/uG+LDnYP4zXfAN9fTmm29a/pKBcmTaSQf56J0QDUWqdkPdpnpOn8FOh+kX9lp+4403zGiR+4yDTEcwTYdHw6AtckPUjd2aOIPEBshviAhGYl//+tdtPhJDGYya0gGDB+s/aaj1aZDJOkKqDtIckJh+iA8EjbXYGGc9+OCDtlE887fs7OPmUTOZb9ai1jWXirtJ1mMzuKSCP12EiVFfqrRiOKiSXkrmwIH2QphHHHFESoYQG4WtSea5g1DXQAvqU95YaGOwlQoQZ2wx6hMulugY6kGkk4FywbiQPtrckO540BQIWap6Y64at6a4LcXlJ0Q6iPmEgVqwYIG1FRdefdrD7o7dnjgHgQZEB4FQYDnMtoc///nPzbIaQ4e6GhiD56pVqyyMptDRmhooPwgm/rSxKqVcGcizNeBiPASzlcoSGX/QGDmlsj5OBISCcFMta6L+GZxSLWNyoFwwooERrO8gltjOXNtj0ITopZI0adOJKw2Sgbb9xBNPpNQMkQc0JHUxRH7AvOA7HsO9ZKBMsNbGcrg5wtUp9UJ+N27caOWIJgCm0NVZfes+GyAdfri2xLjGsjyWV6Xym++AFM1yQM4h6oeQOKeA6yhw6lgRY83KvqWprGR5H0tHlo9w3RQ62u4OiDPWyljSJ6sPBh7Uz2zinq7KFCKEBykIdKp6hjgjXaQzQDW0zSR+48IhX0i6qfKEBzu0GXWB/rBu3TojoEGSkgPMBV70KPd0gfofDQPLGZOBfnfmmWcaM9dcARFGs3bLLbfItddeayphVrOyOQValobUfTZAOvwEGjU1m2ewNzvphYlNp5/AELOZSnPUdDQ2QuKcANcg3eDmwHImltuwzIWlHKzHDVI9IoEwZ41aL7GBh2gcUA/YDrBLVF3SM4Mkart0gcTv1mUnAwMbavO6VOYgnfbCO6mII3DhcK4rXohesmkbfzgAKRxGIxVgTGFaGJDdd6nAO6xjholIli/qkDBZnpXrdc6ZAHlEXc/UCQSOJXisE7/33nvNRoVpnmeffdbaSlOBG7+Qlu+55x75xS9+IQ899JC5gU2nXhkf0aA0xAlNiJA41wINzk+QHdx91H8YL7FW984775RjjjmmlkoTVe0pp5xiazEh5snC84N30mnoIXYNGFmdeOKJJiUmA0Tsk08+MQcb6dYJhAKbBLQryYCEgZFTOvPOtBfUwamYCMLB8DBVeG5grav9gbrec88pn+nTp6f0A8CAjKEf6me+qStcgJ8B1uBu2LDBfgcBBgKtVXMa6MmfyyNaE/KItIzRG2UII0LbgGhPmzbNCB8MYlMBaUNChpGAecCXPHWVDtAqUVe//OUvTZAJUX+ExNmHZAOJ/z6NDiKMy8y77rrL5l/gfP/0pz+Zkw1U38ylAv93rpM6uN+JA1jieyEyA8oYxy04cKEOkwEievfdd9t8YDqgvlCz4uowFZAKcQJSV/2SNogbmpdkgEgivaaSiImHPCOJ1SWNOQ1QUNr87RONAoxLKnUmTClMq5PEk+XXpQ+ihQMgDIyS5Yf3mGemXNxGE3WVo4N7j3goBxgAzqnKLhNw+eMgLiRmnOvgECao/LiHQxfSx7fuaAwQLzYSeGjDSxiCCBb66aYH5hLtIYT5sMMOC1XaDURInBsIBjTUdyeddJLNR7PxOJvVs3zEDWauMXN29xy4BxfqBgrXYRPfC5EZUK6ooBk0nMe1ICDFMLeGEUs6IFy0J8yxpgKSEvOpdQ1whIfUXNd8bV3txD3HWjaVGhpmgLQ7opcMpJulZkjOqYB3KfyJg6B278B9nkOMYHJhipKVDe/uu+++Jon5VeXJ3k8E8+QYL+GtjGkpGGhUyBDDVIzGrsDlG+kYO4brr79e3n777ZRMAeMBBneNBcqT9NJeWD3BUlL6Ql3MnQOaRRhVlkkirLBrV3OcgmgqCIlzBgChZjD1S2R0TtdB3RnQAWjsdFgkNAYMOFPUlOmqjEI0DBA9lmshgaUCKlkIebogXAhHKkNBBql0ttmjfdT1DkiXMMEUpLKopc2S9rosxJE8Ub2yZjUVYE5xK5tOPniOIRhrzFPNoTMlgXtcNyXhwk2nnDCyoo9dc8018sc//lFuu+0282HA1NPf/vY3I9zZglu3zUoP8phqiRiAySOv5MsduQSaEZgY/A3gHhZNTzpGjADCDOMLUaZssQ/gXiLSbbchQuK8y0gcKOrqUHDGEGP2RGXAwPIRP8JI348++mjaXGqI+sENCliOur2ugwARZRORVNJ1ImDOMDhLtXSIeTc38KYCz+sawDA6TDb41RcwIU4iTQUkTAhZKkKP9I3VN+VRVz4dqIe6lkZRHxjz+bUJ6YYPQ4HhFU5TINQQIPKApI7ati5NQEMBs8EcLapdVNp1EWbqFOMpbBeof3dkG8QBAUaL8O9//1t++MMf2pJCtDzpaBWoB9o9fQpbHKRlmNCgqSPiSrfeQii0wELkCNphbU/UYcOG0etqHdpozS2jStDRt0NkEjrQxM74K9dBZCeXlioBR0455ZSISof1djM4derUyJFHHhnRQalWmEr0IgMHDow8/PDDMb/odQGf6ieccMJOvqtpI9w7/fTT004j7jCV+O6ULg5cYV599dXmsrausGi777//fmTChAk7ubQlXZQd6cKlaX2gxNLciw4ZMiQwXCXckSeffLLe7nDJD8fdd9+d1Jc7LmRVQqx3XdcFwlOCHFiHQQfvsF+yEvNYPrORJnf4f6swYGk999xzI926dUvpkjXxUEY2st9++1kZsp+0EnkLO0Rm0KK3jGxqQCpmD1y8IAWpi5iPYrs25gCDOM8QDYcOOjHOHekYSZHlTUg4qKWRILEGxutRXUZjQUDywaEES42oW8JEKsSDGGo+tuDjHvHXBcJCNcx8LGpp0sq3SJgs58NyNt02gqoUSYblMEiNSJ+Ej/r57LPPtvlBtyY/CK7MiAupju8IC0txly7Cp+zQADE3nG7ZETZSNi5ckb7wqkcfQSNAHbGb1fnnn29HXXPiQUBaZZ4X5yZB/Y3009+Y5uAakCaQTj0lA22KdcyPPfZYnVNV5BOtAHWKQx7SQdwcruwzARemC08Js0nLSMm44GQJYbrz3YRBW2SqgXXa2NrQzjKV1hAewi0jcwSKmcH7Zz/7ma0ZpAMnArUn2wuqNGODVojsgbpA3QhBYFBBjc0yOYgPxKu+YPAnLGwHnHc4Bl7UzxyEWZ/BC0LKnB/WvW7pEgQbxgHVPAQwnfBIB2GxZeDMmTNjAzAEmfwyyKZqa3zvjwdiw/Ia1iWjJuY5AzNEmbKD+Ncnn3wPyKPb2hCiShhMBWBgRhrrEyZw4d53333mzSpougiGAPe8bJcJiCMxvw0BZQzhYl9ul44g0CZQA6MOxkEOZZeJ+OsC5cs+5Eyv4fgFy+xUhmp+wDywGuWKK66wPFLn9ZnGCFEPaGMIkSPoABS59tprk27fp5JJ5P777zcVYojMw6n0ANeo4Shrd/ifNwR8z0FYhM3h7vmf1wcujS68XYELy5/X+qbHIZPpciAtieHWJ328m5gvZW4iSvgC+xs7hrELGvB/uysgDJVIIwceeGBgnO5QwmyqbGVyMhJvulDCbFMsBx98cOAWqqmOtm3b2tTFa6+9ZltMujLLZfp3J4S60xwCThnDISSgRMB5sssRnGh9Vaoh0oOfu+eackYScMeucv98z0FYhO2kWxeu/zpduDS68HYFLix/XuubHodMpsuBtCSGW5/08W5ivpBIWRKEloC16Ej5nJHIL7vsMhk+fLi95/92V0AYTJEwBZCsXBgH8CqHxIwmJBPx1gUd60178Mgjj5gjFFzVBmkTgoBkjLaGKR98OrCOnZUJrsxykf5sgXJxR1NDqNbOIShqVEgs7cB5Cd6AlOu0Z24XLFRsqLdDhAiRGTA/jrqcNd9MZ0A8YYIhzExnZJq4qORvqzBYK5w4jwthxjcCBBJ7BObXcwWmSFDxQ5jTHfYhwgcddJA5I4EoO89vzQnklTS7cyLqet5YaLLEmWQxV4ZnGho7BiE0FBpzc2scwFU8xJi5SRb3MwdI/uDm4ezxpsPA0RzzFyJEU0TigMvcqn9JVuLzhsIfDtdsDsJexng+c3PzMN1sB4oEiuSOhiBXYNzB8Qr7AmATUReQ+pnzx5DxoosuMu96MBYOmSq3XANmiQOGjXGX9f1N1b6nyRJnDBaQLlkrCJF2Dfucc86xRpPLhp0JJDbm6upqO7jvVHh1qfGaa4cIEaKlww2jrn9CDGG8YcAx7EPAYA04anYM0ZKpvLMFDPnY+pbNK1Lt/AXIA+nkXYgzghH3Esee5jIekU4OXM/i+IldwVjrjvbkq1/9qm2mwqqDpoYmR5xJzowZM+Rb3/pWjDA70KjhONn+j6UbWA0iTfs5H75vDg0mXfirh2scQbAEgjN5xwczR3PVKIQI0RjI5TjhmPDGlNBgFlg2hVo7meQMw4AQdOSRR9p7LDFzc8vNFW78xLc9rluxoHdz7eQXNT2ajG984xtGX5oSmhxxRuWAH1r83watEaRAUUVgSIEPXw6WcWBk5aTplkakqCI6OHNGaBPcrjYQZDhc3OY5ZsWvsgsRIkQIBwgUam12Xksc9lFZo7o+99xzTTsJw99SxhIEPFy1svEI2gw/oBVoNNi6ExuAXGs0UqFJOSGhwTAfy1wN7vaCwDsQbfYUZa0lPqpRV0CoWA9JI6OAea+lEGnygfEYfmtpRKwzxUEFxi04qUfDwIb+cH5YfOfSyCREiBDNA4wPjI+4LmUenHEFgQbpEWkZn9poJbFmZwxtCeMndACBD6EGHwTOANcP7BAQ8pqa86cmJTmTFCwq8QjENnLpgAbEQQPDexKNCw6I381tXjoV8GZ13nnn2RxWEFCZsSPMpZdealbfGJaFCBEiBHDDPA5IEGYQalBvo8ZGcmS6kGvGkZZAlB3IN0IM06R4bAsizmhi8eh2wQUXNCnBpsmptZEI8ZDFerz6Jg01jLN8Rj0DN4h6hsn+psQRNQRvvPGGEV6k5mSgU+FKkfcwdGBDg3RdRmYDlToQzFPJ/snHHpWJ770rq3UwoGvAMlG1rLI3T74NgLJk+i8+6OAmweWS/JqXZkNE8mN+FLwT7wWVif9Oga8TF+i7/rZo3+pvC8eFm4AC/Zz3eNXf8gi1ffducuwZp8rhJ5wovQcMllbt2+mDiJaL96Ylzf40X1BeqBA/fv5Z+eDBh2Tj3AWIKFpalImWQqRGyxW1aY3kVVd77SCaZfMCHoPWn94nPCsW95IPdj/6HGSzp3dQpn/ohKNkP+1fe4wcKYU+C+ZswvLvaxOuPUJsOBjfUgkjid9joMZUGd/4pwMT32sJQHLGuO1f//pX4FQpmgI2R2F6sCnRiSbnWxvODe6FtXioXuoDGikm8kjfEydOtB1pqBi3BMtxRc2x8UGUn3zyyZ3mTBLB/ArLOMg7nQ5nCHVtB5gNwKG//sor8qffXy8fKZe+LbqbUUST4QZf33hcbyQdpMmnBuzvYjECqif3VVB5xO7oAOX/Pt/3buw7PRPuzqEofPHzVu2o8qRi23aZ+/k0mTHpU9m6cYOUlLSWzl27EZHFZa/X/qhZgv42aNRo6b/PKKmsrpD1uDUtK5d8ZUQK27aWXso8FhUWSfnmTTvVh/vF2f8oqN6BveddGoLf2nXs0Ha8UvvWwokfSOvOnaTb4MFSkIO5WX/5QECxNmbtNqpa5pDd1pf4cw8i0onlCxFirOXMM/c88b2mBsZ4GAuIrEt3XWnmOe+jfUSKdowNQHjBhSrCTDbWvO8KmhxxprHgjQaCQkHS6ODw6guINHMrEHlU5BBswkWyTsVhNlVAdHHgj6V2XaDxMiePAQgb5GM0Rr4p21xxxrNmzJAbb/idLEuQ9OkWMcKnF7uSksSB2v3ifiBxjr7AKagM/HeSEWcHC8P+BcN9b/n1fY/QyO+IDjKlGzfKrM+/kFmTP5MNq9bq4NBF2nfpLHmFOmAmDbl5gPK19qZHJ5U2B6iU2U6J2bqlS6R84yZpo/kcfMThUrZps2xZ7VkPuzx7ZRuHKz53L6hs/N/4r7OFcmWSV8+cJX3GjJFO0X2mswnXbxkL2Vzl9ttvN29dbKTDHsysp2b7S2xOGOeaEpHJBMj/Ru0vbGRCXjGKZYkaDAbqeMdkBIHxHumYqT7CABBlyomlYlhrY0zb1OhCkyPOFDDqaayxnRU2qm4KNWi+IBWcJM2G7kiTcJrsdMP6tubWeJFCYFTg/tJxu0djRspmWRr5Rt1Nvp32INu4+/bbTGI2mJdYb8g0sqPis/dPSZfTayNSG0mL1ksa1UM4+VKgr+p3+n4kX5k4DS8iNUoAo2Hb7wKV1jVm4ohGQaw1PNOjQMvKiGmsTWjauLbfXnrtI+BO9iyadoX3joZJGvR+foRlM+QRYswTQHpowwy00afaRrds2CjzPv9cpnwwUSp2lEv/AQO0DxRbkdTo+zW8z+Bs8cUP/iX+riZP/NS3+Y4ovFRkABowQVdpHFV6ZeG7fNsvvUea7Tfxc/a+adOugwwYPUoGa79esWS5VFXnSfdhw2XN7JlSsW5DtDw9cBX75X7o85o86totR+ImtcaASv1rPPoORw3v5FVGy8xrG4ngLdOuR7Sc9bpK36mxOOyL+CfRsozd8YUFgWZAH378cdE72QPl4xh0lgRh4IQRKGuWkaIZI+fMmWPzyMcdd5wJNy0FjGXOUJiVPE899ZS88847RqTZvKavMkdDhgwxAh0Evkd7isEXq1pOPPFEO/B6dtZZZ9n3qYh7Y6HJEGfHGQLOcETsnIMVHW7jINI0QtTUVSoZ8n59gEUenBYEmwrye7tpDoBhYQ6Z9KMRoBzSKQPKCst3DEAg6nCQqG+y3Rj/9uebZVOUS/WPaG6sYxC329zIy7eB3AbW6H1OqeCFo5IZeaBPMmerNz2CbSyA/tDBWn9HotTRI1IaUzRw916ehkOAfGnf2/MqAtOzDuIM/HwX7fv2TfTsYOnRFwo0AwXGCMAgcF+/VPpRzZWmJ6+GcrcER7/2/lZr+reVlsrUjz6RSRM/kqLiQmnboa20at1OCvIK9Xttw9URKd9RITsqq2RHRaVU6rF9e7lsL9NDz1XVSiI1IUUFmoeaakuf/ctUPUfDodS8dKskp/1q+5ZS2bB2rWxao8eyVSoJr5DNemxbt0a2b9gkO0q3anrL9fUCaaNS9L4nHSuRgiLJb10gK6dN13wrcab/W5gu5DiIlrYOwxXJ05LU3wWaUeaujchy1ueabfuuJl/Js9ZDVX6hlX+02mqBrkO4+VrPecpQWex8TzzUtdaft7Ux7xECH9jPWqiuqJADL7k4+ivzIN/0eQQMnIhAnNAEBu0ixXsw8OPHjzdJkHr3j6vNFeSLNdqsVkEjyJiGBgFVNZpBDhxU+Y1g/fl2Z2gKYx/EGONZpvycTU5TLCNtizTTpoFkDYn7EGakwNdff92Mo+ASV65caRVVH7B/6+OPP25SZHOCqybyjGrnrrvusiVU6RJpytU5GGAPXxwMZNNYbPxBB0pZmedXGALZuVNnOfjgg41QMmBSb1UVWnc6DiJ9FBYXae/RtOj/Kh143n/rLZu3TgaYi0GDh8jQPYfr90qktQNX6fuEy2BaWFJknZH8VZZtlymTJsumtes8iZqhWO+369BRxuy3n7Tt2EE7gt6urJHKqkqppk0xOGtaYYoKNG2EuXnjBpn12WdKTLZ45cY7lhqF/u7UtZuMHreftO7QTiLVlVKh+ahRglmo/4pLijWdhVKhYS+dM0uWzpxBMuw7YJf6pyBKGHoMHCwnnH++jD7wQFk0d44SvnVSpfko27LZDO34IlKlA1T5DilXpitfy7Btu7bSvlMn6di1k3Qf0E8G7zNOOvfoKcX5mVHXxdqZ5mn1suUy/4vPZfXCebJKj3ULFkuppnHrplIdOJVwaL4ou/Y6GLbq0F469ugm3fr2kQ49e0mHrl1kw7IVskaZzLL1G2Td1M+lupw8eWVBOcTKlZKJEskSra9B2q469h+oxLlA49mhZbFDz9RVgRRpGRMnr1dr2Sz/7FNZO2M6P+x7PyxIzU9+t04y4pRTpHWbDpY/2l6VSqgQabRMBSWttLF5qVmmRHHVlMm1+lubzp3lx1oO2QLSMh6t7r//fnn66adNgkzV35EQb7vtNlvxkkySbG6gDNhKF1/lQWMCRBY1P3PHTVECbiiaFHGuCyQV5xtwSjjkoLGi3kCVk+68NM7uH374YVObN0dQBhAg1NsPPfSQPProo2Yslk410mghWGPHjpULL7zQVDrMUWVjruXAfUbH06SSJGp1HP6314G6p8bZrWcPTUuRcsUQZ5U4lfiVbtooixYttM1BnnzisZSMF8RyTyXMhx52mPTp3UcGDhkMa+wRZ+2gNTqgblm/VpYuXizrliyX1159TTZv2qSDPhKlh3YdO8kRRx8t/YcMkn79B2gn76XpUaKnyUZSprwg+utXrZFVK1bKUiUmE197WbZu9jQCngRJHj2Zr2uP7nLYCcdK74GDpH+/AdK+W1epiqgUyyCpBGvd8uVGaD97512ZP2WqSXT62IMGY2OKEmbQo09f2f+4o6Ud82QrVsuyWbNl6by5sn0z61NhLkQ6d+smg0aOlrat28iG9Wtk4Ryeb5UCzXuHzp1kyLgxMv7LX5LRhx+pRKtEiiDSZK5egxfMAvQYqTVP1mvfm/LGK/L5S6/L8jkzZcvWbdK7T3/pPXSwFCuzR51HVHItW79JVs1eIKXrVkthhHrUkqccIgXSWglevtZ5/7Gj5bALLpA5n3wmU556Qio3blI5ttqbguAL/ZOn5e9ITIHW16jjj5FBBxwobbp0k16DBkurLp21IiizfCkuKJbK7Vtl6fQ5sn7hAvn8uWdk9eTJUqCEeicYY6W13L6LjL/iCukyfIgMHL2Plncna5PI0sUq6W/asEaWzZwj29etl2kqvS37YKJXhlEUap5/oXWaaVCO2NywauW///2vTctBpOrq57ja5H3mUlsCcSa/CGbf//73zcdD0DiPNHzjjTfaKhVjzurVvpsumhVx9oNKYp4F4nzPPffY2W1Knwoss2LOAmOA5gaqyjU8rplvwiAEdQ9GIqh/0gFhYCAGp4kxBJ6BINqZxAF7j4peKRhsNU4OBgyk54GDB8kPr71Wh0AvP2uUID90z3/McK+mhqGxps6BCMqWrwQHC9ULLrpIxqpU5TBrxky591//krJtW6SmyiuXiA7IGjtX9ttU2Pma74I86d2/n5x9/gUyfPTeUqOEX2mHqQ6n6uB+3z/+JjV6nacSmumNo+kyAhJNP/e4RoKFcRgwZJic/rWLZfDIkbKjbKu89ugT8u7zz0sNnD/1ZGF44Rj0staQQj1rOSG9o2no2au/7HfYoTJ39gyZO/lzaadS+N5HHyXn/98PpesevaRie5l88fbb8qRKECuVSLulXJ0G9Jczr7pKDjvlRClo1cZm6GvFUxc0XSw+qdxRLvMnfiTP3X6rrJj0mVRr/IP2HiMTLjhXhh51uJS0acfMvn1SE1HJGbXjpi0yTaXNj559XpZ98qnI5i1KqE03oGUckSFHHCKn/+xn0r1/H/n06WfklTvukgplzmq0npj7BflaTtgEAEu5lm2Nxp1fXCQdlQk688c/lYH7jdP3C6Uiv1qe/fNNMuuBR6Rgh5YzzB3q/ajknYi8Gso2X3aU5Es7TdeIC86Xo7//LWUgOxojsmn1Wnnie1fLGpXA6R2VGkxNzc4E79dLl0SvMgdWqqDGvvnmm034SHeYRl0Lww4D3lLAdNx1111nc84w34lAnX3rrbfKmWeemRVBo7HQ7Fgr10gZ5JmHxukIxJmGzEJz9kuGewwCXBWSc1PzoZouHGEGXCONXnLJJabyQgrG8Uo6ah3KEAM7uHKMIpDA4dLTJe4NAXESPp0L1SG/7VoPGK02KoGQfn570msdg1H0MWHybgflngnHhVekRLdN69Yal2ef4IXnETpg93TQrq6pkPyqSlm1aJG8+cpLyiSs0O+dejxP9ui1h3Tt0snmFiMarpNsPfjLOUr0kNL06NK9m3RWqW6HDiwzPv1EPnrlVanZXi55lUosyJ/LQABIZV5NlUp8VZK/Y4cUVlQqgd8uvUfuJV/76U/kwmuukd7KRLTr2FlaFZZI68JiaaME5cCTTpLzldnqMXiw5k/D0Xg2LFosjyuTMuX9D5ROpadd8gNGacfmjfKBDvgP/r9fy9JPP5O2PXvKSd/7jlx5699l/9NOl87tu0qrApXMC4ukqKBIWhe1lVat2kvHPfrIoad/SX7w73/LZTf9SfodfriKdio1a0FV65FfXCzFrVtJgfbXA77yFbnoD7+XwcefpL/bR2NXWL15UB5PJdpqKajeLvnbNkvH1sWS165ItubV2FQE+Rvaf5B0KNDSrdimb+o9rL6C4DUHJf7a9pSQV7TTQX5IX2mjZQkzR/130v6Vl99KKqqLZFt1vhLn3AyXtE2WR913331pE2baKlowxgO3R3VLAYIDxlx4gEwE+R42bJgdLUFT4EeTs9auC47wcOagQiDGeLlhThPJmLlVuC3UQDyHKGO9eOCBB8oVV1xhhlUtpSLJG4Zz5A0OEjef/n2iUwEixhwWUwQYksDsUHZwn66cG4o7/v2v6FUULjg9M9TsM2as7Dl8hA08pJX6KN28WebPn6sEVaWeuqKPPs9TEXfAwIFy7PEnGMGDsFcrAWVuav7c2bJ+3Vp91QUWNw4if2ZtHHtUI1tUWunQqZP0HjjAEmlEXsuXebw502caAfCXC1f8Jj8uXAzaitq0krFHHi6DVGpetXCRPP+/h2Td8hVGKLw59wCuOBoswXMJASMsMyJTolCijMaeB+wr3foPkF4qDQ/bZ28lPcqIKGPRsWsXKVZpknc7du+hhLxcFs+YIRWVKvNqRGWar+69e8ugESOltealLjjWgfnyjatXyqv33S+v3/Mf2bJ6tfTeZ5R8+Sf/Jwefepr2u/ZeeSCZajyWbsuYpw/x5FL9qze7Dxoke+63r1RFqmTt3PlaP8psaD8ch3Fmm7amcejcu5eM0D5c1LpItqzbINs3b7JCyDOLbA1LmzTSOfPBEZWg+4/ZX/Ycf5SUFLfSukRK1novq5TZ77wtlVu3KeFFU0L6SE0CTJpWCV3TS2o79uwto5SR6Kh9iXZRQxwa3tSXXpStyrhZXvgkIKwJP7gmepUZwBgwZccR5DQjERAvJObLLrvMvAPCtO9q/21KYGwgT6i3nZ0ReWZMh2hjQ4MRHH21JaHZEedkoAIZRDH0glDhwhMiDLFms/AzzjjD5iR4hiFUSwJ5R01NfrHSRN3PvHyQRWciII6ox9miEz/dNHCWm2EMsysdvBZxdsHYmYFV5KBDDpXevfuatEMaMOrZpgzVnNkzpXx7mXs5BXSk1FeKNJ3jJ0yQfv0HkhkjqAyu1SqhLl44X1YuXaav+RMQNeIyesIT/af5hBzVaKfftrVMRmiHL2rVOiqx5Jmh0dJ5C6R0/Xrv2yhi5aMnXoUuce7dv68cetwJej9fPnztVZn54cceA6Ivolb3fVYbsRv6nhaS90/DVKJeohLmXvsfIJ169LAcVCnhWfDF5/Law/+ThbNmS6vi1kqku0pJ+/bSqm0bWTR1mmxQwkoeUAsXlJTInvvuJ526pbNfOIQpIttYV/roI/LG/fdJuV73U8J86tXflNEqARdrfKjcSSBqfFeOsXP00D92Zm13a01b7732lDIdZFcpE9Z92FDZa4ISVy1ryG+BtuMS7cPdlfHoO1zf27hZNi9fKXlaLyzVIjhLm8YB49J33H4y4OADbV04Cg0mQ9q36yBzJr4r21et1l8eg2rp2AnRtHHWfHTUtOzzpS9JsTIctB8IMwR6yaRJsmHmLL3GVsE4D/vUj0wTZ4QKCDMGnxCiVGDMO+qoo+SHP/yhnH322TG/2I0F2ltweTcchIe2E60oWgFcjWIz5MZ0VvO0VuY10/E2NloMcXagYboF5hBolmJhoQxRdlsrthT4OwJnloex3u/oo4+238xDpzMPD5A0WaLFukEkZzQRu9Lgb//XP+0c9D0S3nEq6W5V6YbBB4bACKEes2fOMAl6pxFwJ+gAre+T56OPOVZKt2xVhmS5dFYCxX2IwdJFC2XxggX6pgsrLjm7W5xcGknDdiXOZdvLZc/Ro42gQqSQzJBQMbiK1OysGuZ7C0ezUNK2tYw++CDZe/+DZdm8efLuS8/LdmfdrchXQmBX3k93qgXu1R5eNQ2t28iwffc1hx6kC8v05bNmyYKPP5YlX0yVj7Xe1q9bJ7379DNJeoYO7CujebeoC4tlzOFHSA+VDAMj9QFNcE1FpUxSxuK5O+6QinVrpXXHznLIOefK/qec7Em6MA8aTn3aB68WtW0rww7cX6a9+4G0VoZy9JHjpViJM6FYOepREimWjgP6ydAjD5XymkpZNHu2RJjzV7IZc3GqklPPcWOkQuts06oV0q4LHtb0WUGebFNmc830aRKpKNfw6p6DxIBw0ImnSIe+vWXH9q1KoNtZW6Cct65eI4s/+IQCsfR7f2oj08QZYABGX0zGYFNOMOQYdmJzwioUbC8akzAD0uXGJf/4tKsgXxh+jRw50laawJAgdCFIMAZkKp6mhMatyQzCBvcoqCgOiAwDv5MCW1oFkh9/vgF5hgn5v//7P7npppuMq0x3TTeDEZbSWD5+73vfMyO7+rpQdbj2Jz/xpOO+fVW6LdLE6k09SG5JcYl06dpZZs2cKYuVgFYp4ausrJK27drZ+5LG0h/yXaDv9dH3O+ogxVIprLEJq0qlZ4i+J9n565zhHVJHuXm/OSGLefJYnlSW75B5mq65eqBeJxwk1d6DBknfgYOjshjf1AbGZipASsduXWTYmH1k48ZN8vE778p6LU8HS4klgILgh3fy/YzBS6d35sNqrRumaip27LA02TItjKvyiqRS81m+aZ28878H5fpvfF1ee+ghkywLjbly+gEvQPJZF4hzKYzFU0/LtjVrpbKgWIYcfLgccPJp0rZ1BymoUUmVAOvZnzACk2r2NW4rnZSJKGKZUkByKpV/Zs1yp45d5PQf/kguVOIzYP99lWi28cLQZ62UWWnbvbuUr1wjyyd+LGXKhNKGyqoqVKIeZ1bUGPwldI843ANORYUyUL9ZOnWqzH/nfStjmFUIY/s+faWqSBMUVElZAn0YJptppiAwniF4/PrXvzZDKdbt8k1jwo1DjCEclB9ndz9xnGooINKotBnXuXZjeqbCb0poMZJzKsJLxbU0wuyQLF9IvbjtRA3EvBUGYMzZpNOIUauh4mYuGjUx6wjr63d21D5j5MgJE2TEqNHSpVNHW8e8QztsRXml9Nqjl4zce7R88flkKdtaKgMGDFCCkK/EpsbU0TOnz9J0pjZeIi1FKg3uf/Ah0q17N/nw3feka7fu0ksZk2rNI2ryNStXKPFfZOuB4yAPekBJdaCPZylKwvR/eVmZflMlfQb2V8aixNKFx66ysu2yfOliG7SjoRhcuRQrwRi5/wGy177jZI4O9F988L5ZaiNlOiDRe6Qyei/+yH9pP/jM7mk62WCh/54jpEuf3vaYtc4rFsyTlXPnKBOxQ1+Bz45IxbatMmfSFGnftbv0GzHS5kkrtpRJ9/4DZN+jJ0jXnj0TItoZGJ+99fBDMu2N16R6W7kUtmsvR331HBk2bqwUtUJK0SDiBZc+NC0MqNTt3E8nWTgjDz5YmYgSX7nooKQHv3mhQCXfnkOVMRo1SiLKjG1WKZ48tlHmbvCEY6R06TJbbz3wwAMlXyV6lNsFhXmy4J33TIImxMCUatimYdHYCnvvISNPOFEWvfWWbF65SvodfJBJ07T9EmUgJj39pOTtwCufpjAgsExLzpQRalzsQDAIo71xD40gkiK778F8s9rCEXDqo0F1kiFUaX9hPhgHKfj7RiWP8yP8MCDROwEhU2lMzG9j5j1baHFq7UQ0NcKcy/TATWMBfdhhhxl3TUfngKOtCwxMSNFYjeLPe/DgwWZw5udWQar80CExVhurxGo/JVr7jB0r+cr1YrDVu2cvmaEEbHPpZtlrpA68psTR0VvDm6xScA2OLOpAayWG+x1wgEmpH77/gRHmvv36muSHMdNWDXvR/PkqDe/suIC4SLU/5Y44kCece0DsO6t0hgESS3uKVMJatmC+hev/1st/vs0HH6wMCb8/fesNT61cQzzem/zVoLxv7Q934/D/rHWtxLlAmYT+I/Yyoyk+hjivXrhQVhhxroB+x4AqfpBK7+OOP1b6jdxLJc620nNAPxmh0mc7ZZQIPVmdkfcFWv6vPfiArF+2zMpyz4MOkiPPOUe6aVsCyb6tC3yG5I4mgjnxGpV09zxwfylqjQU3pVQ7XItH2wrGXyVdu0mfsftIux7dZfOq1coJFcqeRx8nG+ctlGXaRruPGCrtevawcsjLL5RNSrQ3LVgoNSpJJ4YLKC4UK9TOsDNOky79+svCN96UbWvXyVAtN23o9l6hxjPv9dekYuP6OJOVEFw21NoYuTK3yvSSY7JPPvlkufzyy+Xiiy+OTTs1NhhLIMD4umbbRZY04c0L15q4GuU+YLlmuhq8EB5aPHFu6ECSKfiJVy4JswMEGqtGjMXwVY4UzX6ucLp1gfTim5w9pOGIGQyQcoMGhWT54j7ORjp27CT9+g2Uww4/VF57/XWZ8flUlaR3yBqVhMaOG6eDYaHN5xYr8V64cIFswVI3ET4CBJMAwzFMB62JH0yU9WvWSsfOnaVv/342sEaUOFeUb5f5c+fK9m0YmHmIp5Ih2yPQ3i/vjkNVBcxBnvTqj/RchC2wFOu5UJmG+XPmeETA3vRQrMRzz1H7yKC99jK1+Kdvvip5lRgx+UL1f4PkzskXiD88d23nqOTcV/Patbc3Z8xytFVK/FfOm2vz4c63t6uH/qP3lp76fmtlMPoOHSKLZsyULZu2SG+tv2INK1ZfnHzlymD7wv33yRevvSr5GNcV5MuYY4+TvY/CcKvYyr3BsHiUsVCCu3T2LPPctucB+0lhq9aBxNnAfc1bkZYBu3d133MvGTrhSNlezdr0QTLr/fdlvYZV3LGD9NxruNRoHdXo+/laPss+/kgi5bgNDQiXuDQdrI8e/73vyNY162TG08/Jxk0bZNSZX7KdpigLtCZLNI5tK1Y6Xyc7IRvEmXJ2c6y4pmR6CtsZCHWynadyCcYPXIrirRDPXX/729/MRTDSPho6pmA4w+DjzRFGA2PVXWo/uxnCksoCIGrMuTBfy/phNqDAMAtplGeNAeap9t9/f3Oa/53vfMck4XQ5WdRquBD8yU9+YsYnEGs/cU9GmBOBMRSLVedNny7btm+VG/78F/nL3/8la9dukDUrlqtEutX8Q48Zt29wOVk0/MnXsAqld98BOkgVmvo6EqnU7zeYJTBuOGuqqqW1Sh8QIuZfza0J0ROEoXb4/ujITlVNpTIJc2TJ3OnmchMnJCz36aUEr1N3ldCi7zq07dxB+o8cqnW+UWZ++KFEqjS+As+qOAbi18PSkUjdk8Ali/Kg/TCn7p3967ftDe+v/s5rXSIdunSRkgLNe7nmY9YsmffxB/LkX/4kN151hbz35BOyTAn7diVcFZGowxcIUbXI4lmzZcWMGVBpqdGBtG2nrjJw1N6mZvXq2VdQ9QWEVo8izfjQAw6S3qPHKvdYpLVJgUTfSYCRbNqN1ne+1nUrZfS69eon3Xp2l8+ee1y2r98gxVrOa2bPlYot5bYuvEabZn7H9pLfrr2WczIihkReIO379dMklMjCjz4U2VEqedu3yLZVy2RH1N4AN6CRjp3NqUs1f7IMV5+ubiFmzK9ilc053b6Wabj0uI2EHnzwQVu2ddFFF9leyM7ndRDQvCFBM10WIn2ExDkLYGnSY489Zv5gWeLw05/+VP7whz+YmodnrgM2BpA2f/azn8lf/vIXc+DCuuZ0AReMlx68irEVJwxIfQcLXI2Wlm6W1m1am8p97NhxZvzyzNNPyVtvvCKzZ06V1iWeId9OsGLzjOCYf8MQjIEC5od7MEDlKi0zSLBEC+mifXvP8tZQq9h3Tre/XnhatmWrfP7xZ7J98xZTwWJw1KZtB9n/8CNMzexAPH0HDNRn7WX2lC9k5ZJF0SepkF65+d9yRBlmietq837lveGvhy5duknbjp2kskoZxLWrZAaW3CtXmsXz0s8/l3uu/53c++v/J+8rkV6/gDl0JUAqyUeUqi2ZOUOWKDF36Nm/j/TQw0KPlv+uAoIzaPgw2e+4I6W4XRsLN51Qvej1zepKWTVtuqz4dLIM2X+s9D96vBLPGtmgDN6OSmWINN/F7TtKRzZ/SCphsjFGvvQ57CAlunmyeg4GgFU2IJauXG3lzFFRE5E9hg6WGmUK8CiWbfjrM7Fv0T79bdR/nU0QD6prXAbjw/qb3/ym/PjHP5a33norLTsWNBAIKowXIdJHi1dr5xoQCggYEiYqH5ZEsK8yc7cYSsBhIrGisvIbSdDAEztjpuHCh7AhOePiD5U3S6ggbOl0djoYS7RwXoLTl/o6PJikZfDma69I9x495Zyvnm/3OqpUdvddd8naNatk2dIlsmrFChk9em9T37mlYBjvEI03QIvG20VGjNhLpk2bKhvWrxPmhZlEHDxkqDnHIC/VKv0uX7xE1qxeY2GQTlJqqY2GhwDrKEP0xIsWEa4j2ZChlYbXjfXF9kK+FLcqkTXLVsjWjcpoaQDU5d4HHKDCXYlMUUJYoRI8LkAduHLR+KLz4o9eA/81iL8XkUKV7noPHSYdlaHBWImlVOyNvEYlYNTa9rYGiHQ/dN99pZ/WLYZic1QinDvxfZUKd5ikyDKpiH67fsUyWTDlc1kwfbqti+7cvYfNY09543WZ/X7Uf7SG12/0SNnv5JOkbbsOSlS99FjCdwFWD1pXBUrwMFgzyZkg0wjXZNfK7fLOvffZ5hcHXnaZ7HvCiVKodVK2dZu07o5dhL6ldbFV2+gGGI1qtAzR4KMVwKm4Q2cZdsrJsmNLmSx8+QWpxuWnvthn3P7SRiVqWgvkpHDHdlnw1vuS7zbQSEhmNtTaQXD9LPGcSfjHIYgqwgRTWs4LI0IH+0anO14ArKtRzbPEsyUtZc02Qsk5g6AxY+HMrjBIdKhxkHCQdFAH4eiDDdIx6GAJxKRJk2qpgtJt7LsC1/GQTJm/QrL/85//bEsz0p0PIj8wG3RSUJ90Mw+cL4XStn0HHSB1INBBmk0wRo0do5JbRLaXbZe1a9dJ2w4d5d933in/vPsuOeqYo6V129Zm8U368afdpVcPmwPdumlzVKLJt/l00laJdKnSlQqESkjbexEDfzIpB7NwVskqYvbBSrw4eeXDY4LdUr5Npn7ykazfsFbHeFyDqvSsTMNe4/aV/HatNf0F0rF3L+nUt5fM/eJzKV23Tnb4l4JpGNUaDZ6ocFnpQJklLTfe08PSY/WlhxLoapVsid+kOm1XqM7Z8css3ZUZ4M3uAwZI37H7U7KyZOrnMvP9d6WSdqhpqqHENRzCpay3bNggsz6YKHdoG/jb978tn735mpRu3GJLpdh+E0LYscce0qUbji1Ig2Yi2n52FRA+St/anIVdd7ikX1NuBn7rlyyW4m4qHXfrKl0GDJTDLrxEBu0zVratXS/lSry1YMxArETbGRVJeVhxu2i0HFp17yKt23eS6W+8ITVl5cYosI563aJFyqioZA3To+2pY7+BUtm6lYahJZKZ7Ncb2STIDv72SD9CsPjlL39pqmvGCJZWMk3HmFYfMCXC+NLSnD9lG/SPEBmAG2zZuIFlS8lAo0d6vlMJD95trrrqKpu/4Tuk0qQDdhZAR8cqFPX2v//9b0sLSzXSIdIwHs4fdzoDhisfNohnzS6+cBloAZLgUePHWzjuPdTfm0u3yMhRo+T63/9B7rrnXrnq29+RMePGSq9+fWRA336yUiVstw5bv7IzhihO/YsxT6dOviVg/mTuVMzejZ3KX39uUgl57rQZRhSMMGr6u+7RU/r1HSgdO3eVkeP2k41rN8iyRYulorLCBvlAJBSTJ8enhguKdFHWxO/yV52HWrtGCiA0RcXSY8gwGXnUMToYdpR5H34ok19+Vbav2xANwatvf9Isdg2XPZnnv/+BPHbTn2XZwnnSZehgyW+PS808KVZJPHCKoRFAq6Sel8ycLVVaz1iet2nXVvOlRLWkUKrLy+TzB++TpW+/L6XKTLXq1EWKOnY0l6laRBRALP84J+k6dKgUtC6SjcpkUgYOazGyq/CmRzAM3KFfde2F3/q666s5gzaGRuyJJ54w4QE/3Qga9MWGjE1IzEyjIYwgNfM7RPoIiXOGwMBHZ2ZuhkG0LvAukud9991nc7jM4Tz66KOySLl2JMD6doRdAcQYFTdz0XDKLNOoi8vlm3QlbQfyhUocCRS1ussieR01anTM6IjfpZtLZfnyZVKoEh/zu3vuNVIuUmbm/91wvXz57LNl3ao1snHdelPjkg6+Y555gzIMMEAmWVYrce7YyYsE+Mt0p3HWu+ER8tplj1X50vkLZd2a1Sa5VqhEVdimlfQeMkh6DRkiHTt2kWVzF8qGNWtVKo0HvFMNJtxwDIWD++W/60LjjJEbBkq0HdpYUWFr6di9l/Tacy8lykfLmBNPlrZdu8r0iW/L1Ldel62aXpP2oqBc46mrHV+VphstRu+995ZxXz1PRp18inQbPkIK2jInjKrT+97e95djAOLhJrznvks8R7HT+wnIU2YL56wbFi4x1XxJh3ZSQvoU0M0u/fpJkWZ32r0PyryHH5Ud5VuluFc3iSiT4Qg7+edc1K6dtFVGdN28RZK/zVsP7bB16WKp0m/RwMAIlWus7bt21if+t1oWaFPMKeO4CF/VaPgYn+hL9QXMHEsoJ0yYIL/97W/lRz/6kW1aUVe7CVEbIXHOIGiU+Latz7wKjR9DK9YGwq1CqCHYSJhIgblq0Bg14VnsK1/5ii2LYLN21jV7xGpnMB+MH3O3pCNVOm3QrYnI5vUbZf3aNVKjouWgQSqdRZsfYXTp2s32BSYc7q5fv0amT5uqEg3EhTQo8VBpp3O3rrJ29RpZokzMIUccIT9VZmLCiSeoFNVZiVWJzZFVsatUpTew4uCCpV+WPhOffOnUYAk9YmfvflA+mHtet361LFuyQMqpE3aW0n99VVIdPnaMbN1WahJnTRWbFHjpdaHUCi2hKE1y5gUS4N2o/b7CPSZ9EGRTrWveSGa3YUOUiB4ne51yogw86CDbLUpKiqT74KHSf8xYadOthyae+tGX9QMz+rJEUMLEHo2XwPR/QVEryStuJcXK0PQdt6+MPf1LUqDS59wpn8m20s2m8WCNOi/jazoVsBHgTfaBtrg5KwLP+hzHMSSD9el2EQAv/SJbNm7SslaCW1Ricdj6Y/1mj8EDpevIEVJZrczUBxNlziMPS0XpJilow9K/GqvHSpt0177aoa0SXGWqPv1MKsyKOB4nS7zKV66ycmbJWl5lnlS3YkpFHyZJW3MH2jz6PQZfOBNpyNgDk4yR51e/+lUj8iyxOuecc2y3LMaRZGNJiGCExDmDoPHhkJ253Po2RIg089Q4vGdjcRo4FtV46gqycqTj1LfzpAMMxFhTecMNN8jPf/5zUz8nqqNgPjDwYEcYl45U+SWVPF+2dKls3IC0my/DVTo3ahQFXshG7zNG36NJ6iCqUvY0Nm9YH1fLEk91RZU899TTskfvXnLY+CPk6OOOlV8rd/7Qw/+Tb33vO9K+YwfZtm2LGTdVVuDiMiKdlMCQPFxs+mGlx31OvvTvVKpK1Ct2lMuiefOkFOKvdQXhN6mdddlaR+vMTaf35U7fOyQ88Mou+sMhoBjtFf1DnE6lTf7WKoMy/6NJsnLKdNm8bKlUlm7QATJP2u3RW4YfMUEO0zbUf78DpFCJLvPqXv5dBDAQ8ci5i9Rv22hWVcBLSXH7DrJs5hy54eLL5M7f/j9ZMP0LKS/bZoSU+frk7c+7n6+BYMxGrNBPW7RlvzVm4ome7bkekHu3a1cQiK5Iw1w6e46VeyeVxgrYeFu/oP5Ym7znAQdJG4zXdlTIpnkLZNv6rbL/BedJzZC+EtFv8mvQsuRLyaABUl2UJ9vWrNCIidFX8MoQrl+2UutZ21CNtqGqGmmvRKc6g3PuTQkwfbNmzTID1oa464UoYxh64oknyj//+U9zRgJRZo02S8BCNAyhtXYGwQCBRMn2bWzbyJxsQ9RCfMOuUlhJsj6QcFD5EjaE0hGSWgRFRy7/710B4TAXzS4wWGTjIhCiDQeMMwH2gGbvbFRXvJtWvDqoTpk8SV5/7VXpqtLvhZdcqt8x2HmPGWQ3q0Q0+bNPlRnZoQN2nrTRNBx08KH2vkfIIjLj8y/kpeefl0OPPEKOP/lk01ZQJm00fcNHjZQ+Kv0/cP9/ZYcOzk7tjuHTunVrLS5PXiTShAHZyi96rfDesQvvgILoIN6+S1dzdsKABrEo3bxJZn82WXYwqNX6Po7YtV4oLbLffOvuU36WGt9Hvkv9EVHCUyjd+w2Qdngs03LD//PaBfNl2aTJtsHGopkzZPPqVbauu6hdW6lWIod/6a5aHsVtW8vm9eukRr/Bqt3l3zMh88DdVioxd2X9u7YzL38R2bJpg2xctFBWfjFdZr3/kWxdv1bat2lrfruLNC5X//72R1ExxcAStG16sKf1jrIyqd6hhE6ZK9ypVmn9cOzYplLqtjLZsXWrMWQUAnVaK/9RsOVmmfaFD/77sFSVb5HRJ54gvYYOYwm0AeaiYke1zHz9VSlXJop8Vmi8Y750hux/1peldNs22bJuDQFJ7+OPk6qt22T9Z59I1fbyqC7BQ6ES8PajRkmbfr21XPhXINWbNstqbXt5ZhlfG7my1s4WqGuWRj6v/Yppubrg6hzCiyCCwRi++K+88koz/HIE2bWHEA1DSJwzCAYoCAVetGikcJOoVFkLiLU2z+sDJGbcbeKnluVYbAUJ4UZypQO4uVaQ6Y5AeAyS7O4FgT7++OPtYFs6doSBYPMOh39gDgK5xkjqww8+lHfffduk8dPPONMG09hn+pylMB9/8qESaQzq8qW8fIfsO25fGTB4kL1CeTymEvKChfPl4su+Zvs414qXtCgT8N//3CdLFi+UdcogIeniQjNf84JKWBPrpTf6CSIdBJM5S7uIgoHdwR5FDyy1u+3Rw1Pb6qC2Y9tWWTp/nlRs9w9qjgB6B3/9QIrkpkVn1145+N/zX/Nioaa/S5++0k7Lnc+wJN64coVsXrlM86VEt7JKyjZsls1r12v7KJJWGHQpEcdJS5vu3fRapUT2+VYC6eWSdMXLgV/F+k03LdMSlTwpI5PSlWBuWbJMKpUJ2bZpoyyaPl3mT58qW5RIlrRpL63btrMtG5mvhoyRd1yd7tBB/rPXX5cPn35Gpr3ztsx4f6LM0/pf+MmnMu+jj2XuBx/IrInvKcGfKNPfe19maRtfvXK5dO3TS9pFbQ8SoUmSJdNnyrRnnpWC4nwZe8rp0qV/P80b+4970yvtOnSUWcrgbVq6xFTkRZFq2RopkMMvvlgGjhsjBSWtZPWy5dL3kINl0xezZcucGcZ0eWych3xlL1oNGS7tB/bTX1oOWs9V20pl/bTpEinHx3ZttATijGU2LjcZp1KBeoFxx0aFsQCHRkyBwbQjQDiGONV4ECI9hMQ5g6BBMqgxhwrxgkDjcg/1Do0e13YYRdUXEGS87OClC0kaww2IPqpgCLXrEJmGyw/rsZHaMepAgoYBcQTZnVPBiIkSjw8/mCifqaSCRfjJp52mEcRlN8KBqHz04USzwsaEB+OnDh3ay8GHH2ZxrFZG5eEHH9DBslq+ceU3tQzaxOPWSLjGaOrj9ybKmjUrbV9o1OjMZ//oup9KP2U0tigxxTMWAy4Elg+9VBCAheQhGh6wv/oHdXx7Hfy7KwGxXaP1+3INb+XiBSYZxskwV1z7vneI39bwo2fjDGq/57+GOCM5d+3bT9p07coNsy4uXbVaNq1YrkSoUpkfcqEStTI4pevWSxsdKFt17Cgqp5oLzmJl5mAktimDp5nXMDwGwsVDSbBWuEPvPtK6c1crY/LHsrWtGs+WNauMgEGwN69dJ0unzZBFUz6Xrcr8dOzZTSX2VlKojIAxO9RDpEbKt2xS5mGlbFCJfs3iJbJo8uey8NNPZLESAo5l07+QDdon2G2qY49u0n/EcOmhjFir1jAWtUrAg4Y97b33ZO4br0urrp3loLO+ouXRxTbH4HVjRgoLbLneImUAarSe0RRs2rJVDj/ny9JRCXmPkSNk1fyZNp9cOmeelK1drfnUstP3YvXBvHTXHtJlxDArF2YDKndsl63z5kmlb5rFoSkT58T+GdRf+Y2m73VlphAAgsA7bFHJ/vgXXHCBXHPNNbbKA8kZ41EXZlD4IRqGkDhnGK5hcoZwIj0zN8s8LlbQEGmk4aB55FSg0UPY6Ty4z2R+aNq0aUakMcKAgCZ2Cn9H4RrUt+P485PqnArEvE0HyBdfeEHmzZsrxx53rBx86GF6N04cCKdYpcN1a9fIJGVCWL8LNurgf9ZXzjYGZPqMGfLGa6/K+KPGy4Sjj9FvlFxEA+BEHrHSnj9rjsyarRKR3ffU42eff54cNv5IOea442S41ke5liVL3vgGJsDedZKznvzpil1rGvC81bX3HpBmiajEBVFetWiREYT4m168DvErH/Qm0fHMxeF/r9Y3UeLcWQkn1tikEi3A5tWrpVSl55rqKn3FkxwJq1Kl+KqKHdKua3eR1iWaxxopyC+R/KIC2bxK3y/DAIoYtH3YV94vCHG7PXpJmx6eZS0SFXO75Rs3KSOwUhmfKiKw95HcN69dJXM+myQzX39PKpRB6KgSOtbdfAMD161vXxl+6CGy70knyUEnn6RpyJflU6cZY0H1FnXrKKde82350g9/KHsdOV56D9OBXgkzOQlqV6Rp1kfvy2KVuNv3HSQHfvlMk9wN+rqVox5aGjLtxVelcstmKdBv8rR8+u2/n3TrM0DylGC/+vdbpHTxCunSt7dUbCzVxon/7Xilw1jka7jdR4+U6kKVo2uUGdKHZQsWyg4t70Q0VeKc2OcTfzvwm/EDH9j43YcB8wNJGW0ZO2Fhec3cMtpBiLJfewcSww7RcITEOQegASNxovpheQHuKmnwWERCcKsY9OoJVOUQaVyCsvyK8OlgSO2oo0Fip2m0jqMj8fp1a+WJxx41VfMZZ50leyqj4k8PxI5fLFV6+aWXjeBwAybmBB3ci1sVy0svvCifffKxXPODH0gX/Fv7iDPDDuFBaGdMmyqffz7Ze6BoW9zKdsQaMGiQFJW0lgEDB8sRSgwOPOgg6d6zu0mX1AFxstUksGATygvi3K59R+nRp7cRLga7HdvKZPXSpUoQaxPn6DDo+5sAaIE+8H9Rq76iZ4D6H4kQ4txamT0+xNhty+o1SpyVaGpavI0vvK8IpqKi3BiJNirt2EIiJTDcL9+0UcpUsvbKy173oAQJhyqtuveU9r162QBN/kzDUL5DNq9Qok4eSbe9r2nCZYeW1/bSTTJfifSK2XOkRpmC1h3bmxe1AiXQSMBFZrSVJ8v1+byPP7a5ZvJbon1g+BFHyoDR+1jcBfmk1K2b9yfOA2rqKa+9IisnTZJ+Y/aVkUdP0DYfl9rcGccj899/X7YsX6YNqlIKMV7r0kWGHnyQLP7iC5n5zDMyePwRcuLPfqwEu5+sUYalYssWLUfWxmsGtZ4LlPC03XOoRFq11jBw9CKyffEiKVu00IzayL8rv6ZAnKkrNGww/vhMYBkUq0DoPzDwzlbF38b8YDxCiOA53yBUsHoDgQLV9bXXXiuHH3643XfjS4jsIiTOOYLrGKiHMbSCE2UjCho70rDbGKM+oENiwEFHxHsPam86JOonXEpCqJN1xlyCsWzlimXy4P336sBcLZddeaV079GD8TmePk464BUXlchLL74iZds8t508btOmrfQb2F+efvIpld4icvnl35BCNsA32ux978JB6lmgzMpHuKyMgkEfZmDk3vuY9IZFMztN9ei1h+yz776y74EHSv8hg6Vr9+6yQwc4mCbmqWv0IAHRFJratH2HTtJ9D5WctezZRQtf3quXLFfChTFT9EUfuBVw2276hDXLp7+u/FcecS6SDki1XTzijOS8RRmdbVrfqPKNAPuh5QC9bqPlnKcDs5JYI8jlpdtk87Ll0fC54wGtAdbTqMKxTIZAeZJWjZZVsWxRgl6Bpb3e41tiM5LLDz2QqtcpkzJ/yiRZOWeu7NiuzEHnDkqkWwsbVjAvvGruPJk58QObxyavxW1ay/DDj5R+e42QAv2NYt4YrmjqErFt40aZ9OyzsnbmDOmzzxgZceSRUqyEh9f9ZUe1bd2wShYrEa+p3K6/C6U6v1gGHzhOJj33nKyaOkPGf/NK6atMQS+VjrsMHmoe3LasXuV5U9Pv0Xq1HTxY8rUvmQZB812qxHnHwvlaTtX6W/sWkemfpkCcIcxvvPGG+fDHYho3m6z8QMMGscXOAyKdDAgQ+Nk/5JBD5CRlhk8//XQ599xzzeqaqTmeZWv6LEQwQuLcCICLhVPFEQfbOGJcwW+kYZYy1JdI8z4qWjY3h0DjQhQf3xBoZ+HdmFA6IZM++0Ql3+d1EC6Uq7/3XSlBJcaAGh1ToQOQQbaMXLtmrUyb+rndZ2Bcs3K17L3PPvL8U0/LhKMmyCGHHqot12M84kOyN0DzPmuRX3ruWe+mBkz+9xo9WsbtdwBv6XveI8A3GLIMHjJERo8dI/vuf4CM0TqprKrUulAGQaW1GrZrUpgGRN/t0rOHLScyyVnjWr98hQ3qbu7YwRGM2nejIL/6wP/MP8/qvw9xZtlWJyWaWFRDMqlzLJe3oG7W61oloZeosvMKiqR19x5SpESQtJK+cmUCS1WijCgxrRW/BqrsiL3HNpOFbdrYtTEo+YW2hKoMpyYqsbtv/AQR8Ktme4WsXbJQ5qmEunTGHL2nDA37gJcUy6qFC2Xm2+9KtRHniBHnPQ87zPac9uqydniJWK1M1+fPPydbVqyU3lpPex12qFmMJ4JyrFJmafqbb0n1ts16p1ClvWIp7txWFr7xrpQrsTruu9+Rtp06KlEukK59e0u/fUZLSY+esnHhMtm+tVSKqrQtDhgghW6lgLaB7cqgbF+4WPIpOyohWt9NgTijPbv55puNIOPli3GENf84/WH6C4GAVSQgsd4caN+oqrGXYaoMmxbGkCBNXIjsI2uskDVoPYANJGVlZtSEcw0Mo3D/6J6nQjrvNCf4GzidgQ5w3HHH2UYZbL3Gji8YkDVEdUQ5I4Vj2IG3L5Y44KweaRrOurHKkng3bfLmd82ITaVAxmFtIdE3KBd+6zCq+T7t9NO8m9zQY93qNfLo/x42ogthhlB5xVg7P4QPIcbC3MrPHufZ1AEGL6b+TRhfjCjowRaU7dp2UgljLzlywrHy49/9Vn7zpxvlzPO/Knv07i2tlJCYRbISK8qyqroq5kHKpYL4o0k2uPJ299x9A+nw3YhlJ3rPXXpyqp71B/PpVRonBwTZVLCJGVJ4t1USZqnSlq2xb9j6UooKpBAjwmi4DtYu9cPtG9bZkiwkc+87ZXY0z+336CmtUKlrm3W59OcPa3x8h1cxYazMWPXadTL3nTflod/8Qh74xc9l/gcfSqVK7URrMUf4634kB3FZueqxcdVq2abhYsLXtVcfs0QPAoMa0n+3fv00ufSjGjP8mv7iK7JD+8LQow6V1u07atQR4SnhtNujhxx87lfl5Bt/J72VUEtRoS1Xo36tHJRJK2zXXpmMtrZ+2wbOaP4bG7Rr1im7neIcXLmxLHPixIn2rC4C654nvlfXdy0V1D2aNBge5uQZX/1lnE1kVXKm0SDN3X333eY4/d5775WHHnpInnrqKbM6xukGa3gh3E4FC8Hyq09aaqPw54triApzPKiQjj32WFtDTCNA3d0QwkqjYv6JDdBRbTE/jaoOSdq55gwqW+LJdJkjOb/y0osydeoX0n/QIDnjjC9Jvg5+GlFsbDa5iXiVALZWqe3ZJ5+2pVSM/LSjZcrYDRo6RE467TTpHPVcFv/ag93Tg7y/rxLahg2ej3PmCLuqBHnIwYdKSev4HKUf3LJDmx5W2cXFJbKH1sG4gw6SQ4+bIN179jTrcOYeC9q2kkrNFMQRtfZ6vEltV2YzGqyXNu9sv+1vHPZb82Xx2R0PqM1jdzjFHioxUALSoWcvKenYwT6EeJaXbpZSreOIEhA/sSUUpGCYieIOHaWNSkKUoVlQb9wopUuXmVGW9413QKjw2IY6H+vnks5axirtSg1tT3Ot/VMzbeucpdpzUuJLoOXdpZ58Ie3zq0bb8HqVNr945x3ZuGGtVFYoY8GhkigW5MMOP0j67TUyWmbx8BywxsB4Gpep8yd+KNNff1UZkzwZfdIp0nfkCJvX3gmkTceQNYsXysppM+FapUa/ZwqAzVCO++kPpFv/Afqt5k/jRdImz7bKok9fGX7U8bKpaptUkgclyDWaM9OUVFXLtnmzpGb7JnN36tVXdiTn+vRD6pZ+/tJLLwWuU2Y8ZT6ZqbS63PImIt00NHdQhoyzlB9CJNoGaNQjjzxi0wR4bXzggQfMkyNMEOWIdgEhIFtllDXiTILhNvAWg1s4MosDdaQ4iPKMGTOMaFAASHoQD7xh2XyffkthQbC43h0aiMsnBBTpkvnoAw880Bx/IPmh8m4IkUZDQXmzTppGhWs+GpQj0n5GCGSjrGuqI3Ln7bfKmlUrZdTofeTYE04wAyeQOCBb/JpHNpHActSImN6HYB6hjMvRyrhQRqnSSTlN/uQTU+kBSqxj504ydt/9pVu37l6AdcCFT/m0atdGRo3aW/YZN1Y2b1gvX0yapPQJKSTf4tqwdo1JqXzh0u+isHvepSF2rReoRv3v2XcuX7EXPUCc2ymDUdKhveUHia6itFS2rWHOmX2I4x+YytUCz5eSLl2NONNuIC5lKnluXrxE3+Ylfzrj12goipRwFmkbgciZalsB8arUwatq0yYp4J6vDriK//Jd6wVNtnJHpVSWtJHOY8dIcZeOUqWidkTp6l6HHCR9R+ylhC46hxsAsrJD2/Gsd9+TRZM+tfQccu450mPQANOiBKFA20ipjj+LP/1UqpX5BxDYjnsOlwmXXWZLzai/oHaUrwxc/7F7y3otp43LV5tKHk9mBfpq6bz5UrNpg6aV9HrfZoM4k650CTTvMXa+8sorNk4kgjZ86KGH2ooRt03t7oig8nRCDDsEsj81m35AiBEkucaWh3EI2sV7jCnsLkh5M4+P1XriGJopZI04Q1zxcMXexnAiiUSF3xQMcyNkmgzjbIPCgGgzd8o8ilN/Y8xAwbqjJYP8QUDx0407UDoWVpMQVOaW6YCJ5VkXKGu0FMxHo+LCohMih//soGVYmcRWlf7/9tc/m7Q3XAfiCcceo3TDGxiDYqWxI129/c7blm7e6tSls5z15bNlr1EqZdXRGSibebNm23pwo0E6sBapJDxmzDjpP3BA2nl175lVshIP6NHs6VPl/Vdfl1LqYfMWI8ptinTwjjJOEA7S6xFIoncqUO83ZwvWnRV24rf9it53P6Iw4tyjp3n/IigjzlquW1er5GwGYV5ZxqJRcROjuVZdu0mrLl28/qYMxdblK6RciRa/axF0/dL9KqhWqVzLvUil7nwGc30Xq+1Iq2JbJlW1aaPtCuXFSHqjZ/tb++zKoVrfKe7cRdoOGiQlvfeQkq497HefIUNlj759zeDN6lXjIjzS54XrFVRZ6RaZ/da7snz6F1Kt7x11ycXSWSWXwLrUSJkZ3751myzVMahsHapwDSc/T0adcorsddQxUljMhinBhL0mr0paFbWWZdMmyZwnn7Ydqgo6qgSt/aV86TKpWbdW8jBDiMadLcnZITCPPvAciY9+jQo7EfTz8847z4y96Fsu7LrCbWnw55cyQOhB24AfcLS7eEh79913TX3NNJjb8jcR0DamZpGcDzrooKwxPFkjzgyqNBbUAEHcXCIoBLcNIZv/Q0SwPnzhhRdsuRBzKhBx3nMSH0dLa2DxQclrTFQ8kjSL/+F8MexAu0DjoXH5O3Fd4F0kPRoW5UtDRGNBOEjolGuy8vSnq7745L335IVnn9fhMk+5zeFy5DETTOJhnjJZmOUVlfLRh+8r87ZRB1WRXn37yJlfPke6qfRoo34K0HloL5989LFHgHAyodL7XqNHKnEfVa988K47mIOcMWmKfPEJVsAVZiTVVYnfd378fzJ833G8LTu27/BcVLL3subPtiu0VPCP8CxYy0PEd7j7ECj77f30wG8lim0hzm3bWv4ieuzYss28flVXI7UrQSMQ/Q9hZklSYUlrabtHb5WA25nUuGPbFtm2bJFUKVNh73lBG/zE2e5qX2RpWUmnTirhFll8HEVtW+vvAqnauEUiFdr+7COPzPu/95a5ac7NwYceWg5FnTpKa9aIs7SqFXYHeTLnzbdl2ZQvpF23Hhq2SuswOhoQafOGRSWr+nvj6jUy5ZlnZfOiBVKj7xz1tcukbedOGkQ81jhQU+OOtIMs/OJz2TRrgUnqJcqIHv3NK6XrsCFSQOMjnb5UO9hGGvp/A45TXn9VtsyaKzs2l5o2YYcyJrJylbecSsH3mSTO1C39m6k+CC5jXF2rLngG406/RsjhewfGD5ZA4W6XccS15VTh7Q6oUvoEXWHtNgIh4ynlzf10xlTqCamZMRlj3mwga8QZIgoBSMclXBAoIMJwcwBI0hQm1oioH1DR8ox3eNdPrDkcMdkVotIYCEqryxPEkzXSOAGASJNfrLKTcXipQOPiWzozTBDlSxhYZ+IaNGhAaGg5vv7Sy6ZF4fthe+4pRxw9QQdrJc76LChM7rHd45y5s2Xh/HlGyA9QDvWMM860Oca60kHXmjdntnzw/kT7zdt8M3T4nrL3mDFSiEFaA4Bq9dMPPpCZWmaRiEqrGmbHLl3lxNNPkwMPO1QOO2q8DBs5Ujr06GruQtkLuKZS26cmwNohKdFBPTD1mmh3n+zVeoffmm/U2gVs+q9hQShZd1ymUnBNVUUt8uhiwICpba/ekqcDdESZiQodvFn7i8W1xUe49iZnX7pYF1xTLdUwGjURJe5tlBjpU42XeeuS9m2lqjBfpecyDatcv9OycPmLIlZHNV48zNUXKTEtUWlDIO702x2VUrZgkSz5+FNZiE/1LaW2i1jbdq0lr8CbByZM/q1ftFA+0b5ftn61FLbvIIeqJNhW2yoIbA+aHrRP65WhXzp5itSUb5c++4yVvU87RTp2627pRRuSCMqWSW5yg1/weW+9LdUbNkiVSsuVa1dLTX6NtCurlHJlvoy+KzJBnBkjMZZ99NFHzT7nv//9r813Mu1Hv0SL5rSHQYAIY0iKho3lmRAOGHpca7IdLeMG40VLwa6O62ggmUuGltR37ATEPXr0aBuLmx1xJvEUANIZHN2ugsrAQAo1OCpZVJaEzfHJJ5+YKoL5VAyoiJsDAsPRkkAHo5My34FKZfjw4eaAhIGoIfPSvAunzcDAtAKSNL/p7KjDOBzq3Rk0bFLy3FNP2bwNg+yo0XvLYUce4RF/hsCAMEl+kRLQtatXKYM3xfJ86dcul2HDR6RWafMhda+XODt56403zViKNBAfBmXj9ttP89QwNX7ZtjL56L13Ze6MmfqLvEXMOG38scdK1557SGFRifTu31/GHLC/jBy3j/Tq3086d++mUqunFSJ97ElsCdLo+d5LLdKa3bJ0eefYa/pHCYmWR+su3cw5hq2x1gP3lGWaT0ec46Fp21fpsrVKSq3YNlIl1eptpbJl0WKp3FRq3xI+wp/3Pmdii/+GoahmR6Zt2yVPGaW8NhqvlqGyBCaFF7XFclml3HJ9p1wld+/z2PcWgaVIL/UZGoQCJabFe/Q0FbdtFanfVq1eqSLqetm+aYNKuV/IsunTZOvGDcqElEhJ23ZmWc738z/7RKa98qpUlG2RLr37yP5nnSWtVVq08rK4aoN7tJuC/EKZ9fqbUlG+RYZMOFpGqKTTRtu2t57ae8/B9Ruv1RbIdmVi5rz6ipSuX2MZq9m6TQor8mTMpedJlabdpGgtm6MaSJwhCjDIGM0yvwmxgCgz/0l/RIOIbQ6CCL4LRo0aVas/+kE+GAec4RcrQE499VQzMMXtbkskzAgYjHf0LSRe4PIZ1Cb8QFJ+8MEHbe64IWAMhjDjVCpZnewqskacARlgIh3pzBVepkDFOKmagZ8GzFw1xmXvv/++NWrM3nmPgRli0xIaqGuY5AUpF+LM9o2HHXaYzYHAEJHv+nKDhAtxh8lhOgJCTd2xBph5aWeclzaQvKqrjFn6119vsXlnSMeI0SPlwIMOVKnFY5400OgHPuhoTFzbVZr4WKUqljldedXVtsbYHgd9w2CvqKxkO0X2yF4pH3/wkRFU3uabHioxITm3bdva1J5e3AFh+eAN2FiAV0rpps3y0Ttvy8IF84xAMsC31TTtf/DBSqS72XtImHmaLwbTIcpMjBw7Vkbvv7/06tNPy7BEKraXS6US0yolfJABJLgCpYRG3FxS9IwBEupi3slHTV3USlp17SJ5ylgghRJ/jeZzu6ZJKlXCjaaHeVUIeSvNazslYpFWRSq975CtSxdL2erVNjceKz99nbC8aPR7Tnq45xqUvV+5uVQJcKVtGhHRvKGmVnKtBFqJJ1JDAZuKKJFmj2etd0ufph81O5Im3S7CVFQvlfy7dNQ4lMjTPDVdLG2KbN5kqmS8jeEvfOn02bL0i6myQ9tMSbu2pp6f9tqrshzpescOaY/zmONPMA9jZtSlifaqMpovH/AsN/Xdd6RaJfz9zz1fBowaGbPw9rcjNAU1GhZz67TTKpXqYR9nvvCC+RandGAwpLxaDvnulTLwoIPNWr5szXo54ttXR0NJD7Qp+gVj1r///W+58847zWkIjDFjmh/uXaaeILT0xVQgT4y7qLmR6Oi3LQFu3OMMQcbYmDH+ueeeM80f4xUMDWMKZcT46K9fPwiDNeDMMfNNfUEcSM2XX365rR23cSwLyCpxpnG4xPuNuzINx0FBXOCI4ESRpl9++WV58cUXjWhjJQ5IC5xOuhxWU4Q/zeSHcmbO+IADDrD5JYg2+UXLQNnUB47pwcIbVfR7771ndgBw34RLfOmU2UplmhhsXn/1VdNuIG3p+CatUM3pv80qdVAHJa0814JBYNClHvfeex856ZSTNbP5RtT9cO1p67atskLjXKztDMv02dNnWPwsdUIKRBratr1MsPrephIQwbCmGu9XqTox2pqVCxfZXs6TP/5IJn/4kW3WwDekj/Kq2F4h5TvKZfPWzUagiooKpVUxdhHKFCpR6qqEcvjoUXLAEYfL4NF7KYHLN7VuZVmFEj9UqJQNw7+XDv56S3u0nRJOm7bSulNXKWqnkmIhUqcyukpM8vMKpaRNOyUqOjiQD7Qdyiy0ViatVT/U2cVSowzO1iWLZftylVDNwjyaV5dl9zOhX7rHdlGl0vKWMqnQ/oW3tRolxpXKMEHGqtu0lvyeXc05So2ml0O5E8lTZiJP016DxbcyLq3ZilLbKI5R8EmOAqFaCX6F9tfqrZuUQUH29/5VVW2X7atXqbQ8VWYvWGTTGgs//Uw2zV+kBF3rROMu1DIpL92oDEq1aQnYtMOSm1CXrArYtHqdbN6ySQ47+xzpaFtuaiwJ77FcDOckm9aslM2LF8hCbUOrtf0sUka1TCV5e1uLiFRWKBHv0LW79Nr3ANnRrkTGHH2MhVEXaE+MgUz3/eMf/zDfBggTjI1oq5L1Vb6jjzO/2bdv353Snoig/PlBeHWF0ZRAemFOMHZj1Q/W1Ox1f9ddd8mTTz5pqmnmjbFW58xYFbQPvQN5p1/zLgSe8OsC3xAeYyBMEnPVDVmaVh9on0wjZbsIChbuBlU0c5uopZHKIAIUElJetpMBUcEFHcwCczMQMlRArCdmjgZu0xHtoIZL+ppLg4ZRwaXnww8/bA0QaRhOsaHlTNlRVpdccok5NmH+qy78+PvXyJy5c2wzi+JoA6b82LPX6lwHosFaF9/63vdsPiwRDFRIhrffdpt5BRsxci+bq2SUZAB3ID9oZVBhP3jf/bJxwwaP6Ou7hUqszCBLX7d864FUjfTVqVNnueiyS+XICRMCOzHvU17z586Vf954o6xSYkFeWhUXKYGKWrxqwJxw1FGJaldH7/6DBsq5F18k+xx0UCwcYIK9pUNPSsAXz58n77/6pnz81tuyYMbUqGraYxhr9L18pJ8uXaUY6bBE02fBEEO8HeYVFGr+NJ8wLfa7QMPXAV4jwwtXjfavcmUkqko3SZESNb7zGAEvOC8UD3la3l7sniANLB5NsJW3faCEWQlhSfeuUtCpk+S1byd5WrdFBSrNG+Ok5BrGQcsYl6K0GyzGIchK3q3O2VO6oHyH5OlRtWWbVCoTWbB9q6iA7cWjyNc81FDVPfeQor79paBNiZTre1XKfLVrVSjtOnVRAq91oOUe6dRBjrrkPDngxFOV8dt5H+EqZWI2zF8ibzzzqJzxjW+aKpx8JIJduFbOmS/v3H6PMgUfaH5rpETT3kbbkfkGt4pDra/9S/NRVq4Mnrav/c/+ihzzjSu8QJKAtowxK4QA62BU2DC/6Wq3yA8asn/9618yfvz4mGDRkkGZwbDAYKMdhX6gEWUpE9rBVGWHPQ4OnZhz97cFQH/kHjQJbcUvf/lLqwvGEPcuZ8YECC9MEeMd3hxZ3orEzOoZaAb14MLLBnJCnImCgwJBRUNhY00LFwThoHAg2Ei+vJPNJFGQFCrqWog13qQgDnBaGFNQsbivo1J4N1sFn23QuCnPZcuWmYMCtAg0btRBNMT6gnJgq0eMVfC7W9cA8earr9ng3K5dW9sEQUOwemXryO0qwVYqgS5QYjd6n31MBeyHERD9z0YHS1Xq69+vv0m8qEmD6oOOukQ77aIFC5VAYN2aL621YxXr4Im07b6gTCDMZaY6zJO+A/rbntCkMwiEy9z1rOnTjCAjBbfBU5gvDTRVDL9YGwzTQZzMbffo1Tv6RnRAiOYfCRkV9DaV9GdMniQvP/64fPTa65KnxIw0OWC1jBpZI9Pv9Jk+wkEI0jo/8A8uqLGVeFAXtiwoWicYfNXs2C5V5duV6LHMSqVsKL6FbwHopReX91c/JezoNSQ8fh39y3/9lLlxs1QmTvxmswuVMhIFKimjB1cBOFo+pJv3leiThh2kSft2RblEyvTQa60QKdL37J9+YsVjZ6+e8zR8iD/z3OwsJTsqpFP3btJ/33HSb79x0rZDZyuj7v16S79he1p7snRycKEwvURljaxYPF/2GDDQyjUQGnepMnbLlaktZ569MF+KtN2WKMGnfVie9B3aYEQZi21lnn1Hlx49bZ/oVECDhc9rmGXsYvzW1OmAuJm6uvXWW41Jbumgn0CEIZ4YxUEfmJtPlzYwtuNfg60tk0nPhAORRy0Os8Q4yXjJdABz92yFiSAHU4S2goNn/ulR69e0iywhJ8TZD5chCAQqHuZHUZu6hd2cIdyopyHkdIBsA4mZQodDgkDDJeEABIKNlE1lNVdQ3pQ1mgrUy6iBINKUeX2rHpUOawK/9rWvxRpotuDSxjnbceUOrBeukh1bt8nEN96S5x75n8ydMd12aUJydLmku5uS1zq+loO//7ufCbf9MNoZvYY8FegN1+88EV7f0Wv/9yr0+uJHYR2HG4CMMYjF6124cLG9p56oNp7DYHHfGC1Fvkq5bB5hv70XpCB66X0XH+iIx7vyEL9Gumdzjk7Sa+xo2e/Uk2XYwYdKh559VKjV1Ov3PHfsmAsPwGi5duS/nwjX7vxIfD/xnVThAfraZZddZoQgKPy6AFFwO0PRB1s6YF7wj/HXv/7VNA71LTO0oMzWfve7361T7QwNgmHCaNm/HwGCG0TePwWaa+ScOAfBJcERbAgJ3BIqIOaL4WoaQkwaAjoaB8QaSfGKK66wiX8qrLmB8iIv7swABTMEkcYIhTlluEckynTgiDMDTTJpM0Ry4A97/Zo18sZzz8hj994rWzZom6bodWxHInVLcyBcDAdeW+TC7tr9WmQg8XcUfuIMeURy9q4V0TgI2872V9/XdLjrZMTZ0hX93oMvAbQx+61p5jr6Hgp3WzcM6L/RALhTK07Lq/crGXE2KRjjuAjz7SKFKlkPO+ZoOfTiC6TPwBHSqnNHKcov9PIe/SiW9kaEI87PPhvdjKUeQGL7xje+YWMQ7n2bQn6yDdT/F154oUyZMqVBYz5LQfFKWd9xyo2TqeDSk4t6yKpBWLogoxwUJESRCX2kVybe2b4MX9OoGVBBQyR5jwOi0pDKqwuECaNAp8Igibjw1EXa0qnApgKXTneGA0Rdj6qGJQDMnaAVgFP1rxlPBtT9Z5xxhi3paC5lkC0klpOTCO0+RRN9zm/WBldoGc+fPUsevec/8sQDD9jOR9rq44SU1/mekytaKJAi9jt6tlM0mhh8v42we5e++/QxnsTbb7Lv+UE6EhGbILAT4dgvA/tJE74xGfxj/2j3PupuLqMcQ/Rz+97i0bO97UuXd+XBXSNp4zY0j7lfLMa1j66dNU9mvPyabF6zXgqLCm2nK9upirA0Xgg631t1BOU7S/CPE4wlMMRM49XFCPMNYxwauy9/+cvy7W9/Wy6++GKb42zMPufau0uDP3+ZBOGiOcXoi+mA+oI0oY7GPgbhKlkag9KfTn54x/9etsoBNAnJuS7QoGngqLmR/FB/I11j9cgyKqz4OFjIXxeBqS8oeCr58ccft60dgyoimxWUTVBWGIpRjqjccPLC0gKIdWIZoh467bTT5IYbbrA5+uaY30zD1htHr02By29tq7RXSqeqytvRaJsS4lmTJsvLTz0lUz/9VCowiLLyqy2hOhjB1oN3eC1K07ShEY8Pvt/2fvTaD78USlhGrpRZcPUX+94nxZIuB+65+0ZAo9cetN1Hr2pL3vFrEGsr9JNYiSl8aSvUq1iaEvISv6a8gokbxnGd+vSVYYcfIiPGHyUDx46TNp06KWNdqIlD3c1L/PeHnF24cYE2wLKd6667zgycggi0n3FGIDnhhBOMQKNa5VmsDBsRdY1zmRgHCQPHKxieBrkiTQbixdcDYxM7+1166aVWds0ZzYI4+0FyOdzSKQyckHA/++wzW7yPgRkExq0NzET2IEzspoXUmG7jg/Bx8D5GCe470hMURrL72YYrT5gerOnx6IYBGQSbORieMYeDpP2Tn/zE5uKZh2mMtDYlUC4YgLGEi7XVFcoYIh1Tjlu3bDVr5Q0b1svqlatk7YplsmDmDNmwaqVUVXptQkOIkomd22dS4gy47z9HEZPAE+G771VZtd7Tm4pa+0crvYh/X5t4xL/X92PxuvR7qD1n7d7xEG8r+rHGbb9i4XhgTbFLT3LiTLoxcNsZVfpRkT5Geu7QfQ8ZfMQRsveJJ0tfJXYdunSxrTIh0nybSwLtwPTRI488YkuAWOrJ2AAoG6Ri9nV3O9JBlJGeG2uuMx24cQPGg/HAgXvx+q4/+B7hC+LMyp66NA2UEeWHtIxGD20DPh+aevmlg2ZJnBMrn3scEGMMyVCLsCidNbpcM9nPXHZdFZ0MNL7//e9/8qUvfSllwyN8JFEYBTdPTiNhudY+++xji+Mh9P5GsysNOdOgDGF6IDAYjmHFiEofgkxn8UvMTSnduQblRF2vWrFSPnj3PZny6WeydOE8Wb9yuWzbvs2kZ1TASNbMtyIVslSH+VJvPS+ARKSWnAEEK6rd1oj5ygdfz02UnN11bULnOTQh/YD7sfrkvVh48XTZO96lnhPImoYTe+aLh9ZNuMTjf5/rZJIzxNme63fxdMSfe9hZcnbPtUZMeme5U1VehZREiqRV9x4y+tRTZd/jjpe++4yS/NZtpJDwLc/el9HsZxVWDhoRmj0c/Nx///12xtiJ5TnYtRx99NFGZJD+XJ00RZAXmFIEIOaGWXmDq1AII2c/oa4vXLtkrMa2hSNRtU3ZMH4iFTPViaaBcZllUxj0Mr425fKrD5otcXbnZEA1S8Viko8bPOcSz62xdpbg6RBsDDEgVhCpZIATZk4JK0McnzgHIKQRyRPC5tbKwSXjhB7HIW59Ne81hUblypUOAlND2mAwWlKj31VQrxUVO8zX9rTJU+TNl1+VedNmyGqVkMt3KHE2AhItK+1dWruxgceBp96xc/eDODniDApj1Fmh9wNrwXffvo9ec99de3GRNs56P0l95tNuo9cg9j1t1Ps0IB3xG3g80wx7PxTx7/Vw9xO+J7+kZ6c2xv3oJT+ccRtwb3JGcne//WWHcXq7vr3loHO+LAO1//bcc7i07dwl6uSl7nEkU3DxME4w9sD4cg9HFkybwQT7kat01ReMa/fdd585AGFsRSDCFgdp/8orr5SzzjrL1PO7CsZq9k/GwQjjEBI6YyVMAGMpxJg1xwg8LUFKDkKzI84NAYOpkwjh9LAC5IBQI+GiGkeFC0foJ9Z0DtbgYpDBYvVURhk0WtYy4vmHzhcEvsWSEA6PDklD40CqxvUm4dOw4Z5DNF3QRtZqm1mlbQnHJCWtW8myhYvlI5OiP5bVKkFXVVbYuxCzwoAeRlvAz3ZQa/ITZ57jlcug95IO175nfuLMdfybuOQcezegPfsdkvDU/0bMKAwkhO1+mBSvB/B/711HHwDf9/YN54RBtnb6k0vOtea8fd8QW40GWVhSLL2GDpMhSgyHThgvvYcOlTbtOhhRTNanMw1HcDljgAlRa059nXbPfDDW4wg8flBvbEmJf3CMZ3cVlBGaBjwdstSJsZmxEQGHMTmX9dZY2C2Isx80MLgwCCgHXBlEGo9azHEw38FzOFyWMWCYcdlll5lqOhV3BpGHc0RqTqdICQuplAYHYYZgQ6hp2EjXSOustaMBtkSusLmAukRNzUCBr++ysm3myKSiolK2KEP3wXvvSfs27WTcAQdISbs2snrZUnnj5ZdkmbapqqoK80jG7ku0qSplEN0BvFp1hNJrMzQdCKCfwJjkzGNuRO+7nzH43ufbWIuJXnvvExfaHH5764HJnxEMe+4BZyesF3ZwYcWe23e+OAx6I/qCf/4ZxL7nOfHxI/66wdKsL3Cv1qBbKx79YXPOFlDt76Nx8oafsTEthpYf6c3TB61atVFJeoDse+YZMmz8kdJDmeSSNkh60XIgPju73945hGd1fvPNN8uvfvUrk5gTwRgGcUZ6BpkqN8Zs6sGNg7tLfbRo4pxux+I9iDGSNfNANDwaIsSZ5UPpqHRxnsJaRJZeNQSEzwGxhihDpDEQwWMZ1zT8ELkHBHnKZ5/I3JmzZPb0mTJv1nRZpZw8UxKnnX229O7VT57438PmyWyf/cfJSaefJr0HDJCS4tayedN62bhxvaxfvVZKN27W82opXb/evI6hFq9SaYCFztT7jvIyfWeDlJWWxbQ3ECyUnQW2BApAYaKXwP/Td12LONdCRMPywjb4HJLY2f7q2UdclTzZ4eDvB7wX/xVPQO3v4+941/GwfJ/EwADspGjgZ1JA/Jpwgo3DaluOu/QbS+F9xq/CQukwdIgcfukl0v+gg6Vbn17KLOOwokAK9WOy6YZGf553Z6AdxCj0tttui7VRP1Av//rXvzbnH4lq+kxgd6uP3U5yrgsUh7/yE38nA05TMOzATWamQANnnuXMM880VRISNb9DZB/UOwzb5M8+k+9f8Q1bU4thl7cMyXveViXmvceOk71GjzTDsIWz50jr9m1lxJh95OSzviwHHHygtGL+Lb/A9nXWzmYEkVNp6WbZsmWz0mZvDnWjEu35ygB8/sFEWaznUpzDVNM12cPJa39eO9R7vlMMvt/JiLNHpDyCFvuW76LtO/a9j7hqgncKy94nDoKLgYC8K/e99x7E0YN3jv6Ovx4D71OuZrQVfZpInIH3e2cVt0Nt4sx77lqvKHz7ofWgP/NatZU+Y8fIPqecKgMPPEC69uorbdq20eTtfpJaXWBq8I9//KP85je/setEIMggOZ9zzjlWj2G57RqahBOSpoTEBpVuA4OTxCCM5UhI3ZkADZy5FtZyI5ljdIFFZNjoswtHc/B//dYbr8ukjz4wIsETN/1LHaCeXq1SNJJ0cVGBvr9FyrZutbnoFcuWS7u27WUPfGxHqmXFokWyeN48WbZ4iSxesEBW6vMNKklvXLdONq5db1tJ9thjDxk+dqx079dXKqp2CD7Iq8srtB140rX+4X80AbVOBv8j/30/HKH1CJW75o8jh3oZJYg8jr8fPet7sYHX9549j77kJ6ic3TVvEp69797VI/Z9FKTEtXH+1n7mR5zw+5Esfv+7qK4LtM/i03yL1sWKKV/I2rkLpKKmSoratJGSNq1ta0kj0EbQNd8agD+M3Q3UCdIzO2mxjNUPnuH6GM9eTAG6+gvRcITEOUPAsAPzfgzOWDwfxFk2FEhwrJN020KmWq6QjGMNOdn6AWZr7coV8uzjj8vyJUuNgnjkK0oQogSA98qUiG/ZXGrLpWpQFavktnHdelm2ZIl0aN9OunTrLh+/9ZY8eu+98t5rr8mn778nk957T6Z88IFM1mPKhx/a9dRJn2o9b5ChI/aU0fseYN9t3VIq5eXbpBqGL1p//vj9cL85Jz4DHkGG8HkLl7z2AOGJfuPC15PJpEaX4gQVcLZ37Xu75d3g5M4JaYu/huzOdx7J3+l776TxubR5iF95iH/mUlUbteOPE3ALk2d21kPTQQjEV7F9m2zSel4xebIsUwa7sHWRFLH0io1O9A2LKZomX9J2K1BuWEc7F8tujGPaDwtqbHOOO+44++3Gm3DcaThC4pwhwGFjxMUCeKRdZ/0dZDjRUMCRsmUcczvJkKwjhB2kHtABZfPGTfLKC8/Lm6+8Iju279AB2is/j6woosXpShUibYQ5Ws6osDduWG/7Snfo2FGG7z9W1ixfITN14C/dtEnKVfLYvm2bzWlvL9tmO2WVbtgoS+fMVUL+jqxftVLG7re/jD30UKlUIrJD36vUw831ufp08QN3zdl/PwZNnrO2dq48vSP6jb+NRC/tvndpcPmPxe8e6jl2STG46+jhEIvDzgzc3k/gLv3Emb++V2pd2/fRKz9Sxe+MvRxcvdo5UmNlvHXxQpn1xnuydP5cad+1sxR26iAFrVSSJtxoYLXKajcC02oICCwrZZ0x0jIGYHjlOuWUU0xAqVW+u2k5ZQLhnPMuIpEz5LfzXIaaG0coLDtg3R5OSTA6cwZn9QHzz3QCNmhHtV0XsC7GIQvW6KSJQR2uF2Mzt1wr7DhxMMfIAE1ZbS/bLi8/97zcf/edsmrZMm/gNiLGlTdnS6+pRai8xzEw72omMfpix+5d5ZTzztV6GygvPvKoTJs8yfaqZnvLiFISjzAgodYOh/nqfsOGyH4HHSQVlRWyYMZMWTF3nmwp3WztByLEB9738egdceLwJ8vOvve8ZVVRYs8R1B603TjTHnuHI5rfWm9r+t3n5gxE4d6HIOKQxb3vfc9vUheFL7xCGAcLj/e8cubN2Pd6mNMRPdx9//OCaPweonPmhK8vuDoGjlFJRHV+pRRX6Xt5hVLSrZuMPP4YGXb8cdJn5Cjp2LWbtzWlgvQl9v/dBW5MQQAJ7WCyg5A4ZwkUK+pot6kEBmOLFi0y37rMH3NmDR9ElAbOu6lAB2DbOPzz1uUzFiaAvVDZ1YslXq4jsWSLeWu2wsQRCtbohMV6y91h3WAqQJwjKvmWK2H+5MOP5N4775DlSxbrAx3p9X5Vtbe8TgtTqquq9VYNnccGfo9420UMRiD1yNc//Ou2Ry854thjpOcePeX1Z56ThXPnSKQ6OpdsIejLdEUGfL3jWSx737Zq3Ub6DhokXbt1l1bFRcowLLd57XIkaU2Ll4Yo9ALGwP32Qo+C9EQv+eEZVBFb9L2A+rc8kq4o3Pf2rqUximh6+cs37kGsfKJhuPctKr1X+3sPntLdgyfpuvfj7/DD75AExL7x598fh8JWpfnSEo8pDvagRuvNlyi0I3kF0n3QYHNisvcpJ0nnvfaSdh1Uoi7GLa+GYYnLDPzDcVPtj7Hya6LpaykIiXOOQDFDICHWEE+kaYg166u5ZvtGiDWEOgj4jmUbNNZdp1qmgFSO957rr7/ewvMTfVTvzuMXO3xBpFFNcWZTD9TybAuZKnzy0RI7pe0ctaNCpk35Qp57+mnbratHzx5SqfVRsb1MVmlZlmvdYaSFv2zm3cq2bpHtephHLKMc8XKJX9G9vC7WuUsXOfDwI2SPvr3lrWdfkJVLlmp5Rgk0Z3vLQ+xaP0WdSrmXtGolbTt2kHbt2ynBbi3rV6+RrZtKJYIWhm7sPvJd2vfRS7sXe6ZEF8ZB4wXcIx071W+C5Ow/15I8/XH6fsCgQGwtXO+Wnb1DHzr4vndLqZy1tIM9j71HeHUTZ96PMRT218svSCY5w4z4n7jvC4q07/TqI90P2l/GnXaqStJKpLVOC/X+rsKNCzjcwBc/zDjLJ+mPieUQYvdASJxzAH8R+wc+7nPQMbHyxgqSddJI1kjbjpjiFefrX/+6LanCw1gqICl/5StfkQ8//DB6JzlICwfEGI9lSNXMmTOntJdKB3jiQf29OwwOME4bdHCc8cU06aQD4pZtpcroVCjNrJHNGzfI5s2b7J1tpVtk/dp1tsHC2rWrZYkyVhv1d1wK9uCr5ejhAWMZCHT3Lt3lvddfk43r1noPjCD42ok76y23ZIl7EMoavchXqa2NStT47i4r3aqf+yiSvl/r++i1n1ABU9HHvvEiqUWYFckkZ8CbMcnTF6f/hxHa+Oex7y0eP0Pi+94RZ9c+Y9D78fgJtPY659j3tSTn+DXfuDL24vc/i8NPnDm76xr9V2DPCqUYy/oTjpXRp58oex50RPSNukF/J26mJWCkMfSEOWfXKlxVQpzpb7QTPAey9eExxxzT7LarDbHrCIlzjpDYsdxvd3bzNxiSMU/MnDUctElwPXrYHteprLQdcEvKOkM8ndUXEGniYL0iDAG+a3GAwjXWmLgXJT2pJOvmimotf3xlr16+zCTnp594XEqVEFM/3vIpuokyMkoM+cdg2bd/Hy2PtrK1tFTWrFpt31dDpO1NB76LdzFcdrYpaStDVOoqLCyQ+bNmGXE1V57WPrx4YoRaT0jOgKdGOGg3RnU8UmVxQZBcpDyKXtr30UsDzywaT3KOvVyj4fIc6Auxa73vfc9z+zD2LPaWnvyq9FiYCrfm2a59Z+8g/ii45Kae7X3O0Qy5s/2NBU06+Mh9GCf0sWx5t63+NLtefq38os+9k/7mBe83gAA7cM/dJz5muVF2836V1l/XIYPlB8pU1wWIMQw3/Zu+yeY42KQwvUVfd1oz/3BM/6fv3XLLLWYFHUrQuxdC4twIcATZD1cNifcdgr5JBO9MnjzZiDMGaLsKBgPmpCHKeCrDQvNrX/uaLelqaUD9z3rlB/97rxHn8tJt0Se+OtEqYniMD9Y10rZNazOyg7lCEsIYEJedSJweOEev+V4Pvi+CCerVU4oKCmXVkmVSXanfxOrXER59N/qNIfothzdQR28A36X/2r6PXici3y85Y2mucGmo9b33SKEEncB9iL2fhDj7JWduxcK1v+QzAPHPTSXuiDP3E/MS/74qMCx//P70G2Ph73O8Z7/4Jp4uzu46GX69dEn0Khi0DbZgffjhh81nAVoyPBFib1IXqGeWKLHVZKpVGiFaHkJWrBEQH4RrI9n9dMH3SNn9+vWL3tk1MKiwBSZz46jd/vOf/5j/8ZbIz5ElLKLZ0CLp8rda1eOVAdIQa9vRdjAPzVxhcXFRcBn5vseByboVq2TLxk3SoWOHhLDjqBWKvhNn0vRJkm/8CEhFFN6TWDo1rKD2589GNNYY0mmvtYpB33c/MXRLI/n2ngPR1Qouek6F5On3h5Qc6b2VGrQRtom89dZb5dlnnzU1djqEGdAHka5pXyF2L4TEuYmgroEunYEQYESC5Mx8cabAAI5kydIs1G8MGC0NBQX50qdPX7nokktknzFjpZApBB2ZGZzJvxGxWiO1Vx/UC88wJtu2dZttpoLVN6p/+9beisL3w8pUCTRuOpnrduEFwYXDN45AQdpIUl1IHqr7ngB5y8uHl894wPH4TENscL9j70cRu2+/PPibraU/em3x6d+gb2oj/gVR+YLb6ZugsGrFr4f76X/Hy0P8jvvFwfv+3w0B6up58+aZSpt+5C+zdGDlFm1nIXYfhMS5hYF5Klzo4f8WNTTzx0hzmZyvSpdRaE4gT8y3jxi5t/zwxz+VQ484XH+X6Mjoy2utbO88UPKYpU14TmIO2wN3KXs9onPEDv4BP+nAq5+z5SFHpCBPajSdzHvaCt9a6QlGklDtQR6zyRFmlDnr72i9+uuX7Mfi55p70cOPKH23w988/Nny3fbAOm/7oHa51H7PC8AjUHYZw07hReG/nyr+ZO04ovetnPXAHjwov+nC1WtDCSv9Fr8GWG23xH4XIjlq94oQzR50YOammKdi6dVNN91k3nvY1J1OvisGXVhut3SHA+Rx0KBBsv9++0cdtUQfgFrja/BAmXIAZYBO8byuAdw+j14b0hjvk8amD9znXrxxySxZOry34gh+q/b9nbLru5EqnjiUSEYZncTX6xt/4vt+lXkypJPfVKA9QGDpd/VlkHmftvjVr361Tt8GIVoeQoOwFgpXrVVRK1HmRXGEwvwVxmIs1+IelqLMf9WlqmagYJnVX//6V3Ng0tLAQJ2n4h/+sZcvXSo33XCDfPrhR1p+GE15ZWkDrV7agK3ly30z/OKGu69IJND+X/lazu63GTq57lfre/6aTMnt+H0OrSb3u0BfjEXl+94+UthvvYYVc+HEwtMLP6lwy6poN/acsPUUe58zz9xzhfve8qsvuvv8sCLTG85am5+c3Tu1wrXvg5dVEY59p+945eU9c+G5cCJmEOae+L6Pxm/XPCP90dcIz/UTbsWsz30gv/Hva58dUhmEET6aFOw12E4Rv/t1AaYQBpsljRdccIEtoYS4h9i9EBLn3QhUNQcGT8yNQqSxHMXYCycorLlkIAlqEqyD/u1vfytf/vKXW6T0DHFmrnjr5s3yzBNPyj/+9hevHOzw3mHw9hMYCEd8oOZHdDlUrfu+aw3LbwnsBn0/vO95JxqpIv69Etr4bSUuHoExJMQZg/8+30cvgT/9KMsdE5KI+PeRwGVGO+XZf+37QfDOIYn9dod9H0ycHTPEO/aeD7XL338dt9yuZa2tZ3+Ze2XsPbQ4fCE4+OsLBNVZXdbaAOtstlu84447jFlOBMwva5uRlNnHnbXNrHPmN1NVgHJLLIMQTQeZrp+MEWeXMBecP6HuftiwGh/+euKMZM02cLNmzTKjFbf2EikbQs2AAWE+77zz5NRTTzXC3BLrEc0BFtSfffyp/P53v5XVK5Z5D2jP0R5Crj3irFd6j9/xkkCk9V707sefxK/0e7/kHD0nwvs+GqnCvW/305Gc/fDdt+/dbz3XJlTxZVWuD7t6jn1Pm+GI/q79PYcLIP6N/4e940u/+97iSSE5k0+7jmVWofcTyy/+NE6ca0vOiljY5EN/KCzchKVkDomSc+2nHtIhzrQv+hRW26+99ppprOh3LEtEEwURZrki3vpYbUG/86vBw/GzcVBXufs1ju69TNVTxogzAzmbOmDyz9IbBn0aHs4zHDC4wYoYTnB38TzVHOCaAHWGVI1VNoMHHD5rnFnHi19u6o+G1xIHCtTZq1aslDtuvU2ef/ppHZCjnY6y8fUQJD9gf/U+LZjHNtBDCaLwu4aMXWlYSGLA3Yt/78HKlfL1RRr/XuOP345JzvZ99D7v2m/7pdAftb6PXgJHqHnf8ovkr//8QwLpiX8fLDkD7xx9Nxquh/gP4kOSdeC2O3gv9k30E17lfcrItTd/u4sxGlHEr33EmXfce9Gw9KS/+Us75oGm20ecveceMiU5AwZy+hRe/PAExgExxjUvnv8YE1uig5/mDPoCtI26w4cBh+sfLJ2E1jFmsoQV98fQO+rS304biowQZxL34osvyjPPPGPeb5jLZMkACXa+YYkGwoxbSIwb4BI5yAyNsqEg3KCCSHY/RHpwHCFlaAOWrzxbYtkyaL7y0kty+7//KetWrbYB2fKoebXROgp3n9tGNPTsvVajhDL+YiBxBuYJzAvWhmH73rvh3uPsXfOX+164dh8aar/0rBcWTrR/mSezaBLcOxZ+9JKzn6DZ6/y2i2pLP5+7bLg6jr3Pu5ZO+0DzGH0xCi8f0fei9/wJ8L6PP/MTOvIY/0ah79kNPTuCSplamUfjSSSU8e99DkmIj9ej71v52W/Ki1Cj4VXTpr14yJ/7PlFy9p8d0iHOiX3GLalibAyFlJ2RWF51/U7Erj5n/GPqD+L70UcfmdC5ePFi+823HNA9aB3EGwEGjcchhxxiq2XYu2BXscvEmc9fffVV+cY3vmEbcNcVHAXCgUQ2btw4syQ+6aST6vQZ7eAPnwKkYfsLmeepCj0IQd+4eOobVojmiZUqNf/l5pvljVdf0gHckyCB/fU1aX97YGyPD9zahpy0rQgmzgQUD6yWD+jo4RD/nnCj3+jJLzk7WB+w96LQd5JdJ5PLTK1NGOSPth+Nh9+1vo/eBzZPHb0Grmz8DIQ/AVZevnCJx723E3F2iH9uZ9tOMgo/oQfxax9x9sEfP3Dpt7T41dq+cDMpOYeII9WYC/zP0h3T3XswPs4VKto+N2cPXBypwoOu4MkNpzEInBjxQYCBP41BQNC88sor5Xe/+50JpruCXSbOzJv86Ec/sp2QnLSVLhhUkJ7//ve/yxFHpHYeTzI5MFrCRSVedljUj+ocwwl8PztDpXQq0sGf/fp8F6JlgSmZh/77X3n4wf/Kdgx2tFlYe9AzA/LO+xF79+Mthn2DfW3Jfc+1HjzxfkX7iPs+/kmtgT8uvRGv9xK/HeGLh+f1I+7EvteH7pm75n0XX+yZD3kqOZNcntn75NfyGR8Y7dtYePjcjkra9lTP0fdgOtx93ojetm/NQEtvEH7t/MbLtxai8QGTnPVb+01YdjcO916eEud4/L77fMMNA/F7PyzdUeIMajFW0XTy1MWXGG5InOuPWPtKADTEf98RWgekVWgAU3C8x3NoAdNwrl1BkzBwhaCyNwC0gV33WErqpuZSASn5F7/4hdkHBBnv1QWmKm6//XYz7NsVrcguEWc+RVq++OKL5e23347erR+QmH/605/Kz3/+8+idYBAXczX33HOPPPTQQ8bNUDEQZFTl7HV82mmnmSFFXSAsdoKiklFLQOSZ6+nTp0+M26EC2dygbdu2VsAmndRRqSGaL+jIU7+YIrf8+S8y7fPPvYFX/xiR1B5iZEj/uxZAW7DB3v3WhzHJOeE9PxyhBflKEGLvRQ8HR5q9cOPfEKcD17xlbdPei8IXv4Fv9AbvB0neACLEN156kaL1s1r3PMTjV6IVfc6tWDlQLn4eXT9wX/NtbcnVO0AsBgswOC+c05Wc/Yh9Xyt+4vCljT/RZ1zHy5/k6HtW37UZCsDzkDinhis/d4YAc0B0IX6M49ynDzLGQ1zd+zDNSLFcA55htOon2Bja8R7gOwg3y0P5BvrAMjSEv6uvvtoIpl+SDsKkSZOMprGdb0OAVvjmm2+2ZXAwAw3FLkvO6OHZ1qyhxBmiiCXwbbfdZoQwGaiMRx55xDga4vQnm8GJwv/HP/4ho0aNsgpKBhoFhP3BBx+U9957z+YQqHDS0bdvX5sPd4QYTovwIPisOeR3S7VW3t2BQdjWLaW2jOqft/xdqqsqYgOEkT7X3vRE7TN4M1DHW4JPcnbvJGkndtfC1etouNzzr7sF9r29F78Xg97yvvfav73notN7QTFbHFHJOxF+QpcHdY3EKWxsuZYfxKdH7JvoASib+Be+d4jDF89OhC6af/0b/77W++nPOfsR+16/iYdXu1y5R6q9+L3rRFh8vjy7+EPinB4gwkilaD5ZWoZBHISQsZ1y5zmE1lzgUs5azxhd+X/zDkSc334k/k4E4zZ05sYbbzSvianw9NNPm2oaV8UNgSPOzD3DCFh7bQB2mTizMQIZefTRR+ssoCCQeLxZQVjhMggjKDNwWCziRwVOhSUCn9L//Oc/bcG+DVZJQOVfc8018sILLwSG4wfhkD7OEOYJEybIVVddZQS7qVlVJis3P1z9+N9LrLOGNqTmDiTjmuoqWTRvvvzu17+RaVM/jz5hEI4STf3vSodyMsLofuvD9CTnONJdVhVInBV+QpvOmmfSm1xyjn9jc7F6w9oUv5O0CX/67T0O3q0VvxcGsPKKxu/eT4T3fTzcWmXJ95z1HTtqxeO/Tkdy5n7t9Lti5jqIOCdKzt57mSXO6fTj5giIMsLV//73P5NIsXqG0CIsJY5B2QBlut9++9nOYGzDmQqvvPKK0aR0HMYEAQ0s69mPP/54oxMNrdPkVCxN4Mnm7LPPtgQ1xOoaqZSlBO7bZJmAkK5fv94qNAjMRTDv4Cbug0Ahffjhh/LGG2/USZiBU73wLqoVvPzgsxrVi2tQuWhYmUJQ2XLP3W9IA2ox0GrM147UT5mw8y++WNp26GhDt796KR4G6DylhLbG2I3mCq4Yuu0bfWZP9H3zge1D7BcB+8o7LqfG4erDCzt+GLjwVRft0BgM/ikVquYXz/UoLC6S1mxt2aO7DN5nlPQfMVRK2rSy8PmG/4nwDyguXncY/AXjw079wT7ScKK36b01+tP5rCbf9ooeIGV/igfjXehv+z56P34YCddj5+Et/r3mL/ph7Ozqw8pFb0XDjcE9j6L2r8wgV33QlTNjHIIP05MzZswwx0QspfSrjXcVhPXUU0/J9ddfL++++66poLnHWJ6yvjMI4kECh0moCywbZRVRfesCIY5p2mOPPdbWrjsBrqF1WvD/FNHrBoEEQZhZNkUiqqqqrNAhtlynKnwIMy4hsdjGsIt3k2WEMDFpZ8tCwk0Ec8VnnXWWjB49OqnkTINgyRdOAJIR+VQgXhgArMyZ53ZpbWjhZxKkgfIjjcy3uM4VZKkIEtPcFPLQmCD//CsoLLItHFeuXCELFyxk9NJn8fKhPPv06yt7aHvdvGGTr0x57g7e95V19B6IXREf7d39jB6JSLwfu9YLv+ToDKW8XIgUtypRBqO99NC+OWzMvjLu8MPl8JNOlMNOPklG7LevFLdurYNVqZRvL5OIthmvx3ihQZqi2dUfXrty+Xe3k6Xfe4/78SfeVfR3lG7Gn8bPdsS+jyP2jubXPifuaHrcQ07xb4gzGpEvLM6xkcG+5z13Bl4+E8chd+XPrwO/J/zgGu9HlpCYnkyA8CDMaBIROphWRKp96aWXbIxFDdxQgSsRjJmoeadMmVJrDMolyC/Lm1A1d+3aNXo3GNgaoRHGMZObu04GaBgEGVU2tAcPitAzHDe5Omto3Wl7y0xpYWCFjh4Jk7kE5nGZWyCTJA5iyDwDHBqZgbiNHDlSTj/9dNl///2tQFIBYoMh2HXXXWfqhsRkH3rooWb6TgElKwyk6z/96U9m5s51Q8DgDD9z7bXXWsMlHQ0t/EyBTkbZwvmiMuLgHhoJLBVJs0snTMzw4cONgeHgPtMJaEDcb5efXVHJNGdUV1fJu2+/Lf/46y2yaMEClZK9tkY5Dhm2p5x70YVSU1kl9956u6xcHvUkVgueDO2AWtwP+6XlauRDzw4xwhGFlTvlr+H54X0fJVTRR8QBY9GuUwfpqYNqbx0c+g0eKENHjpK+g4ZJSbvWUtK2jdZpodREqmWzDphT3p8oE19+SeZNmSw7NpdpCF46nVobUP8Orh3E0m9p88C59nX0l37u7nuI3tBT7WVZ8feMOYhe+7+3d/S3MSIJbZL7/jvx69QOSeKIq7gdvPKPh8XZT6Dd97ui1nbly/hIfK6/oQFE9Quz7fqnY7QT894QEA8GsTfccIMZ2WIUy5gBiI8xGXe92PK4eBsC4sFF8Pnnn2/jU2OBPDHnDJPAnLMr5yDwDDrF1CdaVuySYGIwLHMOY3iH8XHEiBGmJucZ4yprnfHn4QTEVPHUhYwRZ+ASwpkDAugkVH7DQXFAiMkQ3BmFlm7iUSdDXO+77z4j+oACwjMLBPfcc8+1sF06EkHjYy6AOWeYiYYAgoxqm+VjxN3Qgs8UyOucOXPM2v2dd96xTka5ky46Fel1dQIweGP+3N/h0FqMHz/e8uMA18wyBN7je8qVRud/p6WCstq4YZ3858675YnHHpcKlS5ReQ8bMVy+9o1vyuFHjZf1a9fKPf/+t7z07LNS5Ri9WFtITpxrtRZtj+63EVoOwojWFbB7+jtixBKC6H1hf/Wa+ujYpbP0GzhEevYfIENH7yXjDjxQJea+klesdYcK3her9gwLizCrK6tlpTIfbz7/nHzy8iuydskyqak2xbxGoGd9x4s7Gqee4yFpmn3p5+y/jv2tNbrQL70re1+LyP9N/JpURuH73hFWwiAl3rX3ZozoRhG/9tZvG3gnemnf+r5x9gI7l388z5SFn6BbGHqkS5wZC+mfiVNqEILPP/+81liJ6veDDz6wcY7+ib0LqlKWBDFu7iqICxXz17/+dVNlJ4I4WAGDMOR2xEo2rqYC32BdDXHm3BhgDMOg95e//KWpnNNlNmCMGEv/P3vnASBHcbTtuizplHPOARAiiGhyBgM2OTiSbGwwGAwOn8HGv43tzwZjPmODIzmabJLJOWckQKCcczzppMv311MzvTs7mt3bu9s7XZhX2pvU09PT091vV3V1NYIPP/KEttMJkuQF/OXayHT505R8A1re9M52ApLKeAiW4fTC6FkyPrDffvvZXGcyr6GMwDoQk3q2mcan0wGVyF+1UUZ9kU593pqg90sFotNBYWoKnBQdlJzpCZK37h2xZKeyHnLIIVlNV2vvoGxM//Aj+dMf/yifz5ghE7afJF8/45vaiTlYumg54/q7b74p1171e1kyb54RreQlOy75NqrqwRmUuXLp/XXVzttCVK40cT1RgvWyWXFrfAUF+VJUUCzFXbtI/0GDZOSY8TJw6DAZPXG8jJ28gwwdMdIajmwaAlft2dIAvf/Ki/LmE0/K5+++J2Wr10pNbbVpDJjuxbrGgHhT0qU/d5xiXBV8fiAMCBKlk5wtPPnjHWo++BciECTXdNOqgs9LIecg9FSUQxVLSxqHJGyDU7Hc0zORs/vutFs4tEB1TEMfLA9oGd05ftQ5BAkI1IWDBKiD5557rlxwwQXW1rn7mwLKL+PAtIVR47CkARUwS84GXTA3BWg6STcqc9cBaQ4cGbr3RwBxmj/AlmFWhAkMhffaay9rt5BsnbDSHtCuyNkBEqJw8aMxIsPdh2kISMwvvPCCTTB/5513TJJHZU6cTq0DwtnCB0WdweIPv/vd72xMYVuDNKLCRl3T1Dl52YLGAetDpiIwJNGRgZEUK1RtXL9Bnnz8cXn+xefl5NNOlS/su6+UlnbXRtoj2zWrV8ot//iHPHzvfTZuC614oOH2y1KwcadB8fc9JMubEV2gyAVLc3FJFxmoHaWBg4eoRDxURk8YL6P0N3j4SOnVp4900XKJC89gg5UNXBlnW11TLSsWzJcPVZp6+9kXZNHMWVKxcYOmybOmdfEmYtdb05EzSKQjEIaDRHjOp9wf3E+GS0EoPBqBRLpSnhPcjybnrZ+fSs5R6Sd88Lu4dKYjZ5dvtC0PPPCASW5IqU0lKOJCreocXHCcSGcjQdtJmuhwpyNn1pH+o3ZOIbrmgM4f7S1qcufa2SGcfp4blETZ5/lOI8p1VMkuTYTDdSbDmfAAIAzqZQQpNx7cGA1tW0Grk7MrsG6bDVwSs7kvm+sUDgoJ6mDGyJHAkcSDPVrnVxUVFD0wKgWGYKjOUS21BfUunYnnnntOzjzzzCab/TcGSNKs53zKKadk3Rlqj3DkjDS8fu06WbxsiUyYNFFKunTRxtj7RzmpUUKb9v77ctWvfy2L5s6z8y4GiNeOAg26K5f85RnekV+2A5IzcPuEG7/d9nLymWfJpClTpGuP7tZBoLHJV0mau12smcp9OvAetjVpsV42l5fL0nlz5c2nn5UPXn5Vls2Zpb1hbx6qxZ/Yemnkdp4Kudmx7Xtw4dyxB/+99XymMWdvmxqfwY+PX2Ncebp4EvHpTpTk7O3rnv+evLcblnD3eUdJyflXDUjOSMYXXXSR3HnnnU3Wbjnw3ZlSeskll9h+4rs0ErSBr732mpxzzjm2Gl0YSOakGQdRTq3dHNC2Pvroo/LUU0/Z8CTPhHgRcojfvQek64x6OYZwsU1Ck+feEzU/krI7Jgzp5R7aRHevuw5c/GxB8FpDaGoeNxetQs5NyZDWBOlz0rMD5Iw0iqRND4y5zRQA1ztrCyDdGN0xlQ0Xdi0NKhEGFcwB7Axjzw0BQmMM8aG7/y1333KzlJdv8s4bBXhSMSU+RX0bgjtjxlWunnDsNySc2fewI+R7P71M+g0ZqOcdVbQcMBirLK+Ud15+Wf574z9l3vRpiTqcmEsdQvrx52SXhZxJCaNZ5I6TNOshkVfki+UC+8nwbLOVnO1GH8H7U8e8w+n38t/th2Hn/etXNjDmzBRQ6gzk1FxQ71A3/+lPf7L62Jw2lXHtn/zkJ3LrrbeaJO1AnBAidZ0x2lzVdYiTdpb8oG2FRHlO0Ac1hO2kXMv/Zrxfe0e4TrQIyOC2nMmkDbUJHsrcDymRBc9RY7PSCBWhLREzIN30NBvyipYruGe05W/ZarCGQ6RHzx5ywGGHyHYq1TqUFJfIBJV2jz/5FNnzC/tIMXOKCwskvyjVECWYi478HNwxf6u1QUM16N2QGq5FoM8p7lYio7cbL/2HDvZPeo8Pp9Mh6uzW5SRBs2Rf4v0T20D45HMCMevl4P3e1iPIbBG8P/x8B0fMmdCY5+ayvkCUqHXdmHND6cwE1L2Q82WXXWYGoaxzgJU29jSooLHlyaWGjLiwV8HYlCEyiB9j3mC7G7SZyGW+tUe0CjnHaBlQMelE0CvH+w090JaSaKkodFAacn3XaUDDyDY/TwYNGyoTt59kFt1Dhg+Xg7ThOft735NvfudcOfO735WDDj9cRo0bJ9vtMNmuF6h0YPDbVdsEGqJgc8vZTZs2ymakcr0QJcXlGqbhVmxYvUaWL17iHSg4bYTgHaYgKlVbE4dPaP5pNvzQMdi+H96/7B8HYtZDd0R2sRgJSIT3tw7eceKOwF9vu9V9/o7pKyK+RyKcIl0+RAFpEGMuJMLmgGeiBsbAiTibQ8yA+BiuY1oo85zxsMh49rXXXmtCCeO1hImxbdBsJyQxth2oOPzGjBljPV7M/BlLohGAqFEhBdVVzQFxHnnkkebMHQOMzg4a8Hq/ha/VPJ6OgwU9PvH00+SEU05TyXk76dW7t/TrP0BGaoNaUVUtg4cMld322F26lXZXabhatpRvNlUf7Z9TkTok9uvrpM+AfrL7vvvIIBz16JVguJYAPfbamhqZ/dE0efPpp6XKX5kn3FCnHGk+eI4/vPPBa8kU69bC+cca3OiF2+y8d8zWfva8QL74O7bRgE6ycOli4+4Pgslk3ll+yfjc/cBTi/vpd+/pOytPHAc3+r3c/YdkcEICgVJ30LoxBIUBalOA1En9/p52+nBRDDkn39tPWBNB2hi6w4iK8VzaDjduG2PboVXGnGO0DiBm5kUyTo4hG5P/Gd/hE1PRGB/F+49bwQVwjYVEmOoRRNDLGKqow1X6wxCFKWvxeLMHXGRCqiuXLpd7/32X7LjjZDngkEMlL79ICvyGnfytra2WpYsWy8svvChDhw+1+arv63d46cln5PPpH8vKZcs1IFbF3jg1cA0/94+YMFYuuPznMnWvL7RKg1mvHYIK/f7P3PNveejvf5Mtvk+BYFORIAb7q+ltYPzWYAQYRPJEurWtvX3/uYH77bweN84hCeny8tjuDz4zeA8XfNg5//G8RyI8P80Ptg2NOQPq5P33328uLGfNmmWdsiAweKJeuXeBfJ3FMeSJJ0WmA+VqnrNrE8L7DlHfOkbrIibnDgr3WYNbfoxdQuLsU+loJLBKx7sbx+48lpyc5zpGGxid4W0sl2NQ7RkmObPV/Fo0d748+uh/ZN8D9pWdd5mq5FyYJFf/H9L1ogULVcKeJkNHDJcdJk+W9WtWy4xp0+Xd196UTz/6QNauXO45x+Eb6L3e96iT/kOHyHk/vUwOOPRwzup5i7rFwDPXr14rD/71b/LiA/dJNS4+9R/U5MoHCCYjaG0edMACMGEjryy87rC1+AIROHImbkgP2HM0LYFgifvZ8jz2KZPBdAUXtwDJ+5PkbPf74bjuyJlTtiqXbfWM0/ErvLT5B/o810XNhpxJH98WF8QPPfSQ+ScgPs5DthAvY8CA8xA1KmyGkXg/N2XUvWNrIZivMVoXMTnHiKyATnLmPGo5pOe4kqbCxjz1N/fzWfL2u2/LAQcfJMOGD9crSQkLQET8h6CXLVkqn33+uQwcNFAmTJwoRSohrV61SmZ9+om8+8brRtZLlcQrzPJbY1E26NOvr1x42c/kgCO/aB6/Whp4CVsyb47c+Jtfy4w331ShHqneh99auLLgzmeSnO0vO3qvHROHv+NdT95v8VIevdO6Te4n4NJAfP7F7Cy3A+QMAuGMqBPxhdLPNQVfNXjek5zzlJwXeCezAJ1dt4YxIM38MIaKVckxgojFoBiRDQK9eeZ3M/7kLENB3Jfz4CQ/iABtRLdupTJo0OCUBt/BGnUNXKiSz+BhQ2WnXXaWzSpFLV22zFxjDh42TPY68AD55nnflfN/9EM56oQTZPz2O0gp8z/1XsamN+uPeFsl+/VByxcvlrUrVpinMGCPDZWT4FG6ZHn3kW4vY9wxe6mxeQiXr8h43Y1+fJFh0iAlLPe7nzu2Cx6szKecSB56r6MnGgkImDm61CvqF0aW/JxKO65fMRxico6RFjQU4cYiisg7I2iYyRqk5zxtcFFJNqR2hAQKioukn0rN47ebJFUqSWMHwD3FxV2kb/9Bsstee8s5F39fvnfZT+RLp50q4yZtJ1UYjymZ27NaIfuR7lYtXSYVGzEECzwQQtIEuHcMloxMyUqUIe739hSeqrshpI1XL2RzfxiZ0hmGpdt/X3vnQPr9wybD5WEY6c7H6HyIyTmGIYqEE42Swl0Ph+usIB/IGQzvNmwsk+4q/TQEzU3b4kikt0pOTIND6sbhDYTIeapkl9LuMnnqVPnKOd+S837yYzn57HNk0IgRRNAq+c/CGCuXLZHKLT4512u6+Ok+TycN7v0dWKM50zrNBqLyd9lz9wfjAcFji0PLoBdXgNB1J3l/OIb08OLxfg6Znu9CevmevItDOltNc8SZREzGMdIhJucYhoYaCXc9bkw8uHyoqKyQ9WUbbAw5G2AcRaUrKiiUHt27m3qzpqbG806nURItYQryi6S7Xttlz73klDPPlMm77GL3t0b+QzxYa9dU10i+kbL/UzYKPj2lo6AXICuCuVHdwFUPeiJ5f5JotwqnSL6nhiOA76ozcT/P83dtTJ9tMD1ZIHl/KtLFknLePT/5QjFi5BReiY8RI0aj4IjAWb83ZeUe1ODOM1I6K3hIinnlbu5payBPiXDSjjtJ38FD9SB12lwKH2fRUYgkNEOq5B1GmGjtOHi/d5hAwiFJ6L5MaDj1gecpCO86AjFitDRico4RowlwxIQhD5bsTfX+RDzMaeUXBfecbIgwV4CcJ++9p2y31+5SpO/mgEQcTAaECBlCV6mURSDvF0w1YZPHvkTs/5C6nWo8qBLnl4AeJO7XnZRrCotfExi+N3nM3TR53s9d3wokxv/xz8Ilnrd1/DFitARico4RCSeBNEYS6WyACHBxiLOIpuYTcbS1KTQ49ujVr5/scdBBMmiUvpsmzYhZf7xlMK1Rb+1RsvcLXk/epdAL4XCOE4Ed+78EghHY/R4SW5cu3bi4nIrdA9cdOW99v0NKukiA7lo68kln8sHh+zKhofIRvt7QcRhNLX8x2i5icu5AaGoFTXdfXOEbBhIv3p1aS+XcOqiXwqJimThlZ5l64AGSV1KcIE1HSJk6E8FS4xGdh5TSpKfTla7U+wMIXXCHiW1EeU2fymTHIXxXyjHPcfH6WzvOkP4oNNT54rp7TuR7ZMrviPAg3fkY7QOxE5IOCj5rQw0CIFyNb5DkGgi2rLeK60+siDlmTiar4QRXjenMIJ/44S4Vi20srzsKQddBO/zXb//p++/JHddeI3M/+EjyajwnHq6cOLjy4EpF0FsYsbn9xHX9x+2cJxbOI5G6YpXWIYkF9I/1RjvkPD+O/QgKXETAf04Q3tVUhyTmylMvkK7EEp/6q7f3dcd+AH/fPy2/XdiwExLq0erVq811J/7uXT3DnmDixImJY7YMlbhpee58rpDr+GK0HGJy7kAIVjyMlJhDi5cvd37Tpk3y6aef2nnAeX7vv/++zJ07184RjnOQc9BJPw7xWV6O5eSCTkk6M2hkIWe3nGjHkp49YI3+2J23yWP//JeUr1mbICT7/r5rS1cWEtcC5KylyX4OKeVGTyePCOchnZ9twqTN4UBchbqXSFPKM1LjYiJU8JpDRm9n/qtY/H7c2ZDzsmXL5A9/+IPcc889NmfdpQ/3nJMmTbJ96h1ggQtWmXOOSdDO7LjjjhaWY8JR3nBmgq2DiwtwzR27+ILXY7QfxOTcThCsdEFwnh9S7sKFC+XDDz+0fYj4zTffTPGZjWXx0qVLrXFw8bn76dlnAsSz9957y1/+8hdzvt/ZKzx5hraBOco4IOG4I5JzfV2tLF84X2783e/l45dfkTrtkMBI3tfXv/re/l6iTKSTnIMISp4eGiZnb5sMlwKfKEEmcgbecarkHERB4HQUOVvcgXgbImc6cTfddJNcccUVWa1KRTniGfwoV5A0ayBDxoDz7O+55542S8CFQ7vF2u7YQXDMech70KBBdh/7XIPYAdezhYsvWzQUPt31xj6nIyMm51aAK3BsIcEgESLZQqA09KiMqWxsqZBBuM8ULric/+yzz4w0IWMIGr/YnIeMGyLdxoC0/d///Z+cfvrpHZKIGgu+Gd+PBq89giJlxclvAWyjbGZFTf9UaSdu44Z1tkDHo7ffJe89+aRUV2whlBKTf6MF5jhQNrXImQtwvaSl3v958fshvLB23cELA9JLzh7pmwrcO0wiEBc1x3PooudSnhHcJzWe5BxMF0h9vj7LZZRuMZaz+uyH4G9D5MwiFxdeeKHcfffdOauP5B9kG2wnOKaOOvIFTNNzC9agQqdjvd9++9m5dDMEwkjX9jQEy6c096SLs6nP6oiIybmFQQOOFMsKTzi8nzNnji3RSCWlACJ5ffTRRybN0vPdfvvtZcqUKXLQQQfZAu2AcOkKellZmVx55ZXy17/+NUHKLQXm2qKaO/vss2Ny9sF3bI95kSwnuq33ZMg8ZTKcj2xYt1ZWLFokCz77XBbMmimL58+T5XMWSMWGMm8RDC2HjnRZwQpQMlPKp0Zrh5o/0AdPc1ctrP0Lgvg8hMk5SYh+PERsx+4dFDzP3zW60mP7LmztbBJeOO5N9e/l7g8+n+fgFIbwiQ6J/YjXC9UQOaPJOuuss+TRRx/1z7Qsgu0FWwicLaRNHUbi/tGPfiT77LNPQnXeEGjH6OwvX77clpclPoZzhg4davFy7EAngV8wHWE09nxnREzOLQjGI59++mn597//Le+8844RKQUcacuB7A9+AgomY7rHH3+8/PrXv7Zl49z5KEyfPt2Wc5w5c6Z/puXgyJmGJizZx2hv0HJXW2N7tXWsA75B5sz4TGZrR3Hx7Fm2KtUyOpEVVZJXl6/8rdSkxTRIdHkJZ53sR5fRfBrbQPl291tYPZ28Q8P5e0FyJDxhw82Ud39S5RyMixWm2CcMBJoIo0juE1/D5JwqeSM5618/LZwn9obIGUMwOrStRc4NgU7LKaecIldffXWKAJAOCBXPPvus/Oc//5EPPvjABA3AGDjGbJCz+0ZsES4YAgu2EWgDx44da/cA7kFyz/TchuCe11HRYckZgyg+nPu1NjC6+te//iXXXXedLFIppLHZjAqKhdnPOOMMI+uogojU9uKLL8o3v/lNWbJkiX+25TB+/Hj505/+JF/84hc7dKXoCKC42Sei2OnWlR/KTI12Dss3bZKyNatk7uczZdYnn8rShQtlxcJFsmbJYqmuqNDwtUpsejPxiKf+JLrkWskQ1daSs/+4BPLQLNgZj3wT4TQ9nE+Et/Sx9QiZLcfWISDdXOe8wsqeHXO3D8L7u87aOig5cypxv/481Thpd1eS8QfHnLmc6FDYH/+infdS8L8NkDOas//3//5fQru1rUH+YYRGevbff/+MHW2EiX/+85/WKV+8eHFiqctMwCkPP/LflTvIeMyYMWafwXmM3iBwpHjaFc7Zd80SLt7wtiOhVck5FxlI40IBccnmmDEd1C4ufmcchWqFQtCvXz8ju2xVOLkAhlnf/e53TWImjY0FPc1vf/vb8qtf/crU3VHpJl4Wb//KV75iqvKWBGmgE/A///M/Zrkdo+3Cqob+2Hj0UW/LTq5fu05WLV8qC2fNkgVKyhh6rVy2TNasWiVVWyqVbLT+WAQ+EfnHefW+9KnnHVF51xia0b1AE+LKqfdXwxOXXecMhBwIa3+IgDAcJ8N58XrPC0qvia0F89MLAmGCkrOlh2MLnwzjIXB/wHI7k+SM6t+Dxs2uXvzfBuoe9RR7kJ/97Gfy2muvpWjOthVoF7EfOfbYY9OOPfNdGYY77bTTTGIOfuemwpUPnglR77vvvnL55ZfLrrvu6nWmGgBpoLOzdu1ak+gZU6dtwkAum/vbE5pNztweJI7wcWOBZSNwyYJ4UQ87gkMKxQAKMuY59EQZs0VlzDH3IbVilQw5MyZCj+1LX/qSHHnkkeYwojXw2GOPGTk3VaKlp/n1r39dfvvb35q1Zbo8pRNyzjnnyHPPPZfIs1yA51GBiJPODVOovv/97zfKkCTGtgHFAIm2Rjuxq5cvk7laX+Z/NkuWLVgoC+bMlDVK0DVK1tShWq1XVrb0nkQJC+07ucrOJa5Rz7VO6sNcvXPg2N0fnlZl93mH3nN9EC55lExA6v3JrfdLPjNwS4Kcw421XQ+Ec1sP2p74e6ljzsnn24EfAdd5S977d1oHGwLt1AsvvGASKB12JFLe3wkVrY0JEybIDTfcIAcffHBayZl0oc6m84/Ak2vw/rQl3/nOd2wIj2EznhksFw6c50fb74YJIWmMMadOnWpqetTpDQlg4fjhFacN4N50BJ8uXQ4NXW8KciI5uyjSZSrgGsQbVItQYCFRCiqAVN9++22bbsB9FFzGUvkgZCLnuAeybmyyR44caSpZSNoVRuLIdYY63HnnnXLxxRfbeFNTgFrovPPOs+kX9AzTgfyksGLggbGG68SEwXvyvhQ+iD8IOizkTzAvGOtG7URYKjIWnlSeGG0fdfW1UlmxWT544215/rHH5fMP3pe1q9dIXVW1EQrq6ALPBIyC4d2k1Snx9QP7SIeJ5iq4b0TlSZuubAFXhtz9nuTsH+g9QckZJMKnIefg/ZxyYey+LMacXfwGPR9uepNXo8mZZyfDcKA/hcXrz/POhpwBdZXOOoSHMEH7RnuHdOpA+0aHO9hOUqdzSeK0AUcddZRce+21VrdT8igAnnn//ffLueeea4arLQVU2zwn6AY3Kk3kC1bvCD7Bdo72/Oijj5ZrrrnGVOQg3Ts54DgIQW/evHn2PQiPJbtTsQPaRcbkOeY6P9pDtw9akkNyptYms1DXoG7gQ2J9TKFD9UDi+dAYEuDcgoLHY+n54DHHzbvlPATtPOi4eEFzk4kU/a1vfUt++ctfmlEC8bVUpoJXXnnFjEB438aCdCHx/+///q/1CCHqTOklj5955hnrmdOZQcVNeNTPxEPhcvcz1YJCSI+VY84jGeP9yxVKwDMhY8IEC2cMD+Sbt6M/P1u2Zf7U+0RRVVkhK5cvlteefU5efvJpmf/5TKmvpT75ydQdPGiRVMZMObZ06/16Vl+HrTUMvJB3n7+10uGdtvvyYVTCu/vtgge3l63kTF/Bi1d/SoCR9xOA9Lpjf2s3ajvh7rfzpFd3eCfGrIE77x0ltx6S5MzWf33JU45MxGvp8t+TAPofZEvOgHJDm8aWHyQd9DvAMY6CaAM55jxSK2plp1UEWExDLrSrhCNO2tOggyHAPYQBtIEMlzEj5Mc//rEcc8wxdpwJ7733npx44olGjC0FJF6mmTFHOx3gBgzSLrjgAnPoEgTvT1tHZ4O0ZtLskS9MXb3xxhvlgQcesM4S2lnOY32OfQ8gTtTudF4gZK7THtJ2okLnmHYR8sY7IPlIO4qaPZ0morHICTlTAJBuISTGQCEHChwflC3gMc5SOQePbDTIsMMPP9wMtMjwlgYVhzEmeoT0hhsCH5ofH5ceJIUMdQ+FzlVSwH4YXOPHc6i0TpUOEYdV4hRcVEFR8cTIDuQ1ZX7L5i3SRSsljZ5mqOTZ5N7WB+mpVXLctGG9zPjwQ3npicdl+tvvyDqk5TrYxdU3JQDdpekoUMrLLyyQki4lWie1Aa+u5HKSgOv1urGPNvzutfx7PUBUScnZ7vEu6L5PYIpsJeeU+y1uD+kkZ4fk/dFSdIHuOXLmvCN6h2R8SXIOIl36Lax/vjHknAl8R96HLXDvZmXNJ3AHhCC0jk7Chpwx2EIAcmRMeNoh2mPqPdowLKbRgqEKpgOeyL804DmXXHKJ3HfffVm1Y00B4854TnOW41GAO66//noTrujAhIGU+/Of/9wka0ewUSC/brnlFrOdaaxWk/aZthMuIW85pn1G2IO4d955Z3uXL3zhCxm1ndkiJ+TMmC8fkC1SM4XDRZuD6HMCMpIxZ4wgMqlycgXygN7u3/72N1ObUMjp2fLcYA8N0BPbY4897APvtNNOVnFIY9AQjHzMlGZ3PZjvvHMYDcUTo2FQwT/++GN5/dVXpU+v3rKbfq8R2vB16Za+UWgpuO+9VBvhl596Wl55+mlZPGuWVFVUGIEgCQfYRffzpbdKBCPHjJER48ZJvwEDpVLDbtiwTiq00Stfv0E2bdwkGzeUSWXZJtms9Rk1ud3Kj+jsCKIKSM7+eStfunVlLJPk7BC830MyTOr9oW2wHKclZ73fOSThT+Ba4G5FNDlnSr9Za+v75oqcgwjX06hjt+U8W8qlk67debRqkCr7dPxpdxwpB+NLB0j/k08+MWJEOwfZu2fkArRRl156qfziF7+w9KUDamisywkXpWKHnBkChJx5v3Sgk4PQc8cddyTysLngHchL8haB6KKLLrJnZEpHNmg2OfOy9GbQ97seW1sEqgk8W1111VWmhnCvnU0BbSoo2KiZKNA05sxJ5kPiNxfDKleBUIkw5kvvll8UqcbY9uB7IYku1u/5Ry3vb7/+hhTp90JNOHmnKbLbXnvJrrvsot+Txg+ZTcuXp1ttEZCe2ppq+VzL1qP3/FveeeUV2bhuXYJEjIiUmAqLSmTY2FEyQgm5S7dSK5c0HEU0KhqyR88e0q1PbylRqYCy2L20u9TX1isxb5JybQjra2pl9ifT5IMXX1YC12NjaC27Fj+KY2JRFnN1ip+rV4Tx9mhsdN8LAywcP8IGwnHg9lMl1yRRBuHdn8X4s/4L35+4R8k5iJT73fM1/cH7vTAtQ85tBa6dhBA///xzm7qJxElbj/odSZ3y5L4351EbO4M3d7+VVe08uGPaOYSSI444wozBaA8dXFxBcC92PBB5lMSL9Mq8bYxoiTsd0DZ89atflZdeesk/k3sgQd988822bU5b3mxyxgiJubg422ir4GMx9kohYFoAakheO6oQ5Arh+CnALqvdBwteb+n0xGge+D40EPPnz5XbbrlVnnriCamtqtJv5l0vVFIbPnKUjZ/ttNPONoaPP+Rupd2koCj35c0rSvVmjX3XP/4lTz74gNRUeYaVlC5IkHLWvVcv6TtgsD2bcs/0p6pNm2Xj+vUqIZdJlUpBXbt20XSWSnc0Ot1LpVuv3tK7bz8ZOGigbvtKHmp7feDSefPk0zfflpW6rayuUOKiA6L/eK96xj69fEqokUOAnHFK4uCaLe9+0uwfc+AjLDk7b2FBePcnyTlI5uxbfmgY7k255m89JMk5eD78/OT9vKf3vh2ZnB1cnjsipi6gXkYyB658M2zJOLUb+wacd+PmaA8RlBBQ0BLupR1ahKWGQPx0DpgxwvCpMyIGdChR1SMgUv+sPKQB6YKvGL9uKTD2/Oc//9nshVCBZ0pPJjSLnLmVnhPzX1999VX/7LYHmeEcvA8cONAaSlTajONmUxBixAgDiWDx4kVy7z13y6MP/0cqNm7WgqYtt1/vvEqUb1Jzn769ZfToUTZ3c5JK1WMmTLJySHnMJXDMMfvTT+QvV/5WZnz4AbXZyn5QQi0qKdZfF6mtqDTnI9zDJQgHudmIVM/VYaKsW1PV6rVCTWuXLl2lq95PmN4DB8t2u01Vsu4tc6Z/Ih+/+55sWbchQVbenGf/QBHVHIXJmTD2szQE7yH9HsJjztmQczCu3ErO5FkS5BSPbmiec0cB+W55nQbuOsQdPGaLKhwy5xrnGMKDVOlAujgbih/VNvPF7733XtNCQvSownfYYQfzkohDlUzjzYDOA74j0KDmUj0fBMORxE8ngDqf6Z0yodmSMwZIzLNtSdd0QUmTn5tw7l4aqRhjAneMyo5pQPRgkF5wMYdhVEMfblugoQIZo22AnjrTXm76599lukoAOOag1Xbfj1pE009lgqQKCzzjvr5aBifvvIvsOHlH2WHyZBkzboIZYeEOMxv7sTqsoIkU8tFqoEf2j7Fk9t9/8w35w+U/k9XLliTKkVdbuOrKlx16xEs69ZhtkZ0h3SilCacxY/Vtz+GheqzPxeMW6vGeAwbI9rvvKlP23lOWzF0oH736iqyaO98aXLLDi80jSZ5rROrHD3gP4iP9PMERnaWbdOo/L7zuuxuRXL3LtrXzCjap90eTM+EJRxiP2JPXOE88HNebcZu3xy9xf0hyTsbt56tuf7eg40vObQUQKtIv020dOTPOi2V1Np1fJH+WyMVaHePlsKFdLgDXMIf8uOOOS+GpxqLZ5ExmsSLSZZddZj2bxiKYcPYZ2CfD3XmIGAMpZyzAMT0kel4OSMOQsLuHbdCqzp2L0XSQj505D72xtOUyc8YnMkOl1YXaIGNHsHLFCiMnbJuNoQyeytP2/PJHeZw4cZLstufesuMuO8vOU3fRMt29wTzFScjG9RvkrZdelDmzPpfuvXpKV40rP79ASrv3kkVz5sj9t90stYzx8Y/4+FawiI/EE/SUc23JOcg08fxkcIUjHtsN3K8EqJ2O0ZOnyEFHHy3FXYvl1cefkJnvvi/5tV4E9bCZhnMgfne/EWXgOSZt+/vApSWgkFAkE7D1/f7P3jmanFMk58RLeSC+4JnkftI4LL1DEuBd/H1Mzu0K1FfGyx966CGbfoq63JE+9dyhqdTIokW4bsYyPlzmGoNmkzPAhJ85ubwog/X0aMgACNVZBvIYJFfUe6gzOKanwwtArICxYayUnTU1P8IiFbteEedio6ncge8QVYDceXqabpwpV/P32iOsmugPg7DKygobQ1swf4F8PG2azJ03T+bOnCXr1qw1tVlVVaVyhae+s/t8cFzatZsMGjJE9jlgfznymGNlJFbeGaw6N2/ZLK8++6zc/te/ydLFC6WoS5E3dqxxdSnpJrVV2qhgIBN8DuTq7wO3zzZBfBrc1SDqEpKz6+XX871dfLpJxqUHej4vv1CGDB8hUw8+UAaPGiGLPp8ln7z2hqxbslSq66rMYMyIT+MCiedzLhEfkrMeBJAIn4Gck/cn0+/iS9wTCEP4RDgXP9vAeYfEPcHxZ01L8DnE54GHeAeNIWc0MBAB7Zobj3TpipE90rVbDcHdxxaOQgJH+0t9DnqahKSZgsZ0YBcW51fMunHxcA5DOdpHvifqbPjshz/8oRm6wVlNTSfICTkTBRZ6znoP03sKIG4zg3PXIGvm8LrGiETzQkFJGeJNZ23nXrQ5LxwjPVy+Utj4fhREvisSIoUOIw7Xseqc+Y8a21ONkTfzlZRXrFgp1UqQlUqiLLW4YUOZLFu6RBbMm2t5Rz7aTQoIDxMqbe+lV5/este++8mxxx8nU3ffXQq0zCNjou7mOexz76faYPzjj9fIjOnTVYr2PHwloPGZ9KvRB4nGI2cvHu/YB+FMutf79Hn9Bww0K9cSrY8l3UtVIu+qhFEoyxctlCX6buVlG+0Z3MddHjESp/f9S3v2lEm77iq7aEdji3bIn/v3fbJ26WKpVSnWSbiEc8+3dPrnLQ77JeHKlCNngtrz/EDB+y2sps3d72399/bPE9RJzoBtsFPvvU8Syf2k5GxhiEhPhDsNLm3ZkDN1BhJgOhLOmWgHsfLHShltoOtwuTyI0bpwbR7fyR1DvPw4xzFEzg9S5jthDAfXoRrnezJ8yg8vY7STzUVOyBkQDT96HKi3eRmbrhEYEA9vswXxxoW2ZUGBo5BhfY8TExbuYIwVD2dMBcOojon7Bx54YE4KXnsE5RBSpodNGeeYMs6iKgzH9NRGFpLdVLZBPteO6rvvvKt5+JYsW7KY2q6VzScqLctsu2undLvJO8iJp58me+2zj3Qr7WGLGFLUIQQa83tvv10evvV2qamu0pPcnGQuoxnqhnchVcJL7PkkYke6p7cXdesiU3bfTXZQYsWArWrzFq9zoA9mTuymdWtk1sfTZfmCxba+MwRnP4uFuDQefS5juAVav4dMGCOHn/IVmf7aKzLt5Ze0s1JFw5Kos95f3eqtSULMIDlz2nuM935+BMH73S8Iu9/yQwMl7vfSrac9z2iJcMn8ckjGF5jzrOH8aL3wZD8X9QRuUEFD5OzKza233mrzhWngGeZAY4jFMotQ0PGlA4xTC/wgIKC4/IjRMFqaI4gfwGvuOexD0Fyjc+W0xOF0NDVtOSPnGO0HwYIGyTAUgRXkU089ZcYSEDLnIWwHVHCHHnqo2Re0hoe1tgLyinyi44IXPOdtCVeDNK6uo4K6kuEcy1MNO3BAP+t1T582XV544Xn54O13ZZVK0pAWoLJCeAWF+TJUe93fOPscOejww6WrkjzMgITN/W+/9po8cd/9MkPj2azx2yCoMY+366o829R9d+STlYJn9hs0SLbfeSfp0bePrFm+StatWC1b1m6QqqpylRw8lXxxF89wskJJu6aqWtMJker9Go2LFXBsgnh+nhx2yinSt38/eVal57LVK+y6NUqE8xsmwjvJF4THnIGFTXmOFwfY+v5gOP9ekG78WX8FvkMSsNX7+NsUcg4gXfobImfqEeObOGpiCDCqyaVhd8aruNVkahCaR4YCkfadxJ94xwhYfme4HqN9ISbnTgg+OWMs2AjgXxbn7/jkhlzQfKQDVvF4WGPaQmdpBCBbSHLatGk2nkwDSj4g3QSBSowf+bdu3VpZs3qV5RHW1jXVtbJ8yVKZ9sEH8sF778jKFcuN9CBQchEJdNKOO8o53zvfHJkUFhcZOYMtWzbLcm3Q33ntDXn9pZdkzuefykaVzPFlbRYAfu118VgD7Z3yY0+Sc49evaTf4EFSV1svZevWS/m6DVKr6S0q1Jhw86mkRkxXWnoAAK4VSURBVEju8+7w7oeQjJjsnHeWAGzpKpDWUZO3l/2P+5K8+ejjMn/6R1LrxwBIFzAy5KeHpDPoCpM9tuQZYZJIT86kx90HXJnEIjwBDeCuMwTAPRaOuLzTCRCO+PKVnF28KfFzDycA6bcA9fL7DPOceU/Kzw9+8AO5/fbbrYw0BNTclDNU3jtquUCydp1BZqBwnXeAsO17++8Nwscx2i8K/h+rgMfoVEAKxPE7c/Fef/11U1u7oYhMoDFArc383c7SAEDILM5C3uDxB7WjU18FQd4whIMk3a1bqXTXBrSoqFgWzJuv0u/rUqvkt+9BB8j2O+6g94qUrd/guVXknzb4W8rLpbikWLbbYXu73xFaYVGhOQIZOXasjJ0wQXr16SuVNdU2xltdWZUgjjDROHDdhalTCQ7pe+2qNVJdUS0DVYoeO3k7GbvdRItvs6+iA+75iXh1x67oaZOWfRCM83VKx8PGTdCORYEsnj0LlvCuWxj/BjvQsP6hAyH9S4mwwSBu34UJgnvd/cC7P0noILGvAVPDBa4FUB+S6BP3+D+D/+LQ/eE/uNg/mQpHlHR677rrLpkxY4Z/JTMoc2izKHdM98Er18svv2zOPRjjREVOGCRyymLQRse9V4z2j5icOyEYT2ZRDrdCWLagIcAKsTOQMw0rPzQMNKq8M3MpIeGod+ccP+4hDA48GIdmPBrLbYYNsILe/8ADZMrkHSW/sMjG92m4QbUS7uaKLTJs5EgZM3acxuE9w8hb4y0qLpb+AwbI+EmTVMqeLFWVlbJSpXG2Do5QHVw63Vk6GDUquTH2PWL8RDnum1+XL552qkyYPEU+/+gjWaMSPSAe758Pt+NvE4e6Y/v6B3V4r779zF/3krnzlOyT/o+j8gsEOxSEcKFSnq1Ing9tw+8b2AavuH03vY37+JeuQ0NXI/J+f2vHSsxI4iAdOfMcygOdYTxSoZ1qLPhmjqwxJHv33XeNrJ988knrWFO+grNZYnQcpC+fMdosHHHwayy4h0YCabkhSTkMjFiC88s7MmhYIU7yinHAbN6b/KQhxrr9ueeek+eff17e/+ADk3RZbOK1l16Wt954V4aOHCNfPvkUOe7kk2TwsCFSq2080qipxqu85R3DgPALlNB79Oot2yuZTtlpV5OwgwiXB44dsQAtMT6x1MveB+0rB3zxcBk1YZzvhtFblIXnJOkoBJMUfYSC1Ok7LlswV0p795GhY0Z7BOj/osD5qNKbLrxD8GpU+c90P8ETV3Un6vmZQPjG3k96sNfAUUa6WSjZgiETNFzMAqDD+N///tcWWGClPWdVnAlR1xu6J8a2Qyw5tzNQmWjEseSFYDFQQj0KMWAx6DWu6UEvnOkckEdjpebDDjtMvvGNb9i4V0cHecy0QCRnpkaQx84RDoDobFujhFy+WZYvWSIfvfue3HfPPfLg/ffLKy++JO+otMziGB+otLNw7lxZuXyFrNDfsOHDZPDQITJk6DAj/SULF0uX4q5yxFFHyyFHHCHde/XQtj+CZPSUdadUEn/9hRdk+vvvSZ1+7hr9jsHQdq+yfXG3rubzu7ba2RF4jFJQUCT7HHGY7LDrVCnIL5RCLTeLFsyXVYsXm6W1Fxl/PAJNxO3v2EYveCEcaqUSyV/zqvfgIbJo5myprfS8LxGH5ZZPnN79jDm7sooMmuxIJELx357jrthrmUgBp7izUVu3DxLn/R0I0+LU/1667HQynO3xI32p6XL7dqMesDkijeQMeH9XL7HypzzlihCJB1Keq2ULj4iMTWfqnERdyxQ+xrZFTM7tDEhmqLToLbMu6cMPP2zHeLlhzjhjojQEVDoqb7jy0YtnZRZ63UHn8ZkAKbEW9sUXX2yGKR3dGQn5BhljKEdHBPUzWzQHDjTgtLFIM59Mny43/uOf8vhjj8r0adNkxcoV9g2Ki0u0E7VSNqxdK1s0PlTKODJYrR2rkaNGyhCVmkeOHC0jRo6QUWPGGDEPwQ1tvk8eYejzOLtx/Tp5/on/yrzZM6Wkaxf7js6Iiu/Nfs8+fWX8jjtwRjbpM7079ftrJLxft949ZfTESRquj3TV7ztg0EAp31QumzaU2fSqriqVE45x6gT85xt0h313zJbpXkXaGdhh9z1l8by5UqbvGVTOWdrcvr+X3KZK+a7cct3tRWxStvaz+0Jxua2mP5EaPWlh/YtsXDj2vKfyS0POgZOZyJlnUBZwvsQwB51pCDUbw7BsQYebKVm77LJLo6TzqPYhRttBTM7tDIxd/uhHP7Ilz5iWAXG4JSmZc8e60JA0SFfxMFrifu6lgoZBY4KkjAEUpHzSSSfJd7/7XXOj2lnmX5KXaCcYy2N6GQuoBzsl5BuahxWah+++/Y68+sortk++7X/AAXLE0V+U3XafKrPnzFbC81boId9qq2tl1epVtoby6NFjpFefXjJMyXk77fQMGDzInhEeO3aw03X1KmkvlBf++6SsX7PWnJkg7Zr1t39fj959ZP8vHinjt9tOZn38iZSXldk3Zcx8yMjhpnbu3aefjFApt++AASbZde/ZW3r27Sd1LDFZXKjkUSlVWypSjM7cjm18ok5cU5GWx1eWb5GpBx5k1uorFi6y8XYXxqXPHSdpm3PR5Oye48Hf8zfu/nC8bN0+SJz3d5LHyVDsJY+C+8nx5/DWoSHJmedQLpiCiO0CVtjm/EXrIdcg18YOMQXBt6VuUkb5llEIEjHPQj3uNG6cJ44YbQsxObcyXCUJVhaH4DUQvo6Uds8999j0J3reLhxbjhk7hJzd2qjh+wHnmAbEdAzGU5HkqKBUTq7RgNOAnHXWWbagybe+9S05QMkG/+UQh0tfVNwdCSxeQd6Q5++++44cdPBBtqIThlsbyzaa1eyLzz8v773zrhQWFMquu+wsZYz76b/Tv/pVOfrLXzIra+Y5L1aSck06JMT0JaTneiXCocNH2LKNgwL5mxY+US2YO0de1Wez5GO/gYPsfPmmjd736z9Ajj71FDlaO1TLFi+T6e++pwS7WfoPGSzjp0yW8VN3lR333FPGb7+9eQSr3FxuKvn3Xn5Z3n7xRVkyc7asWLxIVq9YYfOceV4iRUGi1J3gNZLNuzNmPvWgA2XDypWyZPZsqa+FdJLlORg+GF+YnB1SOyqUO29v6/uD++4o+TxAdeHYS40fwo/QC51Ecj+ULj1Atc7PP0xLzsF6zA+CRvXMMolf/OIX5dhjjzU/zKNHj7b6S1lDM9bY+gUhH3/88RZvJpIlTkgZC/CbbrrJ2hE6+1h/Mz2Q9DXmuTFaFvE8520AJC4qIT1mJDMcDTTYMCvo6WJljSOQKLUYRiduwfGglBcFKinuVhkHwyMY4amckyZNMvUYajik5M5AxGGgJp4za6YsXLRQSrt1k1tuvll+wCLva9fInNm47FxhKu5xY8fKCCVX1j3u1qWrvK8kft/998mOU3aSs7/9bfted995p/zn/gesAcwvyJMe3UtlvHae+ihx9xs0WHbfa29rnJ1Dk4byu04b8CcfeURu+MMfpF47CiPGjJPyjRtkyYL5MnjoMDnq+BPkmNNOVUm4lyydv1BefOq/8srTT0mZPr+LlrWiLiWJ8mZzdvVHeVy7drVsWq8SflWNrX6VgF4PpsapzzlPsMS1+lqpz88zi+1v/eLn8vx9D5rHMO35WRj3XsnwKhm4uBTZOSRh379pq/uT4VLyL+iQRJFQ/+uvMI1DkmB4xtITzwwi8PyrNe+bAzrHaLEYRsHQC00NPp3RjOFNbN26dVZfo8C74r3vb3/7my0IlKns0HlnCiVDYsTvpHU65Keeeqp5ABw5cmQkwYfLZWdsF1obMTm3IshqGml6rvyQzJBicTRAxUI6zdTzpbH/xS9+YY5A6GWHAaGy4Pjpp5/e4NgTaaFy8qOTQEXj2XQWnBTdWbFUOyvX/fGPRsKTJk2Ul55/QXbebar0HdBfRo4arY3h9pbXPVghimVINa/w/LWlfJNJ1KtXr5Gpu+1uqktWrXrx+WflrTffVvqpk0l67+FHHCElKu1UVlYZSdPRgiyDa41H5T81tVI7dQ/dfZfcdMNflVzqZdLkKUbSy5YvVWn5ZDn6xJOkP9K0gkU6Nm4ok8+mT5MXlNA/evMN2bB+nfKVV+V5Aj+O7Gm6Y4SrB7i6NOg5fy91X2HOSfx9SIx4hmrH44QLz5dnb79HZr33ro1xA9fMOEnYyDBwfxQ5A+g8eV4Jwd8L3x+uNYn80+cGCT1xv/5wnuLCBeMCyf1ocg4+v7nkDIL1kTFpftiGMNeZ6VMffPCBdaIhasqLq6t07NBwYaiJNiwT3nnnHTn33HNtKmUYTMf63e9+ZySd7bQs0kz+uW2M3CJWa7ciWJLsn//8p0m3GGRR6d544w157bXXjKgx6shUwaiQqKKZohNFzlRUiJltNpWF+CAF1GJUSAi9sxMz2LRxkxHy7FmzjUCHDBsuhx52mBx2+OEyRaVipFw6VTa+p3nlzQsWzcMS6auSI45DZs6cldCM9Ozd26ZSQehFhUWybs06Wa+NbD8lbxyB0Onih+U2DV3ab+CfqtE0zf58lqxdvdbU4cNGjJD6gnw5+pSTZMToseaikqDEU9yli0nUo8aNlS7du8mqFctMHe65EfVox1LPc+0uv6ENPN/2vIDWwTAC9+93I6V2pPcM0c7LuB2nyEyV/tavWqkXIEAvjIsx8W4Wn7e159rfrcO5Y9vTAO72rbqxemHr+714Df4OG4g10VHQrZ2zoyQ4dg5JXLzB+N3zM405NwauPtLhoyywmMIOO+xgY8k4/6EDz7DVnnvuaa50TzjhBCNl7EIwNkvkawQgfQSCf//732ZPEQaEj9YM1bhzSdsQeJ7rdGV6doymISbnVgKVAzKmd+pW7YJg+aFuQs2EwQgr1VBBo0DlpeJC6Ki7iNMBi+ovf/nL1vOlojYEV7FcpYp7v0ngAGTggEG2EMHE7baT0ePHyYhRo2Q7/TY0XI48+Qeh2T+O9WfGVZr/hKOzA+lu2qSNoV5DEnrh2WelYguGe7vLaPOd3M3CQeTEm7mDpN9Ir/Xt3deeyTKV+UrE47UBL6/YbN7F6EgYyfq3W4NfWCC9VEIfreVrxJjRUtRFn6kdCaYyVVfXKH/mSQHP1psK6vUst/tiMePIdbZPI+ytqkXU/LVmmXR6/+3PoOEjZPzkHWT2hx/JGi2jThJ3SIwhswn8PLJPwg+lW+95BkuSd4M7m7gWQvr7PVgyONYd71smr6UiTbrc/brJFTkD993d1pE1C/gzpW/33Xc3v9sQNsNPELgzLMsEyhdGoM9S/iJU5JQTfHljX9JQ+0G7Q5tFecYxCgapDNORBuJJX363RtzupEes1k6DdIXGZRdbCmEY6e6DjOm1YmnN+FIYjPdedNFFcvnll2eUnqlk+Hm+9957Zfr06db4Y529zz77mFEIFTgducfIDqh98bxFh4kxQOYk46Hp6KOP9kM0DDeHnO/FPr81a1bLpx9Plyk77SRDhwyVwuKkhLJs2TIjZr696wBEwcqf/l+p4e+/40554clnZI/991GCrVMJergcf8ppNt5MoGA5tHKpWzx54Tp0U9lGfccKOwa1ms4yleY3rF0nZZrOsvVrZYOGW7d2rZSvL5PqLZVSV1sjrGWN9XltBUMhdqsH6oMS+E5f2Ff2+9Kx8vgtt8qCzz+zcVnOB+tFuHZwnKcNvjtvx96uv++OFBqfHWl86Uq5u9+eFxpzTt6PWtsLYx0Gd34rpKq1E2G43z+dC7V2S4P8f+yxx2zWBaQaBp37yy67zKZLBqcMhoE9Bj75b775ZlsIBkc9xE0Hgs4sBE/HwfkCpzw7NflW5VGPg+UChI87M2JyzgIQK6ogGmiIlV4ivUfmvjJWgyEWhJipYFGosZC84oorLJ4wkLgYO7ryyiuzcvLBmBTxkBbIGTd+2fSgYzQMviO/lStWynPPPSu77LqrzPjkUznp5JNMcm0KiA+Chty6dsUq1mTKxPdi/itAauF7ZupgEReORz7/+BO5+8abtSyUybhJE2w1rFO+9nUZPXFCUkJNgVfVud/b8ny2Kg3VaweipkZ/tVKjRM2cbLQ6nMMCG9LGivu911+R9196Tao3YJlel2Arj8Dq5IAvHisTd58qj916m6xgBS+7qvXC/vrB9YHhcpqvHSIvDqjYCw+8rU/Pejl4F9K2S3/wqxDGhfP2iVcRuN/Oc59GQFpMMRCAC8c7Je4PpAvY+s564g/z2z45AzR2F1xwgUnQrgwA3h+VNsNtWJGnK3vcw9g3caAiD2ruHOhU0h5ipEacqOVpI/Gyhw8GyJq2jmcSX7gcxEgiVmunAQUPQsVLFKqgf/3rX7aqzG233WZ+ch955BFz/oHFM71FjHkyFTQKIiog4nL+lIOgd8m0Cn6QbEMFlwKOlSVGR4x/BitUXOCbB5d/qP9mqHQwfOgws6TdYfsdTEXc1PzlG/Gd8/O9bxWMh84fWhDCQNDpJGeD3gZd9dDvXtq9VD7/9GMzLINYi7uUyJiJ45V0ou73nmcdA931CBxVpEdQhYVFUqjp66JSUBeVnroTf88e0r1vH6ncvFE+fO11+ejNN2WjStbMt07NBiUxPTF5j72lpLSLfPLOO1Kp72QEip7cgWO2GjZ4O+TIIIHt+z8Hl0/ued4GZrW/tvXu98DWfnaD/zzg79jGu92Q+A6Bjb9r8NLlzqbGx/OPVGmzrYP2hHFs1OOoofFUxntTHpF4mTL5pS99yaTmRH6EQOcS7d+dd95pAksUeA5lmWeg2XvllVeszUPaZliP4Tjupf1yU7fSPa+zI5acfZANkDGOJ1j9hcYYx/J43mKfAheVVagiMchAKqbgpyto3Eu8F154ofU6w3ExN/naa6+1nitxRoF7XPzu/rhgtxywrH/11Vdl++22l7eUlI488kgZMHAAme6HyB0wCGTqDMTMOGKU9ML4r7FBTZ3M0nJZ3K1YevfrI688/bx8/NF06aH3IlF/5Yxv2rzmxoz9RYEOKr/PPvpAHrnlFvn4jTdly8bNyMtGTEa8FpJDPVuQJyd+5zwp0vL7xM23yqay9QlrbWBh/UOXLnd/6trUqaroxDvovYklGw164F9y91vYlHQFyDQZ3AsbPNb7EmkKnAfJfdK1tbT4x3ntQ3IGECxqbZwWMRuBDj7CBVKuk2jTAaGCYTemckZJzdkAQkaF7qRqjNxQgyNk0HnI2CntZOh05OxeFyKmsNEoupWHkIKZlM8WgwcKcjaFkELF/EHGfDOphCB4ep7/+Mc/TCInfsKjxv7a174m5513nlUWKgjhgxUlfNzSaO3ntTXw/kiyH37woRTqN4Kox2AgNmliizQglDckCxotHEKky3vK44rFS+SWv/1D6vNq5fRvnSW9eveXZx5+VObM/FzJc6PssMsucsxJJ5iVONSSzWfU17VwbGEj1NlrV62UN559Rp578H5ZMneBeSLzSNAPGIy3vlb6aYfg+G9/W+ZM/1hef/gxqa2v0QbGk6iB/Q2Uq+DtYXL2thpcf0j4fA8zdPMfS0fFvRcbUzF7hwmJ2IN3n4X3DhPbhOTMTyNz6UrtACTjbQ45b+v6HAblyKUh2/LMEBqKVqZr0nY1F7R9SOpI7ngjPPPMM80avSGDtCDaWr7mEp2KnFGnIBnTY0R6Zb4fUjEqGM47n7eN7RUi6f7v//6vjcXQM0wHshqCxpCCH1OrKIj0XJnr7IjZhd3WhSychraQptYEZWGBdqJefulls6JHhTxpu+1s2CHXoOwxnoc0gRQRBfK/YnO5PPPkE3L7DX/XFrZeTvzmN+S4U0+VJfMWyCP33ydrVq0wL2bHnHii7HnAgdK1S9esvhnez/QJRmG4Fp0741N55fHH5d2XXpA1S303r/o/EVNwX1FUVCA7qRQ0Tsvxq/95VFbMZwxdY3PhNA2eFJtat1wcQXKGBB04584TQzIMID4PqeSeum8gDyi/JByQLnYJoNtC0ufnU0tJzsH6QxvDfjbfpq0AQkal/f3vf9/arlwCgzKMyDBIy3autZVJRXvKw8ag04w50/g9/fTT1utj3PjBBx+Ut99+29Y0xrAKKYnC5z54Y0AP8JhjjrFpDukkZ0AhotAhGdEI4yZzypQpNi+ZwukKWVsodOQFGgU6EXQo6ESkU7d3RPANkCggYuY906HDEh6VXEvkg2u4MQZDvRgFSsMs/R6333iTLJo7R7YoUaP5GTlmtIwZP07KNm6Qjz/6SGpUwlm9YqVN1WIKlRvjzoR6lXwhn/LyjfL6s8/KQ7feamPMZavWeAGAXxxdqQyWzgGDh8jkPfeQT997XxZ/9rlfhgmRpFSvPHuEavkbKN+phJhaB915Vx+8v0liBsH7w3Jgoh6lbvS82+GeADn7P4fkPulKfS7IZszZ1WlIDcMsOmIQNAZSlCf3/dsyqA/Yt6D1Q6jBYDBXIC7qGD/WjOc5mfIjmF9s3XF7yMds0SnImeks+KRmqgBzhPG0g4qmqWQcBg3qWWedZSrJhgqGuw6JUynZci7qvm1RyGgwUPmTT1dddZVZcGL4BikxDzubHm1HgPsmvG+P7j3Mmrqb5kEmlXNzQBnFWIZGKZ1kvqFsgzz93//Kc488rh+KslsjZevWS7WS6o677SrdenSX6droL1+40Hxj16gEPU7LZBeVninnVtb1Z1JyaFtfVyPLFy2S/9xxtzykndf5Mz8zCRokSFSDJ97c32GDBftuBx4ga5evltn6/MpKfHJ7Aey67elWGdQUzDzXh8vLdOSccr/9c/Dvs7+6DdzPNviNEvtp0g+yJeeE5B1AtgZhkNof/vAH+eUvf2nDWzgfArjMdJ3zYLrbIhjCQ/VM28X7YDTptADNBeWCdvm4446zaViZwPMI77auTLX1/GsM2pxa22V4rkB89FQZ08V6MJevS0+Swoqnnt///vdp1ZFtCenyF80B83rx60ujwZrPVD5nlYnB2k9+8hM57bTTjEA6C8gvfpQdrO1xAMF3zvW481IlxtWrVsu4iROkW/dSqMK/4oEGEKn5j1f+SmZMm6ZnIAqvYRqnnabv/fjHMmnnneTZJx6X266/QSrKysw7WJ9+/aW4qMQIv5d2IotKumjaNW7qgTIa06EoD7X6ndetWiVLZs+zcWuuED+pKEixtvbJinLEJi9fJuy6swwaPEg+e/t9Wbd6FUGS47a6TY7tchK1sHcxKDnbKYuQe1Efe2Cb2Ce8Xrdjez57gRv9jekJOK3glIVna9e9dCfiUVgYPSY9ibrB/bobJv3EBfLN3iWzWtu1N46YmfGBFg/wLDr2eOXCXgXSY2EMN7yVSEsbA++EVo06gWEZbQY2O0i9aHLQtDmp2r1/tqA9peOC8WUmEC9CBFNb0XzSsaWDw5RSOtDs86OeRuUj97fV/HXo8GPONGr33XefnH322UZAzQUfFGmXSkXvjkr11a9+1VSeuW6wWxqugEPKTHfASQHqNoyfkOSC4J1pPP70pz/Ztq0X7FwDdSTDIKic991335yrtj989z3N40LZfvIOkl9caJJcEDR2b7/xuvyfkvOyJUv0qn9dvyGN0NfPPVe+fPqpslYbzZv/dJ1Me/dtcyPatWt36d2nv3RXqX+TEjZzlcttKh8x+ESlwC1nPUY+NUo6+N72L8DLkZKzHlB++g4aKKMmTJKFC+bJhiXLJa8WQyPqiRcqVSKu07gCUg6/iHKUjyTm71sYb9ffD4QPpccdZBp/9joIPgL3+w7RtqrDqekP7hOPtxxmQ2PO1LG///3v8pvf/MZsW8JNLs/EKBTDKMoWq1VhIOWsl9tKXSPdpMWlny3lks4G2khU3fwwbKRNoTMLcRKGdjgb0KY++uijNuQXhns+oAPw1FNPyd13320ujUkDWi7aZYYKseNh6JD51XSmOe80lcF42jLaDDm3VIYh+TFHGe9bTgpsLKggfFQ+MtNc6OnuvffeVgD4+PTWgCu47eHDY6nOeDvzD5944gkzjqPX63q8UaAB+eMf/2irXrW3jkhzQb7Q4Lz44os23Q2HCrnEu2+9Iz27d5fx203SnhAza1PLEJ2ll59/Tq7//e9l9coVdo4wlDe+xV4H7C/f+cHFMnTEKJmtUsxSTWtxcZGUKHH3VEmsq0rRG5WcZ8/4VF577gWZ8eE08wqmEWh51bhMNamRRpBRlOTMc4u7FMvgkSOlcku1rNXGWZTc4fVgcMKHJWfvOex7CNeXIDmD5P1uq3t+OpJInkg1Lgvcz0nel4PQ/ZCz64SkpIfz/q6Dd5U0Niw5AxarwDPX/fffn5Gk+I4YlNKu4Ev7xBNPtI5we9BUUR54N8opHVkka6ahIlWzeAer3yHdci1dHkCuuCBmha1MWkiehUEvq2gx3TXcrrs51HRuIHvqKq5OMbrFkyI+7ttD+9UpJGechqDWZjwjG1A5+SGR4FwEAsY5CL05LArxgBMeeyUb2wMpk04k47vuukuuv/566+mGpeR0oLCjmmN8nc5KZwL5Rj7R2EDQWKw6tVlTYes4abz1Kq1OnzbNVrmytbi1GDkJ0Wqn/rZUqKTwyCNy4w3Xyzpt+LyrSuJ52qCXlMi+hx0q31DpmeleFoHdyC6U6O/rpqq6UpYtWyLT3npbnrjnXlkwc5YmxCMaP5RJiwlC032e5dUJ75xDj549pGu3UlmzarXUV/tqTA1jRGdHChepgmcgOSfgp9HVGxe95y3MA6kPPjYoOadKtcmDxkjODi5ZJCW71aq4ITvJGekRzR0SYbagXOFZ66STTpKvfOUrVi6Q/toaqTj6iGr73DWkXOZWI1Gz4A/aOY6DzpggU+Y7//rXv5bddtvN3jNdm0o9ZK41Y/dMQcwW5B8+KfA1AUm39Tasxcg5nLHpMprz9HzIcMiTDKPRo/eTi8wjfnpuuMbEyClqfh7pcioRemxMm6HHxQekt4VzEXqvqEUIm+49os63JZBGVE0UalTY9GI5ly3IH6zdmY/YHnqeuQZ5RUOL1T8NJ40J5aYp3524yPmqikqZrlLFrNmz5ADtAFLugvHV+0JGWdk6ufe22+SBO+60xq5Ay2L//gNkux0ny74HHyiTd9lVBg0ZavUmU3pqNUIMyaa9+ZbcdO2fZNbHnyqZkpYko6VInppIvjRxWrw+i7FfXFhs9cnqlMbh7nEq4jA8og1Izl5UifS6ewpSBCtvFSyHxLuRLv9+D8mHuvstbCBdHGqD5x+FkLxdioLe1XiOvwtcmMZIznSGIWe8CjamvpF+yhftDzNBsG3BaQdlj7YxkRdtGLwv6bTyrj/IFBU0Y9RoolD5o5VixgptLWPuUUNGwXgYnsSOGYJOt851OpBvaD1Z0xppOl075p63LdGiknP4BTnmBxlDDIy/4BWJD0WjxzGGKxAky6LxC879bSp4Hr3WG264wZ5Fj42PwodCxYEBAZbWSMZYJDN+DBkzQT4XHYRtDfcdqAh4MsOwyxmlZAvuJ48o1CxX11nJGU0MlttIzzQoU6dOtU5LU0BndNZnn8t/7n9QBg8bKqd9/atbqTD1kfpHZM2alXLDNX+Ul556Rnr27SO77rWH7L7nXrKTltm+A/trveliUrRDVJ0hLmi4pmqL3H7D3+SRe+6RirKNRnJBcsahh4vJSY7EZ1EGos1TMTlRx9kmzqcSWhIQrUdoJgHby3lx29b+6r3JpOiWeL1wIPFepMtPm4fkQTrJmTBpS20gLlbnSqQp5RmpcWUrOdOZwg8CdYe2hzxrLGiH0OJBzgyrQDCoa5lF0V7rIp066hP5kW76oEOinCkgZ9YgwP4lW21oEExfY138888/3wTBMILP2pbIOTmnezEyEfLF+xaSLG4Rcf6BIQFEDXHwobiXgsjY7ve+9z2T0sjMpsKlh+ejwmWcFekRNQrx0sDSE6VRdHN5g4W9rXyopsJ9Xt6BXivu9xjTyTS2HAVU+WgffvCDH1iHprOC/KSzRxnCEAWpCAmaTh157H7p4L4H5XHGp5/IK8+/IB9P+1i+ftaZcsDBB211vx9cOwTz5JYbb5QuKq3upc+btOMO0rdfPy2vRVKQ8NWd+r3DMPm4tkZmf/Kx/OX3V8lnH36oRIwmibDOk5aSm/4hGqIwouWkHnhjstQH23iwcHpCb3CnCR9FF1y3VaI0vD3J0urXL+63iL1nJp/vSc6E5Kr9LLyfTv8c7+bfniBnwpEfLi3eZdLJ0730JsDz/N0gOXM+/C7eleRQwLUNkDNpYCW5//u//7NZEFg1N7b+AdJE+4TAgrETMwdQezPU5obZeFYi7W0Q4fRlm95gOPLutttus6mx5GVjQV6hyfjtb3+bsBdycM+J2qLdhZuiJPuWQItLzjRCFEzGODE+Ymk8yLihwkmG0OhBJKg73IdpLkiT6wS4XzAL3HGunteWQEG+9NJLzcKRPGgIdFIovKj36SRhpJILTUZHAGUEAzqm6TGdhHzBLoGOS7r8ceWMsv+REuOH778vLz33nAwcNEh+9stf2uIV6cCzMKjhOfya0kDUKdGVawft3/+6SR664w6pqWDR/WD1T6bb7Tly5p14rRSi4ry/GwTkGEXOQaLzsshTh9sxv4h8Q+UeVEUn79ewKc/XcP5eesnZv8+BjoK/G4yrMZIzyIacAYZhCAcPP/ywPPTQQzJ37tys7T2iAMkwFo1HrVNOOcX20Tx63yqY6o4Dl5cIeBiEYcyKYNcYkG9IzQzvYUeTCcRNHYe7+F5oyRj2RHvIcENLai1azAkJmYj6AecfqFHpMQaXW8wGqDogBApdUwsb6Qjey77LUHc+3bY9I/zegGMMmpgSlO4bEAZVGWOfBx98sFxyySVm6c74DOc7Qt7kCmhfqKCoGxkmQJqmfNNAkr/OliK4Ra2J1zVWu5o3d44snr9ADjjwANljr70kP8MQCnWBjlKzhlr021VWVJn3MOpmcWk3m/essoC3cpSWGdf4Jb6yHgabH85bGdDz6UpCmNAcXNHx4nBhks+LLFuUY383uFX6SRw7JK4Hns82ZT61wkt/Ml4Hd1wQHB7wfw7JfdLtpf2oBpyQuPfi2zGERmcXtTTEQLnhW0TZwjQEyhjDgdRn7GnQ4hAPGsB0NjtR7UJrIhfP5360ngyz8a4MG7jz5Ikrw+mAlhSNA7Nu0nVyiYM6Syfqxz/+sa2fTz5jHc6QFlwGSbeksNJikjPRQgQ//OEP5eWXX86akIPAcw7jCixl1uQGqQODPEYKI2/CPTj3WYMFx429o5rGGCMIwtF4oC477LDDTGuBugyVf3g8iLhbqkC2N7hvQAOLVsikocoqWzjCGgr9h8SqAflvfq8Bc42f0w5rH20ofnLZZTJ2/ISM5JwL8Py6mlrZoo3Z5vKN2pivllXLlsvKJUtl8yY9Vsl89mczZd7Mz6W2qkJvoM7ynZUI9V5KWKRDkhCCi1B4d/vw4wBe8cmh5Ew4tvqH59uBXi/gWP+5+gBRe+WX6/49IBBXAfsawH7ebQnwfE5pLPrXe9C18+bqtnGgbKANQatIY48FM9bMaLeaQtTUf4gK8kfdjVUydZjjYNsZVXfba30mDxmqQ7LFDgRpmg4yW4ZLmc7lPJg50MbhHvR3v/udDUWlk3zJE4Zgv/Od71jHJ8xfDPP97Gc/k29/+9uR49a5QIuRMw0WU5hwZI7RV1PAFCbU2qgL22PhaSnwyajESGCMo9N7Y4yeBc4pfOSVq3DhLaq1O+64w1bRokDzneg9Iv1hDUpHCFJGSo47RA0jmL9UYIZsbJrIhjLZpCQ4a9ZM2bjJW+EMMK5Lz32GVvxPPpkuxxxzrHz/0kuV9LyZAC2NYHr5uU4E6cNyfNGcufL+G6/JK08/JcsX+P6TVZKE8CA6mjJLJwTmRbkVjNA8BkuQOrDwifvwrU0avEaPc1Hvn6dpS7nf30K4KaF5LzvDg33ooTf+7Zf/5Gn/FwibSJdHzsAabva5wHW35aLC29YrOc+xvaaAfIdAqM8IMWgaWRkP0iHNTQGaGzQ6GI+h7qb9pD5Tz9337yhweUQ5Rfgg39AgMHyA8S95SX1ECoZQkZaRmhkqzTQ0xHfBbTHTRrGVCoO2kTWwMfSj/W0JtAg5EyUZBQH8/Oc/tx5MY8HL48INC0c853SkAtUc0JAyxnnFFVeYm03UpOQVlptnnHGG9fQohGG4z0w+UlCdcRxqNcZJuQcrdXqBhCWc28bIDuSXy2dabtRtNA4PPXC/dYTqtMJDNDXVtZbvAwb0k+9ffJEcdMjh5gYToTRdT76l4dKOrL+lfJPMmj5Nnn74EXnnlVekfMM6I2eIrjALyTl43sar/X3OJ98OsoSY9aTChQmXt3SSMyBkgqKDzwkc2POTtyeJnuekGXN2aSZMSnr0fPjrcPXaebO9g2YCQoAI8HzF6k+oUSknYaktW1CWcBwEOePcA+9jdOKbYq/Q3kBZdh0fBBL4iPFit9BIpnaNewmPnRTCJR3uMMhbhJk///nPOXdI5NAiY87uxdHLP//885EvFwVIBhUqBQqVDF51mKriLBE7Mygw5Cu9QAwhUE/T+LseI71FVKp0ZBgLiWrk3Xchn5muhloHKZl7IGiXz4TjeQ6ZCnKMJMgnyyv9QXIFmp+DVYKZOGG81oEyWbhgoaxevlIq9LuhXt15111kn/321ZDMUChMyf9WB4Skz82vz5PCohLpzypTU3fVhmewLKQTt36DSs5eughH8XCpZEtpCR4HkTjv7yTCw5p6YPH55wnkwhso9/4Z/gavOetydy5xLRjIe4SBrf0s/VtPq+Ia8SUI3MbhvfB2rBtvz4PbP+ri7/t7TYelR+ssqmncTyL1Uj8hFAgGWwbIJlgvGwJhGW5Bw/bcc8+Z6hwDJzrg2EuEh6vce3YE8C7kJ3WKsX2kW96btq+h93TXGc/HH0TQWYoDBI9NDgIkedkSaBFyplDwgvT4cNvGOEC6QsVLooZhfBl/sowH4M0LCZCJ9y314u0N5Cd5SAXDhSY96jCowKiz6ClT8dx3AFEFknPprme6L0ZmkGOQL+RRUlLsO7bZwbQTm/W7ocIs1EZjzPgJMnLMGG04+mojvG39KCeeqxtLf4FSVF29LJw7Rz545y1N9yaVnj0yhC4tkCKY3MBuYh+iC57nQPnfP+kkwmSIRLmzvx4Be/seZSZDko7U8MFr7iD4/K3CKBLHgUDWUumW1PH0RN7ohUR4Hxw3l5yD9RRQDiBlR9J4zIJgGKOm3kPSjQHxQ8pobxg/ZWwbgYk2AkmSLc8PpqGjoKnv5O577733bNGSMH8hLZ9++un2bSD8lkDOydkVNH58eMbXkKApVBQ6yJjxDxoqyPeoo46ycZFzzz3XXpYxT/zJOkkuXHA7O/Ap+8ADD5hqOgzyCgMQnBTQS2xuvsX53jxYPdB/lHvK/Fgl4vHjx0lNbbVUVFbJwYceIrvtvkdiSga/bQn3vWmGKiu2yCfvviMP33GHjUObkZdfHOy9dD+h4XbnvY0h3X4Q7m3tuYG2z8s3H0aI3pE7l9gmEqT/w8TpDgLnXXjv79aSczACt2vk7u7zT7prbttcck68RwCco9Gn3OBrGxJAi0h7SjmhPY1qAzKB9gFJGmPQd955xyyPUaNDNMwE2Nblry0gzF+0p0jQdIw4h7CIF7NvfOMbNoWtXVprOyA9Mz+THghOG+jBYegF+dIzdIZHUS/oMsptY4iNR7FsY9RQAfnIuDPODihYMdoWKMeLFs6XRx95RMaNGy/7qlTUtWu3NjcGWF1TI59OnyZ3X/9nmfHG21JTXeNJuwo21EX7KcElamWQHAP7KWPOKeBez8OW1e1QuJT79ecBQk0cGFy7ELQQD0YWvJ9TyTDsB9IfRPJ287OdmIql58P0xZVcjTk3BMoPw1gMYTEeesstt9jiEpB0U5txBCDGohk7ZTispaTA9gryFXJG20BeI1TCX3CXm1PeUmhxcnZwBQuydmoUdz74gu44fD6GB4zBIGCmqYVBL+6nP/2pzUum0sX513ZA2ccwcsaMT21cEWvRLl2SxnfbGnWaDgg4r7Zeli9eLHdcf4O88fxzsnlTmaZPA/iEBdFBVpxLISr/egK0KsSnpBnZ3OvzUFkTMM/mFdd4R+SHbhN54sfjxa/X/OvAPd/COsnewifDmCGb20+ztRsDxmHJzkAqOfM3eM2Fby1yDoJxaAw66axjVcyqcnTYsT9pLCAZ2gw8bjXklKOzgnJJHUa7QAemNXiqRcecg+CYFwtbykWFa8kXbu9AIoZ4Mf5CRQXIU8aoDjnkEHNLh5oqzr+2AzqkqCHRIA0aNFjGjh2XsKVoK9/JOKe+VlYuWST333iTvP7Ms7K5vMwjbK75yUwSskfQwdQH94PhU847+O+N/G1bWE/rve3bsX+Xu1m37Caf7yEY1v56u26T8ny2bt8hmf9JQgdu3+tA+OE0ecEwgONcGIQ1FtR5pDjU3QwDovp2Djn4NcbCm/aW9gOvVzE5e/kRrpccQ8pO9c9xS/NUziXnlk5we0E4H3KVL8QDKTNMwDQdes+MFzEN6oADDjBf4WErzBjbDnwv1I7Mv6RyM2bY1tTYoFbTuXb1Cnnoztvkv/9+QMpVCjObcz2f71Mi/Gk/O9Kefb6jVkUEcYH0knMq0ZqKWyOwesJxRF0xqdm/Dtz9Fjbl+ckwYck5GSYJ7/7oaVW8L/cTxiTo4DV/uy0k5yDIM4YLUXdPnz5d/v3vf8vjjz9u6thsSBrCwfIYnxK0I8C+Q8Q3iNF6aDW1dozcg0+HhTaSNL8YbQ98IzcFJtjzbmtAsn/2gYfk3ltvllUrlgnzi2EimucEBesp56CDM2ZJHWi/o5pyUwOn3JNEkOghZxfQzgUiToTRNHnp8sB5+4VIUzM7uR8AzybNrslLvb/hOc/1/HS/0D/HrPC8Ht3l/6ZNI2ibAO9GRxCvY7fffrtZZ0PSqLvde4dBmTzxxBPNGyMGUDHaBtpmS9GB4CpEuorRHNBgYJUNMbdE/DFyAyRlfm2VmMG82Z/Ji889KetXrlACDpKyoylHSB5sC6mFwoThhQv8HPRC+C7KsxElJJhFeU69Pxk+mW4/ROAwGK9/dSsEzwdTYUnTLar+Wu1ZFA8ZIMf94ELvYhsB+Ydq+phjjpG//vWvRtC462WaqrP0DsKFx3NWrNJuW2ixhS86O5BEMADCaQgqJypFSxhpufhyHW+M3KC9fJ/a2hrZsrlc1qmUtWHduhSCCu67pp1z9gu8VzBcEO58UFJ2O4lrSoMuqhQC1ZPJMMnwDqnXkldTwrmD4PN92H324FRp2+3zvi4M61czfaxGpex+o0bKod/+luzx5S9LSddSC9sQGN5AzdwaFtG0N8yEYZgL4mWteqRi2iLSwdAXrn5RY3/lK1+xqUHMx2/r5bQzIVZr5xDO8AdH7A8++KCZ3mNBSY+VnivzuVlYIh4TjtHWgCXqpg3rZdr7H8gjd94pn77/ntRWV2kDgbrXm8BkJBUgOEeGnjWzN2/YhUsgJbz+3LG/TYavScRjJxWOKLy/uuUeS48XLqyHMJW1blM6AZzxD1BRBw4T93uPDZAz4RQcE1fQKCy/rkZKBg2U43/yI9n5sMOlpHsPKcxAtrQJOJ3BRoQFGYgDF5oYcrHyGxqVICHSHLcEQTK0gq0KaWAdfQQHhAW8A+IlMEqqjrFtEZNzM+Gyj6kNeO9iUYlHHnnEHK8EPfkwXQFryKuvvtrmE7ZEBYwRozmASBibXKdl9+G77pTnHntUytauTSErN+bsQDm2nwZKlGgNE7XvEV00vDnPPjHVJR/ixe3vc3/ykp4PjBMrXJ1KN+c5eL+FDRBySvoD4AkFdXk2zpzPfK2+PeSrv7hCphx2pHRVydQ9MwrkJ94RWTL3pZdeso474WkLWIIVx0v4vGYGBuddW5IpzlyBtIGYkNsuYrV2E0FFgpBZQAKjCxzVX3PNNfL000+btBzu80DUnIeYd9ppp7hSxGhzgBRQuZb26iXbTdlJRo+bIBs2lcm69Wulpqo6KWn6Wwfu41zwfNS+45zgNYcg0TpySmztb3i7teScCK9Vz4U1+Aep9yc7CuHzQZCq4nolzoI8GbDj9nLa5ZfLjocfKSVdShqswxhm4RDo1ltvTUxvoh1ArYz0ijTNogx4nGIaVFiKbgnQLtn38n8x2i5icm4kKNyoAHGBh4T8l7/8Rf71r3+ZdSTjy65HGgUqJt5l8MgTW1fHaIugwUaGLFbpbvDwYTJp8mQjonWr10hFmRIM0iPh7K8X3n7se6cMkc2+SZ/R8AiVuAjhEUiCSLwgHvQgtdvrwYUhPAE4Jpyd9y+yCT7fP21wT7Gt3ugss1FYF9bny9Bdd5ZjL7pQttt3f8sP5mXbs1JiSQXtwQ033GAd+ChA3qznjKoZYyz8E7ghLy/u3COYrzHaNmJy9hEusFEFGHKlx8s61Uw7uPvuu02Vjd/VbDzzIJXgH9ctTBEjRluEV+xZnapIevbqI+MnTZKhI0fK2rVrZNXKFVLvd0Bd7aCesB+sLSk1xz8g3nA4B+881AlB60brn0OiHrobNRhXw0TvLofDh293W+f5y8HrGHhbU4HrP56DxHzyj34oE/fcU0q6drX7vGek3h8GHXjmHDPElQ4YaOFQCJJmWiQGWkjRgGe4diiXhJqreGK0LMLlu9MiXGDdMZUC4mXs6J///Kd54GIpSwh68eLFJkVnC6TlwYMH25hTjBhtGRR/yn6+dih79u0vexx4oJxx/nmy2+67+yGSMG1RgExT4KqVv02tZUEErgSIaKvwLh69HvXERD12N4YiCJ7m/YKwY72/Vi+ydGad7o9SQv7ONVfJ2L33kKIuXZLxhyOOAGPJjmgzgfYF5yG///3v5Te/+Y0t8Ui7EiTk5HNjdBbE5JwGNDgYcLDgORXm61//uq2jjPqaMaPGAqkZf8qsU90WPUTFiBGEIy7Wpa6tq5el8xbI0488Jp98/LGdDxNj4hh+8zaGcDg36BM+HwQ85J6fLh4jrhSqTSLlKBSBbTSApUMflLhsz+NX60VQVCjbH7yvfOUXl8mgMWOlKJ9pkNk3l8SHS0xmaWRb31FzM0TGcrlscfeaaZgsRsdGbK0dAj3WZcuW2TjRK6+8Ik888YQtMoHxV1NAxWS+4d577y3f/OY3bUnMeMWoGG0Z9b61NLRQVVUpn3z0oTx+5x3y0Ruvy+byzTCP8ZjzngVYIMIT7vjjX/CiSYRxp4Ez2gof237QlWdIYkwJz3U7w5afnrMbk+G8ff3jh3MXTG3N6QTq9R3q7FdVVCI7H3iwHPmdb8tYJdeCAs8/gYslW9CWMOz1s5/9TF5++eVGtSGsb097wQp0kyZNSjgaiiXozoNOT86uwNNDxXLSub1jDIi5gJs2bWpy75WeM4ulH3fccbLPPvuYc/qWXmYsRozmgjoBQW9RMnnt+WflgZtuliXz5khdRaVSFwSn5dcnN1eSjez8cm0bdyEQxuCOdRucHRxFzsDVT7cFifv155Bi7W3/fATi9eCfCN2P+85CyZcqvfaF474sR573bRk4dpwUq8TcnJkVqKxZSe6qq66yFaRoY7IB78rcY5yHXHDBBebxyy2WEqNzoFORs3vVIDlyjilOTIfCwOuZZ54xpwFNzRbiZpwJrzynn366HHnkkeaZp7WmTkW9YxDprjd0X4zOAxbBKN9QJk898B956K7bZM2yhVo+lPC0iASLR772Wd2hI1evnPsHILAb3GebQsgp11LJ2YGymXJ/8Pkp5MzPPwo+P3BgYQL3mwJfiXifk46T4y+5RHr366cv47lcTYZpGujcY7nNGsw33nijWWc3pn3By9ell15q/q+xWbF86ID1lDzJ5r2yDdfe0WnIOfxBsZLEoAsJ+dFHHzX1NQ7ig45DsgXx0qvtpxUabzt4AjviiCNsagRjzdu6INE40AFZsmSJNRJg4MCBMnz4cFsDmjR2lgIfIxqs52zb6lpZpWT86D33yHP/fUrWrFzpS5iumdBy4m1SJGfjPcqP/sfFZcp5f9fgjnWb4ldLj+2CxeM7JOFEoHly5TNxv3/JO5skZ2D3coL4OEFYf8cds7Xn6E5J1+4y9dhj5fBzzpbh48bqeY8AE7c1E9Qv2hyk52uvvdbWX8amJRutHOmgnh5//PFyzjnnyJ577tkm2pVcgvzhh8U6c8LZMqOFdtV5L+tI75sNOqVamw8PId+jDRDjyYwxN8XIC1B4xo0bJ0cddZRVGhyMOPX1tgKf1BVkxrlwdoB1+WuvvWZGJlynI8ESk9/+9rdlwoQJna7gx0hFtZJEVcVm+VRJ46F77pJP33pHKjZsUnKCxVzZgNiSzUVQcnbwJE2fAIFPgobAPtugtByE8xbm7Sv8R1JGE/dzb0p8IXJ2aU55RiBdirw6HJkUSH63bnLI6afIvl85RQYNHyNFxbn3ge9AfcQa+/7777dpVkyjypagaWuwXfnpT39q0zE7kq8EhKKZM2fKY489ZgITxnEs6oOAw7vy3vj+plPSWdDpyJnKcd9998mvfvUrWbBgQVbzk6NAxYCEIeUTTjjBrDIx9GorPVoqPJoAHKVg+UmBp+fOeZc+CPriiy+2VWtwgh+j86J8U7m89vxz8uAdt8i8z2dKXWWNrb4EbShVeYGMJX2C090UyVnhylWTJOcAHDlbfHQ0OQp0OBP3688hO3IGjqDr7f4KKZRTLrpQ9jrhOOk3aIgU5Gv9LUBKs0DNRjDdwDW3rm6ychRGY9kQNKB92W+//axOu7WXOwLQ6P3ud78zT4sQs2unMKjFBzmuj0866SQTgLDlCeZpR0WnG3NmvvLXvvY1myLVWFAgkIiRlKkgX/3qV81gA2tsV1jaQqGhYGNtjvqMHjpj6FEgrfRIGWvHhSAINyYxOj745o/9+y6565//lJU4zNAWAeKCLigJSXkVSTPQXAR2HVE3JDk7WNjgtQC0UfLPo1qGdD2VJ0hxHBKILz+wHjPb5H6qtC15tXpbjZ4rksLu3eXY73xXDj/tq9Kld0+/3Huhs6kCGM1V1ldLl4KmORSiswwxQ0oYojL0lA1ob3AJilBAmtt7faW9YlgRIYH2OYqS6JRA0hjG8d5oKBEuOvK01E43zxmiwnNPY0CDQ0E48MAD5Ze//KWpw1nAAktspGU3HrKtKwmFfO3atfLf//7XVF8333xzWmIGVAKsR4MWpO29osdoPPjm2F9sKtuoZQJ68pTKiZKgO6i3tyoaHPs/C68BohrWBELh08GjU78+BQJyNgV+XOF0ucNwWUYTAPEXKDH3HDhMvnzed+SgE4+Xkp7ewhPeb+v4osB71tdUy4wXX/bPNB509PfYYw9zbnTJJZfIdtttl5WqmilaDE+hCg6/Y3sE74N6f9WqVWnLD+9Ku01esbwli4YwqwZVONrQjOWunaLTkTNq7GxVSI6UDz74YLn88stNEj3vvPPM6MutJNMWQMHknWbPni3XXXed/PCHP7QxZpaIawg0BrEr0c4NIxp+PhN6RJws267hy9T+EToRT6aAPjLVHHd3OJ50sYbPp7vfu5IvBd17ytHfOke+cNyJ0rX/QH1XmsFG1mWNe9Y778mT1/3VP9E0IBEylkq7cuWVV8qxxx6blR+EjjQlk+/k1rpuCBA5AgcCCPPHsWJHi8DyvNgSZVP22gs6FTlTmLF6xPovEyBlpj+dfPLJNjbN4hb01BhXZppUW6wUzsk+aaWgZmPgBjHTW8dy26EjFe4Y2YHybEphSMrUw9EES7F3Z8NXU48DAX2E72Nbp8GYG0GTHAqegOswAGqdS1d0eEKkgvutydf7CusKpHTIcDn7t7+V/U8+SfoOHCSF+NHO92T1hsAza/RvTU2VzP7oA3ngumtlxaczvIvNAPk/YMAAWz4SF55nnnmmTZmiHYpC3759bR3mjmIchWqa90Vdny0QsmjzIOkrrrhCLrroIlvv4K233uowknSnk5wx4qJ3GrampoJQGejFQso33XSTGV2cf/75RmCu4LRFYqbHiZXjbbfdZo5TsimYvCt5wbg5ld3d0xbfL0bLgm/ftWs3JSnGi+2EnQ/DnXZXg6FSSo1d0DPokTlkw6G38eAfB4JFwtGmlUv/F/V8rykjbGqTRtycLdB//caNkbN/frnsdujB0tXvZFMPrMjzawiaAbXaeakuK5Mn//x3Wfjeh1Jb2zSD0ijQWcbI67faeUBLxyI5WGiTRvdj9apTTz3VbF06Sl3lvVDvs8Z1Y8eQUXej4mepXrSb+JZg6BFf5e1dku50q1JRAfBxTYFAukSlCyFjbIDDEIwS8G07ZcoUqxhBtNXKwLxA1pL+6KOPsiqMvDMGFRdeeKEZWDBlISblzgu+/fxZs+SzaR/J5vKNRohRsqQrIu5KSggtdoljiqCWw0SZCt1gm0B4tu4HUvex2vUPFMFOZEr4lPgCBmmK/LwC6Tt2nBx/4fmy4wEHSLGWd5aEDK9K1RCQwTcsWiS3/fJXMuuFlyS/ulbqCgvkmO9f6IdoHuyd9Ef9RDLGD/+IESNMi4fBJkvNsvAOc53pUCfyt52D90AjSTsMoaK2pm1uLLESHqM6po4ybZQpsrT3aBhoy4OaBsLy3PC2LaFdWmvnIiMxgmKMFkMYPhw9UioA6pX2pi6iENKbfvXVV/0z0SDPeD83v5nealsaO4+x7fDE/Q/IrX+9Xtb4TmqAJ6MmywZ7ySOfJO2vEmBd4JpPlKiLTY51F/zzCQSOt3Jo4u96RMsJPaNSq13kvF9mE/cHng+hG2gnVGIePHG8HHfhBbLL/gdIl26lli5AFFGdkBTo42ghUY+vWblMHr3uenn3/gelvnqL5NXlS9e+veWaD973A+cWtHOQFLYjdMAhMH4dzULZURDjyRh9Pfzww/Lmm2/aD6JuynRXygdCBzNrEETQljIzBSGM/GsPbV6bJ+dcEHEU3GujFkGKBm7b3oCFNg7yn332Wf/M1uDd6IWz3CVTySBpepUtlb8x2heWL1osLz7ztDzx8EOycPYcJct60dJh5QMpE7hS4hGaT5o+cIUZrj1Wn/R+nws96C126LY+tppWRdT2GKZveVfyEI/rPQ9+lNmU+8PkTHwaZtCEifKNn/5Ettt7Ly3vaMK88g7ZNkjMCh5XrYnbsnaN/PefN8krd94tsrFMas2LWb4MmTBBrnj6KT90y6Ej11PXFvN+DNExxQxVNeTMzJgXXnjB5j67cI0FmgjsanCpjBBzyCGHmJTe1tFm1dp8CHpMrtcIqOzNIdBgIXA/4nP77RW8A871mTNJ7zMI3st5FuJTQ+IUVLQDHbnCx2gcuvXsIduxpOnBB8rQYcNlzeq1UrZ+AwYNsF0Cjii9kxCch3RzltM6JPF33DHbxDWQuJ6kUG+brMO2tb+6TXl+ndaJQhmx4xT55s8vM2IuKCzywjipORA6I2qVLCo2yWv3/Vuev/EWqVeSIA31Ghlx7HTYobLz4Yd7YVsQHbme8m6J76lbhAY0mTvssIMcrnnLMCTqboSQbK26g0AAg9xnzJhhAgxtJYSNFgJbouZwSkuiTZIzmQnR4N6OuWwYO73zzjtGPExtaqo3q2AB6EhATYPXHDye4XkI0qXAUfBQ62AkgbEEY1jBvCMfYoKOYVDiytcOW2n3HjJ+u+1l6NBhMnfOLFm3Zo1SkE+I9petJ3mmNGkE8QO4cK7RS5Qu3Uns+2TqbnO/KLjzlFOkZ1duww5JvCOu58t2e+whJ150gYyfOlUb+xIjZgJkV9bRGLDNky01W+Tt+x6Sx/7yV6kuW6e076kIyIO+w4fLFy+4QPqPGGF3xcgdvG+dZ+0VS2Yy3s5sGcbaIWqENnjCCVzZAktuhjOff/55828OSaPqbotT09qcWpvk0MNhUj4rRSE1c85ZMuJuErUs4wkxkkAVhEEYKiBImkLIGDoS8+67725TyFyBjxEjCrQEFI9VK1bJ7X/9mzz/+CNSUV6mjcTWZYYzUHTKFUeAHn9ZWUsrOQM/PFs8kqVc8xGUiI2YlRxdk8V5V55ZNatAz9fpg7ffdx85+YLzZdyOO2vjq40uIfU/92VV/uur9SmFUltRKa8+/IA89OcbpHLlchXIPVU2gJCP/O53Zc/jjpOS2PVti4Nvh8S8fv16I1WmUEGw+CmHrJsChBraSJbkxMgum/nlrYk2R86s1MLc4j//+c9GOEGgisWYiWlOLKMWIxUUXkiZH71Kep30DOOx5RjZgjp3/513yD033ijl69ZpA1EnBSqJhpsJSlKKK88AbClGv7xBztESbioKUrXnSWh4jw71OkwdMAoLxkv6ivKKZOeDD5STf/B9GTJurBQVehKzU2VnjfpaqaqulTefeFwevfqPsnHZUk9i1mj6DBgk26kUt98pp8jInXYyy++4XrUe+M60c1hlQ8wsYPTyyy/LJ598kvUqX0Hw7ZgqC6cwJt2WvmWbI2csj5GMkQCjwBQD1N1Ig50d7tNlKlCEiRuPGDFidDTQttGZhDOefPJJWyOA4VCnbc0WSMyss43P7rZkCe86pW0GmzZtShiARYGPweB+DI+UGyLeliZmKkFjKkKMGDHaD7Ku236w1moJSBdtG8auOFNCLY3TKLSurIEwaNAg0xpmA+JqjjV4S6HNkTMGX4wDpLOg4zrTgGK0DWTTQYgRI0YO0SCHEEB/acNlR0KNIiu/CWitliDc5kDErEuPAylcGP/6178274fYKTUkDTP8h6OXtma13eastclIxkhfeuklk6KDwPr4S1/6kvmgjQ3CYsSI0eng+DIbFoTACJ82bOZIHAG2l8436YQ7mCrK4kTOwhvyxekUfBIek4ZvWJP/61//uhnNtiW0CXJ2KgqA0Re9HTKRZcQwbqJHw5w0iBn3mkjW7aXAZEKwZ9rW34e0MpWN78F0LXqqnOPbdIRvESNGuwBVrcHq5gJp+2J1U7f1VfoXT1u6rd0oUlcu9XWb9fxmrcfJrfsRnvniZt3HYij2TBdv2wekC2dMnDjR5krjp5zpV3iEBPAMwt5hhx1m62mjGm9r7Vib9RBGL4f5aPPmzbNxZnpD22+/fcKBRnsGJLdo0SJzVYeFIRPusT4fMmRImzJIcMDyG289Dz74oFlFMp2BVXRwVH/iiSda77StqYQaC6pBZ+pkdLb37SjIKAgbCKG/OqYXbZFNa5ZLfc0m2bJ+mdRUluulKtm4fJY2/NX2/b3G35s3bsWBE/l5UlDUQ7r2HaGHhVLcpYeU9BokxaV9paR7P8nLL9VbGM/NVOcbTmlLIly+acMQKpimy/gy1t6osrHUZtsW60KbJWdA0tzPNf7tvUGh9/bMM8/IHXfcIZ9++qnN0cOoATN+VCuoYjhuCyDfyW80GMwvJ910lNx51EW4w2PRjZZQCfEc8gdXfnTWKAM4IcDuAPVVc+HewyF8nCs0Nd509+UinS0ZRy7ijtEY0ITXKAlvltqKDbKlbLmS8QIpXztbypZ8JlK5QeqqVSKuqdLvoqHrlJh9WvZO6D6fy/jUHRfooQpBHOcXSUFxqRT2HCxd+4+RHv0mSrc+o6RLTxWUuvTWMCUWXv8QowLVMYTP7e7ctgfl0m3RzCLkteVy2qbJuaOBrGa9UVaDYiJ90MMNHmpQv1x11VWmIdjWIF2u4LKYOeSMxBzG8OHD5d577zXvY7kEz2f5S6bNPfTQQ/ZsKhNDGqeccooNcbREJ8a9d/D9tyXSpaO56cvF/Q7BeNz5tpB3HR/kdaVuKqV83XxZ9snLUrl6ltRvXiZ1lWultqpCr9d489FNNd2Ib2LfkfC6zcs3uq2HsOvypLCku/JxPynsNUKK+oyXsXsdpR1nJel86iOavyQxN7ectRTaarqCiMm5FcF47R/+8Af5zW9+Y/th4Ebuuuuuk+OPP36bq4ld4a2qqjLLRzoNSM1hMEfwr3/9q7kIzeVwA9PpiJfF51FHBYH6/5///KcZcjT1mfSckcbdijcMJzAG1ZhhhXAFJ07STZ4BviFxZjulIwjiZviD+OjEAbQFxNfYdyYu3pO4nEEMaULz0ZT8Iz3kHekDxEE5aEpcweaHfHNuGclXOl8Yfrb3IZOcwrKLTn2lScmbVk6X1Z8/K2vnfahy7hYlYshYiVjDePKr+UdrJsh/HsyPfVyyQPkFui2UmvxS6Td2Lxm4/aFS2n97KSjqrg/WMq+kHqPpiMm5lUA2M87xs5/9TP7xj39ELoOGuhbi/ta3vtVk0sk1IOQrr7xSrr766gTpBEGjzNQFpi3kcrwcww3yAVW6IxQHGuszzjjDOjrOLWlDIP+D4ZYsWSLXX3+9OcEHjKEfd9xxsv/++1uc4fANAaJigXd8wWMrwf3kzUEHHWTxEn9jSGbVqlXmnhA3hTj8B6wqxkwFvORBXJnS59LPdvny5QlPSs5HAIYy2AtgNwBJZ/O+hCEtL774ojzxxBOWRs5hB8I7ki7sJ7LJt2D6wPz5882HPsueMpRBXrHgAcMmrK0Osom33YDXbtTreORYX1uhpLxSVs58TtbNfVsqNyyWvKoNkq9kTfaEv6OjU8tmPU1Nii6FoQSlHAbOc4FrwD8NUdfllajg3FcKuw+VYTsfKaWDd5XiboP0YQw/bf3ERPQkLOq7pjw/9wjnU1tEm12VqqOBgoC0TAP59ttvb0U4AKnoiCOOsAazrUgLEC6NO6u5REn7SLHnn3++EUcuQWONOp3x5jCoWD179kws/ZZNJSOMq5DkPR6FGCtnQZWZM2caSeObnG/AajhIqQ3FG6zgkN7f//53k+inTZtmcWJTwMLvTOPA8CRb4kJyZKk8OmqUF9wUEh/pe//9963zALlmGnd370kn549//KP86U9/snL3+eefJ+KaNWuWfT8WR6G8ZWqwuIYG47bbbjNHD5CoSxedEpd3zDXNdriBZxEvvuDpaP3tb3+Td999N5FGvD0RBqcSvGum9LVbZPU6EGK1VJcvk9VzXpTVnzwiKz99WurLF0lh7SYlZnx+K/RPOH8SR4HTqSHC8K+ySUeQnEucRzLX76ISe17NRqndvErWLPxYqjatlDpNV5cefVWARopOuckDvMw20zfNcKk5aA/lqG0wQCcBEgrjyUhUUcDYCZJrK8TssM8++8iee+65lXoWlSPSEkSRa1B5HGGkQ2O1C65CQpaQH50OBzQZWHJee+218vrrryc6T+75UekgPncerQikgrrXgTiWLl1qhI0BYCbPd0EQF2Ptc+bMSaiOAZoLOhGQNtbzxJ8pfZD8K6+8Ys+mk+PeCaA+hmAhRbQI3J+pwSId+B5gqIGZBsF0sU/e4Q+fdEWlJQz3LDo13IfGAUk8mO/k5VNPPWWdCM5nSl+7QSJrdCf4OuYznK3buJ1a/ZDlsmHR6zLr+Wtl6Vs3S9n8V6WodoMUiL+2tf3NDpnDhq5uFTjqbvdCEDSEUi3FNWukbO4Lsui1v8v0J34nVRs+1cqA9biGDZQNPmfyKAJRj+tEiMm5FUHvH8kYQnOSmftB2EiCqPLaGugwoNo+66yzZNdddzWjrD322EO+973vyY9//OO0nY3mgCUw6ayk66gwPk+YxjbYNPoQFRJzeGgBMkMlDZkxxS1IWOme485DIEjMQQJ0gJRRz7s5lg0BDQUdB9ITBmniWRjJEW+m9KH1wI1hkEiDgOzJB7QiUekOA/LESC+KfLkfSRo1fNTwRzqQ37yLy+8g3LvSUYnS2rRbwFH6uRIEDPh+vL9tOE/Hr0rqalbJ4g/ulnkvXi+VS9+SgqpVkldbYcEdLB5bE7M52Lr8bA19Bo+JeJS729tqvVEyztuySGqXvSmfPnGVrPj0EamvWZdIJ+FsL6Lc2oVsktPBEZNzK4EKRwMKsWFg9cMf/tAsjiFktv/zP/8jl156qbkmTUcErYlgQ4mEuttuu5lR2H333WcO5tkyIkJnoiUkfVTA5A3jmcH4IZyRI0fa2Cvk3RRABFHGbQBCRHLmFyaLKBCGe1A3Q6jp7oHYcNCfDQny/TM9mziQ/jPFxf3EQ35lKk8QKZJ6Q+/KN8A5EN8jHcgHhiOQyrMBzyTP3Dh4FOhYQN6ozbPJuzYLspcfn0J/LMOZaqrFSb47GoJ6qaveIJtXvC+znv2LLHvvHu3hzVdJmU6P911Tvlf6z5sGjb4hFSm3e+nABM2QSJa33ndBvUrMZbNk0Vu3y+J3bpfyldP1Ehbm3h0uKpc9CaQcdE7E5NxKcA0kjRxjmj/96U/lhhtuMOMwVIUXXXSRrbjVEkTXFIQbdNLFOC/jk8zJppPBGGNLAe8+zPumE8PcbzoBO+20k3VkfvnLX8qRRx7ZJKM5916ZCIuxVYgmUxgHwiDVoW7OREoQULbk7Ii1OeD+hgi3MeD74yinIdsCnNQgDWcLylNDwyLMs8cBTtRUvnaD8OeM/Lz63fVXX1Mmmxa+LHNf+ptsXvSyFNdvtKU3HWwZTN0mvy9HkRGmQeZykbwaCMcuv60e451wp71iCzH75/UEa3AXVq+WNZ88InNf+btUrXpfuRkvZMm6kIjWHql/EicUgWR0JsTkvA1AQ4cqGNUshIyHGoiurRBzQ2iNdPIMOgDnnnuujdmypBtrrjImjGU4Ku2mAiMopO8oAmS44eijjzajvGwJEikW469M4JkYSzWUd00l1Kj7skl/YzoCaHXwBpcJdEAw6nLI9D48F7eJDJdk+p5I9wwLoDaPUvW3GzSYzfpu1StloUqZC964TWrWzZR81MPGTl4+BrPT+2zp8zcbIKknoTSqEr03RYptvh57ynd7Skr6U5/rLiXPJve4xvSu/JqN+nofyefPXS+rPn1M6qvXaLDk9/Ti0Pv0xRJ3pz6mUyEm5xhtFjTedGImTZpkBmmo1iFsDNOyJZQoQJQnn3yyWT1DlsTFFhUwVtWXXHJJo6zPcTGL2joTGKtHLZxNxwaDq0yqXhCeSpUuP+hs8F7pAHkimTJ9KROIH4NGpprhMCcdGC7AwY4zjGvoO/EezOtHG5Mub0gjRmtYhacbP2//qJX6yhXy4dN/ldUf3yf1m1Bj48kLwFA+YekJxqs1Y70DP0RTwfdhKlRtfhepLewj0m245PcaLfndR0l9l0FSX9TTpknV+45IUpGOOdOlq14K86qkfsPnMu+1G2XJdCXo2g16PhCzpsd7Wx/Nf8V2i3gqVYw2jcZIdtkCEkCdinczNBZIbXQAUJV///vfN6LIVmUOqSHZP/fcc2mlOp530kknGbE1NAaM2hujKsb008VHh4VhkOCUu3T5xPsxL5mx4Ci4+5inzLBFJhAO1T1zptN1Hkg/6ueDDz44sbRrQ98PgmYo4Y033khrC4D0zLviia4lXMW2HlKoR/OfMeZaqdq4QBa/+2/ZvOBFKarDqh8VNxv9S/7pbeRj+px0RJk+RAosGZByNynqOUp6j/qC9J94iPQdf6D0G7eP9Bqxu/QatpN06zNa8opLpbYa96CMefvTtuxvxLMs3lBaUg45yNd/VbJl7SIrfz0GjtZruAD1ynJErJ0SseQco02joYa9qYA4cGSCmpypPDhSYSwbIzSkzWyBU44XXngho4Uy5IMjjYYkfhoqfkiHbNMBknJSP3AEGwXIuSHbAGe1numZgGcwHIDNRKb3QPLHgIv3yOb78R677757xpWBiIt52sz7breqbcte7/28vIaA60xiXvL+A7JmxtNSUEOnh/NRqt1M36fhfA4CSVhZWXqO2FOGTT1dhkz9qvTb/hjpNeYA6T50L+kxUgl63KEycMqJMmy3b8jgnU+SroOmSH1hafpUUA5th7/8/JDu0OCd572lgve+V5Z99LDUVqJ5CnzXTK/aSRCTc5ZI13A11KDFaJuABCBNphoxjorKGevvxhiZ8e2Zx5zJShtgV8B4c0NxZ0NkwIVjy3Mz3ZdN+XTxgIbCI7UfeuihlnfpAJFC0FFe8KLA8yH8huJdsWKFzU9Hys7mvZqDdPE3+bnutsTt7ChBVa+SaU//XdbPelqK6suUtJLxJ+RkNlkVjawCGerzi6Xb4B1l6C4nSp9xB0txz5GSV9hDo0CCpROpv/yuuttHuvTfTvpNPFKG7aIE3X97vTfqG1EOva2HrV44BQRFUV5Uu06Wf3i/LPrwYS04GzR4O+14tQBicg4h2EihomMuKQ0N413MucT4J9hzz9Qwxmj74Pu5X2NBGWlITY0UjjobFXo2aGw6GgqfTXzOgpywDYVnvBmVNcaM6UC+BDsi2RAaHaNjjz3WOjLpQL3D4xrOXhqbTw0hWO/pXDBcgRV+2Lq+yc/lNvdjo9v6mo2y4J37pWbpi5Jf7UnMW6GJj8sEDL0Kuw+RfuP2V+KdLPUF+ML2v5e+f9IETH8qYbNsJK45uw/fQ4bu9CXJLx0mdfW2nEYAdCv0l8gf97LRL+DOEkt+9RpZ9+mjsmLGc/r4LXqG5/oBOjFicg7BVT4qJR6acHuIdTC/r33tazYX+emnn27QgCZGxwfqWIyk8JSWDkiaLOieKUwQSJuoyjMRGh2CTEZeYWQy4AI4FsnWQQpAC8CYfTqicvniCDobQiMMY+j4Is+kYWD4gPHubAi/MSA+4n3ttddsmANTnP/93/+1Of2M10PYuYBLd231Rimb/4psmPeSSsxb9P1z9z50J1K7FCHkF0qX3qOl+4BJyskqHfN9SJdKrfU15VJfsVbqKtdpIivsnAbQyxqmsFRKh+ws/UfvJVLci4i8+JoJo/WqtbJ+zrNSvmK65NV787k7O2JyTgOMWpiDzJgkFZb5m3hTuvPOO+XnP/+5+f1tt2NfMXIG1OKMJ0cRCiSFJzWu0wBmQyhYOeMCM1PZQgpnzrFDpniR3FHbk5Z0wNIc7VC2cG5bcRQTBQzssHpvzNg9+YNBGvPYM02r4l3TGY01FcSJlPzAAw9Y5/sXv/iFETSLveABDwdBTOPKBTwerJaK1Z/KwvcekNpNS/wruQNdofTdIb1SUCJd+45Uru2nh1purfzUSU35Slk37xVZPu1+WfnxI7JhoZbDLf5YMAlXusjv0k/6jd1buXmkd28OQP7n1dfIpuWfyII37pDqsnl6lvLfuQk6Juc0YOoGFrjh8S167hi7PPzwwzlxKZiuYeU8v2w7AOniiZGKcD41N98glDPPPNPGrIMEDRli4IS2xRk6mYTSAJDQ6BhmSheLfbCCGSBcpnhJB9PPMoVBS+TKWTb5gWEb05/QCATHiHkGzmNY7YpOSSYJOAqEx9EM65qnI3bixy9ALkG6qe9YyKM2x4McdRvtGDYFWKezYhadguaWF3O8UbtWFn/wmNRumKsNsJPImxlvAHzp8Nd26Wbecl5RNynuPkDyCtHmaEiV2utrK2Xzqs9k6Uf/kZXTH5BlH/5bFr17l2yY+4qmd5NGQPlAxi2S4t6jpLT/WP1gXTRei7ZZIP9Jb5FUSeWqabJQ86a+bqOe0chzly3tDvFUqjTATzI+fXFtGAaNGda+NE40Fk1BsJITH1NU8PkM8bMiD3NPcQnJnFEMjjhmPi0NBCpNGjIr1PpzcbEfY2uEG9RgPjU3z7gfC2YWNIG0kCoZj8WrGd7NcGjiCIx0RD3PnWdL54+pT5kkNaZ9sZRicCGSdO/BeRykPPLII2k7ekjAdCIyqarDYIwYIuXdSAfHqKW//e1vy4UXXmhuPrONKwjqE++HVXawY0xcqOePOeYY6wxlMhxrLHgG49i33XZb5Cpo5Btz44Odkaa8G9IpC0As+ehBWfPZk1JYt1nj8S8ZmhJndvDoT99Vpd284t7Sd8y+UtJ7tAq/DHkoOdeUy4bF78qmxW9JXuUqyde01VSsk+qqLdK93zgpKu1vFt723hpHvUrUZcu1jNaW5ybVfiSsQ12+foUUdu0t3fuO0WdmtunoyIjXc04DxpVpaBYuXOifScUJJ5xg6wE31hc22U14xhZpfBjPomF46623jJT50WsnHI0CxO2kCO7DOQaSEHNxaQyR2CADGo3OWoijQP5BdHisIp+RRiEQvhfE0Zgx22zAd8J4kGfxHSA8pGonPbrv3hAoF8ybxhFKlPoWSZglG3/0ox+lkHMmMCSDNItBY1R1R8q99957U1Tl2YJ3RhXPODnSPO/d0Bh3QyAPUDGTJjqkSLDEy3Src845xxy65LKskyfMLb/gggvseWGQ56jbmW5HXWvas8n3Glm/6DWZ9+INkl8+L0Bq7LVwM0z0+hgcjhT0GCWj9z1PeozY26RfLtRUrJKV0x6QVZ/8R8nZ7xQpCdcW9ZVRXzhX+k481LPmNtTIxgWvyOI3bpLK9bONUHPzNbx8oANR2H8XGXvQBdK13/Z6Ljfq8/aGWHJOAwgSgqZxDwOydGq9bBtIQIHn5+bGuvV/UadBzhigYZSCFO2sRWmg2efHeaaTQOCEZwk/pGvugXiQOnJNOu0V5B3DEtgM4PaTYQi+Jz6wUQszbptpHLYx4JsSF6TE/GPGTJGgXfxcz7ZBJxydMtLOzIAguEbHDIm8IVV1EMxzhph597BhE+UXBylI+Ow3lni4h3JHnobLX2PeOwjyDX/b++23n02vYu75V77yFZOaseYmzqbEmw7ERZ1kecooT29cRxOCNXm2hn1bQzuLm5bJfNxyrv08sdyjR0itgMRj8iW/BMn5C1LcY6geFkGHUl9dLhuXfiQVq1QarmPVK2TtenPnWdJziPQYOFHyipgvr2Vav2td5XrZuHyGVJejaYCcffbPCeqlulIlcn1ej8H6XJu61Ur51IYQk3MaQMCok2nQghIMDQcSK4YjqDNBNg0FDRUE+/zzzxthsLA8hmZYyXI+ncoxCsSFVIg0yCIDEDX+jEknknVTVe0dCUx9w6kIhMy4IY0v3xMVL4v7Mx0onUFTU5CuDDSFoCA6ygPpdG4wKY+onVmmE5JINyYbBs+HQIkToy/yACmfcsz708H8yU9+Ympb15loDNz7Rb0j55ry/oSH5OnkkC7G7DG8o5OR7lnNBelkKIt1qcmfILC4R2LHhWyDeeRzVJiq6mu3yJq5L8q6mc9KYW1g2lQuOS0D/KfpNk8KuvZVct5HipSckVJJQH31RiPnLatnSl5dsr1D0i4qHSA9huyoQrbvmU3TW1u1QTYu+1QqyxZriKDXMA/ueaBJr1dfLeUbNyo5j5OSHsP1WGPR/00pT+0VHZ6c+ZigsR+UHjKOEVBNoqpkaggqUdZjvvzyy1N8ATcUN2mgkUV19rOf/cyc+CMVhaWYpoC4kahRx+H+EDDVhQYlnK7OUrB5z//85z9y6623WscnCEgPbQjjpZMnT24SIYWRKU8bm9+Eh3hR3U6dOtW+JQZQp5xyipx33nk2nNIY6c09H5JD+sOKGvU1bjAZu4XsIf2m5kND79fY9w+D+8O/lgDET2eAekR9Jz/oIAwYMMBWR4Oco+pUChwjBYLYbn2t1G5ZJqs/eUSq1szS42ovnojwLQUewY9FLfK79pf+Y/eTwlLsAgr1vErCNZtkw+L3pWLNbH8qkw8lb8i8z/CpUtANI0TKCZL2JiXzj6VqwwLJr6cdS30J71le6MaC9HBfnUrzxV17acdgskn4EHRLff+2iA475hxFRJyjV8w4YNT1IFy20LgjdfGDoN24GvfyyyYeVNGMT2NwglVoY6TkxoB0IDUzzYXpH/T0G6N27yjgGzMu+7vf/S5y3JZGlzW18U+dS8OiXMGVPcD4K2UQQoa0M5W1KLjy6eIkb1yeoIaHhLIpxx0dvD+dZbQVGGGi3iZ/6LigKaOT3ph8SglXt0WWfnS3LH3nLpWaNySWf2Rj3yXH+c6X5mfEaNHn63Pq7IG1UiglfSfJ+EN+KMX9ttNz3jBEdfkSWfTmjVI251lbCcuhVsm868ApMnr/C6XLgMkaXYFGUyfVGxfJkrdukfVznlFy3rqO6QOb9l4k3DKGbb5UFPSTiYdfIL1GHarROVsGNBsEym2+tTU0rbvcDhCsQDRGWDszzvv444/bWC2VkIYPWAUJgfv5QciMTzJXlYoaXMnIhUsHGkLI+LrrrrM50xiXNUTMxEf8rucOubrjTM8CvAfTQFDlQj74Inbv2NkQHPsMg3zMdH1bg/S5H9+fziDbhr5/FNw9Lj46phC9cxISvN6ZwfvT+cHAEuO5b33rW/LNb34zMZ+7sfnkORXhV2dWz2vnviUFtZtS1mVmrLcl+AXJk2itVdMdFUn8rQdU2flFEJ33cEuH0nBttZIsU6ZcQIWWGpWqtQ0JtZH5kHq+/iw/Uq+5Qy/eRsJLkp/eOu3MrJdF7z+pUjTDOy4+aMsF7LjosOTsgNSBwRWVjR+qQdaPZfWhZ5991gyHQBRBB0Gl5OfChbdhcJ7xPZwZYPgVNUUjDKReeukYvzC1hbWMSS9qtdNPP10OPPBAU7M11EBAyEzH+c1vfmMEHR5D6+igI8M4JdJOFFBPot4NahUa+v7bGi2dvobKc2cC5QeipgMXrmvZ5w/30V5USfnK6VK1YbEU5IXrYcsSDMQahHekHbSibiIFWvZZ/EIJj/P1NTVSV6skXJdqeQ1B5iF123vrFbdlWpXmEyG2AsEsEroJjUHyyZbPPEaqpbpsoWxcwXrpmReE6Wjo0FOpICXIifGi8GL4VEBcBSLVNrTKTlOAGtytdsQYVjrQCGCsg/9ljJRIE5a4TlLm56Rt3CxinY1RGdI/VtuMN6f7hDQujJH/4Q9/MDLK9TsG4dLQks9oDLB8x9DpySeftDwCpA2p8ctf/rINM7TvpQfbHigD5LHbOgTLZ9T1jglf9VpXJrOf+Y1snPe6FNRXGv2kSsytkw9GlprvdXldpOeYg2T0/t+Tgq4s6akXVFquXDtT5r16g1Que0fPJLV7ZhDWe6yMO+jH0mXQThocA7J6qd2yUha+dbNsmPmE5NUyX5vvyh3+t9V93rMx35kci5IWa/K7Sf8pJ8jwPc6S/IKe+i5enNnH3D7RYQ3CaABQZ+NIBAcMYfUu17F4xrALpwcgVw0Gz8Ig6ZprromcigUgX+bbso7uFVdcYXOq99lnH5OMIWxUjpCr2/JDEkTtBolD5oRFIsdRSpS6nM4JqnTmou62224NG7Q0Ey0Zd2PBu2LwxRa1JHlNHqCVYD5rY+enx8gMR8DUOTqjlHu3SIwbmnH53SHzndcPvBbZkaeSXvn6WbLg9dulqH6Tvrd/Mbnjb0EogmbB+xYWXyBaJOna/FLpP25/KVWiNQ9hFlTbyvXzZMOCN6V280oNpbSqL8B34nJ+Yan0GrmnN/XKpG09X1clm9fMs1+ekru9L9f0Hv41lpi5P6ny93YsaQokd8bKew7fWQpKenvP4bz97bjosORMwWD8Fdd76VS7kCCEiO9hSLCpCEoCNEZ4N/rtb39rzkVcoxUGVrio1r/zne+YVS7Woq4Bc/dEFW7CkFamluy4447WsYCccWYSRdCc4xrGLbxnYyx9G4NwWnku70F6twXIIzovOK5griw/5qajmYCot1W6OjKYsnb//ffbMM6DDz5osxPcFD/sNtqi8V3O4VcDq8e1m2The49K9aoPpSDPn5mRqCZb120P6c43BsShvwS7eWfq87TT32O4DNrhi1Lca5SexLiLcDVSsfozWTf/Tamv2qBnktKv7mij00V6DdlJSnoP131vKChPmbTAeLpAirr2ksJu/SS/qLstRVlDW6uEmmftogVvEIlgofAckp6q6jp9/ggp7cc8dyzMOz469FQqCOL111+3ecBRxMUYL3NGmVZDYYwiw4YQJGaAlSeWwqieo54JUFsjLTOujAQXJAoXX7q0BK9j1MPYKqSLwVs6gzMaRyRsJEfmQbcUMdEBcqp38pw52GgRkPijxu9aGjyPTglTZCDk5hhWxcgMhg7uuOMOW8mJBWIYVmBaEnOH6RzjVKSlh1a2OezVnBBQb1Loio8fk7ryJSZdNvzuuc2bxONU0lSqtLWZB4w/QHqPPVA5Futz2gGVcWvLZdPCt2Tjkve00dycTAU7EHR+kRR3HyylA8aptN3NVytr3SrtqxL4BOk1YlfpNXyqdB+0gxT11PalpJe2BZoTtZXK0dXZv1U4oH9MB4J2raR7f+mhnYR88wne8dGhxQcaYhoFpNIo0Gg79WZTG43gfRQg5hpjjBVFkoRFLQ15swSlm54RREPpCF9H+kd9S6P4xS9+MVI6gdAhb9T7OC5pCfC+LBpw8cUXm8cpjO/OOOMMm5+LFoExeNLR2nD51VC+djbk+lugymaWAEaQTEmio0aZoHNGpxENFmWg40Lz0/LUlbM62bJhhdRtXhLwBpYJGcon0Tbhc9WRJPunsmdBqXQbNEX6TTzE5i176mlFXq1UbVgo65Z+bF7CEitXcq8JArpfs1nKVs6Qqo1LObDLRuwF3VRiHiyFPcZIcd/tpHT4XjJoynEyZt+zZcw+50jf8UdIXrdhppIGwddgm6LLjHp9F1h3GK8vXzVLaqtYEMPdmRJDh0OHJ2dc/7HKDe4tOUaCYwspH3XUUbZgQS4kSQoyUjNTtaIWywD45f3BD34gJ598spFqrgDx8B7EjYo8SkWP1TrSPH6Wgw1zrhppJCU8n+ETmXzA6QrDChitYXTHeST4XJNCjMYB0sQGARU03wyvYbh/jepMNgbEAUFHDR/xzfGER71w37/DlQPIxZjM+9UrmWwpmy91FXSGVW5tTudQb4ViMyGZr7bxQiMx53dVghwsvUbvL0N3/rIU9x6j53HoQYg6c/SxecUnsnHF53pOiTeQzETHVs9Xrp0r6xe8JTXly/TYrbfsvSs/5j+byrugu+R3GSqlw/aSoVNPkSE7HS8lvcdKLc8MRq7gyE9uJFzsIC+vTqo2rZQq7eyoKKA/9/xMMbRvdHgPYRgEMTaL+hdPS0iujDOjUsY4iLEwCmFzJSsqB+rcG2+8MdIIDImWMU+mR2GdnWvQwSBeOh6o8mmAw2DaGGPUjMM6Am/uewMaXdyRYnwHKYcbXgzvUMHTUYpdi2478F2wP8DX+C233CIPPfSQTSfENoKy05yxeBztYASZzgCS+of/brfUZS7KXdtD4J3qy2TVzGdly/JPVAKCTBr3vq4GJe5K5Fe+XmMfQiQcxxxyjM1KgW71l18ieV0GSOmgHWXAhEOl/6TDpGv/7SWv0PePraivq5SqtZ/L8o+fkOr1czTGmtRUJg5QfVdJ5ab1kq9lqLhbT+XhbvosjYd0aQJQPRs45pdfKHnFPaVb76GSV5Avm9ctk7qqTS61Ftr9sgHhqqprpcfwcdKtzwQ9wdh3Y2Jof+jw5ExjQ6PDuDIOBSAI1L+Mv2Iw5Bqj5jYWEB9rvtJAubnTQeAykQULSEdzjM8yAWmcDgj+wPERHAbSEZ2VI488stnGOTT05BmdgL/+9a82NQnJKUzMDjTKaCqYvtQxG+a2Db4LdgdMq2N6H0uTMtTB0pQMR3CNOfZN/T5oZnDyQ5zhMkAdw10orkfppHVcaL7x6ropXz1Hlk97xJZWzE/oirPPV+5w3SRTS+eVSH2xfpsu/cztZn5xP5VQ+0leiW676k+3BaWDpLD7UCXh8dJj8I7Sb+x+0n/iwdJz1N5SVDpYSTK4gES11G1aYmPiGxa/I/m29GMwfZoCKwfeC2ExjZS9ae1iqd68VuqryvWezSI1mySPhTI0Pu92CFt/drtuC7pKl9I+Ulm+WirLVOqtJWzjkWhvNlXJoO0P08ibt/JZe0CHJ2cH1NlYKkNOEBME6Roht3UFoClgPA2p+YMPPohsnFBl4/yENDT1Geng0s2Pxo8xdub3hjsJqBw5xzQsDMOaA54F2WOZjq/xdBKTA9oLPC+R/yDXeRAjM/hW+HT/05/+ZERMmXHllHFhxoopExA0daWx4B5U15R/hi9ceaTs882ZmcC0RdBS3z74Tq1fvvR5rtrn1UrFhvmyftazklez0SejxqXHha6TQqkr6Ck9huwswycfIUO2P8Qj3bF7Sf/Re0j/MXvrbw8ZoNt+o9nfR/qO3k966bZ06C5S1H24knJXjRCBgASSzhqp3bJCVn32tKz+XNNYuUbP+tf0l8w7d86DzX/W99m8dp6ULZ8h65ZOl7WLP5I1i6ZpZ2SeLZ5R1EUl9kL9Qczco98/v6irFObXysbln0ldpWcN3lgk0qQS86Adj9R46eQl09YR0WnIOYyoytucCs3YHb6zo9Z/RpWLgVSmVW0cwTogkUL4bvyaxi/dvcH72KcDgFEarkPDwFiH9XuR4NPFlw1o7Fn5CWOvqA5JEEj0rIfrFqtvTj63FsLfIwg6OeSjyz/CZQrfFgBhosLGaIv9MEg/Qx4sjoGFe2NB+WSVNows6fgigUP2lDWGcnD84laVArnMLzoXjJ9jGY7WiHrDt6Gj6r5Rq3wfouen5MciEmUL3kg46MgeHiHyFzebeSrxDtr+izJo8pekdMSeUth7nBT0GCH5pUN0O1SlZd12Hyb53dkOtkUt8rqohI1Fc16hvrdXPr14FbVbpHLtLFk147+yZvaLUrd5hcq62Alo/thfBy8dHnTr75IyVNNYeNdXrFOuXqq/RVKxdo4ZbJWvni+FxV1VUlepvkDLEVHre9SpxFy+crZKz0v95zUSfnKq6/Kl17DdpLj7QIs3mMqOhk5LzrkEFR+CYioJhjFhYDGO5MDcZBDVUHDMeRp9HO/ffffdcs8991hjylxRxm0ZFwyqBdM1OJAzY4tMaSG+ICBV4sFILlujtKjnIGkhhaHKj1LjO9A40kDjrYvGOyq9bRHhdELIjKuiAsYiH/sCpo2Rh0iGzenotAYgMGwRXnnllUhyhlxZCQsXsU0Z8iC/IGaGixg+Yl450xTRGHFMBzWYp7koB5RLpnBhhInDH8bRKY/UGciaoRSGefg2rVnucNlZtuQD2bToHSnwrZuzh6bTGEe3RT2l79gDZMiU46S4zwTlIq37tlCFP7Zc7209BThbvceu8660J/rXXlt3aivNq9empR/Kyk8el7VzX5ZaJeZk+iygIZXw/L3ESe+YvyyAkZ+nP6aJ1VeqVFwmW8qWKxHXSI8BY6WgS29Nmj+Ep3myZfVsqVg3X/eZXpX6lAahQRkdqKkvkp4jdpdufUdZ58WhETG1G7TtFqUdwBEXY25RjR7AkhrDM0D4dOAa84NZLQmJ9K677jIjqxtuuEEuueQSc/DAcxyiGhzigDBoJKOmkEHOSONRVrWZ4NLNFsLHwQTj61GdEQfSR+NIx4SFQ9o6gWUCKtsrr7zSXMEyXexHP/qRSYRsZ82a1ej8bG04e4R0Tmi4zrKSGBQ2FXxvOo8YXVL+mDmA9EzcrqxmKv9NAXOo6fhB0MwMYEEbZiTceeed5gyFTmRrA8tirWmR9TN75EvX3iNMVV3QY5geKumaqtjPP5x8wFaWn/xc+WOrP5XeMfBi3rJUr5HyZe/L4vfulvlv/Esl+lelvnKNPiHaV3WylqZPv/dUj2KNOHUPw7f8us1SuUZJeAP5Tlo0hOYDc5OLuuEuN0moHrLLo0Q69b0L9N1sMQ8fzcnltoyYnJsJVwHZpmt4aPBooADh0lVaiI65yDQ4TENC2oEIkUxx6MACHhjcQATpnuXipxFOR4bcmy4NUQinGetepk1Fqc2DQLWJq0xUmu792xvIK/Ifj1doM5DImCqG6hTtBOfJC75XWwXvgGTMmC9ajHC54JgO5H777WdSc7qylQ24l186abUx5a4hUD/wMU+dCGqIeD4SNfYQELU7534tDVS4G5fN1J2gy2Cem+WzySIl4y49h0oXlRC1BeGEl3aVUuuqylT41F/lBhVI1+vW+9VVrFXpeJXUbFoi1RvmyZaVH8n6WU/L/Ff+Kgte/7usm/mU1G5coIRdjj23PiY8vsw5h+Rene7W+4deKE1LQXcp7DZQ8op62DkXHpU1BmM1W9bpjXwT/3xBiRSWdFfp33X+XPxZ5km+tq/aGSnIq5bFM9+UPN+wDOldv2q2sbQrxOScIyDRRlV8Cn86aSUI7mWcmcY/SgrjHASNBEecDTVyNMbpCBEVOQ1bY+DeDckb9ShWvpkaOt4Zq/iOYKFLA48KP8qBC6TA/HG+Sy5AnvKtXccsFxK5Ky8seYqkj2MYvHUxgwA3sljR//jHPzZJNx2pZotsymaugKYKyThdOWRaHx1I8tClqzXShkSLRzDTw6ag4WfXGwtCRAVSUNJDK3LSmAvpFK9jq2Y+J8un/VtWTr9XVk27R1bpduVH98jKD++R5e/dJkvfulHmv3ydzHnhjzL/zRtlw9wXpWrtLMmrKZN8k6jtSf7Ph+1Gpy/fgkKASoV5xZJXOtTU7SN2/pJ07TOaEIlvAFlqrZDqyjJtLKrsPu9CvhTp++QVdU0QfaOg0ejXsx1U6doi2mnvbFMibPuIyTkHoPJDzhBXGBjHOL/ZmUCjQWNMo5yuseEaDRLPI0y6cMA5XIkCkiDPagxco8azGXuNelcHwuK1DBXw2LH4wm3flYcVzWjkM5FAJvV+tiBvkciR+B5++GEbxnj11VftXKZvnS0oD8zxv/rqq2362//93//ZkAmSP+PDzZ1e19qgXKUr4w5BNX0u8jAbmBzn8UgA2dUBr6roHyWzvHxmlATajfo6qSlfLUs+eVaWTfuPLPvoQVk67WH9PSjLpv9Hln/yiKz+/ClZO/cl2bz8A6lZP1fyK1aaxTgqbMg9mYpAevwOQUZgXFbYXboM2EEGTT5WBm1/sNSq/F1diT8FjdcS7r1wvU27qhBbgjIRrVJoYbHk668pXyGZOqehdGe8bfJ6x0FMzjkAxIvf5qiGAhJ0q/OATA0E0mZwYfcwcPeZ7cLvdBbSGWphwNQUi1zAu6KuzgQkNOZ077333i02p9vlY0s3uOQhmoJMmgbS0FhNRBgQM5b+uGHFsv/888+XCy+80Do4jKmiUckF+B7YPzCdDkJmhTOkZ8pDpvLUFkFngrRH1TveBY98OD9xHWPOtXR5AZaLxh9NyU9u9NIIMackl+jqqpRsN0l+1TrJr14neVVrbT+veq2eX29q7rzaTRquUht32pxM7+unbysJX2/3t5YajMxK+knPkfvKqD2+Lv0n7i+b1y+XZTNfkaqyJRqLe0+2eqSJrqvBG6DGEog6v6BIOxzNW7TC5PfmRNCOEJNzjpCJhDJJmUFAvli2RvnchrhpUJnuwrWGGlIae35R4F4arKY0VNzH+KSzPA+DtLtx5qA6n2flqmF070bHp6UbW6bIIb1mAt++uap7OlP33nuv3HzzzUbEOHThx+Iht956q80EiPL61lSQZvdrqCy1VZB21itnrJzOBWXT/bAcxyMZa7UH0RrvSom0xzSjbEJ43J5Mr271BMeeghkQv/ezY4zEbKvn9OfVDfcLIHE+ALuRZ9iRHVqoPM3XHqNlwA7HyvCpJ0uXfmNk45KPZcn0/0rV2jmSX48RLO0Md1gkXvx12uaZat87ZRmSDzkXhZ/cKLh86QyIyTlHcIQXBRpZp/bM1DjQwLC+Mz6ymRNNr58VrFARs5jE2WefbV7NMoEKCXHhFCSdNBc0TmsseEfS5lTWkBKqQ7akl/OnnXZaQkXqnsG2Kc8LAjLGCAtnGljjQljM3WW8N9sOUGNAnBAlTjsyAYtk55ayqWCogLnpUePafEeu8Z7N7Yzk4js0Ba5c5rIzxXswTfHPf/6zzXA45phjTBOAs5vLLrvMlmNF09TaSBBIM/I5KSG6/NKtHiONMqZd5+dj8ltC0N639X7e471gLoyPxD1JuKd4oAOgnbYuA6TbkN1l2NTTZPCUY6SgW19ZP/8tWfT+g1K9bpZKyPjYdgjEoNHXITXrueD3zmdaFep6Djid+tCs4OXL1unviMjTzGtCFsUIgixkLjLEhGOOMJjCctttt1nDAbkRPqqAuU/BVCdIiMUJICQafkgaaRViTXe/Aw080ivzpMOkhTT7s5/9zAyDmmpBzfMhk9dee82MpUgr6UNKYUyTKTnpOipNBe9B3mKYhYUuUiTpQFLHcQaqX7QKSFO5AtLsVVddJb/+9a/TjtHzHSABwjnvZ40F78H8Y8oPnQGOw2B6EmPDGNnl8h1bAqSffGHLd6OjiMqeDioSLZ065trn6j0gfazlqTcYO2LjQbmgrOe6HGaDutpVMvupq6V84auMyvpnG4f6wh7Sf7tjZcgeX5f8koGc0YhrpGrVh/Lxs3+Sgo2zleSy7ZA6WdvPCyN4bxe472X7Gg6jr8Iew6XP6L2l37j9pEufMea6c+2cV2Xlp/81S/C8OpWY9ZaoVghL7n6TT5AhO58iBaWD9YyGwoJ98Zuy+J1bpGLNJ1LglHpREWRAjZRIyYiDZPKRl4oUZh5ea++IJedmwhVsVrlyc5nDQHJ245ZRDa8D8fCjAWONZhpipAHIh7izIWau08DjKINGKwycQeBsoiFDmkzg+XQUWMjj0ksvtXFSxpixzHZOH3IN8pB530xdwmodaZYpTbwrc8H/8Y9/WOOfKX8bA+LBVgAf1JmkciQz/LUHVfhNAZ2NqEVDHHh/CC5dJ6Etgs4Ni2ucd955No5Oh5EOCHP26WBBpLn4XpQ3vgNObujE0DnMxgizpWC1k9fKUE8zA8nVvz2YPXrC5Vc419xx4nzKjkZU0E2K+4yTor4Tpb6ol9T5842D8dkUqcKe0m3QzjJs55PM+UmX/ttrp6Ba1s19TVZ99pQS81zJ91elSn0790Dd6oW8gkIzaEue1p3aGjMSS9yXGkFWSGoUOj5icm4mHFFiJAXpRTXSNELPPfecOUgAUeRKJQk2VIThF25gou4Ngmexdi5jpeGGj3tRkeMQpKF4GgL3I/nQCELUbCH85sabDkiW6TywYcGOhTNknavnEw8aiKh8DIKOFBqD5nZ2nBV+JtBJaKn8zSVII3lGx4aOGw5CmHrHfGQWZKGTxZrmHHdEWGnhM2UoN5kB8ZGHupv43rrVE+77cz0IjtzIbyo4UyAlvUfIiKkny9h9zpGBO3xRivpMktqCHp6xF99LpeX6roOlz9gDZczeZ0jfSV80t6BSoxLz7Jdl2ceP2nSsBDFvVQ45tgTbL5/5zFiau2C6ravTe5WgI+zPskYiXzoBYnLOERgvxl81KuioBhSfv7gWTOesgnuC9zlCcOcyEYQDjTduRJmGEzXeTBrpQLC2dTbxNQbh+Jobf/B+pEUcs0SNxzpgVe1U3bkAeekk9HRAk4FjD1T6zXku74emw/lRjwIaD+wNospWWwTfg3ciD8PgHdB4QNTkc66+GchlXE1FnhR6c5QD7iUbByUgpVr71InX0R095v04jwQZRkpjHigm9XpDYVE3KeoxREoG7SKDd/2qjNj7bBk4+Tgp6jdZ8rqPkJIBO8nQnU+RIbueLsWDdpL6/EJz77nqs2dk+ccPS23ZfI0/1dGLt+NtvK33UG+OdnfJLwzOCPGmV9XWeM5DgunLBu4xdZqKLj366f0dn7pics4RkJxYeQlL5qgGFGLBwxd+s52aNFNDEo6joUaZuJiLi7UvUkoU6DhgzOWmzeSyIWtsehuCux9pkgUNcBeabmoYgCib43oyDDo3EAiq5nTA6A2PW8211OYdIeZMKmtUtTgOaaqdQBh8e348O/zcXJQLvhUGbFHfjPhReeNAJNfagExx5bK8h5ESt0qhXfsMN5JqGpCcfU1a8HU41PcLn45E8FXra2Xz+sWyctYrKgivkPziPtJz+B4yaKeTZNQXzpahU8+QEXt+U/pNOkKKe4/WyPOVmFfJ6lkvyMpPH5fqDfNV2qWzn4zU8jn4DD9BqMbNVWeXXsouaJO8CxiyVVVs9KZY2ZnGgu4Kfwulz5BJGjfE37SY2gtics4h8LiEw/8okqARgmRw/oA0QcXLZaOEuhenFai0UW2HgQoaD1D8nCFOLp/fUoC06HDgMjRT48qwAtJlrgCpMI0p0/Qlxjn55q2Rj5ByLp2EUEbofDDc8sADD5hBI85OnGq9uURGGaMTmA7kGe/TmmWwNZ7l1esCT13cMIWmBblPclO+g55wx9l8Hfd0k8O3rJF1c1+RZdMeleqyRXoy39Z+Lh0yVfpNOFxKB2u70LW/3VRfsVbWzn5Bpeb/Sg0Sc7123qLKQ8TrMZmrsEtPc9XpLXrh3Qcp11b4XsOaAB4FWdFtkTw6qO7h2eRE+0RMzjmAVyE9p//MrcQoJQr4+0XljLU0DaOToJsLVOVYg+PxKZ07Q6Rmlm1EBduegIU2C2ykmxYGyHemmqWbe91YkH+MNTNEkOm5OLnA4YpDVL63Jbj00eH45z//aVPevvKVr8i3v/1tyz8MtZwv6uYSGcRMWcNqOgqcx4gSEm+tfOM57pdrkF8WqxFovkqO+t4mOTYNbmw1+R10qyfccXjMOQiTMAnuHRpweVm3ZaVKw8/I0mkPmMU1RJmXrx2kom7CGszmt3uzhvn8GZWYH5Pq9RCzJzF7z4t45lan8qWgSx/v/UmEBdDOQc0WlZw32DOaAvKC90FVXljaV6OF+NOkqYMgJuccIFFhdEtj/Y1vfMPGdZMVKwkkMha3uOKKK6zxR73XFNDAoI5kmgpOKn7/+9+nnQeLyp2xUaZy5VL125LgPZDuWKULQ69MQFWP5XguJUtcdiI5pzPSIk+ZEhS0MYj63tmAZ6Rb0cyBuJsaPyA/uZ8yg7T8hz/8wYZYWPaSzh2W4Ay7XH/99RmtxrMF5eyggw6yHxoG8sv9mEaF8xC3pnhz3qshkLe8H52OF154IbEEq3NB696zue8L3FvgBatrz8FSWNxd423Ku0H0fC/dTSRLd/TY+44cpU9vVKPO8hBMvcqrXi/r5yFBPyKVa2cqVzLsoLHVqWS7aYkS89Oy7ONHpHrjYilwU7XsUfxJPnPrp3tnUOWX9BjirUCFBkHTy5Xa6nKp2aKSs5Jzk3LEMqNApfIe0nMQAoY/ZLB1QjoMYnLOMZDivv71r8vXvvY1s2COAoQMQSNBMzWIaTI0Io1pIIgDIymWloSYmRMddT+NH40g01ja03rKvAtLALKoRJSa3gESYG1qpFiQi/ej0cZYCeJKB6zysS+AnEFznkvnA7V9uo4AQCvQHLW9Sx+dALQ3dOTCz0Ozg4MX0kL4xpTHMLifjur//M//2Jz6008/3aYFfvWrX7WOKVI675SL75UJ1C2clOAKlSld1AOW+qTeMMwUJOhcwHubPJXu+kihEnR9kwyXPEnVkhXMHj32vkvq6SiErxMf/wqQqytWywYl6BUfP6rS8WyRmo1SW75EVqnEvGrGU1K3cZEUBMeYiSzwnaJLKR0Kjb+4p621nM+Ys92oqK+ROpWaqzev0TNN1xbWKl11GzROo0XA8OMOv2gHQkzOLQDm+p511lnmkCOdAQ+qRSSYyy+/3BxoYPCEKjWd0RMNCA0JhIHEgwobT2I33XRT2kUZqMikhYaJRfQhslw2RC0JSARifuedd9KSliMA5oO7KWdNfb/gfXR8yGOkzHSAlHfZZZeM46rZAskuXecK8J4MlSBxNhcMewSNEsOgDOKNjOvNJU7KPvP1Kac4UEEqv+aaa0yNzndDim5J8P2oVzybedWsu402hCle1BtsGTDUbO57bo08syjuOmC0EpmWSz5rI8ulJzlruoL36bErIw3Glgjg7QTfkJWj6ipWyfr5r8mS9++V8gUvyOpPH5PVzGMuW6ApTk+g1MR0ucU4e1HpAOkxYIImlXrhhcyrq5KK9Uuk1paRdHF715DoswXOUXqPnqJ7LVtu2gpicm4hYLmNxIA1rzPACoPGg7nPt9xyi7nmPOOMM6zxQvUGceOBC7Uu+7ip/Ne//iXf+973zNkHXquQnJF2ohp1KjZjet///vfl5JNPTpBI7huilgHSMo1p1LxmBzQTjJVixRxEUwg6mC9IW5lWoQKQMxbU6b5tY8BzGkozRJeLb4eUHjW9yYEx9oaGERoDOk1ok+hYoN1gy/BDeP5+LhDOR5zIMMc6rJlii+oe40nqEGh+3hJ38tl5+aVS2m+SZxhlJ/iT+RsH4UnOGj6RLt3qsUsn19OCx6Rc9p8beLytg1y52gh67uu3yIpPn5CaTYuVEFyHNBiBtx8k5uTzidS6ElKf30269R8vJf1G64f3hs8IxfrTm1bNkVoW5bCzgHu4K1vUS3G3vlLaa4J2AhB4Ai/TQRGTcwuBxpSFKlBdM96bSUqg4WA+Lb37K6+80lR/zlgHdaD74Y2LxRFwl5lprJoKTEN48cUXy5lnnmnq0GCj1R5AxyXTvGXeEecf4QU2ON+Uhpbn8ONbIFlisJcJdL6aO7/ZIdv0NuW9wqCT1pB6nPKVaQpZNgjmi8tbtx9G8HpzEMwf4sPSH2JOB+w16PgGx9ibl47g9ymW0t6jJK+kr6/a5lq23w8VMUSsu4nk6I4ekz7Ocz0tUh7Dgd3ggWjYt+jqJb+2TOrLF0meEnVSYuae1Pg58mPSn7vOFhBTgZT0HCJ9Ru+hvNwroM6vs2lZm9cukPqaCg2ajJd4kiSfGSxPWdJzmBR1G6p3FIZSB7Y+094Rk3MLAjUyrh3xhgRRp1NxO1DxUOeiuuaHipGGkgaGaS7ZONmggUKiQ5WNJO5Uoblo2FsTSFZ0aNKlm7xErYxRVi7Ac/jR6UFjgUYiE1DX4ks7F/nqNbgNx9M84vCAG1h8kGcCxlOZNBbZgPdx6XV56/bDCF5vDtzz3NYZoKUDdY2ZAO+//75/Jjp92SF0n8bTpecAKew5SukpSrtCGkPfM3GIREn+6W4wWj0mfZwP3ekj+qyBePTH65mNmh+v976BEwYvnmRs3mpXXgjOumEm9o3itbHrKaVDpkjpwB1Msk2Era+S8pUzpXrjMuXl0Hx6fxsEaYs6L3ndpPvAiVJkmgif0v3v7N3hPbEjISbnFgQFH0mFZSB/+ctfmnq5JVfJgbBQo/+///f/bFyvNQxuWgrkG+OS6XxWQ8oYGDV1sYl0QNrCij6T9TRzqnGDmivLd9xYpvMcB/iG5EMuVMGolBvKM1Tb6cb5G4PWLnvh56EhSDdrwgEVP77ZM81nbypsSlGf8UplGTrljmBSthCe12FJdsh06455ncBpb+PtZJSoFZmvJhGKXuHHH4qA47r8EinpN0n6jd3XmyudSKBKzeUrZP2S6SY9B7+CiyYUXcQJoO9d1EOK+08gU71Tfj554dN/3/aMmJxbAZAmi1dgIYolN6SZSSpsLGi0aYiYKnX11VebMRoE0p4BiWCFzZAARM3YrpOmIZdTTz3VpunkiiABDR/e1bDizQSkT1Tqufp+dAYyuSbl/YPOY5INdsshV+/W2iDdLu34PT/qqKPSzpoAdEIYl+Yb5KJDkoSmIa9Exu55pNTkd1MOiWhqA8RisiAqX0s71Iyqn0PvujXVesKO3XnETP8y9yPfWjw5ALG4X8qepcf7ocquK+ghRb3Gy+DtD5fSQTtKXoHnfRDU126WTcumS9nyT/XVvClbDslYUhF1jtzoMXic9Bmh8ZtzFwXPsPzyDjsiYnJuJUAsjFH+4he/kBtvvNHGgjFkwlgmWQEbB4gJFfaRRx5p06muu+462XvvvROOHdyvPYI8YQoYHRoM6zD8OvbYY+Wb3/ymWd8yLQaSzuX7YYTGHNhMPq7paLG4P52fpn63xoLnIDm75zX3uQ0NryA5N3fMeVuDPKIjR4eVefCZgKU8y6sylNTk8hR1W552KAt6qUS5l9QqURPEBTNFcb7+/E9pquYE0xg160Z/iXg51r+aPt4tcd0Hx4nGnNNecG8/uWny1oHuC2rrusKeUtBzrPQad5CM3Pvr0nv0fpJXmLRlYN505do5smrOKyo9L+cEZ/1fGIHz4ct6XFdQKl36TZSCot56IplHyf2OiYL/hw40RquASkUvHnUtEiGqURbqd84z6Lm73rtrgCF19t0PMse7EmOeOHJgXJnl+GiEghJ58NceQbp5dyzOaVx5PyRpVNkckwe5fj9ImUY6OAYZBs9l2cOGGvzGgKlLGAOmIwbIFI0Lnbvmvi/3o0ZnCVOM7qLANKovfOEL1nnkG7Q3OAID1Df2M9kRuHpHp4uph03J44AQGwAn86WwpFjWL/xQ8qs3atz+lehPnUR+iXTrP1F6DNtJSa/U4ywluNota2XVwumSV7NF6gu0k6WSan1BsT5Gt/ibzte2BEtp/dXprz6xX2T7hGWesO3718Jbwibu1/h5Rl5BNxtXLug6QIp7jZaeI/aU/pMOkQETDpauLCtZ1F3fjbKChF8jtZuXyeqZz8j6BW9ob4/31rrKO0TkEpKxu+pteFvdsY12RLoOkWG7nSolPYbpcfNnR7QX5GlBbqiYxGgBkO00CDQYTPnA4QZzMCEGZz3KOBjSnJPS+E2cONGcX/CjIUF6zKVqt60i2OC2FPgGdHReffXVtERJxwrHMUj1uQDPwUIfmwTXMQuDDhmqV9T4zQXPe/LJJ81JDuUuCpQnHHfQCcnFVLFtCd6XqWHYYJCH6eZ3MzWOb8A701lubHnz6SQCSqhVa2XGo1dIzSolaPHdweoNxG8ScATqlAwHbHeMDN7jDCnoMkhDeUZZNRuXyPKZL4lsWaFxaacCidSi8FJAONs1SZVdqI9DPQl3uvN6CCF61/P1uE4FeT3mgoXTn3XMVDgoKNTdYiku7SMl3QdKce/hRtLmopP5zHgC03vt/TWe+qo1snbmc7aaFYtmkE6XjiiY1sDSY0f21x3VSJEUDdpbJn/pF5Jf2HL2Om0RMTlvYwQbARpnpBnXSOOQhP2g6hvJuL03mG0RNNrMJWdeOCSdDljfs640wwmNbcCjwPfGixaq+nTkTAeM5UYxLMwFWBubqXmoc6OAhT/viKaiPUrOQfCNyFfclf7mN79Ja3hHnUIThXMfOsA5RV2lrJv3lMx54QYpqlmrtOM1uZnKD1Jw7zEHy/C9tYPUfZSRH8RlFs+si2w+qgNNN7vBqIKiubsGQRu0nCHl2nm9AAW4rYFj9939SO35tDv6Y0ELc83pX1N4yavWV10jG+a9KsumPypV62b7vrldOFe+LbC/dXDP9jsItpsvlcXDZOpJP5fCnjvqCaR+71JnQPuueR0MNISoMOm5YwSEQQtSszt2hlExcg80FBiDZVq/mbxH1cs3aS4xuwYIQ7A333wzLTEDVr5CS5IrYMzm/FpHAYM3NDPtnZgB34jvxlRGSDfdN6Nzhjc63JdmWuykSVCps3TQLtJnzF5Kut4Qln1/TYujpDDq62qkomyJVKybr0fMHNDyBjNhEFVQqr8e2lNXSbJQpdeUrX++gF9vb1vob4v66I9tX+8ax4QNbhnX5brFpfsu3nyNl+eS/rwiTY0/3GbpqpW66g1SuXaWrPrkcVmK3+51czXJ1f778Zdf+vrihfOue98oT2ryusnQHQ/TV6KzRIfALhtcvrltR0RMztsY4caC40TPURHVmASvNxbcCxE1J46OCIYSWOwik3MXOkvMraYDFfVdmgJIIZMBGkBKz4XrTgfegzH8qGl9GJ6x7Clq3o5URpjbjSYg0zQyDMIeeugh8y+QW+RJUbeB0mvUF6S+pL8SijdE5V2JBqRXsX6xrF3wttRucnOE6cD5dyTKX/g4JPFuteW67ofvz2ZLeTCJnB8+yVWCr90oFUrK62Y9J0vfvctbzWrdHJWYK/UO3jSMcLweCBnsnrJuc1HvcdJ33H6a5G4afGuhxJXOjlNKUxGTcxtEsOGPaiDDBJ4NUJ/S6GB4dNddd5lqk2POB9FZSRuCxOELHZcokOdIk7vvvntOtBfuG2eT34QNlonmgvTjAhYPdBA/mhnGmTEoxDPd+eefn2Id3hGAtuO4445Lu5wr4Fu899575jI3kyajKchT6bkv3rOUcGrFk56jc9c7a1RVUybr5r8uq2f8V2rWz1Ei1I5jHVJ9rSZW6y2q7eDWnbctP43DtlrGEseE5zgQPvJ+thqefOC6ufXULSr1ui1SV75cKpa/J6s/eViWvnOLLHnvTtmw8HWpLV+mpFJjb+GPQmcFQmK87kGlZpXSB2x/kHTtw5Ks0fG4s9k/pX0hHnPuBEBNxypYGPkgHWKERuOLFIgnMeaCOqMyVxw6UsOcDbCYxr95Or/TSMsQF2OXkFiuwEIUhx12WGId5SgwFoqjDCRewDdq7vchDgzCKA/4d6eM4NiFGQQ47gAdrQygHWHc+Xe/+51/ZmvQccFZEHUFbUVO80AJr3L9pzLjv1dpb3CmklGg6XW7KY/DjKpQ6or7Sq+hO0nvoVOkS++hUlCMJOlJwCSPW735v7Zn55IRsXXlJSDL2iZQjmz82DdPo3zZXr03TK0EXa+dguqqcqkuXyeVm1bJFpXqt6xbLBUbl5k1doFU+/c0H3hU6zJ8Xxl7wPlS3HOMnumcMmRMzh0cSACMpTI/GEvw4OemIWJKFwvvMw7ZmcHc8x//+MfmJjUKOHm57LLL5KKLLjIDvaYiTKxI66yqxTdKh6OPPtq0Hbn0LhdMB/v8OsIYcxjB96QusEoVvuszuScdOHCg3HDDDea3vaE54Y2D1r26Clkx4xFZ9ObtUlSN1yyVTP1Ljjc58GqpR5hYU9fllUhB1z62JKMUInl72hSsrD3jLg1roid3cqxb/73ZeMHyLWazylbWzdPwblvH99c47cnc4BuPmZU45aOuRn9VKjhvkvrqcqlVosYXd3OWgIwCNun13UbJiC+cJf3HH6pp8Rbs6YzonF2STgQaJ+Z40vizHwTjndOnT884r7czAIkKyTlTgw0hY5iFUV5zECRmyALJNZMRGs+j44RmI/z9moNgOtjf1sTMu+Xy/RzC77nbbruZpigT6TL2jM/tFStW+GdyBCPQEhm43WEyaIfDpL4Qz2V++mzj3h+FMCcgZn9bXyF1m5dL9fpZUrV6uv0qV30k1as/lirdVq3W38oPpHqlble8r+c+1OP39fgDqbRjtu9Jte6jjq7Ua2wJY1vO63W2lf75KsJzv8ZVveZjqVk3U+rKl0h91TqVbas0ZRmI2SRx/92yhBFzQQ8ZsvOxSsz76+257Bi1P8Tk3MHBdCyWXky3TjTnkd7Szf/sqHBEwBZpmU5KpjzAkGjkyJE5JTGeDQFk8usMObMuOOPCQaLpKKD8Md7PtC6mOeXcUtoHeU3+IRV/5zvfsVXb0oFOEx1aOq1hm4wmw/GuklZeQW/pO/5AKegzSaqd320rj8HvCzF7W+BRHSSN0hdptkYbb8aDvS1SLFsIMz+Pfe+8HSeue5Ku2890zDYvz93vH1t8/JJI36EKv09mELo2r6uUDNld+k84SG+l44Kk33kRk3MHBxLXgAED0hoxcR7LXEc6VLb0Fa7jwBEd78oUGozjMr0303Dw5pZrgmzIxzrXIeiORsx0hOgUoj7G8QfDLhdccIFZS0PWuS6DLv8o5ywOw9SqdHnKs5GeGYvPmWEYj7IffwqktP/2Mmn/b0hR79FSxzl+Ka+cuMGOUqDhXNrTl4t05xsLlwYXX2q8aZ9vp7PNO21zVEruPWJXmXDQOVLYlY5Tkpo6fmsUjZicOzgg3ylTphhBh0HFwrgp6HSBc+krfMcD1tksepBpOhN5iGrZGUrlChAFblixmE4Hvhudgo4GDO9Y6xyvXA888IA8//zzcuedd9qYPgZb6byX5QK49PzSl75k7lDTgc4Dwxy5kuQhmFSSKZai/jvJoMlflirp7cmjVu0aoCINYxrjjOFyWH/1MVunPYioK5nvCKMWY7buo6Tf9sdKYbfhmvzkMp+8SQ7fpl0hJucODgiAxTCYNoNzCdSjSGNsUdPis3nXXXftVIQcBKrUhpyAuHnBWLjnAk4qJM8hXubgRuU/nQJWo8JlaEcC7//222/Lc889lzLOzzdAzX/77bdntF5vLshrfKNjDJlu7Jl6Qx1Jp3FqLLb6unn5+r+bDJh0iAzd/XQRXHTWN6Y5boX66vMrTwo+LZV2t06Hp5DPLn11okTcdbgM2/VU6TV8d80Tb5pZjJicOwUglx/84Afyxz/+0bYst3jppZfKNddcY6pE5oB2VixcuFDmzJmTUY3K3NhczW8GQSJmIQ1UuizwEQbEzUpckERHAuO4GChGaSv4DvjC5pvkTKUcAvlPfpO3UdoQrlMn6BTRkc0FeC++emo5y5f8or4yfOfjZeCOx0tVARJ0G2qSI/g1qy+i96WvTUkwer5Fesu4A86RfhMPkbyiXpo/2ZF6Z0C8KlUnAQZNzGFl8QQ8JWGxyjFThKKktpYEDRQ/VIZObUgaWjsdNP6szoQf6XSGP6SJFZqYfpOrhjoIJLQJEyaYahtVKlbhEAfjot/73vdM/Zorib0tgO+OERi+wlmeM8oIjzzBjziW1bnqEAVBGviWEDPjys4gkm/N86gr5Dvaplx1XF3Z3qqMMw0qv0R6DByt710gG1fNl7y6zQkizzPPWB7VOcJLjQEyz4YKm4hwcv1fFEgFE7Iw40oXBvBedflal0qHycRDviu9xhyg2cByk55L0Bge4nnOnRRexW/9igAhYh2NJSxW5DhEwYIWhyiQlPNM1dLpI36spFkv+uqrr05Lzqg9cTyCs5aWTA9j36h4yRvICYkajQfP70gNFvnODycfV1xxReT0NcgR1TYevVoSlEUMAVml64033rApdeQ7HSM6r4xJ8y1aAjS6KV+1vlbqqlbJwg8elrWfPqIFgulK2mHQvEoG9OYhR5WGRLBtXFSQrL0c2+oNDaQexyrSY5QMm3qq9JtwsL/a1DZOeBtETM4xWhUYAl133XXWIOIdiwYSa2TImeUacfzg1LgUzZYiJuJm9SlIl9Wo0lUDFpyAKFiNKkZuQF4zVemSSy6xTlpQekaixbf39ddf32pj7ZWVldZJwK86mgs6B82dz94QXGlLLd2aDzXrZfmM52T9nGelfPmnSmPMJ87cRNcRiQbB4di27seR0nRJwOitJq+r9BkxVfpuf4z0Zoy5qKdeaUOq/DaEWK0do1VAg4w6EzeULI+4ePFiO6ZhRHpm7Jftvvvua+rGIFm2BEETPw5A8LzFtJko8Fws2b/73e8mXGe2FEgPz3Pbjgr3fqiL+WEABimiIcBdJq5Mf/7zn9vqXy0htUblLx0CSJlvjOamJYYvEqzlb9m1VKSwmb5vXomU9h8jXfoMlc3rV0n15jV6NmL+vd3n3ehepy0Um3RJgJhxMNJ16J4y9qDvSLf+kyWvEFU2d7SBhLdBxF2WDgQanrYK0ubIMMoQCLUyam4a62AD2lJExVj3Rx99lHheFJgjjpV2Ln1ppwPvGUUcHQnBfMbW4ZRTTrHpU48//rjcc8898uijj8rf/vY3G2tuEYJUROVva5Q3458gEbPvH6eUvrwC/V8qPQZPlQmHXCC9Jn5Jqgr7K7m5ptrdCPytbjxPYm0DqfUJtyUFUt9tpAzZ8wyZePD5UtRtjFmqe5nRdtLd1hCTczuFqwCohVkT+PPPPzeygQAhHGdolVpRth2QkjEASrewBCBM0Ld1SxIVEruT1tMBaQpL7ZZWcTp0ZGIGvF+QBOn8MJ3PjfEypQ/puaXGedOh1fI9/Bg9pnYGT3u1Vc+oBF3Ua4KMO+BbMnKfs6VowC5SU9jDiC7YbCfrdzim1kJq++I6OiSrFqV8Xg/pMnwf85U9eKcTpLB0pCazZTpeHQ0xObdTUAEYq2NKyu9//3s599xzbcyW309+8hPzFY2RUas1PBEIdgwYX0ZCWr16ddoOA6pNxvtaAxj/IKlncjKB2pVlIrdlHnZGtJUOZYvCL1LhkpV6rM1zfi8ZuN3RMuagC2TAlFOkrttYqckrVkr0NC1aOC0kOYaxGDORWjf3XIp5uoLFNPRcTX6pFPTZQYYpKY898Hv+IhYBX+IxGkRMzu0UVMxly5bZ3OW//OUv8vLLL9tatFidojrG89K0adO2aUPnSA3pnnWkcZOZacoSY82M+7UGGWIAxFgzaYsCaWChi6j5xzFaFp2iM5SmWqaeJh/0l99VuvVVopv6FZlw+EUyeOeTpbKgv9QpSQdLr+XatqvuChUY6oulsniYDNr1VJlwqKZ1xxOkuMdYTRbap5huGoM4t9ox8KIE6SEFBoE0CDG/8MILpr7d1mDVJcYUG1p9Ca9Nre2qMh0RkB6kZtSsMWLkFBBoRLGL5FUtn9a/ziuwKUc9Bu8lQ/c4RyYefqEUDtxd6kuGqZTK+K03H9yn81YEknK+1Bb0lLquo6Rw0F4y9cSfy/DdzpCu/abo5W5e+mM0GjE5txM4CdhtkUAhO9xPRhEMKu0lS5aYJSzYVhI06XjiiSdMok8npQIW+sdjE/NMWwOo0CHgdPmCwRI+yfHDHCNGTpGGPdMRa6J+21Z/BaXSa/QhssOXfiFjD7tU+k85UYoG7SI1xYOkWrqZ8Vido3ot33a3lXNvjnkuUFtfILX5PaSmZLB0G7Wv9N9JJeUj/0d2/PIvpLC3krJK+6SXtLtfjMYhJud2Ago3FStYyB3ZpatwXHfXtlXlwBXjfffdZ52IdMAy94gjjjDDoJay0g0D9fmYMWPMKCkM8gqf1kjykHiuGrQYMXKCesiuRAqK+krv4XvL8D3OlLGHXCrDv/AtGbDDsVIycGcVWIdJlXSV2rxiYdFHvQFublI7QOmvV8m8RoqV/LuLlA6XbkP3lIFTTpAR+50nYw6+RCXlr0n3QTtJvkrQUo+/8phamos4B9sRghULN4O4fEznfhPSQUW8LV0/0jnAyQRW5JnAghwnnHBCzlwlZgMkdByesOhE0DqYvCTfzj77bNlxxx3tmF9M0DHaAuoZZU5Ud1TKhZJf2FO69BwrAycdJcP2OlfGHf5zGXfET2X0Yd+VgoG7SF73UVJV0E8q83pJpZJrtZJ2tRJtjZSk3VZJFw3bQyqkp9QUDpD60lHSfdxBMuKQ78i4I38mYw79iQzd/UwZMO5QKSwZKnkFStp5kLImjvRt3STFaCRiD2HtGEwFuvzyy23JPaYh8SkhEogbj1u4SGTlHRBF4C0NpnSxLODNN98c6UMZQIz4MMaorVevXq2aTlT++Na+++67zbiONKJex20k6/06V6IxYrQ1uLpu+/bX8aEn50o9hpfMRKiV+roKKV+1UCo24RK0SpZ8/raG9Q0zuQkTb7tZ49T9urx66VraX/oMmST1BcVS3K239Bg0WsOgZYKAC3U/dUpXjNwjJud2DMjk448/toUbGNPFVzQSM9LgaaedZm4Qt9WKRhilPf300+aikSlLUcWMxgVraFw1stBAa6m0gyAP6diQd6SRMWbmN5O2mJhjOATJMAoNXW9ppPrcZo/6hmTNX5W267VzjH9PtnWV/rGGo15GbTEwKyjRY1Ti+nNbh0R43Sd4CJwGEZdiZImYnNsx+HT8cEKC8RdW25AxC0ng1QoJels1GIw1/+pXv5KbbropraMPxnNPPvlk87UdW0XHiNFcpDJlTgkyGFmYMdI8IDU1MRqLWC/RjgHxohZmfjDjo3vvvbfsvPPOMmzYMJNCt2VPfsaMGfL8888nrMWjQAci3Zq6rY24jxojG7TtcpJa33NV+3njeltVw/a8iN0vDQjJZbYxmoaYnDsIIGL329ZApf3222/bOrnpGjOkZtZJ3meffVrdXWM6xAQdIxswjZFOJ9MEM00PbAvIVWugLUtiLwVpHsBpR9AxmoZYrd3BwOfcFgTtnst29uzZZu3MsoDpiheW5qyljDFYa/mubgsI5lPwO4WPHdKdj9G64DswfDR9+nRzmYsbWjQ+rFqGtor9qO8aI0ZTEZNzjJwCj2SMIV955ZUZ5zYfcMABtgIRXrhaGm21wSRdSF/kEwt+ML2L6WSdqbPSXgAx33bbbXLLLbeYRgjpmaEjOpnYTVx88cWtOhUwRsdHrNaOkRNANPyQmu+9996MxIyh2oEHHthqrjrbGjGTT6hD58yZI9dcc42ceeaZctZZZ8k555xji5iQh21dXdqZwPdiVsStt94qH374oaxbt87KN1tWgbvxxhvl2WefbROucmN0HMTkHCMngACxFn/44YdN9ZcOhBs3bpycdNJJCdeYjtj5tQSCcUN6SD1IrGxb6pkNgVW6rrrqKvn1r39tq3Ux3xo3p7/5zW/kBz/4gVnfg22VvhhJUGZmzpxpnaao77F06VL517/+JYsWLfLPxIjRfMTkHCMnoNGaO3euzW3OtAwjHs2+8Y1v2FgdRM19bN2vJeDi3bBhg7z55pu2CAcOWpgfzrg4nQrX6LYGGZIevKZFWbPTaWDBEhY0ofPQUnkSI3tQJlBrp3OkA9CCMBbNN4sRIxeIyTlGs0HjRaOE6o9GKpNKlilfSM3OOUprkQ8EjLodpyj8mIP9ox/9yMYKUVc6gm6N9JA/dGTSrdKFQxQaepyjxNj2oExgD8BwTBQoN0jPTz75pNkOxIiRC8TkHKNZcIQG0TDuhvORdMAd5pFHHmkuMlsbbmyQNaVJI+s5Y3GL7++rr75a3nrrLXsXfq2BhlTqSGmtmZ4Y6cFUP+bkZzL4QgPy1FNPWfmKESMXiMk5RpPgSMNJmjRKqGNRy0aBcFi27rbbbomVoFqLeHgO5Iw0GpbqubZgwQJTd6OObw3J2eVFuuUonRUwVtutkZ4YmcE3wFf9vvvuG7mKmQNW3I888kis8YiRE8TkHKNZgNywXGXxDVR76UCjdsghh9hSjI5wWot4SCOSfabxQNSRmcbKcwnem7mx++23X8riGmzJJ5aqPPjgg81RS4y2ASRn/L/jGjcd0HY888wz1tFz49Ot1QGN0fEQk3OMJsERCpLoiy++aAZMmciNBS6OOuooGTBggB23FjEDnoWTiHQLa3Cd9Z1bc+GN0aNHy/nnny+nn366dVhYrGTXXXe1BUt+/vOf23Fr5lGMzKDThHtcVnlL910g4sWLF9v8fYZMYmKO0RzE5ByjWcCQCqtnN/UnCjRmuOrk5wiwNRsuno+zk1GjRkU2rP369ZPdd9/dGuDWSBfP4Fk4YmE6FYZqOLhg6UrmPbOamJOa4wa+7QCf9aeeeqp15NKBDipjzwyjxJ2rGM1BTM4x/n975xNi0xvG8bcsaGqSlCZJhlmIUKIUCxsWpEzMxlLyp+wslA0bxVKsyJ+FtQ0bCxQLFooFg6gpGzNKsrH2+zzm/Dq/+zv3/n5m3Pcc534+dXPnzuS8vefc9/s8z/u8zzMvKLxAyLhXhjYdpw4dOhQhwToWLASOLHG81NHR0djLRfz4l0Iox44dC8Mh99gwVJgbEuQIZXO8jMiCwtxMuF9szezcubNnlIXkMLZ6+E4o0DJXLN8p82JqaipCsd2yVMl0pbzh1atX0+LFi2c//Sk8ORcursdZ1cePH0dTjpmZmRBCRBFPdXh4OMbT73F1+/9zz4f8GsX94V8K7Zw4cSKeoSow+q5duxYGKc+/91XmguIs8wLBo+wkC1aV97x8+fI4qkSDiyYsUiSF4e3j3bCIkpCVc69Z/nyoBEa+AOeaq5IMORNNgiRGn8Isc8WwtsyJwqaj4heeMwlfnQsRwke/5t27dzdmkUKIOcJEOBlvWWGW/0PZh+GYG1XuqnIYeJ6oG0+Og8Is82HBub+YfS/yy1A1iVrZ7JN+/PgxzjnznqSZvXv3RjWubolYIn8K5eeXUDXJYST1cUaeSAzveeY5kXDhwoXIxveZl/lgWFt+C1TcevfuXZSlJGSMJ71+/foIa3creyjyp8KyyUmF169fR5ib5x/BXrdu3d/d1hRnmQ+Ks8wZHp3yAsSec/EivMfvXKCkzfAdoOAIzzxGqIao/C4UZ5HMdBo1UPWZOC8yuCjO0krKj3XTFne8rC9fvkQ4lBeJc5SHZG+eTF/2NEVksFGcpZXwWCPKRY3jItQOdYo146Bx/6VLl9KTJ0+izCPjInt8//796fDhw2nlypWzfy3FfSyWKeaPFwaMZ4ilzSjO0kp4rGlm8ebNm2jIwYJOos7atWujznZdi/q3b9+idvaNGzeib3MB48F7Pnv2bDpy5IhHvDqg0xO9wun8RMtPjjONjY2FIVNUVBNpE4qztBLCxVeuXIliEEUDfER5z5496fTp05FZmxO+Zgjwy5cv0/j4eIhMJ3iCBw4cSDdv3uzaTnLQYN6oV33nzp24n0Qd+HnRokVp48aN6dSpU2nXrl3xt3rR0ibc3JLWgZfMYk4JRbytr1+/xov3169fj89ztYcsQDg4A07p0E+fPs1++k8YN6I9PT0dPyNMg247M2+vXr1KFy9eTE+fPg2vmap0zNGDBw9ie4CtAYVZ2obiLK2DEOjDhw8jhNzJ9+/f0927d2NBz0FZXHnPdXsZBhRyKcQZwRl00WHOHj16lN6+fRvGSxnyCajp/vz584E3YqR9KM7SOsiERuA6F/MCBJLf51jQy+JKpyIqSvW6LuVQyd6Wn1B9i8I23Qwa9u0pfpM7EiLSbxRnaR0I3NDQUFevk1KLHFnK7ZUiJFV7zWVIcuJIVW6a6nmSGEdZzG73iqIfdBez+Ie0DcVZWgfJVIhcVcYzSVf0TV66dGl2QcKT59XrunjNJDvVBWNjbxxDgpKUbANUdV7KBfeQJhLldqNlyHDnfirO0jYUZ2kdeMYTExNp69at4UGzcCPKvN+0aVM6fvx4LZ5zcb3/um7OcZUNBfZw379/H0lzZ86ciUxo+uKQ8Z5rG6AKWi+S4Y6HjFhzPzk+RcY9rUjJ2q5rbCL9wqNU0krw/J49exaJYRyrwmMlXEw7vx07doRQ8+jnFMLJyckwDCg+0o2DBw+mW7duZT9KxVyQzX7+/Pl079698JqZM8Rw2bJl6ejRozF2Ig65YRwfPnyI/smcWydjm4YqGFq0I12xYkV2Q0uk3yjO0kp4rFnUCcuSVMR7BJmQcTncnUuguf79+/fTyZMnI8GpCsaGt0ohktyFNZij27dvh8f8+fPn2U9/wvxs2LAhXb58OQwbohC5Yf4It9PxjGx87iVbAOV5UqClTRjWllbCQk34c3h4OEpj4v2RKNa5D51rQccIQAB7ZRUTjl+9evW/xpgDxobnTEZ5J4wdwSYCUZctj0GA8bJkyZKoDsYeNPPF/SteIm1CcRbJAOKBgdCrdCjeIMZEHUKDV4ow46FWgVFB/+KiVrmI9BfFWSQDCC77pNT3rvI+8QxHR0cj8zi3d8r1CBGPjIyEN1oFhgPGRR1evcggojiL9JlCbMk23rZtW6UAErLdvn17iHdOz5mxcT2uv3nz5tgC6ITfr1mzJgyHOrx6kUFkwTnOSohIX0HUSF5atWpV7O/SjKPwWMmA3rdvX2RD02UppwAW18Jzx3hYuHBhHJsifI0Rwd7uli1bIlGNo2l6ziJ5MFtbJCN83djbffHiRZqamoqfCSfjtSKOdWRClyETmuNK1LLmOBqGA0eW8OhtzSiSD8VZpAb42hWVt8gqx4NtSsiYsZEYhveMp9yksYkMCoqzSI3w9Wui8BXjaur4RNqOCWEiGem0hZskfOWxFeMqBFpE8qLnLCIi0jD0nEVERBqG4iwiItIwFGcREZGGoTiLiIg0DMVZRESkYSjOIiIiDUNxFhERaRiKs4iISMNQnEVERBqG4iwiItIwFGcREZFGkdIPaWDwEZDEmXsAAAAASUVORK5CYII='
-
-_tools = b'iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAAAXNSR0IArs4c6QAABHxJREFUaEPtmF9oHEUcx+c3a7jkRbCK4D8UPY4zM7NR8KEFhWhFrFalWksVQVGhL9aA7buoWPEhKlItAQXpSxXSgqAVH0SsDwER9W5m7tJwSLQVpWAQjcRAdn5mjt0wXXfvNne7yQUM5OF+N7fz/fz+zfwWyBb/gy2un/wPsNkR3LQIjI+PX7KwsLANEbcRQi5bWlr6rtVqLa/XIRsOwDm/nxCyHwDuiotFxBkAqCPiaaXUt1lgNgzA9/3tiPgiIcTPIsxCGGM+bDQaX3RavyEAQohHCSFvJXnctQHAjuizMaamtb6vG2zhAJzzjwDg9kgIIv5JCLG2k1JKae2c80MA8IKzZk4pdWc38fb7QgEYYy9RSp91hH1ujJlsNBo6svUjvlCA0dHRnZ7nHXfEv6OUOuJ6NUn84uLirvn5+X/i3vd9fych5Hy9Xj97UdplCVMvaxhjk5TS/fa3iDitlJqIid8HAG+6aYOIj2mtf4vvxxh7hFL6NiFkSkr5cuEAvu9fiYjfRxsFQbCj0Wj8HH0ul8ul4eHhMwBwbQg453negVqtNhcXzzl/BgDaohHxjyAI7m42m79G6wqpgVhqfCWlfNwVJoS4kRDytQN4j1sXafVh7caYw1rrE0UDHAGAJ8NNXpNSHnUBGGO3UEo/Db36o1LqjgTPX9SZnFQ7oZQ6XCgAY2yKUro79NjzWuuTrsBKpXJFqVSqOaLeUEpNpnkeEecAoBKlm9tii0qhaedQ2iulnIl7WAhhC3hfHCKpM9n6MMZ8GQKsKKWuLzQCQojXCSFPpEXA2jnn1xFCjkeejQPGi1sI8Utou6CUurVQAM750wDwSloNRJuPjY1VgiA4CgAsDoCI2vO852xnqlarlw8NDdVDgLNKqbWLYFEptBsApsINZ5RSe5M8bG3lcvnSUql0iFJqrw432XxHxDPLy8uTrVbLXjsIY+wpSumrSc/LHYBzviY+qejSQDrZOefHAODBMCUntNbThaRQkvi0AyorCGPsXkrp+6H4c1rr7e5vc4tAEeJteo2MjDTT2q215wJQhHghxEOEkHcj8caYU1rrg/HI9Q3Qi3jbQpVS55LSyF4zEHGPOx+0PQ1Qqdfrf+cK0KP49hUBES8g4g8AYC9mfyHi1aud6yp3KnO8v2d1OvsmCbjnCPQjPmsB2yHf87yJWq3WPsRyAyhaPCJ+BgCnpJSnu8GuOwJ5iDfGfKK1PsAYG12dj28GgGsA4HdjjP1vNpvNn7oJ7+kcyFN8VoHd1mWOwCCKz3wODKr4TACDLL4rwKCL7wiwFcSnAmwV8Z0A1mZaO2B0uxLH59ioz3drgXl8/582KoSwb4jbA8Ogi0+MAOf8NgD4OAvAZnq+40nMOX8PAHZ1ghgE8ak1EL4tmHJfJrl1MCjiO7bRNIggCB5wh42NLNh1X6eTINwXUZstvutJbBfEIZwpqX0lzqMV9vOMTLdRC7GysnKQUvowIp4nhHyglDrWz8Z5/TYTQLRZtVq9YXZ2dj6vzfN4zroA8tgw72dseYB/AV9YJ16oCGq9AAAAAElFTkSuQmCC'
-
-_user = b'iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAAAXNSR0IArs4c6QAABdZJREFUaEPVmWeoJUUQRs+KIOYcUVFUzDmhKIqKOYs554yKIkZURFGMiFlRzKiYcwDFrKiYA4KYMGLE9MfAeVQ/envn3umZ+/bHFgy7e6erumq6+quvaicxjcukadx/pkYAiwL58xvwVTxfAj9M5EebiAAWAjYCtgV2rnDOAO4GHgWeAf6s0Bm4ZJQANgWOArYZwQGDuQe4Anivj50+AawDHAns2bChX/ZN4Jfscdmc2bMJsGGh6ykYxOXAF10C6RrABcAJxQamwr3xJXW8RpYCdgR2AVbLFL4DzgSurjHimi4BPAGYNkneBS4CbqrdrGHd9JGGpuIS2XsDOLzGbm0A3wLzZwbPAi4Efq/ZpGLN3MDRwBnZ2seBLdp0awL4FFg8DP0NHAHc2Ga45/tjgUsy3ativ94odB1wUGi/AazR07EuassAH2YKptLAOzHsBM4FTg5D7wMrdPFixLULAl9nNvYCbmuyOSiAHQJZ1PkJWLUrvI0YgOpbAw+FHdFprSYfBgXwNLBxKAt3902AQ31MCKnpYgvhJ5ZGmgLYJ4NGC5NY3UUWCwhcFlgd+Bd4GfggML6LLdHp1YBYi93aZcVuCkAFj0vZAHiuw477RTWdeYDOx8D2wEcdbObINEV9KAMQd62syvXAwR02Wr8I1qr8GTAdYOWdMbM1B/BrpW2LnR/Viu19lOn+kXTLAC6LguL7nbKL3LbXPIBfd65YWKbecsBdwPLx3jpyQJvR7H1OYXYNW2OvywA+AZYELFjmXy3VzTewSnv5mkT6nIhcF3DYEngkDN4M7Nt0AisC78SLpwre0/axEk8yLUyPQbIe8Hy8HBZok760xbv1I+CJT3ECos2d8ftJwPltXmfvE1eS4K00RG9e4PsBada23WPA5rFIXjZmJ08habKpoBiMeVwrtooLxwmuPETJjQ1WuRXYu3aD6BfkYcqawOtlAPkFlvPIfWrFC2o7+VfwJTG/SVzjWuU44NLaDYDjgwGrMg4w+QncD2wXBkWTnzsYzyvmMN70X2bT3sK7Vis5vRkPPg/ArspFynw9pgcWp6VD/1ng9IBWcdwjfyDz9A5gj1rPY52994Px92MAM2ayO5BDYdcKrK2SBg/zr6YPKfUPA+wPFIneGKzmhuTdV8YCF1/T8Qu5fPZoSPYfoHsqIE3vI2cDp4WiSCfiTRbAVsDDscDj8Zj6iqkoGlmBJXNvByg82ddgdIFyLWWciuQnMEohG8GvatVE8YVs+dCY5AF4/PlYRN4yCA5rdrVoLQKIPM56rKB9Ja/gLwASxykC8Ad5RiouXUq97aYDK2FYpy1qMxTeyiANRJgVkUQqZ6Y1cm3GjMcRqDwB/22ptmQr5u0qQ6zr9IFBzoatG+ag5M5+w4I2aCgmDMuxZgJMH3uVVM0bB1v5AKspjWSpNhk+sxTeWYlfjCJoIfQxTS2M6SnHipqwhhhEE/Idmk0lzssGDY0p5I8Jb8/JYCv5KRfRcRuUJDbc0gNPLp3esK8+a6SbKSe18K4k8UQMJBWs/Pd1o0N8JTfeVFAWiJFhObx18OpQN4k9g7/5fF6TyA1r/BByHL9yLpPlOWAa3QLsXtqorYg5T9LG7UG3U//Q0/9xNXmRJ54PzkoQMVgbrsmkJoC8i1K5cbwxagRxR27ICKUmW5GwLYCcZWrQPnZqzUXTN3BobFolGdpctQUwW4z40phEaLWcvzUBX7zJhBREQDDnFTtE78fACUZbAGmT14ISp393bUba4hWJTgmES2sdLB/SplgbgHZS15VsvhQIJLcfRfzCpkwOzRcXaTTQfpcANJKP25NRsd/g5Oe1/4Uq3bAO7FZMP6zG1gEvb5V0DUCjbmwxk36XIr+RNaYq3FSJ1bNDK8UqrPNdxo6d/o+s3FDSZ2Fz4NpX/omT03HhurP0OYFyE5uWzbKnzQnnm/Itmxv//KZNYdj7iQigtC+VTpTav6d+QCrtkwZbo/g9rjs1ApgQx2qNTPMB/A9KwyVA5cM02QAAAABJRU5ErkJggg=='
-
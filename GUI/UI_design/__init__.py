@@ -1,3 +1,5 @@
-from . import ImgPng_day, ImgPng_night
+import os
 
-__all__ = ['ImgPng_day', 'ImgPng_night']
+IMAGES_BLOB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'images.bin')
+
+__all__ = ['IMAGES_BLOB_PATH']
@@ -0,0 +1,16 @@
+"""
+    把 ImgPngDay 和 ImgPngNight 中的图片打包为 images.bin，修改图片后需要重新运行
+"""
+import os
+import sys
+
+if __name__ == '__main__':
+    _dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, os.path.dirname(os.path.dirname(_dir)))
+    from utils.image_resources import pack_images
+
+    pack_images(os.path.join(_dir, 'images.bin'), {
+        'Day': os.path.join(_dir, 'ImgPngDay'),
+        'Night': os.path.join(_dir, 'ImgPngNight'),
+    })
+    print('Done!')
@@ -3,9 +3,20 @@
 1.UI图标文件和主题颜色配置文件
 2.基础控件，全部继承自Qt的控件，命名通常去掉前缀Q，还有一些更高级的基础控件，如拾色器，自定义对话框等
 3.用于应用程序的高级控件，例如主窗口，特定功能的对话框等
+main_widgets 依赖OpenGL和工程读取模块，导入较慢，因此在第一次访问其中的名称时才导入（星号导入不包含这些名称），
+开始界面只需要基础控件，不会触发这些导入
 """
-
+import importlib
 
 from .general_widgets import *
 from .basic_windows import *
-from .main_widgets import *
+
+
+def __getattr__(name):
+    if name.startswith('__'):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    main_widgets = importlib.import_module('.main_widgets', __name__)
+    try:
+        return getattr(main_widgets, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
@@ -25,7 +25,7 @@ class MessageBox(QDialog):
     def __init__(self, message, msg_type):
         super().__init__()
         self.setWindowTitle("错误")
-        self.setWindowIcon(QIcon(QPixmap(ICO_IMAGE)))
+        self.setWindowIcon(QIcon(IMAGES.pixmap("ICO")))
         self.setWindowFlags(Qt.WindowCloseButtonHint)
         self.setFixedSize(300, 150)
         self.message = message
@@ -11,6 +11,7 @@ from main_logger import Log
 
 from .general_widgets import *
 from operation import *
+from operation.section_op import SectionGroupSnapshotOperation
 
 
 class EditTabWidget(QWidget):
@@ -180,9 +181,10 @@ class EditHullSectionGroupWidget(EditTabWidget):
         一次只显示一个船体截面组的编辑控件
         """
         _font = YAHEI[9]
-        self.sizeX_show = ColoredTextLabel(None, "0", _font, bg=BG_COLOR0, bd=0, padding=3)
-        self.sizeY_show = ColoredTextLabel(None, "0", _font, bg=BG_COLOR0, bd=0, padding=3)
-        self.sizeZ_show = ColoredTextLabel(None, "0", _font, bg=BG_COLOR0, bd=0, padding=3)
+        # 修改船体大小时整体缩放所有截面的节点（一次批量编辑，一个撤回步骤）
+        self.sizeX_edit = NumberEdit(None, self, (68, 24), float, (0.0001, 100000), const.DECIMAL_PRECISION, 1, 0.1, _font)
+        self.sizeY_edit = NumberEdit(None, self, (68, 24), float, (0.0001, 100000), const.DECIMAL_PRECISION, 1, 0.1, _font)
+        self.sizeZ_edit = NumberEdit(None, self, (68, 24), float, (0.0001, 100000), const.DECIMAL_PRECISION, 1, 0.1, _font)
         self.section_num_show = ColoredTextLabel(None, "0", _font, bg=BG_COLOR0, bd=0, padding=3)
 
         # TODO: 需要添加到结构层级控件中，由PrjHullSectionGroup进行管理以及信号传递
@@ -201,9 +203,6 @@ class EditHullSectionGroupWidget(EditTabWidget):
     def _init_ui(self):
         super()._init_ui()
         self.hullSections_layout.setAlignment(Qt.AlignTop)
-        self.sizeX_show.setFixedHeight(24)
-        self.sizeY_show.setFixedHeight(24)
-        self.sizeZ_show.setFixedHeight(24)
         self.section_num_show.setFixedHeight(24)
         self.front_addSection_bt.setFixedHeight(26)
         self.back_addSection_bt.setFixedHeight(26)
@@ -215,9 +214,9 @@ class EditHullSectionGroupWidget(EditTabWidget):
         _font = QFont(YAHEI[9])
         self.basic_info_layout.addWidget(ColoredTextLabel(None, "船体大小", _font, bg='transparent'), 2, 0,
                                          alignment=Qt.AlignLeft | Qt.AlignVCenter)
-        self.basic_info_layout.addWidget(self.sizeX_show, 2, 1)
-        self.basic_info_layout.addWidget(self.sizeY_show, 2, 2)
-        self.basic_info_layout.addWidget(self.sizeZ_show, 2, 3)
+        self.basic_info_layout.addWidget(self.sizeX_edit, 2, 1)
+        self.basic_info_layout.addWidget(self.sizeY_edit, 2, 2)
+        self.basic_info_layout.addWidget(self.sizeZ_edit, 2, 3)
         self.basic_info_layout.addWidget(ColoredTextLabel(None, "截面数量", _font, bg='transparent'), 3, 0,
                                          alignment=Qt.AlignLeft | Qt.AlignVCenter)
         self.basic_info_layout.addWidget(self.section_num_show, 3, 1)
@@ -228,12 +227,32 @@ class EditHullSectionGroupWidget(EditTabWidget):
         self.sub_elements_widget.layout().addWidget(self.hullSections_scroll)
         self.sub_elements_widget.layout().addWidget(self.back_addSection_bt)
         # 设置图标
-        self.front_addSection_bt.setIcon(QIcon(QPixmap(ADD_IMAGE)))
-        self.back_addSection_bt.setIcon(QIcon(QPixmap(ADD_IMAGE)))
+        self.front_addSection_bt.setIcon(QIcon(IMAGES.pixmap("ADD")))
+        self.back_addSection_bt.setIcon(QIcon(IMAGES.pixmap("ADD")))
         # 设置按钮行为
         self.front_addSection_bt.clicked.connect(self.add_front_section)
         self.back_addSection_bt.clicked.connect(self.add_back_section)
 
+    def _bind_signals(self):
+        super()._bind_signals()
+        self.sizeX_edit.value_changed.connect(lambda x: self.setSize(0, x))
+        self.sizeY_edit.value_changed.connect(lambda y: self.setSize(1, y))
+        self.sizeZ_edit.value_changed.connect(lambda z: self.setSize(2, z))
+
+    def setSize(self, axis: int, size: float):
+        """
+        把船体在axis方向上的大小缩放到size：所有截面的节点（或z值）乘以同一个比例
+        :param axis: 0: x, 1: y, 2: z
+        :param size: 目标大小
+        """
+        origin_size = self._current_item.getSize()[axis] if self._current_item else 0
+        if size <= 0 or origin_size <= 0 or abs(size - origin_size) < 1e-9:
+            return
+        target = self._current_item.get_array()
+        target[..., axis] *= size / origin_size
+        op = SectionGroupSnapshotOperation(self._current_item, target, f"缩放 {self._current_item.name}")
+        self.operationStack.execute(op)
+
     def add_front_section(self):
         """
         检测当前被选择的section，在该section的前面添加一个section
@@ -279,6 +298,8 @@ class EditHullSectionGroupWidget(EditTabWidget):
             # 前后截面z值修改信号
             item.update_front_z_s.connect(self.updateFrontZ)
             item.update_back_z_s.connect(self.updateBackZ)
+            # 批量编辑（以及撤回、重做）后刷新船体大小
+            item.update_size_s.connect(self.updateSize)
         super().updateSectionHandler(item)
         for section in item.get_sections():
             section.showButton().show()
@@ -290,17 +311,16 @@ class EditHullSectionGroupWidget(EditTabWidget):
         self.updateSections()
 
     def updateSize(self):
-        _frontSection = self._current_item._frontSection
-        _backSection = self._current_item._backSection
-        self.sizeX_show.setText(str(round(2 * self._current_item.getMaxX(), const.DECIMAL_PRECISION)))
-        self.sizeY_show.setText(str(round(_frontSection.nodes[-1].y - _frontSection.nodes[0].y, const.DECIMAL_PRECISION)))
-        self.sizeZ_show.setText(str(round(_frontSection.z - _backSection.z, const.DECIMAL_PRECISION)))
+        size_x, size_y, size_z = self._current_item.getSize()
+        self.sizeX_edit.setValue(size_x)
+        self.sizeY_edit.setValue(size_y)
+        self.sizeZ_edit.setValue(size_z)
 
     def updateFrontZ(self):
-        self.sizeZ_show.setText(str(round(self._current_item._frontSection.z - self._current_item._backSection.z, const.DECIMAL_PRECISION)))
+        self.sizeZ_edit.setValue(self._current_item._frontSection.z - self._current_item._backSection.z)
 
     def updateBackZ(self):
-        self.sizeZ_show.setText(str(round(self._current_item._frontSection.z - self._current_item._backSection.z, const.DECIMAL_PRECISION)))
+        self.sizeZ_edit.setValue(self._current_item._frontSection.z - self._current_item._backSection.z)
 
     def updateNum(self):
         self.section_num_show.setText(str(len(self._current_item.get_sections())))
@@ -389,7 +409,7 @@ class EditModelWidget(EditTabWidget):
         self.basic_info_layout.addWidget(self.pathButton, 2, 1, 1, 3)
         self.pathButton.setFixedHeight(24)
         self.pathButton.setSizePolicy(QSizePolicy(QSizePolicy.MinimumExpanding, QSizePolicy.Preferred))
-        self.pathButton.setIcon(QIcon(QPixmap(FOLDER_IMAGE)))
+        self.pathButton.setIcon(QIcon(IMAGES.pixmap("FOLDER")))
         self.pathButton.clicked.connect(self.selectModelPath)
 
     def selectModelPath(self):
@@ -457,7 +477,7 @@ class EditRefImageWidget(EditTabWidget):
         self.basic_info_layout.addWidget(self.pathButton, 3, 1, 1, 3)
         self.pathButton.setFixedHeight(24)
         self.pathButton.setSizePolicy(QSizePolicy(QSizePolicy.MinimumExpanding, QSizePolicy.Preferred))
-        self.pathButton.setIcon(QIcon(QPixmap(FOLDER_IMAGE)))
+        self.pathButton.setIcon(QIcon(IMAGES.pixmap("FOLDER")))
         self.pathButton.clicked.connect(self.selectRefImagePath)
 
     def selectRefImagePath(self):
@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
 """
 GUI基础参数，包括字体加载器，颜色配置，图片处理等
-由于颜色和图标被动态加载，一些变量名例如 BG_COLOR0，BYTES_USER，USER_IMAGE 等是动态生成的，其他模块会在静态检查时报错，但是运行时不会有问题
+由于颜色和图标被动态加载，一些变量名例如 BG_COLOR0，BYTES_USER 等是动态生成的，其他模块会在静态检查时报错，但是运行时不会有问题
+图标只加载当前主题的PNG原始数据，QImage/QPixmap 通过 IMAGES.image("USER")、IMAGES.pixmap("USER") 在第一次使用时解码
 """
 import ctypes
-from base64 import b64decode
 import importlib
 from typing import List, Optional
 
@@ -14,8 +14,8 @@ from PyQt5.QtGui import *
 # 静态导入需要的模块
 import general_widgets.theme_config_color._day_color as _day_color
 import general_widgets.theme_config_color._night_color as _night_color
-import GUI.UI_design.ImgPng_day as _ImgPng_day
-import GUI.UI_design.ImgPng_night as _ImgPng_night
+from GUI.UI_design import IMAGES_BLOB_PATH
+from utils.image_resources import ImageRegistry
 
 
 class LazyFontLoader:
@@ -51,26 +51,19 @@ def load_module(module_path):
     return importlib.import_module(module_path)
 
 
-def process_images(img_module):
-    """处理图片，生成 BYTES_... 和 ..._IMAGE 变量，直接加载到全局命名空间"""
-    for attr_name in dir(img_module):
-        # print(attr_name)
-        # 筛选以 "_" 开头的变量
-        if not attr_name.startswith('__') and attr_name.startswith('_'):
-            # 获取变量的 base64 编码数据
-            base64_data = getattr(img_module, attr_name)
-            # 生成对应的 BYTES_... 变量名称
-            bytes_var_name = f'BYTES{attr_name.upper()}'
-            # 对 base64 数据解码为 bytes
-            byte_data = b64decode(base64_data)
-            # 将 BYTES_... 变量添加到全局命名空间
-            globals()[bytes_var_name] = byte_data
-            # 生成对应的 ..._IMAGE 变量名称
-            image_var_name = f'{attr_name[1:].upper()}_IMAGE'
-            # 将 bytes 转换为 QImage
-            qimage = QImage.fromData(QByteArray(byte_data))  # noqa
-            # 将 ..._IMAGE 变量添加到全局命名空间
-            globals()[image_var_name] = qimage
+def process_images(theme):
+    """加载主题的图标，生成 IMAGES 和 BYTES_... 变量，直接加载到全局命名空间"""
+    registry = ImageRegistry(IMAGES_BLOB_PATH, theme)
+    globals()['IMAGES'] = registry
+    for name in registry.names():
+        globals()[f'BYTES_{name}'] = registry.bytes(name)
+
+
+def __getattr__(name):
+    """兼容以模块属性方式访问的 ..._IMAGE 变量（星号导入不会包含这些名称）"""
+    if name.endswith('_IMAGE') and 'IMAGES' in globals() and name[:-6] in IMAGES:
+        return IMAGES.image(name[:-6])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def load_colors(color_module, _theme_details=None):
@@ -112,23 +105,23 @@ def get_theme_images(theme, _theme_details=None):
         },
         "GLTheme": "#303030"
     }  # 当 theme == 'Custom' 时提供详细的配置信息
-    img_module = None
+    img_theme = None
     color_module = None
     if theme in ['Light', 'Day']:
-        img_module = _ImgPng_day
+        img_theme = 'Day'
         color_module = _day_color
         load_colors(color_module, _theme_details)
     elif theme in ['Dark', 'Night']:
-        img_module = _ImgPng_night
+        img_theme = 'Night'
         color_module = _night_color
         load_colors(color_module, _theme_details)
     elif theme == 'Custom':
-        img_module = _ImgPng_night
+        img_theme = 'Night'
         color_module = _night_color
         load_colors(color_module, custom_theme_details)
     globals()['ThemeColor'] = color_module.ThemeColor
-    # 动态处理所有图标，直接加载到全局命名空间
-    process_images(img_module)
+    # 只加载当前主题的图标，直接加载到全局命名空间
+    process_images(img_theme)
 
 
 # 实例化不同类型的字体加载器
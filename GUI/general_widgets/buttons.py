@@ -204,7 +204,7 @@ class Button(QPushButton):
         else:
             indicator_styleSheet = f"""
                 QPushButton::menu-indicator{{
-                    image: url({QPixmap(INDICATOR_IMAGE).toImage()});
+                    image: url({IMAGES.image("INDICATOR")});
                 }}
             """
         self.setStyleSheet(f"""
@@ -391,7 +391,7 @@ class MaximizeButton(Button):
                          bd_radius, 0,
                          (BG_COLOR1, GRAY, BG_COLOR1, BG_COLOR1), FG_COLOR0, YAHEI[6], Qt.AlignCenter,
                          size)
-        self.setIcon(QIcon(QPixmap(MAXIMIZE_IMAGE)))
+        self.setIcon(QIcon(IMAGES.pixmap("MAXIMIZE")))
         self.setFlat(True)
         self.setCursor(Qt.PointingHandCursor)
         self.setFocusPolicy(Qt.NoFocus)
@@ -401,9 +401,9 @@ class MaximizeButton(Button):
 
     def clicked_action(self):
         if self.parent().isMaximized():
-            self.setIcon(QIcon(QPixmap(MAXIMIZE_IMAGE)))
+            self.setIcon(QIcon(IMAGES.pixmap("MAXIMIZE")))
         else:
-            self.setIcon(QIcon(QPixmap(NORMAL_IMAGE)))
+            self.setIcon(QIcon(IMAGES.pixmap("NORMAL")))
 
 
 class MinimizeButton(Button):
@@ -415,7 +415,7 @@ class MinimizeButton(Button):
                          bd_radius, 0,
                          (BG_COLOR1, GRAY, BG_COLOR1, BG_COLOR1), FG_COLOR0, YAHEI[10], Qt.AlignCenter,
                          size)
-        self.setIcon(QIcon(QPixmap(MINIMIZE_IMAGE)))
+        self.setIcon(QIcon(IMAGES.pixmap("MINIMIZE")))
         self.setFlat(True)
         self.setCursor(Qt.PointingHandCursor)
         self.setFocusPolicy(Qt.NoFocus)
@@ -434,7 +434,7 @@ class CloseButton(Button):
         super().__init__(parent, None, 0, BG_COLOR0,
                          bd_radius, 0,
                          (BG_COLOR1, LIGHTER_RED, BG_COLOR1, BG_COLOR1), FG_COLOR0, YAHEI[10], Qt.AlignCenter, size)
-        self.setIcon(QIcon(QPixmap(CLOSE_IMAGE)))
+        self.setIcon(QIcon(IMAGES.pixmap("CLOSE")))
         self.setFlat(True)
         self.setCursor(Qt.PointingHandCursor)
         self.setFocusPolicy(Qt.NoFocus)
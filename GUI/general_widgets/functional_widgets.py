@@ -191,7 +191,7 @@ class BasicDialog(QDialog):
         :param hide_bottom: 是否隐藏底部栏
         :param ensure_bt_fill: 确定按钮是否填充整个底部
         """
-        self.close_bg = QIcon(QPixmap.fromImage(CLOSE_IMAGE))
+        self.close_bg = QIcon(IMAGES.pixmap("CLOSE"))
         super().__init__(parent=parent)
         # self._emerge_animation()
         # self.hide()
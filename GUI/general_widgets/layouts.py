@@ -1081,10 +1081,10 @@ class Window(QWidget):
 
     def showMaximized(self):
         if self.resizable and not self.isMaximized():
-            self.maximize_button.setIcon(QIcon(QPixmap.fromImage(NORMAL_IMAGE)))  # noqa
+            self.maximize_button.setIcon(QIcon(IMAGES.pixmap("NORMAL")))  # noqa
             super().showMaximized()
         else:
-            self.maximize_button.setIcon(QIcon(QPixmap.fromImage(MAXIMIZE_IMAGE)))  # noqa
+            self.maximize_button.setIcon(QIcon(IMAGES.pixmap("MAXIMIZE")))  # noqa
             super().showNormal()
 
     def animate(self, start=0, end=1, duration=200):
@@ -516,3 +516,11 @@ class RatioDisplayWidget(QWidget):
         self.current_value = current_value
         self.progress_bar.setValue(current_value)
         self.progress_bar.setFormat(f"{current_value}/{self.max_value}{self.unit}")
+
+    def set_detail(self, detail: str):
+        """
+        设置鼠标悬停时显示的详细信息
+        :param detail: 详细信息
+        """
+        self.setToolTip(detail)
+        self.progress_bar.setToolTip(detail)
@@ -36,7 +36,7 @@ class HierarchyContainer(QObject):
         self.add_button.setFixedHeight(26)
         self.add_button.setSizePolicy(QSizePolicy(QSizePolicy.MinimumExpanding, QSizePolicy.Fixed))
         self.add_button.setCursor(Qt.PointingHandCursor)
-        self.add_button.setIcon(QIcon(QPixmap(ADD_IMAGE)))
+        self.add_button.setIcon(QIcon(IMAGES.pixmap("ADD")))
         self.widget.setLayout(QVBoxLayout())
         self.widget.layout().setAlignment(Qt.AlignTop)
         self.widget.layout().addWidget(TextLabel(None, self.title, align=Qt.AlignLeft | Qt.AlignTop))
@@ -27,7 +27,7 @@ class UserInfoTab(MutiDirectionTab):
     TAG = "UserInfoTab"
 
     def __init__(self, parent):
-        super().__init__(parent, CONST.DOWN, "用户", "", USER_IMAGE)
+        super().__init__(parent, CONST.DOWN, "用户", "", IMAGES.image("USER"))
         self.set_layout(QVBoxLayout())
         self.__init_main_widget()
 
@@ -43,7 +43,7 @@ class PrjInfoTab(MutiDirectionTab):
     TAG = "PrjInfoTab"
 
     def __init__(self, parent):
-        super().__init__(parent, CONST.RIGHT, "船体信息", f"{DESIGNER_PRJ_STR}的总体信息", ELEMENTS_IMAGE)
+        super().__init__(parent, CONST.RIGHT, "船体信息", f"{DESIGNER_PRJ_STR}的总体信息", IMAGES.image("ELEMENTS"))
         self.set_layout(QVBoxLayout())
         # 控件
         self.shipInfo_widget = QWidget()
@@ -93,7 +93,7 @@ class HierarchyTab(MutiDirectionTab):
 
     def __init__(self, parent, main_editor):
         self.main_editor = main_editor
-        super().__init__(parent, CONST.LEFT, HIERARCHY_STR, f"{DESIGNER_PRJ_STR}所有的部件都在这里", STRUCTURE_IMAGE)
+        super().__init__(parent, CONST.LEFT, HIERARCHY_STR, f"{DESIGNER_PRJ_STR}所有的部件都在这里", IMAGES.image("STRUCTURE"))
         self.set_layout(QVBoxLayout())
         # 控件
         self.tab_widget = TabWidget(None, QTabWidget.West)
@@ -198,7 +198,7 @@ class EditTab(MutiDirectionTab):
         元素编辑窗口
         :param parent:
         """
-        super().__init__(parent, CONST.RIGHT, "部件编辑", "编辑单个部件", EDIT_IMAGE)
+        super().__init__(parent, CONST.RIGHT, "部件编辑", "编辑单个部件", IMAGES.image("EDIT"))
         self.element_mutex = QMutex()  # 互斥锁，用于保证只有一个元素被编辑
         self.element_locker = QMutexLocker(self.element_mutex)
         self.set_layout(QVBoxLayout())
@@ -341,7 +341,7 @@ class SettingTab(MutiDirectionTab):
         self.__configHandler = configHandler_
         self.__camera_sensitivity = configHandler_.get_config("Sensitivity")
         self.__camera: Camera = camera
-        super().__init__(parent, CONST.RIGHT, "设置", f"让{APP_SHORT_NAME_STR}更符合你的使用习惯", SETTINGS_IMAGE)
+        super().__init__(parent, CONST.RIGHT, "设置", f"让{APP_SHORT_NAME_STR}更符合你的使用习惯", IMAGES.image("SETTINGS"))
         self.set_layout(QVBoxLayout())
         # 初始化标签页，分别为：主题、相机灵敏度 =================================================================
         self.tab_widget = TabWidget(None)
@@ -411,7 +411,7 @@ class ToolsTab(MutiDirectionTab):
         元素编辑窗口
         :param parent:
         """
-        super().__init__(parent, CONST.DOWN, f"{NA_DESIGN_STR}工具箱", f"对{NA_DESIGN_STR}进行快捷操作（不是{DESIGNER_PRJ_STR}！）", TOOLS_IMAGE)
+        super().__init__(parent, CONST.DOWN, f"{NA_DESIGN_STR}工具箱", f"对{NA_DESIGN_STR}进行快捷操作（不是{DESIGNER_PRJ_STR}！）", IMAGES.image("TOOLS"))
         self.set_layout(QHBoxLayout())
         self.button_widget = QFrame()
         self.button_widget.setLayout(QHBoxLayout())
@@ -487,6 +487,7 @@ class GLWidgetGUI(GLViewWidget):
         # 切换视图模式的按钮
         self.camera_mode_button = Button(self, "切换视图模式", bd_radius=6, size=None, font=YAHEI[9])
         self.__init_ui()
+        self.setFrameStatsOverlay(configHandler.get_config("FrameStatsOverlay"))
 
         # 主光照
         self.light = PointLight(
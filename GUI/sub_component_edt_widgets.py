@@ -102,7 +102,7 @@ class SubSectionShow(SubElementShow):
         self.posZ_edit = NumberEdit(None, self, (68, 24), float, rounding=const.DECIMAL_PRECISION, step=0.1, font=_font)
         self.editNodes_btn = Button(None, None, 0, BG_COLOR1, 6,
                                     bg=("transparent", "transparent", "transparent", "transparent"), size=24)
-        self.editNodes_btn.setIcon(QIcon(QPixmap(EDIT_IMAGE)))
+        self.editNodes_btn.setIcon(QIcon(IMAGES.pixmap("EDIT")))
         self.editNodes_btn.setFocusPolicy(Qt.NoFocus)
         self.editNodes_btn.setFlat(True)
         self._setup_ui()
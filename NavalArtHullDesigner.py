@@ -4,23 +4,20 @@ NavalArt船体编辑器 主程序
 作者: JasonLee-p
 """
 # 系统库
+import os
 import sys
 import traceback
 import webbrowser
 
-# 第三方库和本地库
+# 第三方库和本地库（开始界面只需要Qt和基础控件，OpenGL、工程读取等模块在后台线程中预加载）
 try:
-    from OpenGL.GL import *
-    from OpenGL.GLU import *
-    from OpenGL.GLUT import *
-    # 本地库
     from GUI import *
     from main_logger import Log, StatusBarHandler
     from utils.funcs_utils import singleton
+    from utils.import_profile import ModuleWarmUp
+    from utils.perf_trace import PerfTracer
     from path_lib import *
-    from main_editor import MainEditor
     from startWindow import StartWindow
-    from ShipRead import *
 except Exception as e:
     traceback.print_exc()
     print(f"[ERROR] {e}")
@@ -28,6 +25,12 @@ except Exception as e:
     sys.exit(1)
 
 VERSION = "1.0.0.0"
+# 在用户选择工程时预加载的模块，打开编辑窗口前会等待加载完成
+WARM_UP_MODULES = [
+    "OpenGL.GL", "OpenGL.GLU", "OpenGL.GLUT",
+    "pyqtOpenGL", "ShipRead", "GUI.main_widgets", "main_editor",
+]
+warmUp = ModuleWarmUp(WARM_UP_MODULES)
 
 
 @singleton
@@ -43,6 +46,20 @@ class MainEditorHandler(list):
         self.configHandler = configHandler
         self.logger = logger_
         self.statusBarHandler = StatusBarHandler()
+        if self.configHandler.get_config("PerfTrace"):
+            PerfTracer.enable()
+            Log().info(self.TAG, "性能追踪已开启")
+
+    def _create_editor(self):
+        """
+        等待后台预加载完成，然后创建主编辑窗口
+        """
+        warmUp.wait()
+        Log().info(self.TAG, "模块预加载耗时：" + "，".join(
+            f"{name} {duration * 1000:.0f}ms" for name, duration in warmUp.durations.items()))
+        from GUI.main_widgets import GLWidgetGUI
+        from main_editor import MainEditor
+        return MainEditor(GLWidgetGUI(), self.logger)
 
     def new(self, mode: Literal["lastEdit", "newPrj", "openPrj", "setting", "help"] = "lastEdit"):
         """
@@ -51,7 +68,7 @@ class MainEditorHandler(list):
         global startWindow
         if len(self) < 3:
             # 新建主编辑窗口
-            self.append(MainEditor(GLWidgetGUI(), self.logger))
+            self.append(self._create_editor())
             # 绑定mainWindow的close信号到该类的close函数
             self[-1].closed.connect(lambda: self.close(self[-1]))
             if mode == "lastEdit":
@@ -79,7 +96,7 @@ class MainEditorHandler(list):
         global startWindow
         if len(self) < 3:
             # 新建主编辑窗口
-            self.append(MainEditor(GLWidgetGUI(), self.logger))
+            self.append(self._create_editor())
             # 绑定mainWindow的close信号到该类的close函数
             self[-1].closed.connect(lambda: self.close(self[-1]))
             self[-1].open_prj(path)
@@ -91,7 +108,7 @@ class MainEditorHandler(list):
             QMessageBox().warning(None, "警告", "编辑窗口数量已达上限（3）", QMessageBox.Ok)
             return None
 
-    def close(self, main_editor: MainEditor):
+    def close(self, main_editor: 'MainEditor'):
         """
         关闭主编辑窗口
         """
@@ -103,6 +120,11 @@ class MainEditorHandler(list):
         del main_editor
         # 保存配置
         self.configHandler.save_config()
+        # 导出性能追踪
+        if PerfTracer.enabled:
+            trace_path = os.path.join(CURRENT_PATH, "perf_trace.json")
+            PerfTracer.export_chrome_trace(trace_path)
+            Log().info(self.TAG, f"性能追踪已导出：{trace_path}")
         # 如果没有窗口了，关闭程序
         Log().save()
 
@@ -157,6 +179,16 @@ def _help():
         return
 
 
+def openRecent(path: str):
+    """
+    打开最近工程列表中的工程，由开始界面调用
+    """
+    Log().info(Log().GLOBAL_TAG, f"单击：最近工程 {path}")
+    _mainEditor = mainEditors.open(path)
+    if not _mainEditor:
+        return
+
+
 def about():
     """
     打开关于页面，由开始界面调用
@@ -175,6 +207,7 @@ def linkSignal(startwindow: StartWindow):
     startwindow.setting_signal.connect(setting)
     startwindow.help_signal.connect(_help)
     startwindow.about_signal.connect(about)
+    startwindow.openRecent_signal.connect(openRecent)
 
 
 if __name__ == '__main__':
@@ -194,7 +227,7 @@ Current env:  {CURRENT_PATH}""")
         opened_file_path = sys.argv[1] if len(sys.argv) > 1 else None
         # 设置QApp
         QApp = QApplication(sys.argv)
-        QApp.setWindowIcon(QIcon(QPixmap(ICO_IMAGE)))
+        QApp.setWindowIcon(QIcon(IMAGES.pixmap("ICO")))
         QApp.setApplicationName("NavalArt HullEditor")
         QApp.setApplicationVersion(VERSION)
         QApp.setOrganizationName("JasonLee")
@@ -213,6 +246,8 @@ Current env:  {CURRENT_PATH}""")
             mainEditor = mainEditors.open(opened_file_path)
         else:
             startWindow.show()
+            # 用户选择工程时，在后台导入OpenGL、工程读取等模块
+            warmUp.start()
 
         # 结束程序
         sys.exit(QApp.exec_())
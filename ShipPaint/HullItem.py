@@ -1,7 +1,7 @@
 """
 定义了船体的绘制类
 """
-from typing import Union, Literal
+from typing import Dict, Tuple, Union, Literal
 
 import numpy as np
 # from main_logger import Log
@@ -9,6 +9,10 @@ import OpenGL.GL as gl
 from main_logger import Log
 from pyqtOpenGL import Matrix4x4, GLGraphicsItem, GLMeshItem, Quaternion
 from pyqtOpenGL.items.MeshData import SymetryCylinderMesh, EditItemMaterial
+from utils.hull_mesh import (HULL_LOD_LEVELS, curve_points, curve_template, group_indexed, group_outlines,
+                             node_outline_patch, segment_point_vertexes, vertex_ranges)
+from utils.lod import LODSelector, bounding_sphere, projected_size
+from utils.perf_trace import trace_it
 
 # 从正下方开始，逆时针排列（向z-方向看）
 SQUARE_POINTS = np.array([
@@ -139,8 +143,13 @@ def _get_index(half_index):
 class HullVerSecItem(GLMeshItem):
 
     # noinspection PyProtectedMember
-    def __init__(self, handler, z, nodes: Union[list, tuple]):
+    def __init__(self, handler, z, nodes: Union[list, tuple], outlines=None, mesh=None):
         """
+        :param handler: 船体截面
+        :param z: 截面的z值
+        :param nodes: 截面的节点
+        :param outlines: {截面: 轮廓}，截面组批量计算的轮廓，为None时自己计算
+        :param mesh: (顶点, 法向量)，截面组批量生成的网格（HullSectionGroup.build_meshes），为None时自己计算
         """
         self.sectionGroup = None  # 船体截面组，将会在HullSectionGroupItem中设置
         self.handler = handler  # 船体截面的处理器
@@ -148,47 +157,84 @@ class HullVerSecItem(GLMeshItem):
         self._nodes = nodes
         self._nodes.sort(key=lambda x: x.y)
         self.mesh_data = SymetryCylinderMesh("z")
-        if self._z > 0:
-            # 从前后两个截面的点集中获取点
-            front_nodes_data = np.concatenate((
-                self.getCurPoints('bot', self._nodes[0], self._nodes[1]),
-                self.handler.nodes_data[1: -1],
-                self.getCurPoints('up', self._nodes[-2], self._nodes[-1])
-            ))
-            back_section = self.handler._backSection
-            back_nodes_data = np.concatenate((
-                self.getCurPoints('bot', back_section.nodes[0], back_section.nodes[1]),
-                self.handler._backSection.nodes_data[1: -1],
-                self.getCurPoints('up', back_section.nodes[-2], back_section.nodes[-1])
-            ))
-            self.mesh_data.initPoints(front_nodes_data, back_nodes_data, self._z, back_section.z)
-        elif self._z < 0:
-            front_section = self.handler._frontSection
-            front_nodes_data = np.concatenate((
-                self.getCurPoints('bot', front_section.nodes[0], front_section.nodes[1]),
-                self.handler._frontSection.nodes_data[1: -1],
-                self.getCurPoints('up', front_section.nodes[-2], front_section.nodes[-1])
-            ))
-            back_nodes_data = np.concatenate((
-                self.getCurPoints('bot', self._nodes[0], self._nodes[1]),
-                self.handler.nodes_data[1: -1],
-                self.getCurPoints('up', self._nodes[-2], self._nodes[-1])
-            ))
-            self.mesh_data.initPoints(front_nodes_data, back_nodes_data, front_section.z, self._z)
-        self.mesh_data.initVertexes()
+        self._init_mesh(outlines, mesh)
+        # 编辑中的截面网格保持不使用索引的排列（恒等索引）：拖动节点时按固定的节点到顶点映射增量改写顶点，
+        # 共享顶点的排列会随硬边的分开与合并而改变，因此索引网格（SymetryCylinderMesh.indexedVertexes）只用于合并的LOD网格
         super().__init__(vertexes=self.mesh_data.vertexes,
                          normals=self.mesh_data.normals,
-                         indices=np.array([i for i in range(len(self.mesh_data.vertexes))], dtype=np.uint32),
+                         indices=np.arange(len(self.mesh_data.vertexes), dtype=np.uint32),
                          material=EditItemMaterial(),
                          # drawLine=True,
                          glOptions='translucent',
-                         glUsage=gl.GL_DYNAMIC_DRAW)
+                         glUsage=gl.GL_STREAM_DRAW)  # 拖动时每帧都会改写顶点
         # 用于判断整个截面组是否被选中
         self.parentSelected = True
 
+    # noinspection PyProtectedMember
+    def segmentSections(self):
+        """
+        网格连接的两个截面：z>0时为自身和后一个截面，z<0时为前一个截面和自身
+        :return: (前截面, 后截面)，z为0时为None
+        """
+        if self._z > 0:
+            return self.handler, self.handler._backSection
+        elif self._z < 0:
+            return self.handler._frontSection, self.handler
+        return None
+
+    def _init_mesh_points(self, outlines=None):
+        """
+        从自身和相邻截面（z>0取后一个截面，z<0取前一个截面）的轮廓初始化网格的点集
+        :param outlines: {截面: 轮廓}，由截面组一次算出所有截面的轮廓（HullSectionGroup.get_outlines），
+                         为None时只计算这两个截面
+        """
+        sections = self.segmentSections()
+        if sections is None:
+            return
+        front_section, back_section = sections
+        if outlines is None:
+            outlines = dict(zip(sections, group_outlines(
+                [front_section.nodes_data, back_section.nodes_data], self.getTopCur(), self.getBotCur())))
+        self.mesh_data.initPoints(outlines[front_section], outlines[back_section], front_section.z, back_section.z)
+
+    def _init_mesh(self, outlines=None, mesh=None):
+        """
+        计算网格的顶点和法向量，有批量生成的网格时直接使用
+        """
+        if mesh is None or outlines is None:
+            self._init_mesh_points(outlines)
+            self.mesh_data.initVertexes()
+            return
+        front_section, back_section = self.segmentSections()
+        self.mesh_data.setVertexes(outlines[front_section], outlines[back_section], front_section.z, back_section.z,
+                                   *mesh)
+
+    @trace_it(cat="mesh")
+    def rebuild_mesh(self, outlines=None, mesh=None):
+        """
+        节点数据整体改变后（例如批量编辑、撤回或修改曲率），重新计算网格，顶点和法向量一次上传到显存
+        :param outlines: 同 __init__
+        :param mesh: 同 __init__
+        """
+        self._z = self.handler.z
+        self._init_mesh(outlines, mesh)
+        self.updateVertexes(self.mesh_data.vertexes, self.mesh_data.normals)
+        self._invalidateGroupLOD()
+
+    def _invalidateGroupLOD(self):
+        parent = self.parentItem()
+        if isinstance(parent, HullSectionGroupItem):
+            parent.invalidateLOD()
+
+    def drawItemTree(self, model_matrix=Matrix4x4()):
+        parent = self.parentItem()
+        if isinstance(parent, HullSectionGroupItem) and parent.lodLevel() > 0:
+            return  # 截面组在远处时由截面组绘制合并后的低细节网格
+        super().drawItemTree(model_matrix)
+
     def getCurPoints(self, direction: Literal['up', 'bot'], p0: np.ndarray, p1: np.ndarray):
         """
-        获取弧度点集（仅左侧）
+        获取弧度点集（仅左侧），弧面模板按曲率缓存
         :param direction: 方向，'up'为上，'bot'为下
         :param p0: 第一个点（y小）
         :param p1: 第二个点（y大）
@@ -199,17 +245,13 @@ class HullVerSecItem(GLMeshItem):
             p1 = np.array([p1.x, p1.y], dtype=np.float32)
         if p1[1] < p0[1]:
             p0, p1 = p1, p0
-        offset = (p0[1] + p1[1]) / 2
         if direction == 'up':
-            result = CIRCLE_POINTS[6:13] + CUR_ADD_POINTS[6:13] * (1 - self.getTopCur())
+            cur = self.getTopCur()
         elif direction == 'bot':
-            result = CIRCLE_POINTS[:7] + CUR_ADD_POINTS[:7] * (1 - self.getBotCur())
+            cur = self.getBotCur()
         else:
             raise ValueError("direction参数错误")
-        result[:, 0] = result[:, 0] * (p0[0] + (p1[0] - p0[0]) * (result[:, 1] + 1) / 2)
-        result[:, 1] = result[:, 1] * (p1[1] - p0[1]) / 2
-        result[:, 1] += offset
-        return result
+        return curve_points(curve_template(direction, float(cur)), p0, p1)
 
     def setZ(self, _z):
         """
@@ -238,6 +280,7 @@ class HullVerSecItem(GLMeshItem):
                 back_section.paintItem.updateVertexes(back_section.paintItem.mesh_data.vertexes)
         # 更新
         self.updateVertexes(self.mesh_data.vertexes)
+        self._invalidateGroupLOD()
 
     def getTopCur(self):
         """
@@ -363,21 +406,60 @@ class HullVerSecItem(GLMeshItem):
 
     def setPoint(self, pointSection, x, y):
         """
-        设置船体截面的点
+        设置船体截面的点：由截面更新节点数据，再调用 update_mesh 增量更新网格
         :param pointSection: 船体截面的点
         :param x: x坐标
         :param y: y坐标
         """
-        pointSection.setPoint(x, y)
-        self.update_mesh(pointSection.y_index, x, y)
+        self.handler.update_node_data(self.handler.nodes.index(pointSection), x, y)
 
+    @trace_it(cat="mesh")
     def update_mesh(self, index, x, y):
         """
-        更新网格
+        一个节点移动后增量更新网格（由 HullSection.update_node_data 在更新节点数据、且节点顺序不变时调用）：
+        只改写连接本截面的分段网格（自身，以及以本截面为端面的相邻截面）中由这个节点决定的顶点，
+        只重新计算这些三角形的法向量，只上传变化的顶点区间，与截面数和节点数无关
+        :param index: 节点的索引（按y排序）
+        :param x: x坐标
+        :param y: y坐标
         """
-        ...  # TODO: Implement this function
+        section = self.handler
+        nodes_data = section.nodes_data
+        nodes_data[index] = (x, y)
+        point_indices, points = node_outline_patch(nodes_data, index, self.getTopCur(), self.getBotCur())
+        neighbors = (self, getattr(section._frontSection, 'paintItem', None),  # noqa
+                     getattr(section._backSection, 'paintItem', None))  # noqa
+        for item in neighbors:
+            if isinstance(item, HullVerSecItem):
+                item.patch_outline(section, point_indices, points)
+        if index == len(nodes_data) - 1:  # 最高的节点决定栏杆的路径
+            section._parent.update_rail()  # noqa
+        self._invalidateGroupLOD()
         self.update()
 
+    def patch_outline(self, section, point_indices: np.ndarray, points: np.ndarray):
+        """
+        截面的部分轮廓点改变后，改写网格中对应的顶点（网格不连接这个截面时不做任何事）
+        :param section: 轮廓改变的截面
+        :param point_indices: 轮廓点的索引
+        :param points: 新的轮廓点
+        """
+        sections = self.segmentSections()
+        if sections is None or section not in sections:
+            return
+        front = section is sections[0]
+        outline = np.array(self.mesh_data.topPoints if front else self.mesh_data.bottomPoints, dtype=np.float64)
+        outline[point_indices] = points
+        if front:
+            self.mesh_data.topPoints = outline
+        else:
+            self.mesh_data.bottomPoints = outline
+        vertex_indices, source, mirror = segment_point_vertexes(len(outline), front, point_indices)
+        positions = np.column_stack([points[source, 0] * np.where(mirror, -1, 1), points[source, 1],
+                                     self.mesh_data.vertexes[vertex_indices, 2]])
+        triangles = self.mesh_data.patchVertexes(vertex_indices, positions)
+        self.updateVertexRanges(self.mesh_data.vertexes, self.mesh_data.normals, vertex_ranges(triangles))
+
     def setParentSelected(self, selected):
         """
         当父项被选中时
@@ -403,10 +485,13 @@ class HullSecConnection(GLMeshItem):
 
 class HullSectionGroupItem(GLGraphicsItem):
     TAG = "HullSectionGroupItem"
+    LOD_ENABLED = True
+    # 截面组在屏幕上的投影直径（像素）低于这些值时依次使用 HULL_LOD_LEVELS 中更粗糙的网格
+    LOD_THRESHOLDS = (360, 160, 60)
 
     def __init__(self, prj, hullSections):
         """
-        设置船体截面组整体的变换，不负责具体绘制。
+        设置船体截面组整体的变换，近处由各截面绘制，远处绘制合并后的低细节网格。
         :param prj: 工程对象
         :param hullSections: 截面对象列表
         """
@@ -417,6 +502,79 @@ class HullSectionGroupItem(GLGraphicsItem):
         self.hullSections = hullSections
         self._front_item: HullSectionGroupItem = self.hullSections[-1]
         self._back_item: HullSectionGroupItem = self.hullSections[0]
+        # 细节层次：各等级的网格在第一次用到时生成并缓存，截面变化后标记为过期
+        self._lod = LODSelector(self.LOD_THRESHOLDS[:len(HULL_LOD_LEVELS) - 1])
+        self._lod_level = 0
+        self._lod_version = 0
+        self._lod_meshes: Dict[int, Tuple[int, GLMeshItem]] = {}
+        self._lod_bound = None
+        self._lights = []
+
+    def lodLevel(self) -> int:
+        """
+        本帧使用的细节等级，0表示由各截面绘制
+        """
+        return self._lod_level
+
+    def invalidateLOD(self):
+        """
+        截面的节点或z值变化后调用，缓存的低细节网格在下次用到时重新生成
+        """
+        self._lod_version += 1
+        self._lod_bound = None
+
+    def _selectLOD(self, model_matrix: Matrix4x4) -> int:
+        view = self.view()
+        if not self.LOD_ENABLED or view is None or self.selected() or len(self.hullSections) < 2:
+            # 选中（编辑）时总是使用完整的截面网格
+            self._lod.reset()
+            return 0
+        if self._lod_bound is None:
+            points = np.concatenate([section.get_array() for section in self.hullSections])
+            self._lod_bound = bounding_sphere(np.concatenate([points, points * [-1, 1, 1]]))
+        center, radius = self._lod_bound
+        matrix = (model_matrix * self.transform()).matrix44
+        world_center = matrix[:3, :3] @ center + matrix[:3, 3]
+        radius *= np.linalg.norm(matrix[:3, :3], axis=0).max()
+        camera = view.camera
+        distance = float(np.linalg.norm(camera.get_view_pos().xyz - world_center))
+        ortho_zoom = camera.zoom_factor if camera._proj_mode == "ortho" else None  # noqa
+        return self._lod.select(projected_size(radius, distance, camera.fov, view.deviceHeight(), ortho_zoom))
+
+    @trace_it(cat="mesh")
+    def _lodMesh(self, level: int) -> GLMeshItem:
+        """
+        获取细节等级对应的合并网格，过期时重新生成（顶点数不变时只更新缓冲区）
+        """
+        version, item = self._lod_meshes.get(level, (-1, None))
+        if item is not None and version == self._lod_version:
+            return item
+        step, stride = HULL_LOD_LEVELS[level]
+        parent = self.hullSections[0]._parent  # noqa
+        # 合并网格不需要逐个节点修改，使用共享顶点的索引网格；硬边阈值为0，着色与等级0的截面网格相同
+        vertexes, normals, indices = group_indexed([section.z for section in self.hullSections],
+                                                   [section.nodes_data for section in self.hullSections],
+                                                   parent.topCur, parent.botCur, step, stride)
+        if item is not None and item.isInitialized and item._mesh._vertexes.shape == vertexes.shape and \
+                np.array_equal(item._mesh._indices, indices):  # noqa
+            item.updateVertexes(vertexes, normals)
+        else:
+            item = GLMeshItem(vertexes=vertexes, normals=normals, indices=indices,
+                              lights=self._lights, material=EditItemMaterial(), glOptions='translucent')
+            item.setView(self.view())
+        self._lod_meshes[level] = (self._lod_version, item)
+        return item
+
+    def drawItemTree(self, model_matrix=Matrix4x4()):
+        self._lod_level = self._selectLOD(model_matrix)
+        super().drawItemTree(model_matrix)
+
+    def paint(self, model_matrix=Matrix4x4()):
+        if self._lod_level == 0:
+            return
+        item = self._lodMesh(self._lod_level)
+        item.initialize()
+        item.paint(model_matrix)
 
     def setSelected(self, s, children=False) -> bool:
         """
@@ -433,6 +591,9 @@ class HullSectionGroupItem(GLGraphicsItem):
     def addLight(self, light):
         for item in self.childItems():
             item.addLight(light)
+        self._lights.extend(light if isinstance(light, list) else [light])
+        for _, item in self._lod_meshes.values():
+            item.addLight(light)
 
     def initializeGL(self):
         for item in self.childItems():
@@ -458,6 +619,7 @@ class HullSectionGroupItem(GLGraphicsItem):
         # 更新前后截面
         self._front_item = self.hullSections[-1]
         self._back_item = self.hullSections[0]
+        self.invalidateLOD()
 
     def delSection(self, section):
         """
@@ -468,6 +630,7 @@ class HullSectionGroupItem(GLGraphicsItem):
         # 更新前后截面
         self._front_item = self.hullSections[-1]
         self._back_item = self.hullSections[0]
+        self.invalidateLOD()
 
 
 class ArmorSectionItem(GLMeshItem):
@@ -493,8 +656,10 @@ class ArmorSectionItem(GLMeshItem):
     def update_mesh(self, index, x, y):
         """
         更新网格
+        装甲截面还没有生成网格，节点已经在setPoint中修改，只需要重绘；
+        生成网格后可以和 HullVerSecItem.update_mesh 一样按节点到顶点的映射增量更新
         """
-        ...
+        self.update()
 
 
 class ArmorSectionGroupItem(GLGraphicsItem):
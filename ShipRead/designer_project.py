@@ -16,6 +16,7 @@ from PyQt5.QtWidgets import QMessageBox
 from ShipPaint import *
 from ShipRead.sectionHandler import *
 from path_lib import CURRENT_PATH
+from utils.perf_trace import trace_it
 
 
 class DesignerProject(QObject):
@@ -492,6 +493,7 @@ class DesignerProject(QObject):
             "ref_image": [ref_image_.to_dict() for ref_image_ in self.__ref_image]
         }
 
+    @trace_it("DesignerProject.save", "io")
     def save(self):
         """
         保存工程文件
@@ -531,6 +533,7 @@ class DesignerPrjReader:
         self.hullProject = shipProject
         self.successed = self.load()
 
+    @trace_it("DesignerPrjReader.load", "io")
     def load(self):
         try:
             with open(self.path, 'r', encoding='utf-8') as f:
@@ -569,12 +572,14 @@ class DesignerPrjReader:
             railing.interval = data['interval']
             railing.thickness = data['thickness']
             railing.Col = QColor(data['col'])
+            railing.update_paint()
         elif data['type'] == "handrail":
             handrail = Handrail(self.hullProject, parent)
             parent.rail = handrail
             handrail.height = data['height']
             handrail.thickness = data['thickness']
             handrail.Col = QColor(data['col'])
+            handrail.update_paint()
 
     def load_hull_section_group(self, data):
         for section_group in data:
@@ -644,6 +649,7 @@ class DesignerPrjReader:
             ladder_handler.width = ladder_['width']
             ladder_handler.interval = ladder_['interval']
             ladder_handler.material_width = ladder_['material_width']
+            ladder_handler.update_paint()
             self.hullProject.add_ladder(ladder_handler, True)
 
     def load_model(self, data):
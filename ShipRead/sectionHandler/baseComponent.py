@@ -13,7 +13,7 @@ from GUI.hierarchy_widgets import *
 from GUI.sub_component_edt_widgets import SubElementShow
 from PyQt5.QtGui import QVector3D
 
-from pyqtOpenGL import GLMeshItem, sphere, cube, EditItemMaterial, GLGraphicsItem, GLViewWidget
+from pyqtOpenGL import GLPlaceholderItem, sphere, cube, GLGraphicsItem, GLViewWidget
 
 
 class PrjComponent(QObject):
@@ -151,13 +151,14 @@ class PrjComponent(QObject):
             Log().info(self.TAG, f"{self} 移除原有paintItem")
         if paintItem == "default":
             Log().warning(self.TAG, f"{self} 将paintItem设置为默认球体")
-            paintItem = GLMeshItem(
+            # 所有默认球体共享一个实例化网格，一次绘制调用
+            paintItem = GLPlaceholderItem(
+                "sphere",
                 vertexes=PrjComponent.SPHERE_VER, indices=PrjComponent.SHPERE_IDX,
                 normals=PrjComponent.SPHERE_NORM,
                 lights=[PrjComponent._gl_widget.light],
                 # 随机颜色
-                material=EditItemMaterial(color=np.random.randint(128, 255, 3).tolist()),
-                glOptions='translucent',
+                color=np.random.randint(128, 255, 3).tolist(),
                 selectable=True
             ).translate(self.Pos.x(), self.Pos.y(), self.Pos.z())
         self.paintItem = paintItem
@@ -428,12 +429,11 @@ class SubPrjComponent(QObject):
             # print(f"[INFO] {self} remove paintItem")
             Log().info(self.TAG, f"{self} remove paintItem")
         if paintItem == "default":
-            paintItem = GLMeshItem(
-                vertexes=PrjComponent.CUBE_VER, indices=PrjComponent.CUBE_NORM,
-                normals=PrjComponent.CUBE_NORM,
+            paintItem = GLPlaceholderItem(
+                "cube",
+                vertexes=PrjComponent.CUBE_VER, normals=PrjComponent.CUBE_NORM,
                 lights=[SubPrjComponent._gl_widget.light],
-                material=EditItemMaterial(color=(128, 128, 128)),
-                glOptions='translucent',
+                color=(128, 128, 128),
                 selectable=True
             )
         else:
@@ -3,6 +3,7 @@
 """
 from PyQt5.QtGui import QVector3D, QColor
 from GUI.hierarchy_widgets import *
+from pyqtOpenGL import GLRailingItem
 from .baseComponent import PrjComponent, SubPrjComponent, ComponentNodeXZ
 
 
@@ -19,7 +20,8 @@ class Railing(SubPrjComponent):
         railing.height = self.height
         railing.interval = self.interval
         railing.thickness = self.thickness
-        railing.Col = self.Col
+        railing.Col = QColor(self.Col)
+        railing.update_paint()
         return railing
 
     idMap = {}
@@ -33,7 +35,17 @@ class Railing(SubPrjComponent):
         self._parent = parent
         self.Col: QColor = QColor(128, 128, 128)  # 颜色
         super().__init__()
-        self.setPaintItem("default")
+        # 所有立柱和扶手一次实例化绘制
+        self.setPaintItem(GLRailingItem(self._parent.get_rail_paths(), self.height, self.interval, self.thickness,
+                                        color=self.Col.getRgb()[:3], selectable=True))
+
+    def update_paint(self):
+        """
+        修改高度、间隔、厚度、颜色或父对象的形状后更新绘制对象（只重新计算实例矩阵）
+        """
+        self.paintItem.setPaths(self._parent.get_rail_paths())
+        self.paintItem.setParams(self.height, self.interval, self.thickness)
+        self.paintItem.setColor(self.Col.getRgb()[:3])
 
     def to_dict(self):
         return {
@@ -57,7 +69,8 @@ class Handrail(SubPrjComponent):
         handrail = Handrail(self.hullProject, self._parent)
         handrail.height = self.height
         handrail.thickness = self.thickness
-        handrail.Col = self.Col
+        handrail.Col = QColor(self.Col)
+        handrail.update_paint()
         return handrail
 
     idMap = {}
@@ -70,6 +83,17 @@ class Handrail(SubPrjComponent):
         self._parent = parent
         self.Col: QColor = QColor(128, 128, 128)
         super().__init__()
+        # 每段折线一块栏板，一次实例化绘制
+        self.setPaintItem(GLRailingItem(self._parent.get_rail_paths(), self.height, None, self.thickness,
+                                        color=self.Col.getRgb()[:3], selectable=True))
+
+    def update_paint(self):
+        """
+        修改高度、厚度、颜色或父对象的形状后更新绘制对象
+        """
+        self.paintItem.setPaths(self._parent.get_rail_paths())
+        self.paintItem.setParams(self.height, None, self.thickness)
+        self.paintItem.setColor(self.Col.getRgb()[:3])
 
     def to_dict(self):
         return {
@@ -116,6 +140,13 @@ class Bridge(PrjComponent):
         # 设置左侧结构树当前的tab
         self._structure_tab.setCurrentTab(self._bridge_tab.widget)
 
+    def get_rail_paths(self):
+        """
+        栏杆的路径：舰桥轮廓（闭合），坐标相对舰桥位置
+        :return: [(节点 nx3, 是否闭合)]
+        """
+        return [([[node.x, 0, node.z] for node in self.nodes], True)] if self.nodes else []
+
     def to_dict(self):
         return {
             "name": f"{self.name}",
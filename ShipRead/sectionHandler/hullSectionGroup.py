@@ -1,7 +1,7 @@
 """
 工程文件组件：船体截面组
 """
-from typing import List, Union, Literal, Optional
+from typing import Dict, List, Tuple, Union, Literal, Optional
 
 import numpy as np
 from GUI.sub_component_edt_widgets import SubSectionShow
@@ -12,6 +12,7 @@ from .baseComponent import ComponentNodeXY, PrjComponent, SubPrjComponent
 from .bridge import Railing, Handrail
 from main_logger import Log
 from operation.section_op import SectionZMoveOperation
+from utils.hull_mesh import group_outlines, group_segments
 
 
 class HullSection(SubPrjComponent):
@@ -63,9 +64,31 @@ class HullSection(SubPrjComponent):
             self.nodes.append(node)
         self.nodes.sort(key=lambda x: x.y)
 
-    def update_node_data(self, index, x):
-        self.nodes[index].x = x
-        self.maxX = max(self.maxX, x)
+    def update_node_data(self, index, x, y=None):
+        """
+        修改一个节点的坐标（例如拖动节点）：先更新节点对象（保存、栏杆路径和船体大小都读取节点对象）和节点数据，
+        再增量更新网格；节点的上下顺序改变时重新排序，并重建截面组的网格
+        :param index: 节点的索引（按y排序）
+        :param x: x坐标
+        :param y: y坐标，为None时不变
+        """
+        node = self.nodes[index]
+        node.x = x
+        if y is not None:
+            node.y = y
+        self.maxX = max(n.x for n in self.nodes)
+        if self.nodes_data is None:
+            return
+        if (index > 0 and node.y < self.nodes[index - 1].y) or \
+                (index < len(self.nodes) - 1 and node.y > self.nodes[index + 1].y):
+            # 轮廓点的排列随节点顺序改变，不能增量更新
+            self.nodes.sort(key=lambda n: n.y)
+            self.init_node_data()
+            self._parent.rebuild_meshes()
+            return
+        self.nodes_data[index] = (node.x, node.y)
+        if self.paintItem is not None:
+            self.paintItem.update_mesh(index, node.x, node.y)
 
     def _add_node(self, node):
         """
@@ -97,6 +120,8 @@ class HullSection(SubPrjComponent):
         :return:
         """
         self.nodes_data = np.array([[node.x, node.y] for node in self.nodes])
+        for i, node in enumerate(self.nodes):
+            node.y_index = i
 
     def setZ(self, z_, undo=False):
         """
@@ -119,6 +144,7 @@ class HullSection(SubPrjComponent):
         self.z = z_
         self._showButton.setEditTextZ(self.z)
         self.paintItem.setZ(self.z)
+        self._parent.update_rail()
         if self._parent._frontSection == self:
             self._parent.update_front_z_s.emit(self.z)
             # EditHullSectionGroupWidget.Instance.updateFrontZ()
@@ -137,6 +163,25 @@ class HullSection(SubPrjComponent):
         """
         return np.array([[node.x, node.y, self.z] for node in self.nodes])
 
+    def set_array(self, array: np.ndarray):
+        """
+        用get_array()格式的数组整体设置节点坐标和z值，不重建网格（由截面组统一重建）
+        :param array: [节点数，3]
+        :return:
+        """
+        self.nodes_data = np.array(array[:, :2], dtype=np.float64)
+        for node, (x, y) in zip(self.nodes, self.nodes_data.tolist()):
+            node.x, node.y = x, y
+        self.maxX = float(self.nodes_data[:, 0].max())
+        z_ = float(array[0, 2])
+        if abs(z_ - self.z) > 1e-6:
+            self.z = z_
+            self._showButton.setEditTextZ(self.z)
+            if self._parent._frontSection == self:
+                self._parent.update_front_z_s.emit(self.z)
+            elif self._parent._backSection == self:
+                self._parent.update_back_z_s.emit(self.z)
+
     def to_dict(self):
         return {
             "name": self.name,
@@ -157,6 +202,7 @@ class HullSectionGroup(PrjComponent):
     deleted_s = pyqtSignal()
     update_front_z_s = pyqtSignal(float)
     update_back_z_s = pyqtSignal(float)
+    update_size_s = pyqtSignal()  # 批量设置节点后发射，用于刷新船体大小的显示
 
     def getCopy(self):
         hullSections = [section.getCopy() for section in self.__sections]
@@ -190,10 +236,12 @@ class HullSectionGroup(PrjComponent):
         self.setPaintItem(paint_item)
         self.setPos(pos)
         self.setRot(rot)
+        # 所有截面的网格一次生成
+        outlines, meshes = self.build_meshes()
         # 倒过来，从大到小排列
         for section in self.__sections[::-1]:
             section.init_parent(self)
-            section.setPaintItem(HullVerSecItem(section, section.z, section.nodes))
+            section.setPaintItem(HullVerSecItem(section, section.z, section.nodes, outlines, meshes.get(section)))
             # 将截面展示的button控件加入右侧滚动区域
             self._edit_tab.edit_hullSectionGroup_widget.add_section_showButton(section)
         # 初始化
@@ -214,9 +262,101 @@ class HullSectionGroup(PrjComponent):
         """
         return np.array([section.get_array() for section in self.__sections])
 
+    def set_array(self, array: np.ndarray):
+        """
+        用get_array()格式的数组整体设置所有截面的节点，然后重建所有截面的网格
+        :param array: [截面数，节点数，3]
+        :return:
+        """
+        array = np.asarray(array)
+        if array.ndim != 3 or array.shape[0] != len(self.__sections):
+            raise ValueError(f"array shape {array.shape} does not match {len(self.__sections)} sections")
+        for section, section_array in zip(self.__sections, array):
+            section.set_array(section_array)
+        # 截面网格依赖相邻截面的节点，所以在所有节点更新后再重建
+        self.rebuild_meshes(array)
+        self.update_size_s.emit()
+
+    def get_outlines(self, array: Optional[np.ndarray] = None) -> Dict[HullSection, np.ndarray]:
+        """
+        所有截面的左侧轮廓（弧面点 + 节点），一次numpy计算
+        :param array: get_array()格式的数组 [截面数，节点数，3]，为None时使用各截面的节点数据（节点数可以不同）
+        :return: {截面: 轮廓}
+        """
+        nodes = [section.nodes_data for section in self.__sections] if array is None else np.asarray(array)[..., :2]
+        outlines = group_outlines(nodes, self.topCur, self.botCur)
+        return dict(zip(self.__sections, outlines))
+
+    def build_meshes(self, array: Optional[np.ndarray] = None
+                     ) -> Tuple[Dict[HullSection, np.ndarray], Dict[HullSection, Tuple[np.ndarray, np.ndarray]]]:
+        """
+        一次生成所有截面的网格：第i个截面和第i+1个截面之间的分段属于z>0的一侧
+        （z>0的截面连接后一个截面，z<0的截面连接前一个截面，与 HullVerSecItem.segmentSections 相同）
+        :param array: get_array()格式的数组 [截面数，节点数，3]，为None时使用各截面的节点数据和z值
+        :return: ({截面: 轮廓}, {截面: (顶点, 法向量)})
+        """
+        sections = self.__sections
+        outlines = self.get_outlines(array)
+        zs = [section.z for section in sections] if array is None else np.asarray(array)[:, 0, 2]
+        segments = group_segments(zs, [outlines[section] for section in sections])
+        meshes = {}
+        for i, section in enumerate(sections):
+            if section.z > 0 and i > 0:
+                meshes[section] = segments[i - 1]
+            elif section.z < 0 and i < len(sections) - 1:
+                meshes[section] = segments[i]
+        return outlines, meshes
+
+    def rebuild_meshes(self, array: Optional[np.ndarray] = None):
+        """
+        重建所有截面的网格（批量生成，每个截面的轮廓只计算一次）
+        :param array: 同 build_meshes
+        """
+        outlines, meshes = self.build_meshes(array)
+        for section in self.__sections:
+            section.paintItem.rebuild_mesh(outlines, meshes.get(section))
+        self.update_rail()
+
+    def update_rail(self):
+        """
+        截面的z值、最高节点或截面数量改变后，更新栏杆的路径（甲板边缘）
+        """
+        if self.rail is not None:
+            self.rail.update_paint()
+
+    def setCurvature(self, topCur: Optional[float] = None, botCur: Optional[float] = None):
+        """
+        设置顶部和底部的曲率，然后重建所有截面的网格
+        :param topCur: 顶部曲率，为None时不变
+        :param botCur: 底部曲率，为None时不变
+        """
+        if topCur is not None:
+            self.topCur = topCur
+        if botCur is not None:
+            self.botCur = botCur
+        self.rebuild_meshes()
+
+    def get_rail_paths(self):
+        """
+        栏杆的路径：左右两舷的甲板边缘（每个截面最高的节点），坐标相对截面组
+        :return: [(节点 nx3, 是否闭合)]
+        """
+        top = np.array([section.get_array()[np.argmax([node.y for node in section.nodes])]
+                        for section in self.__sections if section.nodes], dtype=np.float32).reshape(-1, 3)
+        if top.shape[0] < 2:
+            return []
+        return [(top, False), (top * [-1, 1, 1], False)]
+
     def getMaxX(self):
         return max([section.maxX for section in self.__sections])
 
+    def getSize(self) -> Tuple[float, float, float]:
+        """
+        船体大小：(宽度，前截面的高度，前后截面的距离)
+        """
+        return (2 * self.getMaxX(), self._frontSection.nodes[-1].y - self._frontSection.nodes[0].y,
+                self._frontSection.z - self._backSection.z)
+
     def create_frontSection(self):
         new_hs = HullSection(self.hullProject,
                              self._frontSection.z + 2,
@@ -243,13 +383,14 @@ class HullSectionGroup(PrjComponent):
                     # section.setPaintItem(HullSectionItem(section,
                     ...
                 self.__sections.insert(i, section)
-
+                self.update_rail()
                 return
         raise ValueError(f"Can't insert {section} into {self.__sections}")
 
     def _del_section(self, section: HullSection):
         if section in self.__sections:
             self.__sections.remove(section)
+            self.update_rail()
         else:
             Log().warning(self.TAG, f"{section} not in {self.__sections}")
 
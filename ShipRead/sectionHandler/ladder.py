@@ -4,6 +4,7 @@
 from typing import List, Literal
 from PyQt5.QtCore import pyqtSignal
 from PyQt5.QtGui import QColor, QVector3D
+from pyqtOpenGL import GLLadderItem
 from .baseComponent import PrjComponent
 from main_logger import Log
 
@@ -41,10 +42,20 @@ class Ladder(PrjComponent):
         self.shape = shape  # 梯子材料形状
         self.material_width = 0.1
         super().__init__("PosShow")
-        self.setPaintItem("default")
+        # 竖杆和踏棍一次实例化绘制
+        self.setPaintItem(GLLadderItem(self.length, self.width, self.interval, self.material_width, self.shape,
+                                       color=self.Col.getRgb()[:3], lights=[PrjComponent._gl_widget.light],
+                                       selectable=True))
         self.setPos(self.Pos)
         self.setRot(self.Rot)
 
+    def update_paint(self):
+        """
+        修改长度、宽度、间隔、材料宽度或颜色后更新绘制对象（只重新计算实例矩阵）
+        """
+        self.paintItem.setParams(self.length, self.width, self.interval, self.material_width)
+        self.paintItem.setColor(self.Col.getRgb()[:3])
+
     def set_showButton_checked(self, selected: bool):
         super().set_showButton_checked(selected)
         # 设置左侧结构树当前的tab
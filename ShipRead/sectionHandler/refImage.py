@@ -2,11 +2,11 @@
 参考图片
 """
 from pathlib import Path
-from utils import ReplaceCV2
+from PIL import Image as PILImage
 from GUI.hierarchy_widgets import *
 from PyQt5.QtGui import QVector3D
 from .baseComponent import PrjComponent
-from pyqtOpenGL import GLImageItem
+from pyqtOpenGL import GLImageItem, GLTiledImageItem
 
 
 class RefImage(PrjComponent):
@@ -14,6 +14,7 @@ class RefImage(PrjComponent):
     参考图片
     """
     TAG = "RefImage"
+    TILED_THRESHOLD = 4096  # 图片长或宽超过该值时，使用分块加载的图片（超出常见的最大纹理尺寸）
 
     def getCopy(self):
         return RefImage(self.hullProject, self.name, self.Pos, self.Rot, self.Scl, self.file_path)
@@ -40,14 +41,33 @@ class RefImage(PrjComponent):
         self.file_path = str(Path(file_path))
         super().__init__('PosShow')
         # modelRenderConfig = configHandler.get_config("ModelRenderSetting")
-        img_array = ReplaceCV2.imread(self.file_path)
         with Log().redirectOutput(self.TAG):  # 图片加载时，库内可能会有输出，这里重定向到日志
-            imageItem = GLImageItem(img_array, selectable=True)
-            self.setPaintItem(imageItem)
+            self.setPaintItem(self._create_image_item())
             self.setPos(pos)
             self.setRot(rot)
             self.setScl(scl)
 
+    def _create_image_item(self):
+        """
+        根据图片尺寸创建绘制对象：超大图片按金字塔瓦片流式加载（每一级在需要时才从文件解码），
+        其余的按路径交给纹理缓存，在后台解码，复制的参考图片共享同一个纹理
+        """
+        with PILImage.open(self.file_path) as img:  # 只读取文件头
+            w, h = img.size
+        if max(w, h) > self.TILED_THRESHOLD:
+            Log().info(self.TAG, f"{self.name} 图片尺寸为 {w}x{h}，使用分块加载")
+            return GLTiledImageItem(self.file_path, selectable=True)
+        return GLImageItem(self.file_path, selectable=True)
+
+    def _release_image_item(self):
+        """
+        绘制对象被替换或删除前，释放分块图片的瓦片纹理和内存中的图片（共享纹理由纹理缓存按引用计数释放）
+        """
+        if isinstance(self.paintItem, GLTiledImageItem):
+            self._gl_widget.makeCurrent()
+            self.paintItem.delete()
+            self._gl_widget.doneCurrent()
+
     def changePath(self, path):
         """
         修改模型路径，然后通知gl_widget更新
@@ -55,10 +75,9 @@ class RefImage(PrjComponent):
         """
         self.file_path = str(Path(path))
         # modelRenderConfig = configHandler.get_config("ModelRenderSetting")
-        img_array = ReplaceCV2.imread(self.file_path)
         with Log().redirectOutput(self.TAG):
-            imageItem = GLImageItem(img_array, selectable=True)
-            self.setPaintItem(imageItem)
+            self._release_image_item()
+            self.setPaintItem(self._create_image_item())
             self.setPos(self.Pos)
             self.setRot(self.Rot)
             self.setScl(self.Scl)
@@ -76,6 +95,7 @@ class RefImage(PrjComponent):
         所有的删除操作都应该调用这个方法，即使是在控件中删除
         :return:
         """
+        self._release_image_item()
         super().delete()
         try:
             RefImage.idMap.pop(self.getId())
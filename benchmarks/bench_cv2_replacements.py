@@ -0,0 +1,90 @@
+"""
+ReplaceCV2 图片解码与缩放的基准测试
+与之前的实现（PIL对象与np.array来回拷贝）对比，使用 sample_projects/Fuso.png 及其放大图。
+运行：python benchmarks/bench_cv2_replacements.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image as PILImage
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils.cv2_replacements import ReplaceCV2  # noqa: E402
+
+SAMPLE_IMAGE = os.path.join(ROOT, "sample_projects", "Fuso.png")
+
+
+# 之前的实现，作为对照
+def baseline_imread(path):
+    return np.array(PILImage.open(path))
+
+
+def baseline_resize(src, dsize):
+    return np.array(PILImage.fromarray(src).resize(dsize, PILImage.BILINEAR))
+
+
+def baseline_pyrDown(img):
+    h, w = img.shape[:2]
+    return np.array(PILImage.fromarray(img).resize((w // 2, h // 2), PILImage.BILINEAR))
+
+
+def bench(func, repeat=5):
+    """
+    :return: 最短耗时（毫秒）
+    """
+    func()  # 预热
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def run(scale: int = 8, repeat: int = 5) -> list:
+    """
+    :param scale: 放大倍数，模拟扫描的大尺寸图纸
+    :return: [(用例, 之前的实现ms, 当前实现ms)]
+    """
+    sample = np.array(PILImage.open(SAMPLE_IMAGE).convert("RGB"))
+    big = np.array(PILImage.fromarray(sample).resize((sample.shape[1] * scale, sample.shape[0] * scale)))
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        png_path = os.path.join(tmp_dir, "big.png")
+        jpg_path = os.path.join(tmp_dir, "big.jpg")
+        PILImage.fromarray(big).save(png_path)
+        PILImage.fromarray(big).save(jpg_path, quality=90)
+        out = np.empty(ReplaceCV2.imread_shape(png_path), dtype=np.uint8)
+        results.append(("imread png", bench(lambda: baseline_imread(png_path), repeat),
+                        bench(lambda: ReplaceCV2.imread(png_path, out=out), repeat)))
+        results.append(("imread png 1/4 preview", bench(lambda: baseline_imread(png_path), repeat),
+                        bench(lambda: ReplaceCV2.imread(png_path, reduce=4), repeat)))
+        results.append(("imread jpg 1/4 preview", bench(lambda: baseline_imread(jpg_path), repeat),
+                        bench(lambda: ReplaceCV2.imread(jpg_path, reduce=4), repeat)))
+    dsize = (big.shape[1] // 3, big.shape[0] // 3)
+    results.append(("resize", bench(lambda: baseline_resize(big, dsize), repeat),
+                     bench(lambda: ReplaceCV2.resize(big, dsize), repeat)))
+    batch = [big] * 8
+    results.append(("resize x8", bench(lambda: [baseline_resize(img, dsize) for img in batch], repeat),
+                     bench(lambda: ReplaceCV2.resize_batch(batch, dsize), repeat)))
+    results.append(("pyrDown", bench(lambda: baseline_pyrDown(big), repeat),
+                     bench(lambda: ReplaceCV2.pyrDown(big), repeat)))
+    results.append(("pyrDown small", bench(lambda: baseline_pyrDown(sample), repeat),
+                     bench(lambda: ReplaceCV2.pyrDown(sample), repeat)))
+    return results
+
+
+def main():
+    results = run()
+    print(f"{'case':<26}{'baseline(ms)':>14}{'current(ms)':>14}{'speedup':>10}")
+    for name, base, cur in results:
+        print(f"{name:<26}{base:>14.2f}{cur:>14.2f}{base / cur:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,355 @@
+"""
+合成测试用的工程文件
+生成指定规模的船体和各类组件，写入 .naprj（设计器工程）和 .na（NavalArt 图纸），用于基准测试和压力测试。
+相同的参数和随机种子生成相同的文件。
+    python benchmarks/project_generator.py out_dir --scale 100
+    python benchmarks/project_generator.py out_dir --hull-groups 3 --sections 400 --nodes 24 --bridges 20
+"""
+import argparse
+import json
+import math
+import os
+import random
+from hashlib import sha1
+from typing import List, Tuple
+from xml.sax.saxutils import quoteattr
+
+DEFAULT_COLOR = "#888889"
+# 示例工程（sample_projects/sample.naprj）的规模，--scale 以此为基准
+SAMPLE_SIZE = {
+    "hull_groups": 1, "sections": 5, "nodes": 4,
+    "armor_groups": 1, "bridges": 1, "ladders": 2, "models": 0, "ref_images": 1,
+}
+MODEL_FILE = "box.obj"
+REF_IMAGE_FILE = "ref_image.png"
+
+
+def _color(rng: random.Random) -> str:
+    """
+    舰船常用的灰色系，少量随机的甲板色和水线色
+    """
+    roll = rng.random()
+    if roll < 0.8:
+        grey = rng.randint(0x60, 0xa0)
+        return f"#{grey:02x}{grey:02x}{grey + 1:02x}"
+    if roll < 0.9:
+        return "#a0804a"
+    return "#7a2a2a"
+
+
+def _hull_dimensions(rng: random.Random) -> Tuple[float, float, float]:
+    """
+    船长、船宽、型深，按常见的长宽比（7~9）和宽深比（1.5~2）生成
+    """
+    length = rng.uniform(120, 260)
+    beam = length / rng.uniform(7, 9)
+    depth = beam / rng.uniform(1.5, 2)
+    return round(length, 1), round(beam, 1), round(depth, 1)
+
+
+def hull_sections(n_sections: int, n_nodes: int, length: float = 200., beam: float = 24., depth: float = 14.,
+                  rng: random.Random = None) -> List[dict]:
+    """
+    生成一个船体截面组的截面
+    半宽沿船长按船型曲线变化（舯部最宽，艏艉收窄），截面节点从船底到甲板排列，
+    节点的x为左侧半宽，y为高度，与工程文件中的格式相同
+    :param n_sections: 截面数（至少2个）
+    :param n_nodes: 每个截面的节点数（至少2个）
+    :param length: 船长
+    :param beam: 船宽
+    :param depth: 型深
+    :param rng: 随机数生成器，用于给节点加入小的扰动
+    """
+    rng = rng or random.Random(0)
+    n_sections, n_nodes = max(n_sections, 2), max(n_nodes, 2)
+    sections = []
+    for i in range(n_sections):
+        t = i / (n_sections - 1) * 2 - 1  # -1（艉）到 1（艏）
+        half_width = beam / 2 * max(0.05, (1 - abs(t) ** 3)) ** 0.5
+        nodes = []
+        for j in range(n_nodes):
+            s = j / (n_nodes - 1)  # 0（船底）到 1（甲板）
+            y = -depth / 2 + depth * s
+            x = half_width * math.sin(math.pi / 2 * (0.25 + 0.75 * s)) ** 0.5
+            x *= 1 + rng.uniform(-0.01, 0.01)
+            nodes.append([round(x, 3), round(y, 3)])
+        sections.append({
+            "name": f"截面{i}", "z": round(t * length / 2, 3), "nodes": nodes,
+            "col": [DEFAULT_COLOR] * n_nodes, "armor": 5
+        })
+    return sections
+
+
+def hull_section_group(name: str, n_sections: int, n_nodes: int, rng: random.Random = None,
+                       center=(0.0, 0.0, 0.0), **kwargs) -> dict:
+    """
+    :param kwargs: 传给hull_sections的船体尺寸
+    """
+    rng = rng or random.Random(0)
+    group = {
+        "name": name, "center": list(center), "rot": [0, 0, 0], "col": DEFAULT_COLOR, "armor": 0,
+        "top_cur": 0.0, "bot_cur": 1.0,
+        "sections": hull_sections(n_sections, n_nodes, rng=rng, **kwargs),
+    }
+    if rng.random() < 0.7:  # 大部分船体有栏杆
+        group["rail"] = {"height": 1.2, "interval": 1.0, "thickness": 0.1, "type": "railing", "col": DEFAULT_COLOR}
+    return group
+
+
+def armor_section_group(name: str, length: float, beam: float, depth: float, rng: random.Random,
+                        center=(0.0, 0.0, 0.0)) -> dict:
+    """
+    船体内部的装甲盒：一段长度、三个节点（底、中、顶）的截面
+    """
+    half = round(rng.uniform(0.2, 0.35) * length / 2, 1)
+    x = round(beam * rng.uniform(0.3, 0.45), 2)
+    y = round(depth * rng.uniform(0.25, 0.4), 2)
+    nodes = [[x, -y], [x, 0], [x, y]]
+    return {
+        "name": name, "center": list(center), "rot": [0, 0, 0], "col": DEFAULT_COLOR, "armor": 0,
+        "sections": [{"z": -half, "nodes": nodes, "armor": None}, {"z": half, "nodes": nodes, "armor": None}],
+    }
+
+
+def bridge(name: str, tier: int, deck_y: float, z: float, beam: float, rng: random.Random) -> dict:
+    """
+    舰桥的一层：越高的层越小，节点为XZ平面上的多边形
+    """
+    half_w = round(beam * 0.3 * 0.85 ** tier * rng.uniform(0.9, 1.1), 2)
+    half_l = round(half_w * rng.uniform(1.0, 1.8), 2)
+    nodes = [[half_w, half_l], [half_w, -half_l], [-half_w, -half_l], [-half_w, half_l]]
+    if rng.random() < 0.5:  # 切掉前端两角，成为六边形
+        cut = round(half_w * 0.4, 2)
+        nodes = [[half_w - cut, half_l], [half_w, half_l - cut], [half_w, -half_l], [-half_w, -half_l],
+                 [-half_w, half_l - cut], [-half_w + cut, half_l]]
+    data = {
+        "name": name, "pos": [0.0, round(deck_y + 2.5 * tier, 2), round(z, 2)], "col": _color(rng), "armor": 5,
+        "nodes": nodes, "rail_only": False,
+    }
+    if rng.random() < 0.6:
+        data["rail"] = {"height": 1.2, "thickness": 0.1, "type": "handrail", "col": DEFAULT_COLOR}
+    return data
+
+
+def ladder(name: str, pos, rng: random.Random) -> dict:
+    return {
+        "name": name, "pos": [round(v, 2) for v in pos], "rot": [0, rng.choice([0, 90, 180, 270]), 0],
+        "col": DEFAULT_COLOR, "length": round(rng.uniform(2.5, 8), 1), "width": rng.choice([0.5, 0.6, 0.8]),
+        "interval": rng.choice([0.3, 0.4, 0.5]), "shape": "cylinder" if rng.random() < 0.7 else "box",
+        "material_width": 0.05,
+    }
+
+
+def _placed(name: str, pos, rot, scl, file_path: str) -> dict:
+    return {
+        "name": name, "pos": [round(v, 2) for v in pos], "rot": rot, "scl": [round(v, 2) for v in scl],
+        "file_path": file_path
+    }
+
+
+def check_code(data: dict) -> str:
+    """
+    与 DesignerProject.save 相同的校验码
+    """
+    data = dict(data)
+    data.pop("check_code", None)
+    return str(sha1(str(data).encode("utf-8")).hexdigest())
+
+
+def make_project(name: str = "Synthetic", hull_groups: int = 1, sections: int = 20, nodes: int = 8,
+                 armor_groups: int = 0, bridges: int = 0, ladders: int = 0, models: int = 0, ref_images: int = 0,
+                 asset_dir: str = "", seed: int = 0) -> dict:
+    """
+    生成工程文件的字典
+    船体截面组沿x方向并排（互不重叠），其余组件分配到各个船体上：
+    装甲盒在船体内部，舰桥在舯部甲板上逐层堆叠，梯子、模型沿甲板随机分布，参考图片位于船体侧面
+    :param asset_dir: 模型和参考图片文件所在的文件夹（见write_assets）
+    """
+    rng = random.Random(seed)
+    hulls, spots = [], []
+    offset = 0.
+    for i in range(max(hull_groups, 1)):
+        length, beam, depth = _hull_dimensions(rng)
+        center = (round(offset, 2), 0.0, 0.0)
+        offset += beam * 1.5
+        hulls.append(hull_section_group(f"船体{i}", sections, nodes, rng, center,
+                                        length=length, beam=beam, depth=depth))
+        spots.append((center, length, beam, depth))
+
+    def spot(i):
+        return spots[i % len(spots)]
+
+    armor = []
+    for i in range(armor_groups):
+        center, length, beam, depth = spot(i)
+        armor.append(armor_section_group(f"装甲{i}", length, beam, depth, rng, center))
+    bridges_data = []
+    tiers = {}
+    for i in range(bridges):
+        hull = i % len(spots)
+        center, length, beam, depth = spots[hull]
+        tier = tiers.get(hull, 0)
+        tiers[hull] = tier + 1
+        data = bridge(f"舰桥{i}", tier % 8, depth / 2, center[2] + length * 0.1 * (tier // 8), beam, rng)
+        data["pos"][0] = center[0]
+        bridges_data.append(data)
+    ladders_data = []
+    for i in range(ladders):
+        center, length, beam, depth = spot(i)
+        pos = (center[0] + rng.uniform(-beam, beam) * 0.4, depth / 2 + rng.uniform(0, 8),
+               rng.uniform(-length, length) * 0.45)
+        ladders_data.append(ladder(f"梯子（{i}）", pos, rng))
+    models_data = []
+    for i in range(models):
+        center, length, beam, depth = spot(i)
+        pos = (center[0] + rng.uniform(-beam, beam) * 0.3, depth / 2 + 1, rng.uniform(-length, length) * 0.45)
+        size = rng.uniform(1, 4)
+        models_data.append(_placed(f"模型{i}", pos, [0, rng.choice([0, 180]), 0], [size] * 3,
+                                   os.path.join(asset_dir, MODEL_FILE)))
+    images_data = []
+    for i in range(ref_images):
+        center, length, beam, depth = spot(i)
+        pos = (center[0] - beam, 0, 0)
+        images_data.append(_placed(f"参考图{i}", pos, [90.0, 90.0, 0], [length, depth, 1],
+                                   os.path.join(asset_dir, REF_IMAGE_FILE)))
+    data = {
+        "check_code": None,
+        "project_name": name,
+        "author": "generator",
+        "edit_time": "2024-1-1 0:0:0",
+        "hull_section_group": hulls,
+        "armor_section_group": armor,
+        "bridge": bridges_data,
+        "ladder": ladders_data,
+        "model": models_data,
+        "ref_image": images_data,
+    }
+    data["check_code"] = check_code(data)
+    return data
+
+
+def write_assets(asset_dir: str, image_size: Tuple[int, int] = (2048, 256)):
+    """
+    写入模型（立方体obj）和参考图片（船体侧视剪影）
+    """
+    from PIL import Image, ImageDraw
+    os.makedirs(asset_dir, exist_ok=True)
+    with open(os.path.join(asset_dir, MODEL_FILE), "w", encoding="utf-8") as f:
+        for x in (-0.5, 0.5):
+            for y in (-0.5, 0.5):
+                for z in (-0.5, 0.5):
+                    f.write(f"v {x} {y} {z}\n")
+        for face in ((1, 3, 4, 2), (5, 6, 8, 7), (1, 2, 6, 5), (3, 7, 8, 4), (1, 5, 7, 3), (2, 4, 8, 6)):
+            f.write("f " + " ".join(map(str, face)) + "\n")
+    w, h = image_size
+    image = Image.new("RGB", image_size, (235, 235, 235))
+    draw = ImageDraw.Draw(image)
+    draw.polygon([(w * 0.02, h * 0.3), (w * 0.98, h * 0.2), (w * 0.9, h * 0.8), (w * 0.08, h * 0.75)],
+                 fill=(90, 90, 95))
+    image.save(os.path.join(asset_dir, REF_IMAGE_FILE))
+
+
+def write_naprj(path: str, data: dict):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _na_part(part_id: int, pos, rot=(0, 0, 0), scl=(1, 1, 1), color="888889", armor=5, data: dict = None,
+             turret: dict = None) -> str:
+    lines = [f'    <part id="{part_id}">']
+    if data:
+        lines.append("      <data " + " ".join(f"{k}={quoteattr(str(v))}" for k, v in data.items()) + " />")
+    if turret:
+        lines.append("      <turret " + " ".join(f"{k}={quoteattr(str(v))}" for k, v in turret.items()) + " />")
+    lines.append('      <position x="%s" y="%s" z="%s" />' % tuple(round(v, 4) for v in pos))
+    lines.append('      <rotation x="%s" y="%s" z="%s" />' % tuple(rot))
+    lines.append('      <scale x="%s" y="%s" z="%s" />' % tuple(round(v, 4) for v in scl))
+    lines.append(f'      <color hex="{color}" />')
+    lines.append(f'      <armor value="{armor}" />')
+    lines.append("    </part>")
+    return "\n".join(lines)
+
+
+# 示例图纸（KMS Hindenburg.na）中常见的零件id
+WEAPON_IDS = (124, 172, 311)
+DECORATION_IDS = (5, 114, 391, 519, 563)
+
+
+def write_na(path: str, sections: int = 20, nodes: int = 8, seed: int = 0, weapons: int = 0,
+             decorations: int = 0) -> int:
+    """
+    生成NavalArt图纸：每两个相邻截面之间、每两个相邻节点之间用一个可调节船体零件连接（左右对称），
+    武器（带turret节点的零件）沿中线分布，装饰零件左右对称地分布在甲板上
+    :return: 零件数
+    """
+    rng = random.Random(seed)
+    length, beam, depth = 200., 24., 14.
+    sections_data = hull_sections(sections, nodes, length, beam, depth, rng=rng)
+    parts = []
+    for front, back in zip(sections_data[1:], sections_data[:-1]):
+        z_len = front["z"] - back["z"]
+        for (fx0, fy0), (fx1, fy1), (bx0, _), (bx1, _) in zip(
+                front["nodes"][:-1], front["nodes"][1:], back["nodes"][:-1], back["nodes"][1:]):
+            data = {
+                "length": round(z_len, 3), "height": round(fy1 - fy0, 3),
+                "frontWidth": round(fx0 + fx1, 3), "backWidth": round(bx0 + bx1, 3),
+                "frontSpread": 0, "backSpread": 0, "upCurve": 0, "downCurve": 0,
+                "heightScale": 1, "heightOffset": 0,
+            }
+            parts.append(_na_part(0, (0, (fy0 + fy1) / 2, (front["z"] + back["z"]) / 2), data=data))
+    for i in range(weapons):
+        z = (i / max(weapons - 1, 1) * 2 - 1) * length * 0.4
+        rot = (0, 180 if z < 0 else 0, 0)
+        parts.append(_na_part(rng.choice(WEAPON_IDS), (0, depth / 2 + 1.5, z), rot, color="6F6F6F", armor=128,
+                              turret={"manualControl": "False", "evevator": rng.randint(0, 15)}))
+    for i in range(decorations):
+        x, z = rng.uniform(1, beam * 0.4), rng.uniform(-length, length) * 0.45
+        size = rng.uniform(0.5, 2)
+        for side in (1, -1):
+            parts.append(_na_part(rng.choice(DECORATION_IDS), (side * x, depth / 2 + size / 2, z),
+                                  scl=(size, size, size), color="D9AE2E", armor=10))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('<root>\n  <ship author="generator" description="" hornType="1" hornPitch="1" tracerCol="E53D4FFF">\n')
+        f.write("\n".join(parts))
+        f.write("\n  </ship>\n</root>\n")
+    return len(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="生成用于测试的大型工程文件和图纸")
+    parser.add_argument("out_dir", help="输出文件夹")
+    parser.add_argument("--name", default="Synthetic", help="文件名（不含扩展名）")
+    parser.add_argument("--scale", type=float, default=1., help="相对示例工程的规模倍数，未单独指定的数量按此计算")
+    for key in SAMPLE_SIZE:
+        parser.add_argument(f"--{key.replace('_', '-')}", type=int, help=f"示例工程中为 {SAMPLE_SIZE[key]}")
+    parser.add_argument("--weapons", type=int, help=".na 图纸中的武器数量")
+    parser.add_argument("--decorations", type=int, help=".na 图纸中的装饰零件数量（左右对称成对）")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    counts = {}
+    for key, base in SAMPLE_SIZE.items():
+        value = getattr(args, key)
+        if value is None:
+            # 截面和节点按面积平方根放大，组件数量按线性放大
+            factor = math.sqrt(args.scale) if key in ("sections", "nodes") else args.scale
+            value = max(round(base * factor), 1 if key in ("hull_groups", "sections", "nodes") else 0)
+        counts[key] = value
+    weapons = args.weapons if args.weapons is not None else round(8 * args.scale)
+    decorations = args.decorations if args.decorations is not None else round(20 * args.scale)
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    asset_dir = os.path.abspath(os.path.join(args.out_dir, f"{args.name}_assets"))
+    if counts["models"] or counts["ref_images"]:
+        write_assets(asset_dir)
+    naprj_path = os.path.join(args.out_dir, f"{args.name}.naprj")
+    write_naprj(naprj_path, make_project(args.name, asset_dir=asset_dir, seed=args.seed, **counts))
+    na_path = os.path.join(args.out_dir, f"{args.name}.na")
+    parts = write_na(na_path, counts["sections"] * counts["hull_groups"], counts["nodes"], args.seed,
+                     weapons, decorations)
+    print(f"{naprj_path}: " + ", ".join(f"{k}={v}" for k, v in counts.items()))
+    print(f"{na_path}: {parts} parts")
+
+
+if __name__ == '__main__':
+    main()
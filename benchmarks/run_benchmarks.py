@@ -0,0 +1,330 @@
+"""
+端到端基准测试：图纸解析、工程读取、网格生成、法向量、保存、操作栈和离屏渲染
+船体由 project_generator 按指定规模（截面数 × 节点数）合成，结果写入json，便于比较不同提交之间的性能：
+    python benchmarks/run_benchmarks.py --sections 100 --nodes 16 --json after.json --compare before.json
+每个用例单独计时；某个用例失败（例如缺少依赖、没有OpenGL上下文）只记录错误，不影响其他用例。
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(ROOT)
+# 与IDE中设置的源码根目录一致（部分模块使用 import const、import general_widgets...）
+for _path in (os.path.join(ROOT, "utils"), os.path.join(ROOT, "GUI"), ROOT, os.path.dirname(os.path.abspath(__file__))):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np  # noqa: E402
+
+import project_generator  # noqa: E402
+
+CASES: List[Tuple[str, Callable]] = []
+
+
+def case(name: str):
+    """
+    注册用例；被装饰的函数接收Context，返回要计时的无参函数（准备工作不计时）
+    被计时的函数可以返回字典，作为附加指标写入结果
+    """
+    def decorator(func):
+        CASES.append((name, func))
+        return func
+    return decorator
+
+
+class Context:
+    """
+    用例共享的参数和文件，文件在第一次使用时生成
+    """
+
+    def __init__(self, tmp_dir: str, sections: int, nodes: int, frames: int):
+        self.tmp_dir = tmp_dir
+        self.sections = sections
+        self.nodes = nodes
+        self.frames = frames
+        self._naprj_path = None
+        self._na_path = None
+        self._app = None
+
+    @property
+    def naprj_path(self) -> str:
+        if self._naprj_path is None:
+            self._naprj_path = os.path.join(self.tmp_dir, "synthetic.naprj")
+            project_generator.write_naprj(
+                self._naprj_path, project_generator.make_project(sections=self.sections, nodes=self.nodes))
+        return self._naprj_path
+
+    @property
+    def na_path(self) -> str:
+        if self._na_path is None:
+            self._na_path = os.path.join(self.tmp_dir, "synthetic.na")
+            project_generator.write_na(self._na_path, self.sections, self.nodes)
+        return self._na_path
+
+    def hull_sections(self) -> List[dict]:
+        return project_generator.hull_sections(self.sections, self.nodes)
+
+    def app(self):
+        if self._app is None:
+            from PyQt5.QtWidgets import QApplication
+            self._app = QApplication.instance() or QApplication([])
+        return self._app
+
+
+def _section_meshes(ctx: Context):
+    from pyqtOpenGL.items.MeshData import SymetryCylinderMesh
+    sections = ctx.hull_sections()
+    meshes = []
+    for back, front in zip(sections[:-1], sections[1:]):
+        mesh = SymetryCylinderMesh('z')
+        mesh.initPoints(np.array(front["nodes"], dtype=np.float32), np.array(back["nodes"], dtype=np.float32),
+                        front["z"], back["z"])
+        meshes.append(mesh)
+    return meshes
+
+
+@case("na.parse")
+def bench_na_parse(ctx: Context):
+    from ShipRead.na_project import NaDesignReader
+    path = ctx.na_path
+    return lambda: {"parts": len(NaDesignReader(path).Parts)}
+
+
+@case("naprj.load")
+def bench_naprj_load(ctx: Context):
+    from ShipRead.designer_project import DesignerProject, DesignerPrjReader
+    ctx.app()
+    path = ctx.naprj_path
+    return lambda: DesignerPrjReader(None, path, DesignerProject(path)).load()
+
+
+@case("naprj.save")
+def bench_naprj_save(ctx: Context):
+    from ShipRead.designer_project import DesignerProject, DesignerPrjReader
+    ctx.app()
+    path = os.path.join(ctx.tmp_dir, "save.naprj")
+    with open(ctx.naprj_path, "rb") as src, open(path, "wb") as dst:
+        dst.write(src.read())
+    prj = DesignerProject(path)
+    DesignerPrjReader(None, path, prj)
+    return lambda: {"bytes": prj.save() or os.path.getsize(path)}
+
+
+@case("mesh.initVertexes")
+def bench_mesh_init(ctx: Context):
+    meshes = _section_meshes(ctx)
+
+    def run():
+        for mesh in meshes:
+            mesh.initVertexes()
+        return {"vertexes": sum(len(mesh.vertexes) for mesh in meshes)}
+    return run
+
+
+@case("mesh.normals.face")
+def bench_normals_face(ctx: Context):
+    from pyqtOpenGL.items.MeshData import vertex_normal_faceNormal
+    meshes = _section_meshes(ctx)
+    for mesh in meshes:
+        mesh.initVertexes()
+    vertexes = np.concatenate([mesh.vertexes for mesh in meshes])
+    return lambda: vertex_normal_faceNormal(vertexes) is not None and {"vertexes": len(vertexes)}
+
+
+@case("mesh.normals.smooth")
+def bench_normals_smooth(ctx: Context):
+    from pyqtOpenGL.items.MeshData import vertex_normal_smooth
+    meshes = _section_meshes(ctx)
+    for mesh in meshes:
+        mesh.initVertexes()
+    vertexes = np.concatenate([mesh.vertexes for mesh in meshes])
+    indexes = np.arange(len(vertexes), dtype=np.uint32)
+    return lambda: vertex_normal_smooth(vertexes, indexes) is not None and {"vertexes": len(vertexes)}
+
+
+class _ArrayGroup:
+    """
+    只保存节点数组的截面组，用于在不创建网格的情况下测试操作栈本身的开销
+    """
+
+    def __init__(self, array: np.ndarray):
+        self.name = "截面组"
+        self.array = array
+
+    def get_array(self):
+        return self.array
+
+    def set_array(self, array):
+        self.array = np.array(array, dtype=np.float64)
+
+
+@case("operation_stack")
+def bench_operation_stack(ctx: Context):
+    from operation.basic_op import OperationStack
+    from operation.section_op import SectionGroupSnapshotOperation
+    ctx.app()
+    editor = SimpleNamespace(gl_widget=SimpleNamespace(paintGL_outside=lambda: None),
+                             show_statu_=lambda *args, **kwargs: None)
+    array = np.array([section["nodes"] for section in ctx.hull_sections()], dtype=np.float64)
+    ops = 200
+
+    def run():
+        stack = OperationStack(editor, coalesce_window=0)
+        stack.init_stack()
+        group = _ArrayGroup(array.copy())
+        for i in range(ops):
+            target = group.array.copy()
+            target[i % len(target)] *= 1.01
+            stack.execute(SectionGroupSnapshotOperation(group, target))
+        for _ in range(ops):
+            stack.undo()
+        for _ in range(ops):
+            stack.redo()
+        return {"operations": ops * 3, "nbytes": stack.nbytes}
+    return run
+
+
+@case("render.frame")
+def bench_render_frame(ctx: Context):
+    from pyqtOpenGL.GLHeadlessView import GLHeadlessView, DrawCallCounter, load_project, orbit_path
+    ctx.app()
+    view = GLHeadlessView(1280, 720)
+    load_project(view, ctx.naprj_path)
+    path = orbit_path((0, 0, 0), 150, 40, ctx.frames)
+    counter = DrawCallCounter().__enter__()  # 在整个测试期间统计，进程结束前不需要恢复
+    state = {"i": 0}
+
+    def run():
+        view._set_camera(*path[state["i"] % len(path)])  # noqa
+        state["i"] += 1
+        return view.render_frame(counter)._asdict()
+    return run
+
+
+def time_case(func: Callable, repeat: int) -> dict:
+    func()  # 预热
+    times, extra = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extra = func()
+        times.append((time.perf_counter() - start) * 1000)
+    result = {
+        "min_ms": min(times), "median_ms": statistics.median(times), "mean_ms": statistics.fmean(times),
+        "repeat": repeat,
+    }
+    if isinstance(extra, dict):
+        result["extra"] = extra
+    return result
+
+
+def cv2_results(repeat: int) -> Dict[str, dict]:
+    """
+    ReplaceCV2 的基准测试（bench_cv2_replacements.py），附带之前实现的耗时作为对照
+    """
+    import bench_cv2_replacements
+    return {f"cv2.{name}": {"min_ms": cur, "baseline_ms": base, "repeat": repeat}
+            for name, base, cur in bench_cv2_replacements.run(repeat=repeat)}
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sections: int = 50, nodes: int = 12, frames: int = 60, repeat: int = 5, only: List[str] = None) -> dict:
+    """
+    运行基准测试
+    :param only: 只运行名称以这些前缀开头的用例
+    :return: {"meta": {...}, "results": {用例: {"min_ms", "median_ms", ...} 或 {"error": ...}}}
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        ctx = Context(tmp_dir, sections, nodes, frames)
+        for name, setup in CASES:
+            if only and not any(name.startswith(prefix) for prefix in only):
+                continue
+            try:
+                results[name] = time_case(setup(ctx), repeat)
+            except Exception as e:  # noqa
+                results[name] = {"error": f"{type(e).__name__}: {e}", "traceback": traceback.format_exc()}
+        if not only or any("cv2".startswith(prefix) or prefix.startswith("cv2") for prefix in only):
+            try:
+                results.update(cv2_results(repeat))
+            except Exception as e:  # noqa
+                results["cv2"] = {"error": f"{type(e).__name__}: {e}"}
+    return {
+        "meta": {
+            "commit": _git_commit(), "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(), "platform": platform.platform(), "processor": platform.processor(),
+            "params": {"sections": sections, "nodes": nodes, "frames": frames, "repeat": repeat},
+        },
+        "results": results,
+    }
+
+
+def compare(old: dict, new: dict, threshold: float = 1.1) -> List[Tuple[str, float, float, float, bool]]:
+    """
+    比较两次结果的最短耗时
+    :param threshold: 新旧耗时之比超过该值时视为性能下降
+    :return: [(用例, 旧ms, 新ms, 比值, 是否下降)]
+    """
+    rows = []
+    for name, result in new["results"].items():
+        before = old["results"].get(name, {})
+        if "min_ms" not in result or "min_ms" not in before:
+            continue
+        ratio = result["min_ms"] / max(before["min_ms"], 1e-9)
+        rows.append((name, before["min_ms"], result["min_ms"], ratio, ratio > threshold))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="端到端基准测试")
+    parser.add_argument("--sections", type=int, default=50, help="合成船体的截面数")
+    parser.add_argument("--nodes", type=int, default=12, help="每个截面的节点数")
+    parser.add_argument("--frames", type=int, default=60, help="渲染用例的相机路径帧数")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", nargs="*", help="只运行名称以这些前缀开头的用例")
+    parser.add_argument("--json", help="结果输出路径")
+    parser.add_argument("--compare", help="与之前的结果比较")
+    parser.add_argument("--threshold", type=float, default=1.1, help="判定为性能下降的耗时比值")
+    args = parser.parse_args()
+
+    result = run(args.sections, args.nodes, args.frames, args.repeat, args.only)
+    print(f"commit {result['meta']['commit']}  sections={args.sections} nodes={args.nodes}")
+    for name, item in result["results"].items():
+        if "error" in item:
+            print(f"{name:<28}error: {item['error']}")
+        else:
+            print(f"{name:<28}{item['min_ms']:>10.2f} ms")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            old = json.load(f)
+        print(f"\ncompare with {old['meta'].get('commit')}")
+        regressed = False
+        for name, before, after, ratio, slower in compare(old, result, args.threshold):
+            regressed |= slower
+            print(f"{name:<28}{before:>10.2f}{after:>10.2f}{ratio:>8.2f}x{'  REGRESSION' if slower else ''}")
+        sys.exit(1 if regressed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -45,7 +45,7 @@ NOFOLLOW_IMPORT_TO = [
 # 包含的数据目录
 INCLUDE_PACKAGE_DATA = ['sample_projects', 'resources']
 # 包含的文件
-INCLUDE_DATA_FILES = []
+INCLUDE_DATA_FILES = ['GUI/UI_design/images.bin=GUI/UI_design/images.bin']
 
 """
 其他编译参数（可忽略）
@@ -31,7 +31,10 @@ class ConfigHandler:
             "CheckUpdate": True,
             "Guided": False,
             "ExitAfterClosingEditor": False,
-            "OperationStackMaxLength": 10000
+            "OperationStackMaxLength": 10000,
+            "OperationStackMaxBytes": 256 * 1024 * 1024,
+            "PerfTrace": False,  # 是否记录性能追踪，程序退出时导出为perf_trace.json
+            "FrameStatsOverlay": False  # 是否在3D视图左上角显示帧耗时和GPU耗时的p50/p95/p99
         },
         "Theme": {
             "ThemeName": "Night",
@@ -13,10 +13,12 @@ from PyQt5.QtWidgets import QFileDialog, QAction
 
 from ShipRead.designer_project import *
 from utils.funcs_utils import not_implemented, snake_to_camel
+from utils.texture_cache import TextureCache
+from utils.thumbnail_cache import ThumbnailCache
 from main_logger import Log, StatusBarHandler
 from operation import OperationStack
 from operation.basic_op import Operation
-from path_lib import DESKTOP_PATH
+from path_lib import DESKTOP_PATH, THUMBNAIL_PATH
 
 
 def update_structure(action):
@@ -212,8 +214,19 @@ class MainEditor(MainEditorGUI):
         保存当前工程
         """
         self._current_prj.save() if self._current_prj else None
+        self.save_thumbnail()
         self.show_statu_(f"保存工程：{self._current_prj.project_name}", "success")
 
+    def save_thumbnail(self):
+        """
+        截取当前视图，作为开始界面中最近工程的缩略图
+        """
+        if not self._current_prj:
+            return
+        image = self.gl_widget.grabFramebuffer()
+        if not ThumbnailCache(THUMBNAIL_PATH).store(self._current_prj.path, image):
+            Log().warning(self.TAG, f"缩略图保存失败：{self._current_prj.path}")
+
     @not_implemented
     def save_as_prj(self):
         """
@@ -270,7 +283,8 @@ class MainEditor(MainEditorGUI):
         """
 
         # 操作管理栈
-        self.operationStack = OperationStack(self, max_length=configHandler.get_config("OperationStackMaxLength"))
+        self.operationStack = OperationStack(self, max_length=configHandler.get_config("OperationStackMaxLength"),
+                                             max_bytes=configHandler.get_config("OperationStackMaxBytes"))
         self.operationStack.init_stack()
         super().__init__(gl_widget, logger)
         # 创建内存监控线程
@@ -320,7 +334,7 @@ class MainEditor(MainEditorGUI):
         绑定信号和函数
         """
         # 内存监控线程
-        self.memoryThread.memory_updated_s.connect(self.memory_widget.set_values)
+        self.memoryThread.memory_updated_s.connect(self.update_memory)
         # self.memoryThread.cpu_updated_s.connect(self.update_cpu)
         # 选择船体元素后，显示编辑器
         self.gl_widget.clear_selected_items.connect(self.edit_tab.clear_editing_widget)
@@ -331,6 +345,19 @@ class MainEditor(MainEditorGUI):
         self.gl_widget.keyPressEvent = self.keyPressEvent
         self.gl_widget.keyReleaseEvent = self.keyReleaseEvent
 
+    def update_memory(self, memory_mb: int):
+        """
+        更新内存显示控件，包括进程内存、操作栈的估算内存和共享纹理的内存
+        :param memory_mb: 进程内存（MB）
+        """
+        self.memory_widget.set_values(memory_mb)
+        stack_mb = self.operationStack.nbytes / (1024 * 1024)
+        self.memory_widget.set_detail(
+            f"进程内存：{memory_mb}M\n操作栈：{self.operationStack.length} 个操作，约 {stack_mb:.2f}M / "
+            f"{self.operationStack.max_bytes // (1024 * 1024)}M\n"
+            f"纹理：{TextureCache.count()} 张，内存 {TextureCache.nbytes() / (1024 * 1024):.2f}M，"
+            f"显存 {TextureCache.gpu_nbytes() / (1024 * 1024):.2f}M")
+
     def keyPressEvent(self, ev, qKeyEvent=None) -> None:
         """
         键盘事件，显示快捷键指南
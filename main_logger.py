@@ -2,15 +2,21 @@
 日志模块
 包括：
 1. 日志类Log，用于记录日志信息，包括info、warning、error等
-2. 状态栏处理类StatusBarHandler，用于处理状态栏信息
+2. 日志写入类LogWriter，在后台线程中批量写入日志文件和控制台，并按大小轮转日志文件
+3. 状态栏处理类StatusBarHandler，用于处理状态栏信息
 
 """
+import atexit
+import os
+import queue
 import sys
+import threading
 import time
 from contextlib import contextmanager
+from typing import Optional
 
-from PyQt5.QtCore import QMutex, pyqtSignal, QObject
-from utils import singleton, mutexLock, now
+from PyQt5.QtCore import pyqtSignal, QObject
+from utils import singleton, now
 
 
 def getTagStr(tag):
@@ -32,10 +38,256 @@ def getInfoStr(info):
     return "\n".join(info)
 
 
+class LogWriter:
+    """
+    后台日志写入线程
+    调用方只把未格式化的记录放入无锁队列（queue.SimpleQueue），格式化、控制台输出和文件写入都在后台线程中批量完成；
+    错误记录放入后等待写入文件才返回，程序随后崩溃或被强制结束（os._exit）时不会丢失；
+    日志文件超过max_bytes后轮转为编号文件：logging.txt -> logging.1.txt -> logging.2.txt ...
+    """
+    BATCH_SIZE = 512  # 每批最多处理的记录数
+    ERROR_FLUSH_TIMEOUT = 1.  # 错误记录等待写入文件的最长时间（秒）
+    _FLUSH = "FLUSH"
+    _STOP = "STOP"
+
+    def __init__(self, path, stdout=None, stderr=None, max_bytes=1024 * 1024, backup_count=5, flush_interval=0.5):
+        """
+        :param path: 日志文件路径
+        :param stdout: 普通日志的控制台输出流，None则不输出
+        :param stderr: 错误日志的控制台输出流，None则不输出
+        :param max_bytes: 单个日志文件的最大字节数
+        :param backup_count: 保留的历史日志文件数量
+        :param flush_interval: 没有新记录时，缓冲区最长的等待刷新时间（秒）
+        """
+        self.path = path
+        self._stdout = stdout
+        self._stderr = stderr
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+        self._queue = queue.SimpleQueue()
+        self._sync_lock = threading.Lock()
+        self._file = None
+        self._file_size = 0
+        self._open_file()
+        self._thread = threading.Thread(target=self._run, name="LogWriter", daemon=True)
+        self._thread.start()
+
+    def put(self, record: tuple):
+        """
+        放入一条记录：(时间戳, 级别字符串, 标签, 信息, 是否为错误)
+        普通记录不阻塞，错误记录等待写入文件后返回
+        """
+        self._queue.put(record)
+        if record[4]:
+            self.flush(timeout=self.ERROR_FLUSH_TIMEOUT)
+
+    def write(self, string: str, is_error=False):
+        """
+        放入一条已经格式化的字符串，同 put
+        """
+        self.put((None, None, None, string, is_error))
+
+    def flush(self, wait=True, timeout: Optional[float] = 5.):
+        """
+        请求把队列中的记录全部写入文件
+        :param wait: 是否等待写入完成
+        :param timeout: 等待的最长时间
+        """
+        if not self._thread.is_alive():
+            # 后台线程已结束（例如atexit中close之后仍有记录），在调用线程中直接写入
+            self._write_remaining()
+            return
+        event = threading.Event()
+        self._queue.put((self._FLUSH, event))
+        if wait and threading.current_thread() is not self._thread:
+            event.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 5.):
+        """
+        写入剩余的记录，然后结束后台线程
+        """
+        if not self._thread.is_alive():
+            return
+        event = threading.Event()
+        self._queue.put((self._STOP, event))
+        event.wait(timeout)
+
+    def _write_remaining(self):
+        """
+        后台线程结束后，把队列中剩余的记录同步写入文件
+        """
+        with self._sync_lock:
+            strings = []
+            try:
+                while True:
+                    item = self._queue.get_nowait()
+                    if item[0] in (self._FLUSH, self._STOP):
+                        item[1].set()
+                    else:
+                        strings.append((self.format_record(item), item[4]))
+            except queue.Empty:
+                pass
+            if not strings:
+                return
+            if self._file is None:
+                self._open_file()
+            self._write_batch(strings)
+            self._flush_streams()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    @staticmethod
+    def format_record(record: tuple) -> str:
+        timestamp, level, tag, info, _ = record
+        if level is None:
+            return info
+        time_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
+        return f"{time_str}  {level}{getTagStr(tag)}{getInfoStr(info)}\n"
+
+    def _backup_path(self, index: int) -> str:
+        root, ext = os.path.splitext(self.path)
+        return f"{root}.{index}{ext}"
+
+    def _open_file(self):
+        try:
+            self._file = open(self.path, "a", encoding="utf-8")
+            self._file_size = self._file.tell()
+        except OSError as e:
+            self._file_error("打开日志文件失败", e)
+        if self._file is not None and self._file_size > self.max_bytes:
+            self._rotate()
+
+    def _file_error(self, message: str, e: OSError):
+        """
+        文件出错（被占用、磁盘已满等）后不再写入文件，只输出到控制台，后台线程继续运行
+        """
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+        self._file = None
+        self._file_size = 0
+        if self._stderr:
+            try:
+                self._stderr.write(f"{now()}  [ERROR]   {getTagStr('Log')}{message}：{e}\n")
+            except (OSError, ValueError):
+                pass
+
+    def _rotate(self):
+        """
+        日志文件超过大小后，依次后移编号文件，最旧的文件被删除
+        """
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+        try:
+            if self.backup_count > 0:
+                for i in range(self.backup_count - 1, 0, -1):
+                    src = self._backup_path(i)
+                    if os.path.exists(src):
+                        os.replace(src, self._backup_path(i + 1))
+                os.replace(self.path, self._backup_path(1))
+            else:
+                os.remove(self.path)
+        except OSError:
+            pass
+        try:
+            self._file = open(self.path, "a", encoding="utf-8")
+        except OSError as e:
+            self._file = None
+            self._file_error("轮换后打开日志文件失败", e)
+            return
+        self._file_size = 0
+
+    def _write_batch(self, strings):
+        """
+        写入一批格式化后的字符串
+        :param strings: [(字符串, 是否为错误)]，普通信息输出到stdout，错误输出到stderr，全部写入文件
+        """
+        for stream, is_error in ((self._stdout, False), (self._stderr, True)):
+            if stream is None:
+                continue
+            text = "".join(string for string, err in strings if err == is_error)
+            if text:
+                try:
+                    stream.write(text)
+                except (OSError, ValueError):
+                    pass
+        if self._file is None:
+            return
+        for string, _ in strings:
+            nbytes = len(string.encode("utf-8"))
+            if self._file_size + nbytes > self.max_bytes and self._file_size > 0:
+                self._rotate()
+                if self._file is None:
+                    return
+            try:
+                self._file.write(string)
+            except OSError as e:
+                self._file_error("写入日志文件失败", e)
+                return
+            self._file_size += nbytes
+
+    def _flush_streams(self):
+        for stream in (self._stdout, self._stderr, self._file):
+            if stream is not None:
+                try:
+                    stream.flush()
+                except (OSError, ValueError):
+                    pass
+
+    def _run(self):
+        dirty = False  # 是否有未刷新的数据
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval if dirty else None)
+            except queue.Empty:
+                self._flush_streams()
+                dirty = False
+                continue
+            # 取出队列中已有的记录，批量处理
+            batch = [item]
+            try:
+                while len(batch) < self.BATCH_SIZE:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            strings = []
+            events = []
+            flush = stop = False
+            for item in batch:
+                if item[0] == self._FLUSH:
+                    events.append(item[1])
+                    flush = True
+                elif item[0] == self._STOP:
+                    events.append(item[1])
+                    stop = True
+                else:
+                    strings.append((self.format_record(item), item[4]))
+                    flush = flush or item[4]  # 错误信息立即刷新
+            self._write_batch(strings)
+            dirty = True
+            if flush or stop:
+                self._flush_streams()
+                dirty = False
+            for event in events:
+                event.set()
+            if stop:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                return
+
+
 @singleton
 class Log:
-    write_mutex = QMutex()
-    FILE_MAX_SIZE = 1024 * 1024  # 1MB
+    FILE_MAX_SIZE = 1024 * 1024  # 1MB，超出后轮转到编号文件
+    BACKUP_COUNT = 5  # 保留的历史日志文件数量
     LINE_LENGTH = 150
     SEPARATOR = "=" * LINE_LENGTH
     INFO = "[INFO]    "
@@ -48,58 +300,33 @@ class Log:
         self._stdout = sys.stdout
         self._stderr = sys.stderr
         self.path = path
-        self._init_log_file()
-        logging_time = now()
-        self.addString = (f"\n{self.SEPARATOR}\n"
-                          f"{logging_time}  {self.INFO}{getTagStr('Log')}程序启动，日志启动\n")
-
-    @mutexLock("write_mutex")
-    def _init_log_file(self):
-        with open(self.path, "a", encoding="utf-8") as f:
-            # 检测文件大小
-            f.seek(0, 2)
-            # 限制文件大小
-            if f.tell() > self.FILE_MAX_SIZE:
-                f.truncate(0)  # 清空文件
-                # TODO: 可以尝试上传
-                f.write(f"{now()}  {self.INFO}{getTagStr('Log')}日志文件超过1MB，已清空\n")
-
-    @mutexLock("write_mutex")
+        self._writer = LogWriter(path, self._stdout, self._stderr, self.FILE_MAX_SIZE, self.BACKUP_COUNT)
+        atexit.register(self._writer.close)
+        self._writer.write(f"\n{self.SEPARATOR}\n")
+        self.info('Log', "程序启动，日志启动")
+
     def error(self, trace, tag, info):
-        infoString = getInfoStr(trace + '\n' + info)
-        string = f"{now()}  {self.ERROR}{getTagStr(tag)}{infoString}\n"
-        self.addString += string
-        # 使用sys.stderr输出
-        self._stderr.write(string)
-        self._stderr.flush()
-        self.save()
-
-    @mutexLock("write_mutex")
+        """
+        错误信息写入stderr和文件，等待写入完成后返回（程序随后崩溃时不会丢失）
+        """
+        self._writer.put((time.time(), self.ERROR, tag, trace + '\n' + info, True))
+
     def warning(self, tag, info):
-        string = f"{now()}  {self.WARNING}{getTagStr(tag)}{getInfoStr(info)}\n"
-        self.addString += string
-        self._stdout.write(string)
-        self._stdout.flush()
+        self._writer.put((time.time(), self.WARNING, tag, info, False))
 
-    @mutexLock("write_mutex")
     def info(self, tag, info):
-        string = f"{now()}  {self.INFO}{getTagStr(tag)}{getInfoStr(info)}\n"
-        self.addString += string
-        self._stdout.write(string)
-        self._stdout.flush()
+        self._writer.put((time.time(), self.INFO, tag, info, False))
+
+    def flush(self):
+        """
+        等待所有日志写入文件
+        """
+        self._writer.flush()
 
-    @mutexLock("write_mutex")
     def save(self):
-        self._stdout.flush()
-        self._stderr.flush()
-        self.addString += (f"{now()}  {self.INFO}{getTagStr('Log')}保存日志，程序退出\n"
-                           f"{self.SEPARATOR}\n")
-        try:
-            with open(self.path, "a", encoding="utf-8") as f:
-                f.write(self.addString)
-                self.addString = ''
-        except Exception as e:
-            self._stderr.write(f"{now()}  {self.ERROR}{getTagStr('Log')}保存日志失败：{e}\n")
+        self.info('Log', "保存日志，程序退出")
+        self._writer.write(f"{self.SEPARATOR}\n")
+        self._writer.flush()
 
     @contextmanager
     def redirectOutput(self, tag):
@@ -2,9 +2,12 @@
 """
 操作类基类，以及操作栈类
 """
+import sys
+import time
 from abc import abstractmethod
 from typing import List, Union, Optional
 
+import numpy as np
 from PyQt5.QtCore import QMutex
 from utils.funcs_utils import operationMutexLock
 
@@ -15,7 +18,7 @@ class Operation:
     """
     def __init__(self):
         self.name = f"未命名操作 {self.__class__.__name__}"
-        pass
+        self._nbytes: Optional[int] = None
 
     @abstractmethod
     def execute(self):
@@ -41,30 +44,178 @@ class Operation:
         """
         self.execute()
 
+    def merge(self, operation: 'Operation') -> bool:
+        """
+        尝试将紧随其后的同类操作合并到本操作中（用于拖动、滑块等连续编辑），由operation_stack调用。
+        合并后本操作的撤回目标保持不变，重做目标变为operation的目标。
+        :param operation: 已经执行过的新操作
+        :return: 是否合并成功，默认不合并
+        """
+        return False
+
+    def estimate_size(self) -> int:
+        """
+        估算操作对象占用的字节数，用于操作栈的内存预算。
+        默认只统计操作自身持有的数据（浅层统计），被引用的组件对象不属于操作本身；
+        若子类持有大块数据（例如快照数组），请覆写该方法。
+        :return: 字节数
+        """
+        size = sys.getsizeof(self)
+        for value in vars(self).values():
+            if isinstance(value, np.ndarray):
+                size += value.nbytes
+            elif isinstance(value, (list, tuple)):
+                size += sys.getsizeof(value) + sum(
+                    v.nbytes if isinstance(v, np.ndarray) else sys.getsizeof(v) for v in value)
+            else:
+                size += sys.getsizeof(value)
+        return size
+
+    @property
+    def nbytes(self) -> int:
+        """
+        操作占用的字节数（首次访问时估算并缓存）
+        """
+        if getattr(self, "_nbytes", None) is None:
+            self._nbytes = self.estimate_size()
+        return self._nbytes
+
 
 class OperationStack:
+    """
+    基于环形缓冲区的操作栈。
+    逻辑索引0始终为“底部”状态（无法再撤回），current_index为当前状态的逻辑索引；
+    当长度或内存超出限制时，从最旧的操作开始淘汰，不需要复制整个列表。
+    在时间窗口内连续执行的同类操作（同一对象）会被合并为一个撤回步骤，合并期间只在批次结束时重绘一次。
+    """
     operationMutex = QMutex()
+    DEFAULT_MAX_LENGTH = 10000
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256MB
+    DEFAULT_COALESCE_WINDOW = 0.5  # 秒
 
-    def __init__(self, main_editor, max_length: int = 10000):
+    def __init__(self, main_editor, max_length: int = DEFAULT_MAX_LENGTH, max_bytes: int = DEFAULT_MAX_BYTES,
+                 coalesce_window: float = DEFAULT_COALESCE_WINDOW):
         """
         在编辑器对象中初始化，而不是在操作对象中初始化
         管理操作，以撤回和重做
         :param main_editor: 父窗口
         :param max_length: 栈的最大长度，从配置文件中读取
+        :param max_bytes: 栈的最大内存（字节），从配置文件中读取
+        :param coalesce_window: 合并连续操作的时间窗口（秒），小于等于0则不合并
         """
         self.main_editor = main_editor
-        # 初始化一个定长的状态栈
-        self.max_length = max_length if max_length > 0 else 10000
+        self.max_length = max_length if max_length and max_length > 0 else self.DEFAULT_MAX_LENGTH
+        self.max_bytes = max_bytes if max_bytes and max_bytes > 0 else self.DEFAULT_MAX_BYTES
+        # 定长的环形缓冲区
         self.stateStack: List[Union[Operation, None]] = [None] * self.max_length
+        self._start = 0  # 逻辑索引0在缓冲区中的物理位置
+        self._length = 0  # 缓冲区中有效操作的数量（包括可重做的操作）
+        self._total_bytes = 0  # 缓冲区中所有操作的估算字节数
         self.current_index = None
+        # 连续操作的合并
+        self.coalesce_window = coalesce_window
+        self._last_execute_time: Optional[float] = None
 
     def init_stack(self):
         """
         初始化状态
         :return:
         """
-        self.stateStack[0] = Operation()
+        self.stateStack = [None] * self.max_length
+        self._start = 0
+        self._length = 0
+        self._total_bytes = 0
+        self._push(Operation())
         self.current_index = 0  # 当前状态的索引
+        self._end_batch()
+
+    def _physical(self, index: int) -> int:
+        """
+        逻辑索引转换为缓冲区中的物理索引
+        """
+        return (self._start + index) % self.max_length
+
+    def _get(self, index: int) -> Optional[Operation]:
+        if index < 0 or index >= self._length:
+            return None
+        return self.stateStack[self._physical(index)]
+
+    def _push(self, operation: Operation):
+        """
+        在末尾添加操作，调用前需保证缓冲区未满
+        """
+        self.stateStack[self._physical(self._length)] = operation
+        self._length += 1
+        self._total_bytes += operation.nbytes
+
+    def _pop_back(self):
+        """
+        移除末尾的操作（用于丢弃可重做的操作）
+        """
+        self._length -= 1
+        physical = self._physical(self._length)
+        self._total_bytes -= self.stateStack[physical].nbytes
+        self.stateStack[physical] = None
+
+    def _pop_front(self):
+        """
+        淘汰最旧的操作，原来的逻辑索引1成为新的底部状态
+        """
+        self._total_bytes -= self.stateStack[self._start].nbytes
+        self.stateStack[self._start] = None
+        self._start = (self._start + 1) % self.max_length
+        self._length -= 1
+        self.current_index -= 1
+
+    def _try_merge(self, operation: Operation) -> bool:
+        """
+        尝试将已执行的operation合并到栈顶操作中
+        """
+        now_ = time.monotonic()
+        last_time, self._last_execute_time = self._last_execute_time, now_
+        if last_time is None or now_ - last_time > self.coalesce_window:
+            return False
+        # 只有栈顶是最新的操作（没有可重做的操作）时才能合并
+        if self.current_index == 0 or self._length != self.current_index + 1:
+            return False
+        top = self._get(self.current_index)
+        if not top.merge(operation):
+            return False
+        self._total_bytes -= top.nbytes
+        top._nbytes = None
+        self._total_bytes += top.nbytes
+        return True
+
+    def _evict_over_budget(self) -> bool:
+        """
+        超出内存预算时淘汰最旧的操作，但至少保留栈顶的操作
+        :return: 是否淘汰了操作
+        """
+        evicted = False
+        while self._total_bytes > self.max_bytes and self.current_index > 1:
+            self._pop_front()
+            evicted = True
+        return evicted
+
+    def _end_batch(self):
+        """
+        结束当前的合并批次，之后的操作不会再合并到栈顶操作中
+        """
+        self._last_execute_time = None
+
+    @property
+    def length(self) -> int:
+        """
+        可撤回的操作数量
+        """
+        return self.current_index if self.current_index else 0
+
+    @property
+    def nbytes(self) -> int:
+        """
+        操作栈中所有操作的估算字节数
+        """
+        return self._total_bytes
 
     @operationMutexLock
     def execute(self, operation: Operation):
@@ -76,12 +227,29 @@ class OperationStack:
         if self.current_index is None:
             raise Exception("OperationStack not initialized, please call init_stack() first")
         operation.execute()
-        if self.current_index == self.max_length - 1:
-            self.stateStack = self.stateStack[1:] + [operation]
-            self.main_editor.show_statu_("操作栈已满", "warning")
+        if self.coalesce_window > 0 and self._try_merge(operation):
+            # 合并后的操作可能变大，同样需要满足内存预算
+            top = self._get(self.current_index)
+            if self._evict_over_budget():
+                self.main_editor.show_statu_(f"操作栈已满，已淘汰最早的操作\t{top.name}", "warning")
+            else:
+                self.main_editor.show_statu_(f"{top.name}\t{self.current_index + 1}", "process")
+            # 连续拖动时不同步重绘，而是请求一次重绘，由Qt合并到下一帧，拖动过程中仍然每帧都有反馈
+            self.main_editor.gl_widget.update()
+            return
+        # 丢弃所有可重做的操作
+        while self._length > self.current_index + 1:
+            self._pop_back()
+        evicted = False
+        if self._length == self.max_length:
+            self._pop_front()
+            evicted = True
+        self._push(operation)
+        self.current_index += 1
+        evicted = self._evict_over_budget() or evicted
+        if evicted:
+            self.main_editor.show_statu_(f"操作栈已满，已淘汰最早的操作\t{operation.name}", "warning")
         else:
-            self.current_index += 1
-            self.stateStack[self.current_index] = operation
             self.main_editor.show_statu_(f"{operation.name}\t{self.current_index + 1}", "process")
         self.main_editor.gl_widget.paintGL_outside()
 
@@ -90,13 +258,15 @@ class OperationStack:
         """
         撤回
         """
+        self._end_batch()
         if self.current_index > 0:
+            operation = self._get(self.current_index)
             try:
-                self.stateStack[self.current_index].undo()
+                operation.undo()
             except Exception as e:
                 self.main_editor.show_statu_(f"无效的撤回操作：{e}", "warning")
             self.main_editor.show_statu_(
-                f"Ctrl+Z 撤回 {self.stateStack[self.current_index].name}\t{self.current_index}", "process")
+                f"Ctrl+Z 撤回 {operation.name}\t{self.current_index}", "process")
             self.current_index -= 1
         else:
             self.main_editor.show_statu_("Ctrl+Z 没有更多的历史记录", "warning")
@@ -108,42 +278,60 @@ class OperationStack:
         """
         重做命令
         """
-        if self.current_index is not None and self.stateStack[self.current_index + 1] is not None:
+        self._end_batch()
+        if self.current_index is not None and self._get(self.current_index + 1) is not None:
             self.current_index += 1
+            operation = self._get(self.current_index)
             try:
-                self.stateStack[self.current_index].redo()
+                operation.redo()
             except Exception as e:
                 self.main_editor.show_statu_(f"无效的重做操作：{e}", "warning")
             self.main_editor.show_statu_(
-                f"Ctrl+Shift+Z 重做 {self.stateStack[self.current_index].name}\t{self.current_index + 1}",
+                f"Ctrl+Shift+Z 重做 {operation.name}\t{self.current_index + 1}",
                 "process")
         else:
             self.main_editor.show_statu_("Ctrl+Shift+Z 没有更多的历史记录", "warning")
         self.main_editor.gl_widget.paintGL_outside()
 
+    @operationMutexLock
     def update_size(self, size: int):
+        """
+        修改栈的最大长度，保留最新的操作
+        :param size: 新的最大长度
+        """
         if size < 5 or size > 2 ** 16:
             raise ValueError("Size should be in [5, 2^16]")
-        if size < self.max_length:
-            self.stateStack = self.stateStack[self.max_length - size:]
-            self.max_length = size
-        else:
-            self.stateStack = [None] * (size - self.max_length) + self.stateStack
-            self.max_length = size
-        self.current_index = size - 1
+        # 超出新长度的旧操作被淘汰
+        while self._length > size:
+            if self.current_index > 0:
+                self._pop_front()
+            else:
+                self._pop_back()
+        operations = [self._get(i) for i in range(self._length)]
+        self.max_length = size
+        self.stateStack = operations + [None] * (size - len(operations))
+        self._start = 0
+
+    @operationMutexLock
+    def update_max_bytes(self, max_bytes: int):
+        """
+        修改栈的内存预算，超出部分从最旧的操作开始淘汰
+        :param max_bytes: 新的内存预算（字节）
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes should be positive")
+        self.max_bytes = max_bytes
+        self._evict_over_budget()
 
     @operationMutexLock
     def clear(self, length: Optional[int] = None):
         if length is None:
-            self.stateStack = [None] * self.max_length
             self.init_stack()
             self.main_editor.show_statu_("操作栈已清空", "warning")
             self.main_editor.gl_widget.paintGL_outside()
         else:
             # 清空撤回栈的前length个操作（操作依次前移）
-            for i in range(self.current_index - length + 1):
-                self.stateStack[i] = self.stateStack[i + length]
-            self.current_index = self.current_index - length
-            for i in range(length):
-                self.stateStack[self.current_index + i + 1] = None
+            length = min(length, self.current_index)
+            for _ in range(length):
+                self._pop_front()
             self.main_editor.show_statu_(f"撤回栈已清空 {length} 个操作", "warning")
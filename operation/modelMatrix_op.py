@@ -27,6 +27,14 @@ class MoveToOperation(Operation):
     def execute(self):
         self.sectionHandler.setPos(self.target_pos)
 
+    def merge(self, operation):
+        if type(operation) is not MoveToOperation or operation.sectionHandler is not self.sectionHandler:
+            return False
+        self.name = operation.name
+        self.target_pos = operation.target_pos
+        self.edits = operation.edits
+        return True
+
     def undo(self):
         self.sectionHandler.setPos(self.origin_pos)
         self.edits[0].setValue(self.origin_pos.x())
@@ -61,6 +69,15 @@ class MoveOperation(Operation):
     def execute(self):
         self.sectionHandler.addPos(self.move_vec)
 
+    def merge(self, operation):
+        if type(operation) is not MoveOperation or operation.sectionHandler is not self.sectionHandler:
+            return False
+        # 移动向量累加，重做时从origin_pos一次移动到位
+        self.move_vec = self.move_vec + operation.move_vec
+        self.name = f"移动 {self.sectionHandler.name} ({round(self.move_vec.x(), 4)}, {round(self.move_vec.y())}, {round(self.move_vec.z())})"
+        self.edits = operation.edits
+        return True
+
     def undo(self):
         self.sectionHandler.setPos(self.origin_pos)
         self.edits[0].setValue(self.origin_pos.x())
@@ -95,6 +112,14 @@ class RotateOperation(Operation):
     def execute(self):
         self.setctionHandler.setRot(self.target_rot)
 
+    def merge(self, operation):
+        if type(operation) is not RotateOperation or operation.setctionHandler is not self.setctionHandler:
+            return False
+        self.name = operation.name
+        self.target_rot = operation.target_rot
+        self.edits = operation.edits
+        return True
+
     def undo(self):
         self.setctionHandler.setRot(self.origin_rot)
         self.edits[0].setValue(self.origin_rot[0])
@@ -129,6 +154,14 @@ class ScaleOperation(Operation):
     def execute(self):
         self.sectionHandler.setScl(self.target_scl)
 
+    def merge(self, operation):
+        if type(operation) is not ScaleOperation or operation.sectionHandler is not self.sectionHandler:
+            return False
+        self.name = operation.name
+        self.target_scl = operation.target_scl
+        self.edits = operation.edits
+        return True
+
     def undo(self):
         self.sectionHandler.setScl(self.origin_scl)
         self.edits[0].setValue(self.origin_scl[0])
@@ -1,6 +1,11 @@
 """
-
+截面相关的操作
 """
+import sys
+import zlib
+
+import numpy as np
+
 from .basic_op import Operation
 
 
@@ -42,18 +47,126 @@ class SectionZMoveOperation(Operation):
         self.edits = edits
 
     def execute(self):
+        # 重绘由operation_stack负责（连续拖动时合并为一次重绘）
         self.sectionHandler.setZ(self.target_posZ)
-        # 通知gl_widget更新
-        self.sectionHandler.hullProject.gl_widget.paintGL_outside()
+
+    def merge(self, operation):
+        if type(operation) is not SectionZMoveOperation or operation.sectionHandler is not self.sectionHandler:
+            return False
+        self.name = operation.name
+        self.target_posZ = operation.target_posZ
+        self.edits = operation.edits
+        return True
 
     def undo(self):
         self.sectionHandler.setZ(self.origin_pos, undo=True)
         for edit in self.edits:
             edit.setValue(self.origin_pos)
-        # 通知gl_widget更新
-        self.sectionHandler.hullProject.gl_widget.paintGL_outside()
 
     def redo(self):
         for edit in self.edits:
             edit.setValue(self.target_posZ)
         self.execute()
+
+
+class SectionNodeMoveOperation(Operation):
+    def __init__(self, sectionHandler, node, target_pos):
+        """
+        截面节点的移动操作（拖动节点时连续的移动合并为一步）
+        :param sectionHandler: 节点所在的截面
+        :param node: 被移动的节点
+        :param target_pos: 目标位置 (x, y)
+        """
+        super().__init__()
+        self.name = f"移动 {sectionHandler.name} 的节点到 ({round(target_pos[0], 4)}, {round(target_pos[1], 4)})"
+        self.sectionHandler = sectionHandler
+        self.node = node
+        self.target_pos = tuple(target_pos)
+        self.origin_pos = (node.x, node.y)
+
+    def _move(self, pos):
+        # 节点的索引可能因为上下顺序改变而变化，每次按节点对象查找
+        self.sectionHandler.update_node_data(self.sectionHandler.nodes.index(self.node), *pos)
+
+    def execute(self):
+        self._move(self.target_pos)
+
+    def merge(self, operation):
+        if type(operation) is not SectionNodeMoveOperation or operation.node is not self.node:
+            return False
+        self.name = operation.name
+        self.target_pos = operation.target_pos
+        return True
+
+    def undo(self):
+        self._move(self.origin_pos)
+
+    def redo(self):
+        self.execute()
+
+
+class SectionGroupSnapshotOperation(Operation):
+    """
+    截面组的批量编辑操作（例如整体缩放所有节点）
+    不为每个节点单独记录操作，而是记录编辑前后 get_array() 的快照；
+    快照按float64的原始位按位异或后压缩存储（未改变的值异或后为0，压缩率很高，且还原后的坐标与原值完全相同），
+    撤回和重做时用当前状态与差值异或即可还原另一个状态，然后整体赋值、重建网格。
+    """
+    def __init__(self, sectionGroup, target_array: np.ndarray, name=None):
+        """
+        截面组快照操作
+        :param sectionGroup: 被编辑的截面组（需要实现get_array和set_array）
+        :param target_array: 编辑后的数组，形状与sectionGroup.get_array()相同
+        :param name: 操作名
+        """
+        super().__init__()
+        self.name = name if name else f"批量编辑 {sectionGroup.name}"
+        self.sectionGroup = sectionGroup
+        origin = np.ascontiguousarray(sectionGroup.get_array(), dtype=np.float64)
+        target = np.ascontiguousarray(target_array, dtype=np.float64)
+        if origin.shape != target.shape:
+            raise ValueError(f"target_array shape {target.shape} does not match {origin.shape}")
+        self.shape = origin.shape
+        self._delta = zlib.compress((origin.view(np.uint64) ^ target.view(np.uint64)).tobytes(), 1)
+        self._target = target  # 仅在第一次执行时使用，之后释放
+
+    def _delta_array(self) -> np.ndarray:
+        return np.frombuffer(zlib.decompress(self._delta), dtype=np.uint64).reshape(self.shape)
+
+    def _toggle(self):
+        """
+        当前状态与差值异或，得到另一个状态并整体赋值
+        """
+        current = np.ascontiguousarray(self.sectionGroup.get_array(), dtype=np.float64)
+        self.sectionGroup.set_array((current.view(np.uint64) ^ self._delta_array()).view(np.float64))
+
+    def execute(self):
+        if self._target is not None:
+            self.sectionGroup.set_array(self._target)
+            self._target = None
+            self._nbytes = None
+        else:
+            self._toggle()
+
+    def merge(self, operation):
+        """
+        连续的批量编辑（例如滚轮连续调整尺寸）合并为一步：两个差值异或即为最初状态到最新状态的差值
+        """
+        if type(operation) is not SectionGroupSnapshotOperation or operation.sectionGroup is not self.sectionGroup \
+                or operation.shape != self.shape:
+            return False
+        self._delta = zlib.compress((self._delta_array() ^ operation._delta_array()).tobytes(), 1)
+        self.name = operation.name
+        return True
+
+    def undo(self):
+        self._toggle()
+
+    def redo(self):
+        self._toggle()
+
+    def estimate_size(self) -> int:
+        size = sys.getsizeof(self) + len(self._delta)
+        if self._target is not None:
+            size += self._target.nbytes
+        return size
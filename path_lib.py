@@ -10,6 +10,7 @@ from pathlib import Path
 DESKTOP_PATH = os.path.join(os.path.expanduser("~"), 'Desktop')
 CURRENT_PATH = os.path.dirname(os.path.abspath(sys.argv[0]))
 CONFIG_PATH = os.path.join(CURRENT_PATH, 'plugin_config.json')
+THUMBNAIL_PATH = os.path.join(CURRENT_PATH, 'thumbnails')  # 工程缩略图缓存
 
 
 def increment_path(path):
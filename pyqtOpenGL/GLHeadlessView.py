@@ -0,0 +1,291 @@
+"""
+无窗口的离屏渲染视图，用于在没有显示器和GPU的机器（例如CI）上测量渲染性能
+使用 QOffscreenSurface + QOpenGLFramebufferObject 渲染，没有GPU时使用Mesa的软件渲染（llvmpipe）：
+    QT_QPA_PLATFORM=offscreen LIBGL_ALWAYS_SOFTWARE=1 python -m pyqtOpenGL.GLHeadlessView project.naprj --frames 120
+"""
+import argparse
+import json
+import math
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import OpenGL.GL as gl
+from PyQt5.QtGui import QOffscreenSurface, QOpenGLContext, QOpenGLFramebufferObject, QSurfaceFormat, QImage
+from PyQt5.QtWidgets import QApplication
+
+from utils.frame_stats import FrameTiming, summarize, summarize_frames
+from .GLViewWidget import GLViewWidget
+from .items.BufferObject import VBOPool
+from .transform3d import Vector3
+
+__all__ = ['GLHeadlessView', 'DrawCallCounter', 'orbit_path', 'load_project', 'run_benchmark']
+
+
+class DrawCallCounter:
+    """
+    统计绘制调用次数：在with块内替换OpenGL.GL中的glDraw*函数（所有图元都通过 gl.glDraw* 调用）
+    """
+    FUNCTIONS = ("glDrawArrays", "glDrawElements", "glDrawArraysInstanced", "glDrawElementsInstanced")
+
+    def __init__(self):
+        self.count = 0
+        self._originals = {}
+
+    def _wrap(self, func):
+        def wrapper(*args, **kwargs):
+            self.count += 1
+            return func(*args, **kwargs)
+        return wrapper
+
+    def __enter__(self):
+        for name in self.FUNCTIONS:
+            self._originals[name] = getattr(gl, name)
+            setattr(gl, name, self._wrap(self._originals[name]))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        for name, func in self._originals.items():
+            setattr(gl, name, func)
+        self._originals.clear()
+        return False
+
+
+class GLHeadlessView(GLViewWidget):
+    """
+    不显示的GLViewWidget，绘制到离屏帧缓冲中
+    与GLViewWidget的区别：
+    1. 使用自己的QOpenGLContext和QOffscreenSurface，makeCurrent时绑定离屏帧缓冲
+    2. update()不触发重绘，只记录请求次数；由render_frame()逐帧绘制
+    """
+    TAG = "GLHeadlessView"
+
+    def __init__(self, width: int = 1280, height: int = 720, **kwargs):
+        """
+        :param width: 帧缓冲宽度（像素）
+        :param height: 帧缓冲高度（像素）
+        :param kwargs: 传给GLViewWidget的参数（相机位置等）
+        :raise RuntimeError: 无法创建OpenGL上下文
+        """
+        self._context = None
+        self._fbo = None
+        self.update_requests = 0
+        super().__init__(**kwargs)
+        self.resize(width, height)
+        self._width, self._height = width, height
+        _format = QSurfaceFormat(self.format())
+        _format.setSamples(0)  # 离屏帧缓冲不使用多重采样
+        self._surface = QOffscreenSurface()
+        self._surface.setFormat(_format)
+        self._surface.create()
+        self._context = QOpenGLContext()
+        self._context.setFormat(_format)
+        if not self._context.create() or not self._context.makeCurrent(self._surface):
+            raise RuntimeError("Failed to create an offscreen OpenGL context")
+        self._fbo = QOpenGLFramebufferObject(width, height, QOpenGLFramebufferObject.CombinedDepthStencil)
+        self._fbo.bind()
+        self.initializeGL()
+        self.resizeGL(width, height)
+        self.doneCurrent()
+
+    @property
+    def gl_info(self) -> dict:
+        """
+        OpenGL实现的信息，用于区分测试结果来自硬件还是软件渲染
+        """
+        self.makeCurrent()
+        info = {
+            "vendor": gl.glGetString(gl.GL_VENDOR).decode(),
+            "renderer": gl.glGetString(gl.GL_RENDERER).decode(),
+            "version": gl.glGetString(gl.GL_VERSION).decode(),
+        }
+        self.doneCurrent()
+        return info
+
+    def context(self):
+        return self._context
+
+    def makeCurrent(self):
+        self._context.makeCurrent(self._surface)
+        self._fbo.bind()
+
+    def doneCurrent(self):
+        self._context.doneCurrent()
+
+    def defaultFramebufferObject(self):
+        return self._fbo.handle()
+
+    def deviceWidth(self):
+        return self._width
+
+    def deviceHeight(self):
+        return self._height
+
+    def update(self):
+        self.update_requests += 1
+
+    def grabFramebuffer(self) -> QImage:
+        return self._fbo.toImage()
+
+    def pickItems(self, x_, y_, w_, h_):
+        selected_items = super().pickItems(x_, y_, w_, h_)
+        self._fbo.bind()  # 拾取结束时绑定的是默认帧缓冲
+        return selected_items
+
+    def _set_camera(self, pos: Vector3, tar: Vector3):
+        self.camera.set_params(pos, tar)
+        self.camera.distance = (pos - tar).length()
+        self.camera._get_right()  # noqa
+        self.camera._set_lookAt()  # noqa
+
+    def render_frame(self, counter: DrawCallCounter = None) -> FrameTiming:
+        """
+        绘制一帧，返回耗时
+        :param counter: 正在统计的DrawCallCounter，为None时绘制调用次数记为0
+        """
+        self.makeCurrent()
+        calls_before = counter.count if counter else 0
+        start = time.perf_counter()
+        self.paintGL()
+        cpu_ms = (time.perf_counter() - start) * 1000
+        gl.glFinish()
+        total_ms = (time.perf_counter() - start) * 1000
+        gpu_ms = None
+        if self.gpu_timer.available:  # 主绘制和选择框阶段的GPU耗时（paintGL中的计时查询）
+            gpu_ms = sum(ms for name, ms in self.collectGPUTimes(wait=True) if name != "pick")
+        draw_calls = counter.count - calls_before if counter else 0
+        self.doneCurrent()
+        return FrameTiming(cpu_ms, gpu_ms, total_ms, draw_calls)
+
+    def pick(self, rect: Tuple[int, int, int, int]) -> Tuple[float, list]:
+        """
+        拾取矩形区域内的物体
+        :param rect: (x, y, w, h)，窗口坐标，原点在左上角
+        :return: (耗时ms, 拾取到的物体)
+        """
+        self.makeCurrent()
+        start = time.perf_counter()
+        items = self.pickItems(*rect)
+        elapsed = (time.perf_counter() - start) * 1000
+        self.doneCurrent()
+        return elapsed, items
+
+    def close(self):
+        if self._context is not None:
+            self.makeCurrent()
+            self.gpu_timer.delete()
+            self._fbo.release()
+            self._fbo = None
+            self._context.doneCurrent()
+            self._context = None
+        super().close()
+
+
+def orbit_path(center: Sequence[float], radius: float, height: float, frames: int, turns: float = 1.
+               ) -> List[Tuple[Vector3, Vector3]]:
+    """
+    绕center水平环绕的相机路径
+    :return: [(相机位置, 目标点)]
+    """
+    cx, cy, cz = center
+    path = []
+    for i in range(frames):
+        angle = 2 * math.pi * turns * i / max(frames, 1)
+        pos = Vector3(cx + radius * math.cos(angle), cy + height, cz + radius * math.sin(angle))
+        path.append((pos, Vector3(cx, cy, cz)))
+    return path
+
+
+def load_project(view: GLViewWidget, path: str):
+    """
+    读取.naprj工程，把所有组件的绘制对象添加到视图中（不需要主编辑器）
+    :return: DesignerProject
+    :raise ValueError: 工程读取失败
+    """
+    from ShipRead.designer_project import DesignerProject, DesignerPrjReader
+    from ShipRead.sectionHandler import HullSectionGroup, ArmorSectionGroup, Bridge, Ladder, Model, RefImage
+    prj = DesignerProject(path)
+    if not DesignerPrjReader(None, path, prj).successed:
+        raise ValueError(f"Failed to load project: {path}")
+    for signal, component_class in (
+            (prj.add_hull_section_group_s, HullSectionGroup), (prj.add_armor_section_group_s, ArmorSectionGroup),
+            (prj.add_bridge_s, Bridge), (prj.add_ladder_s, Ladder), (prj.add_model_s, Model),
+            (prj.add_ref_image_s, RefImage)):
+        signal.connect(lambda _id, cls=component_class: view.addItem(cls.get_by_id(_id).paintItem, add_light=True))
+    prj.init_in_main_editor()
+    return prj
+
+
+def run_benchmark(
+        view: GLHeadlessView,
+        camera_path: List[Tuple[Vector3, Vector3]],
+        pick_rects: Sequence[Tuple[int, int, int, int]] = (),
+        warmup_frames: int = 2,
+        on_frame: Optional[Callable[[int, FrameTiming], None]] = None
+) -> dict:
+    """
+    沿相机路径逐帧绘制，每帧之后执行拾取
+    :param view: 离屏视图
+    :param camera_path: [(相机位置, 目标点)]
+    :param pick_rects: 每帧拾取的矩形 (x, y, w, h)
+    :param warmup_frames: 不计入结果的预热帧数（首帧包括着色器编译和缓冲区上传）
+    :param on_frame: 每帧的回调，参数为 (帧序号, 耗时)
+    :return: {"frames": [...], "picks_ms": [...], "summary": {...}, "passes": 视图的分阶段统计（frameStats），
+              "vbo_pool": 共享顶点缓冲区的使用率和碎片率}
+    """
+    frames: List[FrameTiming] = []
+    picks_ms: List[float] = []
+    with DrawCallCounter() as counter:
+        if camera_path:
+            view._set_camera(*camera_path[0])  # noqa
+        for _ in range(warmup_frames):
+            view.render_frame(counter)
+        view.resetFrameStats()
+        for i, (pos, tar) in enumerate(camera_path):
+            view._set_camera(pos, tar)  # noqa
+            frame = view.render_frame(counter)
+            frames.append(frame)
+            for rect in pick_rects:
+                picks_ms.append(view.pick(rect)[0])
+            if on_frame:
+                on_frame(i, frame)
+    summary = summarize_frames(frames)
+    summary["pick_ms"] = summarize(picks_ms)
+    view.collectGPUTimes(wait=True)
+    view.makeCurrent()  # 缓冲区池按GL共享组区分
+    pool_stats = VBOPool.default().stats()
+    view.doneCurrent()
+    return {"frames": [frame._asdict() for frame in frames], "picks_ms": picks_ms, "summary": summary,
+            "passes": view.frameStats(), "vbo_pool": pool_stats}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="离屏渲染性能测试")
+    parser.add_argument("project", help=".naprj 工程文件")
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--size", default="1280x720", help="帧缓冲尺寸，宽x高")
+    parser.add_argument("--radius", type=float, default=60., help="环绕半径")
+    parser.add_argument("--height", type=float, default=20., help="相机高度")
+    parser.add_argument("--pick", action="store_true", help="每帧在画面中心拾取")
+    parser.add_argument("--json", help="结果输出路径")
+    args = parser.parse_args()
+    width, height = (int(v) for v in args.size.lower().split("x"))
+
+    app = QApplication.instance() or QApplication([])  # noqa
+    view = GLHeadlessView(width, height)
+    load_project(view, args.project)
+    picks = [(width // 2 - 50, height // 2 - 50, 100, 100)] if args.pick else []
+    result = run_benchmark(view, orbit_path((0, 0, 0), args.radius, args.height, args.frames), picks)
+    result["gl"] = view.gl_info
+    result["project"] = args.project
+    view.close()
+    print(f"{result['gl']['renderer']}  {width}x{height}  {args.frames} frames")
+    for field, stats in result["summary"].items():
+        if stats:
+            print(f"{field:>10}: " + "  ".join(f"{k} {v:.2f}" for k, v in stats.items()))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
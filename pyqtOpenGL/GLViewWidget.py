@@ -20,10 +20,13 @@ from PyQt5.QtGui import QPainter, QColor, QCursor
 from PyQt5.QtWidgets import QMessageBox
 from main_logger import Log
 from pyqtOpenGL.items.GL2DSelectBox import GLSelectBox
+from utils.frame_stats import FrameStatsRecorder
+from utils.perf_trace import trace_it
 
 from .GLGraphicsItem import GLGraphicsItem, PickColorManager
 from .camera import Camera
 from .functions import mkColor
+from .gpu_timer import GPUTimer
 from .items.light import PointLight
 from .transform3d import Vector3
 
@@ -48,6 +51,9 @@ class GLViewWidget(QtWidgets.QOpenGLWidget):
 
     # 剪贴板
     clipboard = []
+    FRAME_STATS_CAPACITY = 600  # 保留的帧数
+    FRAME_INTERVAL_LIMIT = 0.5  # 超过该间隔（秒）的两帧之间视为空闲，不计入帧间隔统计
+    OVERLAY_REFRESH_INTERVAL = 0.25  # 性能浮层的刷新间隔（秒）
 
     def selectAll(self):
         self.selected_items.clear()
@@ -115,7 +121,13 @@ class GLViewWidget(QtWidgets.QOpenGLWidget):
 
         # 显示帧率
         self.fps_label = TextLabel(self, "")
-        self.__last_time = time.time()
+        self.__last_time = time.perf_counter()
+        # 帧耗时统计：最近若干帧的帧间隔、CPU绘制耗时和各阶段的GPU耗时
+        self.frame_stats = FrameStatsRecorder(self.FRAME_STATS_CAPACITY)
+        self.gpu_timer: Optional[GPUTimer] = None  # 在initializeGL中创建
+        self._frame_stats_overlay = False
+        self.__last_overlay_time = 0.
+        self.__fps_label_size = self.fps_label.size()
 
         # 设置多重采样抗锯齿
         _format = QtGui.QSurfaceFormat()
@@ -220,12 +232,14 @@ class GLViewWidget(QtWidgets.QOpenGLWidget):
         PointLight.initializeGL()
         self._createFramebuffer(WIN_WID, WIN_HEI)
         self.select_box.initializeGL()
+        self.gpu_timer = GPUTimer()
         gl.glEnable(GL_MULTISAMPLE)
         gl.glEnable(GL_DEPTH_TEST)
 
     def enablePaint(self, enable: bool):
         self._paint_enabled = enable
 
+    @trace_it("paintGL", "gl")
     def paintGL(self):
         """
         viewport specifies the arguments to glViewport. If None, then we use self.opts['viewport']
@@ -234,19 +248,28 @@ class GLViewWidget(QtWidgets.QOpenGLWidget):
         """
         if not self._paint_enabled:
             return
+        start = time.perf_counter()
+        self.collectGPUTimes()
         glClearColor(*self.bg_color)
         glDepthMask(GL_TRUE)
         glClear(GL_DEPTH_BUFFER_BIT | GL_COLOR_BUFFER_BIT | GL_STENCIL_BUFFER_BIT)
         if self.select_box.visible():
+            timing = self._begin_gpu_pass("main")
             self.drawItems(pickMode=False, update=False)
+            self._end_gpu_pass(timing)
+            timing = self._begin_gpu_pass("select")
             self.select_box.updateGL(self.select_start, self.select_end)
             self.select_box.paint()
+            self._end_gpu_pass(timing)
             # self.painter.setPen(QColor(255, 255, 255))
             # self.painter.drawRect(self.select_start.x(), self.select_start.y(),
             #                       self.select_end.x() - self.select_start.x(),
             #                       self.select_end.y() - self.select_start.y())
         else:
+            timing = self._begin_gpu_pass("main")
             self.drawItems(pickMode=False)
+            self._end_gpu_pass(timing)
+        self.frame_stats.record("cpu_ms", (time.perf_counter() - start) * 1000)
         self.__update_FPS()
 
     def resizeGL(self, w, h):
@@ -274,6 +297,7 @@ class GLViewWidget(QtWidgets.QOpenGLWidget):
         glTexImage2D(GL_TEXTURE_2D, 0, GL_R32F, width, height, 0, GL_RED, GL_FLOAT, None)
         glBindFramebuffer(GL_FRAMEBUFFER, 0)
 
+    @trace_it("pickItems", "gl")
     def pickItems(self, x_, y_, w_, h_):
         ratio = 2  # 为了提高渲染和拾取速度，暂将渲染视口缩小4倍
         x_, y_, w_, h_ = self._normalizeRect(x_, y_, w_, h_, ratio)
@@ -288,7 +312,11 @@ class GLViewWidget(QtWidgets.QOpenGLWidget):
         glScissor(x_, self.deviceHeight() // ratio - y_ - h_, w_, h_)
         glEnable(GL_SCISSOR_TEST)
         # 在这里设置额外的拾取参数，例如鼠标位置等
+        start = time.perf_counter()
+        timing = self._begin_gpu_pass("pick")
         self.drawItems(pickMode=True)
+        self._end_gpu_pass(timing)
+        self.frame_stats.record("pick_cpu_ms", (time.perf_counter() - start) * 1000)
         glDisable(GL_SCISSOR_TEST)
         pixels = glReadPixels(x_, self.deviceHeight() // ratio - y_ - h_, w_, h_, GL_RED, GL_FLOAT)
         glBindFramebuffer(GL_FRAMEBUFFER, 0)
@@ -369,11 +397,70 @@ class GLViewWidget(QtWidgets.QOpenGLWidget):
         self.update()
 
     def __update_FPS(self):
-        dt = time.time() - self.__last_time
-        if dt != 0:
-            self.fps_label.setText(f"FPS: {1 / dt:.1f}")
-        self.__last_time = time.time()
+        now = time.perf_counter()
+        dt = now - self.__last_time
+        self.__last_time = now
+        if dt < self.FRAME_INTERVAL_LIMIT:
+            self.frame_stats.record("frame_ms", dt * 1000)
+        if not self._frame_stats_overlay:
+            if dt != 0:
+                self.fps_label.setText(f"FPS: {1 / dt:.1f}")
+        elif now - self.__last_overlay_time > self.OVERLAY_REFRESH_INTERVAL:
+            self.__last_overlay_time = now
+            self.fps_label.setText(f"FPS: {1 / dt:.1f}\n{self.frame_stats.format_overlay()}" if dt != 0 else
+                                   self.frame_stats.format_overlay())
+            self.fps_label.adjustSize()
+
+    def _begin_gpu_pass(self, name: str) -> bool:
+        return self.gpu_timer.begin(name) if self.gpu_timer else False
+
+    def _end_gpu_pass(self, started: bool):
+        if started:
+            self.gpu_timer.end()
+
+    def collectGPUTimes(self, wait: bool = False) -> List[tuple]:
+        """
+        读取已完成的GPU计时查询，记录为 "gpu_<阶段>_ms"（阶段：main、select、pick）
+        :param wait: 是否等待所有查询完成
+        :return: [(阶段, 耗时ms)]
+        """
+        if not self.gpu_timer:
+            return []
+        results = self.gpu_timer.collect(wait)
+        for name, ms in results:
+            self.frame_stats.record(f"gpu_{name}_ms", ms)
+        return results
+
+    def frameStats(self) -> dict:
+        """
+        最近若干帧的耗时统计，用于自动化的性能回归检查
+        :return: {名称: {"mean", "p50", "p95", "p99", "max"}}，名称包括
+            frame_ms（帧间隔）、cpu_ms（绘制的CPU耗时）、pick_cpu_ms（拾取的CPU耗时）、
+            gpu_main_ms、gpu_select_ms、gpu_pick_ms（各阶段的GPU耗时，需要OpenGL 3.3）
+        """
+        return self.frame_stats.summary()
+
+    def resetFrameStats(self):
+        self.frame_stats.clear()
+
+    def setFrameStatsOverlay(self, enable: bool):
+        """
+        在帧率标签中显示各项耗时的p50/p95/p99（毫秒）
+        """
+        if bool(enable) == self._frame_stats_overlay:
+            return
+        self._frame_stats_overlay = bool(enable)
+        self.__last_overlay_time = 0.
+        if enable:
+            self.__fps_label_size = self.fps_label.size()
+        else:
+            self.fps_label.resize(self.__fps_label_size)
+        self.update()
+
+    def frameStatsOverlay(self) -> bool:
+        return self._frame_stats_overlay
 
+    @trace_it("drawItems", "gl")
     def drawItems(self, pickMode=False, update=True):
         if pickMode:  # 拾取模式
             for it in self.items:
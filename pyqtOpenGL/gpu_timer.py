@@ -0,0 +1,99 @@
+"""
+GPU计时查询（GL_TIME_ELAPSED）
+每个渲染阶段（主绘制、拾取、选择框）使用一组轮换的查询对象：本帧发起的查询在之后的帧中读取结果，
+读取前检查 GL_QUERY_RESULT_AVAILABLE，不会让CPU等待GPU
+"""
+from typing import Dict, List, Optional, Tuple
+
+import OpenGL.GL as gl
+import numpy as np
+from PyQt5.QtGui import QOpenGLContext
+
+__all__ = ['GPUTimer']
+
+
+class GPUTimer:
+    """
+    按阶段统计GPU耗时
+    GL_TIME_ELAPSED查询不能嵌套，同一时刻只有一个阶段在计时；嵌套调用begin时内层阶段不计时
+    """
+    QUERIES_PER_PASS = 4  # 每个阶段轮换使用的查询对象数量，结果一般在2~3帧后可用
+
+    def __init__(self):
+        """
+        需要在OpenGL上下文中创建；OpenGL 3.3以下且不支持 GL_ARB_timer_query 时不计时
+        """
+        context = QOpenGLContext.currentContext()
+        self.available = context is not None and (
+            context.format().version() >= (3, 3) or context.hasExtension(b"GL_ARB_timer_query"))
+        self._free: Dict[str, List[int]] = {}  # 阶段 -> 空闲的查询对象
+        self._pending: List[Tuple[str, int]] = []  # 按发起顺序排列的 (阶段, 查询对象)
+        self._active: Optional[Tuple[str, int]] = None
+        self._available_flag = np.zeros(1, dtype=np.uint32)
+        self._result = np.zeros(1, dtype=np.uint64)
+
+    def _acquire(self, name: str) -> Optional[int]:
+        free = self._free.get(name)
+        if free is None:
+            free = self._free[name] = [int(q) for q in np.ravel(gl.glGenQueries(self.QUERIES_PER_PASS))]
+        if free:
+            return free.pop()
+        return None  # 结果还没有读取完，丢弃这一次计时
+
+    def begin(self, name: str) -> bool:
+        """
+        开始一个阶段的计时
+        :return: 是否开始计时
+        """
+        if not self.available or self._active is not None:
+            return False
+        query = self._acquire(name)
+        if query is None:
+            return False
+        gl.glBeginQuery(gl.GL_TIME_ELAPSED, query)
+        self._active = (name, query)
+        return True
+
+    def end(self, started: bool = True):
+        """
+        结束当前阶段的计时
+        :param started: 对应begin的返回值
+        """
+        if not started or self._active is None:
+            return
+        gl.glEndQuery(gl.GL_TIME_ELAPSED)
+        self._pending.append(self._active)
+        self._active = None
+
+    def collect(self, wait: bool = False) -> List[Tuple[str, float]]:
+        """
+        读取已经完成的查询
+        :param wait: 是否等待所有查询完成（用于离屏测试，正常绘制时不要等待）
+        :return: [(阶段, 耗时ms)]，按发起顺序排列
+        """
+        results = []
+        while self._pending:
+            name, query = self._pending[0]
+            if not wait:
+                gl.glGetQueryObjectuiv(query, gl.GL_QUERY_RESULT_AVAILABLE, self._available_flag)
+                if not self._available_flag[0]:
+                    break  # 之后发起的查询也不会完成
+            gl.glGetQueryObjectui64v(query, gl.GL_QUERY_RESULT, self._result)
+            results.append((name, int(self._result[0]) / 1e6))
+            self._pending.pop(0)
+            self._free[name].append(query)
+        return results
+
+    def delete(self):
+        """
+        删除所有查询对象（需要在OpenGL上下文中调用）
+        """
+        queries = [q for free in self._free.values() for q in free] + [q for _, q in self._pending]
+        if self._active is not None:
+            gl.glEndQuery(gl.GL_TIME_ELAPSED)
+            queries.append(self._active[1])
+            self._active = None
+        if queries:
+            gl.glDeleteQueries(len(queries), queries)
+        self._free.clear()
+        self._pending.clear()
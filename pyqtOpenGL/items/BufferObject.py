@@ -1,15 +1,21 @@
 """
 缓冲区对象
 """
+import ctypes
 import time
 from ctypes import c_void_p
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 import OpenGL
 import OpenGL.GL as gl
 import numpy as np
 from PyQt5.QtCore import QMutex
+from PyQt5.QtGui import QOpenGLContext
 from main_logger import Log
+from utils.perf_trace import trace_it
+from utils.suballocator import FreeListAllocator, grow_capacity
+
+from .texture import _share_group
 
 
 GL_Type = {
@@ -31,6 +37,7 @@ def locker(func):
 
 class MemoryBlock:
     TAG = "MemoryBlock"
+    GROWTH = 1.5  # 数据块变大时按几何增长预留容量，连续增加节点或截面时不必每次都重新分配缓冲区
 
     def __init__(
             self,
@@ -87,7 +94,7 @@ class MemoryBlock:
             ptr = self.block_offsets[_id] + self.block_lens[_id]
             self.block_used[_id] = _len
             if _len > self.block_lens[_id]:
-                self.block_lens[_id] = _len
+                self.block_lens[_id] = grow_capacity(self.block_lens[_id], _len, self.GROWTH)
                 extend = True
         if ptr < self.sum_lens:
             keep_blocks.append([ptr, self.sum_lens - ptr, -1])
@@ -110,10 +117,22 @@ class MemoryBlock:
         获取指定内存块的偏移量和大小。
 
         :param _id: 内存块的索引。
-        :return: 偏移量和大小。
+        :return: 偏移量和大小（容量）。
         """
         return self.block_offsets[_id], self.block_lens[_id]
 
+    def stats(self) -> Dict[str, float]:
+        """
+        获取容量的使用情况。
+
+        :return: {"capacity": 总容量, "used": 已使用的字节数, "reserved": 预留未用的字节数, "utilization": 使用率}
+        """
+        used = int(np.sum(self.block_used))
+        return {
+            "capacity": self.sum_lens, "used": used, "reserved": self.sum_lens - used,
+            "utilization": used / self.sum_lens if self.sum_lens else 0.,
+        }
+
     @property
     def nblocks(self):
         """
@@ -187,6 +206,7 @@ class VBO:
         self.lock = QMutex()
         self._usage = usage
         self.blocks = MemoryBlock(data, size)
+        self._base_offset = 0  # 数据块在缓冲区中的起始位置（共享缓冲区时不为0）
 
         # 缓冲区数据
         self._vbo = gl.glGenBuffers(1)
@@ -208,12 +228,13 @@ class VBO:
             Log().warning(self.TAG, "_loadSubDatas函数退出，由于缓冲区绑定失败。")
             return False
         for _id, da in zip(block_id, data):
-            offset = int(self.blocks.block_offsets[_id])
+            offset = self._base_offset + int(self.blocks.block_offsets[_id])
             length = int(self.blocks.block_used[_id])
             gl.glBufferSubData(gl.GL_ARRAY_BUFFER, offset, length, da)
 
         gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
 
+    @trace_it("VBO.updateData", "upload")
     @locker
     def updateData(self, block_id: List[int], data: List[np.ndarray]):
         """
@@ -257,6 +278,32 @@ class VBO:
 
         self._loadSubDatas(block_id, data)
 
+    @locker
+    def updateSubData(self, block_id: int, offset: int, data: np.ndarray):
+        """
+        只改写数据块中的一段，数据块的大小不变（例如实例数据中变化的几个实例）
+
+        :param block_id: 子数据块的索引。
+        :param offset: 在数据块内的字节偏移量。
+        :param data: 写入的数据，offset + data.nbytes 不能超过数据块已使用的大小。
+        """
+        if offset < 0 or offset + data.nbytes > int(self.blocks.block_used[block_id]):
+            raise ValueError(f"updateSubData out of range: {offset} + {data.nbytes} > {self.blocks.block_used[block_id]}")
+        if not self.bind():
+            return
+        gl.glBufferSubData(gl.GL_ARRAY_BUFFER, self._base_offset + int(self.blocks.block_offsets[block_id]) + offset,
+                           data.nbytes, np.ascontiguousarray(data))
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+
+    def updateSubDatas(self, updates: List[Tuple[int, int, np.ndarray]]):
+        """
+        改写多个数据块中的多段
+
+        :param updates: [(子数据块的索引, 字节偏移量, 数据)]，同 updateSubData
+        """
+        for block_id, offset, data in updates:
+            self.updateSubData(block_id, offset, data)
+
     @property
     def isbind(self):
         """
@@ -291,7 +338,8 @@ class VBO:
         :return: 从缓冲区读取的数据。
         """
         self.bind()
-        offset, nbytes = self.blocks.locBlock(_id)  # 读取数据的偏移量和大小
+        offset = self._base_offset + self.blocks.block_offsets[_id]  # 读取数据的偏移量和大小
+        nbytes = int(self.blocks.block_used[_id])
         dtype = self.blocks.dtype[_id]
         data = np.empty(int(nbytes / dtype.itemsize), dtype=dtype)
 
@@ -337,7 +385,7 @@ class VBO:
                         GL_Type[dtype],
                         gl.GL_FALSE,
                         stride,
-                        c_void_p(self.blocks.block_offsets[b_id] + a_offsets[i] * dtype.itemsize)
+                        c_void_p(self._base_offset + self.blocks.block_offsets[b_id] + a_offsets[i] * dtype.itemsize)
                     )
                     gl.glVertexAttribDivisor(a_id[i], div)
                     gl.glEnableVertexAttribArray(a_id[i])
@@ -348,11 +396,412 @@ class VBO:
                     GL_Type[dtype],
                     gl.GL_FALSE,
                     a_size * dtype.itemsize,
-                    c_void_p(self.blocks.block_offsets[b_id])
+                    c_void_p(self._base_offset + self.blocks.block_offsets[b_id])
                 )
                 gl.glVertexAttribDivisor(a_id, div)
                 gl.glEnableVertexAttribArray(a_id)
 
+    def bindAttrs(self):
+        """
+        绑定VAO之后、绘制之前调用；普通VBO的属性偏移量不会改变，不需要操作（见StreamVBO）
+        """
+        pass
+
+
+class StreamVBO(VBO):
+    """
+    流式顶点缓冲区，用于频繁改写的顶点数据（例如拖动节点时的船体截面）
+    缓冲区分为SEGMENTS段，每次updateData把所有数据块写入下一段，GPU可能仍在读取的段用栅栏（fence）保护：
+    1. 支持 glBufferStorage（OpenGL 4.4 或 GL_ARB_buffer_storage）时，整个缓冲区一直持久映射（MAP_PERSISTENT），
+       numpy数组直接复制到映射的内存中，不经过 glBufferSubData，也不需要重新分配；
+    2. 不支持时只有一段，每次写入前孤立（orphaning）旧的缓冲区，驱动会分配新的内存而不等待GPU。
+    每次写入后顶点属性的偏移量会改变，绘制前需要在绑定VAO之后调用bindAttrs。
+    """
+    TAG = "StreamVBO"
+    SEGMENTS = 3  # 三重缓冲
+    ALIGNMENT = 256  # 每个数据块的起始位置对齐
+    GROWTH = 1.5  # 数据变大时的扩容倍数，避免连续增长时每次都重新分配
+    FENCE_TIMEOUT = 1_000_000_000  # 等待栅栏的超时（纳秒）
+
+    def __init__(
+            self,
+            data: List[np.ndarray],
+            size: List[int],
+            usage=gl.GL_STREAM_DRAW,
+    ):
+        """
+        :param data: 数据列表，每个元素是一个 ndarray，表示一个数据块。
+        :param size: 每个数据块的大小，与VBO相同。
+        :param usage: 不支持持久映射时使用的缓冲区使用模式。
+        """
+        self.lock = QMutex()
+        self._usage = usage
+        self.blocks = MemoryBlock(data, size)
+        self._base_offset = 0  # 偏移量已经包含在blocks.block_offsets中
+        self._data: List[Optional[np.ndarray]] = [None if x is None else np.ascontiguousarray(x) for x in data]
+        self._persistent = self._storage_supported()
+        self._vbo = None
+        self._mapped: Optional[np.ndarray] = None  # 映射的整个缓冲区（uint8）
+        self._fences = [None] * self.SEGMENTS
+        self._segment = -1  # 最近一次写入的段
+        self._segment_size = 0
+        self._capacity: List[int] = []  # 每个数据块在一段中的容量
+        self._rel_offsets: List[int] = []  # 每个数据块在一段中的偏移量
+        self._attr_pointers = {}  # 属性指针的设置，写入新的一段后重新设置
+        self._attrs_dirty = False
+        self._valid = [False] * self.SEGMENTS  # 每一段是否写入过完整的数据
+        self._history: List[Optional[List[Tuple[int, int, int]]]] = []  # 最近几次写入改变的区间，None表示全部
+        self._owned = set()  # _data中已经复制过（可以原地改写）的数据块
+        self._allocate(self.blocks.block_lens)
+        self._write()
+
+    @staticmethod
+    def _storage_supported() -> bool:
+        context = QOpenGLContext.currentContext()
+        if context is None or not bool(gl.glBufferStorage):
+            return False
+        return context.format().version() >= (4, 4) or context.hasExtension(b"GL_ARB_buffer_storage")
+
+    @property
+    def persistent(self) -> bool:
+        """
+        是否使用持久映射
+        """
+        return self._persistent
+
+    def _align(self, nbytes: int) -> int:
+        return -(-nbytes // self.ALIGNMENT) * self.ALIGNMENT
+
+    def _release(self):
+        for i, fence in enumerate(self._fences):
+            if fence is not None:
+                gl.glClientWaitSync(fence, gl.GL_SYNC_FLUSH_COMMANDS_BIT, self.FENCE_TIMEOUT)
+                gl.glDeleteSync(fence)
+                self._fences[i] = None
+        if self._vbo is not None:
+            if self._mapped is not None:
+                gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._vbo)
+                gl.glUnmapBuffer(gl.GL_ARRAY_BUFFER)
+                self._mapped = None
+            gl.glDeleteBuffers(1, [self._vbo])
+            self._vbo = None
+
+    def _allocate(self, capacity: List[int]):
+        """
+        按每个数据块的容量分配缓冲区；持久映射的缓冲区大小不能改变，需要重新创建
+        """
+        self._capacity = [int(c) for c in capacity]
+        self._rel_offsets = []
+        ptr = 0
+        for c in self._capacity:
+            self._rel_offsets.append(ptr)
+            ptr += self._align(c)
+        self._segment_size = max(ptr, self.ALIGNMENT)
+        if self._vbo is not None and not self._persistent:  # 孤立上传时只需要改变大小
+            self.bind()
+            gl.glBufferData(gl.GL_ARRAY_BUFFER, self._segment_size, None, self._usage)
+        else:
+            self._release()
+            self._vbo = gl.glGenBuffers(1)
+            self.bind()
+            if self._persistent:
+                total = self._segment_size * self.SEGMENTS
+                flags = gl.GL_MAP_WRITE_BIT | gl.GL_MAP_PERSISTENT_BIT | gl.GL_MAP_COHERENT_BIT
+                gl.glBufferStorage(gl.GL_ARRAY_BUFFER, total, None, flags)
+                ptr = gl.glMapBufferRange(gl.GL_ARRAY_BUFFER, 0, total, flags)
+                address = ptr if isinstance(ptr, int) else ctypes.cast(ptr, c_void_p).value
+                self._mapped = np.ctypeslib.as_array((ctypes.c_ubyte * total).from_address(address))
+            else:
+                gl.glBufferData(gl.GL_ARRAY_BUFFER, self._segment_size, None, self._usage)
+        self._segment = -1
+        self._valid = [False] * self.SEGMENTS
+        self._history = []
+        self._attrs_dirty = True
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+
+    def _write(self, ranges: Optional[List[Tuple[int, int, int]]] = None):
+        """
+        把数据写入下一段
+        :param ranges: 本次改变的区间 [(数据块, 起始字节, 结束字节)]，为None时写入所有数据块；
+                       持久映射时下一段还需要补上它之后几次写入改变的区间
+        """
+        if self._persistent:
+            if self._segment >= 0:  # 之前提交的绘制命令读取的是当前段
+                self._fences[self._segment] = gl.glFenceSync(gl.GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+            segment = (self._segment + 1) % self.SEGMENTS
+            fence = self._fences[segment]
+            if fence is not None:  # 一般已经完成，不需要等待
+                gl.glClientWaitSync(fence, gl.GL_SYNC_FLUSH_COMMANDS_BIT, self.FENCE_TIMEOUT)
+                gl.glDeleteSync(fence)
+                self._fences[segment] = None
+            base = segment * self._segment_size
+            # 这一段上次写入之后的所有改变
+            pending = self._history[-(self.SEGMENTS - 1):] + [ranges]
+            if not self._valid[segment] or any(r is None for r in pending):
+                for offset, da in zip(self._rel_offsets, self._data):
+                    if da is not None and da.nbytes:
+                        self._mapped[base + offset:base + offset + da.nbytes] = da.reshape(-1).view(np.uint8)
+            else:
+                for block_id, start, stop in (r for changed in pending for r in changed):
+                    offset = base + self._rel_offsets[block_id]
+                    data = self._data[block_id].reshape(-1).view(np.uint8)
+                    self._mapped[offset + start:offset + stop] = data[start:stop]
+            self._valid[segment] = True
+            self._history = (self._history + [ranges])[-(self.SEGMENTS - 1):]
+        else:
+            segment, base = 0, 0
+            self.bind()
+            if ranges is None:
+                gl.glBufferData(gl.GL_ARRAY_BUFFER, self._segment_size, None, self._usage)  # 孤立旧的缓冲区
+                for offset, da in zip(self._rel_offsets, self._data):
+                    if da is not None and da.nbytes:
+                        gl.glBufferSubData(gl.GL_ARRAY_BUFFER, offset, da.nbytes, da)
+            else:  # 只改写变化的区间
+                for block_id, start, stop in ranges:
+                    gl.glBufferSubData(gl.GL_ARRAY_BUFFER, self._rel_offsets[block_id] + start, stop - start,
+                                       self._data[block_id].reshape(-1).view(np.uint8)[start:stop])
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+        if segment != self._segment:
+            self._segment = segment
+            self.blocks.block_offsets = [base + offset for offset in self._rel_offsets]
+            self._attrs_dirty = True
+
+    @trace_it("StreamVBO.updateData", "upload")
+    @locker
+    def updateData(self, block_id: List[int], data: List[np.ndarray]):
+        """
+        更新数据块并写入下一段，未更新的数据块沿用上一次的数据
+
+        :param block_id: 需要更新数据的子数据块索引列表。
+        :param data: 数据列表，每个元素是一个 ndarray，表示一个数据块。
+        """
+        for _id, da in zip(block_id, data):
+            self._data[_id] = None if da is None else np.ascontiguousarray(da)
+            self._owned.discard(_id)
+            if da is not None:
+                self.blocks.dtype[_id] = self._data[_id].dtype
+            self.blocks.block_used[_id] = 0 if da is None else da.nbytes
+        needed = [0 if da is None else da.nbytes for da in self._data]
+        if any(n > c for n, c in zip(needed, self._capacity)):
+            self._allocate([max(c, int(n * self.GROWTH)) if n > c else c for n, c in zip(needed, self._capacity)])
+            self.blocks.block_lens = list(self._capacity)
+        self._write()
+
+    def updateSubData(self, block_id: int, offset: int, data: np.ndarray):
+        """
+        改写一个数据块中的一段，见 updateSubDatas
+        """
+        self.updateSubDatas([(block_id, offset, data)])
+
+    @trace_it("StreamVBO.updateSubDatas", "upload")
+    @locker
+    def updateSubDatas(self, updates: List[Tuple[int, int, np.ndarray]]):
+        """
+        改写CPU副本中的几段，然后写入下一段：只复制这几段和下一段落后的区间（GPU可能仍在读取当前段，不能原地改写）
+
+        :param updates: [(子数据块的索引, 字节偏移量, 数据)]
+        """
+        ranges = []
+        for block_id, offset, data in updates:
+            da = self._data[block_id]
+            if da is None or offset < 0 or offset + data.nbytes > da.nbytes:
+                raise ValueError(f"updateSubData out of range: {offset} + {data.nbytes}")
+            if block_id not in self._owned:  # 第一次改写前复制，不改动调用者的数组
+                da = self._data[block_id] = da.copy()
+                self._owned.add(block_id)
+            da.reshape(-1).view(np.uint8)[offset:offset + data.nbytes] = \
+                np.ascontiguousarray(data, dtype=da.dtype).reshape(-1).view(np.uint8)
+            ranges.append((block_id, offset, offset + data.nbytes))
+        if ranges:
+            self._write(ranges)
+
+    def setAttrPointer(self, block_id: List[int], attr_id: List[int] = None, divisor=0):
+        """
+        设置顶点属性指针，并记录下来，以便写入新的一段后重新设置
+        """
+        self._attr_pointers[repr(block_id)] = (block_id, attr_id, divisor)
+        super().setAttrPointer(block_id, attr_id, divisor)
+
+    def bindAttrs(self):
+        """
+        如果写入了新的一段，按新的偏移量重新设置属性指针（需要先绑定VAO）
+        """
+        if not self._attrs_dirty:
+            return
+        for block_id, attr_id, divisor in self._attr_pointers.values():
+            super().setAttrPointer(block_id, attr_id, divisor)
+        self._attrs_dirty = False
+
+    def getData(self, _id):
+        """
+        返回最近一次写入的数据（不从显存读取）
+        """
+        asize = self.blocks.attr_size[_id]
+        da = self._data[_id]
+        return None if da is None else da.reshape(-1, asize if isinstance(asize, int) else sum(asize))
+
+    def delete(self):
+        self._release()
+
+
+class _PoolPage:
+    """
+    VBOPool中的一个大缓冲区
+    """
+
+    def __init__(self, nbytes: int, usage):
+        self.vbo = gl.glGenBuffers(1)
+        self.allocator = FreeListAllocator(nbytes, VBOPool.ALIGNMENT)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, nbytes, None, usage)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+
+
+class VBOPool:
+    """
+    共享的顶点缓冲区池：很多小网格的数据放在少数几个大缓冲区中，每个网格占用其中的一个区间（FreeListAllocator）
+    减少缓冲区对象的数量；网格数据变大时在池中重新分配区间，不需要重新分配整个缓冲区
+    缓冲区属于创建它的GL上下文，多个编辑窗口的上下文不共享对象，因此每个GL共享组有各自的默认缓冲区池
+    """
+    TAG = "VBOPool"
+    PAGE_SIZE = 8 * 1024 * 1024  # 每个缓冲区的大小
+    ALIGNMENT = 256
+    _defaults: Dict[int, 'VBOPool'] = {}  # GL共享组 -> 默认缓冲区池
+
+    @classmethod
+    def default(cls) -> 'VBOPool':
+        """
+        当前GL上下文的共享组的默认缓冲区池；上下文销毁时移除（缓冲区随上下文一起删除）
+        """
+        group = _share_group()
+        pool = cls._defaults.get(group)
+        if pool is None:
+            pool = cls._defaults[group] = cls()
+            context = QOpenGLContext.currentContext()
+            if context is not None:
+                context.aboutToBeDestroyed.connect(lambda: cls._defaults.pop(group, None))
+        return pool
+
+    def __init__(self, page_size: int = PAGE_SIZE, usage=gl.GL_STATIC_DRAW):
+        self.page_size = page_size
+        self._usage = usage
+        self.pages: List[_PoolPage] = []
+
+    def allocate(self, nbytes: int) -> Tuple[_PoolPage, int]:
+        """
+        :return: (缓冲区, 区间偏移量)
+        """
+        for page in self.pages:
+            offset = page.allocator.allocate(nbytes)
+            if offset is not None:
+                return page, offset
+        page = _PoolPage(max(self.page_size, -(-nbytes // self.ALIGNMENT) * self.ALIGNMENT), self._usage)
+        self.pages.append(page)
+        Log().info(self.TAG, f"新建共享缓冲区 {len(self.pages)}，{page.allocator.capacity} 字节")
+        return page, page.allocator.allocate(nbytes)
+
+    def free(self, page: _PoolPage, offset: int):
+        page.allocator.free(offset)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        :return: {"pages", "capacity", "used", "allocations", "utilization", "fragmentation"}，
+            fragmentation为 1 - 各缓冲区最大空闲区间之和 / 空闲总量
+        """
+        page_stats = [page.allocator.stats() for page in self.pages]
+        capacity = sum(st["capacity"] for st in page_stats)
+        used = sum(st["used"] for st in page_stats)
+        free = capacity - used
+        largest = sum(st["largest_free"] for st in page_stats)
+        return {
+            "pages": len(self.pages), "capacity": capacity, "used": used,
+            "allocations": sum(st["allocations"] for st in page_stats),
+            "utilization": used / capacity if capacity else 0.,
+            "fragmentation": 1 - largest / free if free else 0.,
+        }
+
+
+class PooledVBO(VBO):
+    """
+    数据放在VBOPool共享缓冲区中的VBO，接口与VBO相同
+    区间可能因为数据变大而移动到其他缓冲区，之后需要在绑定VAO后调用bindAttrs重新设置属性指针
+    """
+    TAG = "PooledVBO"
+    MAX_NBYTES = VBOPool.PAGE_SIZE // 8  # 超过该大小的数据使用单独的VBO
+
+    def __init__(
+            self,
+            data: List[np.ndarray],
+            size: List[int],
+            usage=gl.GL_STATIC_DRAW,
+            pool: VBOPool = None,
+    ):
+        self.lock = QMutex()
+        self._usage = usage
+        self.blocks = MemoryBlock(data, size)
+        self._pool = pool if pool is not None else VBOPool.default()
+        self._page: Optional[_PoolPage] = None
+        self._base_offset = 0
+        self._vbo = None
+        self._attr_pointers = {}
+        self._attrs_dirty = False
+        if self.blocks.nbytes > 0:
+            self._page, self._base_offset = self._pool.allocate(self.blocks.nbytes)
+            self._vbo = self._page.vbo
+        self.updateData([i for i in range(len(data))], data)
+
+    @trace_it("PooledVBO.updateData", "upload")
+    @locker
+    def updateData(self, block_id: List[int], data: List[np.ndarray]):
+        """
+        更新数据；数据块超出容量时在池中分配新的区间，保留的数据块用 glCopyBufferSubData 复制过去
+        """
+        old_page, old_base = self._page, self._base_offset
+        _, keep_blocks, extend = self.blocks.setBlock(block_id, [0 if x is None else x.nbytes for x in data])
+        if self.blocks.nbytes == 0:
+            return
+        if extend or old_page is None:
+            self._page, self._base_offset = self._pool.allocate(self.blocks.nbytes)
+            self._vbo = self._page.vbo
+            if old_page is not None:
+                gl.glBindBuffer(gl.GL_COPY_READ_BUFFER, old_page.vbo)
+                gl.glBindBuffer(gl.GL_COPY_WRITE_BUFFER, self._page.vbo)
+                for read, nbytes, write in keep_blocks:
+                    gl.glCopyBufferSubData(gl.GL_COPY_READ_BUFFER, gl.GL_COPY_WRITE_BUFFER,
+                                           old_base + read, self._base_offset + write, nbytes)
+                gl.glBindBuffer(gl.GL_COPY_READ_BUFFER, 0)
+                gl.glBindBuffer(gl.GL_COPY_WRITE_BUFFER, 0)
+                self._pool.free(old_page, old_base)
+            self._attrs_dirty = True
+        self._loadSubDatas(block_id, data)
+
+    def setAttrPointer(self, block_id: List[int], attr_id: List[int] = None, divisor=0):
+        """
+        设置顶点属性指针，并记录下来，以便区间移动后重新设置
+        """
+        self._attr_pointers[repr(block_id)] = (block_id, attr_id, divisor)
+        super().setAttrPointer(block_id, attr_id, divisor)
+        self._attrs_dirty = False
+
+    def bindAttrs(self):
+        """
+        区间移动后按新的位置重新设置属性指针（需要先绑定VAO）
+        """
+        if not self._attrs_dirty:
+            return
+        for block_id, attr_id, divisor in self._attr_pointers.values():
+            super().setAttrPointer(block_id, attr_id, divisor)
+        self._attrs_dirty = False
+
+    def delete(self):
+        """
+        归还区间（共享的缓冲区不删除）
+        """
+        if self._page is not None:
+            self._pool.free(self._page, self._base_offset)
+            self._page = None
+            self._vbo = None
+
 
 class VAO:
     TAG = "VAO"
@@ -419,6 +868,7 @@ class EBO:
         """
         return self._ebo == gl.glGetIntegerv(gl.GL_ELEMENT_ARRAY_BUFFER_BINDING)
 
+    @trace_it("EBO.updateData", "upload")
     def updateData(self, indices: np.ndarray):
         """
         更新索引数据到缓冲区。
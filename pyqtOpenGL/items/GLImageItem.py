@@ -5,7 +5,10 @@ from .BufferObject import VAO, VBO
 from .texture import Texture2D
 import numpy as np
 import OpenGL.GL as gl
+from PyQt5 import sip
+from PyQt5.QtCore import QMetaObject, Qt
 from pathlib import Path
+from typing import Union
 
 BASE_DIR = Path(__file__).resolve().parent
 
@@ -17,7 +20,7 @@ class GLImageItem(GLGraphicsItem):
 
     def __init__(
             self,
-            img: np.ndarray = None,
+            img: Union[np.ndarray, str, Path] = None,
             left_bottom=(0, 0),  # 左下角坐标 0 ~ 1
             width_height=(1, 1),  # 宽高 0 ~ 1
             glOptions='translucent',
@@ -25,7 +28,8 @@ class GLImageItem(GLGraphicsItem):
             selectable=True
     ):
         """
-        :param img: image data, np.ndarray, shape=(h, w, 3), dtype=np.uint8
+        :param img: image data, np.ndarray, shape=(h, w, 3), dtype=np.uint8;
+                    或图片路径，在后台线程中解码，相同的图片共享一个纹理（TextureCache）
         :param left_bottom: left bottom position, (0, 0) ~ (1, 1)
         :param width_height: width and height, (0, 0) ~ (1, 1)
         :param glOptions: 'opaque' or 'translucent'
@@ -37,7 +41,7 @@ class GLImageItem(GLGraphicsItem):
         self._tex_update_flag = False
         self._vbo_update_flag = False
         self._img = None
-        self.texture = None
+        self.texture = Texture2D(None, flip_y=True)
         self.left_bottom = None
         self.width_height = None
         self.vertices = np.array([
@@ -58,7 +62,6 @@ class GLImageItem(GLGraphicsItem):
         self.vao = VAO()
         self.vbo = VBO([self.vertices], [[3, 2]], usage=gl.GL_STATIC_DRAW)
         self.vbo.setAttrPointer([0], attr_id=[[0, 1]])
-        self.texture = Texture2D(None, flip_y=True)
 
     def updateGL(self):
         if not self._tex_update_flag and not self._vbo_update_flag:
@@ -74,6 +77,9 @@ class GLImageItem(GLGraphicsItem):
         if isinstance(img, np.ndarray):
             self._img = img.astype(np.uint8)
             self._tex_update_flag = True
+        elif isinstance(img, (str, Path)):
+            self._img = str(img)
+            self.texture.updateTexture(self._img)  # 立即开始后台解码
 
         if left_bottom is not None or width_height is not None:
             self._vbo_update_flag = True
@@ -99,9 +105,20 @@ class GLImageItem(GLGraphicsItem):
 
         self.update()
 
+    def _onTextureReady(self):
+        """
+        后台解码完成（在解码线程中调用）：通过Qt的队列连接在GUI线程中请求重绘
+        """
+        view = self.view()
+        if view is not None and not sip.isdeleted(view):
+            QMetaObject.invokeMethod(view, "update", Qt.QueuedConnection)
+
     def paint(self, model_matrix=Matrix4x4()):
         if self._img is None:
             return
+        if not self.texture.ready():  # 后台解码完成前不绘制，不阻塞GL线程
+            self.texture.request(self._onTextureReady)
+            return
         if not self.selected():
             self.updateGL()
             self.setupGLState()
@@ -120,6 +137,9 @@ class GLImageItem(GLGraphicsItem):
             self.paint_selected(model_matrix)
 
     def paint_selected(self, model_matrix=Matrix4x4()):
+        if not self.texture.ready():
+            self.texture.request(self._onTextureReady)
+            return
         self.updateGL()
         self.setupGLState()
 
@@ -1,6 +1,7 @@
 import OpenGL.GL as gl
 import numpy as np
 
+from utils.instancing import changed_range
 from .BufferObject import VBO, EBO, VAO
 from .MeshData import vertex_normal_smooth
 from .light import LightMixin
@@ -12,6 +13,10 @@ __all__ = ['GLInstancedMeshItem']
 
 
 class GLInstancedMeshItem(GLGraphicsItem, LightMixin):
+    """
+    实例化绘制同一个网格：所有实例一次绘制调用
+    每个实例有位置（pos）和颜色，可选每个实例的变换矩阵（transforms，作用在pos之前）和拾取颜色（pickColors）
+    """
 
     def __init__(
             self,
@@ -25,9 +30,12 @@ class GLInstancedMeshItem(GLGraphicsItem, LightMixin):
             opacity=1.,
             glOptions='opaque',
             calcNormals=True,
-            parentItem=None
+            parentItem=None,
+            transforms=None,  # nx4x4
+            selectable=False,
+            selectedColor=(0.1, 0.9, 1.0, 0.3)
     ):
-        super().__init__(parentItem=parentItem)
+        super().__init__(parentItem=parentItem, selectable=selectable, selectedColor=selectedColor)
         if color is None:
             color = [1., 1., 1.]
         if lights is None:
@@ -37,14 +45,34 @@ class GLInstancedMeshItem(GLGraphicsItem, LightMixin):
         self._indices = indices
         self._normals = normals
         self._pos = None
+        self._color = None
+        self._transforms = None
+        self._pickColors = None
+        self._inst_update_flag = False
+        self._inst_range = None  # 只需要上传的实例区间 [start, stop)，None表示整体上传
         self._calcNormals = calcNormals
         if self._calcNormals and self._normals is None and self._indices is not None:
             self._normals = vertex_normal_smooth(self._vertices, self._indices)
 
-        self.setData(pos, color, size, opacity)
+        self.setData(pos, color, size, opacity, transforms)
         self.addLight(lights)
 
-    def setData(self, pos=None, color=None, size=None, opacity=None):
+    def setData(self, pos=None, color=None, size=None, opacity=None, transforms=None):
+        """
+        :param pos: 每个实例的位置 nx3
+        :param color: 所有实例的颜色（3）或每个实例的颜色（nx3）
+        :param size: 网格的缩放
+        :param opacity: 不透明度
+        :param transforms: 每个实例的变换矩阵 nx4x4（按行排列，与 Matrix4x4.matrix44 相同），未给出pos时位置取零；
+            实例数量不变时只上传变化的实例
+        """
+        if transforms is not None:
+            transforms = np.asarray(transforms, dtype=np.float32).reshape(-1, 4, 4)
+            # 转置为列主序，每个实例连续16个float，对应着色器中mat4属性的4列
+            self._setTransforms(np.ascontiguousarray(transforms.transpose(0, 2, 1)).reshape(-1, 16))
+            if pos is None and (self._pos is None or self._pos.shape[0] != self._transforms.shape[0]):
+                pos = np.zeros((self._transforms.shape[0], 3), dtype=np.float32)
+
         if color is not None:
             self._color = np.array(color, dtype=np.float32)
             self._gl_update_flag = True
@@ -52,8 +80,10 @@ class GLInstancedMeshItem(GLGraphicsItem, LightMixin):
         if pos is not None:
             self._pos = np.array(pos, dtype=np.float32).reshape(-1, 3)
             self._gl_update_flag = True
-            if self._color is not None and self._color.size != self._pos.shape[0] * 3 and self._color.size >= 3:
-                self._color = np.tile(self._color.ravel()[:3], (max(self._pos.shape[0], 1), 1))
+
+        if self._pos is not None and self._color is not None and \
+                self._color.size != self._pos.shape[0] * 3 and self._color.size >= 3:
+            self._color = np.tile(self._color.ravel()[:3], (max(self._pos.shape[0], 1), 1))
 
         if opacity is not None:
             self._opacity = opacity
@@ -63,8 +93,38 @@ class GLInstancedMeshItem(GLGraphicsItem, LightMixin):
 
         self.update()
 
+    def setPickColors(self, pickColors):
+        """
+        设置每个实例的拾取颜色，拾取模式下按实例写入，使一个实例化绘制可以对应多个可选物体
+        :param pickColors: n个float32（PickColorManager分配的颜色），为None时所有实例使用本物体的拾取颜色
+        """
+        self._pickColors = None if pickColors is None else np.asarray(pickColors, dtype=np.float32).reshape(-1, 1)
+        self._inst_update_flag = True
+        self._inst_range = None
+
+    def _setTransforms(self, transforms: np.ndarray):
+        """
+        设置列主序的变换矩阵（nx16），记录需要上传的实例区间
+        """
+        old, self._transforms = self._transforms, transforms
+        rng = changed_range(old, transforms)
+        if rng is None:
+            return
+        if old is None or old.shape != transforms.shape:
+            self._inst_range = None
+        elif not self._inst_update_flag:
+            self._inst_range = rng
+        elif self._inst_range is not None:  # 与还没有上传的区间合并
+            self._inst_range = (min(self._inst_range[0], rng[0]), max(self._inst_range[1], rng[1]))
+        self._inst_update_flag = True
+
+    @property
+    def instanceCount(self) -> int:
+        return 0 if self._pos is None else self._pos.shape[0]
+
     def initializeGL(self):
         self.shader = Shader(vertex_shader, fragment_shader)
+        self.pick_shader = Shader(vertex_shader, pick_fragment_shader)
         self.vao = VAO()
         # cone
         self.vbo_mesh = VBO(
@@ -83,17 +143,64 @@ class GLInstancedMeshItem(GLGraphicsItem, LightMixin):
         self.vbo_pos = VBO([self._pos, self._color], [3, 3], usage=gl.GL_DYNAMIC_DRAW)
         self.vbo_pos.setAttrPointer([0, 1], [2, 3], divisor=1)
 
+        # 变换矩阵和拾取颜色，只在设置过时使用
+        self.vbo_inst = VBO([self._transforms, self._pickColors], [16, 1], usage=gl.GL_DYNAMIC_DRAW)
+        self._setInstAttrPointer()
+        self._gl_update_flag = False
+        self._inst_update_flag = False
+
+    def _setInstAttrPointer(self):
+        if self._transforms is not None:
+            self.vbo_inst.setAttrPointer([0], [[4, 5, 6, 7]], divisor=1)
+        if self._pickColors is not None:
+            self.vbo_inst.setAttrPointer([1], [8], divisor=1)
+            # 拾取颜色的数量可能与之后的实例数不同（上次拾取之后增加了实例），只在 paint_pickMode 中启用
+            gl.glDisableVertexAttribArray(8)
+
+    def _instancePick(self) -> bool:
+        """
+        是否按实例写入拾取颜色：拾取颜色与实例一一对应时才使用，否则会读取超出缓冲区的数据
+        """
+        return self._pickColors is not None and self._pickColors.shape[0] == self.instanceCount
+
     def updateGL(self):
-        if not self._gl_update_flag:
+        if not self._gl_update_flag and not self._inst_update_flag:
             return
 
         self.vao.bind()
-        self.vbo_pos.updateData([0, 1], [self._pos, self._color])
-        self.vbo_pos.setAttrPointer([0, 1], [2, 3], divisor=1)
+        if self._gl_update_flag:
+            self.vbo_pos.updateData([0, 1], [self._pos, self._color])
+            self.vbo_pos.setAttrPointer([0, 1], [2, 3], divisor=1)
+        if self._inst_update_flag:
+            if self._inst_range is not None:
+                start, stop = self._inst_range
+                self.vbo_inst.updateSubData(0, start * self._transforms.itemsize * 16, self._transforms[start:stop])
+            else:
+                self.vbo_inst.updateData([0, 1], [self._transforms, self._pickColors])
+            self._setInstAttrPointer()
         self._gl_update_flag = False
+        self._inst_update_flag = False
+        self._inst_range = None
+
+    def _draw(self):
+        if self._indices is not None:
+            self.ebo.bind()
+            gl.glDrawElementsInstanced(
+                gl.GL_TRIANGLES,
+                self._indices.size,
+                gl.GL_UNSIGNED_INT, None,
+                self.instanceCount,
+            )
+        else:
+            gl.glDrawArraysInstanced(
+                gl.GL_TRIANGLES,
+                0,
+                len(self._vertices),
+                self.instanceCount,
+            )
 
     def paint(self, model_matrix=Matrix4x4()):
-        if self._pos is None:
+        if not self.instanceCount:
             return
         self.updateGL()
         self.setupGLState()
@@ -107,25 +214,34 @@ class GLInstancedMeshItem(GLGraphicsItem, LightMixin):
             self.shader.set_uniform("ViewPos", self.view_pos(), "vec3")
             self.shader.set_uniform("size", self._size, "float")
             self.shader.set_uniform("calcNormal", self._calcNormals, "bool")
+            self.shader.set_uniform("useTransform", self._transforms is not None, "bool")
             self.shader.set_uniform("opacity", self._opacity, "float")
-
-            if self._indices is not None:
-                self.ebo.bind()
-                gl.glDrawElementsInstanced(
-                    gl.GL_TRIANGLES,
-                    self._indices.size,
-                    gl.GL_UNSIGNED_INT, None,
-                    self._pos.shape[0],
-                )
-            else:
-                gl.glDrawArraysInstanced(
-                    gl.GL_TRIANGLES,
-                    0,
-                    self._vertices.size,
-                    self._pos.shape[0],
-                )
+            self.shader.set_uniform("highlight", self.selected(), "bool")
+            self.shader.set_uniform("highlightColor", self._selectedColor, "vec4")
+            self._draw()
         # gl.glPolygonMode(gl.GL_FRONT_AND_BACK, gl.GL_FILL)
 
+    def paint_pickMode(self, model_matrix=Matrix4x4()):
+        if not self.instanceCount:
+            return
+        self.updateGL()
+        self.setupGLState()
+        self.vao.bind()
+        with self.pick_shader:
+            self.pick_shader.set_uniform("view", self.proj_view_matrix().glData, "mat4")
+            self.pick_shader.set_uniform("model", model_matrix.glData, "mat4")
+            self.pick_shader.set_uniform("size", self._size, "float")
+            self.pick_shader.set_uniform("calcNormal", False, "bool")
+            self.pick_shader.set_uniform("useTransform", self._transforms is not None, "bool")
+            instance_pick = self._instancePick()
+            self.pick_shader.set_uniform("instancePick", instance_pick, "bool")
+            self.pick_shader.set_uniform("pickColor", self.pickColor(), "float")
+            if instance_pick:
+                gl.glEnableVertexAttribArray(8)
+            self._draw()
+            if instance_pick:
+                gl.glDisableVertexAttribArray(8)
+
 
 vertex_shader = """
 #version 330 core
@@ -134,21 +250,28 @@ uniform mat4 model;
 uniform mat4 view;
 uniform float size;
 uniform bool calcNormal;
+uniform bool useTransform;
 
 layout (location = 0) in vec3 aPos;
 layout (location = 1) in vec3 aNormal;
 layout (location = 2) in vec3 stPos;
 layout (location = 3) in vec3 aColor;
+layout (location = 4) in mat4 aTransform;
+layout (location = 8) in float aPickColor;
 
 out vec3 FragPos;
 out vec3 Normal;
 out vec3 oColor;
+flat out float oPickColor;
 
 void main() {
     oColor = aColor;
-    FragPos = vec3(model * vec4(stPos + aPos*size, 1.0));
+    oPickColor = aPickColor;
+    mat4 instModel = useTransform ? aTransform : mat4(1.0);
+    instModel[3].xyz += stPos;
+    FragPos = vec3(model * instModel * vec4(aPos*size, 1.0));
     if (calcNormal){
-        Normal = normalize(mat3(transpose(inverse(model))) * aNormal);
+        Normal = normalize(mat3(transpose(inverse(model * instModel))) * aNormal);
     } else {
         Normal = vec3(0, 0, 1);
     }
@@ -156,6 +279,19 @@ void main() {
 }
 """
 
+pick_fragment_shader = """
+#version 330 core
+out vec4 FragColor;
+
+flat in float oPickColor;
+uniform bool instancePick;
+uniform float pickColor;
+
+void main() {
+    FragColor = vec4(instancePick ? oPickColor : pickColor, 0.0, 0.0, 1.0);
+}
+"""
+
 fragment_shader = """
 #version 330 core
 out vec4 FragColor;
@@ -166,6 +302,8 @@ in vec3 Normal;
 
 uniform float opacity;
 uniform vec3 ViewPos;
+uniform bool highlight;
+uniform vec4 highlightColor;
 
 struct PointLight {
     vec3 position;
@@ -222,6 +360,9 @@ void main() {
     if(nr_point_lights == 0){
         result = oColor;
     }
+    if(highlight){
+        result = mix(result, highlightColor.rgb, max(highlightColor.a, 0.5));
+    }
     FragColor = vec4(result, opacity);
 }
 """
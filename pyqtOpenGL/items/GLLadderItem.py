@@ -0,0 +1,67 @@
+"""
+直梯：两根竖杆和所有踏棍共享一个单位网格（方块或圆柱），一次实例化绘制
+"""
+from typing import Literal
+
+import numpy as np
+
+from utils.instancing import ladder_transforms
+from .GLInstancedMeshItem import GLInstancedMeshItem
+from .MeshData import cube, cylinder
+
+__all__ = ['GLLadderItem']
+
+
+def _unit_rod(shape: Literal["cylinder", "box"]):
+    """
+    以原点为中心、沿x轴、边长（直径）为1的单位网格
+    :return: vertexes, indices, normals
+    """
+    if shape == "cylinder":
+        verts, faces = cylinder([0.5, 0.5], 1., rows=1, cols=12)
+        # 圆柱沿z轴，从0到1，转到沿x轴并居中
+        verts = np.ascontiguousarray(verts[:, [2, 0, 1]] - [0.5, 0, 0], dtype=np.float32)
+        return verts, faces, None
+    verts, normals, _ = cube(1, 1, 1)
+    return np.ascontiguousarray(verts), None, np.ascontiguousarray(normals)
+
+
+class GLLadderItem(GLInstancedMeshItem):
+    """
+    梯子的局部坐标：底端中点为原点，沿y轴向上，宽度沿x轴
+    """
+
+    def __init__(
+            self,
+            length: float = 3.,
+            width: float = 0.5,
+            interval: float = 0.5,
+            material_width: float = 0.1,
+            shape: Literal["cylinder", "box"] = "box",
+            color=(0.5, 0.5, 0.5),
+            lights=None,
+            glOptions='translucent',
+            parentItem=None,
+            selectable=True,
+    ):
+        vertexes, indices, normals = _unit_rod(shape)
+        self._params = [length, width, interval, material_width]
+        super().__init__(
+            vertexes=vertexes, indices=indices, normals=normals,
+            lights=lights, color=[c / 255 for c in color] if isinstance(color[0], int) else color,
+            glOptions=glOptions, parentItem=parentItem, selectable=selectable,
+            transforms=ladder_transforms(length, width, interval, material_width),
+        )
+
+    def setParams(self, length: float = None, width: float = None, interval: float = None,
+                  material_width: float = None):
+        """
+        修改梯子参数，未给出的参数不变
+        """
+        for i, value in enumerate((length, width, interval, material_width)):
+            if value is not None:
+                self._params[i] = value
+        self.setData(transforms=ladder_transforms(*self._params))
+
+    def setColor(self, color):
+        self.setData(color=[c / 255 for c in color[:3]] if isinstance(color[0], int) else color[:3])
@@ -100,13 +100,24 @@ class GLMeshItem(GLGraphicsItem, LightMixin):
         self.selected_shader = Shader(mesh_vertex_shader, self.selected_fragment_shader)
         self._mesh.initializeGL()
 
-    def updateVertexes(self, vertexes: np.ndarray):
+    def updateVertexes(self, vertexes: np.ndarray, normals: np.ndarray = None):
         """
         更新网格的顶点数据。
 
         :param np.ndarray vertexes: 新的顶点数组。
+        :param np.ndarray normals: 新的法线数组，为 None 时根据顶点重新计算。
         """
-        self._mesh.update_vertexes(vertexes)
+        self._mesh.update_vertexes(vertexes, normals)
+
+    def updateVertexRanges(self, vertexes: np.ndarray, normals: np.ndarray, ranges):
+        """
+        更新网格的顶点数据，只上传变化的部分。
+
+        :param np.ndarray vertexes: 新的顶点数组（大小不变）。
+        :param np.ndarray normals: 新的法线数组。
+        :param list ranges: 变化的顶点区间 [(start, stop)]。
+        """
+        self._mesh.update_vertex_ranges(vertexes, normals, ranges)
 
     def updateVertex(self, index, vertex):
         """
@@ -0,0 +1,181 @@
+"""
+占位物体：没有实际绘制对象的组件（舰桥、梯子、栏杆、加载失败的模型等）显示为小球或方块
+每个组件仍然有自己的 GLPlaceholderItem（变换、选中、拾取、handler与普通物体相同），
+但它们不创建缓冲区和着色器，而是把本帧的模型矩阵和颜色登记到同一视图中共享的 PlaceholderBatch，
+由后者用一次实例化绘制画出所有同类占位物体
+"""
+import weakref
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .GLInstancedMeshItem import GLInstancedMeshItem
+from ..GLGraphicsItem import GLGraphicsItem
+from ..transform3d import Matrix4x4
+
+__all__ = ['GLPlaceholderItem', 'PlaceholderBatch']
+
+
+class PlaceholderBatch(GLInstancedMeshItem):
+    """
+    同一视图中同类占位物体共享的实例化网格
+    深度值最大，在所有物体之后绘制，此时本帧可见的占位物体都已经登记；实例数据没有变化时不重新上传
+    """
+    DEPTH_VALUE = 1000
+    _batches: 'weakref.WeakKeyDictionary[object, Dict[str, PlaceholderBatch]]' = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def get(cls, view, kind: str, vertexes, indices, normals) -> 'PlaceholderBatch':
+        """
+        获取视图中的共享网格，不存在或已被移出视图时创建并添加到视图
+        :param view: GLViewWidget
+        :param kind: 占位网格的种类（"sphere", "cube"）
+        :param vertexes: 网格顶点，只在第一次创建时使用
+        :param indices: 网格索引
+        :param normals: 网格法线
+        """
+        batches = cls._batches.setdefault(view, {})
+        batch = batches.get(kind)
+        if batch is None:
+            batch = batches[kind] = cls(vertexes, indices, normals)
+        if batch not in view.items:
+            view.addItem(batch)
+        return batch
+
+    def __init__(self, vertexes, indices, normals):
+        super().__init__(
+            vertexes=np.ascontiguousarray(vertexes, dtype=np.float32),
+            indices=None if indices is None else np.ascontiguousarray(indices, dtype=np.uint32),
+            normals=None if normals is None else np.ascontiguousarray(normals, dtype=np.float32),
+            glOptions='translucent', calcNormals=True,
+        )
+        self.setDepthValue(self.DEPTH_VALUE)
+        self._frame: List[Tuple[Tuple[float, ...], Tuple[float, float, float]]] = []
+        self._pick_frame: List[Tuple[Tuple[float, ...], float]] = []
+
+    def record(self, model_matrix: Matrix4x4, color):
+        self._frame.append((model_matrix.data(), color))
+
+    def recordPick(self, model_matrix: Matrix4x4, pick_color):
+        self._pick_frame.append((model_matrix.data(), pick_color))
+
+    def _setInstances(self, matrices, colors=None, pick_colors=None) -> bool:
+        """
+        设置本帧的实例（matrices为列主序的模型矩阵），与上次相同时不做任何事
+        :return: 是否有实例
+        """
+        transforms = np.array(matrices, dtype=np.float32).reshape(-1, 16)
+        if transforms.shape[0] == 0:
+            return False
+        if self._transforms is None or not np.array_equal(transforms, self._transforms):
+            self._setTransforms(transforms)
+            if self._pos is None or self._pos.shape[0] != transforms.shape[0]:
+                self._pos = np.zeros((transforms.shape[0], 3), dtype=np.float32)
+                self._gl_update_flag = True
+        if colors is not None:
+            colors = np.array(colors, dtype=np.float32).reshape(-1, 3)
+            if self._color is None or not np.array_equal(colors, self._color):
+                self._color = colors
+                self._gl_update_flag = True
+        if pick_colors is not None:
+            pick_colors = np.array(pick_colors, dtype=np.float32).reshape(-1, 1)
+            if self._pickColors is None or not np.array_equal(pick_colors, self._pickColors):
+                self.setPickColors(pick_colors)
+        return True
+
+    def paint(self, model_matrix=Matrix4x4()):
+        frame, self._frame = self._frame, []
+        if frame and self._setInstances(*zip(*frame)):
+            super().paint(model_matrix)
+
+    def drawItemTree_pickMode(self, model_matrix=Matrix4x4()):
+        # 本身不可选，但需要在拾取模式下绘制登记的占位物体（每个实例使用各自物体的拾取颜色）
+        self.initialize()
+        frame, self._pick_frame = self._pick_frame, []
+        if not frame:
+            return
+        matrices, pick_colors = zip(*frame)
+        if self._color is None or self._color.shape[0] != len(matrices):
+            colors = np.ones((len(matrices), 3), dtype=np.float32)
+        else:
+            colors = None
+        if self._setInstances(matrices, colors, pick_colors):
+            self.paint_pickMode(model_matrix)
+
+
+class GLPlaceholderItem(GLGraphicsItem):
+    """
+    占位物体，接口与 GLMeshItem 相同的部分：变换、可见性、选中、拾取、addLight
+    """
+
+    def __init__(
+            self,
+            kind: str,
+            vertexes,
+            indices=None,
+            normals=None,
+            lights=None,
+            color=(1., 1., 1.),
+            parentItem=None,
+            selectable=True,
+            selectedColor=(0.1, 0.9, 1.0, 0.3)
+    ):
+        """
+        :param kind: 占位网格的种类，同一视图中种类相同的占位物体共享网格
+        :param vertexes: 网格顶点（同种类的占位物体应该相同）
+        :param indices: 网格索引
+        :param normals: 网格法线
+        :param lights: 光源，添加到共享网格
+        :param color: 颜色，0~255的整数或0~1的浮点数
+        """
+        super().__init__(parentItem=parentItem, selectable=selectable, selectedColor=selectedColor)
+        self._kind = kind
+        self._mesh = (vertexes, indices, normals)
+        self._lights = list(lights) if lights else []
+        self._batch = None
+        self._color = (1., 1., 1.)
+        self.setColor(color)
+
+    def setColor(self, color):
+        if isinstance(color[0], (int, np.integer)):
+            color = [c / 255 for c in color]
+        self._color = tuple(float(c) for c in color[:3])
+        self.update()
+
+    def color(self):
+        return self._color
+
+    def addLight(self, lights):
+        if not isinstance(lights, list):
+            lights = [lights]
+        self._lights.extend(light for light in lights if light not in self._lights)
+        if self._batch is not None:
+            self._batch.addLight(self._lights)
+
+    def setDrawLine(self, drawLine: bool):
+        """
+        占位物体不绘制线框
+        """
+        pass
+
+    def setView(self, v, children=False):
+        super().setView(v, children)
+        if v is not None:
+            self._batch = PlaceholderBatch.get(v, self._kind, *self._mesh)
+            self._batch.addLight(self._lights)
+
+    def paint(self, model_matrix=Matrix4x4()):
+        if self._batch is None:
+            return
+        if self.selected():
+            # 选中时混合选中颜色
+            r, g, b, a = self._selectedColor
+            a = max(a, 0.5)
+            color = tuple(c * (1 - a) + s * a for c, s in zip(self._color, (r, g, b)))
+        else:
+            color = self._color
+        self._batch.record(model_matrix, color)
+
+    def paint_pickMode(self, model_matrix=Matrix4x4()):
+        if self._batch is not None:
+            self._batch.recordPick(model_matrix, self.pickColor())
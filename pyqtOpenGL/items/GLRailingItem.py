@@ -0,0 +1,83 @@
+"""
+栏杆（立柱+扶手）和栏板：所有立柱、扶手或栏板共享一个单位方块，整条栏杆一次实例化绘制
+"""
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils.instancing import railing_transforms
+from .GLInstancedMeshItem import GLInstancedMeshItem
+from .MeshData import cube
+
+__all__ = ['GLRailingItem']
+
+
+class GLRailingItem(GLInstancedMeshItem):
+    """
+    沿一条或多条路径（栏杆的底边）生成立柱和扶手；interval为None时为栏板
+    修改路径或参数后只重新计算实例矩阵，实例数量不变时只上传变化的部分
+    """
+
+    def __init__(
+            self,
+            paths: Sequence[Tuple[Sequence, bool]] = (),
+            height: float = 1.2,
+            interval: Optional[float] = 1.0,
+            thickness: float = 0.1,
+            color=(0.5, 0.5, 0.5),
+            lights=None,
+            glOptions='translucent',
+            parentItem=None,
+            selectable=True,
+    ):
+        """
+        :param paths: [(路径顶点 nx3, 是否闭合)]
+        :param height: 栏杆高度
+        :param interval: 立柱间距，None表示栏板
+        :param thickness: 厚度
+        :param color: 颜色，0~255的整数或0~1的浮点数
+        """
+        vertexes, normals, _ = cube(1, 1, 1)
+        self._paths: List[Tuple[np.ndarray, bool]] = []
+        self._height = height
+        self._interval = interval
+        self._thickness = thickness
+        super().__init__(
+            vertexes=np.ascontiguousarray(vertexes), normals=np.ascontiguousarray(normals),
+            lights=lights, color=self._toColor(color), glOptions=glOptions,
+            parentItem=parentItem, selectable=selectable,
+        )
+        self.setPaths(paths)
+
+    @staticmethod
+    def _toColor(color):
+        if isinstance(color[0], (int, np.integer)):
+            return [c / 255 for c in color[:3]]
+        return list(color[:3])
+
+    def setPaths(self, paths: Sequence[Tuple[Sequence, bool]]):
+        self._paths = [(np.asarray(points, dtype=np.float32).reshape(-1, 3), bool(closed)) for points, closed in paths]
+        self._rebuild()
+
+    def setParams(self, height: float = None, interval: Optional[float] = ..., thickness: float = None):
+        """
+        修改栏杆参数，未给出的参数不变（interval可以设为None变为栏板）
+        """
+        if height is not None:
+            self._height = height
+        if interval is not ...:
+            self._interval = interval
+        if thickness is not None:
+            self._thickness = thickness
+        self._rebuild()
+
+    def setColor(self, color):
+        self.setData(color=self._toColor(color))
+
+    def _rebuild(self):
+        transforms = railing_transforms(self._paths, self._height, self._interval, self._thickness)
+        if transforms.shape[0] == 0:
+            self._pos = None
+            self.update()
+            return
+        self.setData(transforms=transforms)
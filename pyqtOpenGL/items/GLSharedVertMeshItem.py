@@ -1,4 +1,5 @@
-from typing import List
+from ctypes import c_void_p
+from typing import List, Optional
 
 import OpenGL.GL as gl
 import numpy as np
@@ -18,10 +19,13 @@ class GLSharedVertMeshItem(GLGraphicsItem, LightMixin):
     """
     GLSharedVertMeshItem 类表示 OpenGL 中的 3D 网格项，
     该类支持使用共享的顶点数组对象（VAO）。
+    VAO 绑定了索引缓冲区（EBO）时传入 indexCount，使用 glDrawElements 绘制共享顶点的索引网格
+    （例如 SymetryCylinderMesh.indexedVertexes 的结果）。
 
     属性:
         vao (int): 顶点数组对象的ID。
         vertexCount (int): 顶点数量。
+        indexCount (int): 索引数量，为None时不使用索引。
         lights (list): 影响网格的光源列表。
         material (object): 网格的材质属性。
         drawLine (bool): 指示是否以线框模式绘制网格的标志。
@@ -45,7 +49,8 @@ class GLSharedVertMeshItem(GLGraphicsItem, LightMixin):
             selectable=False,
             lineColor=(0.0, 0.0, 0.0, 0.2),
             lineWidth=0.6,
-            selectedColor=(0.1, 0.9, 1.0, 0.3)
+            selectedColor=(0.1, 0.9, 1.0, 0.3),
+            indexCount: Optional[int] = None
     ):
         """
         初始化 GLSharedVertMeshItem 实例。
@@ -61,6 +66,7 @@ class GLSharedVertMeshItem(GLGraphicsItem, LightMixin):
         :param tuple lineColor: 线框颜色。
         :param float lineWidth: 线框宽度。
         :param tuple selectedColor: 项被选择时使用的颜色。
+        :param int indexCount: 索引数量（GL_UNSIGNED_INT），为None时按顶点数组绘制。
         """
         super().__init__(parentItem=parentItem, selectable=selectable, selectedColor=selectedColor)
 
@@ -71,6 +77,7 @@ class GLSharedVertMeshItem(GLGraphicsItem, LightMixin):
 
         self.vao = vao
         self.vertexCount = vertexCount
+        self.indexCount = indexCount
         self.material = material
         self.drawLine = drawLine
         self.lineWidth = lineWidth
@@ -86,6 +93,17 @@ class GLSharedVertMeshItem(GLGraphicsItem, LightMixin):
         self.pick_shader = Shader(mesh_vertex_shader, self.pick_fragment_shader)
         self.selected_shader = Shader(mesh_vertex_shader, self.selected_fragment_shader)
 
+    def _drawVAO(self):
+        """
+        绘制共享的 VAO：有索引时使用 glDrawElements，否则使用 glDrawArrays
+        """
+        gl.glBindVertexArray(self.vao)
+        if self.indexCount is not None:
+            gl.glDrawElements(gl.GL_TRIANGLES, self.indexCount, gl.GL_UNSIGNED_INT, c_void_p(0))
+        else:
+            gl.glDrawArrays(gl.GL_TRIANGLES, 0, self.vertexCount)
+        gl.glBindVertexArray(0)
+
     def paint(self, model_matrix=Matrix4x4()):
         """
         绘制网格。
@@ -102,9 +120,7 @@ class GLSharedVertMeshItem(GLGraphicsItem, LightMixin):
                 self.shader.set_uniform("paintLine", False, "bool")
                 self.shader.set_uniform("ViewPos", self.view_pos(), "vec3")
 
-                gl.glBindVertexArray(self.vao)
-                gl.glDrawArrays(gl.GL_TRIANGLES, 0, self.vertexCount)
-                gl.glBindVertexArray(0)
+                self._drawVAO()
 
             if self.drawLine:
                 gl.glLineWidth(self.lineWidth)
@@ -118,9 +134,7 @@ class GLSharedVertMeshItem(GLGraphicsItem, LightMixin):
                     self.shader.set_uniform("lineColor", self.lineColor, "vec4")
                     self.shader.set_uniform("ViewPos", self.view_pos(), "vec3")
 
-                    gl.glBindVertexArray(self.vao)
-                    gl.glDrawArrays(gl.GL_TRIANGLES, 0, self.vertexCount)
-                    gl.glBindVertexArray(0)
+                    self._drawVAO()
 
                 gl.glPolygonMode(gl.GL_FRONT_AND_BACK, gl.GL_FILL)
                 gl.glDepthFunc(gl.GL_LESS)
@@ -143,9 +157,7 @@ class GLSharedVertMeshItem(GLGraphicsItem, LightMixin):
             self.shader.set_uniform("highlight", True, "bool")
             self.shader.set_uniform("ViewPos", self.view_pos(), "vec3")
 
-            gl.glBindVertexArray(self.vao)
-            gl.glDrawArrays(gl.GL_TRIANGLES, 0, self.vertexCount)
-            gl.glBindVertexArray(0)
+            self._drawVAO()
 
             self.shader.set_uniform("highlight", False, "bool")
 
@@ -159,9 +171,7 @@ class GLSharedVertMeshItem(GLGraphicsItem, LightMixin):
             self.shader.set_uniform("lineColor", self._selectedColor, "vec4")
             self.shader.set_uniform("ViewPos", self.view_pos(), "vec3")
 
-            gl.glBindVertexArray(self.vao)
-            gl.glDrawArrays(gl.GL_TRIANGLES, 0, self.vertexCount)
-            gl.glBindVertexArray(0)
+            self._drawVAO()
 
         gl.glPolygonMode(gl.GL_FRONT_AND_BACK, gl.GL_FILL)
 
@@ -178,9 +188,7 @@ class GLSharedVertMeshItem(GLGraphicsItem, LightMixin):
             self.pick_shader.set_uniform("model", model_matrix.glData, "mat4")
             self.pick_shader.set_uniform("pickColor", self.pickColor(), "float")
 
-            gl.glBindVertexArray(self.vao)
-            gl.glDrawArrays(gl.GL_TRIANGLES, 0, self.vertexCount)
-            gl.glBindVertexArray(0)
+            self._drawVAO()
 
     def setMaterial(self, material):
         """
@@ -1,12 +1,13 @@
 import sys
-from typing import Literal
+import weakref
+from typing import Dict, Literal
 
 from ..GLGraphicsItem import GLGraphicsItem
 from ..transform3d import Matrix4x4
 from .shader import Shader
 from .BufferObject import VAO, VBO
-from .texture import Texture2D
-from PIL import Image, ImageDraw, ImageFont
+from .texture import Texture2D, _share_group
+from utils.glyph_atlas import GlyphAtlas
 import numpy as np
 import OpenGL.GL as gl
 from pathlib import Path
@@ -16,8 +17,49 @@ BASE_DIR = Path(__file__).resolve().parent
 __all__ = ['GLTextItem']
 
 
+class _AtlasTexture:
+    """
+    图集对应的纹理，同一GL共享组中使用同一图集的文本共享；图集加入新字形后重新上传
+    多个编辑窗口的GL上下文不共享对象，因此按 (图集, 共享组) 分别创建纹理，与 TextureCache 相同；
+    图集用弱引用作为键，图集被回收后对应的项自动移除
+    """
+    _textures: 'weakref.WeakKeyDictionary[GlyphAtlas, Dict[int, _AtlasTexture]]' = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def get(cls, atlas: GlyphAtlas) -> '_AtlasTexture':
+        """
+        获取图集在当前GL上下文的共享组中的纹理，需要当前GL上下文
+        """
+        groups = cls._textures.get(atlas)
+        if groups is None:
+            groups = cls._textures[atlas] = {}
+        group = _share_group()
+        texture = groups.get(group)
+        if texture is None:
+            texture = groups[group] = cls(atlas)
+        return texture
+
+    def __init__(self, atlas: GlyphAtlas):
+        self._atlas = weakref.ref(atlas)  # 不延长图集的生命周期
+        self.tex = Texture2D(None, tex_type=None, min_filter=gl.GL_LINEAR, wrap_s=gl.GL_CLAMP_TO_EDGE,
+                             wrap_t=gl.GL_CLAMP_TO_EDGE, generate_mipmaps=False)
+        self._version = -1
+
+    def bind(self) -> Texture2D:
+        atlas = self._atlas()
+        if atlas is not None and self._version != atlas.version:
+            self.tex.updateTexture(atlas.image.copy())
+            self._version = atlas.version
+        self.tex.bind()
+        return self.tex
+
+
 class GLTextItem(GLGraphicsItem):
-    """Draws points at a list of 3D positions."""
+    """
+    文本标签
+    字形来自按字体和字号共享的SDF图集（utils.glyph_atlas），每个字形是一个实例化的四边形；
+    修改文本只重新排版并更新很小的实例缓冲区，不再重新光栅化整段文字和上传新纹理
+    """
     align_map = {
         "TL": np.array([0, 0], np.float32),
         "TC": np.array([0.5, 0], np.float32),
@@ -48,62 +90,48 @@ class GLTextItem(GLGraphicsItem):
         self.setGLOptions(glOptions)
         self.setDepthValue(100)
         self._fixed = fixed
-        self._tex_update_flag = False
-        self._wh_update_flag = False
+        self._layout_update_flag = False
         self._pixel_wh = [0, 0]
-        self._text_w = 0
-        self._text_h = 0
         self._align = align
-        self.vertices = np.array([
-            # 顶点坐标             # texcoord
-            -1, -1, 0, 0.0, 0.0,
-            1, -1, 0, 1.0, 0.0,
-            1, 1, 0, 1.0, 1.0,
-            1, 1, 0, 1.0, 1.0,
-            -1, 1, 0, 0.0, 1.0,
-            -1, -1, 0, 0.0, 0.0,
-        ], dtype=np.float32).reshape(-1, 5)
+        self._text = None
+        self._font = None
+        self._fontsize = None
+        self._atlas = None
+        self._quads = np.zeros((0, 8), np.float32)
+        # 单位四边形的四个角（三角形带），每个字形实例按 [x, y, w, h] 缩放
+        self.corners = np.array([0, 0, 1, 0, 0, 1, 1, 1], dtype=np.float32).reshape(-1, 2)
 
         self.setData(text, font, color, fontsize, pos)
 
     def initializeGL(self):
         self.shader = Shader(vertex_shader, fragment_shader)
         self.vao = VAO()
-        self.vbo = VBO([self.vertices], [[3, 2]], usage=gl.GL_STATIC_DRAW)
-        self.vbo.setAttrPointer([0], attr_id=[[0, 1]])
-        self.tex = Texture2D(None, flip_y=True, wrap_s=gl.GL_CLAMP_TO_EDGE, wrap_t=gl.GL_CLAMP_TO_EDGE)
+        self.vbo = VBO([self.corners, None], [2, [4, 4]], usage=gl.GL_DYNAMIC_DRAW)
+        self.vbo.setAttrPointer([0], attr_id=[0])
+        self._layout_update_flag = True
 
     def updateGL(self):
-        if self._tex_update_flag:
-            self.tex.updateTexture(self._image)
-            self._tex_update_flag = False
-
-        if self._wh_update_flag:
-            w, h = self._text_w, self._text_h
-            self.vertices[:, :3] = np.array([
-                [0, 0, 0], [w, 0, 0],
-                [w, h, 0], [w, h, 0],
-                [0, h, 0], [0, 0, 0]
-            ])
-
-            self.vbo.updateData([0], [self.vertices])
-            self._wh_update_flag = False
+        if not self._layout_update_flag:
+            return
+        self.vao.bind()
+        self.vbo.updateData([1], [self._quads])
+        self.vbo.setAttrPointer([0, 1], attr_id=[0, [1, 2]], divisor=[0, 1])
+        self._layout_update_flag = False
 
     def setData(self, text: str = None, font=None, color=None, fontsize=None, pos=None):
         if text is not None:
             self._text = text
-            self._tex_update_flag = True
+            self._layout_update_flag = True
         if color is not None:
-            self._color = np.array(color)
-            if np.max(self._color) <= 1:
-                self._color = (self._color * 255).astype(np.uint8)
+            self._color = np.array(color, dtype=np.float32)
+            if np.max(self._color) > 1:
+                self._color = self._color / 255
             if self._color.shape[0] == 3:
-                self._color = np.append(self._color, 255)
-            self._tex_update_flag = True
+                self._color = np.append(self._color, 1.)
         if font is not None:
             self._font = font
-            self._tex_update_flag = True
-        else:
+            self._layout_update_flag = True
+        elif self._font is None:
             if sys.platform == "win32":
                 self._font = "Deng.ttf"
             elif sys.platform in ("linux", "linux2"):
@@ -111,15 +139,11 @@ class GLTextItem(GLGraphicsItem):
 
         if fontsize is not None:
             self._fontsize = fontsize
-            self._tex_update_flag = True
+            self._layout_update_flag = True
 
-        if self._tex_update_flag:
-            font = ImageFont.truetype(self._font, self._fontsize, encoding="unic")  # Deng.ttf, msyh.ttc
-            self._pixel_wh = np.array(font.getbbox(text)[2:])
-            image = Image.new("RGBA", tuple(self._pixel_wh), (0, 0, 0, 0))  # 背景透明
-            draw = ImageDraw.Draw(image)
-            draw.text((0, 0), self._text, font=font, fill=tuple(self._color), encoding="utf-8")
-            self._image = np.array(image, np.uint8)
+        if self._layout_update_flag:
+            self._atlas = GlyphAtlas.get(self._font, self._fontsize)
+            self._quads, self._pixel_wh = self._atlas.layout(self._text or "")
 
         if pos is not None:
             self._pos = np.array(pos)
@@ -127,49 +151,45 @@ class GLTextItem(GLGraphicsItem):
         self.update()
 
     def paint(self, model_matrix=Matrix4x4()):
-        if self._text is None:
+        if not self._text or len(self._quads) == 0:
             return
 
-        # calc text box size (w, h), mantain pixel size
+        # 保持文字的像素大小：计算每个像素对应的长度
         if self._fixed:
-            w = self._pixel_wh[0] * 2 / self.view().deviceWidth()
-            h = self._pixel_wh[1] * 2 / self.view().deviceHeight()
+            scale = [2 / self.view().deviceWidth(), 2 / self.view().deviceHeight()]
             pos = self._pos * 2 - 1  # map to [-1, 1]
             pos[2] = 0
         else:
             pixelsize = self.view().pixelSize(model_matrix * self._pos)
-            w = self._pixel_wh[0] * pixelsize
-            h = self._pixel_wh[1] * pixelsize
+            scale = [pixelsize, pixelsize]
             pos = self._pos
 
-        if w != self._text_w or h != self._text_h:
-            self._wh_update_flag = True
-            self._text_w = w
-            self._text_h = h
-
         self.updateGL()
         self.setupGLState()
 
         self.shader.set_uniform("align_data", self.align_map[self._align], "vec2")
-        self.shader.set_uniform("wh", [w, h], "vec2")
+        self.shader.set_uniform("scale", scale, "vec2")
+        self.shader.set_uniform("text_size", self._pixel_wh, "vec2")
         self.shader.set_uniform("proj", self.proj_matrix().glData, "mat4")
         self.shader.set_uniform("view", self.view_matrix().glData, "mat4")
         self.shader.set_uniform("model", model_matrix.glData, "mat4")
         self.shader.set_uniform("isFixed", self._fixed, "bool")
         self.shader.set_uniform("text_pos", pos, "vec3")
-        self.tex.bind()
-        self.shader.set_uniform("texture1", self.tex, "sample2D")
+        self.shader.set_uniform("color", self._color, "vec4")
+        tex = _AtlasTexture.get(self._atlas).bind()
+        self.shader.set_uniform("atlas", tex, "sample2D")
 
         with self.shader:
             self.vao.bind()
-            gl.glDrawArrays(gl.GL_TRIANGLES, 0, 6)
+            gl.glDrawArraysInstanced(gl.GL_TRIANGLE_STRIP, 0, 4, len(self._quads))
 
 
 vertex_shader = """
 #version 330 core
 
 uniform vec2 align_data;
-uniform vec2 wh;
+uniform vec2 scale;  // 每个像素对应的长度
+uniform vec2 text_size;  // 文本的像素尺寸
 
 uniform mat4 model;
 uniform mat4 view;
@@ -177,22 +197,24 @@ uniform mat4 proj;
 uniform bool isFixed;
 uniform vec3 text_pos;
 
-layout (location = 0) in vec3 iPos;
-layout (location = 1) in vec2 iTexCoord;
+layout (location = 0) in vec2 iCorner;
+layout (location = 1) in vec4 iRect;  // 字形格子 x, y, w, h（像素，原点在文本左上角，y向下）
+layout (location = 2) in vec4 iUV;  // u0, v0, u1, v1
 
 out vec2 TexCoord;
 
 void main() {
+    vec2 pixel = iRect.xy + iCorner * iRect.zw;
+    vec3 iPos = vec3(pixel.x * scale.x, (text_size.y - pixel.y) * scale.y, 0.0);
     if (isFixed) {
         gl_Position = vec4(text_pos + iPos, 1.0);
     } else {
-        //gl_Position = vec4(text_pos + iPos, 1.0);
         vec4 tpos = view * model * vec4(text_pos, 1.0);
         gl_Position = proj * vec4(tpos.xyz + iPos, 1.0);
-        vec2 offset = align_data * wh;
+        vec2 offset = align_data * text_size * scale;
         gl_Position.xy -= offset;
     }
-    TexCoord =iTexCoord;
+    TexCoord = mix(iUV.xy, iUV.zw, iCorner);
 }
 """
 
@@ -201,9 +223,15 @@ fragment_shader = """
 out vec4 FragColor;
 
 in vec2 TexCoord;
-uniform sampler2D texture1;
+uniform sampler2D atlas;
+uniform vec4 color;
 
 void main() {
-    FragColor = texture(texture1, TexCoord);
+    // 距离场0.5处为字形边缘，按屏幕空间的变化率做抗锯齿
+    float dist = texture(atlas, TexCoord).r;
+    float width = max(fwidth(dist), 1e-4) * 0.75;
+    float alpha = smoothstep(0.5 - width, 0.5 + width, dist);
+    if (alpha <= 0.0) discard;
+    FragColor = vec4(color.rgb, color.a * alpha);
 }
 """
@@ -0,0 +1,225 @@
+"""
+分块、分级加载的图片，用于超大的参考图片
+"""
+from typing import Union
+
+import numpy as np
+import OpenGL.GL as gl
+from PyQt5 import sip
+from PyQt5.QtCore import QMetaObject, Qt
+
+from utils.image_pyramid import ImagePyramid, TileCache
+from utils.perf_trace import trace_span
+from ..GLGraphicsItem import GLGraphicsItem
+from ..transform3d import Matrix4x4
+from .shader import Shader
+from .BufferObject import VAO, VBO
+
+__all__ = ['GLTiledImageItem']
+
+
+class GLTiledImageItem(GLGraphicsItem):
+    """
+    Display a huge image as GPU tiles.
+    图片被切分为金字塔瓦片，每帧只上传当前相机距离下可见的瓦片；
+    尚未上传的瓦片用已上传的上级瓦片代替显示，最顶层的瓦片常驻显存。
+    由路径创建时，每一级在需要时才在后台从文件解码，内存中的级别受cpu_budget限制。
+    """
+    TEXTURE_BUDGET = 256 * 1024 * 1024  # 瓦片纹理的显存预算（字节）
+    MAX_UPLOADS_PER_FRAME = 4  # 每帧最多上传的瓦片数，剩余的在之后的帧中继续上传
+
+    Format = {1: gl.GL_RED, 3: gl.GL_RGB, 4: gl.GL_RGBA}
+    InternalFormat = {1: gl.GL_R8, 3: gl.GL_RGB8, 4: gl.GL_RGBA8}
+
+    def __init__(
+            self,
+            img: Union[np.ndarray, str],
+            tile_size=ImagePyramid.TILE_SIZE,
+            texture_budget=TEXTURE_BUDGET,
+            cpu_budget=ImagePyramid.CPU_BUDGET,
+            glOptions='translucent',
+            parentItem=None,
+            selectable=True
+    ):
+        """
+        :param img: image data, np.ndarray, shape=(h, w, c), dtype=np.uint8，或图片路径（按需解码）
+        :param tile_size: 瓦片边长
+        :param texture_budget: 瓦片纹理的显存预算（字节）
+        :param cpu_budget: 由路径创建时，内存中解码后的级别的字节预算
+        :param glOptions: 'opaque' or 'translucent'
+        """
+        super().__init__(parentItem=parentItem, selectable=selectable, depthValue=0)
+        self.setGLOptions(glOptions)
+        with trace_span("ImagePyramid", "texture"):
+            if isinstance(img, np.ndarray):
+                self.pyramid = ImagePyramid(img.astype(np.uint8, copy=False), tile_size)
+            else:
+                self.pyramid = ImagePyramid.from_file(str(img), tile_size, cpu_budget)
+        self.cache = TileCache(texture_budget, on_evict=self._delete_texture)
+        self.current_level = self.pyramid.top_level
+        self._protected = set()  # 当前帧使用的瓦片，不会被淘汰
+        self.quad = np.array([
+            0, 0, 1, 0, 1, 1,
+            1, 1, 0, 1, 0, 0,
+        ], dtype=np.float32).reshape(-1, 2)
+
+    @property
+    def texture_nbytes(self) -> int:
+        """
+        当前占用的瓦片纹理显存
+        """
+        return self.cache.nbytes
+
+    def initializeGL(self):
+        self.shader = Shader(vertex_shader, fragment_shader)
+        self.pick_shader = Shader(vertex_shader, self.pick_fragment_shader)
+        self.vao = VAO()
+        self.vbo = VBO([self.quad], [2], usage=gl.GL_STATIC_DRAW)
+        self.vbo.setAttrPointer([0], attr_id=[0])
+
+    def _upload_tile(self, key):
+        """
+        上传一个瓦片到显存，并放入缓存
+        """
+        level, ix, iy = key
+        tile = self.pyramid.tile(level, ix, iy)
+        channels = 1 if tile.ndim == 2 else tile.shape[2]
+        gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
+        tex_id = gl.glGenTextures(1)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, tex_id)
+        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, self.InternalFormat[channels], tile.shape[1], tile.shape[0], 0,
+                        self.Format[channels], gl.GL_UNSIGNED_BYTE, tile)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S, gl.GL_CLAMP_TO_EDGE)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T, gl.GL_CLAMP_TO_EDGE)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR)
+        gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 4)
+        self.cache.put(key, tex_id, self.pyramid.tile_nbytes(level, ix, iy), protected=self._protected)
+
+    @staticmethod
+    def _delete_texture(_key, tex_id):
+        gl.glDeleteTextures([tex_id])
+
+    def _onLevelReady(self):
+        """
+        后台解码完成（在解码线程中调用）：通过Qt的队列连接在GUI线程中请求重绘
+        """
+        view = self.view()
+        if view is not None and not sip.isdeleted(view):
+            QMetaObject.invokeMethod(view, "update", Qt.QueuedConnection)
+
+    def _stream_tiles(self, model_matrix):
+        """
+        选择级别和可见瓦片，上传其中尚未上传的部分
+        :return: 本帧要绘制的 [(瓦片, 纹理所在的瓦片)]
+        """
+        mvp = (self.proj_matrix() * self.view_matrix() * model_matrix).matrix44
+        view = self.view()
+        level = self.pyramid.select_level(mvp, (view.deviceWidth(), view.deviceHeight()))
+        self.current_level = level
+        visible = [(level, ix, iy) for ix, iy in self.pyramid.visible_tiles(level, mvp)]
+        top = (self.pyramid.top_level, 0, 0)
+        self._protected = set(visible) | {top}
+        self.pyramid.protect({level, top[0]})
+        if top not in self.cache:
+            # 最顶层解码完成前不绘制（不阻塞GL线程）
+            if not self.pyramid.level_ready(top[0]):
+                self.pyramid.request_level(top[0], self._onLevelReady)
+                return []
+            self._upload_tile(top)
+        # 当前级别解码完成前用上级瓦片代替显示
+        level_ready = self.pyramid.level_ready(level)
+        if not level_ready:
+            self.pyramid.request_level(level, self._onLevelReady)
+        uploads = 0
+        for key in visible:
+            if level_ready and key not in self.cache and uploads < self.MAX_UPLOADS_PER_FRAME:
+                self._upload_tile(key)
+                uploads += 1
+        draws = []
+        for key in visible:
+            src = key
+            # 尚未上传（或超出预算）的瓦片，使用已上传的上级瓦片
+            while src not in self.cache:
+                anc_level = src[0] + 1
+                src = (anc_level, *self.pyramid.ancestor(key[0], key[1], key[2], anc_level))
+            draws.append((key, src))
+        if uploads == self.MAX_UPLOADS_PER_FRAME and any(key not in self.cache for key in visible):
+            view.update()  # 下一帧继续上传
+        return draws
+
+    def _draw_tiles(self, model_matrix):
+        with trace_span("GLTiledImageItem.stream", "texture"):
+            draws = self._stream_tiles(model_matrix)
+        self.setupGLState()
+        self.shader.set_uniform("proj", self.proj_matrix().glData, "mat4")
+        self.shader.set_uniform("view", self.view_matrix().glData, "mat4")
+        self.shader.set_uniform("model", model_matrix.glData, "mat4")
+        self.shader.set_uniform("texture1", 0, "int")
+        with self.shader:
+            self.vao.bind()
+            gl.glActiveTexture(gl.GL_TEXTURE0)
+            for key, src in draws:
+                gl.glBindTexture(gl.GL_TEXTURE_2D, self.cache.get(src))
+                self.shader.set_uniform("rect", self.pyramid.tile_model_rect(*key), "vec4")
+                self.shader.set_uniform("uvRect", self.pyramid.tile_uv(*key, *src), "vec4")
+                gl.glDrawArrays(gl.GL_TRIANGLES, 0, 6)
+            gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+
+    def paint(self, model_matrix=Matrix4x4()):
+        self._draw_tiles(model_matrix)
+
+    def paint_selected(self, model_matrix=Matrix4x4()):
+        self._draw_tiles(model_matrix)
+
+    def paint_pickMode(self, model_matrix=Matrix4x4()):
+        self.setupGLState()
+        self.pick_shader.set_uniform("proj", self.proj_matrix().glData, "mat4")
+        self.pick_shader.set_uniform("view", self.view_matrix().glData, "mat4")
+        self.pick_shader.set_uniform("model", model_matrix.glData, "mat4")
+        self.pick_shader.set_uniform("rect", (-1, -1, 1, 1), "vec4")
+        self.pick_shader.set_uniform("uvRect", (0, 1, 1, 0), "vec4")
+        self.pick_shader.set_uniform("pickColor", self.pickColor(), "float")
+        with self.pick_shader:
+            self.vao.bind()
+            gl.glDrawArrays(gl.GL_TRIANGLES, 0, 6)
+
+    def delete(self):
+        """
+        释放所有瓦片纹理（需要在GL上下文中调用），以及内存中解码后的图片
+        """
+        self.cache.clear()
+        self.pyramid.close()
+
+
+vertex_shader = """
+#version 330 core
+
+uniform mat4 model;
+uniform mat4 view;
+uniform mat4 proj;
+uniform vec4 rect;  // 瓦片在模型坐标中的范围：left, bottom, right, top
+uniform vec4 uvRect;  // 对应的纹理坐标：u_left, v_bottom, u_right, v_top
+
+layout (location = 0) in vec2 iPos;
+
+out vec2 TexCoord;
+
+void main() {
+    vec2 pos = mix(rect.xy, rect.zw, iPos);
+    gl_Position = proj * view * model * vec4(pos, 0.0, 1.0);
+    TexCoord = mix(uvRect.xy, uvRect.zw, iPos);
+}
+"""
+
+fragment_shader = """
+#version 330 core
+out vec4 FragColor;
+
+in vec2 TexCoord;
+uniform sampler2D texture1;
+
+void main() {
+    FragColor = vec4(texture(texture1, TexCoord).rgb, 1.0);
+}
+"""
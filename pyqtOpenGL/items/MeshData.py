@@ -9,8 +9,10 @@ import assimp_py as assimp
 import numpy as np
 from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QMessageBox
+from utils.hull_mesh import CREASE_ANGLE, segment_indexed, update_face_normals
+from utils.perf_trace import trace_it
 
-from .BufferObject import VAO, VBO, EBO
+from .BufferObject import VAO, VBO, EBO, StreamVBO, PooledVBO
 from .shader import Shader
 from .texture import Texture2D
 from ..functions import _dispatchmethod
@@ -156,7 +158,16 @@ class Mesh:
 
     def initializeGL(self):
         self.vao = VAO()
-        self.vbo = VBO(
+        # GL_STREAM_DRAW 的网格（频繁编辑的船体）使用三重缓冲的流式缓冲区，
+        # 较小的静态网格（模型的各个部分等）放在共享的缓冲区池中
+        nbytes = sum(x.nbytes for x in (self._vertexes, self._normals, self._texcoords) if x is not None)
+        if self._usage == gl.GL_STREAM_DRAW:
+            vbo_class = StreamVBO
+        elif self._usage == gl.GL_STATIC_DRAW and nbytes <= PooledVBO.MAX_NBYTES:
+            vbo_class = PooledVBO
+        else:
+            vbo_class = VBO
+        self.vbo = vbo_class(
             [self._vertexes, self._normals, self._texcoords],
             [3, 3, 2],
             usage=self._usage
@@ -173,6 +184,7 @@ class Mesh:
             shader.set_uniform("material.use_texture", False, 'bool')
 
         self.vao.bind()
+        self.vbo.bindAttrs()
         if self._indices is not None:
             gl.glDrawElements(gl.GL_TRIANGLES, self._indices.size, gl.GL_UNSIGNED_INT, c_void_p(0))
         else:
@@ -257,12 +269,40 @@ class Mesh:
         # 更新缓冲区
         self.vbo.updateData([0], [self._vertexes, self._normals, self._texcoords])
 
-    def update_vertexes(self, vertexes: np.ndarray):
+    def update_vertexes(self, vertexes: np.ndarray, normals: np.ndarray = None):
+        """
+        更新顶点（数组大小不变）
+        :param vertexes: 顶点坐标
+        :param normals: 法向量，若为None则根据顶点重新计算
+        :return:
+        """
         if vertexes.shape != self._vertexes.shape:
             raise ValueError("vertexes shape must be the same as the original vertexes")
         self._vertexes = np.array(vertexes, dtype=np.float32)
-        self._normals = vertex_normal_smooth(self._vertexes, self._indices)  # 更新法线
-        self.vbo.updateData([0], [self._vertexes, self._normals, self._texcoords])
+        if normals is None:
+            self._normals = vertex_normal_smooth(self._vertexes, self._indices)  # 更新法线
+            self.vbo.updateData([0], [self._vertexes, self._normals, self._texcoords])
+        else:
+            self._normals = np.array(normals, dtype=np.float32)
+            self.vbo.updateData([0, 1], [self._vertexes, self._normals])
+
+    def update_vertex_ranges(self, vertexes: np.ndarray, normals: np.ndarray, ranges: List[Tuple[int, int]]):
+        """
+        更新顶点和法向量（数组大小不变），只上传变化的顶点区间
+        :param vertexes: 顶点坐标
+        :param normals: 法向量
+        :param ranges: 变化的顶点区间 [(start, stop)]
+        """
+        if vertexes.shape != self._vertexes.shape:
+            raise ValueError("vertexes shape must be the same as the original vertexes")
+        stride = self._vertexes.itemsize * 3
+        updates = []
+        for start, stop in ranges:
+            self._vertexes[start:stop] = vertexes[start:stop]
+            self._normals[start:stop] = normals[start:stop]
+            updates.append((0, start * stride, self._vertexes[start:stop]))
+            updates.append((1, start * stride, self._normals[start:stop]))
+        self.vbo.updateSubDatas(updates)
 
     def update_vertex_size(self, vertexes: np.ndarray, indices: np.ndarray):
         """
@@ -358,6 +398,7 @@ class SymetryCylinderMesh:
         self.topPos = topPos
         self.bottomPos = bottomPos
 
+    @trace_it(cat="mesh")
     def initVertexes(self):
         """
         返回不使用索引数组的顶点数组
@@ -383,6 +424,66 @@ class SymetryCylinderMesh:
         self.normals = vertex_normal_faceNormal(self.vertexes)
         # self.normals = vertex_normal_smooth(self.vertexes, np.arange(vertexLen * 3).reshape(-1, 3))
 
+    def setVertexes(self, topPoints: np.ndarray, bottomPoints: np.ndarray, topPos, bottomPos,
+                    vertexes: np.ndarray, normals: np.ndarray):
+        """
+        使用已经算好的顶点和法向量（顺序与 initVertexes 相同，例如截面组批量生成的网格）初始化，
+        之后 setMeshZ 等修改方法和 initVertexes 的结果一样可用
+        :param topPoints: 同 initPoints
+        :param bottomPoints: 同 initPoints
+        :param topPos: 同 initPoints
+        :param bottomPos: 同 initPoints
+        :param vertexes: 顶点数组
+        :param normals: 法向量数组
+        """
+        self.initPoints(topPoints, bottomPoints, topPos, bottomPos)
+        self.updateRightPoints()
+        self._topPoints = np.concatenate((self.topPoints, self.rightTopPoints), axis=0)
+        self._bottomPoints = np.concatenate((self.bottomPoints, self.rightBottomPoints), axis=0)
+        cap_len = (len(self._topPoints) - 2) * 3
+        if len(vertexes) != cap_len * 2 + len(self._topPoints) * 6:
+            raise ValueError("vertexes do not match topPoints and bottomPoints")
+        self.vertexes = np.array(vertexes, dtype=np.float32)
+        self.normals = np.array(normals, dtype=np.float32)
+        self.top_vert = self.vertexes[:cap_len].copy()
+        self.bottom_vert = self.vertexes[cap_len:cap_len * 2].copy()
+        self.side_vert = self.vertexes[cap_len * 2:].copy()
+
+    def indexedVertexes(self, crease_angle: float = CREASE_ANGLE) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        返回使用索引数组、共享顶点的网格，三角形与 initVertexes 相同；
+        端面共享顶点和同一个法向量，侧面只在夹角超过crease_angle的地方和端面边缘分开顶点（硬边）；
+        crease_angle为0时着色与 initVertexes 相同。
+        不更新 self.vertexes，setMeshZ、patchVertexes 等修改方法仍然只用于不使用索引的网格
+        :param crease_angle: 侧面硬边的角度阈值（度）
+        :return: (顶点, 法向量, 三角形索引 Tx3)
+        """
+        if self.topPoints is None or self.bottomPoints is None:
+            raise ValueError("topPoints and bottomPoints must be initialized")
+        vertexes, normals, indices = segment_indexed(self.topPoints, self.bottomPoints, self.topPos, self.bottomPos,
+                                                     crease_angle)
+        FI, LI, UI = self.getDirIndex()
+        axes = np.zeros((3, 3), dtype=np.float32)
+        axes[[0, 1, 2], [LI, UI, FI]] = 1
+        # 坐标轴的奇置换会翻转叉积的方向
+        return vertexes @ axes, normals @ axes * np.linalg.det(axes), indices
+
+    def patchVertexes(self, indices: np.ndarray, positions: np.ndarray) -> np.ndarray:
+        """
+        只改写部分顶点（例如拖动一个节点），并只重新计算这些顶点所在三角形的法向量
+        :param indices: 顶点索引
+        :param positions: 新的顶点坐标
+        :return: 改变的三角形索引
+        """
+        self.vertexes[indices] = positions
+        cap_len = len(self.top_vert)
+        for part, start in ((self.top_vert, 0), (self.bottom_vert, cap_len), (self.side_vert, cap_len * 2)):
+            selected = (indices >= start) & (indices < start + len(part))
+            part[indices[selected] - start] = positions[selected]
+        triangles = np.unique(indices // 3)
+        update_face_normals(self.vertexes, self.normals, triangles)
+        return triangles
+
     def updateRightPoints(self):
         self.rightTopPoints = self.topPoints.copy()
         self.rightTopPoints[:, 0] = -self.rightTopPoints[:, 0]
@@ -1006,6 +1107,7 @@ def face_normal(v1, v2, v3):
         raise e
 
 
+@trace_it("vertex_normal_smooth", "normal")
 def vertex_normal_smooth(vert, ind):
     """计算每个顶点的法向量，显示会平滑一些"""
     nv = len(vert)  # 顶点的个数
@@ -1022,6 +1124,7 @@ def vertex_normal_smooth(vert, ind):
     return norm
 
 
+@trace_it("vertex_normal_faceNormal", "normal")
 def vertex_normal_faceNormal(vert):
     """生成面法向量"""
     nv = len(vert)  # 顶点的个数
@@ -4,8 +4,13 @@ from .GLBoxItem import GLBoxItem
 from .GLBoxTextureItem import GLBoxTextureItem
 from .GLGridItem import GLGridItem
 from .GLImageItem import GLImageItem
+from .GLTiledImageItem import GLTiledImageItem
 from .GLMeshItem import GLMeshItem
 from .GLInstancedMeshItem import GLInstancedMeshItem
+from .GLSharedVertMeshItem import GLSharedVertMeshItem
+from .GLPlaceholderItem import GLPlaceholderItem, PlaceholderBatch
+from .GLRailingItem import GLRailingItem
+from .GLLadderItem import GLLadderItem
 from .GLModelItem import GLModelItem
 from .GLScatterPlotItem import GLScatterPlotItem
 from .GLSurfacePlotItem import GLSurfacePlotItem
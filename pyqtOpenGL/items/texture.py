@@ -1,7 +1,9 @@
 import OpenGL.GL as gl
-from PIL import Image
 import numpy as np
-from typing import Union
+from typing import Set, Union
+from PyQt5 import sip
+from PyQt5.QtGui import QOpenGLContext
+from utils.texture_cache import TextureCache
 
 __all__ = ['Texture2D']
 
@@ -47,6 +49,8 @@ class Texture2D:
     ):
         self._path = None
         self._id = None
+        self._entry = None  # 从文件加载时，对应TextureCache中的缓存项，纹理在多个对象间共享
+        self._waiting = None  # request() 已经登记回调的解码Future
         self.unit = None
 
         # if the texture image is updated, the flag is set to True,
@@ -66,12 +70,56 @@ class Texture2D:
             self.updateTexture(source)
 
     def updateTexture(self, img: Union[str, np.ndarray]):
+        """
+        更新纹理图片
+        :param img: 图片数组，或图片路径（通过TextureCache在后台线程中解码，相同的图片共享一个纹理）
+        """
+        old_entry = self._entry
         if not isinstance(img, np.ndarray):
             self._path = str(img)
-            img = np.array(Image.open(self._path))
-        self._img = flip_image(img, self.flip_x, self.flip_y)
+            self._entry = TextureCache.acquire(self._path, self.flip_x, self.flip_y)
+            self._img = None
+        else:
+            self._entry = None
+            self._img = flip_image(img, self.flip_x, self.flip_y)
+        if old_entry is not None:
+            TextureCache.release(old_entry)
+            self._id = None
         self._img_update_flag = True
 
+    def ready(self) -> bool:
+        """
+        是否可以绑定而不阻塞：从文件加载时，纹理已经在当前GL共享组中上传，或者后台解码已完成
+        """
+        if self._entry is not None:
+            return _share_group() in self._entry.gpu or self._entry.ready()
+        return self._img is not None
+
+    def request(self, callback):
+        """
+        从文件加载、尚未 ready() 时调用（需要当前GL上下文）：登记当前共享组需要该图片，
+        后台解码完成后调用一次callback（在解码线程中调用）
+        """
+        if self._entry is None:
+            return
+        group = _share_group()
+        _watch_share_group(group)
+        future = TextureCache.request(self._entry, group)
+        if future is not self._waiting:
+            self._waiting = future
+            future.add_done_callback(lambda _: callback())
+
+    @property
+    def nbytes(self) -> int:
+        """
+        纹理占用的显存（估计值，包含多级纹理）
+        """
+        if self._entry is not None:
+            return self._entry.gpu_nbytes
+        if self._id is None or self._img is None:
+            return 0
+        return self._img.nbytes * 4 // 3 if self.generate_mipmaps else self._img.nbytes
+
     def bind(self):
         """ Bind the texture to the specified texture unit,
         if unit is None, the texture will be bound to the next available unit.
@@ -80,59 +128,119 @@ class Texture2D:
             self.unit = Texture2D.UnitCnt
             Texture2D.UnitCnt += 1
 
-        if self._img is None:
+        if self._img is None and self._entry is None:
             raise ValueError('Texture not initialized.')
 
         # do this job in bind() instead of updateTexture() to make sure that
         # the context is current.
         gl.glActiveTexture(gl.GL_TEXTURE0 + self.unit)
 
-        if self._img_update_flag:  # bind and update texture
-            channels = 1 if self._img.ndim == 2 else self._img.shape[2]
-            dtype = self._img.dtype.name
-
-            # -- set alignment
-            nbytes_row = self._img.shape[1] * self._img.dtype.itemsize * channels
-            if nbytes_row % 4 != 0:
-                gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
-            else:
-                gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 4)
-
-            self.delete()
-            self._id = gl.glGenTextures(1)
+        if self._entry is not None:  # 共享的纹理，每个GL共享组只上传一次
+            group = _share_group()
+            _watch_share_group(group)
+            orphans = TextureCache.take_orphans(group)
+            if orphans:
+                gl.glDeleteTextures(orphans)
+            # 没有先检查 ready() 的调用方在这里等待解码
+            self._id = TextureCache.texture_id(self._entry, group, self._upload, wait=True)
+            self._img_update_flag = False
             gl.glBindTexture(gl.GL_TEXTURE_2D, self._id)
-            gl.glTexImage2D(
-                gl.GL_TEXTURE_2D, 0,
-                self.InternalFormat[(channels, dtype)],
-                self._img.shape[1], self._img.shape[0], 0,
-                self.Format[channels],
-                self.DataType[dtype],
-                self._img,
-            )
-
-            if self.generate_mipmaps:
-                gl.glGenerateMipmap(gl.GL_TEXTURE_2D)
-            # -- texture wrapping
-            gl.glTexParameter(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S, self.wrap_s)
-            gl.glTexParameter(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T, self.wrap_t)
-            # -- texture filterting
-            gl.glTexParameter(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, self.min_filter)
-            gl.glTexParameter(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, self.mag_filter)
 
+        elif self._img_update_flag:  # bind and update texture
+            self.delete()
+            self._id, _ = self._upload(self._img)
             self._img_update_flag = False
 
         else:  # bind texture
             gl.glBindTexture(gl.GL_TEXTURE_2D, self._id)
 
+    def _upload(self, img: np.ndarray):
+        """
+        创建纹理并上传图片，纹理保持绑定状态
+        :return: (纹理id, 显存字节数)
+        """
+        channels = 1 if img.ndim == 2 else img.shape[2]
+        dtype = img.dtype.name
+
+        # -- set alignment
+        nbytes_row = img.shape[1] * img.dtype.itemsize * channels
+        if nbytes_row % 4 != 0:
+            gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
+        else:
+            gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 4)
+
+        tex_id = gl.glGenTextures(1)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, tex_id)
+        gl.glTexImage2D(
+            gl.GL_TEXTURE_2D, 0,
+            self.InternalFormat[(channels, dtype)],
+            img.shape[1], img.shape[0], 0,
+            self.Format[channels],
+            self.DataType[dtype],
+            img,
+        )
+
+        if self.generate_mipmaps:
+            gl.glGenerateMipmap(gl.GL_TEXTURE_2D)
+        # -- texture wrapping
+        gl.glTexParameter(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S, self.wrap_s)
+        gl.glTexParameter(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T, self.wrap_t)
+        # -- texture filterting
+        gl.glTexParameter(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, self.min_filter)
+        gl.glTexParameter(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, self.mag_filter)
+        return tex_id, img.nbytes * 4 // 3 if self.generate_mipmaps else img.nbytes
+
     def unbind(self):
         gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
 
+    def __del__(self):
+        # 共享纹理只减少引用计数，GL纹理在之后有GL上下文时删除，因此可以在析构中调用
+        if self._entry is not None:
+            TextureCache.release(self._entry)
+            self._entry = None
+
     def delete(self):
+        if self._entry is not None:  # 共享的纹理由TextureCache按引用计数删除
+            TextureCache.release(self._entry)
+            self._entry = None
+            self._id = None
+            return
         if self._id is not None:
             gl.glDeleteTextures([self._id])
             self._id = None
 
 
+def _share_group() -> int:
+    """
+    当前GL上下文的共享组，共享组内的上下文可以使用相同的纹理
+    """
+    context = QOpenGLContext.currentContext()
+    if context is None:
+        return 0
+    return sip.unwrapinstance(context.shareGroup())
+
+
+_watched_groups: Set[int] = set()  # 已经连接了上下文销毁信号的共享组
+
+
+def _watch_share_group(group: int):
+    """
+    共享组第一次使用共享纹理时，连接当前上下文的销毁信号：销毁时从TextureCache中移除该组的纹理id
+    """
+    if group in _watched_groups:
+        return
+    context = QOpenGLContext.currentContext()
+    if context is None:
+        return
+    _watched_groups.add(group)
+
+    def _on_destroyed():
+        _watched_groups.discard(group)
+        TextureCache.drop_group(group)
+
+    context.aboutToBeDestroyed.connect(_on_destroyed)
+
+
 def flip_image(img, flip_x=False, flip_y=False):
     if flip_x and flip_y:
         img = np.flip(img, (0, 1))
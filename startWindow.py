@@ -6,9 +6,13 @@
 请不要在新的代码中使用这些控件类，而是使用GUI模块中的控件类；
 """
 
+import os
+
 from GUI import *
 from PyQt5.QtCore import Qt
+from path_lib import THUMBNAIL_PATH
 from utils.funcs_utils import open_url
+from utils.thumbnail_cache import ThumbnailCache
 from string_src import *
 
 
@@ -129,11 +133,88 @@ def _create_rounded_thumbnail(image_path, width, height, corner_radius):
     return rounded_thumbnail
 
 
+class _RecentProjectList(QListWidget):
+    """
+    最近工程列表
+    缩略图从ThumbnailCache中异步读取，只请求当前可见的行，因此工程很多时也不会拖慢开始界面的打开
+    """
+    open_signal = pyqtSignal(str)  # noqa  工程路径
+
+    def __init__(self, projects: dict, parent=None):
+        """
+        :param projects: {工程名: 工程路径}，按打开顺序排列，最近的在最后
+        """
+        super().__init__(parent)
+        self.thumbnail_cache = ThumbnailCache(THUMBNAIL_PATH)
+        self.thumbnail_cache.loaded_s.connect(self._set_thumbnail)
+        self._items = {}  # 工程路径: QListWidgetItem
+        self._requested = set()
+        size = ThumbnailCache.SIZE
+        self.setIconSize(QSize(size, size))
+        self.setFont(YAHEI[10])
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setStyleSheet(f"""
+            QListWidget{{
+                background-color: {BG_COLOR0};
+                color: {FG_COLOR0};
+                border: 0px;
+                border-radius: 15px;
+                padding: 10px;
+            }}
+            QListWidget::item{{
+                border-radius: 10px;
+                padding: 3px;
+            }}
+            QListWidget::item:hover{{
+                background-color: {BG_COLOR2};
+            }}
+        """)
+        for name, path in reversed(list(projects.items())):
+            item = QListWidgetItem(name)
+            item.setToolTip(path)
+            item.setData(Qt.UserRole, path)
+            item.setSizeHint(QSize(0, size + 8))
+            self.addItem(item)
+            self._items[path] = item
+        self.verticalScrollBar().valueChanged.connect(self._request_visible)
+        self.itemClicked.connect(lambda _item: self.open_signal.emit(_item.data(Qt.UserRole)))
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._request_visible()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._request_visible()
+
+    def _request_visible(self, *_):
+        """
+        请求可见行的缩略图
+        """
+        if self.count() == 0:
+            return
+        first = self.indexAt(self.viewport().rect().topLeft()).row()
+        last = self.indexAt(self.viewport().rect().bottomLeft()).row()
+        first = max(first, 0)
+        last = self.count() - 1 if last < 0 else last
+        for row in range(first, last + 1):
+            path = self.item(row).data(Qt.UserRole)
+            if path not in self._requested and os.path.exists(path):
+                self._requested.add(path)
+                self.thumbnail_cache.request(path)
+
+    def _set_thumbnail(self, path, image):
+        item = self._items.get(path)
+        if item is not None:
+            item.setIcon(QIcon(QPixmap.fromImage(image)))
+
+
 class _BasicDialog(QDialog):
     def __init__(self, parent=None, border_radius: Union[int, Tuple[int, int, int, int]] = 10,
                  title=None, size=QSize(400, 300), center_layout=None,
                  resizable=False, hide_top=False, hide_bottom=False, ensure_bt_fill=False):
-        self.close_bg = QIcon(QPixmap.fromImage(CLOSE_IMAGE))  # noqa
+        self.close_bg = QIcon(IMAGES.pixmap("CLOSE"))  # noqa
         self._parent = parent
         self._generate_self_parent = False
         if not parent:
@@ -387,11 +468,12 @@ class StartWindow(_BasicDialog):
     setting_signal = pyqtSignal()  # noqa
     help_signal = pyqtSignal()  # noqa
     about_signal = pyqtSignal()  # noqa
+    openRecent_signal = pyqtSignal(str)  # noqa
 
     def __init__(self, parent=None, title="", size=QSize(1100, 800)):
         # 控件
-        self.ICO = QPixmap.fromImage(ICO_IMAGE)  # noqa
-        self.TIP = QPixmap.fromImage(TIP_IMAGE)  # noqa
+        self.ICO = IMAGES.pixmap("ICO")  # noqa
+        self.TIP = IMAGES.pixmap("TIP")  # noqa
         self.ico_lb = QLabel()
         self.tip_lb = QLabel()
         self.center_layout = QVBoxLayout()
@@ -402,6 +484,7 @@ class StartWindow(_BasicDialog):
         self.right_layout = QVBoxLayout()
         self.left_widget_main = QWidget()
         self.left_grid_layout = QGridLayout()
+        self.recent_list = _RecentProjectList(configHandler.get_config("Projects") or {})
         self.title = _MyLabel(f"欢迎使用{APP_FULL_NAME_STR}", font=YAHEI[20])
         self.buttons = {
             "上次编辑": QPushButton("上次编辑"),
@@ -419,7 +502,7 @@ class StartWindow(_BasicDialog):
         super().__init__(parent, (10, 10, 116, 116), title, size, self.center_layout, hide_bottom=True)
         self.hide()
         # 图标
-        self.ICO = QPixmap.fromImage(ICO_IMAGE)  # noqa
+        self.ICO = IMAGES.pixmap("ICO")  # noqa
         self.setWindowIcon(QIcon(self.ICO))
         # 事件绑定
         self.__connect_funcs()
@@ -557,6 +640,9 @@ class StartWindow(_BasicDialog):
         )
         main_inner_layout.addWidget(self.tip_lb, alignment=Qt.AlignCenter)
         main_inner_layout.addWidget(_MyLabel("赞赏二维码", font=YAHEI[13]), alignment=Qt.AlignCenter)
+        # 最近工程
+        self.recent_list.setFixedWidth(230)
+        left_widget_main_layout.addWidget(self.recent_list)
 
     def __set_left_down_grid_layout(self):
         email_text = _MyLabel("E-mail：", font=YAHEI[10])
@@ -665,6 +751,7 @@ class StartWindow(_BasicDialog):
         self.buttons["设置"].clicked.connect(self.setting_signal.emit)
         self.buttons["帮助"].clicked.connect(self.help_signal.emit)
         self.buttons["关于"].clicked.connect(self.about_signal.emit)
+        self.recent_list.open_signal.connect(self.openRecent_signal.emit)
 
         # self.buttons["上次编辑"].setToolTip("打开您上次编辑的项目")
         # self.buttons["新建工程"].setToolTip("新建船体工程")
@@ -8,6 +8,19 @@ from .test_main_editor import *
 from .test_main_logger import *
 from .test_cv2replacement import TestCV2Replacements
 from .test_funcs_utils import TestFuncsUtils
+from .test_operation import TestOperationStack
+from .test_perf_trace import TestPerfTrace
+from .test_image_pyramid import TestImagePyramid, TestImagePyramidFromFile, TestTileCache
+from .test_texture_cache import TestTextureCache
+from .test_thumbnail_cache import TestThumbnailCache
+from .test_image_resources import TestImageResources
+from .test_import_profile import TestImportProfile
+from .test_frame_stats import TestFrameStats
+from .test_project_generator import TestProjectGenerator
+from .test_glyph_atlas import TestGlyphAtlas
+from .test_suballocator import TestSubAllocator
+from .test_instancing import TestInstancing
+from .test_hull_mesh import TestHullMesh
 
 
 def run_test() -> bool:
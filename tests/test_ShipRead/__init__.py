@@ -0,0 +1 @@
+from .test_hull_section import TestHullSection
@@ -0,0 +1,63 @@
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+
+@unittest.skipUnless(sys.platform == "win32", "ShipRead依赖Windows的路径")
+class TestHullSection(unittest.TestCase):
+    def setUp(self):
+        from ShipRead.sectionHandler.hullSectionGroup import HullSection
+        # 不创建界面控件，只初始化节点相关的属性
+        self.section = HullSection.__new__(HullSection)
+        self.section.name = "截面"
+        self.section.z = 1.
+        self.section.nodes = []
+        self.section.load_nodes([[1., 0.], [2., 1.], [3., 2.]], ["#ffffff"] * 3)
+        self.section.init_node_data()
+        self.section.maxX = 3.
+        self.section._parent = MagicMock()
+        self.section.paintItem = MagicMock()
+
+    def test_update_node_data(self):
+        section = self.section
+        section.update_node_data(2, 1.5, 2.5)
+        # 节点对象（保存、栏杆、船体大小读取）和节点数据都已更新，然后增量更新网格
+        self.assertEqual((section.nodes[2].x, section.nodes[2].y), (1.5, 2.5))
+        np.testing.assert_array_equal(section.nodes_data[2], [1.5, 2.5])
+        self.assertEqual(section.maxX, 2.)
+        self.assertEqual(section.to_dict()["nodes"][2], [1.5, 2.5])
+        section.paintItem.update_mesh.assert_called_once_with(2, 1.5, 2.5)
+        section._parent.rebuild_meshes.assert_not_called()
+
+    def test_update_node_data_reorder(self):
+        section = self.section
+        moved = section.nodes[0]
+        section.update_node_data(0, 0.5, 1.5)
+        # 节点顺序改变：按新坐标重新排序，整体重建
+        self.assertEqual([node.y for node in section.nodes], [1., 1.5, 2.])
+        self.assertIs(section.nodes[1], moved)
+        self.assertEqual(moved.y_index, 1)
+        np.testing.assert_array_equal(section.nodes_data, [[2., 1.], [0.5, 1.5], [3., 2.]])
+        section._parent.rebuild_meshes.assert_called_once()
+        section.paintItem.update_mesh.assert_not_called()
+
+    def test_set_point(self):
+        from ShipPaint import HullVerSecItem
+        from operation.section_op import SectionNodeMoveOperation
+        item = MagicMock()
+        item.handler = self.section
+        node = self.section.nodes[1]
+        HullVerSecItem.setPoint(item, node, 2.5, 1.2)
+        self.assertEqual((node.x, node.y), (2.5, 1.2))
+        self.section.paintItem.update_mesh.assert_called_once_with(1, 2.5, 1.2)
+        # 节点移动操作的撤回
+        op = SectionNodeMoveOperation(self.section, node, (2.8, 1.4))
+        op.execute()
+        op.undo()
+        self.assertEqual((node.x, node.y), (2.5, 1.2))
+
+
+if __name__ == '__main__':
+    unittest.main()
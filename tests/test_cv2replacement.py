@@ -37,6 +37,21 @@ class TestCV2Replacements(unittest.TestCase):
         img = ReplaceCV2.imread(self.test_image_path)
         self.assertTrue(np.array_equal(img, self.test_image))
 
+    def test_imread_reduce(self):
+        img = ReplaceCV2.imread(self.test_image_path, reduce=2)
+        self.assertEqual(img.shape, (50, 50, 3))
+        self.assertEqual(img.shape, ReplaceCV2.imread_shape(self.test_image_path, reduce=2))
+        self.assertTrue(np.array_equal(img[25, 25], [255, 0, 0]))
+        self.assertTrue(np.array_equal(img[5, 5], [0, 0, 0]))
+
+    def test_imread_out(self):
+        out = np.empty(ReplaceCV2.imread_shape(self.test_gray_image_path), dtype=np.uint8)
+        img = ReplaceCV2.imread(self.test_gray_image_path, out=out)
+        self.assertIs(img, out)
+        self.assertTrue(np.array_equal(out, self.test_gray_image))
+        with self.assertRaises(ValueError):
+            ReplaceCV2.imread(self.test_image_path, out=out)
+
     def test_imwrite(self):
         path = 'res/test_save.png'
         ReplaceCV2.imwrite(path, self.test_image)
@@ -72,9 +87,17 @@ class TestCV2Replacements(unittest.TestCase):
         resized_image_fx_fy = ReplaceCV2.resize(self.test_image, (0, 0), fx=0.5, fy=0.5)
         self.assertEqual(resized_image_fx_fy.shape, (50, 50, 3))
 
+    def test_resize_batch(self):
+        images = [self.test_image, self.test_image[:50], self.test_gray_image]
+        resized_images = ReplaceCV2.resize_batch(images, (20, 10))
+        self.assertEqual([img.shape for img in resized_images], [(10, 20, 3), (10, 20, 3), (10, 20)])
+        self.assertTrue(np.array_equal(resized_images[0], ReplaceCV2.resize(self.test_image, (20, 10))))
+
     def test_pyrDown(self):
         downsampled_image = ReplaceCV2.pyrDown(self.test_image)
         self.assertEqual(downsampled_image.shape, (50, 50, 3))
+        self.assertEqual(ReplaceCV2.pyrDown(self.test_image[:99, :99]).shape, (49, 49, 3))
+        self.assertTrue(downsampled_image.flags.writeable)
 
 
 # 只测试当前文件
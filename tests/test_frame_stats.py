@@ -0,0 +1,48 @@
+import unittest
+
+from utils.frame_stats import FrameTiming, FrameStatsRecorder, RollingSamples, summarize, summarize_frames
+
+
+class TestFrameStats(unittest.TestCase):
+    def test_summarize(self):
+        stats = summarize(range(1, 101))
+        self.assertAlmostEqual(stats["mean"], 50.5)
+        self.assertAlmostEqual(stats["p50"], 50.5)
+        self.assertAlmostEqual(stats["p95"], 95.05)
+        self.assertAlmostEqual(stats["p99"], 99.01)
+        self.assertEqual(stats["max"], 100)
+        self.assertEqual(summarize([]), {})
+
+    def test_summarize_frames(self):
+        frames = [FrameTiming(1., None, 2., 10), FrameTiming(3., None, 4., 12)]
+        summary = summarize_frames(frames)
+        self.assertEqual(set(summary.keys()), {"cpu_ms", "gpu_ms", "total_ms", "draw_calls"})
+        self.assertAlmostEqual(summary["cpu_ms"]["mean"], 2.)
+        self.assertEqual(summary["draw_calls"]["max"], 12)
+        self.assertEqual(summary["gpu_ms"], {})  # 不支持计时查询时没有GPU耗时
+
+    def test_rolling_samples(self):
+        samples = RollingSamples(capacity=4)
+        self.assertEqual(samples.summary(), {})
+        for value in range(1, 7):
+            samples.push(value)
+        self.assertEqual(len(samples), 4)
+        self.assertEqual(samples.values().tolist(), [3, 4, 5, 6])
+        self.assertEqual(samples.summary()["max"], 6)
+        counts, edges = samples.histogram(bins=5, max_value=5)
+        self.assertEqual(counts.tolist(), [0, 0, 0, 1, 3])  # 超过上限的数据计入最后一个区间
+        self.assertEqual(edges.tolist(), [0, 1, 2, 3, 4, 5])
+
+    def test_recorder(self):
+        recorder = FrameStatsRecorder(capacity=100)
+        for i in range(200):
+            recorder.record("cpu_ms", i % 10)
+        recorder.record("gpu_main_ms", 2.)
+        self.assertEqual(recorder.names(), ["cpu_ms", "gpu_main_ms"])
+        summary = recorder.summary()
+        self.assertEqual(summary["cpu_ms"]["max"], 9)
+        self.assertEqual(summary["gpu_main_ms"]["p99"], 2.)
+        self.assertEqual(len(recorder.format_overlay().splitlines()), 2)
+        self.assertEqual(recorder.format_overlay(["missing"]), "")
+        recorder.clear()
+        self.assertEqual(recorder.summary()["cpu_ms"], {})
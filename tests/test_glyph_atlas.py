@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np
+
+from utils.glyph_atlas import GlyphAtlas, _signed_distance
+
+
+class TestGlyphAtlas(unittest.TestCase):
+    def test_shared(self):
+        self.assertIs(GlyphAtlas.get(None, 20), GlyphAtlas.get(None, 20))
+        self.assertIsNot(GlyphAtlas.get(None, 20), GlyphAtlas.get(None, 21))
+
+    def test_signed_distance(self):
+        mask = np.zeros((9, 9), bool)
+        mask[3:6, 3:6] = True
+        distance = _signed_distance(mask, 3)
+        self.assertAlmostEqual(distance[4, 4], 1.5)  # 中心到外部像素2格，边缘在中点
+        self.assertAlmostEqual(distance[3, 4], 0.5)
+        self.assertAlmostEqual(distance[2, 4], -0.5)
+        self.assertAlmostEqual(distance[0, 4], -2.5)
+        self.assertAlmostEqual(distance[0, 0], -2.5)  # 超出范围截断为radius
+
+    def test_layout(self):
+        atlas = GlyphAtlas(None, 24)
+        quads, (w, h) = atlas.layout("1.5 m")
+        self.assertEqual(quads.shape, (4, 8))  # 空格不生成四边形
+        self.assertEqual(len(atlas), 5)
+        self.assertGreater(w, 0)
+        self.assertEqual(h, atlas.line_height)
+        self.assertTrue(np.all(np.diff(quads[:, 0]) > 0))
+        self.assertTrue(np.all((quads[:, 4:] >= 0) & (quads[:, 4:] <= 1)))
+        # 已有的字形不会重新光栅化
+        version = atlas.version
+        atlas.layout("5.1")
+        self.assertEqual(atlas.version, version)
+        _, (_, h2) = atlas.layout("1\n2")
+        self.assertEqual(h2, 2 * atlas.line_height)
+
+    def test_sdf_values(self):
+        atlas = GlyphAtlas(None, 32)
+        glyph = atlas.glyph("I")
+        height, width = atlas.image.shape
+        u0, v0, u1, v1 = glyph.uv
+        cell = atlas.image[round(v0 * height):round(v1 * height), round(u0 * width):round(u1 * width)]
+        self.assertEqual(cell.shape, (glyph.h, glyph.w))
+        self.assertLess(cell[0, 0], 128)  # 边距在字形外
+        self.assertGreater(cell.max(), 128)  # 笔画内部
+
+    def test_grow(self):
+        atlas = GlyphAtlas(None, 24, width=64, height=16)
+        first = atlas.glyph("A")
+        atlas.ensure("BCDEFGHIJKLMNOP")
+        self.assertGreater(atlas.image.shape[0], 16)
+        moved = atlas.glyph("A")
+        self.assertEqual(moved.uv[0], first.uv[0])
+        self.assertLess(moved.uv[3], first.uv[3])  # 图集变高后v按比例缩小
@@ -0,0 +1,181 @@
+import unittest
+
+import numpy as np
+
+from utils.hull_mesh import (curve_template, face_normals, group_indexed, group_mesh, group_outlines, group_segments,
+                             node_outline_patch, section_outlines, segment_indexed, segment_point_vertexes,
+                             segment_vertexes, update_face_normals, vertex_ranges)
+from utils.lod import LODSelector, bounding_sphere, projected_size
+
+_T15, _T30 = np.tan(np.deg2rad(15)), np.tan(np.deg2rad(30))
+# ShipPaint.HullItem 中 SQUARE_POINTS / CIRCLE_POINTS 的前13个点（-90°到90°）
+_SQUARE = np.array([[0, -1], [_T15, -1], [_T30, -1], [1, -1], [1, -_T30], [1, -_T15], [1, 0],
+                    [1, _T15], [1, _T30], [1, 1], [_T30, 1], [_T15, 1], [0, 1]])
+_CIRCLE = np.array([[np.cos(np.deg2rad(d)), np.sin(np.deg2rad(d))] for d in range(-90, 91, 15)])
+
+
+class TestHullMesh(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.front = np.column_stack([rng.uniform(0.5, 3, 5), np.sort(rng.uniform(-3, 3, 5))])
+        self.back = np.column_stack([rng.uniform(0.5, 3, 5), np.sort(rng.uniform(-3, 3, 5))])
+
+    def test_curve_template(self):
+        for cur in (0, 0.4, 1):
+            np.testing.assert_allclose(curve_template('bot', cur), _CIRCLE[:7] + (_SQUARE - _CIRCLE)[:7] * (1 - cur),
+                                       atol=1e-6)
+            np.testing.assert_allclose(curve_template('up', cur), _CIRCLE[6:] + (_SQUARE - _CIRCLE)[6:] * (1 - cur),
+                                       atol=1e-6)
+        self.assertEqual(len(curve_template('up', 0.5, 45)), 3)
+        # 相同的 (方向, 曲率) 共用缓存的只读模板
+        self.assertIs(curve_template('bot', 0.4), curve_template('bot', 0.4))
+        self.assertFalse(curve_template('bot', 0.4).flags.writeable)
+        with self.assertRaises(ValueError):
+            curve_template('up', 0.5, 40)
+
+    def test_section_outlines(self):
+        outline = section_outlines(self.front, 0.3, 0.6)
+        self.assertEqual(outline.shape, (5 - 2 + 14, 2))
+        # 弧面从中线上的最低（最高）节点开始，到两个节点的中点为止
+        np.testing.assert_allclose(outline[[0, -1]], self.front[[0, -1]] * [0, 1], atol=1e-9)
+        np.testing.assert_allclose(outline[6], self.front[:2].mean(axis=0))
+        np.testing.assert_allclose(outline[-7], self.front[-2:].mean(axis=0))
+        np.testing.assert_allclose(outline[7:-7], self.front[1:-1])
+        batch = section_outlines(np.stack([self.front, self.back]), 0.3, 0.6)
+        np.testing.assert_allclose(batch[1], section_outlines(self.back, 0.3, 0.6))
+        # 节点数不同的截面分组计算，结果顺序不变
+        outlines = group_outlines([self.front, self.back[:4], self.back], 0.3, 0.6)
+        self.assertEqual([len(o) for o in outlines], [17, 16, 17])
+        np.testing.assert_allclose(outlines[1], section_outlines(self.back[:4], 0.3, 0.6))
+        np.testing.assert_allclose(outlines[2], batch[1])
+
+    def test_segment_vertexes(self):
+        front = section_outlines(self.front, 0.3, 0.6)
+        back = section_outlines(self.back, 0.3, 0.6)
+        p = len(front)
+        vertexes = segment_vertexes(front, back, 2.0, -1.0)
+        self.assertEqual(vertexes.shape, (24 * p - 12, 3))
+        # 端面在各自截面的z上，侧面连接两个截面
+        np.testing.assert_allclose(vertexes[:6 * p - 6, 2], 2.0)
+        np.testing.assert_allclose(vertexes[6 * p - 6:12 * p - 12, 2], -1.0)
+        np.testing.assert_allclose(np.abs(vertexes[:, 0]).max(), max(np.abs(front[:, 0]).max(), np.abs(back[:, 0]).max()),
+                                   rtol=1e-6)
+        batch = segment_vertexes(np.stack([front, front]), np.stack([back, back]), [2.0, 3.0], [-1.0, 1.0])
+        np.testing.assert_allclose(batch[0], vertexes)
+        # 法向量：前端面朝+z，后端面朝-z
+        normals = face_normals(vertexes)
+        self.assertTrue(np.all(normals[:6 * p - 6, 2] >= -1e-6))
+        self.assertTrue(np.all(normals[6 * p - 6:12 * p - 12, 2] <= 1e-6))
+
+    def test_group_segments(self):
+        nodes = np.stack([self.back, self.front, self.back])
+        zs = [-1., 0.5, 2.]
+        outlines = group_outlines(nodes, 0.3, 0.6)
+        segments = group_segments(zs, np.stack(outlines))
+        self.assertEqual(len(segments), 2)
+        np.testing.assert_allclose(segments[1][0], segment_vertexes(outlines[2], outlines[1], 2., 0.5))
+        np.testing.assert_allclose(segments[1][1], face_normals(segments[1][0]))
+        # 轮廓列表（可以有不同的点数）与数组的结果相同
+        for (v0, n0), (v1, n1) in zip(segments, group_segments(zs, outlines)):
+            np.testing.assert_allclose(v0, v1)
+            np.testing.assert_allclose(n0, n1)
+
+    def test_group_mesh(self):
+        nodes = [self.back, self.front, self.back, self.front, self.back]
+        zs = [-2., -1., 0., 1., 2.]
+        vertexes, normals = group_mesh(zs, nodes, 0.3, 0.6)
+        p = 5 - 2 + 14
+        self.assertEqual(vertexes.shape, (4 * (24 * p - 12), 3))
+        self.assertEqual(normals.shape, vertexes.shape)
+        # 粗糙等级：弧面步长45°，每隔两个截面取一个
+        coarse, _ = group_mesh(zs, nodes, 0.3, 0.6, step=45, stride=2)
+        p = 5 - 2 + 6
+        self.assertEqual(coarse.shape, (2 * (24 * p - 12), 3))
+        self.assertEqual(set(np.unique(coarse[:, 2])), {-2., 0., 2.})
+        with self.assertRaises(ValueError):
+            group_mesh([0., 1.], [self.front, self.front[:4]], 0.3, 0.6)
+
+    def test_incremental_update(self):
+        front = section_outlines(self.front, 0.3, 0.6)
+        back = section_outlines(self.back, 0.3, 0.6)
+        for index in range(len(self.front)):
+            nodes = self.front.copy()
+            nodes[index, 0] += 0.25
+            point_indices, points = node_outline_patch(nodes, index, 0.3, 0.6)
+            expected = section_outlines(nodes, 0.3, 0.6)
+            np.testing.assert_allclose(points, expected[point_indices])
+            self.assertLessEqual(np.count_nonzero(np.any(expected != front, axis=1)), len(point_indices))
+            # 只改写映射到的顶点和所在三角形的法向量，结果与重新生成的网格相同
+            for is_front in (True, False):
+                vertexes = segment_vertexes(front, back, 2.0, -1.0)
+                normals = face_normals(vertexes)
+                vertex_indices, source, mirror = segment_point_vertexes(len(front), is_front, point_indices)
+                vertexes[vertex_indices, 0] = points[source, 0] * np.where(mirror, -1, 1)
+                vertexes[vertex_indices, 1] = points[source, 1]
+                update_face_normals(vertexes, normals, np.unique(vertex_indices // 3))
+                rebuilt = segment_vertexes(expected, back, 2.0, -1.0) if is_front else \
+                    segment_vertexes(front, np.where(np.isin(np.arange(len(back)), point_indices)[:, None],
+                                                     expected, back), 2.0, -1.0)
+                np.testing.assert_allclose(vertexes, rebuilt, atol=1e-6)
+                np.testing.assert_allclose(normals, face_normals(rebuilt), atol=1e-5)
+        self.assertEqual(vertex_ranges([]), [])
+        self.assertEqual(vertex_ranges([0, 1, 2, 40, 41], gap=4), [(0, 9), (120, 126)])
+        self.assertEqual(vertex_ranges([0, 3], gap=4), [(0, 12)])
+
+    def test_indexed_mesh(self):
+        front = section_outlines(self.front, 0.3, 0.6)
+        back = section_outlines(self.back, 0.3, 0.6)
+        p = len(front)
+        soup = segment_vertexes(front, back, 2.0, -1.0)
+        faces = face_normals(soup)[::3]
+        valid = np.linalg.norm(faces, axis=1) > 0.5  # 中线上的退化三角形没有法向量
+        for crease in (0, 45, 180):
+            vertexes, normals, indices = segment_indexed(front, back, 2.0, -1.0, crease)
+            # 三角形（顺序和朝向）与不使用索引的网格相同
+            np.testing.assert_allclose(vertexes[indices].reshape(-1, 3), soup, atol=1e-6)
+            np.testing.assert_allclose(np.linalg.norm(normals, axis=1), 1, atol=1e-5)
+            # 端面总是硬边：端面三角形的顶点法向量等于面法向量
+            cap = np.arange(len(indices)) < 4 * p - 4
+            np.testing.assert_allclose(normals[indices[cap & valid]], np.repeat(faces[cap & valid, None], 3, axis=1),
+                                       atol=1e-5)
+            self.assertLess(len(vertexes), len(soup))
+        # 阈值为0时只有共面的三角形共享顶点，着色与不使用索引的网格相同
+        vertexes, normals, indices = segment_indexed(front, back, 2.0, -1.0, 0)
+        np.testing.assert_allclose(normals[indices[valid]], np.repeat(faces[valid, None], 3, axis=1), atol=1e-5)
+        # 不分开硬边时端面各 2P 个顶点、侧面两圈各 2P 个顶点
+        self.assertEqual(len(segment_indexed(front, back, 2.0, -1.0, 180)[0]), 8 * p)
+        # 多段一起计算与逐段计算再连接相同
+        flat = section_outlines([[0., -1.], [1., -1.], [1., 0.], [1., 1.], [0., 1.]], 0, 0)  # 有硬边
+        fronts, backs = np.stack([front, back, flat]), np.stack([back, front, flat])
+        batched = segment_indexed(fronts, backs, [2., 1., 3.], [-1., 0., 2.], 30)
+        single = [segment_indexed(f, b, fz, bz, 30) for f, b, fz, bz in zip(fronts, backs, (2, 1, 3), (-1, 0, 2))]
+        offsets = np.cumsum([0] + [len(v) for v, _, _ in single[:-1]])
+        np.testing.assert_allclose(batched[0], np.concatenate([v for v, _, _ in single]))
+        np.testing.assert_allclose(batched[1], np.concatenate([n for _, n, _ in single]), atol=1e-6)
+        np.testing.assert_array_equal(batched[2], np.concatenate([i + o for (_, _, i), o in zip(single, offsets)]))
+        zs = [-2., -1., 0., 1., 2.]
+        nodes = [self.back, self.front, self.back, self.front, self.back]
+        for step, stride in ((15, 1), (45, 2)):
+            vertexes, normals, indices = group_indexed(zs, nodes, 0.3, 0.6, step, stride)
+            soup, soup_normals = group_mesh(zs, nodes, 0.3, 0.6, step, stride)
+            np.testing.assert_allclose(vertexes[indices].reshape(-1, 3), soup, atol=1e-6)
+            # 默认的硬边阈值为0：着色与不使用索引的网格（等级0）相同（几乎共面的三角形会共享顶点）
+            flat = np.linalg.norm(soup_normals, axis=1) > 0.5
+            np.testing.assert_allclose(normals[indices.ravel()][flat], soup_normals[flat], atol=1e-3)
+            self.assertLess(len(vertexes), len(soup))
+            self.assertLess(len(group_indexed(zs, nodes, 0.3, 0.6, step, stride, 45)[0]) * 2, len(soup))
+
+    def test_lod(self):
+        self.assertAlmostEqual(projected_size(1, 10, 90, 500), 50)
+        self.assertAlmostEqual(projected_size(1, 10, 90, 500, ortho_zoom=0.1), 20)
+        center, radius = bounding_sphere([[0, 0, 0], [2, 0, 0], [0, 2, 0]])
+        np.testing.assert_allclose(center, [1, 1, 0])
+        self.assertAlmostEqual(radius, np.sqrt(2))
+        selector = LODSelector((400, 100), hysteresis=0.1)
+        self.assertEqual(selector.select(380), 0)  # 在滞后区间内不变
+        self.assertEqual(selector.select(350), 1)
+        self.assertEqual(selector.select(420), 1)
+        self.assertEqual(selector.select(450), 0)
+        self.assertEqual(selector.select(10), 2)
+        with self.assertRaises(ValueError):
+            LODSelector((100, 400))
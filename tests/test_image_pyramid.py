@@ -0,0 +1,126 @@
+import os
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+from PIL import Image as PILImage
+
+from utils.image_pyramid import ImagePyramid, TileCache
+
+
+def _ortho_mvp(left=-1., right=1., bottom=-1., top=1.):
+    """ 正交投影，把[left, right] x [bottom, top]映射到整个屏幕 """
+    mvp = np.eye(4)
+    mvp[0, 0] = 2 / (right - left)
+    mvp[1, 1] = 2 / (top - bottom)
+    mvp[0, 3] = -(right + left) / (right - left)
+    mvp[1, 3] = -(top + bottom) / (top - bottom)
+    return mvp
+
+
+class TestImagePyramid(unittest.TestCase):
+    def setUp(self):
+        self.img = np.random.randint(0, 255, (1000, 2000, 3), dtype=np.uint8)
+        self.pyramid = ImagePyramid(self.img, tile_size=256)
+
+    def test_levels(self):
+        self.assertEqual(self.pyramid.shape(0), (1000, 2000))
+        self.assertEqual(self.pyramid.shape(1), (500, 1000))
+        self.assertLessEqual(max(self.pyramid.shape(self.pyramid.top_level)), 256)
+        self.assertEqual(self.pyramid.grid(self.pyramid.top_level), (1, 1))
+        self.assertEqual(self.pyramid.grid(0), (8, 4))
+
+    def test_tile(self):
+        tile = self.pyramid.tile(0, 0, 0)
+        self.assertEqual(tile.shape, (257, 257, 3))  # 右侧和下侧多一个像素
+        np.testing.assert_array_equal(tile, self.img[:257, :257])
+        last = self.pyramid.tile(0, 7, 3)
+        self.assertEqual(last.shape, (1000 - 768, 2000 - 1792, 3))
+        self.assertEqual(self.pyramid.tile_nbytes(0, 7, 3), last.nbytes)
+        self.assertEqual(self.pyramid.tile_model_rect(0, 0, 0), (-1, 1 - 256 / 1000 * 2, -1 + 256 / 2000 * 2, 1))
+
+    def test_select_level(self):
+        self.assertEqual(self.pyramid.select_level(_ortho_mvp(), (2000, 1000)), 0)
+        self.assertEqual(self.pyramid.select_level(_ortho_mvp(), (500, 250)), 2)
+        self.assertEqual(self.pyramid.select_level(_ortho_mvp(), (10, 5)), self.pyramid.top_level)
+
+    def test_visible_tiles(self):
+        self.assertEqual(len(self.pyramid.visible_tiles(0, _ortho_mvp())), 32)
+        # 只看图片左上角
+        visible = self.pyramid.visible_tiles(0, _ortho_mvp(-1, -0.9, 0.9, 1))
+        self.assertIn((0, 0), visible)
+        self.assertTrue(all(ix <= 1 and iy <= 1 for ix, iy in visible))
+        # 图片完全在屏幕外
+        self.assertEqual(self.pyramid.visible_tiles(0, _ortho_mvp(3, 4, 3, 4)), [])
+
+    def test_ancestor_uv(self):
+        top = self.pyramid.top_level
+        self.assertEqual(self.pyramid.ancestor(0, 7, 3, top), (0, 0))
+        u0, v0, u1, v1 = self.pyramid.tile_uv(0, 0, 0, top, 0, 0)
+        self.assertAlmostEqual(u0, 0)
+        self.assertAlmostEqual(v1, 0)
+        self.assertGreater(u1, 0)
+        self.assertLess(u1, 1)
+        self.assertEqual(self.pyramid.tile_uv(top, 0, 0, top, 0, 0)[2:], (1, 0))
+
+
+class TestImagePyramidFromFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "huge.png")
+        self.img = np.random.randint(0, 255, (1000, 2001, 3), dtype=np.uint8)
+        PILImage.fromarray(self.img).save(self.path)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_lazy_levels(self):
+        level1 = 500 * 1000 * 3  # 第1级的字节数
+        pyramid = ImagePyramid.from_file(self.path, tile_size=256, cpu_budget=level1 + 1)
+        # 只读取文件头，不解码
+        self.assertEqual(pyramid.nbytes, 0)
+        self.assertEqual(pyramid.shape(0), (1000, 2001))
+        self.assertLessEqual(max(pyramid.shape(pyramid.top_level)), 256)
+        np.testing.assert_array_equal(pyramid.tile(0, 0, 0), self.img[:257, :257])
+        # 解码的级别与文件头推算的尺寸一致
+        for level in range(pyramid.level_count):
+            self.assertEqual(pyramid.level(level).shape[:2], pyramid.shape(level))
+        # 超出预算时淘汰最久未使用的级别，不保留原图
+        self.assertLessEqual(pyramid.nbytes, level1 + 1)
+        self.assertFalse(pyramid.level_ready(0))
+        pyramid.close()
+        self.assertEqual(pyramid.nbytes, 0)
+
+    def test_request_level(self):
+        pyramid = ImagePyramid.from_file(self.path, tile_size=256)
+        done = threading.Event()
+        pyramid.request_level(1, done.set)
+        self.assertTrue(done.wait(5))
+        self.assertTrue(pyramid.level_ready(1))
+        self.assertEqual(pyramid.nbytes, pyramid.level(1).nbytes)
+        pyramid.close()
+
+
+class TestTileCache(unittest.TestCase):
+    def test_budget(self):
+        evicted = []
+        cache = TileCache(100, on_evict=lambda key, value: evicted.append(key))
+        cache.put("a", 1, 40)
+        cache.put("b", 2, 40)
+        cache.get("a")
+        cache.put("c", 3, 40)  # 淘汰最久未使用的b
+        self.assertEqual(evicted, ["b"])
+        self.assertEqual(cache.nbytes, 80)
+        cache.put("d", 4, 40, protected={"a", "c"})  # 受保护的项不淘汰，允许暂时超出预算
+        self.assertEqual(cache.nbytes, 120)
+        self.assertEqual(len(cache), 3)
+        cache.trim()
+        self.assertEqual(cache.nbytes, 80)
+        cache.clear()
+        self.assertEqual(cache.nbytes, 0)
+        self.assertEqual(len(evicted), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+
+from PyQt5.QtGui import QImage, QColor
+
+from utils.image_resources import pack_images, ImageRegistry
+
+UI_DESIGN_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "GUI", "UI_design")
+
+
+class TestImageResources(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.blob_path = os.path.join(self.tmp_dir.name, "images.bin")
+        theme_dirs = {}
+        for theme, color in (("Day", QColor(255, 0, 0)), ("Night", QColor(0, 0, 255))):
+            folder = os.path.join(self.tmp_dir.name, theme)
+            os.makedirs(folder)
+            for name, size in (("close", 8), ("ICO", 16)):
+                image = QImage(size, size, QImage.Format_RGB32)
+                image.fill(color)
+                image.save(os.path.join(folder, f"{name}.png"))
+            theme_dirs[theme] = folder
+        pack_images(self.blob_path, theme_dirs)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_load_theme(self):
+        registry = ImageRegistry(self.blob_path, "Night")
+        self.assertEqual(sorted(registry.names()), ["CLOSE", "ICO"])
+        with open(os.path.join(self.tmp_dir.name, "Night", "close.png"), "rb") as f:
+            self.assertEqual(registry.bytes("CLOSE"), f.read())
+        self.assertIn("close", registry)
+        self.assertNotIn("tip", registry)
+
+    def test_lazy_decode(self):
+        registry = ImageRegistry(self.blob_path, "Day")
+        self.assertEqual(registry.decoded_count(), 0)
+        image = registry.image("ico")
+        self.assertEqual(image.width(), 16)
+        self.assertEqual(QColor(image.pixel(0, 0)).red(), 255)
+        self.assertIs(registry.image("ICO"), image)  # 解码结果被缓存
+        self.assertEqual(registry.decoded_count(), 1)
+
+    def test_invalid_file(self):
+        path = os.path.join(self.tmp_dir.name, "bad.bin")
+        with open(path, "wb") as f:
+            f.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            ImageRegistry(path, "Day")
+        with self.assertRaises(KeyError):
+            ImageRegistry(self.blob_path, "Custom")
+
+    def test_packed_ui_images(self):
+        """
+        images.bin 与 ImgPngDay、ImgPngNight 中的图片一致（修改图片后需要运行 pack_images.py）
+        """
+        for theme, folder in (("Day", "ImgPngDay"), ("Night", "ImgPngNight")):
+            registry = ImageRegistry(os.path.join(UI_DESIGN_DIR, "images.bin"), theme)
+            files = [file for file in os.listdir(os.path.join(UI_DESIGN_DIR, folder)) if file.endswith(".png")]
+            self.assertEqual(len(registry.names()), len(files))
+            for file in files:
+                with open(os.path.join(UI_DESIGN_DIR, folder, file), "rb") as f:
+                    self.assertEqual(registry.bytes(file[:-4]), f.read())
@@ -0,0 +1,66 @@
+import os
+import sys
+import unittest
+
+from utils.import_profile import ModuleWarmUp, format_import_report, profile_imports, static_imports
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# 开始界面显示前不应导入的模块
+HEAVY_MODULES = ["OpenGL.GL", "pyassimp", "psutil", "quaternion", "ShipRead", "GUI.main_widgets", "main_editor"]
+
+
+class TestImportProfile(unittest.TestCase):
+    def test_warm_up(self):
+        warm_up = ModuleWarmUp(["colorsys", "json"])
+        warm_up.start()
+        warm_up.wait()
+        self.assertIn("colorsys", sys.modules)
+        self.assertEqual(list(warm_up.durations.keys()), ["colorsys", "json"])
+
+    def test_warm_up_error(self):
+        warm_up = ModuleWarmUp(["no_such_module_for_test", "json"])
+        with self.assertRaises(ImportError):
+            warm_up.wait()  # 未启动时在当前线程中导入
+        self.assertIn("json", warm_up.durations)  # 导入失败不影响后续模块
+
+    def test_warm_up_wait_twice(self):
+        # 从命令行打开文件时线程不会启动，之后每个新的编辑窗口都会调用wait
+        warm_up = ModuleWarmUp(["json"])
+        warm_up.wait()
+        warm_up.wait()
+        warm_up.start()
+        warm_up.join()
+        warm_up.wait()
+        self.assertEqual(list(warm_up.durations.keys()), ["json"])
+
+    def test_profile_imports(self):
+        records = profile_imports("utils.perf_trace", cwd=ROOT)
+        modules = [record.module for record in records]
+        self.assertIn("utils.perf_trace", modules)
+        self.assertIn("json", modules)
+        record = records[modules.index("utils.perf_trace")]
+        self.assertGreaterEqual(record.cumulative_us, record.self_us)
+        report = format_import_report(records, top=5)
+        self.assertEqual(len(report.splitlines()), 7)
+        with self.assertRaises(ImportError):
+            profile_imports("no_such_module_for_test", cwd=ROOT)
+
+    def test_start_window_imports(self):
+        """
+        OpenGL、assimp、工程读取等模块应在后台预加载，而不是在开始界面显示前导入；
+        开始界面依赖Windows的路径，不能在其他平台上导入，因此从源码分析导入关系
+        """
+        roots = [ROOT, os.path.join(ROOT, "GUI")]
+        modules = static_imports("startWindow", roots)
+        self.assertIn("GUI.general_widgets", modules)
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, modules)
+        # 主编辑窗口确实会导入这些模块（分析结果不是空的）
+        self.assertIn("OpenGL.GL", static_imports("main_editor", roots))
+
+    @unittest.skipUnless(sys.platform == "win32", "开始界面依赖Windows的路径")
+    def test_start_window_import_time(self):
+        records = profile_imports("startWindow", cwd=ROOT)
+        modules = {record.module for record in records}
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, modules)
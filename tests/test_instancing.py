@@ -0,0 +1,49 @@
+import unittest
+
+import numpy as np
+
+from utils.instancing import box_transforms, changed_range, ladder_transforms, railing_transforms, sample_path
+
+
+class TestInstancing(unittest.TestCase):
+    def test_sample_path(self):
+        positions, tangents = sample_path([[0, 0, 0], [0, 0, 0], [3, 0, 0], [3, 0, 4]], 1.0)
+        self.assertEqual(len(positions), 8)  # 总长7，包括两个端点
+        np.testing.assert_allclose(positions[[0, -1]], [[0, 0, 0], [3, 0, 4]])
+        np.testing.assert_allclose(tangents[0], [1, 0, 0])  # 跳过重复的顶点
+        np.testing.assert_allclose(tangents[-1], [0, 0, 1])
+        # 闭合路径首尾不重复
+        positions, _ = sample_path([[0, 0, 0], [2, 0, 0], [2, 0, 2], [0, 0, 2]], 1.0, closed=True)
+        self.assertEqual(len(positions), 8)
+        self.assertGreater(np.linalg.norm(positions[-1] - positions[0]), 0.5)
+
+    def test_box_transforms(self):
+        m = box_transforms([[1, 2, 3]], [[0, 0, 2]], (4, 5, 6))[0]
+        corner = m @ [0.5, 0.5, 0.5, 1]
+        np.testing.assert_allclose(corner[:3], [1 - 3, 2 + 2.5, 3 + 2])  # x轴沿+z，y轴朝上
+        # 竖直方向不退化
+        m = box_transforms([[0, 0, 0]], [[0, 1, 0]], (2, 1, 1))[0]
+        self.assertAlmostEqual(abs(np.linalg.det(m[:3, :3])), 2, places=5)
+
+    def test_railing(self):
+        transforms = railing_transforms([([[0, 0, 0], [2, 0, 0]], False)], height=1.2, interval=1.0, thickness=0.1)
+        self.assertEqual(transforms.shape, (5, 4, 4))  # 3根立柱 + 2段扶手
+        np.testing.assert_allclose(transforms[:3, :3, 3], [[0, 0.6, 0], [1, 0.6, 0], [2, 0.6, 0]])
+        np.testing.assert_allclose(transforms[3, 1, 3], 1.2, rtol=1e-6)
+        panels = railing_transforms([([[0, 0, 0], [2, 0, 0], [2, 0, 2]], True)], 1.0, None, 0.1)
+        self.assertEqual(len(panels), 3)
+        self.assertEqual(railing_transforms([], 1.0, 1.0, 0.1).shape, (0, 4, 4))
+
+    def test_ladder(self):
+        transforms = ladder_transforms(length=3, width=0.5, interval=0.5, material_width=0.1)
+        self.assertEqual(len(transforms), 2 + 5)  # 两根竖杆和 0.5~2.5 的5根踏棍
+        np.testing.assert_allclose(transforms[2:, 1, 3], [0.5, 1, 1.5, 2, 2.5])
+
+    def test_changed_range(self):
+        old = ladder_transforms(3, 0.5, 0.5, 0.1)
+        self.assertIsNone(changed_range(old, old.copy()))
+        new = old.copy()
+        new[3:5, 0, 0] += 1
+        self.assertEqual(changed_range(old, new), (3, 5))
+        self.assertEqual(changed_range(old, ladder_transforms(3, 0.5, 1.0, 0.1)), (0, 4))
+        self.assertEqual(changed_range(None, old), (0, len(old)))
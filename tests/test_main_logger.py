@@ -1,9 +1,107 @@
 # tests/test_main_logger.py
 import unittest
 from unittest.mock import patch, MagicMock
+import io
 import sys
 import os
-from main_logger import Log, StatusBarHandler
+import tempfile
+import time
+from main_logger import Log, LogWriter, StatusBarHandler
+
+
+class TestLogWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "logging.txt")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_flush_and_streams(self):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        writer = LogWriter(self.path, stdout, stderr)
+        writer.put((time.time(), "[INFO]    ", "Test", "info message", False))
+        writer.put((time.time(), "[ERROR]   ", "Test", "error message", True))
+        writer.flush()
+        with open(self.path, encoding="utf-8") as f:
+            content = f.read()
+        self.assertIn("info message", content)
+        self.assertIn("error message", content)
+        self.assertIn("info message", stdout.getvalue())
+        self.assertNotIn("error message", stdout.getvalue())
+        self.assertIn("error message", stderr.getvalue())
+        writer.close()
+
+    def test_rotation(self):
+        writer = LogWriter(self.path, max_bytes=200, backup_count=2)
+        for i in range(50):
+            writer.write(f"line {i:03d} " + "x" * 40 + "\n")
+        writer.close()
+        self.assertTrue(os.path.exists(writer._backup_path(1)))
+        self.assertTrue(os.path.exists(writer._backup_path(2)))
+        self.assertFalse(os.path.exists(writer._backup_path(3)))
+        for path in (self.path, writer._backup_path(1), writer._backup_path(2)):
+            self.assertLessEqual(os.path.getsize(path), 200)
+        with open(self.path, encoding="utf-8") as f:
+            self.assertIn("line 049", f.read())
+
+    def test_close_writes_all(self):
+        writer = LogWriter(self.path, max_bytes=1024 * 1024)
+        for i in range(2000):
+            writer.put((time.time(), "[INFO]    ", "Test", f"message {i}", False))
+        writer.close()
+        with open(self.path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 2000)
+        self.assertIn("message 1999", lines[-1])
+
+    def test_file_error_keeps_thread(self):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        writer = LogWriter(self.path, stdout, stderr)
+        writer.flush()
+        writer._file.close()
+        writer._file = MagicMock()
+        writer._file.write.side_effect = OSError("disk full")
+        writer.write("lost line\n")
+        writer.flush()
+        # 文件出错后线程仍在运行，之后的记录只输出到控制台
+        self.assertTrue(writer._thread.is_alive())
+        self.assertIsNone(writer._file)
+        self.assertIn("disk full", stderr.getvalue())
+        writer.write("console line\n")
+        writer.flush()
+        self.assertIn("console line", stdout.getvalue())
+        t = time.perf_counter()
+        writer.close()
+        self.assertLess(time.perf_counter() - t, 1)
+        writer._thread.join(1)
+        self.assertFalse(writer._thread.is_alive())
+
+    def test_error_written_before_return(self):
+        writer = LogWriter(self.path, flush_interval=60)
+        writer.put((time.time(), "[INFO]    ", "Test", "info message", False))
+        writer.put((time.time(), "[ERROR]   ", "Test", "error message", True))
+        # 不调用flush：错误记录（以及之前的记录）返回时已经在文件中
+        with open(self.path, encoding="utf-8") as f:
+            content = f.read()
+        self.assertIn("info message", content)
+        self.assertIn("error message", content)
+        writer.close()
+        writer._thread.join(1)
+        # 后台线程结束后的错误记录同步写入
+        writer.put((time.time(), "[ERROR]   ", "Test", "late error", True))
+        with open(self.path, encoding="utf-8") as f:
+            self.assertIn("late error", f.read())
+
+    def test_put_does_not_block(self):
+        writer = LogWriter(self.path)
+        n = 10000
+        t = time.perf_counter()
+        for i in range(n):
+            writer.put((time.time(), "[INFO]    ", "Test", "message", False))
+        cost = (time.perf_counter() - t) / n
+        writer.close()
+        self.assertLess(cost, 1e-4)
 
 
 if __name__ == '__main__':
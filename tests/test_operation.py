@@ -0,0 +1,200 @@
+"""
+测试operation/basic_op.py
+"""
+import time
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+from operation.basic_op import Operation, OperationStack
+from operation.section_op import SectionGroupSnapshotOperation
+
+
+class _SetValueOperation(Operation):
+    def __init__(self, target: dict, value, size=0):
+        super().__init__()
+        self.name = f"设置 {value}"
+        self.target = target
+        self.value = value
+        self.origin = target.get("value")
+        self.size = size
+
+    def execute(self):
+        self.target["value"] = self.value
+
+    def undo(self):
+        self.target["value"] = self.origin
+
+    def redo(self):
+        self.execute()
+
+    def merge(self, operation):
+        if type(operation) is not _SetValueOperation or operation.target is not self.target:
+            return False
+        self.value = operation.value
+        self.size += operation.size
+        return True
+
+    def estimate_size(self) -> int:
+        return self.size
+
+
+class _ArrayGroup:
+    def __init__(self, array):
+        self.name = "截面组"
+        self.array = array
+        self.set_count = 0
+
+    def get_array(self):
+        return self.array.copy()
+
+    def set_array(self, array):
+        self.array = np.array(array, dtype=np.float64)
+        self.set_count += 1
+
+
+class TestOperationStack(unittest.TestCase):
+
+    def setUp(self):
+        self.main_editor = MagicMock()
+        self.target = {"value": 0}
+
+    def _stack(self, max_length=10, max_bytes=1024, coalesce_window=0.0):
+        stack = OperationStack(self.main_editor, max_length=max_length, max_bytes=max_bytes,
+                               coalesce_window=coalesce_window)
+        stack.init_stack()
+        return stack
+
+    def test_undo_redo(self):
+        stack = self._stack()
+        for i in range(1, 4):
+            stack.execute(_SetValueOperation(self.target, i))
+        stack.undo()
+        stack.undo()
+        self.assertEqual(self.target["value"], 1)
+        stack.redo()
+        self.assertEqual(self.target["value"], 2)
+        # 新操作会丢弃可重做的操作
+        stack.execute(_SetValueOperation(self.target, 10))
+        stack.redo()
+        self.assertEqual(self.target["value"], 10)
+        self.assertEqual(stack.length, 3)
+
+    def test_ring_buffer_eviction(self):
+        stack = self._stack(max_length=5)
+        for i in range(1, 21):
+            stack.execute(_SetValueOperation(self.target, i))
+        # 底部状态占用一个位置
+        self.assertEqual(stack.length, 4)
+        for _ in range(10):
+            stack.undo()
+        self.assertEqual(self.target["value"], 16)
+
+    def test_byte_budget(self):
+        stack = self._stack(max_length=100, max_bytes=100)
+        for i in range(1, 11):
+            stack.execute(_SetValueOperation(self.target, i, size=30))
+        # 底部状态也计入预算：3 * 30 字节，其中2个可撤回
+        self.assertLessEqual(stack.nbytes, 100)
+        self.assertEqual(stack.length, 2)
+        # 至少保留最新的一个操作
+        stack.update_max_bytes(40)
+        self.assertEqual(stack.length, 1)
+        self.assertEqual(stack.nbytes, 60)
+
+    def test_update_size(self):
+        stack = self._stack(max_length=10)
+        for i in range(1, 9):
+            stack.execute(_SetValueOperation(self.target, i))
+        stack.update_size(5)
+        self.assertEqual(stack.length, 4)
+        stack.undo()
+        self.assertEqual(self.target["value"], 7)
+        stack.update_size(20)
+        stack.execute(_SetValueOperation(self.target, 100))
+        self.assertEqual(stack.length, 4)
+
+    def test_clear(self):
+        stack = self._stack()
+        for i in range(1, 6):
+            stack.execute(_SetValueOperation(self.target, i))
+        stack.clear(2)
+        self.assertEqual(stack.length, 3)
+        stack.clear()
+        self.assertEqual(stack.length, 0)
+        self.assertEqual(stack.nbytes, Operation().nbytes)
+
+    def test_coalesce(self):
+        stack = self._stack(coalesce_window=0.05)
+        paint = self.main_editor.gl_widget.paintGL_outside
+        update = self.main_editor.gl_widget.update
+        paint.reset_mock()
+        update.reset_mock()
+        for i in range(1, 11):
+            stack.execute(_SetValueOperation(self.target, i))
+        # 连续的操作合并为一个撤回步骤，只在第一个操作时同步重绘，之后每次合并都请求一次重绘
+        self.assertEqual(stack.length, 1)
+        self.assertEqual(paint.call_count, 1)
+        self.assertEqual(update.call_count, 9)
+        time.sleep(0.1)
+        # 超出时间窗口后是新的撤回步骤
+        stack.execute(_SetValueOperation(self.target, 20))
+        self.assertEqual(stack.length, 2)
+        stack.undo()
+        self.assertEqual(self.target["value"], 10)
+        stack.undo()
+        self.assertEqual(self.target["value"], 0)
+        stack.redo()
+        self.assertEqual(self.target["value"], 10)
+
+    def test_coalesce_byte_budget(self):
+        stack = self._stack(max_length=100, max_bytes=100, coalesce_window=0.05)
+        stack.execute(_SetValueOperation(self.target, 1, size=20))
+        time.sleep(0.1)
+        for i in range(2, 6):
+            stack.execute(_SetValueOperation(self.target, i, size=20))
+        # 合并后的栈顶操作变大，超出预算时淘汰更早的操作
+        self.assertEqual(stack.length, 1)
+        self.assertLessEqual(stack.nbytes, 100)
+        stack.undo()
+        self.assertEqual(self.target["value"], 1)
+
+    def test_snapshot_operation(self):
+        rng = np.random.default_rng(0)
+        # float64的坐标（不能用float32精确表示）撤回和重做后必须完全不变
+        origin = rng.random((50, 20, 3))
+        target = origin.copy()
+        target[:, :, 0] *= 1.1  # 只缩放x
+        group = _ArrayGroup(origin.copy())
+        stack = self._stack(max_bytes=1024 * 1024)
+        op = SectionGroupSnapshotOperation(group, target)
+        stack.execute(op)
+        np.testing.assert_array_equal(group.array, target)
+        # 只保存压缩后的差值
+        self.assertLess(op.nbytes, origin.nbytes)
+        stack.undo()
+        np.testing.assert_array_equal(group.array, origin)
+        stack.redo()
+        np.testing.assert_array_equal(group.array, target)
+        # 每次撤回或重做只整体赋值一次
+        self.assertEqual(group.set_count, 3)
+
+    def test_snapshot_merge(self):
+        rng = np.random.default_rng(1)
+        origin = rng.random((10, 5, 3))
+        group = _ArrayGroup(origin.copy())
+        stack = self._stack(max_bytes=1024 * 1024, coalesce_window=0.05)
+        for scale in (1.1, 1.2, 1.3):
+            target = origin.copy()
+            target[..., 1] *= scale
+            stack.execute(SectionGroupSnapshotOperation(group, target))
+        # 连续的批量编辑合并为一个撤回步骤
+        self.assertEqual(stack.length, 1)
+        np.testing.assert_array_equal(group.array, target)
+        stack.undo()
+        np.testing.assert_array_equal(group.array, origin)
+        stack.redo()
+        np.testing.assert_array_equal(group.array, target)
+
+if __name__ == '__main__':
+    unittest.main()
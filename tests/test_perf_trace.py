@@ -0,0 +1,66 @@
+import json
+import os
+import tempfile
+import unittest
+
+from utils.perf_trace import PerfTracer, trace_span, trace_it
+
+
+class TestPerfTrace(unittest.TestCase):
+    def setUp(self):
+        PerfTracer.enable(capacity=8)
+        PerfTracer.clear()
+
+    def tearDown(self):
+        PerfTracer.disable()
+        PerfTracer.clear()
+
+    def test_span_and_decorator(self):
+        @trace_it("inner", "test")
+        def inner():
+            return 1
+
+        with trace_span("outer", "test", frame=1):
+            self.assertEqual(inner(), 1)
+        events = PerfTracer.events()
+        self.assertEqual([e[0] for e in events], ["inner", "outer"])
+        self.assertEqual(events[1][5], {"frame": 1})
+        self.assertGreaterEqual(events[1][3], events[0][3])
+
+    def test_disabled(self):
+        PerfTracer.disable()
+
+        @trace_it()
+        def func():
+            return 2
+
+        with trace_span("span"):
+            self.assertEqual(func(), 2)
+        self.assertEqual(PerfTracer.events(), [])
+
+    def test_ring_buffer(self):
+        for i in range(20):
+            with trace_span(f"span{i}"):
+                pass
+        events = PerfTracer.events()
+        self.assertEqual(len(events), 8)
+        self.assertEqual(events[-1][0], "span19")
+
+    def test_export_chrome_trace(self):
+        with trace_span("paintGL", "gl"):
+            pass
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "trace.json")
+            PerfTracer.export_chrome_trace(path)
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        event = data["traceEvents"][0]
+        self.assertEqual(event["name"], "paintGL")
+        self.assertEqual(event["ph"], "X")
+        self.assertEqual(event["cat"], "gl")
+        self.assertIn("ts", event)
+        self.assertIn("dur", event)
+
+
+if __name__ == '__main__':
+    unittest.main()
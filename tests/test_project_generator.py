@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+
+import ujson
+
+from benchmarks.project_generator import check_code, make_project, write_assets, write_na, write_naprj
+
+
+class TestProjectGenerator(unittest.TestCase):
+    def test_make_project(self):
+        data = make_project(hull_groups=2, sections=12, nodes=6, armor_groups=3, bridges=5, ladders=7, models=2,
+                            ref_images=1, asset_dir="assets")
+        self.assertEqual(data["check_code"], check_code(data))
+        self.assertEqual([len(data[k]) for k in ("hull_section_group", "armor_section_group", "bridge", "ladder",
+                                                 "model", "ref_image")], [2, 3, 5, 7, 2, 1])
+        for group in data["hull_section_group"]:
+            self.assertEqual(len(group["sections"]), 12)
+            zs = [section["z"] for section in group["sections"]]
+            self.assertEqual(zs, sorted(zs))
+            self.assertTrue(all(len(section["nodes"]) == len(section["col"]) == 6 for section in group["sections"]))
+        # 相同的种子生成相同的工程
+        self.assertEqual(data, make_project(hull_groups=2, sections=12, nodes=6, armor_groups=3, bridges=5,
+                                            ladders=7, models=2, ref_images=1, asset_dir="assets"))
+
+    def test_write_files(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            write_assets(tmp_dir, (64, 16))
+            data = make_project(models=1, ref_images=1, asset_dir=tmp_dir)
+            path = os.path.join(tmp_dir, "test.naprj")
+            write_naprj(path, data)
+            with open(path, "r", encoding="utf-8") as f:
+                loaded = ujson.load(f)
+            self.assertEqual(loaded["check_code"], check_code(loaded))
+            self.assertTrue(os.path.exists(loaded["model"][0]["file_path"]))
+            self.assertTrue(os.path.exists(loaded["ref_image"][0]["file_path"]))
+
+            na_path = os.path.join(tmp_dir, "test.na")
+            count = write_na(na_path, sections=5, nodes=4, weapons=3, decorations=2)
+            parts = ET.parse(na_path).getroot().find("ship").findall("part")
+            self.assertEqual(count, len(parts))
+            self.assertEqual(len(parts), 4 * 3 + 3 + 2 * 2)
+            self.assertEqual(sum(part.find("turret") is not None for part in parts), 3)
+            self.assertEqual(sum(part.attrib["id"] == "0" for part in parts), 12)
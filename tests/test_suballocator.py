@@ -0,0 +1,58 @@
+import unittest
+
+from utils.suballocator import FreeListAllocator, grow_capacity
+
+
+class TestSubAllocator(unittest.TestCase):
+    def test_grow_capacity(self):
+        self.assertEqual(grow_capacity(1024, 512), 1024)  # 容量足够时不变
+        self.assertEqual(grow_capacity(1024, 1040), 1536)
+        self.assertEqual(grow_capacity(1024, 4000), 4000)
+        self.assertEqual(grow_capacity(0, 10), 16)  # 按16字节对齐
+        # 每次多1字节地增长，重新分配的次数为对数级
+        capacity, grows = 0, 0
+        for needed in range(1, 100000):
+            new_capacity = grow_capacity(capacity, needed)
+            grows += new_capacity != capacity
+            capacity = new_capacity
+        self.assertLess(grows, 30)
+
+    def test_allocate_free(self):
+        allocator = FreeListAllocator(4096, alignment=256)
+        a = allocator.allocate(100)
+        b = allocator.allocate(300)
+        c = allocator.allocate(256)
+        self.assertEqual((a, b, c), (0, 256, 768))
+        self.assertEqual(allocator.size_of(b), 512)
+        self.assertEqual(len(allocator), 3)
+        self.assertIsNone(allocator.allocate(4096))
+        allocator.free(b)
+        self.assertEqual(allocator.allocate(200), 256)  # 最佳适配：使用释放出的区间
+        with self.assertRaises(KeyError):
+            allocator.free(100)
+
+    def test_coalesce(self):
+        allocator = FreeListAllocator(1024, alignment=256)
+        offsets = [allocator.allocate(256) for _ in range(4)]
+        self.assertIsNone(allocator.allocate(1))
+        allocator.free(offsets[0])
+        allocator.free(offsets[2])
+        stats = allocator.stats()
+        self.assertEqual(stats["free_blocks"], 2)
+        self.assertAlmostEqual(stats["fragmentation"], 0.5)
+        self.assertIsNone(allocator.allocate(512))
+        allocator.free(offsets[1])  # 与前后两个空闲区间合并
+        self.assertEqual(allocator.stats()["free_blocks"], 1)
+        self.assertEqual(allocator.allocate(768), 0)
+
+    def test_grow_and_stats(self):
+        allocator = FreeListAllocator(512, alignment=256)
+        allocator.allocate(512)
+        self.assertIsNone(allocator.allocate(256))
+        allocator.grow(1024)
+        self.assertEqual(allocator.allocate(512), 512)
+        stats = allocator.stats()
+        self.assertEqual(stats["capacity"], 1024)
+        self.assertEqual(stats["used"], 1024)
+        self.assertAlmostEqual(stats["utilization"], 1.)
+        self.assertEqual(stats["fragmentation"], 0.)
@@ -0,0 +1,134 @@
+import os
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+from PIL import Image
+
+from utils.texture_cache import TextureCache
+
+
+class TestTextureCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "image.png")
+        self.img = np.random.randint(0, 255, (16, 32, 3), dtype=np.uint8)
+        Image.fromarray(self.img).save(self.path)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_shared_entry(self):
+        a = TextureCache.acquire(self.path, flip_y=True)
+        b = TextureCache.acquire(self.path, flip_y=True)
+        c = TextureCache.acquire(self.path)
+        self.assertIs(a, b)
+        self.assertIsNot(a, c)
+        self.assertEqual(a.refcount, 2)
+        np.testing.assert_array_equal(a.image(), self.img[::-1])
+        np.testing.assert_array_equal(c.image(), self.img)
+        for entry in (a, b, c):
+            TextureCache.release(entry)
+        self.assertNotIn(a.key, TextureCache._entries)
+        self.assertNotIn(c.key, TextureCache._entries)
+
+    def test_decode_on_worker(self):
+        threads = []
+        from utils import texture_cache
+        decode = texture_cache._decode
+
+        def _decode(*args):
+            threads.append(threading.current_thread())
+            return decode(*args)
+
+        texture_cache._decode = _decode
+        try:
+            entry = TextureCache.acquire(self.path)
+            entry.image()
+        finally:
+            texture_cache._decode = decode
+        self.assertIsNot(threads[0], threading.current_thread())
+        TextureCache.release(entry)
+
+    def test_mtime_invalidate(self):
+        a = TextureCache.acquire(self.path)
+        a.image()
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        b = TextureCache.acquire(self.path)
+        self.assertIsNot(a, b)
+        TextureCache.release(a)
+        TextureCache.release(b)
+
+    def test_gpu_accounting(self):
+        uploads = []
+
+        def upload(img):
+            uploads.append(img)
+            return 100 + len(uploads), img.nbytes
+
+        a = TextureCache.acquire(self.path)
+        b = TextureCache.acquire(self.path)
+        TextureCache.request(a, 2)
+        self.assertEqual(TextureCache.texture_id(a, 1, upload, wait=True), 101)
+        self.assertEqual(TextureCache.texture_id(b, 1, upload), 101)  # 同一共享组只上传一次
+        self.assertTrue(a.ready())  # 共享组2还没有上传，保留图片
+        self.assertEqual(TextureCache.texture_id(b, 2, upload), 102)
+        self.assertEqual(len(uploads), 2)
+        # 上传到所有请求过的共享组之后释放图片
+        self.assertFalse(a.ready())
+        self.assertEqual(TextureCache.nbytes(), 0)
+        self.assertEqual(TextureCache.gpu_nbytes(), self.img.nbytes * 2)
+        TextureCache.release(a)
+        self.assertEqual(TextureCache.take_orphans(1), [])
+        TextureCache.release(b)
+        self.assertEqual(TextureCache.gpu_nbytes(), 0)
+        self.assertEqual(TextureCache.take_orphans(1), [101])
+        self.assertEqual(TextureCache.take_orphans(2), [102])
+
+    def test_texture_id_does_not_block(self):
+        from utils import texture_cache
+        decode = texture_cache._decode
+        started = threading.Event()
+
+        def _decode(*args):
+            started.wait(5)
+            return decode(*args)
+
+        texture_cache._decode = _decode
+        try:
+            entry = TextureCache.acquire(self.path)
+            # 解码完成前返回None，不等待解码线程
+            self.assertIsNone(TextureCache.texture_id(entry, 1, lambda img: (1, img.nbytes)))
+            done = threading.Event()
+            TextureCache.request(entry, 1).add_done_callback(lambda _: done.set())
+            started.set()
+            self.assertTrue(done.wait(5))
+            self.assertEqual(TextureCache.texture_id(entry, 1, lambda img: (1, img.nbytes)), 1)
+            self.assertFalse(entry.ready())
+            # 图片释放后才请求的共享组重新解码
+            self.assertEqual(TextureCache.texture_id(entry, 2, lambda img: (2, img.nbytes), wait=True), 2)
+        finally:
+            texture_cache._decode = decode
+        TextureCache.release(entry)
+        TextureCache.take_orphans(1)
+        TextureCache.take_orphans(2)
+
+    def test_drop_group(self):
+        entry = TextureCache.acquire(self.path)
+        self.assertEqual(TextureCache.texture_id(entry, 1, lambda img: (101, img.nbytes), wait=True), 101)
+        TextureCache.request(entry, 2)
+        # 共享组1的上下文销毁：纹理id失效，复用同一地址的共享组重新上传
+        TextureCache.drop_group(1)
+        self.assertEqual(entry.gpu, {})
+        self.assertEqual(TextureCache.texture_id(entry, 1, lambda img: (201, img.nbytes), wait=True), 201)
+        # 等待删除的纹理id也随共享组一起移除，不会在之后复用该地址的上下文中被删除
+        TextureCache.release(entry)
+        TextureCache.drop_group(1)
+        self.assertEqual(TextureCache.take_orphans(1), [])
+        TextureCache.take_orphans(2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from PyQt5.QtCore import QCoreApplication, Qt
+from PyQt5.QtGui import QImage, QColor
+
+from utils.thumbnail_cache import ThumbnailCache
+
+
+class TestThumbnailCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = ThumbnailCache(os.path.join(self.tmp_dir.name, "thumbnails"))
+        self.image_path = os.path.join(self.tmp_dir.name, "ref.png")
+        image = QImage(200, 100, QImage.Format_RGB32)
+        image.fill(QColor(255, 0, 0))
+        image.save(self.image_path)
+        self.prj_path = os.path.join(self.tmp_dir.name, "test.naprj")
+        with open(self.prj_path, "w", encoding="utf-8") as f:
+            json.dump({"ref_image": [{"file_path": self.image_path}]}, f)
+
+    def tearDown(self):
+        self.cache.wait()
+        self.tmp_dir.cleanup()
+
+    def test_store_and_load(self):
+        image = QImage(300, 300, QImage.Format_RGB32)
+        image.fill(QColor(0, 0, 255))
+        self.assertTrue(self.cache.store(self.prj_path, image))
+        thumbnail = self.cache.load(self.prj_path)
+        self.assertEqual(thumbnail.width(), ThumbnailCache.SIZE)
+        self.assertEqual(QColor(thumbnail.pixel(32, 32)).blue(), 255)
+        self.assertEqual(thumbnail.pixelColor(0, 0).alpha(), 0)  # 圆角外透明
+
+    def test_mtime_invalidate(self):
+        image = QImage(300, 300, QImage.Format_RGB32)
+        image.fill(QColor(0, 0, 255))
+        self.cache.store(self.prj_path, image)
+        old_path = self.cache.thumbnail_path(self.prj_path)
+        stat = os.stat(self.prj_path)
+        os.utime(self.prj_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self.assertNotEqual(self.cache.thumbnail_path(self.prj_path), old_path)
+        # 缓存失效后，用第一张参考图片生成
+        thumbnail = self.cache.load(self.prj_path)
+        self.assertEqual(QColor(thumbnail.pixel(32, 32)).red(), 255)
+        self.assertFalse(os.path.exists(old_path))
+
+    def test_request_async(self):
+        loaded = []
+        self.cache.loaded_s.connect(lambda path, image: loaded.append((path, image)))
+        self.cache.request(self.prj_path)
+        self.cache.request(os.path.join(self.tmp_dir.name, "missing.naprj"))
+        deadline = time.time() + 5
+        while not loaded and time.time() < deadline:
+            QCoreApplication.processEvents()
+            time.sleep(0.01)
+        self.assertEqual(len(loaded), 1)
+        self.assertEqual(loaded[0][0], self.prj_path)
+        self.assertFalse(loaded[0][1].isNull())
+
+
+if __name__ == '__main__':
+    unittest.main()
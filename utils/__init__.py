@@ -2,3 +2,4 @@
 from .const import *
 from .cv2_replacements import ReplaceCV2
 from .funcs_utils import *
+from .perf_trace import *
@@ -0,0 +1,129 @@
+"""
+帧耗时统计
+用于渲染性能测试，记录每帧的CPU耗时、GPU耗时和绘制调用次数，并计算均值和百分位数；
+FrameStatsRecorder 保存最近若干帧的耗时，供视图的性能浮层和自动化的性能回归检查使用
+"""
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+__all__ = ["FrameTiming", "summarize", "summarize_frames", "RollingSamples", "FrameStatsRecorder"]
+
+
+class FrameTiming(NamedTuple):
+    cpu_ms: float  # 提交绘制命令的CPU耗时
+    gpu_ms: Optional[float]  # GPU执行耗时（计时查询），不支持时为None
+    total_ms: float  # 包括等待GPU完成（glFinish）的总耗时
+    draw_calls: int  # 绘制调用次数
+
+
+def summarize(values: Iterable[float]) -> Dict[str, float]:
+    """
+    计算均值、p50、p95、p99和最大值；没有数据时返回空字典
+    """
+    data = np.fromiter((v for v in values if v is not None), dtype=np.float64)
+    if data.size == 0:
+        return {}
+    p50, p95, p99 = np.percentile(data, [50, 95, 99])
+    return {
+        "mean": float(data.mean()), "p50": float(p50), "p95": float(p95), "p99": float(p99), "max": float(data.max())
+    }
+
+
+def summarize_frames(frames: List[FrameTiming]) -> Dict[str, Dict[str, float]]:
+    """
+    按字段统计多帧的耗时
+    :return: {"cpu_ms": {...}, "gpu_ms": {...}, "total_ms": {...}, "draw_calls": {...}}
+    """
+    return {field: summarize(getattr(frame, field) for frame in frames) for field in FrameTiming._fields}
+
+
+class RollingSamples:
+    """
+    定长的环形缓冲区，只保留最近capacity个数据
+    """
+
+    def __init__(self, capacity: int = 600):
+        self._data = np.zeros(capacity, dtype=np.float64)
+        self._count = 0  # 写入过的数据总数
+
+    def __len__(self):
+        return min(self._count, len(self._data))
+
+    def push(self, value: float):
+        self._data[self._count % len(self._data)] = value
+        self._count += 1
+
+    def values(self) -> np.ndarray:
+        """
+        按写入顺序排列的数据
+        """
+        capacity = len(self._data)
+        if self._count <= capacity:
+            return self._data[:self._count].copy()
+        start = self._count % capacity
+        return np.concatenate((self._data[start:], self._data[:start]))
+
+    def summary(self) -> Dict[str, float]:
+        return summarize(self._data[:len(self)])
+
+    def histogram(self, bins: int = 20, max_value: float = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :param bins: 区间数
+        :param max_value: 上限，超过上限的数据计入最后一个区间；为None时使用最大值
+        :return: (每个区间的数量, 区间边界)
+        """
+        data = self._data[:len(self)]
+        upper = max_value if max_value is not None else (float(data.max()) if data.size else 1.)
+        upper = max(upper, 1e-9)
+        return np.histogram(np.minimum(data, upper), bins=bins, range=(0., upper))
+
+    def clear(self):
+        self._count = 0
+
+
+class FrameStatsRecorder:
+    """
+    按名称记录多组滚动数据，例如 "frame_ms"（帧间隔）、"cpu_ms"（绘制耗时）、"gpu_main_ms"（主绘制的GPU耗时）
+    """
+
+    def __init__(self, capacity: int = 600):
+        self.capacity = capacity
+        self._series: Dict[str, RollingSamples] = {}
+
+    def record(self, name: str, value: float):
+        series = self._series.get(name)
+        if series is None:
+            series = self._series[name] = RollingSamples(self.capacity)
+        series.push(value)
+
+    def __getitem__(self, name: str) -> RollingSamples:
+        return self._series[name]
+
+    def __contains__(self, name: str):
+        return name in self._series
+
+    def names(self) -> List[str]:
+        return list(self._series.keys())
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        :return: {名称: {"mean", "p50", "p95", "p99", "max"}}
+        """
+        return {name: series.summary() for name, series in self._series.items()}
+
+    def clear(self):
+        for series in self._series.values():
+            series.clear()
+
+    def format_overlay(self, names: Iterable[str] = None) -> str:
+        """
+        性能浮层的文本，每组数据一行
+        """
+        lines = []
+        for name in names if names is not None else self._series:
+            if name not in self._series or not len(self._series[name]):
+                continue
+            stats = self._series[name].summary()
+            lines.append(f"{name:<12} p50 {stats['p50']:6.2f}  p95 {stats['p95']:6.2f}  p99 {stats['p99']:6.2f}")
+        return "\n".join(lines)
@@ -11,6 +11,8 @@ from typing import Literal
 from PyQt5.QtCore import QMutexLocker
 from PyQt5.QtWidgets import QMessageBox
 
+from .perf_trace import PerfTracer
+
 
 def snake_to_camel(snake_str):
     """
@@ -151,14 +153,17 @@ def color_print(text, color: Literal["red", "green", "yellow", "blue", "magenta"
 
 def time_it(func):
     """
-    计算函数运行时间
+    计算函数运行时间，开启PerfTracer时同时记录到追踪缓冲区
     :param func:
     :return:
     """
     def wrapper(*args, **kwargs):
         start = time.time()
+        start_ns = time.perf_counter_ns()
         result = func(*args, **kwargs)
         end = time.time()
+        if PerfTracer.enabled:
+            PerfTracer.record(func.__qualname__, "time_it", start_ns, time.perf_counter_ns() - start_ns)
         print(f"函数{func.__name__}运行时间：{end-start}")
         return result
     return wrapper
@@ -0,0 +1,198 @@
+"""
+有向距离场（SDF）字形图集
+每个字体和字号共享一个图集：字形在第一次使用时光栅化并写入图集，之后修改文本只需要重新排版（查表），
+不再重新光栅化整段文字；SDF在缩放时边缘仍然清晰，由着色器按距离值做抗锯齿
+"""
+import threading
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+__all__ = ["Glyph", "GlyphAtlas"]
+
+
+class Glyph(NamedTuple):
+    x: float  # 相对笔位置的偏移（像素），包括距离场的边距
+    y: float  # 相对行顶部的偏移（像素，向下为正）
+    w: float  # 字形格子的宽度（像素）
+    h: float  # 字形格子的高度（像素）
+    uv: Tuple[float, float, float, float]  # 图集中的纹理坐标 (u0, v0, u1, v1)，v0为格子顶部
+    advance: float  # 笔位置的前进量（像素）
+
+
+def _distance(feature: np.ndarray, radius: int) -> np.ndarray:
+    """
+    每个像素到最近的特征像素（True）的欧氏距离，超过radius的截断为radius
+    先按行求水平距离，再按列求 min(dy² + 水平距离²)，两次一维搜索得到精确的距离
+    """
+    h, w = feature.shape
+    far = float(radius + 1)
+    padded = np.pad(feature, ((0, 0), (radius, radius)), constant_values=False)
+    row = np.full((h, w), far, dtype=np.float32)
+    for dx in range(-radius, radius + 1):
+        np.minimum(row, np.where(padded[:, radius + dx:radius + dx + w], abs(dx), far), out=row)
+    squared = np.pad(row * row, ((radius, radius), (0, 0)), constant_values=far * far)
+    result = np.full((h, w), far * far, dtype=np.float32)
+    for dy in range(-radius, radius + 1):
+        np.minimum(result, squared[radius + dy:radius + dy + h] + dy * dy, out=result)
+    return np.minimum(np.sqrt(result), radius)
+
+
+def _signed_distance(mask: np.ndarray, radius: int) -> np.ndarray:
+    """
+    二值图每个像素到边缘的有向距离（内部为正），以像素中心之间的中点作为边缘
+    """
+    return np.where(mask, _distance(~mask, radius) - 0.5, 0.5 - _distance(mask, radius))
+
+
+class GlyphAtlas:
+    """
+    字形图集：单通道uint8图片，值为 0.5 + 有向距离 / (2 * spread)，0.5处为字形边缘
+    图集按行（shelf）排列字形，放不下时高度翻倍；每次写入新字形version加一，纹理据此判断是否需要重新上传
+    """
+    _atlases: Dict[Tuple[Optional[str], int], 'GlyphAtlas'] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, font: Optional[str], fontsize: int) -> 'GlyphAtlas':
+        """
+        获取共享的图集，相同的字体和字号只创建一次
+        :param font: 字体文件路径或名称（例如 "Deng.ttf"），为None或找不到时使用Pillow的默认字体
+        :param fontsize: 字号（像素）
+        """
+        key = (font, int(fontsize))
+        with cls._lock:
+            atlas = cls._atlases.get(key)
+            if atlas is None:
+                atlas = cls._atlases[key] = cls(font, int(fontsize))
+            return atlas
+
+    def __init__(self, font: Optional[str], fontsize: int, spread: int = 4, supersample: int = 2,
+                 width: int = 512, height: int = 128):
+        """
+        :param font: 字体文件路径或名称
+        :param fontsize: 字号（像素）
+        :param spread: 距离场的范围（像素），也是每个字形格子四周的边距
+        :param supersample: 光栅化时的放大倍数，距离场在放大的图上计算后缩小，边缘更准确
+        :param width: 图集宽度
+        :param height: 图集初始高度
+        """
+        self.fontsize = fontsize
+        self.spread = spread
+        self.supersample = supersample
+        self._font = self._load_font(font, fontsize * supersample)
+        ascent, descent = self._font.getmetrics()
+        self.line_height = (ascent + descent) / supersample
+        self.image = np.zeros((height, width), dtype=np.uint8)
+        self.version = 0
+        self._glyphs: Dict[str, Glyph] = {}
+        self._shelf_x = 0  # 当前行的下一个空位
+        self._shelf_y = 0  # 当前行的顶部
+        self._shelf_h = 0  # 当前行的高度
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _load_font(font: Optional[str], size: int):
+        if font is not None:
+            try:
+                return ImageFont.truetype(font, size, encoding="unic")
+            except OSError:
+                pass
+        return ImageFont.load_default(size)
+
+    def __len__(self):
+        return len(self._glyphs)
+
+    def __contains__(self, char: str):
+        return char in self._glyphs
+
+    def _rasterize(self, char: str) -> Tuple[np.ndarray, Glyph]:
+        """
+        :return: (距离场, 不含纹理坐标的字形信息)
+        """
+        s = self.supersample
+        pad = self.spread * s
+        x0, y0, x1, y1 = self._font.getbbox(char)
+        advance = self._font.getlength(char) / s
+        if x1 <= x0 or y1 <= y0:  # 空白字符
+            return np.zeros((0, 0), dtype=np.uint8), Glyph(0, 0, 0, 0, (0, 0, 0, 0), advance)
+        # 放大后的格子尺寸取supersample的整数倍，便于缩小
+        w = -(-(x1 - x0 + 2 * pad) // s) * s
+        h = -(-(y1 - y0 + 2 * pad) // s) * s
+        canvas = Image.new("L", (w, h), 0)
+        ImageDraw.Draw(canvas).text((pad - x0, pad - y0), char, font=self._font, fill=255)
+        distance = _signed_distance(np.asarray(canvas) >= 128, pad) / s
+        distance = distance.reshape(h // s, s, w // s, s).mean(axis=(1, 3))
+        sdf = np.clip(0.5 + distance / (2 * self.spread), 0, 1)
+        glyph = Glyph((x0 - pad) / s, (y0 - pad) / s, w // s, h // s, (0, 0, 0, 0), advance)
+        return (sdf * 255 + 0.5).astype(np.uint8), glyph
+
+    def _place(self, w: int, h: int) -> Tuple[int, int]:
+        """
+        为w×h的格子分配位置，必要时换行或扩大图集
+        """
+        width = self.image.shape[1]
+        if w > width:
+            raise ValueError(f"Glyph is wider than the atlas: {w} > {width}")
+        if self._shelf_x + w > width:
+            self._shelf_x, self._shelf_y, self._shelf_h = 0, self._shelf_y + self._shelf_h, 0
+        while self._shelf_y + h > self.image.shape[0]:
+            grown = np.zeros((self.image.shape[0] * 2, width), dtype=np.uint8)
+            grown[:self.image.shape[0]] = self.image
+            self.image = grown
+            # 纹理坐标以图集高度归一化，扩大后需要重新计算已有字形的v
+            self._glyphs = {c: g._replace(uv=(g.uv[0], g.uv[1] / 2, g.uv[2], g.uv[3] / 2))
+                            for c, g in self._glyphs.items()}
+        pos = self._shelf_x, self._shelf_y
+        self._shelf_x += w + 1  # 留1像素间隔，避免线性采样时相邻字形互相渗透
+        self._shelf_h = max(self._shelf_h, h + 1)
+        return pos
+
+    def ensure(self, text: str) -> bool:
+        """
+        把文本中还没有的字形加入图集
+        :return: 图集是否有变化
+        """
+        missing = {c for c in text if c not in self._glyphs and c != "\n"}
+        if not missing:
+            return False
+        with self._lock:
+            for char in sorted(missing):
+                if char in self._glyphs:
+                    continue
+                sdf, glyph = self._rasterize(char)
+                if sdf.size:
+                    h, w = sdf.shape
+                    x, y = self._place(w, h)
+                    self.image[y:y + h, x:x + w] = sdf
+                    atlas_h, atlas_w = self.image.shape
+                    glyph = glyph._replace(uv=(x / atlas_w, y / atlas_h, (x + w) / atlas_w, (y + h) / atlas_h))
+                self._glyphs[char] = glyph
+            self.version += 1
+        return True
+
+    def glyph(self, char: str) -> Glyph:
+        self.ensure(char)
+        return self._glyphs[char]
+
+    def layout(self, text: str) -> Tuple[np.ndarray, Tuple[float, float]]:
+        """
+        排版一段文本（支持换行符）
+        :return: (每个可见字形一行 [x, y, w, h, u0, v0, u1, v1] 的float32数组，坐标为像素，原点在文本左上角，y向下;
+                  文本的 (宽, 高)）
+        """
+        self.ensure(text)
+        quads = []
+        pen_x = pen_y = width = 0.
+        for char in text:
+            if char == "\n":
+                pen_x, pen_y = 0., pen_y + self.line_height
+                continue
+            glyph = self._glyphs[char]
+            if glyph.w:
+                quads.append((pen_x + glyph.x, pen_y + glyph.y, glyph.w, glyph.h) + glyph.uv)
+            pen_x += glyph.advance
+            width = max(width, pen_x)
+        height = pen_y + self.line_height if text else 0.
+        return np.array(quads, dtype=np.float32).reshape(-1, 8), (width, height)
@@ -0,0 +1,443 @@
+"""
+船体截面组网格的numpy计算
+截面的轮廓（底部弧面、中间节点、顶部弧面，只有左侧）和相邻两个截面之间的分段网格，
+顶点顺序和法向量与 SymetryCylinderMesh（延伸方向为z）生成的相同，但可以一次计算多个截面/分段；
+弧面的角度步长可调，较大的步长和隔几个截面取一个截面用于远处的低细节网格
+"""
+from functools import lru_cache
+from typing import List, Literal, Sequence, Tuple
+
+import numpy as np
+
+__all__ = ["CURVE_STEP", "HULL_LOD_LEVELS", "curve_template", "curve_points", "section_outlines", "group_outlines",
+           "segment_vertexes", "face_normals", "group_segments", "group_mesh", "node_outline_patch",
+           "segment_point_vertexes", "update_face_normals", "vertex_ranges", "CREASE_ANGLE", "segment_indexed",
+           "group_indexed"]
+
+CURVE_STEP = 15  # 弧面的角度步长（度），与 CIRCLE_POINTS / SQUARE_POINTS 相同
+# 各细节等级的 (弧面角度步长, 截面间隔)，等级0与编辑时的截面网格相同
+HULL_LOD_LEVELS: Tuple[Tuple[int, int], ...] = ((15, 1), (30, 1), (45, 2), (90, 4))
+# 使用索引的网格中，相邻侧面夹角超过该角度（度）时为硬边；
+# 默认为0：只有共面的三角形共享顶点，着色与编辑时不使用索引的截面网格相同（切换LOD时不会突然变成平滑着色）
+CREASE_ANGLE = 0.
+
+
+@lru_cache(maxsize=256)
+def curve_template(direction: Literal['up', 'bot'], cur: float, step: int = CURVE_STEP) -> np.ndarray:
+    """
+    弧面模板（单位正方形和单位圆之间按曲率插值）：'bot'从正下方（-90°）到正左方（0°），'up'从正左方到正上方（90°）
+    按 (方向, 曲率, 步长) 缓存，同一截面组的所有截面共用；返回的数组只读
+    :param direction: 方向，'up'为上，'bot'为下
+    :param cur: 曲率，1为圆弧，0为直角
+    :param step: 角度步长，需要整除90
+    :return: (90 / step + 1) x 2
+    """
+    if 90 % step:
+        raise ValueError(f"step must divide 90: {step}")
+    if direction == 'bot':
+        degrees = np.arange(-90, 1, step)
+    elif direction == 'up':
+        degrees = np.arange(0, 91, step)
+    else:
+        raise ValueError("direction参数错误")
+    radians = np.deg2rad(degrees)
+    circle = np.column_stack([np.cos(radians), np.sin(radians)])
+    circle[np.abs(circle) < 1e-12] = 0
+    square = circle / np.abs(circle).max(axis=1, keepdims=True)
+    result = circle + (square - circle) * (1 - cur)
+    result.flags.writeable = False
+    return result
+
+
+def curve_points(template: np.ndarray, p0, p1) -> np.ndarray:
+    """
+    把弧面模板映射到两个节点之间：x按y的位置在两个节点的x之间插值，y映射到两个节点的y之间
+    :param template: kx2
+    :param p0: ...x2，y较小的节点（可以是多个截面的节点）
+    :param p1: ...x2，y较大的节点
+    :return: ...xkx2
+    """
+    tx, ty = template[:, 0], template[:, 1]
+    p0 = np.asarray(p0, dtype=np.float64)[..., None, :]
+    p1 = np.asarray(p1, dtype=np.float64)[..., None, :]
+    x = tx * (p0[..., 0] + (p1[..., 0] - p0[..., 0]) * (ty + 1) / 2)
+    y = ty * (p1[..., 1] - p0[..., 1]) / 2 + (p0[..., 1] + p1[..., 1]) / 2
+    return np.stack([x, y], axis=-1)
+
+
+def section_outlines(nodes, top_cur: float, bot_cur: float, step: int = CURVE_STEP) -> np.ndarray:
+    """
+    截面的左侧轮廓：底部弧面（两个最低节点之间）、中间节点、顶部弧面（两个最高节点之间），从下到上
+    :param nodes: 按y排序的节点，Nx2 或 SxNx2（多个节点数相同的截面一次计算）
+    :param top_cur: 顶部曲率
+    :param bot_cur: 底部曲率
+    :param step: 弧面的角度步长
+    :return: (N - 2 + 2k)x2 或 Sx(N - 2 + 2k)x2，k = 90 / step + 1
+    """
+    nodes = np.asarray(nodes, dtype=np.float64)
+    bot = curve_points(curve_template('bot', float(bot_cur), step), nodes[..., 0, :], nodes[..., 1, :])
+    top = curve_points(curve_template('up', float(top_cur), step), nodes[..., -2, :], nodes[..., -1, :])
+    return np.concatenate([bot, nodes[..., 1:-1, :], top], axis=-2)
+
+
+def group_outlines(nodes: Sequence, top_cur: float, bot_cur: float, step: int = CURVE_STEP) -> List[np.ndarray]:
+    """
+    截面组所有截面的轮廓，节点数相同的截面一起计算（通常整个截面组只有一次numpy计算）
+    :param nodes: 每个截面按y排序的节点（Nx2），或 SxNx2 数组
+    :return: 与nodes顺序相同的轮廓列表
+    """
+    if isinstance(nodes, np.ndarray) and nodes.ndim == 3:
+        return list(section_outlines(nodes, top_cur, bot_cur, step))
+    by_count = {}
+    for i, section_nodes in enumerate(nodes):
+        by_count.setdefault(len(section_nodes), []).append(i)
+    result: List[np.ndarray] = [None] * len(nodes)  # noqa
+    for indices in by_count.values():
+        outlines = section_outlines(np.stack([np.asarray(nodes[i], dtype=np.float64) for i in indices]),
+                                    top_cur, bot_cur, step)
+        for i, outline in zip(indices, outlines):
+            result[i] = outline
+    return result
+
+
+@lru_cache(maxsize=64)
+def _segment_layout(p: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    分段网格中每个顶点取自整圈轮廓（左侧p个点 + 镜像的右侧p个点，共2p个）的哪个点
+    :return: (前截面的顶面索引, 后截面的底面索引, 侧面索引, 侧面顶点是否在前截面)
+    """
+    n = 2 * p
+    i = np.arange(p - 1)
+    r_d, l_d, r_u, l_u = i, n - 1 - i, i + 1, n - 2 - i
+    top = np.column_stack([l_d, r_d, r_u, l_d, r_u, l_u]).ravel()
+    bottom = np.column_stack([r_d, l_d, l_u, r_d, l_u, r_u]).ravel()
+    j = np.arange(n)
+    j1 = (j + 1) % n
+    side = np.column_stack([j, j, j1, j, j1, j1]).ravel()
+    side_front = np.tile([True, False, False, True, False, True], n)
+    return top, bottom, side, side_front
+
+
+def segment_vertexes(front, back, front_z, back_z) -> np.ndarray:
+    """
+    相邻两个截面之间的分段网格（不使用索引的三角形），顺序为前截面的端面、后截面的端面、侧面
+    :param front: 前截面（z较大）的左侧轮廓，Px2 或 MxPx2
+    :param back: 后截面的左侧轮廓，形状与front相同
+    :param front_z: 前截面的z，标量或长度为M
+    :param back_z: 后截面的z
+    :return: (24P - 12)x3 或 Mx(24P - 12)x3
+    """
+    front = np.asarray(front, dtype=np.float64)
+    back = np.asarray(back, dtype=np.float64)
+    if front.shape != back.shape:
+        raise ValueError("front and back must have the same shape")
+    single = front.ndim == 2
+    if single:
+        front, back = front[None], back[None]
+    m, p = front.shape[:2]
+    front_z = np.broadcast_to(np.asarray(front_z, dtype=np.float64), (m,))[:, None]
+    back_z = np.broadcast_to(np.asarray(back_z, dtype=np.float64), (m,))[:, None]
+    # 整圈轮廓：左侧从下到上，右侧（x取反）从上到下
+    mirror = np.array([-1., 1.])
+    front_ring = np.concatenate([front, front[:, ::-1] * mirror], axis=1)
+    back_ring = np.concatenate([back, back[:, ::-1] * mirror], axis=1)
+    top, bottom, side, side_front = _segment_layout(p)
+    xy = np.concatenate([
+        front_ring[:, top], back_ring[:, bottom],
+        np.where(side_front[None, :, None], front_ring[:, side], back_ring[:, side])
+    ], axis=1)
+    z = np.concatenate([
+        np.broadcast_to(front_z, (m, len(top))), np.broadcast_to(back_z, (m, len(bottom))),
+        np.where(side_front[None], front_z, back_z)
+    ], axis=1)
+    result = np.concatenate([xy, z[..., None]], axis=2).astype(np.float32)
+    return result[0] if single else result
+
+
+def face_normals(vertexes) -> np.ndarray:
+    """
+    不使用索引的三角形的面法向量（每个三角形的三个顶点相同），退化三角形的法向量为0
+    :param vertexes: ...xVx3，V为3的倍数
+    """
+    vertexes = np.asarray(vertexes, dtype=np.float32)
+    tri = vertexes.reshape(vertexes.shape[:-2] + (-1, 3, 3))
+    normal = np.cross(tri[..., 1, :] - tri[..., 0, :], tri[..., 2, :] - tri[..., 0, :])
+    length = np.linalg.norm(normal, axis=-1, keepdims=True)
+    length[length < 1e-5] = 1
+    normal = normal / length
+    return np.repeat(normal, 3, axis=-2).reshape(vertexes.shape).astype(np.float32)
+
+
+def group_segments(zs: Sequence[float], outlines: Sequence) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    相邻截面之间的所有分段网格，第i段连接截面i（后）和截面i+1（前）；
+    轮廓点数相同的分段一起计算，节点数全部相同时整个截面组只有一次numpy计算
+    :param zs: 按z从小到大排列的截面z值
+    :param outlines: 每个截面的左侧轮廓（group_outlines 的结果），或 SxPx2 数组
+    :return: [(顶点 Vx3, 法向量 Vx3)]，长度为 截面数 - 1
+    """
+    zs = np.asarray(zs, dtype=np.float64)
+    if isinstance(outlines, np.ndarray) and outlines.ndim == 3:
+        vertexes = segment_vertexes(outlines[1:], outlines[:-1], zs[1:], zs[:-1])
+        return list(zip(vertexes, face_normals(vertexes)))
+    by_count = {}
+    for i in range(len(outlines) - 1):
+        if outlines[i].shape != outlines[i + 1].shape:
+            raise ValueError(f"sections {i} and {i + 1} have different node counts")
+        by_count.setdefault(outlines[i].shape[0], []).append(i)
+    result: List[Tuple[np.ndarray, np.ndarray]] = [None] * max(len(outlines) - 1, 0)  # noqa
+    for indices in by_count.values():
+        back = np.stack([outlines[i] for i in indices])
+        front = np.stack([outlines[i + 1] for i in indices])
+        vertexes = segment_vertexes(front, back, zs[[i + 1 for i in indices]], zs[indices])
+        for i, v, n in zip(indices, vertexes, face_normals(vertexes)):
+            result[i] = (v, n)
+    return result
+
+
+def _kept_sections(count: int, stride: int) -> List[int]:
+    """
+    每隔stride取一个截面，首尾的截面总是保留
+    """
+    kept = list(range(0, count, max(stride, 1)))
+    if kept[-1] != count - 1:
+        kept.append(count - 1)
+    return kept
+
+
+def group_mesh(zs: Sequence[float], nodes: Sequence, top_cur: float, bot_cur: float,
+               step: int = CURVE_STEP, stride: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    整个截面组合并成的一个网格：相邻的（保留下来的）截面之间各一段
+    :param zs: 按z从小到大排列的截面z值
+    :param nodes: 每个截面按y排序的节点（Nx2），节点数可以不同，但相连的两个截面需要相同；或 SxNx2 数组
+    :param top_cur: 顶部曲率
+    :param bot_cur: 底部曲率
+    :param step: 弧面的角度步长
+    :param stride: 截面间隔，大于1时跳过中间的截面
+    :return: (顶点 Vx3, 法向量 Vx3)
+    """
+    if len(zs) < 2:
+        return np.zeros((0, 3), dtype=np.float32), np.zeros((0, 3), dtype=np.float32)
+    kept = _kept_sections(len(zs), stride)
+    outlines = group_outlines([nodes[i] for i in kept], top_cur, bot_cur, step)
+    vertexes, normals = zip(*group_segments([zs[i] for i in kept], outlines))
+    return np.concatenate(vertexes), np.concatenate(normals)
+
+
+def node_outline_patch(nodes, index: int, top_cur: float, bot_cur: float,
+                       step: int = CURVE_STEP) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    一个节点改变后，截面轮廓中需要重新计算的点：最低和最高的两个节点决定弧面上的所有点，其他节点只决定自己
+    :param nodes: 按y排序的节点 Nx2（已经是新的坐标）
+    :param index: 改变的节点
+    :return: (轮廓点的索引, 新的轮廓点 nx2)
+    """
+    nodes = np.asarray(nodes, dtype=np.float64)
+    n = len(nodes)
+    k = 90 // step + 1
+    indices, points = [], []
+    if index <= 1:
+        indices.append(np.arange(k))
+        points.append(curve_points(curve_template('bot', float(bot_cur), step), nodes[0], nodes[1]))
+    if 1 <= index <= n - 2:
+        indices.append(np.array([k + index - 1]))
+        points.append(nodes[index:index + 1])
+    if index >= n - 2:
+        indices.append(np.arange(k + n - 2, 2 * k + n - 2))
+        points.append(curve_points(curve_template('up', float(top_cur), step), nodes[-2], nodes[-1]))
+    return np.concatenate(indices), np.concatenate(points)
+
+
+@lru_cache(maxsize=64)
+def _segment_point_map(p: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    分段网格的每个顶点来自哪个截面的哪个轮廓点
+    :return: (前截面的轮廓点索引, 后截面的轮廓点索引, 是否为镜像的右侧点, 顶点数)，不属于该截面的顶点为-1
+    """
+    top, bottom, side, side_front = _segment_layout(p)
+    ring_point = np.concatenate([np.arange(p), np.arange(p)[::-1]])
+    ring_mirror = np.arange(2 * p) >= p
+    ring = np.concatenate([top, bottom, side])
+    is_front = np.concatenate([np.ones(len(top), bool), np.zeros(len(bottom), bool), side_front])
+    front = np.where(is_front, ring_point[ring], -1)
+    back = np.where(is_front, -1, ring_point[ring])
+    return front, back, ring_mirror[ring], np.array(len(ring))
+
+
+@lru_cache(maxsize=256)
+def _point_vertexes(p: int, front: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    轮廓点到顶点的映射：按轮廓点排序的顶点索引，以及每个轮廓点的顶点在其中的起止位置
+    """
+    front_point, back_point = _segment_point_map(p)[:2]
+    point = front_point if front else back_point
+    order = np.flatnonzero(point >= 0)
+    order = order[np.argsort(point[order], kind="stable")]
+    bounds = np.searchsorted(point[order], np.arange(p + 1))
+    return order, bounds
+
+
+def segment_point_vertexes(p: int, front: bool, point_indices) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    分段网格中由前（或后）截面的某些轮廓点决定的顶点，使用预先计算的映射，与网格大小无关
+    :param p: 每个截面的轮廓点数
+    :param front: 是否为前截面
+    :param point_indices: 轮廓点的索引
+    :return: (顶点索引, 每个顶点对应 point_indices 中的第几个点, 是否为镜像的右侧点（x取反）)
+    """
+    order, bounds = _point_vertexes(p, front)
+    mirror = _segment_point_map(p)[2]
+    point_indices = np.asarray(point_indices, dtype=np.int64)
+    counts = bounds[point_indices + 1] - bounds[point_indices]
+    source = np.repeat(np.arange(len(point_indices)), counts)
+    starts = np.repeat(bounds[point_indices], counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    vertexes = order[starts + offsets]
+    return vertexes, source, mirror[vertexes]
+
+
+def update_face_normals(vertexes: np.ndarray, normals: np.ndarray, triangles) -> None:
+    """
+    只重新计算指定三角形的面法向量（直接写入normals）
+    :param vertexes: Vx3，不使用索引的三角形
+    :param normals: Vx3
+    :param triangles: 三角形的索引
+    """
+    triangles = np.asarray(triangles, dtype=np.int64)
+    normals[(triangles[:, None] * 3 + np.arange(3)).ravel()] = np.repeat(
+        face_normals(vertexes[(triangles[:, None] * 3 + np.arange(3)).ravel()]).reshape(-1, 3, 3)[:, 0], 3, axis=0)
+
+
+def vertex_ranges(triangles, gap: int = 16) -> List[Tuple[int, int]]:
+    """
+    把三角形索引合并成连续的顶点区间 [start, stop)，间隔不超过gap个三角形的区间合并为一个（少量多余的上传换更少的调用）
+    """
+    triangles = np.unique(np.asarray(triangles, dtype=np.int64))
+    if triangles.size == 0:
+        return []
+    breaks = np.flatnonzero(np.diff(triangles) > gap + 1)
+    starts = np.concatenate([triangles[:1], triangles[breaks + 1]])
+    stops = np.concatenate([triangles[breaks], triangles[-1:]]) + 1
+    return [(int(a) * 3, int(b) * 3) for a, b in zip(starts, stops)]
+
+
+def _segments_indexed(front: np.ndarray, back: np.ndarray, front_z: np.ndarray, back_z: np.ndarray,
+                      crease_angle: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    M个轮廓点数相同的分段一起计算 segment_indexed，各段的顶点按顺序连续排列
+    :param front: MxPx2
+    :param back: MxPx2
+    :param front_z: 长度为M
+    :param back_z: 长度为M
+    :return: (顶点 Ux3, 法向量 Ux3, 每段内的三角形索引 MxTx3, 每段的顶点数 M)
+    """
+    m, p = front.shape[:2]
+    n = 2 * p
+    mirror = np.array([-1., 1.])
+    front_ring = np.concatenate([np.concatenate([front, front[:, ::-1] * mirror], axis=1),
+                                 np.broadcast_to(front_z[:, None, None], (m, n, 1))], axis=2)
+    back_ring = np.concatenate([np.concatenate([back, back[:, ::-1] * mirror], axis=1),
+                                np.broadcast_to(back_z[:, None, None], (m, n, 1))], axis=2)
+    top, bottom = _segment_layout(p)[:2]
+    # 端面：与 segment_vertexes 相同的三角形，法向量取面积加权的平均（平面上所有三角形相同）
+    top_tri = top.reshape(-1, 3)
+    bottom_tri = bottom.reshape(-1, 3) + n
+    rows = np.concatenate([front_ring, back_ring], axis=1)  # 前截面为j，后截面为n+j
+
+    def _cap_normal(tri):
+        corners = rows[:, tri]
+        normal = np.cross(corners[:, :, 1] - corners[:, :, 0], corners[:, :, 2] - corners[:, :, 0]).sum(axis=1)
+        length = np.linalg.norm(normal, axis=1, keepdims=True)
+        return normal / np.where(length > 1e-12, length, 1)
+
+    cap_normals = np.concatenate([np.repeat(_cap_normal(top_tri)[:, None], n, axis=1),
+                                  np.repeat(_cap_normal(bottom_tri)[:, None], n, axis=1)], axis=1)
+    # 侧面：四边形j的两个三角形 (tp0, bp0, bp1), (tp0, bp1, tp1) 与 segment_vertexes 相同，
+    # 按 2j, 2j+1 排成一圈三角形带，相邻的两个三角形共用一条边（带的第k条边在三角形k和k+1之间）
+    j = np.arange(n)
+    j1 = (j + 1) % n
+    side_corners = np.column_stack([j, n + j, n + j1, j, n + j1, j1]).reshape(-1, 3)
+    tri = rows[:, side_corners]
+    side_face = np.cross(tri[:, :, 1] - tri[:, :, 0], tri[:, :, 2] - tri[:, :, 0])  # 面积加权
+    length = np.linalg.norm(side_face, axis=2)
+    unit = side_face / np.where(length > 1e-12, length, 1)[..., None]
+    # 两个三角形都不退化且夹角超过阈值时为硬边
+    following = np.roll(unit, -1, axis=1)
+    hard = (length > 1e-12) & (np.roll(length, -1, axis=1) > 1e-12) & \
+        (np.sum(unit * following, axis=2) < np.cos(np.deg2rad(crease_angle)) - 1e-6)
+    # 每个侧面顶点属于带上连续的三个三角形 a, a+1, a+2（前截面 a=2j-1，后截面 a=2j-2），
+    # 被其中的两条边分成1~3组，每组一个顶点
+    first = np.concatenate([2 * j - 1, 2 * j - 2]) % (2 * n)
+    edge0, edge1 = hard[:, first].astype(np.int64), hard[:, (first + 1) % (2 * n)].astype(np.int64)
+    counts = 1 + edge0 + edge1
+    base = 2 * n + np.cumsum(counts, axis=1) - counts
+    # 三角形的每个角在其顶点的三个三角形中的位置
+    k = np.arange(2 * n)
+    corner_pos = (k[:, None] - first[side_corners]) % (2 * n)
+    group = np.where(corner_pos == 0, 0, edge0[:, side_corners] + np.where(corner_pos == 2, edge1[:, side_corners], 0))
+    side_tri = base[:, side_corners] + group
+    # 各段的顶点：2n个端面顶点，之后是侧面顶点
+    sizes = 2 * n + counts.sum(axis=1)
+    offsets = np.cumsum(sizes) - sizes
+    is_cap = np.zeros(int(sizes.sum()), dtype=bool)
+    is_cap[(offsets[:, None] + np.arange(2 * n)).ravel()] = True
+    vertexes = np.empty((len(is_cap), 3))
+    vertexes[is_cap] = rows.reshape(-1, 3)
+    vertexes[~is_cap] = np.repeat(rows.reshape(-1, 3), counts.ravel(), axis=0)
+    normals = np.zeros_like(vertexes)
+    normals[is_cap] = cap_normals.reshape(-1, 3)
+    np.add.at(normals, (side_tri + offsets[:, None, None]).ravel(), np.repeat(side_face.reshape(-1, 3), 3, axis=0))
+    side = ~is_cap
+    normals[side] /= np.maximum(np.linalg.norm(normals[side], axis=1, keepdims=True), 1e-12)
+    indices = np.concatenate([np.broadcast_to(top_tri, (m,) + top_tri.shape),
+                              np.broadcast_to(bottom_tri, (m,) + bottom_tri.shape), side_tri], axis=1)
+    return vertexes.astype(np.float32), normals.astype(np.float32), indices.astype(np.uint32), sizes
+
+
+def segment_indexed(front, back, front_z, back_z,
+                    crease_angle: float = CREASE_ANGLE) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    使用索引、共享顶点的分段网格，三角形与 segment_vertexes 相同（顺序和朝向不变）：
+    两个端面是平面，各自共享一圈顶点和同一个法向量；侧面的顶点由相邻的三角形共享，法向量为它们的面积加权平均，
+    相邻三角形的夹角超过crease_angle时（例如曲率为0时的直角）在这条边上把顶点分开（硬边），
+    端面和侧面之间总是硬边。侧面没有硬边时顶点数为 8P，不使用索引时为 24P - 12
+    :param front: 前截面（z较大）的左侧轮廓，Px2 或 MxPx2
+    :param back: 后截面的左侧轮廓，形状与front相同
+    :param front_z: 前截面的z，标量或长度为M
+    :param back_z: 后截面的z
+    :param crease_angle: 侧面硬边的角度阈值（度），为0时只有共面的三角形共享顶点，与不使用索引的网格着色相同
+    :return: (顶点 Ux3, 法向量 Ux3, 三角形索引 Tx3 uint32)，M段时依次连接成一个网格
+    """
+    front = np.asarray(front, dtype=np.float64)
+    back = np.asarray(back, dtype=np.float64)
+    if front.shape != back.shape:
+        raise ValueError("front and back must have the same shape")
+    if front.ndim == 2:
+        front, back = front[None], back[None]
+    m = front.shape[0]
+    front_z = np.broadcast_to(np.asarray(front_z, dtype=np.float64), (m,))
+    back_z = np.broadcast_to(np.asarray(back_z, dtype=np.float64), (m,))
+    vertexes, normals, indices, sizes = _segments_indexed(front, back, front_z, back_z, crease_angle)
+    indices = indices + (np.cumsum(sizes) - sizes).astype(np.uint32)[:, None, None]
+    return vertexes, normals, indices.reshape(-1, 3)
+
+
+def group_indexed(zs: Sequence[float], nodes: Sequence, top_cur: float, bot_cur: float, step: int = CURVE_STEP,
+                  stride: int = 1, crease_angle: float = CREASE_ANGLE) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    与 group_mesh 相同的网格（三角形相同），但每段使用 segment_indexed 的共享顶点；
+    所有分段一次numpy计算（相连的截面节点数相同）。
+    只用于合并的LOD网格，编辑中的截面网格（等级0）仍然不使用索引，编辑时的顶点数不变
+    :return: (顶点 Ux3, 法向量 Ux3, 三角形索引 Tx3 uint32)
+    """
+    if len(zs) < 2:
+        return np.zeros((0, 3), dtype=np.float32), np.zeros((0, 3), dtype=np.float32), np.zeros((0, 3), np.uint32)
+    kept = _kept_sections(len(zs), stride)
+    outlines = group_outlines([nodes[i] for i in kept], top_cur, bot_cur, step)
+    for i in range(len(outlines) - 1):
+        if outlines[i].shape != outlines[i + 1].shape:
+            raise ValueError(f"sections {i} and {i + 1} have different node counts")
+    outlines = np.stack(outlines)
+    return segment_indexed(outlines[1:], outlines[:-1], [zs[i] for i in kept[1:]], [zs[i] for i in kept[:-1]],
+                           crease_angle)
@@ -0,0 +1,336 @@
+"""
+图片金字塔与瓦片缓存
+用于超大参考图片的分块、分级加载：
+1. ImagePyramid：基于ReplaceCV2.pyrDown逐级缩小图片（或从文件按需降采样解码每一级），并把每一级切分为固定大小的瓦片；
+   根据模型-视图-投影矩阵计算当前相机距离下应使用的级别和可见瓦片
+2. TileCache：按字节预算管理已上传的瓦片（以及内存中解码后的级别），超出预算时按最近最少使用的顺序淘汰
+"""
+import math
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, List, Tuple, Callable, Optional
+
+import numpy as np
+
+from .cv2_replacements import ReplaceCV2
+
+
+class ImagePyramid:
+    """
+    图片金字塔，第0级为原图，之后每级长宽减半，直到整张图片能放进一个瓦片
+    图片坐标：行0为图片顶部；模型坐标：图片铺满[-1, 1] x [-1, 1]，y轴向上
+    由数组创建时所有级别都在内存中；由 from_file 创建时每一级在需要时才从文件解码，内存中的级别受cpu_budget限制
+    """
+    TILE_SIZE = 512
+    CPU_BUDGET = 256 * 1024 * 1024  # 从文件加载时，内存中解码后的级别的字节预算
+
+    def __init__(self, img: np.ndarray, tile_size: int = TILE_SIZE):
+        """
+        :param img: 原图，shape=(h, w) 或 (h, w, c)，dtype=np.uint8
+        :param tile_size: 瓦片边长（像素）
+        """
+        self._init(tile_size, None, math.inf)
+        levels = [img]
+        while max(levels[-1].shape[:2]) > tile_size and min(levels[-1].shape[:2]) >= 2:
+            levels.append(ReplaceCV2.pyrDown(levels[-1]))
+        for i, level_img in enumerate(levels):
+            self._shapes.append(level_img.shape)
+            self._levels.put(i, level_img, level_img.nbytes)
+
+    @classmethod
+    def from_file(cls, path: str, tile_size: int = TILE_SIZE, cpu_budget: int = CPU_BUDGET) -> 'ImagePyramid':
+        """
+        从文件按需解码的金字塔：只读取文件头得到各级的尺寸，每一级直接按降采样倍数从文件解码（JPEG按DCT缩放），
+        不保留原图；解码后的级别按cpu_budget缓存，超出时淘汰最久未使用的级别（当前使用的级别除外）
+        :param path: 图片路径
+        :param tile_size: 瓦片边长（像素）
+        :param cpu_budget: 内存中解码后的级别的字节预算
+        """
+        pyramid = cls.__new__(cls)
+        pyramid._init(tile_size, str(path), cpu_budget)
+        shape = ReplaceCV2.imread_shape(pyramid.path)
+        pyramid._shapes.append(shape)
+        while max(shape[:2]) > tile_size and min(shape[:2]) >= 2:
+            shape = ReplaceCV2.imread_shape(pyramid.path, 2 ** len(pyramid._shapes))
+            pyramid._shapes.append(shape)
+        return pyramid
+
+    def _init(self, tile_size: int, path: Optional[str], cpu_budget: float):
+        self.tile_size = tile_size
+        self.path = path
+        self._shapes: List[tuple] = []  # 每一级数组的形状
+        self._levels = TileCache(cpu_budget)  # 级别 -> 解码后的数组
+        self._pending: Dict[int, Future] = {}  # 正在后台解码的级别
+        self._protected = set()  # 不允许淘汰的级别
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def level_count(self) -> int:
+        return len(self._shapes)
+
+    @property
+    def top_level(self) -> int:
+        return len(self._shapes) - 1
+
+    @property
+    def channels(self) -> int:
+        shape = self._shapes[0]
+        return 1 if len(shape) == 2 else shape[2]
+
+    @property
+    def nbytes(self) -> int:
+        """
+        内存中解码后的级别占用的字节数
+        """
+        return self._levels.nbytes
+
+    def shape(self, level: int) -> Tuple[int, int]:
+        """
+        :return: (高, 宽)
+        """
+        return self._shapes[level][:2]
+
+    def _decode(self, level: int) -> np.ndarray:
+        img = ReplaceCV2.imread(self.path, 2 ** level) if level > 0 else ReplaceCV2.imread(self.path)
+        if img.shape != self._shapes[level]:
+            raise ValueError(f"decoded level {level} of {self.path} has shape {img.shape}, "
+                             f"expected {self._shapes[level]}")
+        return np.ascontiguousarray(img, dtype=np.uint8)
+
+    def _collect(self):
+        """
+        把后台解码完成的级别放入缓存（只在调用方线程中修改缓存）
+        """
+        for level, future in list(self._pending.items()):
+            if future.done():
+                self._pending.pop(level)
+                img = future.result()
+                self._levels.put(level, img, img.nbytes, protected=self._protected)
+
+    def protect(self, levels):
+        """
+        设置当前使用的级别，淘汰内存中的级别时跳过它们
+        """
+        self._protected = set(levels)
+        self._levels.trim(protected=self._protected)
+
+    def level_ready(self, level: int) -> bool:
+        """
+        该级是否已经在内存中（可以不阻塞地取瓦片），并标记为最近使用
+        """
+        self._collect()
+        return self._levels.get(level) is not None
+
+    def request_level(self, level: int, callback: Optional[Callable] = None):
+        """
+        在后台线程中解码该级（已在内存中或正在解码时不重复解码）
+        :param level: 级别
+        :param callback: 本次提交的解码完成后调用（在解码线程中调用），用于请求重绘
+        """
+        if self.level_ready(level) or level in self._pending:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(1, thread_name_prefix="ImagePyramid")
+        future = self._executor.submit(self._decode, level)
+        if callback is not None:
+            future.add_done_callback(lambda _: callback())
+        self._pending[level] = future
+
+    def level(self, level: int) -> np.ndarray:
+        """
+        该级的图片，不在内存中时等待后台解码或直接解码
+        """
+        self._collect()
+        img = self._levels.get(level)
+        if img is None:
+            future = self._pending.pop(level, None)
+            img = future.result() if future is not None else self._decode(level)
+            self._levels.put(level, img, img.nbytes, protected=self._protected)
+        return img
+
+    def close(self):
+        """
+        取消后台解码，释放内存中的所有级别
+        """
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._levels.clear()
+
+    def grid(self, level: int) -> Tuple[int, int]:
+        """
+        :return: 该级瓦片的列数和行数 (nx, ny)
+        """
+        h, w = self.shape(level)
+        return math.ceil(w / self.tile_size), math.ceil(h / self.tile_size)
+
+    def tile_rect(self, level: int, ix: int, iy: int) -> Tuple[int, int, int, int]:
+        """
+        瓦片在该级图片中覆盖的像素范围
+        :return: (x0, y0, x1, y1)，不包含x1, y1
+        """
+        h, w = self.shape(level)
+        ts = self.tile_size
+        return ix * ts, iy * ts, min((ix + 1) * ts, w), min((iy + 1) * ts, h)
+
+    def tile(self, level: int, ix: int, iy: int) -> np.ndarray:
+        """
+        瓦片的像素数据，右侧和下侧多取一个像素（若存在），使相邻瓦片的线性过滤在接缝处连续
+        """
+        h, w = self.shape(level)
+        x0, y0, x1, y1 = self.tile_rect(level, ix, iy)
+        return np.ascontiguousarray(self.level(level)[y0:min(y1 + 1, h), x0:min(x1 + 1, w)])
+
+    def tile_nbytes(self, level: int, ix: int, iy: int) -> int:
+        h, w = self.shape(level)
+        x0, y0, x1, y1 = self.tile_rect(level, ix, iy)
+        return (min(x1 + 1, w) - x0) * (min(y1 + 1, h) - y0) * self.channels  # uint8
+
+    def tile_model_rect(self, level: int, ix: int, iy: int) -> Tuple[float, float, float, float]:
+        """
+        瓦片在模型坐标系中的范围
+        :return: (left, bottom, right, top)
+        """
+        h, w = self.shape(level)
+        x0, y0, x1, y1 = self.tile_rect(level, ix, iy)
+        return x0 / w * 2 - 1, 1 - y1 / h * 2, x1 / w * 2 - 1, 1 - y0 / h * 2
+
+    def ancestor(self, level: int, ix: int, iy: int, anc_level: int) -> Tuple[int, int]:
+        """
+        包含该瓦片中心的上级瓦片
+        """
+        h, w = self.shape(level)
+        x0, y0, x1, y1 = self.tile_rect(level, ix, iy)
+        ah, aw = self.shape(anc_level)
+        nx, ny = self.grid(anc_level)
+        aix = min(int((x0 + x1) / 2 / w * aw) // self.tile_size, nx - 1)
+        aiy = min(int((y0 + y1) / 2 / h * ah) // self.tile_size, ny - 1)
+        return aix, aiy
+
+    def tile_uv(self, level: int, ix: int, iy: int, src_level: int, src_ix: int, src_iy: int
+                ) -> Tuple[float, float, float, float]:
+        """
+        用src瓦片的纹理绘制(level, ix, iy)瓦片的区域时对应的纹理坐标
+        纹理的第0行为瓦片顶部，因此v轴向下
+        :return: (u_left, v_bottom, u_right, v_top)
+        """
+        h, w = self.shape(level)
+        x0, y0, x1, y1 = self.tile_rect(level, ix, iy)
+        sh, sw = self.shape(src_level)
+        sx0, sy0, sx1, sy1 = self.tile_rect(src_level, src_ix, src_iy)
+        tex_w = min(sx1 + 1, sw) - sx0
+        tex_h = min(sy1 + 1, sh) - sy0
+        return ((x0 / w * sw - sx0) / tex_w, (y1 / h * sh - sy0) / tex_h,
+                (x1 / w * sw - sx0) / tex_w, (y0 / h * sh - sy0) / tex_h)
+
+    def select_level(self, mvp: np.ndarray, viewport: Tuple[int, int]) -> int:
+        """
+        根据图片在屏幕上的尺寸选择级别，使一个纹素大致对应一个屏幕像素
+        :param mvp: 行主序的4x4 投影*视图*模型 矩阵
+        :param viewport: 视口的 (宽, 高)，像素
+        """
+        corners = np.array([[-1, -1, 0, 1], [1, -1, 0, 1], [-1, 1, 0, 1]], dtype=np.float64)
+        clip = corners @ mvp.T
+        if np.any(clip[:, 3] <= 1e-6):  # 图片有部分在相机后方，按屏幕上最大的级别处理
+            return 0
+        screen = clip[:, :2] / clip[:, 3:4] * (np.array(viewport, dtype=np.float64) / 2)
+        h, w = self.shape(0)
+        px_w = np.linalg.norm(screen[1] - screen[0])
+        px_h = np.linalg.norm(screen[2] - screen[0])
+        texels_per_pixel = max(w / max(px_w, 1e-6), h / max(px_h, 1e-6))
+        if texels_per_pixel <= 1:
+            return 0
+        return min(int(math.log2(texels_per_pixel)), self.top_level)
+
+    def visible_tiles(self, level: int, mvp: np.ndarray) -> List[Tuple[int, int]]:
+        """
+        与视锥在屏幕平面上相交的瓦片（保守估计）
+        :param level: 级别
+        :param mvp: 行主序的4x4 投影*视图*模型 矩阵
+        """
+        h, w = self.shape(level)
+        nx, ny = self.grid(level)
+        xs = np.minimum(np.arange(nx + 1) * self.tile_size, w) / w * 2 - 1
+        ys = 1 - np.minimum(np.arange(ny + 1) * self.tile_size, h) / h * 2
+        gx, gy = np.meshgrid(xs, ys)  # (ny + 1, nx + 1)
+        points = np.stack([gx, gy, np.zeros_like(gx), np.ones_like(gx)], axis=-1)
+        clip = points @ mvp.T
+        # 每个瓦片的四个角
+        corners = np.stack([clip[:-1, :-1], clip[:-1, 1:], clip[1:, :-1], clip[1:, 1:]], axis=2)  # (ny, nx, 4, 4)
+        cx, cy, cw = corners[..., 0], corners[..., 1], corners[..., 3]
+        # 裁剪空间中，四个角都在同一裁剪平面外侧的瓦片不可见
+        outside = (np.all(cx > cw, axis=2) | np.all(cx < -cw, axis=2) |
+                   np.all(cy > cw, axis=2) | np.all(cy < -cw, axis=2) |
+                   np.all(cw <= 0, axis=2))
+        iy, ix = np.nonzero(~outside)
+        return list(zip(ix.tolist(), iy.tolist()))
+
+
+class TileCache:
+    """
+    按字节预算管理的瓦片缓存（最近最少使用淘汰）
+    """
+
+    def __init__(self, max_bytes: int, on_evict: Optional[Callable] = None):
+        """
+        :param max_bytes: 字节预算
+        :param on_evict: 淘汰回调，参数为 (key, value)，用于释放显存
+        """
+        self.max_bytes = max_bytes
+        self.on_evict = on_evict
+        self._items = OrderedDict()  # key: (value, nbytes)
+        self._nbytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key):
+        """
+        获取缓存的值，并标记为最近使用
+        """
+        if key not in self._items:
+            return None
+        self._items.move_to_end(key)
+        return self._items[key][0]
+
+    def put(self, key, value, nbytes: int, protected=()):
+        """
+        放入新值，超出预算时淘汰最久未使用的项
+        :param protected: 不允许淘汰的键（例如当前帧正在使用的瓦片）
+        """
+        if key in self._items:
+            self._nbytes -= self._items.pop(key)[1]
+        self._items[key] = (value, nbytes)
+        self._nbytes += nbytes
+        self.trim(protected=set(protected) | {key})
+
+    def trim(self, protected=()):
+        """
+        淘汰最久未使用的项，直到满足预算或者只剩受保护的项
+        """
+        for key in list(self._items.keys()):
+            if self._nbytes <= self.max_bytes:
+                break
+            if key in protected:
+                continue
+            value, nbytes = self._items.pop(key)
+            self._nbytes -= nbytes
+            if self.on_evict:
+                self.on_evict(key, value)
+
+    def clear(self):
+        for key, (value, _) in self._items.items():
+            if self.on_evict:
+                self.on_evict(key, value)
+        self._items.clear()
+        self._nbytes = 0
@@ -0,0 +1,116 @@
+"""
+界面图片资源
+所有主题的PNG原始数据打包在一个二进制文件中，文件格式：
+    MAGIC | 索引长度(uint32, 小端) | 索引(JSON) | 各主题的PNG数据（每个主题连续存放）
+索引：{主题名: {"offset": 主题数据的偏移, "length": 主题数据的长度, "items": {图片名: [主题内偏移, 长度]}}}
+启动时只读取当前主题的数据段，图片在第一次访问时才解码为QImage/QPixmap，并缓存。
+"""
+import json
+import os
+import struct
+from typing import Dict, List
+
+from PyQt5.QtCore import QByteArray
+from PyQt5.QtGui import QImage, QPixmap
+
+__all__ = ["pack_images", "ImageRegistry"]
+
+MAGIC = b"NAHDIMG1"
+_HEADER = struct.Struct("<8sI")
+
+
+def pack_images(blob_path: str, theme_dirs: Dict[str, str]):
+    """
+    把各主题文件夹中的PNG图片打包为一个二进制文件
+    :param blob_path: 输出文件路径
+    :param theme_dirs: {主题名: 图片文件夹}，图片名为去掉扩展名的文件名
+    """
+    index = {}
+    sections: List[bytes] = []
+    offset = 0
+    for theme, folder in theme_dirs.items():
+        items = {}
+        data = bytearray()
+        for file in sorted(os.listdir(folder)):
+            if not file.endswith('.png'):
+                continue
+            with open(os.path.join(folder, file), 'rb') as f:
+                png = f.read()
+            items[file[:-4]] = [len(data), len(png)]
+            data += png
+        index[theme] = {"offset": offset, "length": len(data), "items": items}
+        sections.append(bytes(data))
+        offset += len(data)
+    index_bytes = json.dumps(index, separators=(',', ':')).encode('utf-8')
+    with open(blob_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, len(index_bytes)))
+        f.write(index_bytes)
+        for section in sections:
+            f.write(section)
+
+
+class ImageRegistry:
+    """
+    单个主题的图片资源，名称不区分大小写（统一为大写，与 BYTES_ICO、ICO_IMAGE 等变量名一致）
+    """
+
+    def __init__(self, blob_path: str, theme: str):
+        """
+        :param blob_path: pack_images生成的文件
+        :param theme: 主题名
+        :raise KeyError: 文件中没有该主题
+        """
+        self.theme = theme
+        self._bytes: Dict[str, bytes] = {}
+        self._images: Dict[str, QImage] = {}
+        self._pixmaps: Dict[str, QPixmap] = {}
+        with open(blob_path, 'rb') as f:
+            magic, index_len = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"Invalid image resource file: {blob_path}")
+            section = json.loads(f.read(index_len).decode('utf-8'))[theme]
+            f.seek(section["offset"], os.SEEK_CUR)
+            data = f.read(section["length"])
+        for name, (offset, length) in section["items"].items():
+            self._bytes[name.upper()] = data[offset:offset + length]
+
+    def names(self) -> List[str]:
+        return list(self._bytes.keys())
+
+    def __contains__(self, name: str):
+        return name.upper() in self._bytes
+
+    def bytes(self, name: str) -> bytes:
+        """
+        PNG原始数据
+        :raise KeyError: 图片不存在
+        """
+        return self._bytes[name.upper()]
+
+    def image(self, name: str) -> QImage:
+        """
+        解码后的QImage，第一次访问时解码
+        """
+        name = name.upper()
+        image = self._images.get(name)
+        if image is None:
+            image = QImage.fromData(QByteArray(self._bytes[name]))  # noqa
+            self._images[name] = image
+        return image
+
+    def pixmap(self, name: str) -> QPixmap:
+        """
+        QPixmap，第一次访问时创建（需要已经创建QApplication）
+        """
+        name = name.upper()
+        pixmap = self._pixmaps.get(name)
+        if pixmap is None:
+            pixmap = QPixmap.fromImage(self.image(name))
+            self._pixmaps[name] = pixmap
+        return pixmap
+
+    def decoded_count(self) -> int:
+        """
+        已经解码的图片数量
+        """
+        return len(self._images)
@@ -0,0 +1,184 @@
+"""
+导入耗时分析与后台预加载
+1. ModuleWarmUp：在后台线程中预先导入耗时的模块（OpenGL、工程读取等），主线程需要时再等待完成
+2. profile_imports：在子进程中以 -X importtime 运行导入，解析每个模块的导入耗时，用于生成启动耗时报告
+3. static_imports：不执行代码，分析模块在导入时（模块顶层）会间接导入哪些模块，可以在任何平台上检查
+"""
+import ast
+import importlib
+import os
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set
+
+__all__ = ["ModuleWarmUp", "ImportRecord", "profile_imports", "format_import_report", "static_imports"]
+
+
+class ModuleWarmUp(threading.Thread):
+    """
+    在后台线程中按顺序导入模块
+    导入失败时不会中断后续模块，异常保存下来，在主线程调用wait时抛出
+    """
+
+    def __init__(self, modules: List[str]):
+        """
+        :param modules: 模块名列表，例如 ["OpenGL.GL", "main_editor"]
+        """
+        super().__init__(name="ModuleWarmUp", daemon=True)
+        self.modules = list(modules)
+        self.durations: Dict[str, float] = {}  # 模块名 -> 导入耗时（秒）
+        self.error: Optional[BaseException] = None
+        self._done = threading.Event()
+
+    def run(self):
+        try:
+            for name in self.modules:
+                start = time.perf_counter()
+                try:
+                    importlib.import_module(name)
+                except BaseException as e:  # noqa
+                    if self.error is None:
+                        self.error = e
+                self.durations[name] = time.perf_counter() - start
+        finally:
+            self._done.set()
+
+    def wait(self, timeout: float = None):
+        """
+        等待预加载完成；未启动时在当前线程中直接导入，已经完成时直接返回（可以多次调用）
+        :raise: 预加载中第一个导入异常
+        """
+        if self._done.is_set():
+            pass
+        elif self.ident is None:  # 线程没有启动（例如从命令行直接打开文件）
+            self.run()
+        else:
+            self.join(timeout)
+        if self.error is not None:
+            raise self.error
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    self_us: int  # 模块自身的导入耗时（微秒）
+    cumulative_us: int  # 包含其导入的子模块的耗时（微秒）
+    depth: int  # 导入层级，0为顶层
+
+
+def profile_imports(module: str, python: str = sys.executable, cwd: str = None) -> List[ImportRecord]:
+    """
+    在新的解释器中导入模块，返回 -X importtime 的解析结果（按导入完成的顺序）
+    :param module: 模块名
+    :param python: 解释器路径
+    :param cwd: 工作目录（决定本地模块能否被导入）
+    :raise ImportError: 导入失败
+    """
+    result = subprocess.run([python, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=cwd, capture_output=True, text=True)
+    if result.returncode != 0:
+        last_line = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else ""
+        raise ImportError(f"Failed to import {module}: {last_line}")
+    records = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # 表头
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        records.append(ImportRecord(name.strip(), int(fields[0]), int(fields[1]), depth))
+    return records
+
+
+def format_import_report(records: List[ImportRecord], top: int = 20) -> str:
+    """
+    生成导入耗时报告：总耗时和自身耗时最多的模块
+    """
+    total = sum(record.self_us for record in records)
+    lines = [f"{len(records)} modules, {total / 1000:.1f} ms", f"{'self ms':>9} {'cumul ms':>9}  module"]
+    for record in sorted(records, key=lambda r: r.self_us, reverse=True)[:top]:
+        lines.append(f"{record.self_us / 1000:9.2f} {record.cumulative_us / 1000:9.2f}  {record.module}")
+    return "\n".join(lines)
+
+
+
+class _TopLevelImports(ast.NodeVisitor):
+    """
+    收集导入模块时会执行的import语句（函数体中的导入在调用时才执行，不收集）
+    """
+
+    def __init__(self):
+        self.imports = []  # [(模块名, from导入的名称或None, 相对导入的层级)]
+
+    def visit_FunctionDef(self, node):
+        pass
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+    visit_Lambda = visit_FunctionDef
+
+    def visit_Import(self, node: ast.Import):
+        for alias in node.names:
+            self.imports.append((alias.name, None, 0))
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        for alias in node.names:
+            self.imports.append((node.module or "", alias.name, node.level))
+
+
+def _find_module(name: str, roots: Sequence[str]) -> Optional[str]:
+    parts = name.split(".")
+    for root in roots:
+        base = os.path.join(root, *parts)
+        for path in (base + ".py", os.path.join(base, "__init__.py")):
+            if os.path.isfile(path):
+                return path
+    return None
+
+
+def static_imports(module: str, roots: Sequence[str]) -> Set[str]:
+    """
+    不执行代码，从源码分析导入module时（模块顶层的import语句，包括 try/if 中的）会间接导入的所有模块；
+    在roots中找得到源码的本地模块会继续分析，其他模块（第三方库、标准库）只记录名称
+    :param module: 模块名
+    :param roots: 本地模块的搜索路径（例如工程根目录和作为源码根目录的GUI）
+    :return: 导入的模块名（包含module本身）
+    """
+    found = {module}
+    visited_files = set()
+    pending = [module]
+    while pending:
+        name = pending.pop()
+        path = _find_module(name, roots)
+        if path is None or path in visited_files:
+            continue
+        visited_files.add(path)
+        is_package = os.path.basename(path) == "__init__.py"
+        package = name if is_package else name.rpartition(".")[0]
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), path)
+        collector = _TopLevelImports()
+        collector.visit(tree)
+        for target, attr, level in collector.imports:
+            if level:
+                base = package.split(".") if package else []
+                base = base[:len(base) - (level - 1)] if level > 1 else base
+                target = ".".join(base + ([target] if target else []))
+            candidates = [target] if target else []
+            if attr is not None and attr != "*" and _find_module(f"{target}.{attr}", roots):
+                candidates.append(f"{target}.{attr}")  # from 包 import 子模块
+            for candidate in candidates:
+                # 导入子模块时会先导入其上级包
+                parts = candidate.split(".")
+                for i in range(1, len(parts) + 1):
+                    parent = ".".join(parts[:i])
+                    if parent not in found:
+                        found.add(parent)
+                        pending.append(parent)
+    return found
+
+
+if __name__ == '__main__':
+    print(format_import_report(profile_imports(sys.argv[1] if len(sys.argv) > 1 else "startWindow")))
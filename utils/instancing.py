@@ -0,0 +1,159 @@
+"""
+实例化绘制的变换矩阵生成
+栏杆的立柱和扶手、梯子的踏棍都是同一个网格的大量重复，这里只计算每个实例的变换矩阵（按行排列的4×4），
+网格由 GLInstancedMeshItem 共享，整条栏杆或整架梯子一次绘制调用
+实例网格约定为以原点为中心、边长为1的单位体（方块或沿x轴的圆柱）
+"""
+from typing import Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+__all__ = ["sample_path", "box_transforms", "railing_transforms", "ladder_transforms", "changed_range"]
+
+_UP = np.array([0., 1., 0.])
+
+
+def sample_path(points, interval: float, closed: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    沿折线按弧长等距取点，间距不超过interval；开放折线包括两个端点，闭合折线的首尾不重复
+    :param points: 折线的顶点 nx3
+    :param interval: 最大间距
+    :param closed: 是否闭合
+    :return: (位置 mx3, 所在线段的单位切向 mx3)
+    """
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    if pts.shape[0] == 0:
+        return np.zeros((0, 3)), np.zeros((0, 3))
+    if closed and pts.shape[0] > 2:
+        pts = np.vstack([pts, pts[:1]])
+    seg = np.diff(pts, axis=0)
+    lens = np.linalg.norm(seg, axis=1)
+    total = float(lens.sum())
+    if total <= 0 or interval <= 0:
+        return pts[:1].copy(), np.tile([1., 0., 0.], (1, 1))
+    cum = np.concatenate([[0.], np.cumsum(lens)])
+    if closed:
+        n = max(int(np.ceil(total / interval - 1e-9)), 1)
+        s = np.linspace(0, total, n, endpoint=False)
+    else:
+        n = int(np.ceil(total / interval - 1e-9)) + 1
+        s = np.linspace(0, total, n)
+    idx = np.clip(np.searchsorted(cum, s, side="right") - 1, 0, len(seg) - 1)
+    # 跳过长度为0的线段（重复的顶点）
+    valid = lens > 0
+    while not np.all(valid[idx]):
+        bad = ~valid[idx]
+        idx[bad] = np.clip(idx[bad] + np.where(idx[bad] + 1 < len(seg), 1, -1), 0, len(seg) - 1)
+    safe = np.where(lens[idx] > 0, lens[idx], 1.)
+    t = ((s - cum[idx]) / safe)[:, None]
+    positions = pts[idx] + seg[idx] * t
+    tangents = seg[idx] / safe[:, None]
+    return positions, tangents
+
+
+def box_transforms(centers, directions, sizes) -> np.ndarray:
+    """
+    单位体的变换：局部x轴沿direction，y轴尽量朝上（direction竖直时取z轴），按sizes缩放后平移到center
+    :param centers: nx3
+    :param directions: nx3，不需要单位化
+    :param sizes: nx3 或 3，沿局部 x, y, z 轴的尺寸
+    :return: nx4x4（按行排列）
+    """
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 3)
+    n = centers.shape[0]
+    x = np.asarray(directions, dtype=np.float64).reshape(-1, 3)
+    x = x / np.maximum(np.linalg.norm(x, axis=1, keepdims=True), 1e-12)
+    sizes = np.broadcast_to(np.asarray(sizes, dtype=np.float64), (n, 3))
+    # y轴：向上方向去掉沿x的分量
+    y = _UP - x * x[:, 1:2]
+    y_len = np.linalg.norm(y, axis=1, keepdims=True)
+    vertical = y_len[:, 0] < 1e-6
+    y[vertical] = [0., 0., 1.]
+    y_len[vertical] = 1.
+    y = y / y_len
+    z = np.cross(x, y)
+    result = np.zeros((n, 4, 4), dtype=np.float32)
+    result[:, :3, 0] = x * sizes[:, 0:1]
+    result[:, :3, 1] = y * sizes[:, 1:2]
+    result[:, :3, 2] = z * sizes[:, 2:3]
+    result[:, :3, 3] = centers
+    result[:, 3, 3] = 1
+    return result
+
+
+def railing_transforms(paths: Iterable[Tuple[Sequence, bool]], height: float, interval: Optional[float],
+                       thickness: float) -> np.ndarray:
+    """
+    栏杆的实例：沿每条路径每隔interval一根立柱，立柱顶端之间一根扶手；interval为None时为栏板（每段折线一块板）
+    同一路径的实例连续排列，修改一条路径时只有这一段实例变化
+    :param paths: [(路径顶点 nx3, 是否闭合)]，路径为栏杆的底边
+    :param height: 高度
+    :param interval: 立柱间距，None表示栏板
+    :param thickness: 立柱、扶手、栏板的厚度
+    :return: nx4x4
+    """
+    parts = []
+    up = np.array([0., height, 0.])
+    for points, closed in paths:
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        if points.shape[0] == 0:
+            continue
+        if interval is None:  # 栏板
+            pts = np.vstack([points, points[:1]]) if closed and points.shape[0] > 2 else points
+            seg = np.diff(pts, axis=0)
+            lens = np.linalg.norm(seg, axis=1)
+            keep = lens > 0
+            if not np.any(keep):
+                continue
+            sizes = np.column_stack([lens[keep], np.full(keep.sum(), height), np.full(keep.sum(), thickness)])
+            parts.append(box_transforms((pts[:-1] + pts[1:])[keep] / 2 + up / 2, seg[keep], sizes))
+            continue
+        positions, tangents = sample_path(points, interval, closed)
+        flat = tangents * [1., 0., 1.]  # 立柱竖直，只取水平方向
+        flat[np.linalg.norm(flat, axis=1) < 1e-6] = [1., 0., 0.]
+        parts.append(box_transforms(positions + up / 2, flat, (thickness, height, thickness)))
+        # 扶手：相邻立柱顶端之间
+        tops = positions + up
+        if closed and tops.shape[0] > 2:
+            tops = np.vstack([tops, tops[:1]])
+        seg = np.diff(tops, axis=0)
+        lens = np.linalg.norm(seg, axis=1)
+        keep = lens > 0
+        if np.any(keep):
+            sizes = np.column_stack([lens[keep] + thickness, np.full(keep.sum(), thickness),
+                                     np.full(keep.sum(), thickness)])
+            parts.append(box_transforms((tops[:-1] + tops[1:])[keep] / 2, seg[keep], sizes))
+    if not parts:
+        return np.zeros((0, 4, 4), dtype=np.float32)
+    return np.concatenate(parts)
+
+
+def ladder_transforms(length: float, width: float, interval: float, material_width: float) -> np.ndarray:
+    """
+    直梯的实例：两根竖杆和每隔interval一根踏棍；梯子底端中点为原点，沿y轴向上，宽度沿x轴
+    :return: nx4x4，前两个为竖杆
+    """
+    rails = box_transforms(
+        [[-width / 2, length / 2, 0], [width / 2, length / 2, 0]], [[0, 1, 0]] * 2,
+        (length, material_width, material_width))
+    if interval <= 0:
+        return rails
+    heights = np.arange(1, int(np.floor(length / interval + 1e-9)) + 1) * interval
+    heights = heights[heights < length - 1e-9]
+    centers = np.column_stack([np.zeros_like(heights), heights, np.zeros_like(heights)])
+    rungs = box_transforms(centers, np.tile([1., 0., 0.], (len(heights), 1)), (width, material_width, material_width))
+    return np.concatenate([rails, rungs])
+
+
+def changed_range(old: Optional[np.ndarray], new: np.ndarray) -> Optional[Tuple[int, int]]:
+    """
+    比较两组实例数据（按第0维为实例）
+    :return: 没有变化时为None；数量相同时为变化的实例区间 [start, stop)；数量不同时为 (0, len(new))
+    """
+    if old is None or old.shape != new.shape:
+        return 0, len(new)
+    diff = np.any(old.reshape(len(old), -1) != new.reshape(len(new), -1), axis=1)
+    changed = np.flatnonzero(diff)
+    if changed.size == 0:
+        return None
+    return int(changed[0]), int(changed[-1]) + 1
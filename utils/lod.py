@@ -0,0 +1,80 @@
+"""
+细节层次（LOD）选择
+按物体在屏幕上的投影尺寸选择网格的细节等级：0为最精细，数字越大越粗糙；
+切换等级带有滞后区间，物体尺寸在阈值附近抖动（例如缓慢缩放视角）时不会每帧来回切换网格
+"""
+import math
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+__all__ = ["projected_size", "bounding_sphere", "LODSelector"]
+
+
+def projected_size(radius: float, distance: float, fov: float, viewport_height: float,
+                   ortho_zoom: Optional[float] = None) -> float:
+    """
+    包围球在屏幕上的投影直径（像素）
+    :param radius: 包围球半径（世界坐标）
+    :param distance: 包围球中心到相机的距离
+    :param fov: 透视投影的竖直视角（度）
+    :param viewport_height: 视口高度（像素）
+    :param ortho_zoom: 正交投影时每像素对应的世界长度（Camera.zoom_factor），为None时按透视投影计算
+    """
+    if ortho_zoom is not None:
+        return 2 * radius / max(ortho_zoom, 1e-9)
+    if distance <= radius:  # 相机在包围球内
+        return math.inf
+    return radius * viewport_height / (distance * math.tan(math.radians(fov) / 2))
+
+
+def bounding_sphere(points) -> Tuple[np.ndarray, float]:
+    """
+    点集的包围球（以包围盒中心为球心，不是最小包围球）
+    :param points: nx3
+    :return: (球心, 半径)
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    if points.shape[0] == 0:
+        return np.zeros(3), 0.
+    center = (points.min(axis=0) + points.max(axis=0)) / 2
+    return center, float(np.linalg.norm(points - center, axis=1).max())
+
+
+class LODSelector:
+    """
+    带滞后区间的等级选择
+    thresholds为从细到粗的投影尺寸阈值（递减），尺寸不小于thresholds[i]时等级不超过i，小于最后一个阈值时为最粗的等级；
+    当前等级只有在尺寸越过阈值的 hysteresis 比例之后才会改变
+    """
+
+    def __init__(self, thresholds: Sequence[float], hysteresis: float = 0.15):
+        """
+        :param thresholds: 递减的阈值（像素），等级数为 len(thresholds) + 1
+        :param hysteresis: 滞后区间占阈值的比例
+        """
+        if any(a <= b for a, b in zip(thresholds, thresholds[1:])):
+            raise ValueError(f"thresholds must be decreasing: {thresholds}")
+        self.thresholds = tuple(thresholds)
+        self.hysteresis = hysteresis
+        self.level = 0
+
+    @property
+    def levels(self) -> int:
+        return len(self.thresholds) + 1
+
+    def select(self, size: float) -> int:
+        """
+        :param size: 投影尺寸（像素）
+        :return: 新的等级
+        """
+        # 变粗：尺寸低于当前等级下界的 (1 - hysteresis)
+        while self.level < len(self.thresholds) and size < self.thresholds[self.level] * (1 - self.hysteresis):
+            self.level += 1
+        # 变细：尺寸高于上一等级下界的 (1 + hysteresis)
+        while self.level > 0 and size >= self.thresholds[self.level - 1] * (1 + self.hysteresis):
+            self.level -= 1
+        return self.level
+
+    def reset(self, level: int = 0):
+        self.level = level
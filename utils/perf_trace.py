@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+性能追踪
+以区间（span）为单位记录耗时，存放在环形缓冲区中，可以导出为Chrome trace格式（chrome://tracing 或 Perfetto 打开）。
+关闭时，trace_span返回共享的空上下文，trace_it只多一次布尔判断，不会产生额外开销。
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from functools import wraps
+
+__all__ = ["PerfTracer", "trace_span", "trace_it"]
+
+_NULL_CONTEXT = nullcontext()
+
+
+class PerfTracer:
+    """
+    全局的性能追踪器，所有状态都保存在类属性中
+    记录格式：(名称, 类别, 开始时间ns, 持续时间ns, 线程id, 参数)
+    """
+    DEFAULT_CAPACITY = 100000
+    enabled = False
+    _events = deque(maxlen=DEFAULT_CAPACITY)
+    _origin = time.perf_counter_ns()
+
+    @classmethod
+    def enable(cls, capacity: int = None):
+        """
+        开启追踪
+        :param capacity: 环形缓冲区容量（区间个数），超出后丢弃最早的记录
+        """
+        if capacity is not None and capacity != cls._events.maxlen:
+            cls._events = deque(cls._events, maxlen=capacity)
+        cls.enabled = True
+
+    @classmethod
+    def disable(cls):
+        cls.enabled = False
+
+    @classmethod
+    def clear(cls):
+        cls._events.clear()
+
+    @classmethod
+    def record(cls, name: str, cat: str, start_ns: int, dur_ns: int, args: dict = None):
+        """
+        记录一个已经结束的区间
+        """
+        cls._events.append((name, cat, start_ns, dur_ns, threading.get_ident(), args))
+
+    @classmethod
+    def events(cls) -> list:
+        """
+        获取缓冲区中所有记录的副本
+        """
+        return list(cls._events)
+
+    @classmethod
+    def to_chrome_trace(cls) -> dict:
+        """
+        转换为Chrome trace格式的字典，时间单位为微秒
+        """
+        pid = os.getpid()
+        trace_events = []
+        for name, cat, start_ns, dur_ns, tid, args in cls.events():
+            event = {
+                "name": name, "cat": cat, "ph": "X", "pid": pid, "tid": tid,
+                "ts": (start_ns - cls._origin) / 1000, "dur": dur_ns / 1000
+            }
+            if args:
+                event["args"] = args
+            trace_events.append(event)
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    @classmethod
+    def export_chrome_trace(cls, path: str):
+        """
+        导出为Chrome trace格式的json文件
+        :param path: 文件路径
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(cls.to_chrome_trace(), f)
+
+
+class _Span:
+    __slots__ = ("name", "cat", "args", "start")
+
+    def __init__(self, name, cat, args):
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        PerfTracer.record(self.name, self.cat, self.start, time.perf_counter_ns() - self.start, self.args)
+        return False
+
+
+def trace_span(name: str, cat: str = "default", **args):
+    """
+    上下文管理器，记录with块的耗时
+    :param name: 区间名称
+    :param cat: 类别，例如 "gl"、"mesh"、"io"
+    :param args: 附加参数，会显示在trace查看器中
+    """
+    if not PerfTracer.enabled:
+        return _NULL_CONTEXT
+    return _Span(name, cat, args)
+
+
+def trace_it(name: str = None, cat: str = "default"):
+    """
+    装饰器，记录函数的耗时，与time_it类似，但结果写入PerfTracer而不是打印
+    :param name: 区间名称，默认为函数的限定名
+    :param cat: 类别
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PerfTracer.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                PerfTracer.record(span_name, cat, start, time.perf_counter_ns() - start)
+        return wrapper
+
+    return decorator
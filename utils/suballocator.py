@@ -0,0 +1,124 @@
+"""
+缓冲区子分配器
+在一块固定大小的缓冲区（例如一个大的VBO）中分配和释放区间，使很多小网格共享少数几个缓冲区，
+减少缓冲区对象的数量和重新分配；空闲区间按偏移量排序，释放时与相邻的空闲区间合并
+"""
+import bisect
+from typing import Dict, List, Optional
+
+__all__ = ["FreeListAllocator", "grow_capacity"]
+
+
+def grow_capacity(capacity: int, needed: int, factor: float = 1.5, alignment: int = 16) -> int:
+    """
+    几何增长的容量：至少为needed，且不小于 capacity * factor，按alignment对齐
+    连续增长时重新分配的次数为对数级，均摊到每次增长的复制开销为常数
+    """
+    if needed <= capacity:
+        return capacity
+    new_capacity = max(needed, int(capacity * factor))
+    return -(-new_capacity // alignment) * alignment
+
+
+class FreeListAllocator:
+    """
+    空闲链表分配器（最佳适配）
+    """
+
+    def __init__(self, capacity: int, alignment: int = 256):
+        """
+        :param capacity: 总字节数
+        :param alignment: 每个区间起始位置和大小的对齐字节数
+        """
+        self.capacity = capacity
+        self.alignment = alignment
+        self._free_offsets: List[int] = [0] if capacity > 0 else []  # 按偏移量排序
+        self._free_sizes: Dict[int, int] = {0: capacity} if capacity > 0 else {}
+        self._allocated: Dict[int, int] = {}  # 偏移量 -> 大小
+
+    def _align(self, size: int) -> int:
+        return max(-(-size // self.alignment) * self.alignment, self.alignment)
+
+    def allocate(self, size: int) -> Optional[int]:
+        """
+        :return: 区间的偏移量，没有足够大的空闲区间时返回None
+        """
+        size = self._align(size)
+        best = None
+        for offset in self._free_offsets:
+            free = self._free_sizes[offset]
+            if free >= size and (best is None or free < self._free_sizes[best]):
+                best = offset
+                if free == size:
+                    break
+        if best is None:
+            return None
+        free = self._free_sizes.pop(best)
+        index = bisect.bisect_left(self._free_offsets, best)
+        if free > size:  # 剩余部分仍然空闲
+            self._free_offsets[index] = best + size
+            self._free_sizes[best + size] = free - size
+        else:
+            del self._free_offsets[index]
+        self._allocated[best] = size
+        return best
+
+    def free(self, offset: int):
+        """
+        释放区间，并与前后相邻的空闲区间合并
+        :raise KeyError: offset不是已分配区间的起点
+        """
+        size = self._allocated.pop(offset)
+        index = bisect.bisect_left(self._free_offsets, offset)
+        # 与后一个空闲区间合并
+        if index < len(self._free_offsets) and self._free_offsets[index] == offset + size:
+            size += self._free_sizes.pop(self._free_offsets[index])
+            del self._free_offsets[index]
+        # 与前一个空闲区间合并
+        if index > 0:
+            prev = self._free_offsets[index - 1]
+            if prev + self._free_sizes[prev] == offset:
+                self._free_sizes[prev] += size
+                return
+        self._free_offsets.insert(index, offset)
+        self._free_sizes[offset] = size
+
+    def grow(self, capacity: int):
+        """
+        扩大总容量（缓冲区已扩大，已分配的区间位置不变）
+        """
+        if capacity <= self.capacity:
+            return
+        added = capacity - self.capacity
+        last = self._free_offsets[-1] if self._free_offsets else None
+        if last is not None and last + self._free_sizes[last] == self.capacity:
+            self._free_sizes[last] += added
+        else:
+            self._free_offsets.append(self.capacity)
+            self._free_sizes[self.capacity] = added
+        self.capacity = capacity
+
+    def size_of(self, offset: int) -> int:
+        return self._allocated[offset]
+
+    def __len__(self):
+        return len(self._allocated)
+
+    @property
+    def used(self) -> int:
+        return sum(self._allocated.values())
+
+    def stats(self) -> Dict[str, float]:
+        """
+        :return: {"capacity", "used", "free", "largest_free", "allocations", "free_blocks",
+                  "utilization"（已用/总容量）, "fragmentation"（1 - 最大空闲区间/空闲总量，0表示空闲空间连续）}
+        """
+        used = self.used
+        free = self.capacity - used
+        largest = max(self._free_sizes.values(), default=0)
+        return {
+            "capacity": self.capacity, "used": used, "free": free, "largest_free": largest,
+            "allocations": len(self._allocated), "free_blocks": len(self._free_offsets),
+            "utilization": used / self.capacity if self.capacity else 0.,
+            "fragmentation": 1 - largest / free if free else 0.,
+        }
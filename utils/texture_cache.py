@@ -0,0 +1,200 @@
+"""
+进程级的纹理缓存
+以 (文件路径, 修改时间, 翻转参数) 为键，相同的图片只解码一次、每个GL共享组只上传一次；
+解码在后台线程中进行，GL对象的创建和删除由调用方（在GL上下文中）完成。
+解码后的图片上传到所有请求过它的共享组之后即被释放，之后才请求的共享组会重新解码。
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from PIL import Image as PILImage
+
+from .perf_trace import trace_span
+
+__all__ = ["TextureEntry", "TextureCache"]
+
+
+def _decode(path: str, flip_x: bool, flip_y: bool) -> np.ndarray:
+    with trace_span("TextureCache.decode", "texture", path=path):
+        img = np.array(PILImage.open(path))
+        if flip_x:
+            img = img[:, ::-1]
+        if flip_y:
+            img = img[::-1]
+        return np.ascontiguousarray(img)
+
+
+class TextureEntry:
+    """
+    缓存中的一张图片
+    """
+    __slots__ = ("key", "path", "future", "refcount", "gpu", "wanted")
+
+    def __init__(self, key: tuple, path: str, future: Future):
+        self.key = key
+        self.path = path
+        self.future: Optional[Future] = future  # 图片上传后释放，为None
+        self.refcount = 1
+        self.gpu: Dict[int, Tuple[int, int]] = {}  # GL共享组 -> (纹理id, 显存字节数)
+        self.wanted: Set[int] = set()  # 请求过纹理、但还没有上传的GL共享组
+
+    def ready(self) -> bool:
+        """
+        是否已经解码完成（图片在内存中，可以上传）
+        """
+        return self.future is not None and self.future.done()
+
+    def image(self, timeout=None) -> np.ndarray:
+        """
+        解码后的图片，未完成时等待解码线程
+        :raise RuntimeError: 图片上传后已经被释放
+        """
+        if self.future is None:
+            raise RuntimeError(f"image released after upload: {self.path}")
+        return self.future.result(timeout)
+
+    @property
+    def nbytes(self) -> int:
+        future = self.future
+        if future is None or not future.done() or future.exception() is not None:
+            return 0
+        return future.result().nbytes
+
+    @property
+    def gpu_nbytes(self) -> int:
+        return sum(nbytes for _, nbytes in self.gpu.values())
+
+
+class TextureCache:
+    """
+    所有状态都保存在类属性中，整个进程共享
+    """
+    MAX_WORKERS = 2
+    _entries: Dict[tuple, TextureEntry] = {}
+    _orphans: Dict[int, List[int]] = {}  # GL共享组 -> 等待删除的纹理id（引用计数归零时可能没有当前的GL上下文）
+    _lock = threading.Lock()
+    _executor = None
+
+    @staticmethod
+    def make_key(path, flip_x=False, flip_y=False) -> tuple:
+        path = os.path.abspath(str(path))
+        return path, os.stat(path).st_mtime_ns, bool(flip_x), bool(flip_y)
+
+    @classmethod
+    def acquire(cls, path, flip_x=False, flip_y=False) -> TextureEntry:
+        """
+        获取图片的缓存项，引用计数加一；不存在时在后台线程中开始解码
+        文件被修改后（mtime变化）会作为新的图片重新解码
+        :raise FileNotFoundError: 文件不存在
+        """
+        key = cls.make_key(path, flip_x, flip_y)
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is not None:
+                entry.refcount += 1
+                return entry
+            entry = TextureEntry(key, key[0], cls._submit(key))
+            cls._entries[key] = entry
+            return entry
+
+    @classmethod
+    def _submit(cls, key: tuple) -> Future:
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(cls.MAX_WORKERS, thread_name_prefix="TextureDecode")
+        path, _, flip_x, flip_y = key
+        return cls._executor.submit(_decode, path, flip_x, flip_y)
+
+    @classmethod
+    def release(cls, entry: TextureEntry):
+        """
+        引用计数减一，归零时从缓存中移除，其GL纹理等待下次在对应的上下文中删除
+        """
+        with cls._lock:
+            entry.refcount -= 1
+            if entry.refcount > 0:
+                return
+            if cls._entries.get(entry.key) is entry:
+                cls._entries.pop(entry.key)
+            for group, (tex_id, _) in entry.gpu.items():
+                cls._orphans.setdefault(group, []).append(tex_id)
+            entry.gpu.clear()
+            entry.wanted.clear()
+            entry.future = None
+
+    @classmethod
+    def texture_id(cls, entry: TextureEntry, group: int, upload: Callable[[np.ndarray], Tuple[int, int]],
+                   wait: bool = False) -> Optional[int]:
+        """
+        获取图片在GL共享组中的纹理id，第一次使用时上传；
+        上传到所有请求过的共享组之后释放内存中的图片，之后才请求的共享组重新在后台解码
+        :param entry: 缓存项
+        :param group: 当前GL上下文的共享组
+        :param upload: 上传函数，参数为图片，返回 (纹理id, 显存字节数)，在当前GL上下文中调用
+        :param wait: 尚未解码完成时是否等待解码线程；为False时返回None，调用方应该跳过绘制
+        """
+        if group in entry.gpu:
+            return entry.gpu[group][0]
+        future = cls.request(entry, group)
+        if not future.done() and not wait:
+            return None
+        entry.gpu[group] = upload(future.result())
+        with cls._lock:
+            entry.wanted.discard(group)
+            if not entry.wanted and entry.future is future:
+                entry.future = None
+        return entry.gpu[group][0]
+
+    @classmethod
+    def request(cls, entry: TextureEntry, group: int) -> Future:
+        """
+        登记共享组需要该图片（上传前不释放内存中的图片），图片已被释放时重新开始解码
+        :return: 解码的Future，可以用 add_done_callback 在完成后请求重绘
+        """
+        with cls._lock:
+            entry.wanted.add(group)
+            if entry.future is None:
+                entry.future = cls._submit(entry.key)
+            return entry.future
+
+    @classmethod
+    def take_orphans(cls, group: int) -> List[int]:
+        """
+        取出该共享组中等待删除的纹理id，由调用方在GL上下文中删除
+        """
+        with cls._lock:
+            return cls._orphans.pop(group, [])
+
+    @classmethod
+    def drop_group(cls, group: int):
+        """
+        GL共享组的上下文被销毁时调用：纹理已经随上下文删除，移除该组的纹理id和等待删除的纹理id，
+        避免之后复用同一地址的共享组拿到不存在的纹理、或删除属于其他上下文的纹理
+        """
+        with cls._lock:
+            for entry in cls._entries.values():
+                entry.gpu.pop(group, None)
+                entry.wanted.discard(group)
+                if not entry.wanted and entry.gpu:
+                    entry.future = None  # 其余请求过的共享组都已上传
+            cls._orphans.pop(group, None)
+
+    @classmethod
+    def count(cls) -> int:
+        return len(cls._entries)
+
+    @classmethod
+    def nbytes(cls) -> int:
+        """
+        已解码图片占用的内存
+        """
+        return sum(entry.nbytes for entry in list(cls._entries.values()))
+
+    @classmethod
+    def gpu_nbytes(cls) -> int:
+        """
+        已上传纹理占用的显存（估计值，包含多级纹理）
+        """
+        return sum(entry.gpu_nbytes for entry in list(cls._entries.values()))
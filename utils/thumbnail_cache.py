@@ -0,0 +1,149 @@
+"""
+工程缩略图缓存
+缩略图为已经圆角化的小尺寸PNG，文件名由工程路径和修改时间决定，工程文件修改后旧的缩略图自动失效。
+缩略图在保存工程时由编辑器截图生成；没有缓存时，用工程的第一张参考图片生成。
+读取和生成都在线程池中进行，完成后通过信号在主线程中通知。
+"""
+import json
+import os
+from hashlib import sha1
+from typing import Optional
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt5.QtGui import QImage, QPainter, QPainterPath
+
+
+def rounded_image(image: QImage, size: int, corner_radius: int) -> QImage:
+    """
+    把图片居中裁剪为正方形并缩放、圆角化
+    只使用QImage，可以在非GUI线程中调用
+    """
+    scaled = image.scaled(size, size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+    result = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    result.fill(Qt.transparent)
+    painter = QPainter(result)
+    painter.setRenderHint(QPainter.Antialiasing)
+    path = QPainterPath()
+    path.addRoundedRect(0, 0, size, size, corner_radius, corner_radius)
+    painter.setClipPath(path)
+    painter.drawImage((size - scaled.width()) // 2, (size - scaled.height()) // 2, scaled)
+    painter.end()
+    return result
+
+
+class _LoadTask(QRunnable):
+    def __init__(self, cache: 'ThumbnailCache', prj_path: str):
+        super().__init__()
+        self.cache = cache
+        self.prj_path = prj_path
+
+    def run(self):
+        image = self.cache.load(self.prj_path)
+        self.cache.finish_request(self.prj_path, image)
+
+
+class ThumbnailCache(QObject):
+    """
+    工程缩略图缓存
+    """
+    TAG = "ThumbnailCache"
+    SIZE = 64  # 缩略图边长
+    CORNER_RADIUS = 12
+    loaded_s = pyqtSignal(str, QImage)  # noqa  工程路径，缩略图（在请求的对象所在的线程中接收）
+
+    def __init__(self, cache_dir: str, max_threads: int = 2):
+        """
+        :param cache_dir: 缓存文件夹
+        :param max_threads: 后台读取的线程数
+        """
+        super().__init__()
+        self.cache_dir = cache_dir
+        self._pending = set()
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(max_threads)
+
+    @staticmethod
+    def _path_hash(prj_path: str) -> str:
+        return sha1(os.path.normcase(os.path.abspath(prj_path)).encode("utf-8")).hexdigest()[:16]
+
+    def thumbnail_path(self, prj_path: str) -> Optional[str]:
+        """
+        缩略图文件路径，由工程路径和修改时间决定；工程文件不存在时返回None
+        """
+        try:
+            mtime = os.stat(prj_path).st_mtime_ns
+        except OSError:
+            return None
+        return os.path.join(self.cache_dir, f"{self._path_hash(prj_path)}_{mtime}.png")
+
+    def store(self, prj_path: str, image: QImage) -> bool:
+        """
+        生成并保存缩略图，删除该工程旧的缩略图
+        :param prj_path: 工程路径（应在工程保存之后调用，使修改时间与缩略图对应）
+        :param image: 原始图片，例如编辑器的截图
+        """
+        path = self.thumbnail_path(prj_path)
+        if path is None or image.isNull():
+            return False
+        os.makedirs(self.cache_dir, exist_ok=True)
+        prefix = self._path_hash(prj_path) + "_"
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(prefix) and os.path.join(self.cache_dir, name) != path:
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+        return rounded_image(image, self.SIZE, self.CORNER_RADIUS).save(path, "PNG")
+
+    def load(self, prj_path: str) -> Optional[QImage]:
+        """
+        同步读取缩略图，没有缓存时尝试用工程的第一张参考图片生成
+        :return: 缩略图，无法生成时返回None
+        """
+        path = self.thumbnail_path(prj_path)
+        if path is None:
+            return None
+        if os.path.exists(path):
+            image = QImage(path)
+            if not image.isNull():
+                return image
+        source = self._first_ref_image(prj_path)
+        if source is None:
+            return None
+        image = QImage(source)
+        if image.isNull() or not self.store(prj_path, image):
+            return None
+        return QImage(path)
+
+    @staticmethod
+    def _first_ref_image(prj_path: str) -> Optional[str]:
+        try:
+            with open(prj_path, 'r', encoding='utf-8') as f:
+                ref_images = json.load(f).get("ref_image", [])
+        except (OSError, ValueError, AttributeError):
+            return None
+        for ref_image in ref_images:
+            path = ref_image.get("file_path")
+            if path and os.path.exists(path):
+                return path
+        return None
+
+    def request(self, prj_path: str):
+        """
+        在后台读取缩略图，读取成功后发出loaded_s信号；重复的请求会被忽略
+        """
+        if prj_path in self._pending:
+            return
+        self._pending.add(prj_path)
+        self._pool.start(_LoadTask(self, prj_path))
+
+    def finish_request(self, prj_path: str, image: Optional[QImage]):
+        self._pending.discard(prj_path)
+        if image is not None:
+            self.loaded_s.emit(prj_path, image)
+
+    def wait(self, msecs: int = -1) -> bool:
+        """
+        等待所有后台任务完成
+        """
+        return self._pool.waitForDone(msecs)